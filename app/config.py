@@ -1,3 +1,4 @@
+from typing import Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
@@ -11,6 +12,36 @@ class Settings(BaseSettings):
     SECRET_KEY: str
     FRONTEND_URL: str
 
+    # Bearer token required by GET /metrics (unset disables the endpoint)
+    METRICS_TOKEN: Optional[str] = None
+
+    # Claude request scheduling
+    CLAUDE_MAX_CONCURRENCY: int = 4
+    CLAUDE_TOKENS_PER_MINUTE: int = 40000
+    CLAUDE_MAX_RETRIES: int = 3
+
+    # Local suspect pre-ranking
+    SUSPECT_RANKER_SKIP_THRESHOLD: float = 0.85
+    SUSPECT_RANKER_TOP_K: int = 5
+
+    # Background analysis workers; run by `python -m scripts.analysis_worker` unless ANALYSIS_WORKERS_IN_APP
+    # starts them inside the API process (long-running servers only: serverless instances are frozen between requests)
+    ANALYSIS_WORKERS_IN_APP: bool = False
+    ANALYSIS_WORKERS: int = 2
+    ANALYSIS_POLL_INTERVAL: float = 1.0
+    ANALYSIS_MAX_ATTEMPTS: int = 3
+    ANALYSIS_RETRY_BACKOFF: float = 5.0
+    ANALYSIS_VISIBILITY_TIMEOUT: float = 300.0
+    ANALYSIS_PER_USER_CONCURRENCY: int = 1
+
+    # Authenticated user cache (USER_CACHE_TTL=0 disables it)
+    USER_CACHE_TTL: float = 60.0
+    USER_CACHE_MAX_SIZE: int = 1024
+    USER_CACHE_REDIS_URL: Optional[str] = None
+
+    # Batch find_unique calls made in the same event loop tick into one find_many
+    PRISMA_AUTO_BATCH: bool = False
+
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
 settings = Settings()
@@ -1,12 +1,20 @@
 import os
 import subprocess
 import sys
+import time
 from pathlib import Path
 from typing import Optional
 
+from app.utils.metrics import metrics
+
 db: Optional["Prisma"] = None
 PrismaType = Optional["Prisma"]
 
+
+def _env_flag(name: str) -> bool:
+    return os.environ.get(name, "").lower() in ("1", "true", "yes")
+
+
 def _generate_prisma_client() -> None:
     """
     Generate the Prisma client even when the CLI shim isn't on PATH.
@@ -52,19 +60,20 @@ def _ensure_prisma_client():
         return db
 
     PrismaClass = None
+    client_kwargs = {}
     # Prefer vendored client generated into the repo (app/prisma_client).
     try:
         from app.prisma_client import Prisma as VendoredPrisma  # type: ignore
 
         PrismaClass = VendoredPrisma
+        # Only the vendored client supports these engine options.
+        client_kwargs["unix_socket"] = _env_flag("PRISMA_ENGINE_UDS")
+        # More than one engine process spreads CPU-heavy queries; each has its own DB connection pool.
+        client_kwargs["engine_pool_size"] = int(os.environ.get("PRISMA_ENGINE_POOL_SIZE") or 1)
     except Exception:
         PrismaClass = None
 
-    allow_runtime_generate = os.environ.get("PRISMA_GENERATE_AT_RUNTIME", "").lower() in (
-        "1",
-        "true",
-        "yes",
-    )
+    allow_runtime_generate = _env_flag("PRISMA_GENERATE_AT_RUNTIME")
 
     try:
         if PrismaClass is None:
@@ -91,14 +100,18 @@ def _ensure_prisma_client():
             "or that the default prisma package is installed."
         )
 
-    db = PrismaClass()
+    db = PrismaClass(**client_kwargs)
     return db
 
 
 async def connect_db():
     prisma = _ensure_prisma_client()
     if not prisma.is_connected():
+        # Cold-start cost (engine spawn + readiness), tracked as a histogram
+        started = time.perf_counter()
         await prisma.connect()
+        metrics.observe("prisma.connect_ms", (time.perf_counter() - started) * 1000)
+    return prisma
 
 
 async def disconnect_db():
@@ -1,17 +1,18 @@
 from fastapi import Depends, HTTPException, status
-from fastapi.security import OAuth2PasswordBearer
+from fastapi.security import OAuth2PasswordBearer, HTTPBearer, HTTPAuthorizationCredentials
+from typing import Optional
 import jwt
+import secrets
 from app.config import settings
-from app.database import _ensure_prisma_client
-from app.utils.exceptions import UnauthorizedException
+from app.database import connect_db
+from app.utils.exceptions import UnauthorizedException, NotFoundException
+from app.utils.user_cache import user_cache
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
+metrics_scheme = HTTPBearer(auto_error=False)
 
 async def get_db():
-    prisma = _ensure_prisma_client()
-    if not prisma.is_connected():
-        await prisma.connect()
-    return prisma
+    return await connect_db()
 
 async def get_current_user(token: str = Depends(oauth2_scheme)):
     try:
@@ -22,8 +23,37 @@ async def get_current_user(token: str = Depends(oauth2_scheme)):
     except jwt.PyJWTError:
         raise UnauthorizedException()
     
+    # the generated models are only imported once a request is authenticated
+    from app.prisma_client.models import User
+
     prisma = await get_db()
+    user = await user_cache.get(user_id, User)
+    if user is not None:
+        return user
+
     user = await prisma.user.find_unique(where={"id": user_id})
     if user is None:
         raise UnauthorizedException()
+    await user_cache.set(user_id, user)
+    return user
+
+async def get_current_user_with_token(current_user = Depends(get_current_user)):
+    """Like `get_current_user`, for routes calling GitHub: users read from the shared cache lack `access_token`."""
+    if current_user.access_token is not None:
+        return current_user
+
+    prisma = await get_db()
+    row = await prisma.user.find_unique(where={"id": current_user.id}, select=["id", "access_token"])
+    if row is None:
+        raise UnauthorizedException()
+
+    user = current_user.model_copy(update={"access_token": row.access_token})
+    # kept out of the shared cache, see UserCache
+    await user_cache.set(user.id, user, local_only=True)
     return user
+
+async def require_metrics_token(credentials: Optional[HTTPAuthorizationCredentials] = Depends(metrics_scheme)):
+    if not settings.METRICS_TOKEN:
+        raise NotFoundException()
+    if credentials is None or not secrets.compare_digest(credentials.credentials, settings.METRICS_TOKEN):
+        raise UnauthorizedException()
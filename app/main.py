@@ -1,9 +1,11 @@
-from fastapi import FastAPI, Request, status
+from fastapi import Depends, FastAPI, Request, status
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from app.config import settings
-from app.database import connect_db, disconnect_db
+from app.database import connect_db, disconnect_db, _ensure_prisma_client
+from app.dependencies import require_metrics_token
+from app.prisma_client import loader_scope
 from app.routers import auth, github, judgments, blame
 from app.utils.exceptions import (
     UnauthorizedException,
@@ -12,11 +14,20 @@ from app.utils.exceptions import (
     GitHubAPIException,
     ClaudeAPIException,
 )
+from app.utils.metrics import metrics
+from app.services.job_queue import AnalysisWorkerPool
+from app.services.claude_service import close_clients
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await connect_db()
+    workers = AnalysisWorkerPool(_ensure_prisma_client()) if settings.ANALYSIS_WORKERS_IN_APP else None
+    if workers is not None:
+        workers.start()
     yield
+    if workers is not None:
+        await workers.stop()
+    await close_clients()
     await disconnect_db()
 
 app = FastAPI(lifespan=lifespan)
@@ -29,6 +40,13 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if settings.PRISMA_AUTO_BATCH:
+    @app.middleware("http")
+    async def prisma_loader_scope(request: Request, call_next):
+        # find_unique lookups are batched and cached for the duration of one request
+        with loader_scope():
+            return await call_next(request)
+
 # Exception Handlers
 @app.exception_handler(UnauthorizedException)
 async def unauthorized_exception_handler(request: Request, exc: UnauthorizedException):
@@ -65,6 +83,10 @@ async def claude_api_exception_handler(request: Request, exc: ClaudeAPIException
         content={"message": "Claude API Error", "detail": str(exc)},
     )
 
+@app.get("/metrics", dependencies=[Depends(require_metrics_token)])
+async def get_metrics():
+    return metrics.snapshot()
+
 # Routers
 app.include_router(auth.router, prefix="/auth", tags=["auth"])
 app.include_router(github.router, prefix="/github", tags=["github"])
@@ -1,7 +1,8 @@
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, model_validator
 from typing import Optional, List, Generic, TypeVar, Literal, Union
 from uuid import UUID
 from datetime import datetime
+import json
 
 T = TypeVar("T")
 
@@ -96,11 +97,40 @@ class SuspectResponse(BaseModel):
     last_commit_date: Optional[datetime] = None
     model_config = ConfigDict(from_attributes=True)
 
+BLAME_INTENSITIES = ("mild", "medium", "spicy")
+
+def _as_message_list(value) -> List[str]:
+    if value is None:
+        return []
+    if isinstance(value, list):
+        return [str(v) for v in value if v is not None]
+    return [str(value)]
+
 class BlameMessages(BaseModel):
     mild: List[str]
     medium: List[str]
     spicy: List[str]
 
+    @classmethod
+    def from_stored(cls, value, intensity: Optional[str] = None) -> "BlameMessages":
+        """Decode the jsonb `Blame.message` column (already parsed by the Prisma client).
+
+        Rows not yet rewritten by `scripts.backfill_blame_messages` may still hold a JSON
+        encoded string or a bare single-intensity string/list, those are filed under `intensity`.
+        """
+        if isinstance(value, str):
+            try:
+                value = json.loads(value)
+            except ValueError:
+                pass
+
+        if isinstance(value, dict):
+            return cls(**{key: _as_message_list(value.get(key)) for key in BLAME_INTENSITIES})
+
+        # A bare string/list came from the single-intensity era: file it under that intensity
+        targets = (intensity,) if intensity in BLAME_INTENSITIES else BLAME_INTENSITIES
+        return cls(**{key: _as_message_list(value) if key in targets else [] for key in BLAME_INTENSITIES})
+
 class BlameResponse(BaseModel):
     id: UUID
     target_username: str
@@ -111,6 +141,16 @@ class BlameResponse(BaseModel):
     image_url: Optional[str] = None
     created_at: datetime
 
+    @model_validator(mode="before")
+    @classmethod
+    def _decode_message(cls, data):
+        # Accept a Blame record (or its dump) directly: `message` holds the stored messages
+        if isinstance(data, BaseModel):
+            data = data.model_dump()
+        if isinstance(data, dict) and "messages" not in data:
+            data = {**data, "messages": BlameMessages.from_stored(data.get("message"), data.get("intensity"))}
+        return data
+
 class JudgmentResponse(BaseModel):
     id: UUID
     case_number: str
@@ -126,6 +166,11 @@ class JudgmentResponse(BaseModel):
     blame: Optional[BlameResponse] = None
     model_config = ConfigDict(from_attributes=True)
 
+class AnalysisJobResponse(BaseModel):
+    job_id: UUID
+    judgment_id: UUID
+    status: str
+
 class JudgmentListResponse(BaseModel):
     id: UUID
     case_number: str
@@ -147,3 +192,10 @@ class PaginatedResponse(BaseModel, Generic[T]):
     page: int
     per_page: int
     model_config = ConfigDict(from_attributes=True)
+
+class CursorPaginatedResponse(BaseModel, Generic[T]):
+    items: List[T]
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+    per_page: int
+    model_config = ConfigDict(from_attributes=True)
@@ -18,9 +18,13 @@ from ._metrics import (
     Metrics as Metrics,
     MetricHistogram as MetricHistogram,
 )
+from ._loader import (
+    LoaderScope as LoaderScope,
+    loader_scope as loader_scope,
+)
 
 
-try:
+if TYPE_CHECKING:
     from .client import *
     from .fields import *
     from . import (
@@ -29,32 +33,62 @@ try:
         types as types,
         bases as bases,
     )
-except ModuleNotFoundError:
-    # code has not been generated yet
-    # TODO: this could swallow unexpected errors
-
-    # we only define this magic function when the client has not
-    # been generated for performance reasons and we hide it from
-    # type checkers so that they don't incidentally disable type
-    # checking due to the dynamic nature of the `__getattr__`
-    # magic dunder method.
-    if not TYPE_CHECKING:
-
-        def __getattr__(name: str):
-            try:
-                return globals()[name]
-            except KeyError as err:
-                # TODO: support checking for 'models' here too
-                if name in {'Prisma', 'Client'}:
-                    # TODO: remove this frame from the stack trace
-                    raise RuntimeError(
-                        "The Client hasn't been generated yet, "
-                        'you must run `prisma generate` before you can use the client.\n'
-                        'See https://prisma-client-py.readthedocs.io/en/stable/reference/troubleshooting/#client-has-not-been-generated-yet'
-                    ) from None
-
-                # leaves handling of this potential error to Python as per PEP 562
-                raise AttributeError() from err
+
+
+# The generated modules are large, they are imported on first access instead of with the
+# package so that e.g. `from prisma import loader_scope` does not have to load them.
+# This is hidden from type checkers so that they don't incidentally disable type checking
+# due to the dynamic nature of the `__getattr__` magic dunder method.
+_GENERATED_MODULES = {'models', 'partials', 'types', 'bases'}
+_GENERATED_EXPORTS = {
+    # .client
+    'ENGINE_TYPE': 'client',
+    'SCHEMA_PATH': 'client',
+    'BINARY_PATHS': 'client',
+    'Batch': 'client',
+    'Prisma': 'client',
+    'Client': 'client',
+    'load_env': 'client',
+    'register': 'client',
+    'get_client': 'client',
+    # .fields
+    'Json': 'fields',
+    'Base64': 'fields',
+}
+
+if not TYPE_CHECKING:
+
+    def __getattr__(name: str):
+        if name.startswith('__'):
+            raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+        import importlib
+
+        try:
+            if name in _GENERATED_MODULES:
+                return importlib.import_module(f'{__name__}.{name}')
+
+            submodule = _GENERATED_EXPORTS.get(name)
+            if submodule is not None:
+                value = getattr(importlib.import_module(f'{__name__}.{submodule}'), name)
+                globals()[name] = value
+                return value
+        except ModuleNotFoundError as err:
+            # code has not been generated yet
+            if not (err.name or '').startswith(f'{__name__}.'):
+                raise
+
+            # TODO: support checking for 'models' here too
+            if name in {'Prisma', 'Client'}:
+                # TODO: remove this frame from the stack trace
+                raise RuntimeError(
+                    "The Client hasn't been generated yet, "
+                    'you must run `prisma generate` before you can use the client.\n'
+                    'See https://prisma-client-py.readthedocs.io/en/stable/reference/troubleshooting/#client-has-not-been-generated-yet'
+                ) from None
+
+        # leaves handling of this potential error to Python as per PEP 562
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
 
 setup_logging()
@@ -3,6 +3,7 @@ from typing import Any
 
 import httpx
 
+from ._json import loads
 from ._types import Method
 from .http_abstract import AbstractResponse, AbstractHTTP
 
@@ -24,7 +25,7 @@ class HTTP(AbstractHTTP[httpx.AsyncClient, httpx.Response]):
         return Response(await self.session.request(method, url, **kwargs))
 
     def open(self) -> None:
-        self.session = httpx.AsyncClient(**self.session_kwargs)
+        self.session = httpx.AsyncClient(**self._client_kwargs(httpx.AsyncHTTPTransport))
 
     async def close(self) -> None:
         if self.should_close():
@@ -51,7 +52,10 @@ class Response(AbstractResponse[httpx.Response]):
         return self.original.headers
 
     async def json(self, **kwargs: Any) -> Any:
-        return json.loads(await self.original.aread(), **kwargs)
+        content = await self.original.aread()
+        if kwargs:
+            return json.loads(content, **kwargs)
+        return loads(content)
 
     async def text(self, **kwargs: Any) -> str:
         return ''.join([part async for part in self.original.aiter_text(**kwargs)])
@@ -5,7 +5,6 @@ from __future__ import annotations
 from pathlib import Path
 from typing import TYPE_CHECKING, Union, Optional, List, ClassVar
 
-import tomlkit
 import pydantic
 
 from ._proxy import LazyProxy
@@ -49,6 +48,13 @@ class DefaultConfig(BaseSettings):
         default=None,
     )
 
+    # Where to cache the results of probing the platform & binaries, e.g. the OpenSSL version
+    # and the query engine version, defaults to `binary_cache_dir / 'manifest.json'`
+    binary_manifest: Union[Path, None] = Field(
+        env='PRISMA_BINARY_MANIFEST',
+        default=None,
+    )
+
     # Workaround to support setting the binary platform until it can be properly implemented
     binary_platform: Optional[str] = Field(env='PRISMA_BINARY_PLATFORM', default=None)
 
@@ -86,6 +92,7 @@ class DefaultConfig(BaseSettings):
 
 class Config(DefaultConfig):
     binary_cache_dir: Path = Field(env='PRISMA_BINARY_CACHE_DIR')
+    binary_manifest: Path = Field(env='PRISMA_BINARY_MANIFEST')
 
     @classmethod
     def from_base(cls, config: DefaultConfig) -> Config:
@@ -99,6 +106,9 @@ class Config(DefaultConfig):
                 / config.expected_engine_version
             )
 
+        if config.binary_manifest is None:
+            config.binary_manifest = config.binary_cache_dir / 'manifest.json'
+
         return model_parse(cls, model_dict(config))
 
     @classmethod
@@ -107,6 +117,8 @@ class Config(DefaultConfig):
             path = Path('pyproject.toml')
 
         if path.exists():
+            import tomlkit
+
             config = tomlkit.loads(path.read_text()).get('tool', {}).get('prisma', {})
         else:
             config = {}
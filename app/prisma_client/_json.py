@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import json
+import math
+from typing import Any, Callable, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+
+__all__ = ('HAS_ORJSON', 'loads', 'fast_dumps')
+
+HAS_ORJSON = orjson is not None
+
+# datetimes & dataclasses must go through the `default` hook so that they are
+# rendered exactly like the standard library path would render them
+_DUMPS_OPTIONS = (
+    orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    if orjson is not None
+    else 0
+)
+
+
+def loads(data: Union[str, bytes, bytearray]) -> Any:
+    """Parse JSON, straight from bytes when orjson is installed"""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than the standard library (e.g. NaN, integers wider
+            # than 64 bits), let the standard library decide
+            pass
+
+    return json.loads(data)
+
+
+def fast_dumps(obj: Any, default: Callable[[Any], Any]) -> str | None:
+    """Serialize with orjson, returns None if the standard library should be used instead.
+
+    The output only differs from `json.dumps(obj, default=default, ensure_ascii=False, allow_nan=False)`
+    in insignificant whitespace. Whenever the two would differ otherwise, None is returned so
+    that the caller's standard library call decides, e.g. it raises for NaN and infinities,
+    which orjson would write as `null`.
+    """
+    if orjson is None:
+        return None
+
+    try:
+        dumped = orjson.dumps(obj, default=default, option=_DUMPS_OPTIONS)
+    except orjson.JSONEncodeError:
+        # unsupported values (integers wider than 64 bits, non-str keys, errors raised
+        # by `default`) are retried by the caller so the standard library behaviour,
+        # including the exception raised, is preserved
+        return None
+
+    if b'null' in dumped and _has_non_finite_float(obj, default):
+        return None
+
+    return dumped.decode('utf-8')
+
+
+def _has_non_finite_float(obj: Any, default: Callable[[Any], Any]) -> bool:
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if obj is None or isinstance(obj, (str, int)):
+        return False
+    if isinstance(obj, dict):
+        return any(_has_non_finite_float(value, default) for value in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite_float(item, default) for item in obj)
+
+    try:
+        converted = default(obj)
+    except TypeError:
+        # serialized by orjson itself, e.g. UUIDs
+        return False
+    return _has_non_finite_float(converted, default)
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import json
+import asyncio
+import contextlib
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    from .bases import _PrismaModel
+
+
+__all__ = ('LoaderScope', 'loader_scope', 'current_loader_scope')
+
+_current_scope: ContextVar[Optional['LoaderScope']] = ContextVar('prisma_loader_scope', default=None)
+
+
+class LoaderScope:
+    """Batches `find_unique()` calls made within the same event loop tick.
+
+    Calls filtering on a single unique field, e.g. `find_unique(where={'id': ...})`, are
+    collected until the running callbacks yield and then resolved with one
+    `find_many(where={'id': {'in': [...]}})` query per model, field, include & select.
+
+    With `cache=True` results, including missing records, are kept for the lifetime of
+    the scope so it should be scoped to a single request; writes made within the scope
+    are not reflected in later `find_unique()` calls unless `clear()` is called.
+    """
+
+    def __init__(self, cache: bool = True) -> None:
+        self._cache = cache
+        self._results: Dict[Tuple[Any, ...], 'asyncio.Future[Any]'] = {}
+        self._pending: Dict[Tuple[Any, ...], Dict[Any, 'asyncio.Future[Any]']] = {}
+        self._tasks: Set['asyncio.Task[None]'] = set()
+
+    def clear(self) -> None:
+        """Drop every cached result"""
+        self._results.clear()
+
+    def find_unique(
+        self,
+        actions: Any,
+        where: Dict[str, Any],
+        include: Optional[Dict[str, Any]],
+        select: Optional[List[str]],
+    ) -> Optional['asyncio.Future[Optional[_PrismaModel]]']:
+        """Queue a `find_unique()` call, returns None if the given filter cannot be batched"""
+        if len(where) != 1:
+            return None
+
+        (field, value), = where.items()
+        if field not in actions._loader_fields:
+            return None
+
+        # bool is an int subclass but never a unique key
+        if not isinstance(value, (str, int)) or isinstance(value, bool):
+            return None
+
+        if select is not None and field not in select:
+            return None
+
+        batch_key = (
+            actions._client,
+            actions._model,
+            field,
+            _freeze(include),
+            tuple(select) if select is not None else None,
+        )
+        # futures are shared between callers, shield them from the cancellation of any one caller
+        cached = self._results.get((batch_key, value))
+        if cached is not None:
+            return asyncio.shield(cached)
+
+        loop = asyncio.get_running_loop()
+        pending = self._pending.get(batch_key)
+        if pending is None:
+            pending = self._pending[batch_key] = {}
+            loop.call_soon(self._dispatch, actions, batch_key, include)
+        elif value in pending:
+            return asyncio.shield(pending[value])
+
+        future = pending[value] = loop.create_future()
+        if self._cache:
+            self._results[(batch_key, value)] = future
+        return asyncio.shield(future)
+
+    def _dispatch(
+        self,
+        actions: Any,
+        batch_key: Tuple[Any, ...],
+        include: Optional[Dict[str, Any]],
+    ) -> None:
+        pending = self._pending.pop(batch_key)
+        task = asyncio.get_running_loop().create_task(self._load(actions, batch_key, include, pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _load(
+        self,
+        actions: Any,
+        batch_key: Tuple[Any, ...],
+        include: Optional[Dict[str, Any]],
+        pending: Dict[Any, 'asyncio.Future[Any]'],
+    ) -> None:
+        # the queries below are made directly, not through this scope
+        _current_scope.set(None)
+
+        _, _, field, _, selected = batch_key
+        select = list(selected) if selected is not None else None
+
+        try:
+            if len(pending) == 1:
+                await self._resolve(actions, batch_key, field, include, select, pending)
+                return
+
+            try:
+                records = await actions.find_many(
+                    where={field: {'in': list(pending)}},
+                    include=include,
+                    select=select,
+                )
+            except Exception:
+                # e.g. a single malformed key fails the whole query, give every caller its own result
+                records = []
+
+            found = {getattr(record, field): record for record in records}
+            for value in list(pending):
+                if value in found:
+                    _set_result(pending.pop(value), found[value])
+
+            # misses are resolved individually as the database may match keys that are not
+            # equal in Python, e.g. differently formatted UUIDs
+            await self._resolve(actions, batch_key, field, include, select, pending)
+        except BaseException as exc:
+            for value, future in pending.items():
+                self._results.pop((batch_key, value), None)
+                if future.done():
+                    continue
+                if isinstance(exc, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(exc)
+            raise
+
+    async def _resolve(
+        self,
+        actions: Any,
+        batch_key: Tuple[Any, ...],
+        field: str,
+        include: Optional[Dict[str, Any]],
+        select: Optional[List[str]],
+        pending: Dict[Any, 'asyncio.Future[Any]'],
+    ) -> None:
+        async def resolve(value: Any, future: 'asyncio.Future[Any]') -> None:
+            try:
+                result = await actions.find_unique(where={field: value}, include=include, select=select)
+            except Exception as exc:
+                # errors are not cached, the next call retries
+                self._results.pop((batch_key, value), None)
+                if not future.done():
+                    future.set_exception(exc)
+            else:
+                _set_result(future, result)
+
+        await asyncio.gather(*(resolve(value, future) for value, future in pending.items()))
+
+
+@contextlib.contextmanager
+def loader_scope(scope: Optional[LoaderScope] = None, *, cache: bool = True) -> Iterator[LoaderScope]:
+    """Batch `find_unique()` calls made within this context, see `LoaderScope`"""
+    if scope is None:
+        scope = LoaderScope(cache=cache)
+
+    token = _current_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _current_scope.reset(token)
+
+
+def current_loader_scope() -> Optional[LoaderScope]:
+    return _current_scope.get()
+
+
+def _freeze(include: Optional[Dict[str, Any]]) -> Optional[str]:
+    if include is None:
+        return None
+    return json.dumps(include, sort_keys=True, default=str)
+
+
+def _set_result(future: 'asyncio.Future[Any]', result: Any) -> None:
+    if not future.done():
+        future.set_result(result)
@@ -2,6 +2,7 @@ from typing import Any
 
 import httpx
 
+from ._json import loads
 from ._types import Method
 from .http_abstract import AbstractResponse, AbstractHTTP
 
@@ -23,7 +24,7 @@ class HTTP(AbstractHTTP[httpx.Client, httpx.Response]):
         return Response(self.session.request(method, url, **kwargs))
 
     def open(self) -> None:
-        self.session = httpx.Client(**self.session_kwargs)
+        self.session = httpx.Client(**self._client_kwargs(httpx.HTTPTransport))
 
     def close(self) -> None:
         if self.should_close():
@@ -49,7 +50,9 @@ class Response(AbstractResponse[httpx.Response]):
         return self.original.headers
 
     def json(self, **kwargs: Any) -> Any:
-        return self.original.json(**kwargs)
+        if kwargs:
+            return self.original.json(**kwargs)
+        return loads(self.original.content)
 
     def text(self, **kwargs: Any) -> str:
         return self.original.content.decode(**kwargs)
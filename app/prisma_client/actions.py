@@ -41,11 +41,16 @@ LiteralString = str
 # -- template actions.py.jinja --
 from typing import TypeVar
 import warnings
+import asyncio
+from typing import AsyncIterator
 
-from . import types, errors, bases
+from . import errors, bases
 from ._compat import model_parse
+from .builder import partial_model
+from ._loader import current_loader_scope
 
 if TYPE_CHECKING:
+    from . import types
     from .client import Client
     from .bases import _PrismaModel
 
@@ -59,6 +64,9 @@ class UserActions(Generic[_PrismaModelT]):
         '_model',
     )
 
+    # single field unique keys that `find_unique()` calls can be batched on, see `_loader`
+    _loader_fields = frozenset(['id', 'github_id'])
+
     def __init__(self, client: 'Client', model: Type[_PrismaModelT]) -> None:
         self._client = client
         self._model = model
@@ -68,37 +76,6 @@ class UserActions(Generic[_PrismaModelT]):
         query: LiteralString,
         *args: Any,
     ) -> List[_PrismaModelT]:
-        """Execute a raw SQL query
-
-        Parameters
-        ----------
-        query
-            The raw SQL query string to be executed
-        *args
-            Parameters to be passed to the SQL query, these MUST be used over
-            string formatting to avoid an SQL injection vulnerability
-
-        Returns
-        -------
-        List[prisma.models.User]
-            The records returned by the SQL query
-
-        Raises
-        ------
-        prisma_errors.RawQueryError
-            This could be due to invalid syntax, mismatched number of parameters or any other error
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-
-        Example
-        -------
-        ```py
-        users = await User.prisma().query_raw(
-            'SELECT * FROM User WHERE id = $1',
-            'bbadfchfja',
-        )
-        ```
-        """
         return await self._client.query_raw(query, *args, model=self._model)
 
     async def query_first(
@@ -106,39 +83,6 @@ class UserActions(Generic[_PrismaModelT]):
         query: LiteralString,
         *args: Any,
     ) -> Optional[_PrismaModelT]:
-        """Execute a raw SQL query, returning the first result
-
-        Parameters
-        ----------
-        query
-            The raw SQL query string to be executed
-        *args
-            Parameters to be passed to the SQL query, these MUST be used over
-            string formatting to avoid an SQL injection vulnerability
-
-        Returns
-        -------
-        prisma.models.User
-            The first record returned by the SQL query
-        None
-            The raw SQL query did not return any records
-
-        Raises
-        ------
-        prisma_errors.RawQueryError
-            This could be due to invalid syntax, mismatched number of parameters or any other error
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-
-        Example
-        -------
-        ```py
-        user = await User.prisma().query_first(
-            'SELECT * FROM User WHERE github_id = $1',
-            'dhheabfhf',
-        )
-        ```
-        """
         return await self._client.query_first(query, *args, model=self._model)
 
     async def create(
@@ -146,40 +90,6 @@ class UserActions(Generic[_PrismaModelT]):
         data: types.UserCreateInput,
         include: Optional[types.UserInclude] = None
     ) -> _PrismaModelT:
-        """Create a new User record.
-
-        Parameters
-        ----------
-        data
-            User record data
-        include
-            Specifies which relations should be loaded on the returned User model
-
-        Returns
-        -------
-        prisma.models.User
-            The created User record
-
-        Raises
-        ------
-        prisma.errors.MissingRequiredValueError
-            Value is required but was not found
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-
-        Example
-        -------
-        ```py
-        # create a User record from just the required fields
-        user = await User.prisma().create(
-            data={
-                # data to create a User record
-                'github_id': 'ggciceaie',
-                'username': 'bbehjachib',
-            },
-        )
-        ```
-        """
         resp = await self._client._execute(
             method='create',
             model=self._model,
@@ -196,53 +106,6 @@ class UserActions(Generic[_PrismaModelT]):
         *,
         skip_duplicates: Optional[bool] = None,
     ) -> int:
-        """Create multiple User records at once.
-
-        This function is *not* available when using SQLite.
-
-        Parameters
-        ----------
-        data
-            List of User record data
-        skip_duplicates
-            Boolean flag for ignoring unique constraint errors
-
-        Returns
-        -------
-        int
-            The total number of records created
-
-        Raises
-        ------
-        prisma.errors.UnsupportedDatabaseError
-            Attempting to query when using SQLite
-        prisma.errors.UniqueViolationError
-            A unique constraint check has failed, these can be ignored with the `skip_duplicates` argument
-        prisma.errors.MissingRequiredValueError
-            Value is required but was not found
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-
-        Example
-        -------
-        ```py
-        total = await User.prisma().create_many(
-            data=[
-                {
-                    # data to create a User record
-                    'github_id': 'cadfabfehe',
-                    'username': 'dgiiaaijj',
-                },
-                {
-                    # data to create a User record
-                    'github_id': 'bfaiacjjfc',
-                    'username': 'eigcfgbif',
-                },
-            ],
-            skip_duplicates=True,
-        )
-        ```
-        """
         if self._client._active_provider == 'sqlite':
             raise errors.UnsupportedDatabaseError('sqlite', 'create_many()')
 
@@ -262,39 +125,6 @@ class UserActions(Generic[_PrismaModelT]):
         where: types.UserWhereUniqueInput,
         include: Optional[types.UserInclude] = None
     ) -> Optional[_PrismaModelT]:
-        """Delete a single User record.
-
-        Parameters
-        ----------
-        where
-            User filter to select the record to be deleted, must be unique
-        include
-            Specifies which relations should be loaded on the returned User model
-
-        Returns
-        -------
-        prisma.models.User
-            The deleted User record
-        None
-            Could not find a record to delete
-
-        Raises
-        ------
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-        prisma.errors.MissingRequiredValueError
-            Value is required but was not found
-
-        Example
-        -------
-        ```py
-        user = await User.prisma().delete(
-            where={
-                'id': 'bagcfbhiig',
-            },
-        )
-        ```
-        """
         try:
             resp = await self._client._execute(
                 method='delete',
@@ -312,41 +142,15 @@ class UserActions(Generic[_PrismaModelT]):
     async def find_unique(
         self,
         where: types.UserWhereUniqueInput,
-        include: Optional[types.UserInclude] = None
+        include: Optional[types.UserInclude] = None,
+        select: Optional[List[types.UserScalarFieldKeys]] = None
     ) -> Optional[_PrismaModelT]:
-        """Find a unique User record.
-
-        Parameters
-        ----------
-        where
-            User filter to find the record, must be unique
-        include
-            Specifies which relations should be loaded on the returned User model
-
-        Returns
-        -------
-        prisma.models.User
-            The found User record
-        None
-            No record matching the given input could be found
-
-        Raises
-        ------
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-        prisma.errors.MissingRequiredValueError
-            Value is required but was not found
-
-        Example
-        -------
-        ```py
-        user = await User.prisma().find_unique(
-            where={
-                'id': 'cghideieh',
-            },
-        )
-        ```
-        """
+        scope = current_loader_scope()
+        if scope is not None:
+            loaded = scope.find_unique(self, where, include, select)
+            if loaded is not None:
+                return await loaded
+
         resp = await self._client._execute(
             method='find_unique',
             model=self._model,
@@ -354,50 +158,19 @@ class UserActions(Generic[_PrismaModelT]):
                 'where': where,
                 'include': include,
             },
+            root_selection=select,
         )
         result = resp['data']['result']
         if result is None:
             return None
-        return model_parse(self._model, result)
+        return model_parse(partial_model(self._model, select, include), result)
 
     async def find_unique_or_raise(
         self,
         where: types.UserWhereUniqueInput,
-        include: Optional[types.UserInclude] = None
+        include: Optional[types.UserInclude] = None,
+        select: Optional[List[types.UserScalarFieldKeys]] = None
     ) -> _PrismaModelT:
-        """Find a unique User record. Raises `RecordNotFoundError` if no record is found.
-
-        Parameters
-        ----------
-        where
-            User filter to find the record, must be unique
-        include
-            Specifies which relations should be loaded on the returned User model
-
-        Returns
-        -------
-        prisma.models.User
-            The found User record
-
-        Raises
-        ------
-        prisma.errors.RecordNotFoundError
-            No record was found
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-        prisma.errors.MissingRequiredValueError
-            Value is required but was not found
-
-        Example
-        -------
-        ```py
-        user = await User.prisma().find_unique_or_raise(
-            where={
-                'id': 'biabhbdai',
-            },
-        )
-        ```
-        """
         resp = await self._client._execute(
             method='find_unique_or_raise',
             model=self._model,
@@ -405,8 +178,9 @@ class UserActions(Generic[_PrismaModelT]):
                 'where': where,
                 'include': include,
             },
+            root_selection=select,
         )
-        return model_parse(self._model, resp['data']['result'])
+        return model_parse(partial_model(self._model, select, include), resp['data']['result'])
 
     async def find_many(
         self,
@@ -417,53 +191,8 @@ class UserActions(Generic[_PrismaModelT]):
         include: Optional[types.UserInclude] = None,
         order: Optional[Union[types.UserOrderByInput, List[types.UserOrderByInput]]] = None,
         distinct: Optional[List[types.UserScalarFieldKeys]] = None,
+        select: Optional[List[types.UserScalarFieldKeys]] = None,
     ) -> List[_PrismaModelT]:
-        """Find multiple User records.
-
-        An empty list is returned if no records could be found.
-
-        Parameters
-        ----------
-        take
-            Limit the maximum number of User records returned
-        skip
-            Ignore the first N results
-        where
-            User filter to select records
-        cursor
-            Specifies the position in the list to start returning results from, (typically an ID field)
-        include
-            Specifies which relations should be loaded on the returned User model
-        order
-            Order the returned User records by any field
-        distinct
-            Filter User records by either a single distinct field or distinct combinations of fields
-
-        Returns
-        -------
-        List[prisma.models.User]
-            The list of all User records that could be found
-
-        Raises
-        ------
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-
-        Example
-        -------
-        ```py
-        # find the first 10 User records
-        users = await User.prisma().find_many(take=10)
-
-        # find the first 5 User records ordered by the username field
-        users = await User.prisma().find_many(
-            take=5,
-            order={
-                'username': 'desc',
-            },
-        )
-        ```
-        """
         resp = await self._client._execute(
             method='find_many',
             model=self._model,
@@ -476,8 +205,80 @@ class UserActions(Generic[_PrismaModelT]):
                 'include': include,
                 'distinct': distinct,
             },
+            root_selection=select,
         )
-        return [model_parse(self._model, r) for r in resp['data']['result']]
+        model = partial_model(self._model, select, include)
+        return [model_parse(model, r) for r in resp['data']['result']]
+
+    async def stream(
+        self,
+        batch_size: int = 100,
+        where: Optional[types.UserWhereInput] = None,
+        include: Optional[types.UserInclude] = None,
+        order: Optional[Union[types.UserOrderByInput, List[types.UserOrderByInput]]] = None,
+        select: Optional[List[types.UserScalarFieldKeys]] = None,
+    ) -> AsyncIterator[List[_PrismaModelT]]:
+        if batch_size < 1:
+            raise TypeError(f'Expected batch_size to be a positive integer, got {batch_size}')
+
+        if order is None:
+            order_by: List[types.UserOrderByInput] = []
+        elif isinstance(order, list):
+            order_by = list(order)
+        else:
+            order_by = [order]
+
+        # cursor pagination needs a total order
+        if not any('id' in item for item in order_by):
+            order_by.append({'id': 'asc'})
+
+        if select is not None and 'id' not in select:
+            select = [*select, 'id']
+
+        pending: Optional[asyncio.Task[List[_PrismaModelT]]] = None
+        try:
+            page = await self.find_many(take=batch_size, where=where, include=include, order=order_by, select=select)
+            while page:
+                if len(page) == batch_size:
+                    pending = asyncio.ensure_future(
+                        self.find_many(
+                            take=batch_size,
+                            skip=1,
+                            where=where,
+                            cursor=cast('types.UserWhereUniqueInput', {'id': getattr(page[-1], 'id')}),
+                            include=include,
+                            order=order_by,
+                            select=select,
+                        )
+                    )
+
+                yield page
+
+                if pending is None:
+                    break
+
+                page = await pending
+                pending = None
+        finally:
+            # the caller stopped iterating early, the prefetched batch is no longer needed
+            if pending is not None and not pending.cancel():
+                pending.exception()
+
+    async def find_many_iter(
+        self,
+        batch_size: int = 100,
+        where: Optional[types.UserWhereInput] = None,
+        include: Optional[types.UserInclude] = None,
+        order: Optional[Union[types.UserOrderByInput, List[types.UserOrderByInput]]] = None,
+        select: Optional[List[types.UserScalarFieldKeys]] = None,
+    ) -> AsyncIterator[_PrismaModelT]:
+        pages = self.stream(batch_size=batch_size, where=where, include=include, order=order, select=select)
+        try:
+            async for page in pages:
+                for record in page:
+                    yield record
+        finally:
+            await pages.aclose()
 
     async def find_first(
         self,
@@ -487,48 +288,8 @@ class UserActions(Generic[_PrismaModelT]):
         include: Optional[types.UserInclude] = None,
         order: Optional[Union[types.UserOrderByInput, List[types.UserOrderByInput]]] = None,
         distinct: Optional[List[types.UserScalarFieldKeys]] = None,
+        select: Optional[List[types.UserScalarFieldKeys]] = None,
     ) -> Optional[_PrismaModelT]:
-        """Find a single User record.
-
-        Parameters
-        ----------
-        skip
-            Ignore the first N records
-        where
-            User filter to select the record
-        cursor
-            Specifies the position in the list to start returning results from, (typically an ID field)
-        include
-            Specifies which relations should be loaded on the returned User model
-        order
-            Order the returned User records by any field
-        distinct
-            Filter User records by either a single distinct field or distinct combinations of fields
-
-        Returns
-        -------
-        prisma.models.User
-            The first User record found, matching the given arguments
-        None
-            No record could be found
-
-        Raises
-        ------
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-
-        Example
-        -------
-        ```py
-        # find the second User record ordered by the avatar_url field
-        user = await User.prisma().find_first(
-            skip=1,
-            order={
-                'avatar_url': 'desc',
-            },
-        )
-        ```
-        """
         resp = await self._client._execute(
             method='find_first',
             model=self._model,
@@ -540,12 +301,13 @@ class UserActions(Generic[_PrismaModelT]):
                 'include': include,
                 'distinct': distinct,
             },
+            root_selection=select,
         )
         result = resp['data']['result']
         if result is None:
             return None
 
-        return model_parse(self._model, result)
+        return model_parse(partial_model(self._model, select, include), result)
 
     async def find_first_or_raise(
         self,
@@ -555,48 +317,8 @@ class UserActions(Generic[_PrismaModelT]):
         include: Optional[types.UserInclude] = None,
         order: Optional[Union[types.UserOrderByInput, List[types.UserOrderByInput]]] = None,
         distinct: Optional[List[types.UserScalarFieldKeys]] = None,
+        select: Optional[List[types.UserScalarFieldKeys]] = None,
     ) -> _PrismaModelT:
-        """Find a single User record. Raises `RecordNotFoundError` if no record was found.
-
-        Parameters
-        ----------
-        skip
-            Ignore the first N records
-        where
-            User filter to select the record
-        cursor
-            Specifies the position in the list to start returning results from, (typically an ID field)
-        include
-            Specifies which relations should be loaded on the returned User model
-        order
-            Order the returned User records by any field
-        distinct
-            Filter User records by either a single distinct field or distinct combinations of fields
-
-        Returns
-        -------
-        prisma.models.User
-            The first User record found, matching the given arguments
-
-        Raises
-        ------
-        prisma.errors.RecordNotFoundError
-            No record was found
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-
-        Example
-        -------
-        ```py
-        # find the second User record ordered by the access_token field
-        user = await User.prisma().find_first_or_raise(
-            skip=1,
-            order={
-                'access_token': 'desc',
-            },
-        )
-        ```
-        """
         resp = await self._client._execute(
             method='find_first_or_raise',
             model=self._model,
@@ -608,8 +330,9 @@ class UserActions(Generic[_PrismaModelT]):
                 'include': include,
                 'distinct': distinct,
             },
+            root_selection=select,
         )
-        return model_parse(self._model, resp['data']['result'])
+        return model_parse(partial_model(self._model, select, include), resp['data']['result'])
 
     async def update(
         self,
@@ -617,42 +340,6 @@ class UserActions(Generic[_PrismaModelT]):
         where: types.UserWhereUniqueInput,
         include: Optional[types.UserInclude] = None
     ) -> Optional[_PrismaModelT]:
-        """Update a single User record.
-
-        Parameters
-        ----------
-        data
-            User record data specifying what to update
-        where
-            User filter to select the unique record to create / update
-        include
-            Specifies which relations should be loaded on the returned User model
-
-        Returns
-        -------
-        prisma.models.User
-            The updated User record
-        None
-            No record could be found
-
-        Raises
-        ------
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-
-        Example
-        -------
-        ```py
-        user = await User.prisma().update(
-            where={
-                'id': 'idghgaicb',
-            },
-            data={
-                # data to update the User record to
-            },
-        )
-        ```
-        """
         try:
             resp = await self._client._execute(
                 method='update',
@@ -674,50 +361,6 @@ class UserActions(Generic[_PrismaModelT]):
         data: types.UserUpsertInput,
         include: Optional[types.UserInclude] = None,
     ) -> _PrismaModelT:
-        """Updates an existing record or create a new one
-
-        Parameters
-        ----------
-        where
-            User filter to select the unique record to create / update
-        data
-            Data specifying what fields to set on create and update
-        include
-            Specifies which relations should be loaded on the returned User model
-
-        Returns
-        -------
-        prisma.models.User
-            The created or updated User record
-
-        Raises
-        ------
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-        prisma.errors.MissingRequiredValueError
-            Value is required but was not found
-
-        Example
-        -------
-        ```py
-        user = await User.prisma().upsert(
-            where={
-                'id': 'fjfddhigg',
-            },
-            data={
-                'create': {
-                    'id': 'fjfddhigg',
-                    'github_id': 'bfaiacjjfc',
-                    'username': 'eigcfgbif',
-                },
-                'update': {
-                    'github_id': 'bfaiacjjfc',
-                    'username': 'eigcfgbif',
-                },
-            },
-        )
-        ```
-        """
         resp = await self._client._execute(
             method='upsert',
             model=self._model,
@@ -735,37 +378,6 @@ class UserActions(Generic[_PrismaModelT]):
         data: types.UserUpdateManyMutationInput,
         where: types.UserWhereInput,
     ) -> int:
-        """Update multiple User records
-
-        Parameters
-        ----------
-        data
-            User data to update the selected User records to
-        where
-            Filter to select the User records to update
-
-        Returns
-        -------
-        int
-            The total number of User records that were updated
-
-        Raises
-        ------
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-
-        Example
-        -------
-        ```py
-        # update all User records
-        total = await User.prisma().update_many(
-            data={
-                'created_at': datetime.datetime.utcnow()
-            },
-            where={}
-        )
-        ```
-        """
         resp = await self._client._execute(
             method='update_many',
             model=self._model,
@@ -774,73 +386,8 @@ class UserActions(Generic[_PrismaModelT]):
         )
         return int(resp['data']['result']['count'])
 
-    @overload
-    async def count(
-        self,
-        select: None = None,
-        take: Optional[int] = None,
-        skip: Optional[int] = None,
-        where: Optional[types.UserWhereInput] = None,
-        cursor: Optional[types.UserWhereUniqueInput] = None,
-    ) -> int:
-        """Count the number of User records present in the database
-
-        Parameters
-        ----------
-        select
-            Select the User fields to be counted
-        take
-            Limit the maximum result
-        skip
-            Ignore the first N records
-        where
-            User filter to find records
-        cursor
-            Specifies the position in the list to start counting results from, (typically an ID field)
-        order
-            This parameter is deprecated and will be removed in a future release
-
-        Returns
-        -------
-        int
-            The total number of records found, returned if `select` is not given
-
-        prisma.types.UserCountAggregateOutput
-            Data returned when `select` is used, the fields present in this dictionary will
-            match the fields passed in the `select` argument
-
-        Raises
-        ------
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-
-        Example
-        -------
-        ```py
-        # total: int
-        total = await User.prisma().count()
-
-        # results: prisma.types.UserCountAggregateOutput
-        results = await User.prisma().count(
-            select={
-                '_all': True,
-                'updated_at': True,
-            },
-        )
-        ```
-        """
 
 
-    @overload
-    async def count(
-        self,
-        select: types.UserCountAggregateInput,
-        take: Optional[int] = None,
-        skip: Optional[int] = None,
-        where: Optional[types.UserWhereInput] = None,
-        cursor: Optional[types.UserWhereUniqueInput] = None,
-    ) -> types.UserCountAggregateOutput:
-        ...
 
     async def count(
         self,
@@ -850,52 +397,6 @@ class UserActions(Generic[_PrismaModelT]):
         where: Optional[types.UserWhereInput] = None,
         cursor: Optional[types.UserWhereUniqueInput] = None,
     ) -> Union[int, types.UserCountAggregateOutput]:
-        """Count the number of User records present in the database
-
-        Parameters
-        ----------
-        select
-            Select the User fields to be counted
-        take
-            Limit the maximum result
-        skip
-            Ignore the first N records
-        where
-            User filter to find records
-        cursor
-            Specifies the position in the list to start counting results from, (typically an ID field)
-        order
-            This parameter is deprecated and will be removed in a future release
-
-        Returns
-        -------
-        int
-            The total number of records found, returned if `select` is not given
-
-        prisma.types.UserCountAggregateOutput
-            Data returned when `select` is used, the fields present in this dictionary will
-            match the fields passed in the `select` argument
-
-        Raises
-        ------
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-
-        Example
-        -------
-        ```py
-        # total: int
-        total = await User.prisma().count()
-
-        # results: prisma.types.UserCountAggregateOutput
-        results = await User.prisma().count(
-            select={
-                '_all': True,
-                'id': True,
-            },
-        )
-        ```
-        """
 
         # TODO: this selection building should be moved to the QueryBuilder
         #
@@ -925,36 +426,12 @@ class UserActions(Generic[_PrismaModelT]):
         if select is None:
             return cast(int, resp['data']['result']['_count']['_all'])
         else:
-            return cast(types.UserCountAggregateOutput, resp['data']['result']['_count'])
+            return cast('types.UserCountAggregateOutput', resp['data']['result']['_count'])
 
     async def delete_many(
         self,
         where: Optional[types.UserWhereInput] = None
     ) -> int:
-        """Delete multiple User records.
-
-        Parameters
-        ----------
-        where
-            Optional User filter to find the records to be deleted
-
-        Returns
-        -------
-        int
-            The total number of User records that were deleted
-
-        Raises
-        ------
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-
-        Example
-        -------
-        ```py
-        # delete all User records
-        total = await User.prisma().delete_many()
-        ```
-        """
         resp = await self._client._execute(
             method='delete_many',
             model=self._model,
@@ -982,63 +459,6 @@ class UserActions(Generic[_PrismaModelT]):
         count: Optional[Union[bool, 'types.UserCountAggregateInput']] = None,
         order: Optional[Union[Mapping['types.UserScalarFieldKeys', 'types.SortOrder'], List[Mapping['types.UserScalarFieldKeys', 'types.SortOrder']]]] = None,
     ) -> List['types.UserGroupByOutput']:
-        """Group User records by one or more field values and perform aggregations
-        each group such as finding the average.
-
-        Parameters
-        ----------
-        by
-            List of scalar User fields to group records by
-        where
-            User filter to select records
-        take
-            Limit the maximum number of User records returned
-        skip
-            Ignore the first N records
-        avg
-            Adds the average of all values of the specified fields to the `_avg` field
-            in the returned data.
-        sum
-            Adds the sum of all values of the specified fields to the `_sum` field
-            in the returned data.
-        min
-            Adds the smallest available value for the specified fields to the `_min` field
-            in the returned data.
-        max
-            Adds the largest available value for the specified fields to the `_max` field
-            in the returned data.
-        count
-            Adds a count of non-fields to the `_count` field in the returned data.
-        having
-            Allows you to filter groups by an aggregate value - for example only return
-            groups having an average age less than 50.
-        order
-            Lets you order the returned list by any property that is also present in `by`.
-            Only **one** field is allowed at a time.
-
-        Returns
-        -------
-        List[prisma.types.UserGroupByOutput]
-            A list of dictionaries representing the User record,
-            this will also have additional fields present if aggregation arguments
-            are used (see the above parameters)
-
-        Raises
-        ------
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-
-        Example
-        -------
-        ```py
-        # group User records by github_id values
-        # and count how many records are in each group
-        results = await User.prisma().group_by(
-            ['github_id'],
-            count=True,
-        )
-        ```
-        """
         if order is None:
             if take is not None:
                 raise TypeError('Missing argument: \'order\' which is required when \'take\' is present')
@@ -1087,6 +507,9 @@ class JudgmentActions(Generic[_PrismaModelT]):
         '_model',
     )
 
+    # single field unique keys that `find_unique()` calls can be batched on, see `_loader`
+    _loader_fields = frozenset(['id', 'case_number'])
+
     def __init__(self, client: 'Client', model: Type[_PrismaModelT]) -> None:
         self._client = client
         self._model = model
@@ -1096,37 +519,6 @@ class JudgmentActions(Generic[_PrismaModelT]):
         query: LiteralString,
         *args: Any,
     ) -> List[_PrismaModelT]:
-        """Execute a raw SQL query
-
-        Parameters
-        ----------
-        query
-            The raw SQL query string to be executed
-        *args
-            Parameters to be passed to the SQL query, these MUST be used over
-            string formatting to avoid an SQL injection vulnerability
-
-        Returns
-        -------
-        List[prisma.models.Judgment]
-            The records returned by the SQL query
-
-        Raises
-        ------
-        prisma_errors.RawQueryError
-            This could be due to invalid syntax, mismatched number of parameters or any other error
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-
-        Example
-        -------
-        ```py
-        users = await Judgment.prisma().query_raw(
-            'SELECT * FROM Judgment WHERE id = $1',
-            'hjaecfifb',
-        )
-        ```
-        """
         return await self._client.query_raw(query, *args, model=self._model)
 
     async def query_first(
@@ -1134,39 +526,6 @@ class JudgmentActions(Generic[_PrismaModelT]):
         query: LiteralString,
         *args: Any,
     ) -> Optional[_PrismaModelT]:
-        """Execute a raw SQL query, returning the first result
-
-        Parameters
-        ----------
-        query
-            The raw SQL query string to be executed
-        *args
-            Parameters to be passed to the SQL query, these MUST be used over
-            string formatting to avoid an SQL injection vulnerability
-
-        Returns
-        -------
-        prisma.models.Judgment
-            The first record returned by the SQL query
-        None
-            The raw SQL query did not return any records
-
-        Raises
-        ------
-        prisma_errors.RawQueryError
-            This could be due to invalid syntax, mismatched number of parameters or any other error
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-
-        Example
-        -------
-        ```py
-        user = await Judgment.prisma().query_first(
-            'SELECT * FROM Judgment WHERE user_id = $1',
-            'cbbbjbfcii',
-        )
-        ```
-        """
         return await self._client.query_first(query, *args, model=self._model)
 
     async def create(
@@ -1174,44 +533,6 @@ class JudgmentActions(Generic[_PrismaModelT]):
         data: types.JudgmentCreateInput,
         include: Optional[types.JudgmentInclude] = None
     ) -> _PrismaModelT:
-        """Create a new Judgment record.
-
-        Parameters
-        ----------
-        data
-            Judgment record data
-        include
-            Specifies which relations should be loaded on the returned Judgment model
-
-        Returns
-        -------
-        prisma.models.Judgment
-            The created Judgment record
-
-        Raises
-        ------
-        prisma.errors.MissingRequiredValueError
-            Value is required but was not found
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-
-        Example
-        -------
-        ```py
-        # create a Judgment record from just the required fields
-        judgment = await Judgment.prisma().create(
-            data={
-                # data to create a Judgment record
-                'user_id': 'bbejhfidcb',
-                'repo_owner': 'bgeecijdgg',
-                'repo_name': 'bdiicjafbj',
-                'title': 'bgehebiafc',
-                'status': 'bghffegacj',
-                'case_number': 'bhghchehcc',
-            },
-        )
-        ```
-        """
         resp = await self._client._execute(
             method='create',
             model=self._model,
@@ -1228,61 +549,6 @@ class JudgmentActions(Generic[_PrismaModelT]):
         *,
         skip_duplicates: Optional[bool] = None,
     ) -> int:
-        """Create multiple Judgment records at once.
-
-        This function is *not* available when using SQLite.
-
-        Parameters
-        ----------
-        data
-            List of Judgment record data
-        skip_duplicates
-            Boolean flag for ignoring unique constraint errors
-
-        Returns
-        -------
-        int
-            The total number of records created
-
-        Raises
-        ------
-        prisma.errors.UnsupportedDatabaseError
-            Attempting to query when using SQLite
-        prisma.errors.UniqueViolationError
-            A unique constraint check has failed, these can be ignored with the `skip_duplicates` argument
-        prisma.errors.MissingRequiredValueError
-            Value is required but was not found
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-
-        Example
-        -------
-        ```py
-        total = await Judgment.prisma().create_many(
-            data=[
-                {
-                    # data to create a Judgment record
-                    'user_id': 'dcgchcbbf',
-                    'repo_owner': 'bdedcabahc',
-                    'repo_name': 'ghfhiafcb',
-                    'title': 'heejgedji',
-                    'status': 'bjgjgibgbf',
-                    'case_number': 'bbbgbhfjge',
-                },
-                {
-                    # data to create a Judgment record
-                    'user_id': 'igbehcbab',
-                    'repo_owner': 'bdadaadhag',
-                    'repo_name': 'bgiggdidbf',
-                    'title': 'caaaedabfc',
-                    'status': 'bigibebcib',
-                    'case_number': 'bigaiehgcc',
-                },
-            ],
-            skip_duplicates=True,
-        )
-        ```
-        """
         if self._client._active_provider == 'sqlite':
             raise errors.UnsupportedDatabaseError('sqlite', 'create_many()')
 
@@ -1302,39 +568,6 @@ class JudgmentActions(Generic[_PrismaModelT]):
         where: types.JudgmentWhereUniqueInput,
         include: Optional[types.JudgmentInclude] = None
     ) -> Optional[_PrismaModelT]:
-        """Delete a single Judgment record.
-
-        Parameters
-        ----------
-        where
-            Judgment filter to select the record to be deleted, must be unique
-        include
-            Specifies which relations should be loaded on the returned Judgment model
-
-        Returns
-        -------
-        prisma.models.Judgment
-            The deleted Judgment record
-        None
-            Could not find a record to delete
-
-        Raises
-        ------
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-        prisma.errors.MissingRequiredValueError
-            Value is required but was not found
-
-        Example
-        -------
-        ```py
-        judgment = await Judgment.prisma().delete(
-            where={
-                'id': 'beeifcbebf',
-            },
-        )
-        ```
-        """
         try:
             resp = await self._client._execute(
                 method='delete',
@@ -1352,41 +585,15 @@ class JudgmentActions(Generic[_PrismaModelT]):
     async def find_unique(
         self,
         where: types.JudgmentWhereUniqueInput,
-        include: Optional[types.JudgmentInclude] = None
+        include: Optional[types.JudgmentInclude] = None,
+        select: Optional[List[types.JudgmentScalarFieldKeys]] = None
     ) -> Optional[_PrismaModelT]:
-        """Find a unique Judgment record.
-
-        Parameters
-        ----------
-        where
-            Judgment filter to find the record, must be unique
-        include
-            Specifies which relations should be loaded on the returned Judgment model
-
-        Returns
-        -------
-        prisma.models.Judgment
-            The found Judgment record
-        None
-            No record matching the given input could be found
-
-        Raises
-        ------
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-        prisma.errors.MissingRequiredValueError
-            Value is required but was not found
-
-        Example
-        -------
-        ```py
-        judgment = await Judgment.prisma().find_unique(
-            where={
-                'id': 'bgcigfahea',
-            },
-        )
-        ```
-        """
+        scope = current_loader_scope()
+        if scope is not None:
+            loaded = scope.find_unique(self, where, include, select)
+            if loaded is not None:
+                return await loaded
+
         resp = await self._client._execute(
             method='find_unique',
             model=self._model,
@@ -1394,50 +601,19 @@ class JudgmentActions(Generic[_PrismaModelT]):
                 'where': where,
                 'include': include,
             },
+            root_selection=select,
         )
         result = resp['data']['result']
         if result is None:
             return None
-        return model_parse(self._model, result)
+        return model_parse(partial_model(self._model, select, include), result)
 
     async def find_unique_or_raise(
         self,
         where: types.JudgmentWhereUniqueInput,
-        include: Optional[types.JudgmentInclude] = None
+        include: Optional[types.JudgmentInclude] = None,
+        select: Optional[List[types.JudgmentScalarFieldKeys]] = None
     ) -> _PrismaModelT:
-        """Find a unique Judgment record. Raises `RecordNotFoundError` if no record is found.
-
-        Parameters
-        ----------
-        where
-            Judgment filter to find the record, must be unique
-        include
-            Specifies which relations should be loaded on the returned Judgment model
-
-        Returns
-        -------
-        prisma.models.Judgment
-            The found Judgment record
-
-        Raises
-        ------
-        prisma.errors.RecordNotFoundError
-            No record was found
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-        prisma.errors.MissingRequiredValueError
-            Value is required but was not found
-
-        Example
-        -------
-        ```py
-        judgment = await Judgment.prisma().find_unique_or_raise(
-            where={
-                'id': 'bcejgaggif',
-            },
-        )
-        ```
-        """
         resp = await self._client._execute(
             method='find_unique_or_raise',
             model=self._model,
@@ -1445,8 +621,9 @@ class JudgmentActions(Generic[_PrismaModelT]):
                 'where': where,
                 'include': include,
             },
+            root_selection=select,
         )
-        return model_parse(self._model, resp['data']['result'])
+        return model_parse(partial_model(self._model, select, include), resp['data']['result'])
 
     async def find_many(
         self,
@@ -1457,53 +634,8 @@ class JudgmentActions(Generic[_PrismaModelT]):
         include: Optional[types.JudgmentInclude] = None,
         order: Optional[Union[types.JudgmentOrderByInput, List[types.JudgmentOrderByInput]]] = None,
         distinct: Optional[List[types.JudgmentScalarFieldKeys]] = None,
+        select: Optional[List[types.JudgmentScalarFieldKeys]] = None,
     ) -> List[_PrismaModelT]:
-        """Find multiple Judgment records.
-
-        An empty list is returned if no records could be found.
-
-        Parameters
-        ----------
-        take
-            Limit the maximum number of Judgment records returned
-        skip
-            Ignore the first N results
-        where
-            Judgment filter to select records
-        cursor
-            Specifies the position in the list to start returning results from, (typically an ID field)
-        include
-            Specifies which relations should be loaded on the returned Judgment model
-        order
-            Order the returned Judgment records by any field
-        distinct
-            Filter Judgment records by either a single distinct field or distinct combinations of fields
-
-        Returns
-        -------
-        List[prisma.models.Judgment]
-            The list of all Judgment records that could be found
-
-        Raises
-        ------
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-
-        Example
-        -------
-        ```py
-        # find the first 10 Judgment records
-        judgments = await Judgment.prisma().find_many(take=10)
-
-        # find the first 5 Judgment records ordered by the repo_owner field
-        judgments = await Judgment.prisma().find_many(
-            take=5,
-            order={
-                'repo_owner': 'desc',
-            },
-        )
-        ```
-        """
         resp = await self._client._execute(
             method='find_many',
             model=self._model,
@@ -1516,8 +648,80 @@ class JudgmentActions(Generic[_PrismaModelT]):
                 'include': include,
                 'distinct': distinct,
             },
+            root_selection=select,
         )
-        return [model_parse(self._model, r) for r in resp['data']['result']]
+        model = partial_model(self._model, select, include)
+        return [model_parse(model, r) for r in resp['data']['result']]
+
+    async def stream(
+        self,
+        batch_size: int = 100,
+        where: Optional[types.JudgmentWhereInput] = None,
+        include: Optional[types.JudgmentInclude] = None,
+        order: Optional[Union[types.JudgmentOrderByInput, List[types.JudgmentOrderByInput]]] = None,
+        select: Optional[List[types.JudgmentScalarFieldKeys]] = None,
+    ) -> AsyncIterator[List[_PrismaModelT]]:
+        if batch_size < 1:
+            raise TypeError(f'Expected batch_size to be a positive integer, got {batch_size}')
+
+        if order is None:
+            order_by: List[types.JudgmentOrderByInput] = []
+        elif isinstance(order, list):
+            order_by = list(order)
+        else:
+            order_by = [order]
+
+        # cursor pagination needs a total order
+        if not any('id' in item for item in order_by):
+            order_by.append({'id': 'asc'})
+
+        if select is not None and 'id' not in select:
+            select = [*select, 'id']
+
+        pending: Optional[asyncio.Task[List[_PrismaModelT]]] = None
+        try:
+            page = await self.find_many(take=batch_size, where=where, include=include, order=order_by, select=select)
+            while page:
+                if len(page) == batch_size:
+                    pending = asyncio.ensure_future(
+                        self.find_many(
+                            take=batch_size,
+                            skip=1,
+                            where=where,
+                            cursor=cast('types.JudgmentWhereUniqueInput', {'id': getattr(page[-1], 'id')}),
+                            include=include,
+                            order=order_by,
+                            select=select,
+                        )
+                    )
+
+                yield page
+
+                if pending is None:
+                    break
+
+                page = await pending
+                pending = None
+        finally:
+            # the caller stopped iterating early, the prefetched batch is no longer needed
+            if pending is not None and not pending.cancel():
+                pending.exception()
+
+    async def find_many_iter(
+        self,
+        batch_size: int = 100,
+        where: Optional[types.JudgmentWhereInput] = None,
+        include: Optional[types.JudgmentInclude] = None,
+        order: Optional[Union[types.JudgmentOrderByInput, List[types.JudgmentOrderByInput]]] = None,
+        select: Optional[List[types.JudgmentScalarFieldKeys]] = None,
+    ) -> AsyncIterator[_PrismaModelT]:
+        pages = self.stream(batch_size=batch_size, where=where, include=include, order=order, select=select)
+        try:
+            async for page in pages:
+                for record in page:
+                    yield record
+        finally:
+            await pages.aclose()
 
     async def find_first(
         self,
@@ -1527,48 +731,8 @@ class JudgmentActions(Generic[_PrismaModelT]):
         include: Optional[types.JudgmentInclude] = None,
         order: Optional[Union[types.JudgmentOrderByInput, List[types.JudgmentOrderByInput]]] = None,
         distinct: Optional[List[types.JudgmentScalarFieldKeys]] = None,
+        select: Optional[List[types.JudgmentScalarFieldKeys]] = None,
     ) -> Optional[_PrismaModelT]:
-        """Find a single Judgment record.
-
-        Parameters
-        ----------
-        skip
-            Ignore the first N records
-        where
-            Judgment filter to select the record
-        cursor
-            Specifies the position in the list to start returning results from, (typically an ID field)
-        include
-            Specifies which relations should be loaded on the returned Judgment model
-        order
-            Order the returned Judgment records by any field
-        distinct
-            Filter Judgment records by either a single distinct field or distinct combinations of fields
-
-        Returns
-        -------
-        prisma.models.Judgment
-            The first Judgment record found, matching the given arguments
-        None
-            No record could be found
-
-        Raises
-        ------
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-
-        Example
-        -------
-        ```py
-        # find the second Judgment record ordered by the repo_name field
-        judgment = await Judgment.prisma().find_first(
-            skip=1,
-            order={
-                'repo_name': 'desc',
-            },
-        )
-        ```
-        """
         resp = await self._client._execute(
             method='find_first',
             model=self._model,
@@ -1580,12 +744,13 @@ class JudgmentActions(Generic[_PrismaModelT]):
                 'include': include,
                 'distinct': distinct,
             },
+            root_selection=select,
         )
         result = resp['data']['result']
         if result is None:
             return None
 
-        return model_parse(self._model, result)
+        return model_parse(partial_model(self._model, select, include), result)
 
     async def find_first_or_raise(
         self,
@@ -1595,48 +760,8 @@ class JudgmentActions(Generic[_PrismaModelT]):
         include: Optional[types.JudgmentInclude] = None,
         order: Optional[Union[types.JudgmentOrderByInput, List[types.JudgmentOrderByInput]]] = None,
         distinct: Optional[List[types.JudgmentScalarFieldKeys]] = None,
+        select: Optional[List[types.JudgmentScalarFieldKeys]] = None,
     ) -> _PrismaModelT:
-        """Find a single Judgment record. Raises `RecordNotFoundError` if no record was found.
-
-        Parameters
-        ----------
-        skip
-            Ignore the first N records
-        where
-            Judgment filter to select the record
-        cursor
-            Specifies the position in the list to start returning results from, (typically an ID field)
-        include
-            Specifies which relations should be loaded on the returned Judgment model
-        order
-            Order the returned Judgment records by any field
-        distinct
-            Filter Judgment records by either a single distinct field or distinct combinations of fields
-
-        Returns
-        -------
-        prisma.models.Judgment
-            The first Judgment record found, matching the given arguments
-
-        Raises
-        ------
-        prisma.errors.RecordNotFoundError
-            No record was found
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-
-        Example
-        -------
-        ```py
-        # find the second Judgment record ordered by the title field
-        judgment = await Judgment.prisma().find_first_or_raise(
-            skip=1,
-            order={
-                'title': 'desc',
-            },
-        )
-        ```
-        """
         resp = await self._client._execute(
             method='find_first_or_raise',
             model=self._model,
@@ -1648,8 +773,9 @@ class JudgmentActions(Generic[_PrismaModelT]):
                 'include': include,
                 'distinct': distinct,
             },
+            root_selection=select,
         )
-        return model_parse(self._model, resp['data']['result'])
+        return model_parse(partial_model(self._model, select, include), resp['data']['result'])
 
     async def update(
         self,
@@ -1657,42 +783,6 @@ class JudgmentActions(Generic[_PrismaModelT]):
         where: types.JudgmentWhereUniqueInput,
         include: Optional[types.JudgmentInclude] = None
     ) -> Optional[_PrismaModelT]:
-        """Update a single Judgment record.
-
-        Parameters
-        ----------
-        data
-            Judgment record data specifying what to update
-        where
-            Judgment filter to select the unique record to create / update
-        include
-            Specifies which relations should be loaded on the returned Judgment model
-
-        Returns
-        -------
-        prisma.models.Judgment
-            The updated Judgment record
-        None
-            No record could be found
-
-        Raises
-        ------
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-
-        Example
-        -------
-        ```py
-        judgment = await Judgment.prisma().update(
-            where={
-                'id': 'idfjadbcc',
-            },
-            data={
-                # data to update the Judgment record to
-            },
-        )
-        ```
-        """
         try:
             resp = await self._client._execute(
                 method='update',
@@ -1714,58 +804,6 @@ class JudgmentActions(Generic[_PrismaModelT]):
         data: types.JudgmentUpsertInput,
         include: Optional[types.JudgmentInclude] = None,
     ) -> _PrismaModelT:
-        """Updates an existing record or create a new one
-
-        Parameters
-        ----------
-        where
-            Judgment filter to select the unique record to create / update
-        data
-            Data specifying what fields to set on create and update
-        include
-            Specifies which relations should be loaded on the returned Judgment model
-
-        Returns
-        -------
-        prisma.models.Judgment
-            The created or updated Judgment record
-
-        Raises
-        ------
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-        prisma.errors.MissingRequiredValueError
-            Value is required but was not found
-
-        Example
-        -------
-        ```py
-        judgment = await Judgment.prisma().upsert(
-            where={
-                'id': 'hgdhbjhhj',
-            },
-            data={
-                'create': {
-                    'id': 'hgdhbjhhj',
-                    'user_id': 'igbehcbab',
-                    'repo_owner': 'bdadaadhag',
-                    'repo_name': 'bgiggdidbf',
-                    'title': 'caaaedabfc',
-                    'status': 'bigibebcib',
-                    'case_number': 'bigaiehgcc',
-                },
-                'update': {
-                    'user_id': 'igbehcbab',
-                    'repo_owner': 'bdadaadhag',
-                    'repo_name': 'bgiggdidbf',
-                    'title': 'caaaedabfc',
-                    'status': 'bigibebcib',
-                    'case_number': 'bigaiehgcc',
-                },
-            },
-        )
-        ```
-        """
         resp = await self._client._execute(
             method='upsert',
             model=self._model,
@@ -1783,37 +821,6 @@ class JudgmentActions(Generic[_PrismaModelT]):
         data: types.JudgmentUpdateManyMutationInput,
         where: types.JudgmentWhereInput,
     ) -> int:
-        """Update multiple Judgment records
-
-        Parameters
-        ----------
-        data
-            Judgment data to update the selected Judgment records to
-        where
-            Filter to select the Judgment records to update
-
-        Returns
-        -------
-        int
-            The total number of Judgment records that were updated
-
-        Raises
-        ------
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-
-        Example
-        -------
-        ```py
-        # update all Judgment records
-        total = await Judgment.prisma().update_many(
-            data={
-                'description': 'ecjjjfbae'
-            },
-            where={}
-        )
-        ```
-        """
         resp = await self._client._execute(
             method='update_many',
             model=self._model,
@@ -1822,73 +829,8 @@ class JudgmentActions(Generic[_PrismaModelT]):
         )
         return int(resp['data']['result']['count'])
 
-    @overload
-    async def count(
-        self,
-        select: None = None,
-        take: Optional[int] = None,
-        skip: Optional[int] = None,
-        where: Optional[types.JudgmentWhereInput] = None,
-        cursor: Optional[types.JudgmentWhereUniqueInput] = None,
-    ) -> int:
-        """Count the number of Judgment records present in the database
-
-        Parameters
-        ----------
-        select
-            Select the Judgment fields to be counted
-        take
-            Limit the maximum result
-        skip
-            Ignore the first N records
-        where
-            Judgment filter to find records
-        cursor
-            Specifies the position in the list to start counting results from, (typically an ID field)
-        order
-            This parameter is deprecated and will be removed in a future release
-
-        Returns
-        -------
-        int
-            The total number of records found, returned if `select` is not given
-
-        prisma.types.JudgmentCountAggregateOutput
-            Data returned when `select` is used, the fields present in this dictionary will
-            match the fields passed in the `select` argument
-
-        Raises
-        ------
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-
-        Example
-        -------
-        ```py
-        # total: int
-        total = await Judgment.prisma().count()
-
-        # results: prisma.types.JudgmentCountAggregateOutput
-        results = await Judgment.prisma().count(
-            select={
-                '_all': True,
-                'file_path': True,
-            },
-        )
-        ```
-        """
 
 
-    @overload
-    async def count(
-        self,
-        select: types.JudgmentCountAggregateInput,
-        take: Optional[int] = None,
-        skip: Optional[int] = None,
-        where: Optional[types.JudgmentWhereInput] = None,
-        cursor: Optional[types.JudgmentWhereUniqueInput] = None,
-    ) -> types.JudgmentCountAggregateOutput:
-        ...
 
     async def count(
         self,
@@ -1898,52 +840,6 @@ class JudgmentActions(Generic[_PrismaModelT]):
         where: Optional[types.JudgmentWhereInput] = None,
         cursor: Optional[types.JudgmentWhereUniqueInput] = None,
     ) -> Union[int, types.JudgmentCountAggregateOutput]:
-        """Count the number of Judgment records present in the database
-
-        Parameters
-        ----------
-        select
-            Select the Judgment fields to be counted
-        take
-            Limit the maximum result
-        skip
-            Ignore the first N records
-        where
-            Judgment filter to find records
-        cursor
-            Specifies the position in the list to start counting results from, (typically an ID field)
-        order
-            This parameter is deprecated and will be removed in a future release
-
-        Returns
-        -------
-        int
-            The total number of records found, returned if `select` is not given
-
-        prisma.types.JudgmentCountAggregateOutput
-            Data returned when `select` is used, the fields present in this dictionary will
-            match the fields passed in the `select` argument
-
-        Raises
-        ------
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-
-        Example
-        -------
-        ```py
-        # total: int
-        total = await Judgment.prisma().count()
-
-        # results: prisma.types.JudgmentCountAggregateOutput
-        results = await Judgment.prisma().count(
-            select={
-                '_all': True,
-                'period_days': True,
-            },
-        )
-        ```
-        """
 
         # TODO: this selection building should be moved to the QueryBuilder
         #
@@ -1973,36 +869,12 @@ class JudgmentActions(Generic[_PrismaModelT]):
         if select is None:
             return cast(int, resp['data']['result']['_count']['_all'])
         else:
-            return cast(types.JudgmentCountAggregateOutput, resp['data']['result']['_count'])
+            return cast('types.JudgmentCountAggregateOutput', resp['data']['result']['_count'])
 
     async def delete_many(
         self,
         where: Optional[types.JudgmentWhereInput] = None
     ) -> int:
-        """Delete multiple Judgment records.
-
-        Parameters
-        ----------
-        where
-            Optional Judgment filter to find the records to be deleted
-
-        Returns
-        -------
-        int
-            The total number of Judgment records that were deleted
-
-        Raises
-        ------
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-
-        Example
-        -------
-        ```py
-        # delete all Judgment records
-        total = await Judgment.prisma().delete_many()
-        ```
-        """
         resp = await self._client._execute(
             method='delete_many',
             model=self._model,
@@ -2030,63 +902,6 @@ class JudgmentActions(Generic[_PrismaModelT]):
         count: Optional[Union[bool, 'types.JudgmentCountAggregateInput']] = None,
         order: Optional[Union[Mapping['types.JudgmentScalarFieldKeys', 'types.SortOrder'], List[Mapping['types.JudgmentScalarFieldKeys', 'types.SortOrder']]]] = None,
     ) -> List['types.JudgmentGroupByOutput']:
-        """Group Judgment records by one or more field values and perform aggregations
-        each group such as finding the average.
-
-        Parameters
-        ----------
-        by
-            List of scalar Judgment fields to group records by
-        where
-            Judgment filter to select records
-        take
-            Limit the maximum number of Judgment records returned
-        skip
-            Ignore the first N records
-        avg
-            Adds the average of all values of the specified fields to the `_avg` field
-            in the returned data.
-        sum
-            Adds the sum of all values of the specified fields to the `_sum` field
-            in the returned data.
-        min
-            Adds the smallest available value for the specified fields to the `_min` field
-            in the returned data.
-        max
-            Adds the largest available value for the specified fields to the `_max` field
-            in the returned data.
-        count
-            Adds a count of non-fields to the `_count` field in the returned data.
-        having
-            Allows you to filter groups by an aggregate value - for example only return
-            groups having an average age less than 50.
-        order
-            Lets you order the returned list by any property that is also present in `by`.
-            Only **one** field is allowed at a time.
-
-        Returns
-        -------
-        List[prisma.types.JudgmentGroupByOutput]
-            A list of dictionaries representing the Judgment record,
-            this will also have additional fields present if aggregation arguments
-            are used (see the above parameters)
-
-        Raises
-        ------
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-
-        Example
-        -------
-        ```py
-        # group Judgment records by status values
-        # and count how many records are in each group
-        results = await Judgment.prisma().group_by(
-            ['status'],
-            count=True,
-        )
-        ```
-        """
         if order is None:
             if take is not None:
                 raise TypeError('Missing argument: \'order\' which is required when \'take\' is present')
@@ -2135,6 +950,9 @@ class SuspectActions(Generic[_PrismaModelT]):
         '_model',
     )
 
+    # single field unique keys that `find_unique()` calls can be batched on, see `_loader`
+    _loader_fields = frozenset(['id'])
+
     def __init__(self, client: 'Client', model: Type[_PrismaModelT]) -> None:
         self._client = client
         self._model = model
@@ -2144,37 +962,6 @@ class SuspectActions(Generic[_PrismaModelT]):
         query: LiteralString,
         *args: Any,
     ) -> List[_PrismaModelT]:
-        """Execute a raw SQL query
-
-        Parameters
-        ----------
-        query
-            The raw SQL query string to be executed
-        *args
-            Parameters to be passed to the SQL query, these MUST be used over
-            string formatting to avoid an SQL injection vulnerability
-
-        Returns
-        -------
-        List[prisma.models.Suspect]
-            The records returned by the SQL query
-
-        Raises
-        ------
-        prisma_errors.RawQueryError
-            This could be due to invalid syntax, mismatched number of parameters or any other error
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-
-        Example
-        -------
-        ```py
-        users = await Suspect.prisma().query_raw(
-            'SELECT * FROM Suspect WHERE id = $1',
-            'bhhfibbigf',
-        )
-        ```
-        """
         return await self._client.query_raw(query, *args, model=self._model)
 
     async def query_first(
@@ -2182,39 +969,6 @@ class SuspectActions(Generic[_PrismaModelT]):
         query: LiteralString,
         *args: Any,
     ) -> Optional[_PrismaModelT]:
-        """Execute a raw SQL query, returning the first result
-
-        Parameters
-        ----------
-        query
-            The raw SQL query string to be executed
-        *args
-            Parameters to be passed to the SQL query, these MUST be used over
-            string formatting to avoid an SQL injection vulnerability
-
-        Returns
-        -------
-        prisma.models.Suspect
-            The first record returned by the SQL query
-        None
-            The raw SQL query did not return any records
-
-        Raises
-        ------
-        prisma_errors.RawQueryError
-            This could be due to invalid syntax, mismatched number of parameters or any other error
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-
-        Example
-        -------
-        ```py
-        user = await Suspect.prisma().query_first(
-            'SELECT * FROM Suspect WHERE judgment_id = $1',
-            'ijdbeffgg',
-        )
-        ```
-        """
         return await self._client.query_first(query, *args, model=self._model)
 
     async def create(
@@ -2222,41 +976,6 @@ class SuspectActions(Generic[_PrismaModelT]):
         data: types.SuspectCreateInput,
         include: Optional[types.SuspectInclude] = None
     ) -> _PrismaModelT:
-        """Create a new Suspect record.
-
-        Parameters
-        ----------
-        data
-            Suspect record data
-        include
-            Specifies which relations should be loaded on the returned Suspect model
-
-        Returns
-        -------
-        prisma.models.Suspect
-            The created Suspect record
-
-        Raises
-        ------
-        prisma.errors.MissingRequiredValueError
-            Value is required but was not found
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-
-        Example
-        -------
-        ```py
-        # create a Suspect record from just the required fields
-        suspect = await Suspect.prisma().create(
-            data={
-                # data to create a Suspect record
-                'judgment_id': 'jjfeafhfj',
-                'username': 'cbachdgfce',
-                'responsibility': 271520213,
-            },
-        )
-        ```
-        """
         resp = await self._client._execute(
             method='create',
             model=self._model,
@@ -2273,55 +992,6 @@ class SuspectActions(Generic[_PrismaModelT]):
         *,
         skip_duplicates: Optional[bool] = None,
     ) -> int:
-        """Create multiple Suspect records at once.
-
-        This function is *not* available when using SQLite.
-
-        Parameters
-        ----------
-        data
-            List of Suspect record data
-        skip_duplicates
-            Boolean flag for ignoring unique constraint errors
-
-        Returns
-        -------
-        int
-            The total number of records created
-
-        Raises
-        ------
-        prisma.errors.UnsupportedDatabaseError
-            Attempting to query when using SQLite
-        prisma.errors.UniqueViolationError
-            A unique constraint check has failed, these can be ignored with the `skip_duplicates` argument
-        prisma.errors.MissingRequiredValueError
-            Value is required but was not found
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-
-        Example
-        -------
-        ```py
-        total = await Suspect.prisma().create_many(
-            data=[
-                {
-                    # data to create a Suspect record
-                    'judgment_id': 'efggddide',
-                    'username': 'caficfigfb',
-                    'responsibility': 1583689592,
-                },
-                {
-                    # data to create a Suspect record
-                    'judgment_id': 'ihieecagf',
-                    'username': 'bghfciaafe',
-                    'responsibility': 1627576247,
-                },
-            ],
-            skip_duplicates=True,
-        )
-        ```
-        """
         if self._client._active_provider == 'sqlite':
             raise errors.UnsupportedDatabaseError('sqlite', 'create_many()')
 
@@ -2341,39 +1011,6 @@ class SuspectActions(Generic[_PrismaModelT]):
         where: types.SuspectWhereUniqueInput,
         include: Optional[types.SuspectInclude] = None
     ) -> Optional[_PrismaModelT]:
-        """Delete a single Suspect record.
-
-        Parameters
-        ----------
-        where
-            Suspect filter to select the record to be deleted, must be unique
-        include
-            Specifies which relations should be loaded on the returned Suspect model
-
-        Returns
-        -------
-        prisma.models.Suspect
-            The deleted Suspect record
-        None
-            Could not find a record to delete
-
-        Raises
-        ------
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-        prisma.errors.MissingRequiredValueError
-            Value is required but was not found
-
-        Example
-        -------
-        ```py
-        suspect = await Suspect.prisma().delete(
-            where={
-                'id': 'cafeiaccbc',
-            },
-        )
-        ```
-        """
         try:
             resp = await self._client._execute(
                 method='delete',
@@ -2391,41 +1028,15 @@ class SuspectActions(Generic[_PrismaModelT]):
     async def find_unique(
         self,
         where: types.SuspectWhereUniqueInput,
-        include: Optional[types.SuspectInclude] = None
+        include: Optional[types.SuspectInclude] = None,
+        select: Optional[List[types.SuspectScalarFieldKeys]] = None
     ) -> Optional[_PrismaModelT]:
-        """Find a unique Suspect record.
-
-        Parameters
-        ----------
-        where
-            Suspect filter to find the record, must be unique
-        include
-            Specifies which relations should be loaded on the returned Suspect model
-
-        Returns
-        -------
-        prisma.models.Suspect
-            The found Suspect record
-        None
-            No record matching the given input could be found
-
-        Raises
-        ------
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-        prisma.errors.MissingRequiredValueError
-            Value is required but was not found
-
-        Example
-        -------
-        ```py
-        suspect = await Suspect.prisma().find_unique(
-            where={
-                'id': 'gaddfhfh',
-            },
-        )
-        ```
-        """
+        scope = current_loader_scope()
+        if scope is not None:
+            loaded = scope.find_unique(self, where, include, select)
+            if loaded is not None:
+                return await loaded
+
         resp = await self._client._execute(
             method='find_unique',
             model=self._model,
@@ -2433,50 +1044,19 @@ class SuspectActions(Generic[_PrismaModelT]):
                 'where': where,
                 'include': include,
             },
+            root_selection=select,
         )
         result = resp['data']['result']
         if result is None:
             return None
-        return model_parse(self._model, result)
+        return model_parse(partial_model(self._model, select, include), result)
 
     async def find_unique_or_raise(
         self,
         where: types.SuspectWhereUniqueInput,
-        include: Optional[types.SuspectInclude] = None
+        include: Optional[types.SuspectInclude] = None,
+        select: Optional[List[types.SuspectScalarFieldKeys]] = None
     ) -> _PrismaModelT:
-        """Find a unique Suspect record. Raises `RecordNotFoundError` if no record is found.
-
-        Parameters
-        ----------
-        where
-            Suspect filter to find the record, must be unique
-        include
-            Specifies which relations should be loaded on the returned Suspect model
-
-        Returns
-        -------
-        prisma.models.Suspect
-            The found Suspect record
-
-        Raises
-        ------
-        prisma.errors.RecordNotFoundError
-            No record was found
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-        prisma.errors.MissingRequiredValueError
-            Value is required but was not found
-
-        Example
-        -------
-        ```py
-        suspect = await Suspect.prisma().find_unique_or_raise(
-            where={
-                'id': 'gieegcbeg',
-            },
-        )
-        ```
-        """
         resp = await self._client._execute(
             method='find_unique_or_raise',
             model=self._model,
@@ -2484,8 +1064,9 @@ class SuspectActions(Generic[_PrismaModelT]):
                 'where': where,
                 'include': include,
             },
+            root_selection=select,
         )
-        return model_parse(self._model, resp['data']['result'])
+        return model_parse(partial_model(self._model, select, include), resp['data']['result'])
 
     async def find_many(
         self,
@@ -2496,53 +1077,8 @@ class SuspectActions(Generic[_PrismaModelT]):
         include: Optional[types.SuspectInclude] = None,
         order: Optional[Union[types.SuspectOrderByInput, List[types.SuspectOrderByInput]]] = None,
         distinct: Optional[List[types.SuspectScalarFieldKeys]] = None,
+        select: Optional[List[types.SuspectScalarFieldKeys]] = None,
     ) -> List[_PrismaModelT]:
-        """Find multiple Suspect records.
-
-        An empty list is returned if no records could be found.
-
-        Parameters
-        ----------
-        take
-            Limit the maximum number of Suspect records returned
-        skip
-            Ignore the first N results
-        where
-            Suspect filter to select records
-        cursor
-            Specifies the position in the list to start returning results from, (typically an ID field)
-        include
-            Specifies which relations should be loaded on the returned Suspect model
-        order
-            Order the returned Suspect records by any field
-        distinct
-            Filter Suspect records by either a single distinct field or distinct combinations of fields
-
-        Returns
-        -------
-        List[prisma.models.Suspect]
-            The list of all Suspect records that could be found
-
-        Raises
-        ------
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-
-        Example
-        -------
-        ```py
-        # find the first 10 Suspect records
-        suspects = await Suspect.prisma().find_many(take=10)
-
-        # find the first 5 Suspect records ordered by the username field
-        suspects = await Suspect.prisma().find_many(
-            take=5,
-            order={
-                'username': 'desc',
-            },
-        )
-        ```
-        """
         resp = await self._client._execute(
             method='find_many',
             model=self._model,
@@ -2555,8 +1091,80 @@ class SuspectActions(Generic[_PrismaModelT]):
                 'include': include,
                 'distinct': distinct,
             },
+            root_selection=select,
         )
-        return [model_parse(self._model, r) for r in resp['data']['result']]
+        model = partial_model(self._model, select, include)
+        return [model_parse(model, r) for r in resp['data']['result']]
+
+    async def stream(
+        self,
+        batch_size: int = 100,
+        where: Optional[types.SuspectWhereInput] = None,
+        include: Optional[types.SuspectInclude] = None,
+        order: Optional[Union[types.SuspectOrderByInput, List[types.SuspectOrderByInput]]] = None,
+        select: Optional[List[types.SuspectScalarFieldKeys]] = None,
+    ) -> AsyncIterator[List[_PrismaModelT]]:
+        if batch_size < 1:
+            raise TypeError(f'Expected batch_size to be a positive integer, got {batch_size}')
+
+        if order is None:
+            order_by: List[types.SuspectOrderByInput] = []
+        elif isinstance(order, list):
+            order_by = list(order)
+        else:
+            order_by = [order]
+
+        # cursor pagination needs a total order
+        if not any('id' in item for item in order_by):
+            order_by.append({'id': 'asc'})
+
+        if select is not None and 'id' not in select:
+            select = [*select, 'id']
+
+        pending: Optional[asyncio.Task[List[_PrismaModelT]]] = None
+        try:
+            page = await self.find_many(take=batch_size, where=where, include=include, order=order_by, select=select)
+            while page:
+                if len(page) == batch_size:
+                    pending = asyncio.ensure_future(
+                        self.find_many(
+                            take=batch_size,
+                            skip=1,
+                            where=where,
+                            cursor=cast('types.SuspectWhereUniqueInput', {'id': getattr(page[-1], 'id')}),
+                            include=include,
+                            order=order_by,
+                            select=select,
+                        )
+                    )
+
+                yield page
+
+                if pending is None:
+                    break
+
+                page = await pending
+                pending = None
+        finally:
+            # the caller stopped iterating early, the prefetched batch is no longer needed
+            if pending is not None and not pending.cancel():
+                pending.exception()
+
+    async def find_many_iter(
+        self,
+        batch_size: int = 100,
+        where: Optional[types.SuspectWhereInput] = None,
+        include: Optional[types.SuspectInclude] = None,
+        order: Optional[Union[types.SuspectOrderByInput, List[types.SuspectOrderByInput]]] = None,
+        select: Optional[List[types.SuspectScalarFieldKeys]] = None,
+    ) -> AsyncIterator[_PrismaModelT]:
+        pages = self.stream(batch_size=batch_size, where=where, include=include, order=order, select=select)
+        try:
+            async for page in pages:
+                for record in page:
+                    yield record
+        finally:
+            await pages.aclose()
 
     async def find_first(
         self,
@@ -2566,48 +1174,8 @@ class SuspectActions(Generic[_PrismaModelT]):
         include: Optional[types.SuspectInclude] = None,
         order: Optional[Union[types.SuspectOrderByInput, List[types.SuspectOrderByInput]]] = None,
         distinct: Optional[List[types.SuspectScalarFieldKeys]] = None,
+        select: Optional[List[types.SuspectScalarFieldKeys]] = None,
     ) -> Optional[_PrismaModelT]:
-        """Find a single Suspect record.
-
-        Parameters
-        ----------
-        skip
-            Ignore the first N records
-        where
-            Suspect filter to select the record
-        cursor
-            Specifies the position in the list to start returning results from, (typically an ID field)
-        include
-            Specifies which relations should be loaded on the returned Suspect model
-        order
-            Order the returned Suspect records by any field
-        distinct
-            Filter Suspect records by either a single distinct field or distinct combinations of fields
-
-        Returns
-        -------
-        prisma.models.Suspect
-            The first Suspect record found, matching the given arguments
-        None
-            No record could be found
-
-        Raises
-        ------
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-
-        Example
-        -------
-        ```py
-        # find the second Suspect record ordered by the avatar_url field
-        suspect = await Suspect.prisma().find_first(
-            skip=1,
-            order={
-                'avatar_url': 'desc',
-            },
-        )
-        ```
-        """
         resp = await self._client._execute(
             method='find_first',
             model=self._model,
@@ -2619,12 +1187,13 @@ class SuspectActions(Generic[_PrismaModelT]):
                 'include': include,
                 'distinct': distinct,
             },
+            root_selection=select,
         )
         result = resp['data']['result']
         if result is None:
             return None
 
-        return model_parse(self._model, result)
+        return model_parse(partial_model(self._model, select, include), result)
 
     async def find_first_or_raise(
         self,
@@ -2634,48 +1203,8 @@ class SuspectActions(Generic[_PrismaModelT]):
         include: Optional[types.SuspectInclude] = None,
         order: Optional[Union[types.SuspectOrderByInput, List[types.SuspectOrderByInput]]] = None,
         distinct: Optional[List[types.SuspectScalarFieldKeys]] = None,
+        select: Optional[List[types.SuspectScalarFieldKeys]] = None,
     ) -> _PrismaModelT:
-        """Find a single Suspect record. Raises `RecordNotFoundError` if no record was found.
-
-        Parameters
-        ----------
-        skip
-            Ignore the first N records
-        where
-            Suspect filter to select the record
-        cursor
-            Specifies the position in the list to start returning results from, (typically an ID field)
-        include
-            Specifies which relations should be loaded on the returned Suspect model
-        order
-            Order the returned Suspect records by any field
-        distinct
-            Filter Suspect records by either a single distinct field or distinct combinations of fields
-
-        Returns
-        -------
-        prisma.models.Suspect
-            The first Suspect record found, matching the given arguments
-
-        Raises
-        ------
-        prisma.errors.RecordNotFoundError
-            No record was found
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-
-        Example
-        -------
-        ```py
-        # find the second Suspect record ordered by the responsibility field
-        suspect = await Suspect.prisma().find_first_or_raise(
-            skip=1,
-            order={
-                'responsibility': 'desc',
-            },
-        )
-        ```
-        """
         resp = await self._client._execute(
             method='find_first_or_raise',
             model=self._model,
@@ -2687,8 +1216,9 @@ class SuspectActions(Generic[_PrismaModelT]):
                 'include': include,
                 'distinct': distinct,
             },
+            root_selection=select,
         )
-        return model_parse(self._model, resp['data']['result'])
+        return model_parse(partial_model(self._model, select, include), resp['data']['result'])
 
     async def update(
         self,
@@ -2696,42 +1226,6 @@ class SuspectActions(Generic[_PrismaModelT]):
         where: types.SuspectWhereUniqueInput,
         include: Optional[types.SuspectInclude] = None
     ) -> Optional[_PrismaModelT]:
-        """Update a single Suspect record.
-
-        Parameters
-        ----------
-        data
-            Suspect record data specifying what to update
-        where
-            Suspect filter to select the unique record to create / update
-        include
-            Specifies which relations should be loaded on the returned Suspect model
-
-        Returns
-        -------
-        prisma.models.Suspect
-            The updated Suspect record
-        None
-            No record could be found
-
-        Raises
-        ------
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-
-        Example
-        -------
-        ```py
-        suspect = await Suspect.prisma().update(
-            where={
-                'id': 'bgcffadich',
-            },
-            data={
-                # data to update the Suspect record to
-            },
-        )
-        ```
-        """
         try:
             resp = await self._client._execute(
                 method='update',
@@ -2753,52 +1247,6 @@ class SuspectActions(Generic[_PrismaModelT]):
         data: types.SuspectUpsertInput,
         include: Optional[types.SuspectInclude] = None,
     ) -> _PrismaModelT:
-        """Updates an existing record or create a new one
-
-        Parameters
-        ----------
-        where
-            Suspect filter to select the unique record to create / update
-        data
-            Data specifying what fields to set on create and update
-        include
-            Specifies which relations should be loaded on the returned Suspect model
-
-        Returns
-        -------
-        prisma.models.Suspect
-            The created or updated Suspect record
-
-        Raises
-        ------
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-        prisma.errors.MissingRequiredValueError
-            Value is required but was not found
-
-        Example
-        -------
-        ```py
-        suspect = await Suspect.prisma().upsert(
-            where={
-                'id': 'fcbichhci',
-            },
-            data={
-                'create': {
-                    'id': 'fcbichhci',
-                    'judgment_id': 'ihieecagf',
-                    'username': 'bghfciaafe',
-                    'responsibility': 1627576247,
-                },
-                'update': {
-                    'judgment_id': 'ihieecagf',
-                    'username': 'bghfciaafe',
-                    'responsibility': 1627576247,
-                },
-            },
-        )
-        ```
-        """
         resp = await self._client._execute(
             method='upsert',
             model=self._model,
@@ -2816,37 +1264,6 @@ class SuspectActions(Generic[_PrismaModelT]):
         data: types.SuspectUpdateManyMutationInput,
         where: types.SuspectWhereInput,
     ) -> int:
-        """Update multiple Suspect records
-
-        Parameters
-        ----------
-        data
-            Suspect data to update the selected Suspect records to
-        where
-            Filter to select the Suspect records to update
-
-        Returns
-        -------
-        int
-            The total number of Suspect records that were updated
-
-        Raises
-        ------
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-
-        Example
-        -------
-        ```py
-        # update all Suspect records
-        total = await Suspect.prisma().update_many(
-            data={
-                'reason': 'bcggadccgf'
-            },
-            where={}
-        )
-        ```
-        """
         resp = await self._client._execute(
             method='update_many',
             model=self._model,
@@ -2855,73 +1272,8 @@ class SuspectActions(Generic[_PrismaModelT]):
         )
         return int(resp['data']['result']['count'])
 
-    @overload
-    async def count(
-        self,
-        select: None = None,
-        take: Optional[int] = None,
-        skip: Optional[int] = None,
-        where: Optional[types.SuspectWhereInput] = None,
-        cursor: Optional[types.SuspectWhereUniqueInput] = None,
-    ) -> int:
-        """Count the number of Suspect records present in the database
-
-        Parameters
-        ----------
-        select
-            Select the Suspect fields to be counted
-        take
-            Limit the maximum result
-        skip
-            Ignore the first N records
-        where
-            Suspect filter to find records
-        cursor
-            Specifies the position in the list to start counting results from, (typically an ID field)
-        order
-            This parameter is deprecated and will be removed in a future release
-
-        Returns
-        -------
-        int
-            The total number of records found, returned if `select` is not given
-
-        prisma.types.SuspectCountAggregateOutput
-            Data returned when `select` is used, the fields present in this dictionary will
-            match the fields passed in the `select` argument
-
-        Raises
-        ------
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-
-        Example
-        -------
-        ```py
-        # total: int
-        total = await Suspect.prisma().count()
-
-        # results: prisma.types.SuspectCountAggregateOutput
-        results = await Suspect.prisma().count(
-            select={
-                '_all': True,
-                'commit_count': True,
-            },
-        )
-        ```
-        """
 
 
-    @overload
-    async def count(
-        self,
-        select: types.SuspectCountAggregateInput,
-        take: Optional[int] = None,
-        skip: Optional[int] = None,
-        where: Optional[types.SuspectWhereInput] = None,
-        cursor: Optional[types.SuspectWhereUniqueInput] = None,
-    ) -> types.SuspectCountAggregateOutput:
-        ...
 
     async def count(
         self,
@@ -2931,52 +1283,6 @@ class SuspectActions(Generic[_PrismaModelT]):
         where: Optional[types.SuspectWhereInput] = None,
         cursor: Optional[types.SuspectWhereUniqueInput] = None,
     ) -> Union[int, types.SuspectCountAggregateOutput]:
-        """Count the number of Suspect records present in the database
-
-        Parameters
-        ----------
-        select
-            Select the Suspect fields to be counted
-        take
-            Limit the maximum result
-        skip
-            Ignore the first N records
-        where
-            Suspect filter to find records
-        cursor
-            Specifies the position in the list to start counting results from, (typically an ID field)
-        order
-            This parameter is deprecated and will be removed in a future release
-
-        Returns
-        -------
-        int
-            The total number of records found, returned if `select` is not given
-
-        prisma.types.SuspectCountAggregateOutput
-            Data returned when `select` is used, the fields present in this dictionary will
-            match the fields passed in the `select` argument
-
-        Raises
-        ------
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-
-        Example
-        -------
-        ```py
-        # total: int
-        total = await Suspect.prisma().count()
-
-        # results: prisma.types.SuspectCountAggregateOutput
-        results = await Suspect.prisma().count(
-            select={
-                '_all': True,
-                'last_commit_msg': True,
-            },
-        )
-        ```
-        """
 
         # TODO: this selection building should be moved to the QueryBuilder
         #
@@ -3006,36 +1312,12 @@ class SuspectActions(Generic[_PrismaModelT]):
         if select is None:
             return cast(int, resp['data']['result']['_count']['_all'])
         else:
-            return cast(types.SuspectCountAggregateOutput, resp['data']['result']['_count'])
+            return cast('types.SuspectCountAggregateOutput', resp['data']['result']['_count'])
 
     async def delete_many(
         self,
         where: Optional[types.SuspectWhereInput] = None
     ) -> int:
-        """Delete multiple Suspect records.
-
-        Parameters
-        ----------
-        where
-            Optional Suspect filter to find the records to be deleted
-
-        Returns
-        -------
-        int
-            The total number of Suspect records that were deleted
-
-        Raises
-        ------
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-
-        Example
-        -------
-        ```py
-        # delete all Suspect records
-        total = await Suspect.prisma().delete_many()
-        ```
-        """
         resp = await self._client._execute(
             method='delete_many',
             model=self._model,
@@ -3063,63 +1345,6 @@ class SuspectActions(Generic[_PrismaModelT]):
         count: Optional[Union[bool, 'types.SuspectCountAggregateInput']] = None,
         order: Optional[Union[Mapping['types.SuspectScalarFieldKeys', 'types.SortOrder'], List[Mapping['types.SuspectScalarFieldKeys', 'types.SortOrder']]]] = None,
     ) -> List['types.SuspectGroupByOutput']:
-        """Group Suspect records by one or more field values and perform aggregations
-        each group such as finding the average.
-
-        Parameters
-        ----------
-        by
-            List of scalar Suspect fields to group records by
-        where
-            Suspect filter to select records
-        take
-            Limit the maximum number of Suspect records returned
-        skip
-            Ignore the first N records
-        avg
-            Adds the average of all values of the specified fields to the `_avg` field
-            in the returned data.
-        sum
-            Adds the sum of all values of the specified fields to the `_sum` field
-            in the returned data.
-        min
-            Adds the smallest available value for the specified fields to the `_min` field
-            in the returned data.
-        max
-            Adds the largest available value for the specified fields to the `_max` field
-            in the returned data.
-        count
-            Adds a count of non-fields to the `_count` field in the returned data.
-        having
-            Allows you to filter groups by an aggregate value - for example only return
-            groups having an average age less than 50.
-        order
-            Lets you order the returned list by any property that is also present in `by`.
-            Only **one** field is allowed at a time.
-
-        Returns
-        -------
-        List[prisma.types.SuspectGroupByOutput]
-            A list of dictionaries representing the Suspect record,
-            this will also have additional fields present if aggregation arguments
-            are used (see the above parameters)
-
-        Raises
-        ------
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-
-        Example
-        -------
-        ```py
-        # group Suspect records by last_commit_date values
-        # and count how many records are in each group
-        results = await Suspect.prisma().group_by(
-            ['last_commit_date'],
-            count=True,
-        )
-        ```
-        """
         if order is None:
             if take is not None:
                 raise TypeError('Missing argument: \'order\' which is required when \'take\' is present')
@@ -3168,6 +1393,9 @@ class BlameActions(Generic[_PrismaModelT]):
         '_model',
     )
 
+    # single field unique keys that `find_unique()` calls can be batched on, see `_loader`
+    _loader_fields = frozenset(['id', 'judgment_id'])
+
     def __init__(self, client: 'Client', model: Type[_PrismaModelT]) -> None:
         self._client = client
         self._model = model
@@ -3177,37 +1405,6 @@ class BlameActions(Generic[_PrismaModelT]):
         query: LiteralString,
         *args: Any,
     ) -> List[_PrismaModelT]:
-        """Execute a raw SQL query
-
-        Parameters
-        ----------
-        query
-            The raw SQL query string to be executed
-        *args
-            Parameters to be passed to the SQL query, these MUST be used over
-            string formatting to avoid an SQL injection vulnerability
-
-        Returns
-        -------
-        List[prisma.models.Blame]
-            The records returned by the SQL query
-
-        Raises
-        ------
-        prisma_errors.RawQueryError
-            This could be due to invalid syntax, mismatched number of parameters or any other error
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-
-        Example
-        -------
-        ```py
-        users = await Blame.prisma().query_raw(
-            'SELECT * FROM Blame WHERE id = $1',
-            'jdcfdcgc',
-        )
-        ```
-        """
         return await self._client.query_raw(query, *args, model=self._model)
 
     async def query_first(
@@ -3215,39 +1412,6 @@ class BlameActions(Generic[_PrismaModelT]):
         query: LiteralString,
         *args: Any,
     ) -> Optional[_PrismaModelT]:
-        """Execute a raw SQL query, returning the first result
-
-        Parameters
-        ----------
-        query
-            The raw SQL query string to be executed
-        *args
-            Parameters to be passed to the SQL query, these MUST be used over
-            string formatting to avoid an SQL injection vulnerability
-
-        Returns
-        -------
-        prisma.models.Blame
-            The first record returned by the SQL query
-        None
-            The raw SQL query did not return any records
-
-        Raises
-        ------
-        prisma_errors.RawQueryError
-            This could be due to invalid syntax, mismatched number of parameters or any other error
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-
-        Example
-        -------
-        ```py
-        user = await Blame.prisma().query_first(
-            'SELECT * FROM Blame WHERE judgment_id = $1',
-            'cafdaehjid',
-        )
-        ```
-        """
         return await self._client.query_first(query, *args, model=self._model)
 
     async def create(
@@ -3255,41 +1419,6 @@ class BlameActions(Generic[_PrismaModelT]):
         data: types.BlameCreateInput,
         include: Optional[types.BlameInclude] = None
     ) -> _PrismaModelT:
-        """Create a new Blame record.
-
-        Parameters
-        ----------
-        data
-            Blame record data
-        include
-            Specifies which relations should be loaded on the returned Blame model
-
-        Returns
-        -------
-        prisma.models.Blame
-            The created Blame record
-
-        Raises
-        ------
-        prisma.errors.MissingRequiredValueError
-            Value is required but was not found
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-
-        Example
-        -------
-        ```py
-        # create a Blame record from just the required fields
-        blame = await Blame.prisma().create(
-            data={
-                # data to create a Blame record
-                'judgment_id': 'gifdddbia',
-                'target_username': 'bchehecef',
-                'responsibility': 948921754,
-            },
-        )
-        ```
-        """
         resp = await self._client._execute(
             method='create',
             model=self._model,
@@ -3306,55 +1435,6 @@ class BlameActions(Generic[_PrismaModelT]):
         *,
         skip_duplicates: Optional[bool] = None,
     ) -> int:
-        """Create multiple Blame records at once.
-
-        This function is *not* available when using SQLite.
-
-        Parameters
-        ----------
-        data
-            List of Blame record data
-        skip_duplicates
-            Boolean flag for ignoring unique constraint errors
-
-        Returns
-        -------
-        int
-            The total number of records created
-
-        Raises
-        ------
-        prisma.errors.UnsupportedDatabaseError
-            Attempting to query when using SQLite
-        prisma.errors.UniqueViolationError
-            A unique constraint check has failed, these can be ignored with the `skip_duplicates` argument
-        prisma.errors.MissingRequiredValueError
-            Value is required but was not found
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-
-        Example
-        -------
-        ```py
-        total = await Blame.prisma().create_many(
-            data=[
-                {
-                    # data to create a Blame record
-                    'judgment_id': 'bjgejjabff',
-                    'target_username': 'bcciijbibg',
-                    'responsibility': 255202753,
-                },
-                {
-                    # data to create a Blame record
-                    'judgment_id': 'bccdfhdigc',
-                    'target_username': 'febcgjbfj',
-                    'responsibility': 1064846676,
-                },
-            ],
-            skip_duplicates=True,
-        )
-        ```
-        """
         if self._client._active_provider == 'sqlite':
             raise errors.UnsupportedDatabaseError('sqlite', 'create_many()')
 
@@ -3374,39 +1454,6 @@ class BlameActions(Generic[_PrismaModelT]):
         where: types.BlameWhereUniqueInput,
         include: Optional[types.BlameInclude] = None
     ) -> Optional[_PrismaModelT]:
-        """Delete a single Blame record.
-
-        Parameters
-        ----------
-        where
-            Blame filter to select the record to be deleted, must be unique
-        include
-            Specifies which relations should be loaded on the returned Blame model
-
-        Returns
-        -------
-        prisma.models.Blame
-            The deleted Blame record
-        None
-            Could not find a record to delete
-
-        Raises
-        ------
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-        prisma.errors.MissingRequiredValueError
-            Value is required but was not found
-
-        Example
-        -------
-        ```py
-        blame = await Blame.prisma().delete(
-            where={
-                'id': 'faidicegb',
-            },
-        )
-        ```
-        """
         try:
             resp = await self._client._execute(
                 method='delete',
@@ -3424,41 +1471,15 @@ class BlameActions(Generic[_PrismaModelT]):
     async def find_unique(
         self,
         where: types.BlameWhereUniqueInput,
-        include: Optional[types.BlameInclude] = None
+        include: Optional[types.BlameInclude] = None,
+        select: Optional[List[types.BlameScalarFieldKeys]] = None
     ) -> Optional[_PrismaModelT]:
-        """Find a unique Blame record.
-
-        Parameters
-        ----------
-        where
-            Blame filter to find the record, must be unique
-        include
-            Specifies which relations should be loaded on the returned Blame model
-
-        Returns
-        -------
-        prisma.models.Blame
-            The found Blame record
-        None
-            No record matching the given input could be found
-
-        Raises
-        ------
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-        prisma.errors.MissingRequiredValueError
-            Value is required but was not found
-
-        Example
-        -------
-        ```py
-        blame = await Blame.prisma().find_unique(
-            where={
-                'id': 'bacecgfhbe',
-            },
-        )
-        ```
-        """
+        scope = current_loader_scope()
+        if scope is not None:
+            loaded = scope.find_unique(self, where, include, select)
+            if loaded is not None:
+                return await loaded
+
         resp = await self._client._execute(
             method='find_unique',
             model=self._model,
@@ -3466,50 +1487,19 @@ class BlameActions(Generic[_PrismaModelT]):
                 'where': where,
                 'include': include,
             },
+            root_selection=select,
         )
         result = resp['data']['result']
         if result is None:
             return None
-        return model_parse(self._model, result)
+        return model_parse(partial_model(self._model, select, include), result)
 
     async def find_unique_or_raise(
         self,
         where: types.BlameWhereUniqueInput,
-        include: Optional[types.BlameInclude] = None
+        include: Optional[types.BlameInclude] = None,
+        select: Optional[List[types.BlameScalarFieldKeys]] = None
     ) -> _PrismaModelT:
-        """Find a unique Blame record. Raises `RecordNotFoundError` if no record is found.
-
-        Parameters
-        ----------
-        where
-            Blame filter to find the record, must be unique
-        include
-            Specifies which relations should be loaded on the returned Blame model
-
-        Returns
-        -------
-        prisma.models.Blame
-            The found Blame record
-
-        Raises
-        ------
-        prisma.errors.RecordNotFoundError
-            No record was found
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-        prisma.errors.MissingRequiredValueError
-            Value is required but was not found
-
-        Example
-        -------
-        ```py
-        blame = await Blame.prisma().find_unique_or_raise(
-            where={
-                'id': 'ihcahiead',
-            },
-        )
-        ```
-        """
         resp = await self._client._execute(
             method='find_unique_or_raise',
             model=self._model,
@@ -3517,8 +1507,9 @@ class BlameActions(Generic[_PrismaModelT]):
                 'where': where,
                 'include': include,
             },
+            root_selection=select,
         )
-        return model_parse(self._model, resp['data']['result'])
+        return model_parse(partial_model(self._model, select, include), resp['data']['result'])
 
     async def find_many(
         self,
@@ -3529,53 +1520,8 @@ class BlameActions(Generic[_PrismaModelT]):
         include: Optional[types.BlameInclude] = None,
         order: Optional[Union[types.BlameOrderByInput, List[types.BlameOrderByInput]]] = None,
         distinct: Optional[List[types.BlameScalarFieldKeys]] = None,
+        select: Optional[List[types.BlameScalarFieldKeys]] = None,
     ) -> List[_PrismaModelT]:
-        """Find multiple Blame records.
-
-        An empty list is returned if no records could be found.
-
-        Parameters
-        ----------
-        take
-            Limit the maximum number of Blame records returned
-        skip
-            Ignore the first N results
-        where
-            Blame filter to select records
-        cursor
-            Specifies the position in the list to start returning results from, (typically an ID field)
-        include
-            Specifies which relations should be loaded on the returned Blame model
-        order
-            Order the returned Blame records by any field
-        distinct
-            Filter Blame records by either a single distinct field or distinct combinations of fields
-
-        Returns
-        -------
-        List[prisma.models.Blame]
-            The list of all Blame records that could be found
-
-        Raises
-        ------
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-
-        Example
-        -------
-        ```py
-        # find the first 10 Blame records
-        blames = await Blame.prisma().find_many(take=10)
-
-        # find the first 5 Blame records ordered by the target_username field
-        blames = await Blame.prisma().find_many(
-            take=5,
-            order={
-                'target_username': 'desc',
-            },
-        )
-        ```
-        """
         resp = await self._client._execute(
             method='find_many',
             model=self._model,
@@ -3588,8 +1534,80 @@ class BlameActions(Generic[_PrismaModelT]):
                 'include': include,
                 'distinct': distinct,
             },
+            root_selection=select,
         )
-        return [model_parse(self._model, r) for r in resp['data']['result']]
+        model = partial_model(self._model, select, include)
+        return [model_parse(model, r) for r in resp['data']['result']]
+
+    async def stream(
+        self,
+        batch_size: int = 100,
+        where: Optional[types.BlameWhereInput] = None,
+        include: Optional[types.BlameInclude] = None,
+        order: Optional[Union[types.BlameOrderByInput, List[types.BlameOrderByInput]]] = None,
+        select: Optional[List[types.BlameScalarFieldKeys]] = None,
+    ) -> AsyncIterator[List[_PrismaModelT]]:
+        if batch_size < 1:
+            raise TypeError(f'Expected batch_size to be a positive integer, got {batch_size}')
+
+        if order is None:
+            order_by: List[types.BlameOrderByInput] = []
+        elif isinstance(order, list):
+            order_by = list(order)
+        else:
+            order_by = [order]
+
+        # cursor pagination needs a total order
+        if not any('id' in item for item in order_by):
+            order_by.append({'id': 'asc'})
+
+        if select is not None and 'id' not in select:
+            select = [*select, 'id']
+
+        pending: Optional[asyncio.Task[List[_PrismaModelT]]] = None
+        try:
+            page = await self.find_many(take=batch_size, where=where, include=include, order=order_by, select=select)
+            while page:
+                if len(page) == batch_size:
+                    pending = asyncio.ensure_future(
+                        self.find_many(
+                            take=batch_size,
+                            skip=1,
+                            where=where,
+                            cursor=cast('types.BlameWhereUniqueInput', {'id': getattr(page[-1], 'id')}),
+                            include=include,
+                            order=order_by,
+                            select=select,
+                        )
+                    )
+
+                yield page
+
+                if pending is None:
+                    break
+
+                page = await pending
+                pending = None
+        finally:
+            # the caller stopped iterating early, the prefetched batch is no longer needed
+            if pending is not None and not pending.cancel():
+                pending.exception()
+
+    async def find_many_iter(
+        self,
+        batch_size: int = 100,
+        where: Optional[types.BlameWhereInput] = None,
+        include: Optional[types.BlameInclude] = None,
+        order: Optional[Union[types.BlameOrderByInput, List[types.BlameOrderByInput]]] = None,
+        select: Optional[List[types.BlameScalarFieldKeys]] = None,
+    ) -> AsyncIterator[_PrismaModelT]:
+        pages = self.stream(batch_size=batch_size, where=where, include=include, order=order, select=select)
+        try:
+            async for page in pages:
+                for record in page:
+                    yield record
+        finally:
+            await pages.aclose()
 
     async def find_first(
         self,
@@ -3599,48 +1617,8 @@ class BlameActions(Generic[_PrismaModelT]):
         include: Optional[types.BlameInclude] = None,
         order: Optional[Union[types.BlameOrderByInput, List[types.BlameOrderByInput]]] = None,
         distinct: Optional[List[types.BlameScalarFieldKeys]] = None,
+        select: Optional[List[types.BlameScalarFieldKeys]] = None,
     ) -> Optional[_PrismaModelT]:
-        """Find a single Blame record.
-
-        Parameters
-        ----------
-        skip
-            Ignore the first N records
-        where
-            Blame filter to select the record
-        cursor
-            Specifies the position in the list to start returning results from, (typically an ID field)
-        include
-            Specifies which relations should be loaded on the returned Blame model
-        order
-            Order the returned Blame records by any field
-        distinct
-            Filter Blame records by either a single distinct field or distinct combinations of fields
-
-        Returns
-        -------
-        prisma.models.Blame
-            The first Blame record found, matching the given arguments
-        None
-            No record could be found
-
-        Raises
-        ------
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-
-        Example
-        -------
-        ```py
-        # find the second Blame record ordered by the target_avatar field
-        blame = await Blame.prisma().find_first(
-            skip=1,
-            order={
-                'target_avatar': 'desc',
-            },
-        )
-        ```
-        """
         resp = await self._client._execute(
             method='find_first',
             model=self._model,
@@ -3652,12 +1630,13 @@ class BlameActions(Generic[_PrismaModelT]):
                 'include': include,
                 'distinct': distinct,
             },
+            root_selection=select,
         )
         result = resp['data']['result']
         if result is None:
             return None
 
-        return model_parse(self._model, result)
+        return model_parse(partial_model(self._model, select, include), result)
 
     async def find_first_or_raise(
         self,
@@ -3667,48 +1646,8 @@ class BlameActions(Generic[_PrismaModelT]):
         include: Optional[types.BlameInclude] = None,
         order: Optional[Union[types.BlameOrderByInput, List[types.BlameOrderByInput]]] = None,
         distinct: Optional[List[types.BlameScalarFieldKeys]] = None,
+        select: Optional[List[types.BlameScalarFieldKeys]] = None,
     ) -> _PrismaModelT:
-        """Find a single Blame record. Raises `RecordNotFoundError` if no record was found.
-
-        Parameters
-        ----------
-        skip
-            Ignore the first N records
-        where
-            Blame filter to select the record
-        cursor
-            Specifies the position in the list to start returning results from, (typically an ID field)
-        include
-            Specifies which relations should be loaded on the returned Blame model
-        order
-            Order the returned Blame records by any field
-        distinct
-            Filter Blame records by either a single distinct field or distinct combinations of fields
-
-        Returns
-        -------
-        prisma.models.Blame
-            The first Blame record found, matching the given arguments
-
-        Raises
-        ------
-        prisma.errors.RecordNotFoundError
-            No record was found
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-
-        Example
-        -------
-        ```py
-        # find the second Blame record ordered by the responsibility field
-        blame = await Blame.prisma().find_first_or_raise(
-            skip=1,
-            order={
-                'responsibility': 'desc',
-            },
-        )
-        ```
-        """
         resp = await self._client._execute(
             method='find_first_or_raise',
             model=self._model,
@@ -3720,8 +1659,9 @@ class BlameActions(Generic[_PrismaModelT]):
                 'include': include,
                 'distinct': distinct,
             },
+            root_selection=select,
         )
-        return model_parse(self._model, resp['data']['result'])
+        return model_parse(partial_model(self._model, select, include), resp['data']['result'])
 
     async def update(
         self,
@@ -3729,42 +1669,6 @@ class BlameActions(Generic[_PrismaModelT]):
         where: types.BlameWhereUniqueInput,
         include: Optional[types.BlameInclude] = None
     ) -> Optional[_PrismaModelT]:
-        """Update a single Blame record.
-
-        Parameters
-        ----------
-        data
-            Blame record data specifying what to update
-        where
-            Blame filter to select the unique record to create / update
-        include
-            Specifies which relations should be loaded on the returned Blame model
-
-        Returns
-        -------
-        prisma.models.Blame
-            The updated Blame record
-        None
-            No record could be found
-
-        Raises
-        ------
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-
-        Example
-        -------
-        ```py
-        blame = await Blame.prisma().update(
-            where={
-                'id': 'biheheiajg',
-            },
-            data={
-                # data to update the Blame record to
-            },
-        )
-        ```
-        """
         try:
             resp = await self._client._execute(
                 method='update',
@@ -3786,52 +1690,6 @@ class BlameActions(Generic[_PrismaModelT]):
         data: types.BlameUpsertInput,
         include: Optional[types.BlameInclude] = None,
     ) -> _PrismaModelT:
-        """Updates an existing record or create a new one
-
-        Parameters
-        ----------
-        where
-            Blame filter to select the unique record to create / update
-        data
-            Data specifying what fields to set on create and update
-        include
-            Specifies which relations should be loaded on the returned Blame model
-
-        Returns
-        -------
-        prisma.models.Blame
-            The created or updated Blame record
-
-        Raises
-        ------
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-        prisma.errors.MissingRequiredValueError
-            Value is required but was not found
-
-        Example
-        -------
-        ```py
-        blame = await Blame.prisma().upsert(
-            where={
-                'id': 'jbgijghgb',
-            },
-            data={
-                'create': {
-                    'id': 'jbgijghgb',
-                    'judgment_id': 'bccdfhdigc',
-                    'target_username': 'febcgjbfj',
-                    'responsibility': 1064846676,
-                },
-                'update': {
-                    'judgment_id': 'bccdfhdigc',
-                    'target_username': 'febcgjbfj',
-                    'responsibility': 1064846676,
-                },
-            },
-        )
-        ```
-        """
         resp = await self._client._execute(
             method='upsert',
             model=self._model,
@@ -3849,37 +1707,6 @@ class BlameActions(Generic[_PrismaModelT]):
         data: types.BlameUpdateManyMutationInput,
         where: types.BlameWhereInput,
     ) -> int:
-        """Update multiple Blame records
-
-        Parameters
-        ----------
-        data
-            Blame data to update the selected Blame records to
-        where
-            Filter to select the Blame records to update
-
-        Returns
-        -------
-        int
-            The total number of Blame records that were updated
-
-        Raises
-        ------
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-
-        Example
-        -------
-        ```py
-        # update all Blame records
-        total = await Blame.prisma().update_many(
-            data={
-                'reason': 'hgjcghfbi'
-            },
-            where={}
-        )
-        ```
-        """
         resp = await self._client._execute(
             method='update_many',
             model=self._model,
@@ -3888,73 +1715,8 @@ class BlameActions(Generic[_PrismaModelT]):
         )
         return int(resp['data']['result']['count'])
 
-    @overload
-    async def count(
-        self,
-        select: None = None,
-        take: Optional[int] = None,
-        skip: Optional[int] = None,
-        where: Optional[types.BlameWhereInput] = None,
-        cursor: Optional[types.BlameWhereUniqueInput] = None,
-    ) -> int:
-        """Count the number of Blame records present in the database
-
-        Parameters
-        ----------
-        select
-            Select the Blame fields to be counted
-        take
-            Limit the maximum result
-        skip
-            Ignore the first N records
-        where
-            Blame filter to find records
-        cursor
-            Specifies the position in the list to start counting results from, (typically an ID field)
-        order
-            This parameter is deprecated and will be removed in a future release
-
-        Returns
-        -------
-        int
-            The total number of records found, returned if `select` is not given
-
-        prisma.types.BlameCountAggregateOutput
-            Data returned when `select` is used, the fields present in this dictionary will
-            match the fields passed in the `select` argument
-
-        Raises
-        ------
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-
-        Example
-        -------
-        ```py
-        # total: int
-        total = await Blame.prisma().count()
-
-        # results: prisma.types.BlameCountAggregateOutput
-        results = await Blame.prisma().count(
-            select={
-                '_all': True,
-                'message': True,
-            },
-        )
-        ```
-        """
 
 
-    @overload
-    async def count(
-        self,
-        select: types.BlameCountAggregateInput,
-        take: Optional[int] = None,
-        skip: Optional[int] = None,
-        where: Optional[types.BlameWhereInput] = None,
-        cursor: Optional[types.BlameWhereUniqueInput] = None,
-    ) -> types.BlameCountAggregateOutput:
-        ...
 
     async def count(
         self,
@@ -3964,52 +1726,6 @@ class BlameActions(Generic[_PrismaModelT]):
         where: Optional[types.BlameWhereInput] = None,
         cursor: Optional[types.BlameWhereUniqueInput] = None,
     ) -> Union[int, types.BlameCountAggregateOutput]:
-        """Count the number of Blame records present in the database
-
-        Parameters
-        ----------
-        select
-            Select the Blame fields to be counted
-        take
-            Limit the maximum result
-        skip
-            Ignore the first N records
-        where
-            Blame filter to find records
-        cursor
-            Specifies the position in the list to start counting results from, (typically an ID field)
-        order
-            This parameter is deprecated and will be removed in a future release
-
-        Returns
-        -------
-        int
-            The total number of records found, returned if `select` is not given
-
-        prisma.types.BlameCountAggregateOutput
-            Data returned when `select` is used, the fields present in this dictionary will
-            match the fields passed in the `select` argument
-
-        Raises
-        ------
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-
-        Example
-        -------
-        ```py
-        # total: int
-        total = await Blame.prisma().count()
-
-        # results: prisma.types.BlameCountAggregateOutput
-        results = await Blame.prisma().count(
-            select={
-                '_all': True,
-                'intensity': True,
-            },
-        )
-        ```
-        """
 
         # TODO: this selection building should be moved to the QueryBuilder
         #
@@ -4039,36 +1755,12 @@ class BlameActions(Generic[_PrismaModelT]):
         if select is None:
             return cast(int, resp['data']['result']['_count']['_all'])
         else:
-            return cast(types.BlameCountAggregateOutput, resp['data']['result']['_count'])
+            return cast('types.BlameCountAggregateOutput', resp['data']['result']['_count'])
 
     async def delete_many(
         self,
         where: Optional[types.BlameWhereInput] = None
     ) -> int:
-        """Delete multiple Blame records.
-
-        Parameters
-        ----------
-        where
-            Optional Blame filter to find the records to be deleted
-
-        Returns
-        -------
-        int
-            The total number of Blame records that were deleted
-
-        Raises
-        ------
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-
-        Example
-        -------
-        ```py
-        # delete all Blame records
-        total = await Blame.prisma().delete_many()
-        ```
-        """
         resp = await self._client._execute(
             method='delete_many',
             model=self._model,
@@ -4096,63 +1788,449 @@ class BlameActions(Generic[_PrismaModelT]):
         count: Optional[Union[bool, 'types.BlameCountAggregateInput']] = None,
         order: Optional[Union[Mapping['types.BlameScalarFieldKeys', 'types.SortOrder'], List[Mapping['types.BlameScalarFieldKeys', 'types.SortOrder']]]] = None,
     ) -> List['types.BlameGroupByOutput']:
-        """Group Blame records by one or more field values and perform aggregations
-        each group such as finding the average.
-
-        Parameters
-        ----------
-        by
-            List of scalar Blame fields to group records by
-        where
-            Blame filter to select records
-        take
-            Limit the maximum number of Blame records returned
-        skip
-            Ignore the first N records
-        avg
-            Adds the average of all values of the specified fields to the `_avg` field
-            in the returned data.
-        sum
-            Adds the sum of all values of the specified fields to the `_sum` field
-            in the returned data.
-        min
-            Adds the smallest available value for the specified fields to the `_min` field
-            in the returned data.
-        max
-            Adds the largest available value for the specified fields to the `_max` field
-            in the returned data.
-        count
-            Adds a count of non-fields to the `_count` field in the returned data.
-        having
-            Allows you to filter groups by an aggregate value - for example only return
-            groups having an average age less than 50.
-        order
-            Lets you order the returned list by any property that is also present in `by`.
-            Only **one** field is allowed at a time.
-
-        Returns
-        -------
-        List[prisma.types.BlameGroupByOutput]
-            A list of dictionaries representing the Blame record,
-            this will also have additional fields present if aggregation arguments
-            are used (see the above parameters)
-
-        Raises
-        ------
-        prisma.errors.PrismaError
-            Catch all for every exception raised by Prisma Client Python
-
-        Example
-        -------
-        ```py
-        # group Blame records by image_url values
-        # and count how many records are in each group
-        results = await Blame.prisma().group_by(
-            ['image_url'],
-            count=True,
+        if order is None:
+            if take is not None:
+                raise TypeError('Missing argument: \'order\' which is required when \'take\' is present')
+
+            if skip is not None:
+                raise TypeError('Missing argument: \'order\' which is required when \'skip\' is present')
+
+        root_selection: List[str] = [*by]
+        if avg is not None:
+            root_selection.append(_select_fields('_avg', avg))
+
+        if min is not None:
+            root_selection.append(_select_fields('_min', min))
+
+        if sum is not None:
+            root_selection.append(_select_fields('_sum', sum))
+
+        if max is not None:
+            root_selection.append(_select_fields('_max', max))
+
+        if count is not None:
+            if count is True:
+                root_selection.append('_count { _all }')
+            elif isinstance(count, dict):
+                root_selection.append(_select_fields('_count', count))
+
+        resp = await self._client._execute(
+            method='group_by',
+            model=self._model,
+            arguments={
+                'by': by,
+                'take': take,
+                'skip': skip,
+                'where': where,
+                'having': having,
+                'orderBy': order,
+            },
+            root_selection=root_selection,
+        )
+        return resp['data']['result']  # type: ignore[no-any-return]
+
+
+class AnalysisJobActions(Generic[_PrismaModelT]):
+    __slots__ = (
+        '_client',
+        '_model',
+    )
+
+    # single field unique keys that `find_unique()` calls can be batched on, see `_loader`
+    _loader_fields = frozenset(['id'])
+
+    def __init__(self, client: 'Client', model: Type[_PrismaModelT]) -> None:
+        self._client = client
+        self._model = model
+
+    async def query_raw(
+        self,
+        query: LiteralString,
+        *args: Any,
+    ) -> List[_PrismaModelT]:
+        return await self._client.query_raw(query, *args, model=self._model)
+
+    async def query_first(
+        self,
+        query: LiteralString,
+        *args: Any,
+    ) -> Optional[_PrismaModelT]:
+        return await self._client.query_first(query, *args, model=self._model)
+
+    async def create(
+        self,
+        data: types.AnalysisJobCreateInput,
+        include: Optional[types.AnalysisJobInclude] = None
+    ) -> _PrismaModelT:
+        resp = await self._client._execute(
+            method='create',
+            model=self._model,
+            arguments={
+                'data': data,
+                'include': include,
+            },
+        )
+        return model_parse(self._model, resp['data']['result'])
+
+    async def create_many(
+        self,
+        data: List[types.AnalysisJobCreateWithoutRelationsInput],
+        *,
+        skip_duplicates: Optional[bool] = None,
+    ) -> int:
+        if self._client._active_provider == 'sqlite':
+            raise errors.UnsupportedDatabaseError('sqlite', 'create_many()')
+
+        resp = await self._client._execute(
+            method='create_many',
+            model=self._model,
+            arguments={
+                'data': data,
+                'skipDuplicates': skip_duplicates,
+            },
+            root_selection=['count'],
+        )
+        return int(resp['data']['result']['count'])
+
+    async def delete(
+        self,
+        where: types.AnalysisJobWhereUniqueInput,
+        include: Optional[types.AnalysisJobInclude] = None
+    ) -> Optional[_PrismaModelT]:
+        try:
+            resp = await self._client._execute(
+                method='delete',
+                model=self._model,
+                arguments={
+                    'where': where,
+                    'include': include,
+                },
+            )
+        except errors.RecordNotFoundError:
+            return None
+
+        return model_parse(self._model, resp['data']['result'])
+
+    async def find_unique(
+        self,
+        where: types.AnalysisJobWhereUniqueInput,
+        include: Optional[types.AnalysisJobInclude] = None,
+        select: Optional[List[types.AnalysisJobScalarFieldKeys]] = None
+    ) -> Optional[_PrismaModelT]:
+        scope = current_loader_scope()
+        if scope is not None:
+            loaded = scope.find_unique(self, where, include, select)
+            if loaded is not None:
+                return await loaded
+
+        resp = await self._client._execute(
+            method='find_unique',
+            model=self._model,
+            arguments={
+                'where': where,
+                'include': include,
+            },
+            root_selection=select,
+        )
+        result = resp['data']['result']
+        if result is None:
+            return None
+        return model_parse(partial_model(self._model, select, include), result)
+
+    async def find_unique_or_raise(
+        self,
+        where: types.AnalysisJobWhereUniqueInput,
+        include: Optional[types.AnalysisJobInclude] = None,
+        select: Optional[List[types.AnalysisJobScalarFieldKeys]] = None
+    ) -> _PrismaModelT:
+        resp = await self._client._execute(
+            method='find_unique_or_raise',
+            model=self._model,
+            arguments={
+                'where': where,
+                'include': include,
+            },
+            root_selection=select,
+        )
+        return model_parse(partial_model(self._model, select, include), resp['data']['result'])
+
+    async def find_many(
+        self,
+        take: Optional[int] = None,
+        skip: Optional[int] = None,
+        where: Optional[types.AnalysisJobWhereInput] = None,
+        cursor: Optional[types.AnalysisJobWhereUniqueInput] = None,
+        include: Optional[types.AnalysisJobInclude] = None,
+        order: Optional[Union[types.AnalysisJobOrderByInput, List[types.AnalysisJobOrderByInput]]] = None,
+        distinct: Optional[List[types.AnalysisJobScalarFieldKeys]] = None,
+        select: Optional[List[types.AnalysisJobScalarFieldKeys]] = None,
+    ) -> List[_PrismaModelT]:
+        resp = await self._client._execute(
+            method='find_many',
+            model=self._model,
+            arguments={
+                'take': take,
+                'skip': skip,
+                'where': where,
+                'order_by': order,
+                'cursor': cursor,
+                'include': include,
+                'distinct': distinct,
+            },
+            root_selection=select,
         )
-        ```
-        """
+        model = partial_model(self._model, select, include)
+        return [model_parse(model, r) for r in resp['data']['result']]
+
+    async def stream(
+        self,
+        batch_size: int = 100,
+        where: Optional[types.AnalysisJobWhereInput] = None,
+        include: Optional[types.AnalysisJobInclude] = None,
+        order: Optional[Union[types.AnalysisJobOrderByInput, List[types.AnalysisJobOrderByInput]]] = None,
+        select: Optional[List[types.AnalysisJobScalarFieldKeys]] = None,
+    ) -> AsyncIterator[List[_PrismaModelT]]:
+        if batch_size < 1:
+            raise TypeError(f'Expected batch_size to be a positive integer, got {batch_size}')
+
+        if order is None:
+            order_by: List[types.AnalysisJobOrderByInput] = []
+        elif isinstance(order, list):
+            order_by = list(order)
+        else:
+            order_by = [order]
+
+        # cursor pagination needs a total order
+        if not any('id' in item for item in order_by):
+            order_by.append({'id': 'asc'})
+
+        if select is not None and 'id' not in select:
+            select = [*select, 'id']
+
+        pending: Optional[asyncio.Task[List[_PrismaModelT]]] = None
+        try:
+            page = await self.find_many(take=batch_size, where=where, include=include, order=order_by, select=select)
+            while page:
+                if len(page) == batch_size:
+                    pending = asyncio.ensure_future(
+                        self.find_many(
+                            take=batch_size,
+                            skip=1,
+                            where=where,
+                            cursor=cast('types.AnalysisJobWhereUniqueInput', {'id': getattr(page[-1], 'id')}),
+                            include=include,
+                            order=order_by,
+                            select=select,
+                        )
+                    )
+
+                yield page
+
+                if pending is None:
+                    break
+
+                page = await pending
+                pending = None
+        finally:
+            # the caller stopped iterating early, the prefetched batch is no longer needed
+            if pending is not None and not pending.cancel():
+                pending.exception()
+
+    async def find_many_iter(
+        self,
+        batch_size: int = 100,
+        where: Optional[types.AnalysisJobWhereInput] = None,
+        include: Optional[types.AnalysisJobInclude] = None,
+        order: Optional[Union[types.AnalysisJobOrderByInput, List[types.AnalysisJobOrderByInput]]] = None,
+        select: Optional[List[types.AnalysisJobScalarFieldKeys]] = None,
+    ) -> AsyncIterator[_PrismaModelT]:
+        pages = self.stream(batch_size=batch_size, where=where, include=include, order=order, select=select)
+        try:
+            async for page in pages:
+                for record in page:
+                    yield record
+        finally:
+            await pages.aclose()
+
+    async def find_first(
+        self,
+        skip: Optional[int] = None,
+        where: Optional[types.AnalysisJobWhereInput] = None,
+        cursor: Optional[types.AnalysisJobWhereUniqueInput] = None,
+        include: Optional[types.AnalysisJobInclude] = None,
+        order: Optional[Union[types.AnalysisJobOrderByInput, List[types.AnalysisJobOrderByInput]]] = None,
+        distinct: Optional[List[types.AnalysisJobScalarFieldKeys]] = None,
+        select: Optional[List[types.AnalysisJobScalarFieldKeys]] = None,
+    ) -> Optional[_PrismaModelT]:
+        resp = await self._client._execute(
+            method='find_first',
+            model=self._model,
+            arguments={
+                'skip': skip,
+                'where': where,
+                'order_by': order,
+                'cursor': cursor,
+                'include': include,
+                'distinct': distinct,
+            },
+            root_selection=select,
+        )
+        result = resp['data']['result']
+        if result is None:
+            return None
+
+        return model_parse(partial_model(self._model, select, include), result)
+
+    async def find_first_or_raise(
+        self,
+        skip: Optional[int] = None,
+        where: Optional[types.AnalysisJobWhereInput] = None,
+        cursor: Optional[types.AnalysisJobWhereUniqueInput] = None,
+        include: Optional[types.AnalysisJobInclude] = None,
+        order: Optional[Union[types.AnalysisJobOrderByInput, List[types.AnalysisJobOrderByInput]]] = None,
+        distinct: Optional[List[types.AnalysisJobScalarFieldKeys]] = None,
+        select: Optional[List[types.AnalysisJobScalarFieldKeys]] = None,
+    ) -> _PrismaModelT:
+        resp = await self._client._execute(
+            method='find_first_or_raise',
+            model=self._model,
+            arguments={
+                'skip': skip,
+                'where': where,
+                'order_by': order,
+                'cursor': cursor,
+                'include': include,
+                'distinct': distinct,
+            },
+            root_selection=select,
+        )
+        return model_parse(partial_model(self._model, select, include), resp['data']['result'])
+
+    async def update(
+        self,
+        data: types.AnalysisJobUpdateInput,
+        where: types.AnalysisJobWhereUniqueInput,
+        include: Optional[types.AnalysisJobInclude] = None
+    ) -> Optional[_PrismaModelT]:
+        try:
+            resp = await self._client._execute(
+                method='update',
+                model=self._model,
+                arguments={
+                    'data': data,
+                    'where': where,
+                    'include': include,
+                },
+            )
+        except errors.RecordNotFoundError:
+            return None
+
+        return model_parse(self._model, resp['data']['result'])
+
+    async def upsert(
+        self,
+        where: types.AnalysisJobWhereUniqueInput,
+        data: types.AnalysisJobUpsertInput,
+        include: Optional[types.AnalysisJobInclude] = None,
+    ) -> _PrismaModelT:
+        resp = await self._client._execute(
+            method='upsert',
+            model=self._model,
+            arguments={
+                'where': where,
+                'include': include,
+                'create': data.get('create'),
+                'update': data.get('update'),
+            },
+        )
+        return model_parse(self._model, resp['data']['result'])
+
+    async def update_many(
+        self,
+        data: types.AnalysisJobUpdateManyMutationInput,
+        where: types.AnalysisJobWhereInput,
+    ) -> int:
+        resp = await self._client._execute(
+            method='update_many',
+            model=self._model,
+            arguments={'data': data, 'where': where,},
+            root_selection=['count'],
+        )
+        return int(resp['data']['result']['count'])
+
+
+
+
+    async def count(
+        self,
+        select: Optional[types.AnalysisJobCountAggregateInput] = None,
+        take: Optional[int] = None,
+        skip: Optional[int] = None,
+        where: Optional[types.AnalysisJobWhereInput] = None,
+        cursor: Optional[types.AnalysisJobWhereUniqueInput] = None,
+    ) -> Union[int, types.AnalysisJobCountAggregateOutput]:
+
+        # TODO: this selection building should be moved to the QueryBuilder
+        #
+        # note the distinction between checking for `not select` here and `select is None`
+        # later is to handle the case that the given select dictionary is empty, this
+        # is a limitation of our types.
+        if not select:
+            root_selection = ['_count { _all }']
+        else:
+
+            root_selection = [
+                '_count {{ {0} }}'.format(' '.join(k for k, v in select.items() if v is True))
+            ]
+
+        resp = await self._client._execute(
+            method='count',
+            model=self._model,
+            arguments={
+                'take': take,
+                'skip': skip,
+                'where': where,
+                'cursor': cursor,
+            },
+            root_selection=root_selection,
+        )
+
+        if select is None:
+            return cast(int, resp['data']['result']['_count']['_all'])
+        else:
+            return cast('types.AnalysisJobCountAggregateOutput', resp['data']['result']['_count'])
+
+    async def delete_many(
+        self,
+        where: Optional[types.AnalysisJobWhereInput] = None
+    ) -> int:
+        resp = await self._client._execute(
+            method='delete_many',
+            model=self._model,
+            arguments={'where': where},
+            root_selection=['count'],
+        )
+        return int(resp['data']['result']['count'])
+
+    # TODO: make this easier to work with safely, currently output fields are typed as
+    #       not required, we should refactor the return type
+    # TODO: consider returning a Dict where the keys are a Tuple of the `by` selection
+    # TODO: statically type that the order argument is required when take or skip are present
+    async def group_by(
+        self,
+        by: List['types.AnalysisJobScalarFieldKeys'],
+        *,
+        where: Optional['types.AnalysisJobWhereInput'] = None,
+        take: Optional[int] = None,
+        skip: Optional[int] = None,
+        avg: Optional['types.AnalysisJobAvgAggregateInput'] = None,
+        sum: Optional['types.AnalysisJobSumAggregateInput'] = None,
+        min: Optional['types.AnalysisJobMinAggregateInput'] = None,
+        max: Optional['types.AnalysisJobMaxAggregateInput'] = None,
+        having: Optional['types.AnalysisJobScalarWhereWithAggregatesInput'] = None,
+        count: Optional[Union[bool, 'types.AnalysisJobCountAggregateInput']] = None,
+        order: Optional[Union[Mapping['types.AnalysisJobScalarFieldKeys', 'types.SortOrder'], List[Mapping['types.AnalysisJobScalarFieldKeys', 'types.SortOrder']]]] = None,
+    ) -> List['types.AnalysisJobGroupByOutput']:
         if order is None:
             if take is not None:
                 raise TypeError('Missing argument: \'order\' which is required when \'take\' is present')
@@ -4197,12 +2275,8 @@ class BlameActions(Generic[_PrismaModelT]):
 
 
 def _select_fields(root: str, select: Mapping[str, Any]) -> str:
-    """Helper to build a GraphQL selection string
-
-    This is a work around until field selection is added to the query builder.
-    """
 
     return root + ' {{ {0} }}'.format(' '.join(k for k, v in select.items() if v is True))
 
 
-from . import models
\ No newline at end of file
+from . import models
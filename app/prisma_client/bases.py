@@ -114,3 +114,13 @@ class BaseBlame(_PrismaModel):
         return actions.BlameActions[_PrismaModelT](client or get_client(), cls)
 
 
+class BaseAnalysisJob(_PrismaModel):
+    __prisma_model__: ClassVar[Literal['AnalysisJob']] = 'AnalysisJob'  # pyright: ignore[reportIncompatibleVariableOverride]
+
+    @classmethod
+    def prisma(cls: Type[_PrismaModelT], client: Optional['Prisma'] = None) -> 'actions.AnalysisJobActions[_PrismaModelT]':
+        from .client import get_client
+
+        return actions.AnalysisJobActions[_PrismaModelT](client or get_client(), cls)
+
+
@@ -0,0 +1,170 @@
+"""Cache for the results of probing the platform and binaries.
+
+Resolving the query engine runs a number of subprocesses, e.g. `openssl version` and
+`query-engine --version`, the results are stored in a JSON manifest at
+`config.binary_manifest` so that later processes can skip them. Every entry is stored
+with a stamp of the contents of the files it was derived from and is probed again once
+they change.
+
+`python -m app.prisma_client py prebake` (or `python -m scripts.prebake_prisma`) writes the
+manifest at build time to `BUNDLED_MANIFEST`, inside the package so that it is deployed with it.
+The `prisma` executable runs the CLI of the installed `prisma` package instead, which has no
+such command. The bundled manifest is read when the one at
+`config.binary_manifest` does not exist, e.g. on a fresh serverless instance where the
+cache directory is not deployed and may not even be writable. Stamps and keys do not
+depend on where the files are located or when they were copied, so that the bundled
+entries still apply once deployed.
+"""
+
+from __future__ import annotations
+
+import os
+import json
+import shutil
+import hashlib
+import logging
+import tempfile
+import platform as _platform
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from .. import config
+
+
+__all__ = (
+    'MANIFEST_VERSION',
+    'BUNDLED_MANIFEST',
+    'cached',
+    'cached_for_binary',
+    'file_stamp',
+    'platform_stamp',
+    'write',
+)
+
+log: logging.Logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+# bump whenever the shape of the entries or how they are probed changes
+MANIFEST_VERSION = 2
+
+BUNDLED_MANIFEST = Path(__file__).parent.parent / 'binary-manifest.json'
+
+# only the start and the end of binaries are hashed, the query engine is tens of megabytes
+_STAMP_CHUNK_SIZE = 64 * 1024
+
+_manifest: Optional[Dict[str, Any]] = None
+
+
+def cached(kind: str, key: str, stamp: str, probe: Callable[[], T]) -> T:
+    """Return the stored result of `probe()` for the given key, probing on a miss.
+
+    Results must be JSON serializable, exceptions raised by `probe()` are not cached.
+    """
+    entries = _load()['entries'].setdefault(kind, {})
+    entry = entries.get(key)
+    if entry is not None and entry.get('stamp') == stamp:
+        log.debug('Using cached %s for %s', kind, key)
+        return entry['result']
+
+    result = probe()
+    entries[key] = {'stamp': stamp, 'result': result}
+    _save()
+    return result
+
+
+def cached_for_binary(kind: str, path: Path, probe: Callable[[], T]) -> T:
+    """Like `cached()` for a result derived from the given binary, e.g. its version.
+
+    Entries are keyed by the file name as the binary may be deployed to a different
+    directory than the one the manifest was written in.
+    """
+    stamp = file_stamp(path)
+    if stamp is None:
+        return probe()
+
+    return cached(kind, path.name, stamp, probe)
+
+
+def file_stamp(path: Path) -> Optional[str]:
+    """Identifies the contents of the given file, without reading all of it"""
+    try:
+        with path.open('rb') as file:
+            size = os.fstat(file.fileno()).st_size
+            sha = hashlib.sha256(file.read(_STAMP_CHUNK_SIZE))
+            if size > _STAMP_CHUNK_SIZE:
+                file.seek(max(size - _STAMP_CHUNK_SIZE, _STAMP_CHUNK_SIZE))
+                sha.update(file.read())
+    except OSError:
+        return None
+
+    return f'{size}:{sha.hexdigest()}'
+
+
+def write(path: Path) -> None:
+    """Write every entry probed so far to the given path"""
+    _write(path, _load())
+
+
+def platform_stamp() -> str:
+    """Identifies the files the binary platform is derived from, without running anything"""
+    openssl = shutil.which('openssl')
+    return '|'.join(
+        [
+            _platform.system(),
+            _platform.machine(),
+            file_stamp(Path('/etc/os-release')) or '',
+            openssl or '',
+            (file_stamp(Path(openssl)) if openssl else None) or '',
+        ]
+    )
+
+
+def _load() -> Dict[str, Any]:
+    global _manifest
+
+    if _manifest is None:
+        data = _read(Path(config.binary_manifest))
+        if data is None:
+            data = _read(BUNDLED_MANIFEST)
+            if data is not None:
+                log.debug('Using the bundled binary manifest at %s', BUNDLED_MANIFEST)
+
+        _manifest = data or {'version': MANIFEST_VERSION, 'entries': {}}
+
+    return _manifest
+
+
+def _read(path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(data, dict) or data.get('version') != MANIFEST_VERSION:
+        return None
+
+    return data
+
+
+def _save() -> None:
+    path = Path(config.binary_manifest)
+    try:
+        _write(path, _load())
+    except OSError as exc:
+        # e.g. a read-only file system, the probes are simply run again by the next process
+        log.debug('Could not write the binary manifest to %s: %s', path, exc)
+
+
+def _write(path: Path, data: Dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    # write atomically as concurrent processes may be reading the manifest
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.')
+    try:
+        with os.fdopen(fd, 'w') as file:
+            json.dump(data, file, indent=2)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
@@ -2,9 +2,12 @@ import re
 import sys
 import subprocess
 import platform as _platform
+from pathlib import Path
 from functools import lru_cache
 from typing import Tuple
 
+from . import manifest
+
 
 def name() -> str:
     return _platform.system().lower()
@@ -32,8 +35,7 @@ def linux_distro() -> str:
 
 
 def _get_linux_distro_details() -> Tuple[str, str]:
-    process = subprocess.run(['cat', '/etc/os-release'], stdout=subprocess.PIPE, check=True)
-    output = str(process.stdout, sys.getdefaultencoding())
+    output = Path('/etc/os-release').read_text()
 
     match = re.search(r'ID="?([^"\n]*)"?', output)
     distro_id = match.group(1) if match else ''
@@ -49,6 +51,11 @@ def binary_platform() -> str:
     if platform != 'linux':
         return platform
 
+    # resolving the OpenSSL version runs a subprocess, only do so when the platform changes
+    return manifest.cached('binary_platform', platform, manifest.platform_stamp(), _linux_binary_platform)
+
+
+def _linux_binary_platform() -> str:
     distro = linux_distro()
     if distro == 'alpine':
         return 'linux-musl'
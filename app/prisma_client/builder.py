@@ -40,7 +40,9 @@ from typing_extensions import TypedDict, Literal
 LiteralString = str
 # -- template builder.py.jinja --
 
+import re
 import json
+import uuid
 import logging
 import inspect
 from textwrap import indent
@@ -50,18 +52,19 @@ from functools import singledispatch
 from typing import ForwardRef
 from typing_extensions import TypeGuard
 
-from pydantic import BaseModel
+from pydantic import BaseModel, create_model
 from pydantic.fields import FieldInfo
 
 from . import fields
-from .types import Serializable
+from ._json import fast_dumps
 from .errors import UnknownModelError, UnknownRelationalFieldError, InvalidModelError
 from ._constants import QUERY_BUILDER_ALIASES
-from ._types import PrismaMethod
+from ._types import BaseModelT, PrismaMethod
 from ._typing import is_list_type
 from ._compat import model_fields, model_field_type, is_union, get_args, get_origin
 
 if TYPE_CHECKING:
+    from .types import Serializable
     from .bases import _PrismaModel as PrismaModel
 
 
@@ -74,6 +77,7 @@ PRISMA_MODELS: Set[str] = {
     'Judgment',
     'Suspect',
     'Blame',
+    'AnalysisJob',
 }
 
 RELATIONAL_FIELD_MAPPINGS: Dict[str, Dict[str, str]] = {
@@ -84,6 +88,7 @@ RELATIONAL_FIELD_MAPPINGS: Dict[str, Dict[str, str]] = {
         'user': 'User',
         'suspects': 'Suspect',
         'blame': 'Blame',
+        'jobs': 'AnalysisJob',
     },
     'Suspect': {
         'judgment': 'Judgment',
@@ -91,6 +96,9 @@ RELATIONAL_FIELD_MAPPINGS: Dict[str, Dict[str, str]] = {
     'Blame': {
         'judgment': 'Judgment',
     },
+    'AnalysisJob': {
+        'judgment': 'Judgment',
+    },
 }
 
 METHOD_OPERATION_MAPPING: dict[PrismaMethod, Operation] = {
@@ -135,6 +143,8 @@ METHOD_FORMAT_MAPPING: dict[PrismaMethod, str] = {
     'find_unique_or_raise': 'findUnique{model}OrThrow',
 }
 
+RAW_METHODS: Set[str] = {'query_raw', 'query_first', 'execute_raw'}
+
 MISSING = object()
 Operation = Literal['query', 'mutation']
 
@@ -234,10 +244,49 @@ class QueryBuilder:
           }
         }
         """
-        query = self._create_root_node().render()
+        if self.method in RAW_METHODS:
+            query = self._create_root_node().render()
+        else:
+            query = self._render_compiled()
         log.debug('Generated query: \n%s', query)
         return query
 
+    def _render_compiled(self) -> str:
+        """Render the query from the compiled template for its shape.
+
+        Two queries share a shape when they only differ in argument values, so the node
+        tree is only built & rendered once per shape; afterwards just the argument values
+        are serialized and spliced into the cached template.
+        """
+        values: List[Any] = []
+        key = (
+            self.method,
+            self.model,
+            tuple(self.root_selection) if self.root_selection is not None else None,
+            _argument_shape(self.arguments, values),
+            _include_shape(self.include, values),
+        )
+        compiled = _compiled_queries.get(key)
+        if compiled is None:
+            compiled = self._compile()
+            if len(_compiled_queries) >= COMPILED_QUERY_CACHE_SIZE:
+                _compiled_queries.pop(next(iter(_compiled_queries)))
+            _compiled_queries[key] = compiled
+
+        return compiled.render(values)
+
+    def _compile(self) -> 'CompiledQuery':
+        counter = iter(range(sys.maxsize))
+        builder = QueryBuilder.__new__(QueryBuilder)
+        builder.method = self.method
+        builder.method_format = self.method_format
+        builder.operation = self.operation
+        builder.model = self.model
+        builder.root_selection = self.root_selection
+        builder.arguments = _slotted_arguments(self.arguments, counter)
+        builder.include = _slotted_include(self.include, counter)
+        return CompiledQuery(builder._create_root_node().render())
+
     def _create_root_node(self) -> 'RootNode':
         root = RootNode(builder=self)
         root.add(ResultNode.create(self))
@@ -256,6 +305,10 @@ class QueryBuilder:
 
         Raises UnknownModelError if the current model cannot be found.
         """
+        cached = _default_fields.get(model)
+        if cached is not None:
+            return cached
+
         name = getattr(model, '__prisma_model__', MISSING)
         if name is MISSING:
             raise InvalidModelError(model)
@@ -266,11 +319,12 @@ class QueryBuilder:
 
         # by default we exclude every field that points to a PrismaModel as that indicates that it is a relational field
         # we explicitly keep fields that point to anything else, even other pydantic.BaseModel types, as they can be used to deserialize JSON
-        return [
+        fields = _default_fields[model] = [
             field
             for field, info in model_fields(model).items()
             if not _field_is_prisma_model(info, name=field, parent=model)
         ]
+        return fields
 
     def get_relational_model(self, current_model: Type[PrismaModel], field: str) -> Type[PrismaModel]:
         """Returns the model that the field is related to.
@@ -278,6 +332,10 @@ class QueryBuilder:
         Raises UnknownModelError if the current model is invalid.
         Raises UnknownRelationalFieldError if the field does not exist.
         """
+        cached = _relational_models.get((current_model, field))
+        if cached is not None:
+            return cached
+
         name = getattr(current_model, '__prisma_model__', MISSING)
         if name is MISSING:
             raise InvalidModelError(current_model)
@@ -304,6 +362,7 @@ class QueryBuilder:
                 'Is the field a pydantic.BaseModel type and does it have a `__prisma_model__` class variable?'
             )
 
+        _relational_models[(current_model, field)] = model
         return model
 
     def _transform_aliases(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
@@ -374,6 +433,226 @@ def _is_prisma_model_type(type_: type[BaseModel]) -> TypeGuard[type[PrismaModel]
     return issubclass(type_, _PrismaModel)
 
 
+_partial_models: Dict[Any, Type[BaseModel]] = {}
+
+
+def partial_model(
+    model: type[BaseModelT],
+    select: Optional[List[str]],
+    include: Optional[Dict[str, Any]],
+) -> type[BaseModelT]:
+    """Returns the model that a result narrowed by `select` should be parsed with.
+
+    Unselected scalar fields become optional, defaulting to `None`, on a cached subclass
+    of the given model. Included relations that define their own `select` are narrowed
+    recursively. If nothing was narrowed the model itself is returned.
+    """
+    if select is None and not _has_nested_select(include):
+        return model
+
+    key = (model, _selection_key(select, include))
+    cached = _partial_models.get(key)
+    if cached is not None:
+        return cast(Type[BaseModelT], cached)
+
+    overrides: Dict[str, Any] = {}
+    for name, info in model_fields(model).items():
+        relation = _prisma_model_for_field(info, name=name, parent=model)
+        if relation is None:
+            if select is not None and name not in select:
+                overrides[name] = (Optional[model_field_type(info)], None)  # type: ignore
+            continue
+
+        args = (include or {}).get(name)
+        if isinstance(args, dict) and _has_nested_select({name: args}):
+            nested = partial_model(relation, args.get('select'), args.get('include'))
+            nested_type = List[nested] if _is_list_field(info) else nested  # type: ignore
+            overrides[name] = (Optional[nested_type], None)  # type: ignore
+
+    cached = create_model(f'Partial{model.__name__}', __base__=model, **overrides)  # type: ignore
+    _partial_models[key] = cached
+    return cast(Type[BaseModelT], cached)
+
+
+def _has_nested_select(include: Optional[Dict[str, Any]]) -> bool:
+    if not include:
+        return False
+
+    for value in include.values():
+        if isinstance(value, dict) and ('select' in value or _has_nested_select(value.get('include'))):
+            return True
+
+    return False
+
+
+def _selection_key(select: Optional[List[str]], include: Optional[Dict[str, Any]]) -> Any:
+    nested = tuple(
+        sorted(
+            (name, _selection_key(args.get('select'), args.get('include')))
+            for name, args in (include or {}).items()
+            if isinstance(args, dict)
+        )
+    )
+    return (frozenset(select) if select is not None else None, nested)
+
+
+def _is_list_field(field: FieldInfo) -> bool:
+    type_ = getattr(field, 'outer_type_', None) or model_field_type(field)
+    if is_union(get_origin(type_)):
+        type_ = next((arg for arg in get_args(type_) if arg is not type(None)), type_)
+    return is_list_type(type_)
+
+
+_default_fields: Dict[Any, List[str]] = {}
+_relational_models: Dict[Any, Type[BaseModel]] = {}
+
+COMPILED_QUERY_CACHE_SIZE = 512
+_compiled_queries: Dict[Any, 'CompiledQuery'] = {}
+
+# Argument values are rendered as `"\u001e<index>\u001e"` while compiling a query shape,
+# lists of values as `"\u001e[<index>\u001e"`. `dumps()` always escapes control characters,
+# so real values can never produce this.
+_SLOT_PATTERN = re.compile(r'"\\u001e(\[?)(\d+)\\u001e"')
+_LEAF = object()
+_LIST = object()
+
+
+class _Slot:
+    __slots__ = ('index',)
+
+    def __init__(self, index: int) -> None:
+        self.index = index
+
+
+class _ListSlot(_Slot):
+    """Placeholder for a list of values, e.g. an `in` filter, so that its length is not part of the shape"""
+    __slots__ = ()
+
+
+class CompiledQuery:
+    """A rendered query with a slot in place of every argument value"""
+    fragments: List[str]
+    slots: List[int]
+    # indentation of the line a list slot is on, None for other slots
+    indents: List[Optional[str]]
+
+    __slots__ = ('fragments', 'slots', 'indents')
+
+    def __init__(self, template: str) -> None:
+        parts = _SLOT_PATTERN.split(template)
+        self.fragments = parts[::3]
+        self.slots = [int(index) for index in parts[2::3]]
+        self.indents = []
+        for fragment, bracket in zip(self.fragments, parts[1::3]):
+            if bracket:
+                line = fragment.rpartition('\n')[2]
+                self.indents.append(line[:len(line) - len(line.lstrip(' '))])
+            else:
+                self.indents.append(None)
+
+    def render(self, values: List[Any]) -> str:
+        fragments = self.fragments
+        strings = [fragments[0]]
+        for i, (index, indent) in enumerate(zip(self.slots, self.indents), start=1):
+            if indent is None:
+                strings.append(dumps(values[index]))
+            else:
+                strings.append(_render_list(values[index], indent))
+            strings.append(fragments[i])
+        return ''.join(strings)
+
+
+def _render_list(items: Iterable[Any], indent: str) -> str:
+    """Render a list of values the way `ListNode` does, on a line indented by `indent`"""
+    lines = ['[']
+    lines.extend(f'{indent}  {dumps(item)}' for item in items)
+    lines.append(f'{indent}]')
+    return ',\n'.join(lines)
+
+
+def _argument_shape(value: Any, values: List[Any]) -> Any:
+    """Returns a hashable description of the argument structure, collecting every value into `values`.
+
+    Must traverse in the same order as `_slotted_arguments`.
+    """
+    if isinstance(value, dict):
+        return ('{', tuple((key, _argument_shape(item, values)) for key, item in value.items()))
+    if isinstance(value, ITERABLES):
+        if not any(isinstance(item, dict) for item in value):
+            # a list of values is a single value, every length shares the same shape
+            values.append(value)
+            return _LIST
+
+        # `ListNode` renders every item that is not an object as a single value
+        shape: List[Any] = []
+        for item in value:
+            if isinstance(item, dict):
+                shape.append(_argument_shape(item, values))
+            else:
+                values.append(item)
+                shape.append(_LEAF)
+        return ('[', tuple(shape))
+    if value is None:
+        return None
+    values.append(value)
+    return _LEAF
+
+
+def _slotted_arguments(value: Any, counter: Iterator[int]) -> Any:
+    if isinstance(value, dict):
+        return {key: _slotted_arguments(item, counter) for key, item in value.items()}
+    if isinstance(value, ITERABLES):
+        if not any(isinstance(item, dict) for item in value):
+            return _ListSlot(next(counter))
+        return [
+            _slotted_arguments(item, counter) if isinstance(item, dict) else _Slot(next(counter))
+            for item in value
+        ]
+    if value is None:
+        return None
+    return _Slot(next(counter))
+
+
+def _include_shape(include: Optional[Dict[str, Any]], values: List[Any]) -> Any:
+    """Like `_argument_shape` but `include` flags and `select` lists are part of the shape"""
+    if include is None:
+        return None
+
+    shape: List[Any] = []
+    for key, value in include.items():
+        if isinstance(value, dict):
+            shape.append((key, tuple(
+                (name, _include_shape(item, values) if name == 'include'
+                 else tuple(item) if name == 'select' and item is not None
+                 else _argument_shape(item, values))
+                for name, item in value.items()
+            )))
+        elif isinstance(value, bool):
+            shape.append((key, value))
+        else:
+            # invalid, rendering raises the appropriate error
+            shape.append((key, type(value)))
+    return tuple(shape)
+
+
+def _slotted_include(include: Optional[Dict[str, Any]], counter: Iterator[int]) -> Optional[Dict[str, Any]]:
+    if include is None:
+        return None
+
+    slotted: Dict[str, Any] = {}
+    for key, value in include.items():
+        if isinstance(value, dict):
+            slotted[key] = {
+                name: _slotted_include(item, counter) if name == 'include'
+                else item if name == 'select'
+                else _slotted_arguments(item, counter)
+                for name, item in value.items()
+            }
+        else:
+            slotted[key] = value
+    return slotted
+
+
 class AbstractNode(ABC):
     __slots__ = ()
 
@@ -809,6 +1088,7 @@ class Selection(Node):
                     # posts( where: { published: true }) { post_fields }
                     args = value.copy()
                     nested_include = args.pop('include', None)
+                    nested_select = args.pop('select', None)
                     children.extend(
                         [
                             Key(
@@ -821,6 +1101,7 @@ class Selection(Node):
                             Selection.create(
                                 builder,
                                 include=nested_include,
+                                root_selection=nested_select,
                                 model=builder.get_relational_model(
                                     current_model=model, field=key
                                 ),
@@ -908,15 +1189,40 @@ def serialize_base64(obj: fields.Base64) -> str:
     return str(obj)
 
 
+@serializer.register(_Slot)
+def serialize_slot(obj: _Slot) -> str:
+    """Placeholder for an argument value in a compiled query, see `CompiledQuery`"""
+    return f'\x1e{obj.index}\x1e'
+
+
+@serializer.register(_ListSlot)
+def serialize_list_slot(obj: _ListSlot) -> str:
+    """Placeholder for a list of argument values in a compiled query, see `CompiledQuery`"""
+    return f'\x1e[{obj.index}\x1e'
+
+
 @serializer.register(decimal.Decimal)
 def serialize_decimal(obj: decimal.Decimal) -> str:
     """Serialize a Decimal object to a string"""
     return str(obj)
 
 
+@serializer.register(uuid.UUID)
+def serialize_uuid(obj: uuid.UUID) -> str:
+    """Serialize a UUID to its canonical string, as orjson does natively"""
+    return str(obj)
+
+
 def dumps(obj: Any, **kwargs: Any) -> str:
+    if not kwargs:
+        dumped = fast_dumps(obj, default=serializer)
+        if dumped is not None:
+            return dumped
+
     kwargs.setdefault('default', serializer)
     kwargs.setdefault('ensure_ascii', False)
+    # NaN and infinities are not valid JSON, raise instead of sending them to the engine
+    kwargs.setdefault('allow_nan', False)
     return json.dumps(obj, **kwargs)
 
 # black does not respect the fmt: off comment without this
@@ -13,7 +13,7 @@ from typing_extensions import Literal
 
 from .. import config
 from .._proxy import LazyProxy
-from ..binaries import platform
+from ..binaries import platform, manifest
 from ..errors import PrismaError
 from .._compat import nodejs, get_args
 
@@ -371,6 +371,13 @@ def _should_use_binary(target: Target, path: Path) -> bool:
 
 
 def _get_binary_version(target: Target, path: Path) -> tuple[int, ...] | None:
+    version = manifest.cached_for_binary(f'{target}_version', path, lambda: _probe_binary_version(target, path))
+    if version is None:
+        return None
+    return tuple(version)
+
+
+def _probe_binary_version(target: Target, path: Path) -> list[int] | None:
     proc = subprocess.run(
         [str(path), '--version'],
         stdout=subprocess.PIPE,
@@ -386,7 +393,7 @@ def _get_binary_version(target: Target, path: Path) -> tuple[int, ...] | None:
     if not match:
         return None
 
-    version = tuple(int(value) for value in match.groups())
+    version = [int(value) for value in match.groups()]
     log.debug('%s version check returning %s', target, version)
     return version
 
@@ -0,0 +1,49 @@
+from pathlib import Path
+from typing import Dict, Optional
+
+import click
+
+from .. import _node
+from ...binaries import manifest
+from ...binaries.platform import binary_platform
+
+
+@click.command('prebake', short_help='Cache platform and binary checks ahead of time.')
+def cli() -> None:
+    """Runs the platform and binary checks made when connecting and writes their results
+    to the binary manifest bundled with the package, so that processes started afterwards,
+    including deployed ones, do not have to.
+
+    This is intended to be ran at build time, after `prisma generate`, as
+    `python -m app.prisma_client py prebake`.
+    """
+    results = prebake()
+    for name, value in results.items():
+        click.echo(f'{name}: {value or "not found"}')
+
+    click.echo(f'Wrote binary manifest to {click.style(str(manifest.BUNDLED_MANIFEST), fg="green")}')
+
+
+def prebake() -> Dict[str, Optional[str]]:
+    results: Dict[str, Optional[str]] = {'platform': binary_platform()}
+
+    try:
+        from ...client import BINARY_PATHS
+    except ImportError:
+        # the client has not been generated yet, there is no query engine to check
+        results['query engine'] = None
+    else:
+        from ...engine import utils as engine_utils, errors as engine_errors
+
+        try:
+            results['query engine'] = str(engine_utils.ensure(BINARY_PATHS.query_engine))
+        except engine_errors.BinaryNotFoundError:
+            # not fetched yet, it will be checked when first resolved instead
+            results['query engine'] = None
+
+    for target in ('node', 'npm'):
+        path: Optional[Path] = _node._get_global_binary(target)
+        results[target] = str(path) if path is not None else None
+
+    manifest.write(manifest.BUNDLED_MANIFEST)
+    return results
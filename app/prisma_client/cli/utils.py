@@ -28,7 +28,8 @@ log: logging.Logger = logging.getLogger(__name__)
 
 
 class PrismaCLI(click.MultiCommand):
-    base_package: str = 'prisma.cli.commands'
+    # commands are loaded from the package they are listed from, which is not `prisma` when vendored
+    base_package: str = f'{__package__}.commands'
     folder: Path = Path(__file__).parent / 'commands'
 
     def list_commands(self, ctx: click.Context) -> List[str]:  # noqa: ARG002
@@ -47,18 +47,21 @@ from types import TracebackType
 
 from pydantic import BaseModel
 
-from . import types, models, errors, actions
-from .types import DatasourceOverride, HttpConfig, MetricsFormat
+from . import models, errors, actions
 from ._types import BaseModelT, PrismaMethod
 from .bases import _PrismaModel
-from .engine import AbstractEngine, QueryEngine, TransactionId
-from .builder import QueryBuilder, dumps
-from .generator.models import EngineType, OptionalValueFromEnvVar, BinaryPaths
+from .engine import AbstractEngine, QueryEngine, EnginePool, TransactionId, utils as engine_utils
+from .builder import QueryBuilder, dumps, partial_model
+from .generator._runtime import EngineType, OptionalValueFromEnvVar, BinaryPaths
 from ._compat import removeprefix, model_parse
 from ._constants import DEFAULT_CONNECT_TIMEOUT, DEFAULT_TX_MAX_WAIT, DEFAULT_TX_TIMEOUT
 from ._raw_query import deserialize_raw_results
 from ._metrics import Metrics
 
+if TYPE_CHECKING:
+    from . import types
+    from .types import DatasourceOverride, HttpConfig, MetricsFormat
+
 __all__ = (
     'ENGINE_TYPE',
     'SCHEMA_PATH',
@@ -164,17 +167,21 @@ class Prisma:
     judgment: 'actions.JudgmentActions[models.Judgment]'
     suspect: 'actions.SuspectActions[models.Suspect]'
     blame: 'actions.BlameActions[models.Blame]'
+    analysisjob: 'actions.AnalysisJobActions[models.AnalysisJob]'
 
     __slots__ = (
         'user',
         'judgment',
         'suspect',
         'blame',
+        'analysisjob',
         '__engine',
         '__copied',
         '_tx_id',
         '_datasource',
         '_log_queries',
+        '_unix_socket',
+        '_engine_pool_size',
         '_http_config',
         '_connect_timeout',
         '_active_provider',
@@ -189,11 +196,14 @@ class Prisma:
         datasource: Optional[DatasourceOverride] = None,
         connect_timeout: Union[int, timedelta] = DEFAULT_CONNECT_TIMEOUT,
         http: Optional[HttpConfig] = None,
+        unix_socket: bool = False,
+        engine_pool_size: int = 1,
     ) -> None:
         self.user = actions.UserActions[models.User](self, models.User)
         self.judgment = actions.JudgmentActions[models.Judgment](self, models.Judgment)
         self.suspect = actions.SuspectActions[models.Suspect](self, models.Suspect)
         self.blame = actions.BlameActions[models.Blame](self, models.Blame)
+        self.analysisjob = actions.AnalysisJobActions[models.AnalysisJob](self, models.AnalysisJob)
 
         # NOTE: if you add any more properties here then you may also need to forward
         # them in the `_copy()` method.
@@ -202,6 +212,13 @@ class Prisma:
         self._log_queries = log_queries
         self._datasource = datasource
 
+        # talk to the query engine over a unix domain socket instead of a TCP port where
+        # supported, falls back to TCP otherwise
+        self._unix_socket = unix_socket
+
+        # number of query engine processes to spread queries across, see `EnginePool`
+        self._engine_pool_size = engine_pool_size
+
         if isinstance(connect_timeout, int):
             message = (
                 'Passing an int as `connect_timeout` argument is deprecated '
@@ -399,9 +416,13 @@ class Prisma:
 
         return deserialize_raw_results(result)
 
-    def batch_(self) -> 'Batch':
-        """Returns a context manager for grouping write queries into a single transaction."""
-        return Batch(client=self)
+    def batch_(self, transaction: bool = True) -> 'Batch':
+        """Returns a context manager for grouping queries into a single request.
+
+        The queries are executed within a single transaction unless `transaction=False` is given,
+        in which case they are independent of each other but still sent in one round trip.
+        """
+        return Batch(client=self, transaction=transaction)
 
     def tx(
         self,
@@ -502,6 +523,8 @@ class Prisma:
             datasource=self._datasource,
             log_queries=self._log_queries,
             connect_timeout=self._connect_timeout,
+            unix_socket=self._unix_socket,
+            engine_pool_size=self._engine_pool_size,
         )
         new.__copied = True
 
@@ -512,7 +535,17 @@ class Prisma:
 
     def _create_engine(self, dml_path: Path = PACKAGED_SCHEMA_PATH) -> AbstractEngine:
         if ENGINE_TYPE == EngineType.binary:
-            return QueryEngine(dml_path=dml_path, log_queries=self._log_queries, **self._http_config)
+            def create_query_engine() -> QueryEngine:
+                return QueryEngine(
+                    dml_path=dml_path,
+                    log_queries=self._log_queries,
+                    unix_socket=self._unix_socket,
+                    **self._http_config,
+                )
+
+            if self._engine_pool_size > 1:
+                return EnginePool(size=self._engine_pool_size, factory=create_query_engine)
+            return create_query_engine()
 
         raise NotImplementedError(f'Unsupported engine type: {ENGINE_TYPE}')
 
@@ -655,32 +688,49 @@ class TransactionManager:
             )
 
 
-# TODO: this should return the results as well
 # TODO: don't require copy-pasting arguments between actions and batch actions
 class Batch:
     user: 'UserBatchActions'
     judgment: 'JudgmentBatchActions'
     suspect: 'SuspectBatchActions'
     blame: 'BlameBatchActions'
+    analysisjob: 'AnalysisJobBatchActions'
 
-    def __init__(self, client: Prisma) -> None:
+    def __init__(self, client: Prisma, transaction: bool = True) -> None:
         self.__client = client
-        self.__queries: List[str] = []
+        self.__operations: List[Tuple[str, Callable[[Any], Any], bool]] = []
+        self._transaction = transaction
         self._active_provider = client._active_provider
         self.user = UserBatchActions(self)
         self.judgment = JudgmentBatchActions(self)
         self.suspect = SuspectBatchActions(self)
         self.blame = BlameBatchActions(self)
+        self.analysisjob = AnalysisJobBatchActions(self)
 
-    def _add(self, **kwargs: Any) -> None:
+    def _add(
+        self,
+        parse: Callable[[Any], Any],
+        *,
+        missing_ok: bool = False,
+        **kwargs: Any,
+    ) -> None:
         builder = QueryBuilder(**kwargs)
-        self.__queries.append(builder.build_query())
+        self.__operations.append((builder.build_query(), parse, missing_ok))
 
-    async def commit(self) -> None:
-        """Execute the queries"""
+    async def commit(self) -> List[Any]:
+        """Execute the queries, returning the result of every operation in the order they were added.
+
+        Results are typed like their client counterparts, e.g. `find_many()` returns a list of
+        models and `count()` returns an `int`.
+
+        Non-transactional batches still execute every operation if one of them fails, the first
+        error is raised once all the operations have run.
+        """
         # TODO: normalise this, we should still call client._execute
-        queries = self.__queries
-        self.__queries = []
+        operations = self.__operations
+        self.__operations = []
+        if not operations:
+            return []
 
         payload = {
             'batch': [
@@ -688,17 +738,56 @@ class Batch:
                     'query': query,
                     'variables': {},
                 }
-                for query in queries
+                for query, _, _ in operations
             ],
-            'transaction': True,
+            'transaction': self._transaction,
         }
-        await self.__client._engine.query(
+        response = await self.__client._engine.query(
             dumps(payload),
             tx_id=self.__client._tx_id,
         )
 
+        results: List[Any] = []
+        for (_, parse, missing_ok), item in zip(operations, response['batchResult']):
+            errors_data = item.get('errors')
+            if errors_data:
+                # only reachable for non-transactional batches, a failure within
+                # a transaction is reported for the request as a whole
+                try:
+                    engine_utils.handle_batch_result_errors(errors_data)
+                except errors.RecordNotFoundError:
+                    if not missing_ok:
+                        raise
+                    results.append(None)
+                    continue
+
+            results.append(parse(item['data']['result']))
+
+        return results
+
+    def query_raw(
+        self,
+        query: LiteralString,
+        *args: Any,
+        model: Optional[Type[BaseModelT]] = None,
+    ) -> None:
+        if model is not None:
+            parse: Callable[[Any], Any] = lambda result: deserialize_raw_results(result, model=model)
+        else:
+            parse = deserialize_raw_results
+
+        self._add(
+            parse,
+            method='query_raw',
+            arguments={
+                'query': query,
+                'parameters': args,
+            },
+        )
+
     def execute_raw(self, query: LiteralString, *args: Any) -> None:
         self._add(
+            int,
             method='execute_raw',
             arguments={
                 'query': query,
@@ -719,18 +808,28 @@ class Batch:
             await self.commit()
 
 
+def _parse_count(result: Any) -> int:
+    return int(result['count'])
+
+
 # NOTE: some arguments are meaningless in this context but are included
 # for completeness sake
 class UserBatchActions:
     def __init__(self, batcher: Batch) -> None:
         self._batcher = batcher
 
+    def _parser(self, model: Type[BaseModel], *, many: bool = False) -> Callable[[Any], Any]:
+        if many:
+            return lambda result: [model_parse(model, r) for r in result]
+        return lambda result: None if result is None else model_parse(model, result)
+
     def create(
         self,
         data: types.UserCreateInput,
         include: Optional[types.UserInclude] = None
     ) -> None:
         self._batcher._add(
+            self._parser(models.User),
             method='create',
             model=models.User,
             arguments={
@@ -749,6 +848,7 @@ class UserBatchActions:
             raise errors.UnsupportedDatabaseError('sqlite', 'create_many()')
 
         self._batcher._add(
+            _parse_count,
             method='create_many',
             model=models.User,
             arguments={
@@ -764,6 +864,8 @@ class UserBatchActions:
         include: Optional[types.UserInclude] = None,
     ) -> None:
         self._batcher._add(
+            self._parser(models.User),
+            missing_ok=True,
             method='delete',
             model=models.User,
             arguments={
@@ -772,6 +874,110 @@ class UserBatchActions:
             },
         )
 
+    def find_unique(
+        self,
+        where: types.UserWhereUniqueInput,
+        include: Optional[types.UserInclude] = None,
+        select: Optional[List[types.UserScalarFieldKeys]] = None
+    ) -> None:
+        self._batcher._add(
+            self._parser(partial_model(models.User, select, include)),
+            method='find_unique',
+            model=models.User,
+            arguments={
+                'where': where,
+                'include': include,
+            },
+            root_selection=select,
+        )
+
+    def find_first(
+        self,
+        skip: Optional[int] = None,
+        where: Optional[types.UserWhereInput] = None,
+        cursor: Optional[types.UserWhereUniqueInput] = None,
+        include: Optional[types.UserInclude] = None,
+        order: Optional[Union[types.UserOrderByInput, List[types.UserOrderByInput]]] = None,
+        distinct: Optional[List[types.UserScalarFieldKeys]] = None,
+        select: Optional[List[types.UserScalarFieldKeys]] = None,
+    ) -> None:
+        self._batcher._add(
+            self._parser(partial_model(models.User, select, include)),
+            method='find_first',
+            model=models.User,
+            arguments={
+                'skip': skip,
+                'where': where,
+                'order_by': order,
+                'cursor': cursor,
+                'include': include,
+                'distinct': distinct,
+            },
+            root_selection=select,
+        )
+
+    def find_many(
+        self,
+        take: Optional[int] = None,
+        skip: Optional[int] = None,
+        where: Optional[types.UserWhereInput] = None,
+        cursor: Optional[types.UserWhereUniqueInput] = None,
+        include: Optional[types.UserInclude] = None,
+        order: Optional[Union[types.UserOrderByInput, List[types.UserOrderByInput]]] = None,
+        distinct: Optional[List[types.UserScalarFieldKeys]] = None,
+        select: Optional[List[types.UserScalarFieldKeys]] = None,
+    ) -> None:
+        self._batcher._add(
+            self._parser(partial_model(models.User, select, include), many=True),
+            method='find_many',
+            model=models.User,
+            arguments={
+                'take': take,
+                'skip': skip,
+                'where': where,
+                'order_by': order,
+                'cursor': cursor,
+                'include': include,
+                'distinct': distinct,
+            },
+            root_selection=select,
+        )
+
+    def count(
+        self,
+        select: Optional[types.UserCountAggregateInput] = None,
+        take: Optional[int] = None,
+        skip: Optional[int] = None,
+        where: Optional[types.UserWhereInput] = None,
+        cursor: Optional[types.UserWhereUniqueInput] = None,
+    ) -> None:
+        # see `UserActions.count()` for the selection building
+        if not select:
+            root_selection = ['_count { _all }']
+        else:
+
+            root_selection = [
+                '_count {{ {0} }}'.format(' '.join(k for k, v in select.items() if v is True))
+            ]
+
+        if select is None:
+            parse: Callable[[Any], Any] = lambda result: int(result['_count']['_all'])
+        else:
+            parse = lambda result: result['_count']
+
+        self._batcher._add(
+            parse,
+            method='count',
+            model=models.User,
+            arguments={
+                'take': take,
+                'skip': skip,
+                'where': where,
+                'cursor': cursor,
+            },
+            root_selection=root_selection,
+        )
+
     def update(
         self,
         data: types.UserUpdateInput,
@@ -779,6 +985,8 @@ class UserBatchActions:
         include: Optional[types.UserInclude] = None
     ) -> None:
         self._batcher._add(
+            self._parser(models.User),
+            missing_ok=True,
             method='update',
             model=models.User,
             arguments={
@@ -795,6 +1003,7 @@ class UserBatchActions:
         include: Optional[types.UserInclude] = None,
     ) -> None:
         self._batcher._add(
+            self._parser(models.User),
             method='upsert',
             model=models.User,
             arguments={
@@ -811,6 +1020,7 @@ class UserBatchActions:
         where: types.UserWhereInput,
     ) -> None:
         self._batcher._add(
+            _parse_count,
             method='update_many',
             model=models.User,
             arguments={'data': data, 'where': where,},
@@ -822,6 +1032,7 @@ class UserBatchActions:
         where: Optional[types.UserWhereInput] = None,
     ) -> None:
         self._batcher._add(
+            _parse_count,
             method='delete_many',
             model=models.User,
             arguments={'where': where},
@@ -836,12 +1047,18 @@ class JudgmentBatchActions:
     def __init__(self, batcher: Batch) -> None:
         self._batcher = batcher
 
+    def _parser(self, model: Type[BaseModel], *, many: bool = False) -> Callable[[Any], Any]:
+        if many:
+            return lambda result: [model_parse(model, r) for r in result]
+        return lambda result: None if result is None else model_parse(model, result)
+
     def create(
         self,
         data: types.JudgmentCreateInput,
         include: Optional[types.JudgmentInclude] = None
     ) -> None:
         self._batcher._add(
+            self._parser(models.Judgment),
             method='create',
             model=models.Judgment,
             arguments={
@@ -860,6 +1077,7 @@ class JudgmentBatchActions:
             raise errors.UnsupportedDatabaseError('sqlite', 'create_many()')
 
         self._batcher._add(
+            _parse_count,
             method='create_many',
             model=models.Judgment,
             arguments={
@@ -875,6 +1093,8 @@ class JudgmentBatchActions:
         include: Optional[types.JudgmentInclude] = None,
     ) -> None:
         self._batcher._add(
+            self._parser(models.Judgment),
+            missing_ok=True,
             method='delete',
             model=models.Judgment,
             arguments={
@@ -883,6 +1103,110 @@ class JudgmentBatchActions:
             },
         )
 
+    def find_unique(
+        self,
+        where: types.JudgmentWhereUniqueInput,
+        include: Optional[types.JudgmentInclude] = None,
+        select: Optional[List[types.JudgmentScalarFieldKeys]] = None
+    ) -> None:
+        self._batcher._add(
+            self._parser(partial_model(models.Judgment, select, include)),
+            method='find_unique',
+            model=models.Judgment,
+            arguments={
+                'where': where,
+                'include': include,
+            },
+            root_selection=select,
+        )
+
+    def find_first(
+        self,
+        skip: Optional[int] = None,
+        where: Optional[types.JudgmentWhereInput] = None,
+        cursor: Optional[types.JudgmentWhereUniqueInput] = None,
+        include: Optional[types.JudgmentInclude] = None,
+        order: Optional[Union[types.JudgmentOrderByInput, List[types.JudgmentOrderByInput]]] = None,
+        distinct: Optional[List[types.JudgmentScalarFieldKeys]] = None,
+        select: Optional[List[types.JudgmentScalarFieldKeys]] = None,
+    ) -> None:
+        self._batcher._add(
+            self._parser(partial_model(models.Judgment, select, include)),
+            method='find_first',
+            model=models.Judgment,
+            arguments={
+                'skip': skip,
+                'where': where,
+                'order_by': order,
+                'cursor': cursor,
+                'include': include,
+                'distinct': distinct,
+            },
+            root_selection=select,
+        )
+
+    def find_many(
+        self,
+        take: Optional[int] = None,
+        skip: Optional[int] = None,
+        where: Optional[types.JudgmentWhereInput] = None,
+        cursor: Optional[types.JudgmentWhereUniqueInput] = None,
+        include: Optional[types.JudgmentInclude] = None,
+        order: Optional[Union[types.JudgmentOrderByInput, List[types.JudgmentOrderByInput]]] = None,
+        distinct: Optional[List[types.JudgmentScalarFieldKeys]] = None,
+        select: Optional[List[types.JudgmentScalarFieldKeys]] = None,
+    ) -> None:
+        self._batcher._add(
+            self._parser(partial_model(models.Judgment, select, include), many=True),
+            method='find_many',
+            model=models.Judgment,
+            arguments={
+                'take': take,
+                'skip': skip,
+                'where': where,
+                'order_by': order,
+                'cursor': cursor,
+                'include': include,
+                'distinct': distinct,
+            },
+            root_selection=select,
+        )
+
+    def count(
+        self,
+        select: Optional[types.JudgmentCountAggregateInput] = None,
+        take: Optional[int] = None,
+        skip: Optional[int] = None,
+        where: Optional[types.JudgmentWhereInput] = None,
+        cursor: Optional[types.JudgmentWhereUniqueInput] = None,
+    ) -> None:
+        # see `JudgmentActions.count()` for the selection building
+        if not select:
+            root_selection = ['_count { _all }']
+        else:
+
+            root_selection = [
+                '_count {{ {0} }}'.format(' '.join(k for k, v in select.items() if v is True))
+            ]
+
+        if select is None:
+            parse: Callable[[Any], Any] = lambda result: int(result['_count']['_all'])
+        else:
+            parse = lambda result: result['_count']
+
+        self._batcher._add(
+            parse,
+            method='count',
+            model=models.Judgment,
+            arguments={
+                'take': take,
+                'skip': skip,
+                'where': where,
+                'cursor': cursor,
+            },
+            root_selection=root_selection,
+        )
+
     def update(
         self,
         data: types.JudgmentUpdateInput,
@@ -890,6 +1214,8 @@ class JudgmentBatchActions:
         include: Optional[types.JudgmentInclude] = None
     ) -> None:
         self._batcher._add(
+            self._parser(models.Judgment),
+            missing_ok=True,
             method='update',
             model=models.Judgment,
             arguments={
@@ -906,6 +1232,7 @@ class JudgmentBatchActions:
         include: Optional[types.JudgmentInclude] = None,
     ) -> None:
         self._batcher._add(
+            self._parser(models.Judgment),
             method='upsert',
             model=models.Judgment,
             arguments={
@@ -922,6 +1249,7 @@ class JudgmentBatchActions:
         where: types.JudgmentWhereInput,
     ) -> None:
         self._batcher._add(
+            _parse_count,
             method='update_many',
             model=models.Judgment,
             arguments={'data': data, 'where': where,},
@@ -933,6 +1261,7 @@ class JudgmentBatchActions:
         where: Optional[types.JudgmentWhereInput] = None,
     ) -> None:
         self._batcher._add(
+            _parse_count,
             method='delete_many',
             model=models.Judgment,
             arguments={'where': where},
@@ -947,12 +1276,18 @@ class SuspectBatchActions:
     def __init__(self, batcher: Batch) -> None:
         self._batcher = batcher
 
+    def _parser(self, model: Type[BaseModel], *, many: bool = False) -> Callable[[Any], Any]:
+        if many:
+            return lambda result: [model_parse(model, r) for r in result]
+        return lambda result: None if result is None else model_parse(model, result)
+
     def create(
         self,
         data: types.SuspectCreateInput,
         include: Optional[types.SuspectInclude] = None
     ) -> None:
         self._batcher._add(
+            self._parser(models.Suspect),
             method='create',
             model=models.Suspect,
             arguments={
@@ -971,6 +1306,7 @@ class SuspectBatchActions:
             raise errors.UnsupportedDatabaseError('sqlite', 'create_many()')
 
         self._batcher._add(
+            _parse_count,
             method='create_many',
             model=models.Suspect,
             arguments={
@@ -986,6 +1322,8 @@ class SuspectBatchActions:
         include: Optional[types.SuspectInclude] = None,
     ) -> None:
         self._batcher._add(
+            self._parser(models.Suspect),
+            missing_ok=True,
             method='delete',
             model=models.Suspect,
             arguments={
@@ -994,6 +1332,110 @@ class SuspectBatchActions:
             },
         )
 
+    def find_unique(
+        self,
+        where: types.SuspectWhereUniqueInput,
+        include: Optional[types.SuspectInclude] = None,
+        select: Optional[List[types.SuspectScalarFieldKeys]] = None
+    ) -> None:
+        self._batcher._add(
+            self._parser(partial_model(models.Suspect, select, include)),
+            method='find_unique',
+            model=models.Suspect,
+            arguments={
+                'where': where,
+                'include': include,
+            },
+            root_selection=select,
+        )
+
+    def find_first(
+        self,
+        skip: Optional[int] = None,
+        where: Optional[types.SuspectWhereInput] = None,
+        cursor: Optional[types.SuspectWhereUniqueInput] = None,
+        include: Optional[types.SuspectInclude] = None,
+        order: Optional[Union[types.SuspectOrderByInput, List[types.SuspectOrderByInput]]] = None,
+        distinct: Optional[List[types.SuspectScalarFieldKeys]] = None,
+        select: Optional[List[types.SuspectScalarFieldKeys]] = None,
+    ) -> None:
+        self._batcher._add(
+            self._parser(partial_model(models.Suspect, select, include)),
+            method='find_first',
+            model=models.Suspect,
+            arguments={
+                'skip': skip,
+                'where': where,
+                'order_by': order,
+                'cursor': cursor,
+                'include': include,
+                'distinct': distinct,
+            },
+            root_selection=select,
+        )
+
+    def find_many(
+        self,
+        take: Optional[int] = None,
+        skip: Optional[int] = None,
+        where: Optional[types.SuspectWhereInput] = None,
+        cursor: Optional[types.SuspectWhereUniqueInput] = None,
+        include: Optional[types.SuspectInclude] = None,
+        order: Optional[Union[types.SuspectOrderByInput, List[types.SuspectOrderByInput]]] = None,
+        distinct: Optional[List[types.SuspectScalarFieldKeys]] = None,
+        select: Optional[List[types.SuspectScalarFieldKeys]] = None,
+    ) -> None:
+        self._batcher._add(
+            self._parser(partial_model(models.Suspect, select, include), many=True),
+            method='find_many',
+            model=models.Suspect,
+            arguments={
+                'take': take,
+                'skip': skip,
+                'where': where,
+                'order_by': order,
+                'cursor': cursor,
+                'include': include,
+                'distinct': distinct,
+            },
+            root_selection=select,
+        )
+
+    def count(
+        self,
+        select: Optional[types.SuspectCountAggregateInput] = None,
+        take: Optional[int] = None,
+        skip: Optional[int] = None,
+        where: Optional[types.SuspectWhereInput] = None,
+        cursor: Optional[types.SuspectWhereUniqueInput] = None,
+    ) -> None:
+        # see `SuspectActions.count()` for the selection building
+        if not select:
+            root_selection = ['_count { _all }']
+        else:
+
+            root_selection = [
+                '_count {{ {0} }}'.format(' '.join(k for k, v in select.items() if v is True))
+            ]
+
+        if select is None:
+            parse: Callable[[Any], Any] = lambda result: int(result['_count']['_all'])
+        else:
+            parse = lambda result: result['_count']
+
+        self._batcher._add(
+            parse,
+            method='count',
+            model=models.Suspect,
+            arguments={
+                'take': take,
+                'skip': skip,
+                'where': where,
+                'cursor': cursor,
+            },
+            root_selection=root_selection,
+        )
+
     def update(
         self,
         data: types.SuspectUpdateInput,
@@ -1001,6 +1443,8 @@ class SuspectBatchActions:
         include: Optional[types.SuspectInclude] = None
     ) -> None:
         self._batcher._add(
+            self._parser(models.Suspect),
+            missing_ok=True,
             method='update',
             model=models.Suspect,
             arguments={
@@ -1017,6 +1461,7 @@ class SuspectBatchActions:
         include: Optional[types.SuspectInclude] = None,
     ) -> None:
         self._batcher._add(
+            self._parser(models.Suspect),
             method='upsert',
             model=models.Suspect,
             arguments={
@@ -1033,6 +1478,7 @@ class SuspectBatchActions:
         where: types.SuspectWhereInput,
     ) -> None:
         self._batcher._add(
+            _parse_count,
             method='update_many',
             model=models.Suspect,
             arguments={'data': data, 'where': where,},
@@ -1044,6 +1490,7 @@ class SuspectBatchActions:
         where: Optional[types.SuspectWhereInput] = None,
     ) -> None:
         self._batcher._add(
+            _parse_count,
             method='delete_many',
             model=models.Suspect,
             arguments={'where': where},
@@ -1058,12 +1505,18 @@ class BlameBatchActions:
     def __init__(self, batcher: Batch) -> None:
         self._batcher = batcher
 
+    def _parser(self, model: Type[BaseModel], *, many: bool = False) -> Callable[[Any], Any]:
+        if many:
+            return lambda result: [model_parse(model, r) for r in result]
+        return lambda result: None if result is None else model_parse(model, result)
+
     def create(
         self,
         data: types.BlameCreateInput,
         include: Optional[types.BlameInclude] = None
     ) -> None:
         self._batcher._add(
+            self._parser(models.Blame),
             method='create',
             model=models.Blame,
             arguments={
@@ -1082,6 +1535,7 @@ class BlameBatchActions:
             raise errors.UnsupportedDatabaseError('sqlite', 'create_many()')
 
         self._batcher._add(
+            _parse_count,
             method='create_many',
             model=models.Blame,
             arguments={
@@ -1097,6 +1551,8 @@ class BlameBatchActions:
         include: Optional[types.BlameInclude] = None,
     ) -> None:
         self._batcher._add(
+            self._parser(models.Blame),
+            missing_ok=True,
             method='delete',
             model=models.Blame,
             arguments={
@@ -1105,6 +1561,110 @@ class BlameBatchActions:
             },
         )
 
+    def find_unique(
+        self,
+        where: types.BlameWhereUniqueInput,
+        include: Optional[types.BlameInclude] = None,
+        select: Optional[List[types.BlameScalarFieldKeys]] = None
+    ) -> None:
+        self._batcher._add(
+            self._parser(partial_model(models.Blame, select, include)),
+            method='find_unique',
+            model=models.Blame,
+            arguments={
+                'where': where,
+                'include': include,
+            },
+            root_selection=select,
+        )
+
+    def find_first(
+        self,
+        skip: Optional[int] = None,
+        where: Optional[types.BlameWhereInput] = None,
+        cursor: Optional[types.BlameWhereUniqueInput] = None,
+        include: Optional[types.BlameInclude] = None,
+        order: Optional[Union[types.BlameOrderByInput, List[types.BlameOrderByInput]]] = None,
+        distinct: Optional[List[types.BlameScalarFieldKeys]] = None,
+        select: Optional[List[types.BlameScalarFieldKeys]] = None,
+    ) -> None:
+        self._batcher._add(
+            self._parser(partial_model(models.Blame, select, include)),
+            method='find_first',
+            model=models.Blame,
+            arguments={
+                'skip': skip,
+                'where': where,
+                'order_by': order,
+                'cursor': cursor,
+                'include': include,
+                'distinct': distinct,
+            },
+            root_selection=select,
+        )
+
+    def find_many(
+        self,
+        take: Optional[int] = None,
+        skip: Optional[int] = None,
+        where: Optional[types.BlameWhereInput] = None,
+        cursor: Optional[types.BlameWhereUniqueInput] = None,
+        include: Optional[types.BlameInclude] = None,
+        order: Optional[Union[types.BlameOrderByInput, List[types.BlameOrderByInput]]] = None,
+        distinct: Optional[List[types.BlameScalarFieldKeys]] = None,
+        select: Optional[List[types.BlameScalarFieldKeys]] = None,
+    ) -> None:
+        self._batcher._add(
+            self._parser(partial_model(models.Blame, select, include), many=True),
+            method='find_many',
+            model=models.Blame,
+            arguments={
+                'take': take,
+                'skip': skip,
+                'where': where,
+                'order_by': order,
+                'cursor': cursor,
+                'include': include,
+                'distinct': distinct,
+            },
+            root_selection=select,
+        )
+
+    def count(
+        self,
+        select: Optional[types.BlameCountAggregateInput] = None,
+        take: Optional[int] = None,
+        skip: Optional[int] = None,
+        where: Optional[types.BlameWhereInput] = None,
+        cursor: Optional[types.BlameWhereUniqueInput] = None,
+    ) -> None:
+        # see `BlameActions.count()` for the selection building
+        if not select:
+            root_selection = ['_count { _all }']
+        else:
+
+            root_selection = [
+                '_count {{ {0} }}'.format(' '.join(k for k, v in select.items() if v is True))
+            ]
+
+        if select is None:
+            parse: Callable[[Any], Any] = lambda result: int(result['_count']['_all'])
+        else:
+            parse = lambda result: result['_count']
+
+        self._batcher._add(
+            parse,
+            method='count',
+            model=models.Blame,
+            arguments={
+                'take': take,
+                'skip': skip,
+                'where': where,
+                'cursor': cursor,
+            },
+            root_selection=root_selection,
+        )
+
     def update(
         self,
         data: types.BlameUpdateInput,
@@ -1112,6 +1672,8 @@ class BlameBatchActions:
         include: Optional[types.BlameInclude] = None
     ) -> None:
         self._batcher._add(
+            self._parser(models.Blame),
+            missing_ok=True,
             method='update',
             model=models.Blame,
             arguments={
@@ -1128,6 +1690,7 @@ class BlameBatchActions:
         include: Optional[types.BlameInclude] = None,
     ) -> None:
         self._batcher._add(
+            self._parser(models.Blame),
             method='upsert',
             model=models.Blame,
             arguments={
@@ -1144,6 +1707,7 @@ class BlameBatchActions:
         where: types.BlameWhereInput,
     ) -> None:
         self._batcher._add(
+            _parse_count,
             method='update_many',
             model=models.Blame,
             arguments={'data': data, 'where': where,},
@@ -1155,6 +1719,7 @@ class BlameBatchActions:
         where: Optional[types.BlameWhereInput] = None,
     ) -> None:
         self._batcher._add(
+            _parse_count,
             method='delete_many',
             model=models.Blame,
             arguments={'where': where},
@@ -1163,4 +1728,233 @@ class BlameBatchActions:
 
 
 
+# NOTE: some arguments are meaningless in this context but are included
+# for completeness sake
+class AnalysisJobBatchActions:
+    def __init__(self, batcher: Batch) -> None:
+        self._batcher = batcher
+
+    def _parser(self, model: Type[BaseModel], *, many: bool = False) -> Callable[[Any], Any]:
+        if many:
+            return lambda result: [model_parse(model, r) for r in result]
+        return lambda result: None if result is None else model_parse(model, result)
+
+    def create(
+        self,
+        data: types.AnalysisJobCreateInput,
+        include: Optional[types.AnalysisJobInclude] = None
+    ) -> None:
+        self._batcher._add(
+            self._parser(models.AnalysisJob),
+            method='create',
+            model=models.AnalysisJob,
+            arguments={
+                'data': data,
+                'include': include,
+            },
+        )
+
+    def create_many(
+        self,
+        data: List[types.AnalysisJobCreateWithoutRelationsInput],
+        *,
+        skip_duplicates: Optional[bool] = None,
+    ) -> None:
+        if self._batcher._active_provider == 'sqlite':
+            raise errors.UnsupportedDatabaseError('sqlite', 'create_many()')
+
+        self._batcher._add(
+            _parse_count,
+            method='create_many',
+            model=models.AnalysisJob,
+            arguments={
+                'data': data,
+                'skipDuplicates': skip_duplicates,
+            },
+            root_selection=['count'],
+        )
+
+    def delete(
+        self,
+        where: types.AnalysisJobWhereUniqueInput,
+        include: Optional[types.AnalysisJobInclude] = None,
+    ) -> None:
+        self._batcher._add(
+            self._parser(models.AnalysisJob),
+            missing_ok=True,
+            method='delete',
+            model=models.AnalysisJob,
+            arguments={
+                'where': where,
+                'include': include,
+            },
+        )
+
+    def find_unique(
+        self,
+        where: types.AnalysisJobWhereUniqueInput,
+        include: Optional[types.AnalysisJobInclude] = None,
+        select: Optional[List[types.AnalysisJobScalarFieldKeys]] = None
+    ) -> None:
+        self._batcher._add(
+            self._parser(partial_model(models.AnalysisJob, select, include)),
+            method='find_unique',
+            model=models.AnalysisJob,
+            arguments={
+                'where': where,
+                'include': include,
+            },
+            root_selection=select,
+        )
+
+    def find_first(
+        self,
+        skip: Optional[int] = None,
+        where: Optional[types.AnalysisJobWhereInput] = None,
+        cursor: Optional[types.AnalysisJobWhereUniqueInput] = None,
+        include: Optional[types.AnalysisJobInclude] = None,
+        order: Optional[Union[types.AnalysisJobOrderByInput, List[types.AnalysisJobOrderByInput]]] = None,
+        distinct: Optional[List[types.AnalysisJobScalarFieldKeys]] = None,
+        select: Optional[List[types.AnalysisJobScalarFieldKeys]] = None,
+    ) -> None:
+        self._batcher._add(
+            self._parser(partial_model(models.AnalysisJob, select, include)),
+            method='find_first',
+            model=models.AnalysisJob,
+            arguments={
+                'skip': skip,
+                'where': where,
+                'order_by': order,
+                'cursor': cursor,
+                'include': include,
+                'distinct': distinct,
+            },
+            root_selection=select,
+        )
+
+    def find_many(
+        self,
+        take: Optional[int] = None,
+        skip: Optional[int] = None,
+        where: Optional[types.AnalysisJobWhereInput] = None,
+        cursor: Optional[types.AnalysisJobWhereUniqueInput] = None,
+        include: Optional[types.AnalysisJobInclude] = None,
+        order: Optional[Union[types.AnalysisJobOrderByInput, List[types.AnalysisJobOrderByInput]]] = None,
+        distinct: Optional[List[types.AnalysisJobScalarFieldKeys]] = None,
+        select: Optional[List[types.AnalysisJobScalarFieldKeys]] = None,
+    ) -> None:
+        self._batcher._add(
+            self._parser(partial_model(models.AnalysisJob, select, include), many=True),
+            method='find_many',
+            model=models.AnalysisJob,
+            arguments={
+                'take': take,
+                'skip': skip,
+                'where': where,
+                'order_by': order,
+                'cursor': cursor,
+                'include': include,
+                'distinct': distinct,
+            },
+            root_selection=select,
+        )
+
+    def count(
+        self,
+        select: Optional[types.AnalysisJobCountAggregateInput] = None,
+        take: Optional[int] = None,
+        skip: Optional[int] = None,
+        where: Optional[types.AnalysisJobWhereInput] = None,
+        cursor: Optional[types.AnalysisJobWhereUniqueInput] = None,
+    ) -> None:
+        # see `AnalysisJobActions.count()` for the selection building
+        if not select:
+            root_selection = ['_count { _all }']
+        else:
+
+            root_selection = [
+                '_count {{ {0} }}'.format(' '.join(k for k, v in select.items() if v is True))
+            ]
+
+        if select is None:
+            parse: Callable[[Any], Any] = lambda result: int(result['_count']['_all'])
+        else:
+            parse = lambda result: result['_count']
+
+        self._batcher._add(
+            parse,
+            method='count',
+            model=models.AnalysisJob,
+            arguments={
+                'take': take,
+                'skip': skip,
+                'where': where,
+                'cursor': cursor,
+            },
+            root_selection=root_selection,
+        )
+
+    def update(
+        self,
+        data: types.AnalysisJobUpdateInput,
+        where: types.AnalysisJobWhereUniqueInput,
+        include: Optional[types.AnalysisJobInclude] = None
+    ) -> None:
+        self._batcher._add(
+            self._parser(models.AnalysisJob),
+            missing_ok=True,
+            method='update',
+            model=models.AnalysisJob,
+            arguments={
+                'data': data,
+                'where': where,
+                'include': include,
+            },
+        )
+
+    def upsert(
+        self,
+        where: types.AnalysisJobWhereUniqueInput,
+        data: types.AnalysisJobUpsertInput,
+        include: Optional[types.AnalysisJobInclude] = None,
+    ) -> None:
+        self._batcher._add(
+            self._parser(models.AnalysisJob),
+            method='upsert',
+            model=models.AnalysisJob,
+            arguments={
+                'where': where,
+                'include': include,
+                'create': data.get('create'),
+                'update': data.get('update'),
+            },
+        )
+
+    def update_many(
+        self,
+        data: types.AnalysisJobUpdateManyMutationInput,
+        where: types.AnalysisJobWhereInput,
+    ) -> None:
+        self._batcher._add(
+            _parse_count,
+            method='update_many',
+            model=models.AnalysisJob,
+            arguments={'data': data, 'where': where,},
+            root_selection=['count'],
+        )
+
+    def delete_many(
+        self,
+        where: Optional[types.AnalysisJobWhereInput] = None,
+    ) -> None:
+        self._batcher._add(
+            _parse_count,
+            method='delete_many',
+            model=models.AnalysisJob,
+            arguments={'where': where},
+            root_selection=['count'],
+        )
+
+
+
 Client = Prisma
\ No newline at end of file
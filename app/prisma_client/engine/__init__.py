@@ -3,6 +3,7 @@ from ._types import TransactionId as TransactionId
 
 try:
     from .query import *
+    from .pool import *
     from .abstract import *
 except ModuleNotFoundError:
     # code has not been generated yet
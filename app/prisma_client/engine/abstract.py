@@ -42,10 +42,12 @@ LiteralString = str
 from abc import ABC, abstractmethod
 from datetime import timedelta
 from ._types import TransactionId
-from ..types import DatasourceOverride, MetricsFormat
 from .._compat import get_running_loop
 from .._constants import DEFAULT_CONNECT_TIMEOUT
 
+if TYPE_CHECKING:
+    from ..types import DatasourceOverride, MetricsFormat
+
 
 __all__ = (
     'AbstractEngine',
@@ -39,11 +39,11 @@ from typing_extensions import TypedDict, Literal
 LiteralString = str
 # -- template engine/http.py.jinja --
 
-import json
 import logging
 from datetime import timedelta
 
 from . import utils, errors
+from .._json import loads
 from .abstract import AbstractEngine
 from ..http import HTTP
 from .._types import Method
@@ -134,7 +134,7 @@ class HTTPEngine(AbstractEngine):
 
             if isinstance(response, str):
                 # workaround for https://github.com/prisma/prisma-engines/pull/4246
-                response = json.loads(response)
+                response = loads(response)
 
             errors_data = response.get('errors')
             if errors_data:
@@ -0,0 +1,301 @@
+# -*- coding: utf-8 -*-
+# code generated by Prisma. DO NOT EDIT.
+# pyright: reportUnusedImport=false
+# fmt: off
+from __future__ import annotations
+
+# global imports for type checking
+from builtins import bool as _bool
+from builtins import int as _int
+from builtins import float as _float
+from builtins import str as _str
+import sys
+import decimal
+import datetime
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+    Iterable,
+    Iterator,
+    Sequence,
+    Callable,
+    ClassVar,
+    NoReturn,
+    TypeVar,
+    Generic,
+    Mapping,
+    Tuple,
+    Union,
+    List,
+    Dict,
+    Type,
+    Any,
+    Set,
+    overload,
+    cast,
+)
+from typing_extensions import TypedDict, Literal
+
+
+LiteralString = str
+# -- template engine/pool.py.jinja --
+
+import re
+import copy
+import json
+import time
+import asyncio
+import logging
+from datetime import timedelta
+
+from .abstract import AbstractEngine
+from .query import QueryEngine
+from ._types import TransactionId
+from .._constants import DEFAULT_CONNECT_TIMEOUT, DEFAULT_TX_TIMEOUT
+
+if TYPE_CHECKING:
+    from ..types import DatasourceOverride, MetricsFormat
+
+
+__all__ = ('EnginePool',)
+
+log: logging.Logger = logging.getLogger(__name__)
+
+# how long the engine of a transaction is remembered past the transaction timeout, so that
+# late queries still reach it and get its "transaction expired" error
+TRANSACTION_AFFINITY_GRACE: float = 60.0
+
+_SAMPLE_NAME = re.compile(r'[a-zA-Z_:][a-zA-Z0-9_:]*')
+
+
+class EnginePool(AbstractEngine):
+    """Spreads queries across multiple query engine processes.
+
+    Every query is sent to the engine with the fewest requests in flight, interactive
+    transactions stay on the engine they were started on. Each engine has its own
+    database connection pool.
+    """
+
+    engines: List[QueryEngine]
+
+    def __init__(self, *, size: int, factory: Callable[[], QueryEngine]) -> None:
+        if size < 1:
+            raise ValueError(f'Expected at least one query engine but got {size}')
+
+        self.engines = [factory() for _ in range(size)]
+        self._outstanding = [0] * size
+        # transaction -> (engine index, monotonic time after which the entry can be dropped)
+        self._transactions: Dict[TransactionId, Tuple[int, float]] = {}
+        self._next = 0
+
+    def close(self, *, timeout: Optional[timedelta] = None) -> None:
+        for engine in self.engines:
+            engine.close(timeout=timeout)
+
+        self._transactions.clear()
+
+    async def aclose(self, *, timeout: Optional[timedelta] = None) -> None:
+        for engine in self.engines:
+            await engine.aclose(timeout=timeout)
+
+        self._transactions.clear()
+
+    async def connect(
+        self,
+        timeout: timedelta = DEFAULT_CONNECT_TIMEOUT,
+        datasources: Optional[List[DatasourceOverride]] = None,
+    ) -> None:
+        log.debug('Connecting %i query engines', len(self.engines))
+        try:
+            # let every engine finish connecting before cleaning up after a failure
+            results = await asyncio.gather(
+                *(engine.connect(timeout=timeout, datasources=datasources) for engine in self.engines),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+        except BaseException:
+            self.close()
+            raise
+
+    def _pick(self) -> int:
+        # least outstanding requests, ties are broken round-robin so idle engines share the load
+        size = len(self.engines)
+        start = self._next
+        self._next = (start + 1) % size
+        return min(range(start, start + size), key=lambda i: self._outstanding[i % size]) % size
+
+    async def query(
+        self,
+        content: str,
+        *,
+        tx_id: TransactionId | None,
+    ) -> Any:
+        index = None
+        if tx_id is not None:
+            # an unknown transaction is reported by whichever engine receives it
+            entry = self._transactions.get(tx_id)
+            if entry is not None:
+                index = entry[0]
+
+        if index is None:
+            index = self._pick()
+
+        self._outstanding[index] += 1
+        try:
+            return await self.engines[index].query(content, tx_id=tx_id)
+        finally:
+            self._outstanding[index] -= 1
+
+    async def start_transaction(self, *, content: str) -> TransactionId:
+        index = self._pick()
+        self._outstanding[index] += 1
+        try:
+            tx_id = await self.engines[index].start_transaction(content=content)
+        finally:
+            self._outstanding[index] -= 1
+
+        # transactions that are never committed or rolled back are expired by their engine,
+        # forget them too instead of keeping an entry per abandoned transaction forever
+        now = time.monotonic()
+        for expired in [key for key, (_, deadline) in self._transactions.items() if deadline < now]:
+            del self._transactions[expired]
+
+        self._transactions[tx_id] = (index, now + _transaction_timeout(content) + TRANSACTION_AFFINITY_GRACE)
+        return tx_id
+
+    async def commit_transaction(self, tx_id: TransactionId) -> None:
+        index, _ = self._transactions.pop(tx_id, (0, 0.0))
+        await self.engines[index].commit_transaction(tx_id)
+
+    async def rollback_transaction(self, tx_id: TransactionId) -> None:
+        index, _ = self._transactions.pop(tx_id, (0, 0.0))
+        await self.engines[index].rollback_transaction(tx_id)
+
+    @overload
+    async def metrics(
+        self,
+        *,
+        format: Literal['json'],
+        global_labels: dict[str, str] | None,
+    ) -> dict[str, Any]:
+        ...
+
+    @overload
+    async def metrics(
+        self,
+        *,
+        format: Literal['prometheus'],
+        global_labels: dict[str, str] | None,
+    ) -> str:
+        ...
+
+    async def metrics(
+        self,
+        *,
+        format: MetricsFormat,
+        global_labels: dict[str, str] | None,
+    ) -> str | dict[str, Any]:
+        if format == 'json':
+            results = [
+                await engine.metrics(format='json', global_labels=global_labels)
+                for engine in self.engines
+            ]
+            return _merge_json_metrics(results)
+
+        results = [
+            await engine.metrics(format='prometheus', global_labels=global_labels)
+            for engine in self.engines
+        ]
+        return _merge_prometheus_metrics(results)
+
+
+def _transaction_timeout(content: str) -> float:
+    """The timeout in seconds of the transaction started with the given `start_transaction` content"""
+    timeout = json.loads(content).get('timeout')
+    if timeout is None:
+        return DEFAULT_TX_TIMEOUT.total_seconds()
+    return timeout / 1000
+
+
+def _merge_prometheus_metrics(results: List[str]) -> str:
+    """Combine the metrics reported by every engine into a single exposition.
+
+    Every engine reports the same families, their samples are grouped under one `# HELP` / `# TYPE`
+    header per family and told apart with an `engine` label.
+    """
+    # family name -> (header lines, samples)
+    families: Dict[str, Tuple[List[str], List[str]]] = {}
+    for index, text in enumerate(results):
+        family: Optional[str] = None
+        for line in text.splitlines():
+            if not line.strip():
+                continue
+
+            if line.startswith('#'):
+                parts = line.split(None, 3)
+                if len(parts) >= 3 and parts[1] in ('HELP', 'TYPE'):
+                    # samples that follow belong to this family, histogram ones carry a suffix e.g. `_bucket`
+                    family = parts[2]
+                    headers, _ = families.setdefault(family, ([], []))
+                    if not any(header.split(None, 2)[1] == parts[1] for header in headers):
+                        headers.append(line)
+                continue
+
+            match = _SAMPLE_NAME.match(line)
+            if match is None:
+                continue
+
+            name = match.group()
+            rest = line[match.end():]
+            if rest.startswith('{}'):
+                rest = rest[2:]
+            label = f'engine="{index}"'
+            if rest.startswith('{'):
+                rest = '{' + label + ',' + rest[1:]
+            else:
+                rest = '{' + label + '}' + rest
+
+            if family is None or not name.startswith(family):
+                family = name
+            _, samples = families.setdefault(family, ([], []))
+            samples.append(name + rest)
+
+    lines: List[str] = []
+    for headers, samples in families.values():
+        lines.extend(headers)
+        lines.extend(samples)
+
+    return '\n'.join(lines) + '\n'
+
+
+def _merge_json_metrics(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Sum the metrics reported by every engine, matched by key and labels"""
+    merged: Dict[str, Any] = {}
+    for kind in ('counters', 'gauges', 'histograms'):
+        entries: Dict[str, Dict[str, Any]] = {}
+        for result in results:
+            for metric in result.get(kind, []):
+                identity = json.dumps([metric['key'], metric.get('labels')], sort_keys=True)
+                existing = entries.get(identity)
+                if existing is None:
+                    entries[identity] = copy.deepcopy(metric)
+                elif kind == 'histograms':
+                    value = existing['value']
+                    other = metric['value']
+                    value['sum'] += other['sum']
+                    value['count'] += other['count']
+                    value['buckets'] = [
+                        [bound, count + other_count]
+                        for (bound, count), (_, other_count) in zip(value['buckets'], other['buckets'])
+                    ]
+                else:
+                    existing['value'] += metric['value']
+
+        merged[kind] = list(entries.values())
+
+    return merged
+
+# black does not respect the fmt: off comment without this
+# fmt: on
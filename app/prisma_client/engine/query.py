@@ -44,27 +44,37 @@ import os
 import json
 import time
 import atexit
+import shutil
 import signal
+import socket
 import asyncio
 import logging
+import tempfile
 import subprocess
 from datetime import timedelta
 from pathlib import Path
 
 from . import utils, errors
 from .http import HTTPEngine
+from ..http import HTTP
 from .. import config
 from ..utils import DEBUG
 from ..binaries import platform
 from ..utils import time_since, _env_bool
-from ..types import DatasourceOverride, MetricsFormat
 from ..builder import dumps
 from .._constants import DEFAULT_CONNECT_TIMEOUT
 from ._types import TransactionId
 
+if TYPE_CHECKING:
+    from ..types import DatasourceOverride, MetricsFormat
+
 
 __all__ = ('QueryEngine',)
 
+# bounds of the delay between readiness checks while the engine is starting, in seconds
+READY_BACKOFF_INITIAL = 0.001
+READY_BACKOFF_MAX = 0.05
+
 log: logging.Logger = logging.getLogger(__name__)
 
 
@@ -74,10 +84,20 @@ class QueryEngine(HTTPEngine):
     file: Optional[Path]
     process: subprocess.Popen[bytes] | subprocess.Popen[str] | None
 
-    def __init__(self, *, dml_path: Path, log_queries: bool = False, **kwargs: Any) -> None:
+    def __init__(
+        self,
+        *,
+        dml_path: Path,
+        log_queries: bool = False,
+        unix_socket: bool = False,
+        **kwargs: Any,
+    ) -> None:
         super().__init__(url=None, **kwargs)
         self.dml_path = dml_path
         self._log_queries = log_queries
+        self._unix_socket = unix_socket
+        self._socket_dir: Optional[str] = None
+        self._http_kwargs = kwargs
         self.process = None
         self.file = None
 
@@ -105,6 +125,10 @@ class QueryEngine(HTTPEngine):
 
             self.process = None
 
+        if self._socket_dir is not None:
+            shutil.rmtree(self._socket_dir, ignore_errors=True)
+            self._socket_dir = None
+
         log.debug('Disconnected query engine')
 
     async def aclose(self, *, timeout: Optional[timedelta] = None) -> None:
@@ -141,16 +165,68 @@ class QueryEngine(HTTPEngine):
 
         log.debug('Connecting to query engine took %s', time_since(start))
 
+    def _create_socket_path(self) -> Optional[str]:
+        if platform.name() == 'windows' or not hasattr(socket, 'AF_UNIX'):
+            return None
+
+        directory = tempfile.mkdtemp(prefix='prisma-')
+        path = os.path.join(directory, 'query-engine.sock')
+
+        # socket paths are limited to 104 bytes on macOS and 108 bytes on linux
+        if len(path.encode()) >= 104:
+            shutil.rmtree(directory, ignore_errors=True)
+            return None
+
+        self._socket_dir = directory
+        return path
+
     async def spawn(
         self,
         file: Path,
         timeout: timedelta = DEFAULT_CONNECT_TIMEOUT,
         datasources: Optional[List[DatasourceOverride]] = None,
     ) -> None:
-        port = utils.get_open_port()
-        log.debug('Running query engine on port %i', port)
+        if self._unix_socket:
+            socket_path = self._create_socket_path()
+            if socket_path is None:
+                log.debug('Unix sockets are not available; falling back to TCP')
+            else:
+                try:
+                    await self._spawn(file, timeout=timeout, datasources=datasources, socket_path=socket_path)
+                    return
+                except errors.EngineConnectionError:
+                    # engines that cannot listen on a unix socket exit straight away, any
+                    # other connection failure would happen over TCP as well
+                    if self.process is None or self.process.poll() is None:
+                        raise
+
+                    log.debug('Query engine exited while binding to %s; falling back to TCP', socket_path)
+                    self.close()
+                    await self._close_session()
+
+        await self._spawn(file, timeout=timeout, datasources=datasources)
+
+    async def _spawn(
+        self,
+        file: Path,
+        timeout: timedelta,
+        datasources: Optional[List[DatasourceOverride]],
+        socket_path: Optional[str] = None,
+    ) -> None:
+        if socket_path is not None:
+            log.debug('Running query engine on unix socket %s', socket_path)
 
-        self.url = f'http://localhost:{port}'
+            # requests are sent through the socket, the host is only used for the Host header
+            self.url = 'http://localhost'
+            self.session = HTTP(uds=socket_path, **self._http_kwargs)
+            listen_args = ['--unix-path', socket_path]
+        else:
+            port = utils.get_open_port()
+            log.debug('Running query engine on port %i', port)
+
+            self.url = f'http://localhost:{port}'
+            self.session = HTTP(**self._http_kwargs)
+            listen_args = ['-p', str(port)]
 
         env = os.environ.copy()
         env.update(
@@ -173,8 +249,7 @@ class QueryEngine(HTTPEngine):
 
         args: List[str] = [
             str(file.absolute()),
-            '-p',
-            str(port),
+            *listen_args,
             '--enable-metrics',
             '--enable-raw-queries',
         ]
@@ -201,8 +276,20 @@ class QueryEngine(HTTPEngine):
             **popen_kwargs
         )
 
+        # the engine is usually listening within a few milliseconds, so start polling
+        # almost immediately and back off exponentially from there
+        start = time.monotonic()
+        deadline = start + timeout.total_seconds()
+        delay = READY_BACKOFF_INITIAL
+        attempts = 0
         last_exc = None
-        for _ in range(int(timeout.total_seconds() / 0.1)):
+        while True:
+            if self.process.poll() is not None:
+                raise errors.EngineConnectionError(
+                    f'Query engine exited with code {self.process.returncode}'
+                )
+
+            attempts += 1
             try:
                 data = await self.request('GET', '/status')
             except Exception as exc:
@@ -215,21 +302,22 @@ class QueryEngine(HTTPEngine):
                     'Could not connect to query engine due to %s; retrying...',
                     exc,
                 )
-                await asyncio.sleep(0.1)
-
-                continue
+            else:
+                if data.get('Errors') is None:
+                    break
 
-            if data.get('Errors') is not None:
                 log.debug('Could not connect due to gql errors; retrying...')
-                await asyncio.sleep(0.1)
 
-                continue
+            if time.monotonic() + delay > deadline:
+                raise errors.EngineConnectionError(
+                    'Could not connect to the query engine'
+                ) from last_exc
 
-            break
-        else:
-            raise errors.EngineConnectionError(
-                'Could not connect to the query engine'
-            ) from last_exc
+            await asyncio.sleep(delay)
+
+            delay = min(delay * 2, READY_BACKOFF_MAX)
+
+        log.debug('Query engine ready after %i status checks in %s', attempts, time_since(start))
 
     async def query(
         self,
@@ -15,7 +15,7 @@ from .. import errors as prisma_errors
 from .. import config
 from ..http_abstract import AbstractResponse
 from ..utils import DEBUG_GENERATOR, time_since
-from ..binaries import platform
+from ..binaries import platform, manifest
 
 
 log: logging.Logger = logging.getLogger(__name__)
@@ -64,9 +64,12 @@ def _resolve_from_binary_paths(binary_paths: dict[str, str]) -> Path | None:
 
 
 def _can_execute_binary(path: Path) -> bool:
-    proc = subprocess.run([str(path), '--version'], check=False)
-    log.debug('Executable check for %s exited with code: %s', path, proc.returncode)
-    return proc.returncode == 0
+    def probe() -> bool:
+        proc = subprocess.run([str(path), '--version'], check=False)
+        log.debug('Executable check for %s exited with code: %s', path, proc.returncode)
+        return proc.returncode == 0
+
+    return manifest.cached_for_binary('executable', path, probe)
 
 
 def ensure(binary_paths: dict[str, str]) -> Path:
@@ -117,11 +120,7 @@ def ensure(binary_paths: dict[str, str]) -> Path:
 
     log.debug('Using Query Engine binary at %s', file)
 
-    start_version = time.monotonic()
-    process = subprocess.run([str(file.absolute()), '--version'], stdout=subprocess.PIPE, check=True)
-    log.debug('Version check took %s', time_since(start_version))
-
-    version = str(process.stdout, sys.getdefaultencoding()).replace('query-engine', '').strip()
+    version = manifest.cached_for_binary('query_engine_version', file, lambda: _get_engine_version(file))
     log.debug('Using query engine version %s', version)
 
     if force_version and version != config.expected_engine_version:
@@ -132,6 +131,13 @@ def ensure(binary_paths: dict[str, str]) -> Path:
     return file
 
 
+def _get_engine_version(file: Path) -> str:
+    start_version = time.monotonic()
+    process = subprocess.run([str(file.absolute()), '--version'], stdout=subprocess.PIPE, check=True)
+    log.debug('Version check took %s', time_since(start_version))
+    return str(process.stdout, sys.getdefaultencoding()).replace('query-engine', '').strip()
+
+
 def get_open_port() -> int:
     sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
     sock.bind(('', 0))
@@ -141,6 +147,23 @@ def get_open_port() -> int:
 
 
 def handle_response_errors(resp: AbstractResponse[Any], data: Any) -> NoReturn:
+    _raise_mapped_error(data)
+
+    try:
+        raise prisma_errors.DataError(data[0])
+    except (IndexError, TypeError):
+        pass
+
+    raise errors.EngineRequestError(resp, f'Could not process erroneous response: {data}')
+
+
+def handle_batch_result_errors(data: Any) -> NoReturn:
+    """Raise the error reported for a single operation of a non-transactional batch"""
+    _raise_mapped_error(data)
+    raise prisma_errors.DataError(data[0])
+
+
+def _raise_mapped_error(data: Any) -> None:
     for error in data:
         try:
             base_error_message = error.get('error', '')
@@ -179,10 +202,3 @@ def handle_response_errors(resp: AbstractResponse[Any], data: Any) -> NoReturn:
         except (KeyError, TypeError) as err:
             log.debug('Ignoring error while constructing specialized error %s', err)
             continue
-
-    try:
-        raise prisma_errors.DataError(data[0])
-    except (IndexError, TypeError):
-        pass
-
-    raise errors.EngineRequestError(resp, f'Could not process erroneous response: {data}')
@@ -221,4 +221,5 @@ class Base64:
         return False
 
 
-from .types import Serializable
\ No newline at end of file
+if TYPE_CHECKING:
+    from .types import Serializable
\ No newline at end of file
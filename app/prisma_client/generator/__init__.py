@@ -1,4 +1,44 @@
-from .types import *
-from .models import *
-from .jsonrpc import *
-from .generator import *
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .types import *
+    from .models import *
+    from .jsonrpc import *
+    from .generator import *
+
+
+# The generated client only needs `generator._runtime` & `generator.types` at runtime, the
+# rest of the package pulls in jinja2, click and the DMMF models so it is only imported
+# once one of its exports is accessed.
+_EXPORTS = {
+    # .types
+    'PartialModel': 'types',
+    'PartialModelField': 'types',
+    # .models
+    'AnyData': 'models',
+    'PythonData': 'models',
+    'DefaultData': 'models',
+    'GenericData': 'models',
+    # .jsonrpc
+    'Manifest': 'jsonrpc',
+    # .generator
+    'BASE_PACKAGE_DIR': 'generator',
+    'GenericGenerator': 'generator',
+    'BaseGenerator': 'generator',
+    'Generator': 'generator',
+    'render_template': 'generator',
+    'cleanup_templates': 'generator',
+    'partial_models_ctx': 'generator',
+}
+
+
+def __getattr__(name: str) -> Any:
+    submodule = _EXPORTS.get(name)
+    if submodule is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    import importlib
+
+    value = getattr(importlib.import_module(f'{__name__}.{submodule}'), name)
+    globals()[name] = value
+    return value
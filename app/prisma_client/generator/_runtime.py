@@ -0,0 +1,100 @@
+"""Generator models that the generated client also needs at runtime.
+
+These are kept out of `generator.models` so that importing the client does not
+import the rest of the generator, e.g. click, jinja2 and the DMMF models.
+"""
+
+import os
+import enum
+from typing import Any, ClassVar, Dict, Optional
+
+import pydantic
+from pydantic import BaseModel
+
+from .._compat import PYDANTIC_V2, ConfigDict, Field as FieldInfo
+
+
+__all__ = (
+    'EngineType',
+    'BinaryPaths',
+    'ValueFromEnvVar',
+    'OptionalValueFromEnvVar',
+)
+
+
+class EngineType(str, enum.Enum):
+    binary = 'binary'
+    library = 'library'
+    dataproxy = 'dataproxy'
+
+    def __str__(self) -> str:
+        return self.value
+
+
+class BinaryPaths(BaseModel):
+    """This class represents the paths to engine binaries.
+
+    Each property in this class is a mapping of platform name to absolute path, for example:
+
+    ```py
+    # This is what will be set on an M1 chip if there are no other `binaryTargets` set
+    binary_paths.query_engine == {
+        'darwin-arm64': '/Users/robert/.cache/prisma-python/binaries/3.13.0/efdf9b1183dddfd4258cd181a72125755215ab7b/node_modules/prisma/query-engine-darwin-arm64'
+    }
+    ```
+
+    This is only available if the generator explicitly requests them using the `requires_engines` manifest property.
+    """
+
+    query_engine: Dict[str, str] = FieldInfo(
+        default_factory=dict,
+        alias='queryEngine',
+    )
+    introspection_engine: Dict[str, str] = FieldInfo(
+        default_factory=dict,
+        alias='introspectionEngine',
+    )
+    migration_engine: Dict[str, str] = FieldInfo(
+        default_factory=dict,
+        alias='migrationEngine',
+    )
+    libquery_engine: Dict[str, str] = FieldInfo(
+        default_factory=dict,
+        alias='libqueryEngine',
+    )
+    prisma_format: Dict[str, str] = FieldInfo(
+        default_factory=dict,
+        alias='prismaFmt',
+    )
+
+    if PYDANTIC_V2:
+        model_config: ClassVar[ConfigDict] = ConfigDict(extra='allow')
+    else:
+
+        class Config(BaseModel.Config):  # pyright: ignore[reportDeprecated]
+            extra: Any = (
+                pydantic.Extra.allow  # pyright: ignore[reportDeprecated]
+            )
+
+
+class ValueFromEnvVar(BaseModel):
+    value: str
+    from_env_var: Optional[str] = FieldInfo(alias='fromEnvVar')
+
+
+class OptionalValueFromEnvVar(BaseModel):
+    value: Optional[str] = None
+    from_env_var: Optional[str] = FieldInfo(alias='fromEnvVar')
+
+    def resolve(self) -> str:
+        value = self.value
+        if value is not None:
+            return value
+
+        env_var = self.from_env_var
+        assert env_var is not None, 'from_env_var should not be None'
+        value = os.environ.get(env_var)
+        if value is None:
+            raise RuntimeError(f'Environment variable not found: {env_var}')
+
+        return value
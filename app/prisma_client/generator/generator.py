@@ -2,12 +2,16 @@ import os
 import sys
 import json
 import shutil
+import hashlib
 import logging
 import traceback
+import multiprocessing
 from pathlib import Path
 from abc import ABC, abstractmethod
 from contextvars import ContextVar
-from typing import Generic, Dict, Type, List, Any, Optional, cast
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Generic, Dict, Type, List, Any, Optional, Set, Tuple, cast
 
 from jinja2 import Environment, FileSystemLoader, StrictUndefined
 from pydantic import BaseModel, ValidationError
@@ -15,7 +19,8 @@ from pydantic import BaseModel, ValidationError
 from . import jsonrpc
 from .jsonrpc import Manifest
 from .filters import quote
-from .models import DefaultData, PythonData
+from .slim import slim_module
+from .models import DefaultData, PythonData, data_ctx, config_ctx
 from .types import PartialModel
 from .utils import (
     copy_tree,
@@ -24,7 +29,7 @@ from .utils import (
 )
 from .errors import PartialTypeGeneratorError
 from .. import __version__
-from ..utils import DEBUG, DEBUG_GENERATOR
+from ..utils import DEBUG, DEBUG_GENERATOR, _env_bool
 from .._compat import cached_property, model_json, model_parse
 from .._types import BaseModelT, InheritsGeneric, get_args
 
@@ -46,6 +51,19 @@ GENERIC_GENERATOR_NAME = 'prisma.generator.generator.GenericGenerator'
 # set of templates that should be rendered after every other template
 DEFERRED_TEMPLATES = {'partials.py.jinja'}
 
+# set of templates that are only rendered in full to a `.pyi` stub with the `slim` option,
+# these are by far the largest modules and are mostly made up of type definitions
+SLIM_TEMPLATES = {'types.py.jinja', 'actions.py.jinja'}
+
+# written after a successful generation, generation is skipped while none of its inputs change.
+# It only holds paths relative to the schema and the package so that it can be committed along
+# with the generated client and still match on a fresh checkout in a different directory
+FINGERPRINT_FILE = '.generate-fingerprint.json'
+
+# templates embedding machine local paths (the schema and query engine locations), these are
+# rendered again even when generation is otherwise skipped
+MACHINE_LOCAL_TEMPLATES = {'client.py.jinja'}
+
 DEFAULT_ENV = Environment(
     trim_blocks=True,
     lstrip_blocks=True,
@@ -230,23 +248,36 @@ class Generator(GenericGenerator[PythonData]):
         if not rootdir.exists():
             rootdir.mkdir(parents=True, exist_ok=True)
 
+        fingerprint = _fingerprint(data)
+        fingerprint_file = rootdir / FINGERPRINT_FILE
+        if not _env_bool('PRISMA_PY_FORCE_GENERATE') and _is_up_to_date(rootdir, fingerprint):
+            log.debug('Prisma Client Python is up to date, only rendering machine local modules')
+            _copy_schema(data, rootdir)
+            params = data.to_params()
+            for name in MACHINE_LOCAL_TEMPLATES:
+                render_template(rootdir, name, params)
+            return
+
+        # a generation that does not finish must not be mistaken for an up to date client
+        if fingerprint_file.exists():
+            fingerprint_file.unlink()
+
         if not is_same_path(BASE_PACKAGE_DIR, rootdir):
             copy_tree(BASE_PACKAGE_DIR, rootdir)
 
-        # copy the Prisma Schema file used to generate the client to the
-        # package so we can use it to instantiate the query engine
-        packaged_schema = rootdir / 'schema.prisma'
-        if not is_same_path(data.schema_path, packaged_schema):
-            shutil.copy(data.schema_path, packaged_schema)
+        _copy_schema(data, rootdir)
 
         params = data.to_params()
 
-        try:
-            for name in DEFAULT_ENV.list_templates():
-                if not name.endswith('.py.jinja') or name.startswith('_') or name in DEFERRED_TEMPLATES:
-                    continue
+        names = [
+            name
+            for name in DEFAULT_ENV.list_templates()
+            if name.endswith('.py.jinja') and not name.startswith('_') and name not in DEFERRED_TEMPLATES
+        ]
+        slim = SLIM_TEMPLATES if config.slim else set()
 
-                render_template(rootdir, name, params)
+        try:
+            _render_templates(rootdir, names, params, data=data, slim=slim)
 
             if config.partial_type_generator:
                 log.debug('Generating partial types')
@@ -259,9 +290,24 @@ class Generator(GenericGenerator[PythonData]):
             cleanup_templates(rootdir, env=DEFAULT_ENV)
             raise
 
+        files = [*names, *DEFERRED_TEMPLATES]
+        outputs = [resolve_template_path(Path(), name) for name in files]
+        outputs.extend(_stub_path(resolve_template_path(Path(), name)) for name in files if name in slim)
+        fingerprint_file.write_text(
+            json.dumps({'fingerprint': fingerprint, 'files': sorted(path.as_posix() for path in outputs)}, indent=2)
+        )
+
         log.debug('Finished generating Prisma Client Python')
 
 
+def _copy_schema(data: PythonData, rootdir: Path) -> None:
+    # copy the Prisma Schema file used to generate the client to the
+    # package so we can use it to instantiate the query engine
+    packaged_schema = rootdir / 'schema.prisma'
+    if not is_same_path(data.schema_path, packaged_schema):
+        shutil.copy(data.schema_path, packaged_schema)
+
+
 def cleanup_templates(rootdir: Path, *, env: Optional[Environment] = None) -> None:
     """Revert module to pre-generation state"""
     if env is None:
@@ -269,9 +315,14 @@ def cleanup_templates(rootdir: Path, *, env: Optional[Environment] = None) -> No
 
     for name in env.list_templates():
         file = resolve_template_path(rootdir=rootdir, name=name)
-        if file.exists():
-            log.debug('Removing rendered template at %s', file)
-            file.unlink()
+        for path in (file, _stub_path(file)):
+            if path.exists():
+                log.debug('Removing rendered template at %s', path)
+                path.unlink()
+
+    fingerprint_file = rootdir / FINGERPRINT_FILE
+    if fingerprint_file.exists():
+        fingerprint_file.unlink()
 
 
 def render_template(
@@ -280,6 +331,7 @@ def render_template(
     params: Dict[str, Any],
     *,
     env: Optional[Environment] = None,
+    slim: bool = False,
 ) -> None:
     if env is None:
         env = DEFAULT_ENV
@@ -291,10 +343,166 @@ def render_template(
     if not file.parent.exists():
         file.parent.mkdir(parents=True, exist_ok=True)
 
+    stub = _stub_path(file)
+    if slim:
+        stub.write_bytes(output.encode(sys.getdefaultencoding()))
+        log.debug('Rendered template stub to %s', stub.absolute())
+        output = slim_module(output)
+    elif stub.exists():
+        # left over from a previous generation with the `slim` option
+        stub.unlink()
+
     file.write_bytes(output.encode(sys.getdefaultencoding()))
     log.debug('Rendered template to %s', file.absolute())
 
 
+def _stub_path(file: Path) -> Path:
+    return file.with_suffix('.pyi')
+
+
+def _render_templates(
+    rootdir: Path,
+    names: List[str],
+    params: Dict[str, Any],
+    *,
+    data: PythonData,
+    slim: Set[str],
+) -> None:
+    """Render independent templates, in parallel on forked worker processes where supported.
+
+    Workers are forked so that they inherit the parsed DMMF and the template parameters
+    instead of having to pickle them.
+    """
+    workers = min(len(names), _render_workers())
+    if workers > 1 and 'fork' in multiprocessing.get_all_start_methods():
+        try:
+            _render_in_pool(rootdir, names, params, data=data, slim=slim, workers=workers)
+            return
+        except (OSError, ImportError, BrokenProcessPool) as exc:
+            # e.g. sandboxed build environments without working semaphores or /dev/shm,
+            # rendering is idempotent so any partially rendered templates are simply re-rendered
+            log.debug('Could not render templates on worker processes, rendering sequentially: %s', exc)
+
+    for name in names:
+        render_template(rootdir, name, params, slim=name in slim)
+
+
+def _render_in_pool(
+    rootdir: Path,
+    names: List[str],
+    params: Dict[str, Any],
+    *,
+    data: PythonData,
+    slim: Set[str],
+    workers: int,
+) -> None:
+    global _worker_state
+    _worker_state = (data, params)
+
+    # the largest templates take the longest to render, start them first
+    template_dir = Path(__file__).parent / 'templates'
+    names = sorted(names, key=lambda name: (template_dir / name).stat().st_size, reverse=True)
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context('fork'),
+            initializer=_init_render_worker,
+        ) as executor:
+            futures = [executor.submit(_render_in_worker, rootdir, name, name in slim) for name in names]
+            for future in futures:
+                future.result()
+    finally:
+        _worker_state = None
+
+    log.debug('Rendered %i templates on %i worker processes', len(names), workers)
+
+
+def _render_workers() -> int:
+    value = os.environ.get('PRISMA_PY_GENERATOR_WORKERS')
+    if value:
+        return int(value)
+    return os.cpu_count() or 1
+
+
+# the parsed data & template parameters inherited by forked render workers
+_worker_state: Optional[Tuple[PythonData, Dict[str, Any]]] = None
+
+
+def _init_render_worker() -> None:
+    assert _worker_state is not None, 'Render workers must be forked from the generating process'
+    data, _ = _worker_state
+    # context variables are not guaranteed to survive the fork
+    data_ctx.set(data)
+    config_ctx.set(data.generator.config)
+
+
+def _render_in_worker(rootdir: Path, name: str, slim: bool) -> None:
+    assert _worker_state is not None
+    _, params = _worker_state
+    render_template(rootdir, name, params, slim=slim)
+
+
+def _fingerprint(data: PythonData) -> str:
+    """Hash of every input that the generated client depends on.
+
+    Paths are hashed relative to the schema directory or to the package, the binary targets
+    and query engine paths are left out entirely as they only end up in `MACHINE_LOCAL_TEMPLATES`.
+    """
+    sha = hashlib.sha256()
+    schema_dir = Path(data.schema_path).parent
+    generator = json.loads(model_json(data.generator))
+    generator['output']['value'] = _relative_path(Path(data.generator.output.value), schema_dir)
+    # `native` is resolved to the platform generating the client, targets only affect the engine paths
+    del generator['binary_targets']
+    parts = [
+        __version__,
+        data.version,
+        data.datamodel,
+        json.dumps(generator, sort_keys=True),
+        *(model_json(datasource) for datasource in data.datasources),
+    ]
+    for part in parts:
+        sha.update(part.encode('utf-8'))
+        sha.update(b'\0')
+
+    # the templates, the generator itself and every module copied alongside the rendered ones
+    rendered = {resolve_template_path(BASE_PACKAGE_DIR, name) for name in DEFAULT_ENV.list_templates()}
+    sources = [
+        path
+        for path in BASE_PACKAGE_DIR.rglob('*')
+        if path.suffix in {'.py', '.jinja'} and path not in rendered and '__pycache__' not in path.parts
+    ]
+
+    named = [(path.relative_to(BASE_PACKAGE_DIR).as_posix(), path) for path in sources]
+
+    partial_type_generator = data.generator.config.partial_type_generator
+    if partial_type_generator is not None and partial_type_generator.spec.origin:
+        origin = Path(partial_type_generator.spec.origin)
+        named.append((_relative_path(origin, schema_dir), origin))
+
+    for name, path in sorted(named):
+        sha.update(name.encode('utf-8'))
+        sha.update(path.read_bytes())
+
+    return sha.hexdigest()
+
+
+def _relative_path(path: Path, start: Path) -> str:
+    return Path(os.path.relpath(path.resolve(), start.resolve())).as_posix()
+
+
+def _is_up_to_date(rootdir: Path, fingerprint: str) -> bool:
+    try:
+        state = json.loads((rootdir / FINGERPRINT_FILE).read_text())
+    except (OSError, ValueError):
+        return False
+
+    if state.get('fingerprint') != fingerprint:
+        return False
+
+    return all((rootdir / name).exists() for name in state.get('files', []))
+
+
 def _write_debug_data(name: str, output: str) -> None:
     path = Path(__file__).parent.joinpath(f'debug-{name}.json')
 
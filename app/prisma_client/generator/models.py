@@ -51,6 +51,12 @@ from .._compat import (
 )
 from .._constants import QUERY_BUILDER_ALIASES
 from ..errors import UnsupportedListTypeError
+from ._runtime import (
+    EngineType as EngineType,
+    BinaryPaths as BinaryPaths,
+    ValueFromEnvVar as ValueFromEnvVar,
+    OptionalValueFromEnvVar as OptionalValueFromEnvVar,
+)
 
 
 __all__ = (
@@ -239,15 +245,6 @@ class InterfaceChoices(str, enum.Enum):
     asyncio = 'asyncio'
 
 
-class EngineType(str, enum.Enum):
-    binary = 'binary'
-    library = 'library'
-    dataproxy = 'dataproxy'
-
-    def __str__(self) -> str:
-        return self.value
-
-
 class Module(BaseModel):
     if TYPE_CHECKING:
         spec: machinery.ModuleSpec
@@ -381,52 +378,6 @@ class GenericData(GenericModel, Generic[ConfigT]):
         return values
 
 
-class BinaryPaths(BaseModel):
-    """This class represents the paths to engine binaries.
-
-    Each property in this class is a mapping of platform name to absolute path, for example:
-
-    ```py
-    # This is what will be set on an M1 chip if there are no other `binaryTargets` set
-    binary_paths.query_engine == {
-        'darwin-arm64': '/Users/robert/.cache/prisma-python/binaries/3.13.0/efdf9b1183dddfd4258cd181a72125755215ab7b/node_modules/prisma/query-engine-darwin-arm64'
-    }
-    ```
-
-    This is only available if the generator explicitly requests them using the `requires_engines` manifest property.
-    """
-
-    query_engine: Dict[str, str] = FieldInfo(
-        default_factory=dict,
-        alias='queryEngine',
-    )
-    introspection_engine: Dict[str, str] = FieldInfo(
-        default_factory=dict,
-        alias='introspectionEngine',
-    )
-    migration_engine: Dict[str, str] = FieldInfo(
-        default_factory=dict,
-        alias='migrationEngine',
-    )
-    libquery_engine: Dict[str, str] = FieldInfo(
-        default_factory=dict,
-        alias='libqueryEngine',
-    )
-    prisma_format: Dict[str, str] = FieldInfo(
-        default_factory=dict,
-        alias='prismaFmt',
-    )
-
-    if PYDANTIC_V2:
-        model_config: ClassVar[ConfigDict] = ConfigDict(extra='allow')
-    else:
-
-        class Config(BaseModel.Config):  # pyright: ignore[reportDeprecated]
-            extra: Any = (
-                pydantic.Extra.allow  # pyright: ignore[reportDeprecated]
-            )
-
-
 class Datasource(BaseModel):
     # TODO: provider enums
     name: str
@@ -462,29 +413,6 @@ class Generator(GenericModel, Generic[ConfigT]):
         return feature in self.preview_features
 
 
-class ValueFromEnvVar(BaseModel):
-    value: str
-    from_env_var: Optional[str] = FieldInfo(alias='fromEnvVar')
-
-
-class OptionalValueFromEnvVar(BaseModel):
-    value: Optional[str] = None
-    from_env_var: Optional[str] = FieldInfo(alias='fromEnvVar')
-
-    def resolve(self) -> str:
-        value = self.value
-        if value is not None:
-            return value
-
-        env_var = self.from_env_var
-        assert env_var is not None, 'from_env_var should not be None'
-        value = os.environ.get(env_var)
-        if value is None:
-            raise RuntimeError(f'Environment variable not found: {env_var}')
-
-        return value
-
-
 class Config(BaseSettings):
     """Custom generator config options."""
 
@@ -500,6 +428,10 @@ class Config(BaseSettings):
     # https://github.com/prisma/prisma/issues/12442
     enable_experimental_decimal: bool = FieldInfo(default=False, env='PRISMA_PY_CONFIG_ENABLE_EXPERIMENTAL_DECIMAL')
 
+    # emit runtime-minimal `types.py` & `actions.py` modules, the full modules are written
+    # as `.pyi` stubs for type checkers
+    slim: bool = FieldInfo(default=False, env='PRISMA_PY_CONFIG_SLIM')
+
     # this seems to be the only good method for setting the contextvar as
     # we don't control the actual construction of the object like we do for
     # the Data model.
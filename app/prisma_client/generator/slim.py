@@ -0,0 +1,124 @@
+import ast
+from typing import List, Optional, Set, Tuple, Union
+
+
+__all__ = ('slim_module',)
+
+# (first line, last line, replacement lines), lines are 1-indexed and inclusive
+_Edit = Tuple[int, int, List[str]]
+
+_FunctionDef = Union[ast.FunctionDef, ast.AsyncFunctionDef]
+
+
+def slim_module(source: str) -> str:
+    """Strip a rendered module down to what is needed at runtime.
+
+    The full module is written as a `.pyi` stub alongside so type checkers do not
+    lose anything, the runtime module:
+
+    - replaces every `TypedDict` with a plain `dict` alias
+    - removes `@overload` signatures
+    - removes docstrings
+    """
+    lines = source.splitlines()
+    tree = ast.parse(source)
+    edits: List[_Edit] = []
+    typed_dicts: Set[str] = set()
+
+    for node in tree.body:
+        name = _typed_dict_name(node, typed_dicts)
+        if name is not None:
+            typed_dicts.add(name)
+            edits.append((_first_line(node), _last_line(node), [f'{name} = dict']))
+            continue
+
+        _slim_statement(node, lines, edits)
+
+    for start, end, replacement in sorted(edits, reverse=True):
+        lines[start - 1 : end] = replacement
+
+    return '\n'.join(lines) + '\n'
+
+
+def _slim_statement(node: ast.stmt, lines: List[str], edits: List[_Edit]) -> None:
+    if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and _is_overload(node):
+        edits.append((_first_line(node), _last_line(node), []))
+        return
+
+    if isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+        body = node.body
+        docstring = _docstring(body, lines)
+        if docstring is not None:
+            if len(body) == 1:
+                indent = ' ' * docstring.col_offset
+                edits.append((docstring.lineno, _last_line(docstring), [f'{indent}...']))
+                return
+
+            edits.append((docstring.lineno, _last_line(docstring), []))
+            body = body[1:]
+
+        for child in body:
+            _slim_statement(child, lines, edits)
+    elif isinstance(node, ast.If):
+        for child in (*node.body, *node.orelse):
+            _slim_statement(child, lines, edits)
+
+
+def _typed_dict_name(node: ast.stmt, typed_dicts: Set[str]) -> Optional[str]:
+    if isinstance(node, ast.ClassDef):
+        if node.decorator_list:
+            return None
+
+        for base in node.bases:
+            if isinstance(base, ast.Name) and (base.id == 'TypedDict' or base.id in typed_dicts):
+                return node.name
+
+        return None
+
+    # functional syntax, e.g. `StringFilter = TypedDict('StringFilter', {...}, total=False)`
+    if (
+        isinstance(node, ast.Assign)
+        and len(node.targets) == 1
+        and isinstance(node.targets[0], ast.Name)
+        and isinstance(node.value, ast.Call)
+        and isinstance(node.value.func, ast.Name)
+        and node.value.func.id == 'TypedDict'
+    ):
+        return node.targets[0].id
+
+    return None
+
+
+def _is_overload(node: _FunctionDef) -> bool:
+    for decorator in node.decorator_list:
+        if isinstance(decorator, ast.Name) and decorator.id == 'overload':
+            return True
+    return False
+
+
+def _docstring(body: List[ast.stmt], lines: List[str]) -> Optional[ast.Expr]:
+    if not body:
+        return None
+
+    node = body[0]
+    if not (
+        isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant) and isinstance(node.value.value, str)
+    ):
+        return None
+
+    # only docstrings on their own lines can be removed without rewriting the surrounding code
+    if lines[node.lineno - 1][: node.col_offset].strip():
+        return None
+
+    return node
+
+
+def _first_line(node: ast.stmt) -> int:
+    decorators = getattr(node, 'decorator_list', [])
+    return min([node.lineno, *(decorator.lineno for decorator in decorators)])
+
+
+def _last_line(node: ast.AST) -> int:
+    end_lineno = getattr(node, 'end_lineno', None)
+    assert end_lineno is not None, 'end_lineno should be available on Python 3.8+'
+    return end_lineno
@@ -8,6 +8,7 @@ from typing import (
     TypeVar,
     Generic,
     Optional,
+    Callable,
     cast,
 )
 
@@ -28,6 +29,9 @@ DEFAULT_CONFIG: Dict[str, Any] = {
     'timeout': Timeout(30),
 }
 
+# connection options a custom transport has to be given, the client ignores them once it has one
+TRANSPORT_OPTIONS = ('verify', 'cert', 'http1', 'http2', 'limits', 'trust_env')
+
 
 class AbstractHTTP(ABC, Generic[Session, Response]):
     session_kwargs: Dict[str, Any]
@@ -35,20 +39,33 @@ class AbstractHTTP(ABC, Generic[Session, Response]):
     __slots__ = (
         '_session',
         'session_kwargs',
+        'uds',
     )
 
     # NOTE: ParamSpec wouldn't be valid here:
     # https://github.com/microsoft/pyright/issues/2667
-    def __init__(self, **kwargs: Any) -> None:
+    def __init__(self, *, uds: Optional[str] = None, **kwargs: Any) -> None:
         # NoneType = not used yet
         # None = closed
         # Session = open
         self._session: Optional[Union[Session, Type[_NoneType]]] = _NoneType
+        self.uds = uds
         self.session_kwargs = {
             **DEFAULT_CONFIG,
             **kwargs,
         }
 
+    def _client_kwargs(self, transport: Callable[..., Any]) -> Dict[str, Any]:
+        """Keyword arguments for the httpx client, connecting through the `uds` unix socket if set"""
+        if self.uds is None:
+            return self.session_kwargs
+
+        options = {key: self.session_kwargs[key] for key in TRANSPORT_OPTIONS if key in self.session_kwargs}
+        return {
+            **self.session_kwargs,
+            'transport': transport(uds=self.uds, **options),
+        }
+
     @abstractmethod
     def download(self, url: str, dest: str) -> MaybeCoroutine[None]:
         ...
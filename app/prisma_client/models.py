@@ -46,11 +46,11 @@ from collections import OrderedDict
 
 from pydantic import BaseModel, Field
 
-from . import types, enums, errors, fields, bases
+from . import enums, errors, fields, bases
 from ._types import FuncType
 from ._compat import model_rebuild, field_validator
 from .builder import serialize_base64
-from .generator import partial_models_ctx, PartialModelField
+from .generator.types import PartialModelField
 
 
 log: logging.Logger = logging.getLogger(__name__)
@@ -180,6 +180,9 @@ class User(bases.BaseUser):
                 f'{exc.args[0]} is not a valid User / {name} field.'
             ) from None
 
+        # only called by partial type generators, avoid importing the generator at runtime
+        from .generator import partial_models_ctx
+
         models = partial_models_ctx.get()
         models.append(
             {
@@ -208,6 +211,7 @@ class Judgment(bases.BaseJudgment):
     user: Optional['models.User'] = None
     suspects: Optional[List['models.Suspect']] = None
     blame: Optional['models.Blame'] = None
+    jobs: Optional[List['models.AnalysisJob']] = None
 
     # take *args and **kwargs so that other metaclasses can define arguments
     def __init_subclass__(
@@ -321,6 +325,9 @@ class Judgment(bases.BaseJudgment):
                 f'{exc.args[0]} is not a valid Judgment / {name} field.'
             ) from None
 
+        # only called by partial type generators, avoid importing the generator at runtime
+        from .generator import partial_models_ctx
+
         models = partial_models_ctx.get()
         models.append(
             {
@@ -458,6 +465,9 @@ class Suspect(bases.BaseSuspect):
                 f'{exc.args[0]} is not a valid Suspect / {name} field.'
             ) from None
 
+        # only called by partial type generators, avoid importing the generator at runtime
+        from .generator import partial_models_ctx
+
         models = partial_models_ctx.get()
         models.append(
             {
@@ -478,7 +488,7 @@ class Blame(bases.BaseBlame):
     target_avatar: Optional[_str] = None
     responsibility: _int
     reason: Optional[_str] = None
-    message: Optional[_str] = None
+    message: Optional['fields.Json'] = None
     intensity: _str
     image_url: Optional[_str] = None
     created_at: datetime.datetime
@@ -596,6 +606,9 @@ class Blame(bases.BaseBlame):
                 f'{exc.args[0]} is not a valid Blame / {name} field.'
             ) from None
 
+        # only called by partial type generators, avoid importing the generator at runtime
+        from .generator import partial_models_ctx
+
         models = partial_models_ctx.get()
         models.append(
             {
@@ -607,6 +620,148 @@ class Blame(bases.BaseBlame):
         _created_partial_types.add(name)
 
 
+class AnalysisJob(bases.BaseAnalysisJob):
+    """Represents a AnalysisJob record"""
+
+    id: _str
+    judgment_id: _str
+    user_id: _str
+    status: _str
+    attempts: _int
+    max_attempts: _int
+    run_at: datetime.datetime
+    locked_until: Optional[datetime.datetime] = None
+    last_error: Optional[_str] = None
+    created_at: datetime.datetime
+    updated_at: datetime.datetime
+    judgment: Optional['models.Judgment'] = None
+
+    # take *args and **kwargs so that other metaclasses can define arguments
+    def __init_subclass__(
+        cls,
+        *args: Any,
+        warn_subclass: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init_subclass__()
+        if warn_subclass is not None:
+            warnings.warn(
+                'The `warn_subclass` argument is deprecated as it is no longer necessary and will be removed in the next release',
+                DeprecationWarning,
+                stacklevel=3,
+            )
+
+
+    @staticmethod
+    def create_partial(
+        name: str,
+        include: Optional[Iterable['types.AnalysisJobKeys']] = None,
+        exclude: Optional[Iterable['types.AnalysisJobKeys']] = None,
+        required: Optional[Iterable['types.AnalysisJobKeys']] = None,
+        optional: Optional[Iterable['types.AnalysisJobKeys']] = None,
+        relations: Optional[Mapping['types.AnalysisJobRelationalFieldKeys', str]] = None,
+        exclude_relational_fields: bool = False,
+    ) -> None:
+        if not os.environ.get('PRISMA_GENERATOR_INVOCATION'):
+            raise RuntimeError(
+                'Attempted to create a partial type outside of client generation.'
+            )
+
+        if name in _created_partial_types:
+            raise ValueError(f'Partial type "{name}" has already been created.')
+
+        if include is not None:
+            if exclude is not None:
+                raise TypeError('Exclude and include are mutually exclusive.')
+            if exclude_relational_fields is True:
+                raise TypeError('Include and exclude_relational_fields=True are mutually exclusive.')
+
+        if required and optional:
+            shared = set(required) & set(optional)
+            if shared:
+                raise ValueError(f'Cannot make the same field(s) required and optional {shared}')
+
+        if exclude_relational_fields and relations:
+            raise ValueError(
+                'exclude_relational_fields and relations are mutually exclusive'
+            )
+
+        fields: Dict['types.AnalysisJobKeys', PartialModelField] = OrderedDict()
+
+        try:
+            if include:
+                for field in include:
+                    fields[field] = _AnalysisJob_fields[field].copy()
+            elif exclude:
+                for field in exclude:
+                    if field not in _AnalysisJob_fields:
+                        raise KeyError(field)
+
+                fields = {
+                    key: data.copy()
+                    for key, data in _AnalysisJob_fields.items()
+                    if key not in exclude
+                }
+            else:
+                fields = {
+                    key: data.copy()
+                    for key, data in _AnalysisJob_fields.items()
+                }
+
+            if required:
+                for field in required:
+                    fields[field]['optional'] = False
+
+            if optional:
+                for field in optional:
+                    fields[field]['optional'] = True
+
+            if exclude_relational_fields:
+                fields = {
+                    key: data
+                    for key, data in fields.items()
+                    if key not in _AnalysisJob_relational_fields
+                }
+
+            if relations:
+                for field, type_ in relations.items():
+                    if field not in _AnalysisJob_relational_fields:
+                        raise errors.UnknownRelationalFieldError('AnalysisJob', field)
+
+                    # TODO: this method of validating types is not ideal
+                    # as it means we cannot two create partial types that
+                    # reference each other
+                    if type_ not in _created_partial_types:
+                        raise ValueError(
+                            f'Unknown partial type: "{type_}". '
+                            f'Did you remember to generate the {type_} type before this one?'
+                        )
+
+                    # TODO: support non prisma.partials models
+                    info = fields[field]
+                    if info['is_list']:
+                        info['type'] = f'List[\'partials.{type_}\']'
+                    else:
+                        info['type'] = f'\'partials.{type_}\''
+        except KeyError as exc:
+            raise ValueError(
+                f'{exc.args[0]} is not a valid AnalysisJob / {name} field.'
+            ) from None
+
+        # only called by partial type generators, avoid importing the generator at runtime
+        from .generator import partial_models_ctx
+
+        models = partial_models_ctx.get()
+        models.append(
+            {
+                'name': name,
+                'fields': cast(Mapping[str, PartialModelField], fields),
+                'from_model': 'AnalysisJob',
+            }
+        )
+        _created_partial_types.add(name)
+
+
 
 _User_relational_fields: Set[str] = {
         'judgments',
@@ -684,6 +839,7 @@ _Judgment_relational_fields: Set[str] = {
         'user',
         'suspects',
         'blame',
+        'jobs',
     }
 _Judgment_fields: Dict['types.JudgmentKeys', PartialModelField] = OrderedDict(
     [
@@ -799,6 +955,14 @@ _Judgment_fields: Dict['types.JudgmentKeys', PartialModelField] = OrderedDict(
             'is_relational': True,
             'documentation': None,
         }),
+        ('jobs', {
+            'name': 'jobs',
+            'is_list': True,
+            'optional': True,
+            'type': 'List[\'models.AnalysisJob\']',
+            'is_relational': True,
+            'documentation': None,
+        }),
     ],
 )
 
@@ -947,7 +1111,7 @@ _Blame_fields: Dict['types.BlameKeys', PartialModelField] = OrderedDict(
             'name': 'message',
             'is_list': False,
             'optional': True,
-            'type': '_str',
+            'type': 'fields.Json',
             'is_relational': False,
             'documentation': None,
         }),
@@ -986,6 +1150,110 @@ _Blame_fields: Dict['types.BlameKeys', PartialModelField] = OrderedDict(
     ],
 )
 
+_AnalysisJob_relational_fields: Set[str] = {
+        'judgment',
+    }
+_AnalysisJob_fields: Dict['types.AnalysisJobKeys', PartialModelField] = OrderedDict(
+    [
+        ('id', {
+            'name': 'id',
+            'is_list': False,
+            'optional': False,
+            'type': '_str',
+            'is_relational': False,
+            'documentation': None,
+        }),
+        ('judgment_id', {
+            'name': 'judgment_id',
+            'is_list': False,
+            'optional': False,
+            'type': '_str',
+            'is_relational': False,
+            'documentation': None,
+        }),
+        ('user_id', {
+            'name': 'user_id',
+            'is_list': False,
+            'optional': False,
+            'type': '_str',
+            'is_relational': False,
+            'documentation': None,
+        }),
+        ('status', {
+            'name': 'status',
+            'is_list': False,
+            'optional': False,
+            'type': '_str',
+            'is_relational': False,
+            'documentation': None,
+        }),
+        ('attempts', {
+            'name': 'attempts',
+            'is_list': False,
+            'optional': False,
+            'type': '_int',
+            'is_relational': False,
+            'documentation': None,
+        }),
+        ('max_attempts', {
+            'name': 'max_attempts',
+            'is_list': False,
+            'optional': False,
+            'type': '_int',
+            'is_relational': False,
+            'documentation': None,
+        }),
+        ('run_at', {
+            'name': 'run_at',
+            'is_list': False,
+            'optional': False,
+            'type': 'datetime.datetime',
+            'is_relational': False,
+            'documentation': None,
+        }),
+        ('locked_until', {
+            'name': 'locked_until',
+            'is_list': False,
+            'optional': True,
+            'type': 'datetime.datetime',
+            'is_relational': False,
+            'documentation': None,
+        }),
+        ('last_error', {
+            'name': 'last_error',
+            'is_list': False,
+            'optional': True,
+            'type': '_str',
+            'is_relational': False,
+            'documentation': None,
+        }),
+        ('created_at', {
+            'name': 'created_at',
+            'is_list': False,
+            'optional': False,
+            'type': 'datetime.datetime',
+            'is_relational': False,
+            'documentation': None,
+        }),
+        ('updated_at', {
+            'name': 'updated_at',
+            'is_list': False,
+            'optional': False,
+            'type': 'datetime.datetime',
+            'is_relational': False,
+            'documentation': None,
+        }),
+        ('judgment', {
+            'name': 'judgment',
+            'is_list': False,
+            'optional': True,
+            'type': 'models.Judgment',
+            'is_relational': True,
+            'documentation': None,
+        }),
+    ],
+)
+
 
 
 # we have to import ourselves as relation types are namespaced to models
@@ -997,3 +1265,4 @@ model_rebuild(User)
 model_rebuild(Judgment)
 model_rebuild(Suspect)
 model_rebuild(Blame)
+model_rebuild(AnalysisJob)
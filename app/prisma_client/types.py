@@ -56,25 +56,15 @@ SortOrder = Literal['asc', 'desc']
 MetricsFormat = Literal['json', 'prometheus']
 
 
-class _DatasourceOverrideOptional(TypedDict, total=False):
-    env: str
-    name: str
+_DatasourceOverrideOptional = dict
 
 
-class DatasourceOverride(_DatasourceOverrideOptional):
-    url: str
+DatasourceOverride = dict
 
 
 # NOTE: we don't support some options as their type hints are not publicly exposed
 # https://github.com/encode/httpx/discussions/1977
-class HttpConfig(TypedDict, total=False):
-    app: Callable[[Mapping[str, Any], Any], Any]
-    http1: bool
-    http2: bool
-    limits: httpx.Limits
-    timeout: Union[None, float, httpx.Timeout]
-    trust_env: bool
-    max_redirects: int
+HttpConfig = dict
 
 
 # types that can be serialized to json by our query builder
@@ -96,656 +86,181 @@ Serializable = Union[
 
     
 
-StringFilter = TypedDict(
-    'StringFilter',
-    {
-        'equals': str,
-        'not_in': List[str],
-        'lt': str,
-        'lte': str,
-        'gt': str,
-        'gte': str,
-        'contains': str,
-        'startswith': str,
-        'endswith': str,
-        'in': List[str],
-        'not': Union[str, 'StringFilterRecursive1'],
-        'mode': SortMode,
-    },
-    total=False,
-)
+StringFilter = dict
 
 
-StringFilterRecursive1 = TypedDict(
-    'StringFilterRecursive1',
-    {
-        'equals': str,
-        'not_in': List[str],
-        'lt': str,
-        'lte': str,
-        'gt': str,
-        'gte': str,
-        'contains': str,
-        'startswith': str,
-        'endswith': str,
-        'in': List[str],
-        'not': Union[str, 'StringFilterRecursive2'],
-        'mode': SortMode,
-    },
-    total=False,
-)
+StringFilterRecursive1 = dict
 
 
-StringFilterRecursive2 = TypedDict(
-    'StringFilterRecursive2',
-    {
-        'equals': str,
-        'not_in': List[str],
-        'lt': str,
-        'lte': str,
-        'gt': str,
-        'gte': str,
-        'contains': str,
-        'startswith': str,
-        'endswith': str,
-        'in': List[str],
-        'not': Union[str, 'StringFilterRecursive3'],
-        'mode': SortMode,
-    },
-    total=False,
-)
+StringFilterRecursive2 = dict
 
 
-StringFilterRecursive3 = TypedDict(
-    'StringFilterRecursive3',
-    {
-        'equals': str,
-        'not_in': List[str],
-        'lt': str,
-        'lte': str,
-        'gt': str,
-        'gte': str,
-        'contains': str,
-        'startswith': str,
-        'endswith': str,
-        'in': List[str],
-        'not': Union[str, 'StringFilterRecursive4'],
-        'mode': SortMode,
-    },
-    total=False,
-)
+StringFilterRecursive3 = dict
 
 
-StringFilterRecursive4 = TypedDict(
-    'StringFilterRecursive4',
-    {
-        'equals': str,
-        'not_in': List[str],
-        'lt': str,
-        'lte': str,
-        'gt': str,
-        'gte': str,
-        'contains': str,
-        'startswith': str,
-        'endswith': str,
-        'in': List[str],
-                'mode': SortMode,
-    },
-    total=False,
-)
+StringFilterRecursive4 = dict
 
 
-class StringWithAggregatesFilter(StringFilter, total=False):
-    _max: 'StringFilter'
-    _min: 'StringFilter'
-    _sum: 'StringFilter'
-    _avg: 'StringFilter'
-    _count: 'IntFilter'
+StringWithAggregatesFilter = dict
 
 
     
 
-DateTimeFilter = TypedDict(
-    'DateTimeFilter',
-    {
-        'equals': datetime.datetime,
-        'not_in': List[datetime.datetime],
-        'lt': datetime.datetime,
-        'lte': datetime.datetime,
-        'gt': datetime.datetime,
-        'gte': datetime.datetime,
-        'in': List[datetime.datetime],
-        'not': Union[datetime.datetime, 'DateTimeFilterRecursive1'],
-    },
-    total=False,
-)
+DateTimeFilter = dict
 
 
-DateTimeFilterRecursive1 = TypedDict(
-    'DateTimeFilterRecursive1',
-    {
-        'equals': datetime.datetime,
-        'not_in': List[datetime.datetime],
-        'lt': datetime.datetime,
-        'lte': datetime.datetime,
-        'gt': datetime.datetime,
-        'gte': datetime.datetime,
-        'in': List[datetime.datetime],
-        'not': Union[datetime.datetime, 'DateTimeFilterRecursive2'],
-    },
-    total=False,
-)
+DateTimeFilterRecursive1 = dict
 
 
-DateTimeFilterRecursive2 = TypedDict(
-    'DateTimeFilterRecursive2',
-    {
-        'equals': datetime.datetime,
-        'not_in': List[datetime.datetime],
-        'lt': datetime.datetime,
-        'lte': datetime.datetime,
-        'gt': datetime.datetime,
-        'gte': datetime.datetime,
-        'in': List[datetime.datetime],
-        'not': Union[datetime.datetime, 'DateTimeFilterRecursive3'],
-    },
-    total=False,
-)
+DateTimeFilterRecursive2 = dict
 
 
-DateTimeFilterRecursive3 = TypedDict(
-    'DateTimeFilterRecursive3',
-    {
-        'equals': datetime.datetime,
-        'not_in': List[datetime.datetime],
-        'lt': datetime.datetime,
-        'lte': datetime.datetime,
-        'gt': datetime.datetime,
-        'gte': datetime.datetime,
-        'in': List[datetime.datetime],
-        'not': Union[datetime.datetime, 'DateTimeFilterRecursive4'],
-    },
-    total=False,
-)
+DateTimeFilterRecursive3 = dict
 
 
-DateTimeFilterRecursive4 = TypedDict(
-    'DateTimeFilterRecursive4',
-    {
-        'equals': datetime.datetime,
-        'not_in': List[datetime.datetime],
-        'lt': datetime.datetime,
-        'lte': datetime.datetime,
-        'gt': datetime.datetime,
-        'gte': datetime.datetime,
-        'in': List[datetime.datetime],
-            },
-    total=False,
-)
+DateTimeFilterRecursive4 = dict
 
 
-class DateTimeWithAggregatesFilter(DateTimeFilter, total=False):
-    _max: 'DateTimeFilter'
-    _min: 'DateTimeFilter'
-    _sum: 'DateTimeFilter'
-    _avg: 'DateTimeFilter'
-    _count: 'IntFilter'
+DateTimeWithAggregatesFilter = dict
 
 
     
 
-BooleanFilter = TypedDict(
-    'BooleanFilter',
-    {
-        'equals': bool,
-        'not': Union[bool, 'BooleanFilterRecursive1'],
-    },
-    total=False,
-)
+BooleanFilter = dict
 
 
-BooleanFilterRecursive1 = TypedDict(
-    'BooleanFilterRecursive1',
-    {
-        'equals': bool,
-        'not': Union[bool, 'BooleanFilterRecursive2'],
-    },
-    total=False,
-)
+BooleanFilterRecursive1 = dict
 
 
-BooleanFilterRecursive2 = TypedDict(
-    'BooleanFilterRecursive2',
-    {
-        'equals': bool,
-        'not': Union[bool, 'BooleanFilterRecursive3'],
-    },
-    total=False,
-)
+BooleanFilterRecursive2 = dict
 
 
-BooleanFilterRecursive3 = TypedDict(
-    'BooleanFilterRecursive3',
-    {
-        'equals': bool,
-        'not': Union[bool, 'BooleanFilterRecursive4'],
-    },
-    total=False,
-)
+BooleanFilterRecursive3 = dict
 
 
-BooleanFilterRecursive4 = TypedDict(
-    'BooleanFilterRecursive4',
-    {
-        'equals': bool,
-            },
-    total=False,
-)
+BooleanFilterRecursive4 = dict
 
 
-class BooleanWithAggregatesFilter(BooleanFilter, total=False):
-    _max: 'BooleanFilter'
-    _min: 'BooleanFilter'
-    _sum: 'BooleanFilter'
-    _avg: 'BooleanFilter'
-    _count: 'IntFilter'
+BooleanWithAggregatesFilter = dict
 
 
     
 
-IntFilter = TypedDict(
-    'IntFilter',
-    {
-        'equals': int,
-        'not_in': List[int],
-        'lt': int,
-        'lte': int,
-        'gt': int,
-        'gte': int,
-        'in': List[int],
-        'not': Union[int, 'IntFilterRecursive1'],
-    },
-    total=False,
-)
+IntFilter = dict
 
 
-IntFilterRecursive1 = TypedDict(
-    'IntFilterRecursive1',
-    {
-        'equals': int,
-        'not_in': List[int],
-        'lt': int,
-        'lte': int,
-        'gt': int,
-        'gte': int,
-        'in': List[int],
-        'not': Union[int, 'IntFilterRecursive2'],
-    },
-    total=False,
-)
+IntFilterRecursive1 = dict
 
 
-IntFilterRecursive2 = TypedDict(
-    'IntFilterRecursive2',
-    {
-        'equals': int,
-        'not_in': List[int],
-        'lt': int,
-        'lte': int,
-        'gt': int,
-        'gte': int,
-        'in': List[int],
-        'not': Union[int, 'IntFilterRecursive3'],
-    },
-    total=False,
-)
+IntFilterRecursive2 = dict
 
 
-IntFilterRecursive3 = TypedDict(
-    'IntFilterRecursive3',
-    {
-        'equals': int,
-        'not_in': List[int],
-        'lt': int,
-        'lte': int,
-        'gt': int,
-        'gte': int,
-        'in': List[int],
-        'not': Union[int, 'IntFilterRecursive4'],
-    },
-    total=False,
-)
+IntFilterRecursive3 = dict
 
 
-IntFilterRecursive4 = TypedDict(
-    'IntFilterRecursive4',
-    {
-        'equals': int,
-        'not_in': List[int],
-        'lt': int,
-        'lte': int,
-        'gt': int,
-        'gte': int,
-        'in': List[int],
-            },
-    total=False,
-)
+IntFilterRecursive4 = dict
 
 
-class IntWithAggregatesFilter(IntFilter, total=False):
-    _max: 'IntFilter'
-    _min: 'IntFilter'
-    _sum: 'IntFilter'
-    _avg: 'IntFilter'
-    _count: 'IntFilter'
+IntWithAggregatesFilter = dict
 
 
 BigIntFilter = IntFilter
 BigIntWithAggregatesFilter = IntWithAggregatesFilter
     
 
-FloatFilter = TypedDict(
-    'FloatFilter',
-    {
-        'equals': float,
-        'not_in': List[float],
-        'lt': float,
-        'lte': float,
-        'gt': float,
-        'gte': float,
-        'in': List[float],
-        'not': Union[float, 'FloatFilterRecursive1'],
-    },
-    total=False,
-)
+FloatFilter = dict
 
 
-FloatFilterRecursive1 = TypedDict(
-    'FloatFilterRecursive1',
-    {
-        'equals': float,
-        'not_in': List[float],
-        'lt': float,
-        'lte': float,
-        'gt': float,
-        'gte': float,
-        'in': List[float],
-        'not': Union[float, 'FloatFilterRecursive2'],
-    },
-    total=False,
-)
+FloatFilterRecursive1 = dict
 
 
-FloatFilterRecursive2 = TypedDict(
-    'FloatFilterRecursive2',
-    {
-        'equals': float,
-        'not_in': List[float],
-        'lt': float,
-        'lte': float,
-        'gt': float,
-        'gte': float,
-        'in': List[float],
-        'not': Union[float, 'FloatFilterRecursive3'],
-    },
-    total=False,
-)
+FloatFilterRecursive2 = dict
 
 
-FloatFilterRecursive3 = TypedDict(
-    'FloatFilterRecursive3',
-    {
-        'equals': float,
-        'not_in': List[float],
-        'lt': float,
-        'lte': float,
-        'gt': float,
-        'gte': float,
-        'in': List[float],
-        'not': Union[float, 'FloatFilterRecursive4'],
-    },
-    total=False,
-)
+FloatFilterRecursive3 = dict
 
 
-FloatFilterRecursive4 = TypedDict(
-    'FloatFilterRecursive4',
-    {
-        'equals': float,
-        'not_in': List[float],
-        'lt': float,
-        'lte': float,
-        'gt': float,
-        'gte': float,
-        'in': List[float],
-            },
-    total=False,
-)
+FloatFilterRecursive4 = dict
 
 
-class FloatWithAggregatesFilter(FloatFilter, total=False):
-    _max: 'FloatFilter'
-    _min: 'FloatFilter'
-    _sum: 'FloatFilter'
-    _avg: 'FloatFilter'
-    _count: 'IntFilter'
+FloatWithAggregatesFilter = dict
 
 
     
 
-BytesFilter = TypedDict(
-    'BytesFilter',
-    {
-        'equals': 'fields.Base64',
-        'in': List['fields.Base64'],
-        'not_in': List['fields.Base64'],
-        'not': Union['fields.Base64', 'BytesFilterRecursive1'],
-    },
-    total=False,
-)
+BytesFilter = dict
 
 
-BytesFilterRecursive1 = TypedDict(
-    'BytesFilterRecursive1',
-    {
-        'equals': 'fields.Base64',
-        'in': List['fields.Base64'],
-        'not_in': List['fields.Base64'],
-        'not': Union['fields.Base64', 'BytesFilterRecursive2'],
-    },
-    total=False,
-)
+BytesFilterRecursive1 = dict
 
 
-BytesFilterRecursive2 = TypedDict(
-    'BytesFilterRecursive2',
-    {
-        'equals': 'fields.Base64',
-        'in': List['fields.Base64'],
-        'not_in': List['fields.Base64'],
-        'not': Union['fields.Base64', 'BytesFilterRecursive3'],
-    },
-    total=False,
-)
+BytesFilterRecursive2 = dict
 
 
-BytesFilterRecursive3 = TypedDict(
-    'BytesFilterRecursive3',
-    {
-        'equals': 'fields.Base64',
-        'in': List['fields.Base64'],
-        'not_in': List['fields.Base64'],
-        'not': Union['fields.Base64', 'BytesFilterRecursive4'],
-    },
-    total=False,
-)
+BytesFilterRecursive3 = dict
 
 
-BytesFilterRecursive4 = TypedDict(
-    'BytesFilterRecursive4',
-    {
-        'equals': 'fields.Base64',
-        'in': List['fields.Base64'],
-        'not_in': List['fields.Base64'],
-            },
-    total=False,
-)
+BytesFilterRecursive4 = dict
 
 
-class BytesWithAggregatesFilter(BytesFilter, total=False):
-    _max: 'BytesFilter'
-    _min: 'BytesFilter'
-    _sum: 'BytesFilter'
-    _avg: 'BytesFilter'
-    _count: 'IntFilter'
+BytesWithAggregatesFilter = dict
 
 
 # TODO: preview feature for improving JSON filtering
-JsonFilter = TypedDict(
-    'JsonFilter',
-    {
-        'equals': 'fields.Json',
-        'not': 'fields.Json',
-    },
-    total=False,
-)
+JsonFilter = dict
 
 
-class JsonWithAggregatesFilter(JsonFilter, total=False):
-    _max: 'JsonFilter'
-    _min: 'JsonFilter'
-    _sum: 'JsonFilter'
-    _avg: 'JsonFilter'
-    _count: 'IntFilter'
+JsonWithAggregatesFilter = dict
 
 
     
 
-DecimalFilter = TypedDict(
-    'DecimalFilter',
-    {
-        'equals': decimal.Decimal,
-        'not_in': List[decimal.Decimal],
-        'lt': decimal.Decimal,
-        'lte': decimal.Decimal,
-        'gt': decimal.Decimal,
-        'gte': decimal.Decimal,
-        'in': List[decimal.Decimal],
-        'not': Union[decimal.Decimal, 'DecimalFilterRecursive1'],
-    },
-    total=False,
-)
+DecimalFilter = dict
 
 
-DecimalFilterRecursive1 = TypedDict(
-    'DecimalFilterRecursive1',
-    {
-        'equals': decimal.Decimal,
-        'not_in': List[decimal.Decimal],
-        'lt': decimal.Decimal,
-        'lte': decimal.Decimal,
-        'gt': decimal.Decimal,
-        'gte': decimal.Decimal,
-        'in': List[decimal.Decimal],
-        'not': Union[decimal.Decimal, 'DecimalFilterRecursive2'],
-    },
-    total=False,
-)
+DecimalFilterRecursive1 = dict
 
 
-DecimalFilterRecursive2 = TypedDict(
-    'DecimalFilterRecursive2',
-    {
-        'equals': decimal.Decimal,
-        'not_in': List[decimal.Decimal],
-        'lt': decimal.Decimal,
-        'lte': decimal.Decimal,
-        'gt': decimal.Decimal,
-        'gte': decimal.Decimal,
-        'in': List[decimal.Decimal],
-        'not': Union[decimal.Decimal, 'DecimalFilterRecursive3'],
-    },
-    total=False,
-)
+DecimalFilterRecursive2 = dict
 
 
-DecimalFilterRecursive3 = TypedDict(
-    'DecimalFilterRecursive3',
-    {
-        'equals': decimal.Decimal,
-        'not_in': List[decimal.Decimal],
-        'lt': decimal.Decimal,
-        'lte': decimal.Decimal,
-        'gt': decimal.Decimal,
-        'gte': decimal.Decimal,
-        'in': List[decimal.Decimal],
-        'not': Union[decimal.Decimal, 'DecimalFilterRecursive4'],
-    },
-    total=False,
-)
+DecimalFilterRecursive3 = dict
 
 
-DecimalFilterRecursive4 = TypedDict(
-    'DecimalFilterRecursive4',
-    {
-        'equals': decimal.Decimal,
-        'not_in': List[decimal.Decimal],
-        'lt': decimal.Decimal,
-        'lte': decimal.Decimal,
-        'gt': decimal.Decimal,
-        'gte': decimal.Decimal,
-        'in': List[decimal.Decimal],
-            },
-    total=False,
-)
+DecimalFilterRecursive4 = dict
 
 
-class DecimalWithAggregatesFilter(StringFilter, total=False):
-    _max: 'DecimalFilter'
-    _min: 'DecimalFilter'
-    _sum: 'DecimalFilter'
-    _avg: 'DecimalFilter'
-    _count: 'IntFilter'
+DecimalWithAggregatesFilter = dict
 
 
-class _FloatSetInput(TypedDict):
-    set: float
+_FloatSetInput = dict
 
 
-class _FloatDivideInput(TypedDict):
-    divide: float
+_FloatDivideInput = dict
 
 
-class _FloatMultiplyInput(TypedDict):
-    multiply: float
+_FloatMultiplyInput = dict
 
 
-class _FloatIncrementInput(TypedDict):
-    increment: float
+_FloatIncrementInput = dict
 
 
-class _FloatDecrementInput(TypedDict):
-    decrement: float
+_FloatDecrementInput = dict
 
 
-class _IntSetInput(TypedDict):
-    set: int
+_IntSetInput = dict
 
 
-class _IntDivideInput(TypedDict):
-    divide: int
+_IntDivideInput = dict
 
 
-class _IntMultiplyInput(TypedDict):
-    multiply: int
+_IntMultiplyInput = dict
 
 
-class _IntIncrementInput(TypedDict):
-    increment: int
+_IntIncrementInput = dict
 
 
-class _IntDecrementInput(TypedDict):
-    decrement: int
+_IntDecrementInput = dict
 
 
 AtomicFloatInput = Union[
@@ -764,24 +279,19 @@ AtomicIntInput = Union[
 ]
 AtomicBigIntInput = AtomicIntInput
 
-class _StringListFilterEqualsInput(TypedDict):
-    equals: Optional[List[_str]]
+_StringListFilterEqualsInput = dict
 
 
-class _StringListFilterHasInput(TypedDict):
-    has: _str
+_StringListFilterHasInput = dict
 
 
-class _StringListFilterHasEveryInput(TypedDict):
-    has_every: List[_str]
+_StringListFilterHasEveryInput = dict
 
 
-class _StringListFilterHasSomeInput(TypedDict):
-    has_some: List[_str]
+_StringListFilterHasSomeInput = dict
 
 
-class _StringListFilterIsEmptyInput(TypedDict):
-    is_empty: bool
+_StringListFilterIsEmptyInput = dict
 
 
 StringListFilter = Union[
@@ -793,12 +303,10 @@ StringListFilter = Union[
 ]
 
 
-class _StringListUpdateSet(TypedDict):
-    set: List[_str]
+_StringListUpdateSet = dict
 
 
-class _StringListUpdatePush(TypedDict):
-    push: List[_str]
+_StringListUpdatePush = dict
 
 
 StringListUpdate = Union[
@@ -807,24 +315,19 @@ StringListUpdate = Union[
     _StringListUpdatePush,
 ]
 
-class _BytesListFilterEqualsInput(TypedDict):
-    equals: Optional[List['fields.Base64']]
+_BytesListFilterEqualsInput = dict
 
 
-class _BytesListFilterHasInput(TypedDict):
-    has: 'fields.Base64'
+_BytesListFilterHasInput = dict
 
 
-class _BytesListFilterHasEveryInput(TypedDict):
-    has_every: List['fields.Base64']
+_BytesListFilterHasEveryInput = dict
 
 
-class _BytesListFilterHasSomeInput(TypedDict):
-    has_some: List['fields.Base64']
+_BytesListFilterHasSomeInput = dict
 
 
-class _BytesListFilterIsEmptyInput(TypedDict):
-    is_empty: bool
+_BytesListFilterIsEmptyInput = dict
 
 
 BytesListFilter = Union[
@@ -836,12 +339,10 @@ BytesListFilter = Union[
 ]
 
 
-class _BytesListUpdateSet(TypedDict):
-    set: List['fields.Base64']
+_BytesListUpdateSet = dict
 
 
-class _BytesListUpdatePush(TypedDict):
-    push: List['fields.Base64']
+_BytesListUpdatePush = dict
 
 
 BytesListUpdate = Union[
@@ -850,24 +351,19 @@ BytesListUpdate = Union[
     _BytesListUpdatePush,
 ]
 
-class _DateTimeListFilterEqualsInput(TypedDict):
-    equals: Optional[List[datetime.datetime]]
+_DateTimeListFilterEqualsInput = dict
 
 
-class _DateTimeListFilterHasInput(TypedDict):
-    has: datetime.datetime
+_DateTimeListFilterHasInput = dict
 
 
-class _DateTimeListFilterHasEveryInput(TypedDict):
-    has_every: List[datetime.datetime]
+_DateTimeListFilterHasEveryInput = dict
 
 
-class _DateTimeListFilterHasSomeInput(TypedDict):
-    has_some: List[datetime.datetime]
+_DateTimeListFilterHasSomeInput = dict
 
 
-class _DateTimeListFilterIsEmptyInput(TypedDict):
-    is_empty: bool
+_DateTimeListFilterIsEmptyInput = dict
 
 
 DateTimeListFilter = Union[
@@ -879,12 +375,10 @@ DateTimeListFilter = Union[
 ]
 
 
-class _DateTimeListUpdateSet(TypedDict):
-    set: List[datetime.datetime]
+_DateTimeListUpdateSet = dict
 
 
-class _DateTimeListUpdatePush(TypedDict):
-    push: List[datetime.datetime]
+_DateTimeListUpdatePush = dict
 
 
 DateTimeListUpdate = Union[
@@ -893,24 +387,19 @@ DateTimeListUpdate = Union[
     _DateTimeListUpdatePush,
 ]
 
-class _BooleanListFilterEqualsInput(TypedDict):
-    equals: Optional[List[_bool]]
+_BooleanListFilterEqualsInput = dict
 
 
-class _BooleanListFilterHasInput(TypedDict):
-    has: _bool
+_BooleanListFilterHasInput = dict
 
 
-class _BooleanListFilterHasEveryInput(TypedDict):
-    has_every: List[_bool]
+_BooleanListFilterHasEveryInput = dict
 
 
-class _BooleanListFilterHasSomeInput(TypedDict):
-    has_some: List[_bool]
+_BooleanListFilterHasSomeInput = dict
 
 
-class _BooleanListFilterIsEmptyInput(TypedDict):
-    is_empty: bool
+_BooleanListFilterIsEmptyInput = dict
 
 
 BooleanListFilter = Union[
@@ -922,12 +411,10 @@ BooleanListFilter = Union[
 ]
 
 
-class _BooleanListUpdateSet(TypedDict):
-    set: List[_bool]
+_BooleanListUpdateSet = dict
 
 
-class _BooleanListUpdatePush(TypedDict):
-    push: List[_bool]
+_BooleanListUpdatePush = dict
 
 
 BooleanListUpdate = Union[
@@ -936,24 +423,19 @@ BooleanListUpdate = Union[
     _BooleanListUpdatePush,
 ]
 
-class _IntListFilterEqualsInput(TypedDict):
-    equals: Optional[List[_int]]
+_IntListFilterEqualsInput = dict
 
 
-class _IntListFilterHasInput(TypedDict):
-    has: _int
+_IntListFilterHasInput = dict
 
 
-class _IntListFilterHasEveryInput(TypedDict):
-    has_every: List[_int]
+_IntListFilterHasEveryInput = dict
 
 
-class _IntListFilterHasSomeInput(TypedDict):
-    has_some: List[_int]
+_IntListFilterHasSomeInput = dict
 
 
-class _IntListFilterIsEmptyInput(TypedDict):
-    is_empty: bool
+_IntListFilterIsEmptyInput = dict
 
 
 IntListFilter = Union[
@@ -965,12 +447,10 @@ IntListFilter = Union[
 ]
 
 
-class _IntListUpdateSet(TypedDict):
-    set: List[_int]
+_IntListUpdateSet = dict
 
 
-class _IntListUpdatePush(TypedDict):
-    push: List[_int]
+_IntListUpdatePush = dict
 
 
 IntListUpdate = Union[
@@ -979,24 +459,19 @@ IntListUpdate = Union[
     _IntListUpdatePush,
 ]
 
-class _BigIntListFilterEqualsInput(TypedDict):
-    equals: Optional[List[_int]]
+_BigIntListFilterEqualsInput = dict
 
 
-class _BigIntListFilterHasInput(TypedDict):
-    has: _int
+_BigIntListFilterHasInput = dict
 
 
-class _BigIntListFilterHasEveryInput(TypedDict):
-    has_every: List[_int]
+_BigIntListFilterHasEveryInput = dict
 
 
-class _BigIntListFilterHasSomeInput(TypedDict):
-    has_some: List[_int]
+_BigIntListFilterHasSomeInput = dict
 
 
-class _BigIntListFilterIsEmptyInput(TypedDict):
-    is_empty: bool
+_BigIntListFilterIsEmptyInput = dict
 
 
 BigIntListFilter = Union[
@@ -1008,12 +483,10 @@ BigIntListFilter = Union[
 ]
 
 
-class _BigIntListUpdateSet(TypedDict):
-    set: List[_int]
+_BigIntListUpdateSet = dict
 
 
-class _BigIntListUpdatePush(TypedDict):
-    push: List[_int]
+_BigIntListUpdatePush = dict
 
 
 BigIntListUpdate = Union[
@@ -1022,24 +495,19 @@ BigIntListUpdate = Union[
     _BigIntListUpdatePush,
 ]
 
-class _FloatListFilterEqualsInput(TypedDict):
-    equals: Optional[List[_float]]
+_FloatListFilterEqualsInput = dict
 
 
-class _FloatListFilterHasInput(TypedDict):
-    has: _float
+_FloatListFilterHasInput = dict
 
 
-class _FloatListFilterHasEveryInput(TypedDict):
-    has_every: List[_float]
+_FloatListFilterHasEveryInput = dict
 
 
-class _FloatListFilterHasSomeInput(TypedDict):
-    has_some: List[_float]
+_FloatListFilterHasSomeInput = dict
 
 
-class _FloatListFilterIsEmptyInput(TypedDict):
-    is_empty: bool
+_FloatListFilterIsEmptyInput = dict
 
 
 FloatListFilter = Union[
@@ -1051,12 +519,10 @@ FloatListFilter = Union[
 ]
 
 
-class _FloatListUpdateSet(TypedDict):
-    set: List[_float]
+_FloatListUpdateSet = dict
 
 
-class _FloatListUpdatePush(TypedDict):
-    push: List[_float]
+_FloatListUpdatePush = dict
 
 
 FloatListUpdate = Union[
@@ -1065,24 +531,19 @@ FloatListUpdate = Union[
     _FloatListUpdatePush,
 ]
 
-class _JsonListFilterEqualsInput(TypedDict):
-    equals: Optional[List['fields.Json']]
+_JsonListFilterEqualsInput = dict
 
 
-class _JsonListFilterHasInput(TypedDict):
-    has: 'fields.Json'
+_JsonListFilterHasInput = dict
 
 
-class _JsonListFilterHasEveryInput(TypedDict):
-    has_every: List['fields.Json']
+_JsonListFilterHasEveryInput = dict
 
 
-class _JsonListFilterHasSomeInput(TypedDict):
-    has_some: List['fields.Json']
+_JsonListFilterHasSomeInput = dict
 
 
-class _JsonListFilterIsEmptyInput(TypedDict):
-    is_empty: bool
+_JsonListFilterIsEmptyInput = dict
 
 
 JsonListFilter = Union[
@@ -1094,12 +555,10 @@ JsonListFilter = Union[
 ]
 
 
-class _JsonListUpdateSet(TypedDict):
-    set: List['fields.Json']
+_JsonListUpdateSet = dict
 
 
-class _JsonListUpdatePush(TypedDict):
-    push: List['fields.Json']
+_JsonListUpdatePush = dict
 
 
 JsonListUpdate = Union[
@@ -1108,24 +567,19 @@ JsonListUpdate = Union[
     _JsonListUpdatePush,
 ]
 
-class _DecimalListFilterEqualsInput(TypedDict):
-    equals: Optional[List[decimal.Decimal]]
+_DecimalListFilterEqualsInput = dict
 
 
-class _DecimalListFilterHasInput(TypedDict):
-    has: decimal.Decimal
+_DecimalListFilterHasInput = dict
 
 
-class _DecimalListFilterHasEveryInput(TypedDict):
-    has_every: List[decimal.Decimal]
+_DecimalListFilterHasEveryInput = dict
 
 
-class _DecimalListFilterHasSomeInput(TypedDict):
-    has_some: List[decimal.Decimal]
+_DecimalListFilterHasSomeInput = dict
 
 
-class _DecimalListFilterIsEmptyInput(TypedDict):
-    is_empty: bool
+_DecimalListFilterIsEmptyInput = dict
 
 
 DecimalListFilter = Union[
@@ -1137,12 +591,10 @@ DecimalListFilter = Union[
 ]
 
 
-class _DecimalListUpdateSet(TypedDict):
-    set: List[decimal.Decimal]
+_DecimalListUpdateSet = dict
 
 
-class _DecimalListUpdatePush(TypedDict):
-    push: List[decimal.Decimal]
+_DecimalListUpdatePush = dict
 
 
 DecimalListUpdate = Union[
@@ -1154,65 +606,30 @@ DecimalListUpdate = Union[
 
 # User types
 
-class UserOptionalCreateInput(TypedDict, total=False):
-    """Optional arguments to the User create method"""
-    id: _str
-    avatar_url: Optional[_str]
-    access_token: Optional[_str]
-    created_at: datetime.datetime
-    updated_at: datetime.datetime
-    judgments: 'JudgmentCreateManyNestedWithoutRelationsInput'
+UserOptionalCreateInput = dict
 
 
-class UserCreateInput(UserOptionalCreateInput):
-    """Required arguments to the User create method"""
-    github_id: _str
-    username: _str
+UserCreateInput = dict
 
 
 # TODO: remove this in favour of without explicit relations
 # e.g. PostCreateWithoutAuthorInput
 
-class UserOptionalCreateWithoutRelationsInput(TypedDict, total=False):
-    """Optional arguments to the User create method, without relations"""
-    id: _str
-    avatar_url: Optional[_str]
-    access_token: Optional[_str]
-    created_at: datetime.datetime
-    updated_at: datetime.datetime
+UserOptionalCreateWithoutRelationsInput = dict
 
 
-class UserCreateWithoutRelationsInput(UserOptionalCreateWithoutRelationsInput):
-    """Required arguments to the User create method, without relations"""
-    github_id: _str
-    username: _str
+UserCreateWithoutRelationsInput = dict
 
 
-class UserCreateNestedWithoutRelationsInput(TypedDict, total=False):
-    create: 'UserCreateWithoutRelationsInput'
-    connect: 'UserWhereUniqueInput'
+UserCreateNestedWithoutRelationsInput = dict
 
 
-class UserCreateManyNestedWithoutRelationsInput(TypedDict, total=False):
-    create: Union['UserCreateWithoutRelationsInput', List['UserCreateWithoutRelationsInput']]
-    connect: Union['UserWhereUniqueInput', List['UserWhereUniqueInput']]
+UserCreateManyNestedWithoutRelationsInput = dict
 
 
-_UserWhereUnique_id_Input = TypedDict(
-    '_UserWhereUnique_id_Input',
-    {
-        'id': '_str',
-    },
-    total=True
-)
+_UserWhereUnique_id_Input = dict
 
-_UserWhereUnique_github_id_Input = TypedDict(
-    '_UserWhereUnique_github_id_Input',
-    {
-        'github_id': '_str',
-    },
-    total=True
-)
+_UserWhereUnique_github_id_Input = dict
 
 UserWhereUniqueInput = Union[
     '_UserWhereUnique_id_Input',
@@ -1220,35 +637,13 @@ UserWhereUniqueInput = Union[
 ]
 
 
-class UserUpdateInput(TypedDict, total=False):
-    """Optional arguments for updating a record"""
-    id: _str
-    github_id: _str
-    username: _str
-    avatar_url: Optional[_str]
-    access_token: Optional[_str]
-    created_at: datetime.datetime
-    updated_at: datetime.datetime
-    judgments: 'JudgmentUpdateManyWithoutRelationsInput'
-
-
-class UserUpdateManyMutationInput(TypedDict, total=False):
-    """Arguments for updating many records"""
-    id: _str
-    github_id: _str
-    username: _str
-    avatar_url: Optional[_str]
-    access_token: Optional[_str]
-    created_at: datetime.datetime
-    updated_at: datetime.datetime
-
-
-class UserUpdateManyWithoutRelationsInput(TypedDict, total=False):
-    create: List['UserCreateWithoutRelationsInput']
-    connect: List['UserWhereUniqueInput']
-    set: List['UserWhereUniqueInput']
-    disconnect: List['UserWhereUniqueInput']
-    delete: List['UserWhereUniqueInput']
+UserUpdateInput = dict
+
+
+UserUpdateManyMutationInput = dict
+
+
+UserUpdateManyWithoutRelationsInput = dict
 
     # TODO
     # update: List['UserUpdateWithWhereUniqueWithoutRelationsInput']
@@ -1258,11 +653,7 @@ class UserUpdateManyWithoutRelationsInput(TypedDict, total=False):
     # connectOrCreate: List['UserCreateOrConnectWithoutRelationsInput']
 
 
-class UserUpdateOneWithoutRelationsInput(TypedDict, total=False):
-    create: 'UserCreateWithoutRelationsInput'
-    connect: 'UserWhereUniqueInput'
-    disconnect: bool
-    delete: bool
+UserUpdateOneWithoutRelationsInput = dict
 
     # TODO
     # update: 'UserUpdateInput'
@@ -1270,66 +661,22 @@ class UserUpdateOneWithoutRelationsInput(TypedDict, total=False):
     # connectOrCreate: 'UserCreateOrConnectWithoutRelationsInput'
 
 
-class UserUpsertInput(TypedDict):
-    create: 'UserCreateInput'
-    update: 'UserUpdateInput'  # pyright: ignore[reportIncompatibleMethodOverride]
+UserUpsertInput = dict
 
 
-_User_id_OrderByInput = TypedDict(
-    '_User_id_OrderByInput',
-    {
-        'id': 'SortOrder',
-    },
-    total=True
-)
+_User_id_OrderByInput = dict
 
-_User_github_id_OrderByInput = TypedDict(
-    '_User_github_id_OrderByInput',
-    {
-        'github_id': 'SortOrder',
-    },
-    total=True
-)
+_User_github_id_OrderByInput = dict
 
-_User_username_OrderByInput = TypedDict(
-    '_User_username_OrderByInput',
-    {
-        'username': 'SortOrder',
-    },
-    total=True
-)
+_User_username_OrderByInput = dict
 
-_User_avatar_url_OrderByInput = TypedDict(
-    '_User_avatar_url_OrderByInput',
-    {
-        'avatar_url': 'SortOrder',
-    },
-    total=True
-)
+_User_avatar_url_OrderByInput = dict
 
-_User_access_token_OrderByInput = TypedDict(
-    '_User_access_token_OrderByInput',
-    {
-        'access_token': 'SortOrder',
-    },
-    total=True
-)
+_User_access_token_OrderByInput = dict
 
-_User_created_at_OrderByInput = TypedDict(
-    '_User_created_at_OrderByInput',
-    {
-        'created_at': 'SortOrder',
-    },
-    total=True
-)
+_User_created_at_OrderByInput = dict
 
-_User_updated_at_OrderByInput = TypedDict(
-    '_User_updated_at_OrderByInput',
-    {
-        'updated_at': 'SortOrder',
-    },
-    total=True
-)
+_User_updated_at_OrderByInput = dict
 
 UserOrderByInput = Union[
     '_User_id_OrderByInput',
@@ -1351,454 +698,254 @@ UserOrderByInput = Union[
 # see https://github.com/RobertCraigie/prisma-client-py/issues/45
 # switch to pyright for improved types, see https://prisma-client-py.readthedocs.io/en/stable/reference/limitations/
 
-UserRelationFilter = TypedDict(
-    'UserRelationFilter',
-    {
-        'is': 'Dict[str, Any]',
-        'is_not': 'Dict[str, Any]',
-    },
-    total=False,
-)
+UserRelationFilter = dict
+
+
+UserListRelationFilter = dict
+
+
+UserInclude = dict
+
+
+    
+
+UserIncludeFromUser = dict
+
+
+UserIncludeFromUserRecursive1 = dict
+
+
+UserIncludeFromUserRecursive2 = dict
+
+
+UserIncludeFromUserRecursive3 = dict
+
+
+UserIncludeFromUserRecursive4 = dict
+
+    
+
+UserArgsFromUser = dict
+
+
+UserArgsFromUserRecursive1 = dict
 
 
-class UserListRelationFilter(TypedDict, total=False):
-    some: 'Dict[str, Any]'
-    none: 'Dict[str, Any]'
-    every: 'Dict[str, Any]'
+UserArgsFromUserRecursive2 = dict
 
 
-class UserInclude(TypedDict, total=False):
-    """User relational arguments"""
-    judgments: Union[bool, 'FindManyJudgmentArgsFromUser']
+UserArgsFromUserRecursive3 = dict
 
 
+UserArgsFromUserRecursive4 = dict
     
+    
+
+FindManyUserArgsFromUser = dict
+
+
+FindManyUserArgsFromUserRecursive1 = dict
+
+
+FindManyUserArgsFromUserRecursive2 = dict
+
+
+FindManyUserArgsFromUserRecursive3 = dict
 
-class UserIncludeFromUser(TypedDict, total=False):
-    """Relational arguments for User"""
-    judgments: Union[bool, 'FindManyJudgmentArgsFromUserRecursive1']
+
+FindManyUserArgsFromUserRecursive4 = dict
+    
+    
+
+JudgmentIncludeFromUser = dict
 
 
-class UserIncludeFromUserRecursive1(TypedDict, total=False):
-    """Relational arguments for User"""
-    judgments: Union[bool, 'FindManyJudgmentArgsFromUserRecursive2']
+JudgmentIncludeFromUserRecursive1 = dict
 
 
-class UserIncludeFromUserRecursive2(TypedDict, total=False):
-    """Relational arguments for User"""
-    judgments: Union[bool, 'FindManyJudgmentArgsFromUserRecursive3']
+JudgmentIncludeFromUserRecursive2 = dict
 
 
-class UserIncludeFromUserRecursive3(TypedDict, total=False):
-    """Relational arguments for User"""
-    judgments: Union[bool, 'FindManyJudgmentArgsFromUserRecursive4']
+JudgmentIncludeFromUserRecursive3 = dict
 
 
-class UserIncludeFromUserRecursive4(TypedDict, total=False):
-    """Relational arguments for User"""
+JudgmentIncludeFromUserRecursive4 = dict
 
     
 
-class UserArgsFromUser(TypedDict, total=False):
-    """Arguments for User"""
-    include: 'UserIncludeFromUserRecursive1'
+JudgmentArgsFromUser = dict
 
 
-class UserArgsFromUserRecursive1(TypedDict, total=False):
-    """Arguments for User"""
-    include: 'UserIncludeFromUserRecursive2'
+JudgmentArgsFromUserRecursive1 = dict
 
 
-class UserArgsFromUserRecursive2(TypedDict, total=False):
-    """Arguments for User"""
-    include: 'UserIncludeFromUserRecursive3'
+JudgmentArgsFromUserRecursive2 = dict
 
 
-class UserArgsFromUserRecursive3(TypedDict, total=False):
-    """Arguments for User"""
-    include: 'UserIncludeFromUserRecursive4'
+JudgmentArgsFromUserRecursive3 = dict
 
 
-class UserArgsFromUserRecursive4(TypedDict, total=False):
-    """Arguments for User"""
+JudgmentArgsFromUserRecursive4 = dict
     
     
 
-class FindManyUserArgsFromUser(TypedDict, total=False):
-    """Arguments for User"""
-    take: int
-    skip: int
-    order_by: Union['UserOrderByInput', List['UserOrderByInput']]
-    where: 'UserWhereInput'
-    cursor: 'UserWhereUniqueInput'
-    distinct: List['UserScalarFieldKeys']
-    include: 'UserIncludeFromUserRecursive1'
+FindManyJudgmentArgsFromUser = dict
 
 
-class FindManyUserArgsFromUserRecursive1(TypedDict, total=False):
-    """Arguments for User"""
-    take: int
-    skip: int
-    order_by: Union['UserOrderByInput', List['UserOrderByInput']]
-    where: 'UserWhereInput'
-    cursor: 'UserWhereUniqueInput'
-    distinct: List['UserScalarFieldKeys']
-    include: 'UserIncludeFromUserRecursive2'
+FindManyJudgmentArgsFromUserRecursive1 = dict
 
 
-class FindManyUserArgsFromUserRecursive2(TypedDict, total=False):
-    """Arguments for User"""
-    take: int
-    skip: int
-    order_by: Union['UserOrderByInput', List['UserOrderByInput']]
-    where: 'UserWhereInput'
-    cursor: 'UserWhereUniqueInput'
-    distinct: List['UserScalarFieldKeys']
-    include: 'UserIncludeFromUserRecursive3'
+FindManyJudgmentArgsFromUserRecursive2 = dict
 
 
-class FindManyUserArgsFromUserRecursive3(TypedDict, total=False):
-    """Arguments for User"""
-    take: int
-    skip: int
-    order_by: Union['UserOrderByInput', List['UserOrderByInput']]
-    where: 'UserWhereInput'
-    cursor: 'UserWhereUniqueInput'
-    distinct: List['UserScalarFieldKeys']
-    include: 'UserIncludeFromUserRecursive4'
+FindManyJudgmentArgsFromUserRecursive3 = dict
 
 
-class FindManyUserArgsFromUserRecursive4(TypedDict, total=False):
-    """Arguments for User"""
-    take: int
-    skip: int
-    order_by: Union['UserOrderByInput', List['UserOrderByInput']]
-    where: 'UserWhereInput'
-    cursor: 'UserWhereUniqueInput'
-    distinct: List['UserScalarFieldKeys']
+FindManyJudgmentArgsFromUserRecursive4 = dict
     
     
 
-class JudgmentIncludeFromUser(TypedDict, total=False):
-    """Relational arguments for User"""
-    user: Union[bool, 'UserArgsFromUserRecursive1']
-    suspects: Union[bool, 'FindManySuspectArgsFromUserRecursive1']
-    blame: Union[bool, 'BlameArgsFromUserRecursive1']
+SuspectIncludeFromUser = dict
 
 
-class JudgmentIncludeFromUserRecursive1(TypedDict, total=False):
-    """Relational arguments for User"""
-    user: Union[bool, 'UserArgsFromUserRecursive2']
-    suspects: Union[bool, 'FindManySuspectArgsFromUserRecursive2']
-    blame: Union[bool, 'BlameArgsFromUserRecursive2']
+SuspectIncludeFromUserRecursive1 = dict
 
 
-class JudgmentIncludeFromUserRecursive2(TypedDict, total=False):
-    """Relational arguments for User"""
-    user: Union[bool, 'UserArgsFromUserRecursive3']
-    suspects: Union[bool, 'FindManySuspectArgsFromUserRecursive3']
-    blame: Union[bool, 'BlameArgsFromUserRecursive3']
+SuspectIncludeFromUserRecursive2 = dict
 
 
-class JudgmentIncludeFromUserRecursive3(TypedDict, total=False):
-    """Relational arguments for User"""
-    user: Union[bool, 'UserArgsFromUserRecursive4']
-    suspects: Union[bool, 'FindManySuspectArgsFromUserRecursive4']
-    blame: Union[bool, 'BlameArgsFromUserRecursive4']
+SuspectIncludeFromUserRecursive3 = dict
 
 
-class JudgmentIncludeFromUserRecursive4(TypedDict, total=False):
-    """Relational arguments for User"""
+SuspectIncludeFromUserRecursive4 = dict
 
     
 
-class JudgmentArgsFromUser(TypedDict, total=False):
-    """Arguments for User"""
-    include: 'JudgmentIncludeFromJudgmentRecursive1'
+SuspectArgsFromUser = dict
 
 
-class JudgmentArgsFromUserRecursive1(TypedDict, total=False):
-    """Arguments for User"""
-    include: 'JudgmentIncludeFromJudgmentRecursive2'
+SuspectArgsFromUserRecursive1 = dict
 
 
-class JudgmentArgsFromUserRecursive2(TypedDict, total=False):
-    """Arguments for User"""
-    include: 'JudgmentIncludeFromJudgmentRecursive3'
+SuspectArgsFromUserRecursive2 = dict
 
 
-class JudgmentArgsFromUserRecursive3(TypedDict, total=False):
-    """Arguments for User"""
-    include: 'JudgmentIncludeFromJudgmentRecursive4'
+SuspectArgsFromUserRecursive3 = dict
 
 
-class JudgmentArgsFromUserRecursive4(TypedDict, total=False):
-    """Arguments for User"""
+SuspectArgsFromUserRecursive4 = dict
     
     
 
-class FindManyJudgmentArgsFromUser(TypedDict, total=False):
-    """Arguments for User"""
-    take: int
-    skip: int
-    order_by: Union['JudgmentOrderByInput', List['JudgmentOrderByInput']]
-    where: 'JudgmentWhereInput'
-    cursor: 'JudgmentWhereUniqueInput'
-    distinct: List['JudgmentScalarFieldKeys']
-    include: 'JudgmentIncludeFromJudgmentRecursive1'
+FindManySuspectArgsFromUser = dict
 
 
-class FindManyJudgmentArgsFromUserRecursive1(TypedDict, total=False):
-    """Arguments for User"""
-    take: int
-    skip: int
-    order_by: Union['JudgmentOrderByInput', List['JudgmentOrderByInput']]
-    where: 'JudgmentWhereInput'
-    cursor: 'JudgmentWhereUniqueInput'
-    distinct: List['JudgmentScalarFieldKeys']
-    include: 'JudgmentIncludeFromJudgmentRecursive2'
+FindManySuspectArgsFromUserRecursive1 = dict
 
 
-class FindManyJudgmentArgsFromUserRecursive2(TypedDict, total=False):
-    """Arguments for User"""
-    take: int
-    skip: int
-    order_by: Union['JudgmentOrderByInput', List['JudgmentOrderByInput']]
-    where: 'JudgmentWhereInput'
-    cursor: 'JudgmentWhereUniqueInput'
-    distinct: List['JudgmentScalarFieldKeys']
-    include: 'JudgmentIncludeFromJudgmentRecursive3'
+FindManySuspectArgsFromUserRecursive2 = dict
 
 
-class FindManyJudgmentArgsFromUserRecursive3(TypedDict, total=False):
-    """Arguments for User"""
-    take: int
-    skip: int
-    order_by: Union['JudgmentOrderByInput', List['JudgmentOrderByInput']]
-    where: 'JudgmentWhereInput'
-    cursor: 'JudgmentWhereUniqueInput'
-    distinct: List['JudgmentScalarFieldKeys']
-    include: 'JudgmentIncludeFromJudgmentRecursive4'
+FindManySuspectArgsFromUserRecursive3 = dict
 
 
-class FindManyJudgmentArgsFromUserRecursive4(TypedDict, total=False):
-    """Arguments for User"""
-    take: int
-    skip: int
-    order_by: Union['JudgmentOrderByInput', List['JudgmentOrderByInput']]
-    where: 'JudgmentWhereInput'
-    cursor: 'JudgmentWhereUniqueInput'
-    distinct: List['JudgmentScalarFieldKeys']
+FindManySuspectArgsFromUserRecursive4 = dict
     
     
 
-class SuspectIncludeFromUser(TypedDict, total=False):
-    """Relational arguments for User"""
-    judgment: Union[bool, 'JudgmentArgsFromUserRecursive1']
+BlameIncludeFromUser = dict
 
 
-class SuspectIncludeFromUserRecursive1(TypedDict, total=False):
-    """Relational arguments for User"""
-    judgment: Union[bool, 'JudgmentArgsFromUserRecursive2']
+BlameIncludeFromUserRecursive1 = dict
 
 
-class SuspectIncludeFromUserRecursive2(TypedDict, total=False):
-    """Relational arguments for User"""
-    judgment: Union[bool, 'JudgmentArgsFromUserRecursive3']
+BlameIncludeFromUserRecursive2 = dict
 
 
-class SuspectIncludeFromUserRecursive3(TypedDict, total=False):
-    """Relational arguments for User"""
-    judgment: Union[bool, 'JudgmentArgsFromUserRecursive4']
+BlameIncludeFromUserRecursive3 = dict
 
 
-class SuspectIncludeFromUserRecursive4(TypedDict, total=False):
-    """Relational arguments for User"""
+BlameIncludeFromUserRecursive4 = dict
 
     
 
-class SuspectArgsFromUser(TypedDict, total=False):
-    """Arguments for User"""
-    include: 'SuspectIncludeFromSuspectRecursive1'
+BlameArgsFromUser = dict
 
 
-class SuspectArgsFromUserRecursive1(TypedDict, total=False):
-    """Arguments for User"""
-    include: 'SuspectIncludeFromSuspectRecursive2'
+BlameArgsFromUserRecursive1 = dict
 
 
-class SuspectArgsFromUserRecursive2(TypedDict, total=False):
-    """Arguments for User"""
-    include: 'SuspectIncludeFromSuspectRecursive3'
+BlameArgsFromUserRecursive2 = dict
 
 
-class SuspectArgsFromUserRecursive3(TypedDict, total=False):
-    """Arguments for User"""
-    include: 'SuspectIncludeFromSuspectRecursive4'
+BlameArgsFromUserRecursive3 = dict
 
 
-class SuspectArgsFromUserRecursive4(TypedDict, total=False):
-    """Arguments for User"""
+BlameArgsFromUserRecursive4 = dict
     
     
 
-class FindManySuspectArgsFromUser(TypedDict, total=False):
-    """Arguments for User"""
-    take: int
-    skip: int
-    order_by: Union['SuspectOrderByInput', List['SuspectOrderByInput']]
-    where: 'SuspectWhereInput'
-    cursor: 'SuspectWhereUniqueInput'
-    distinct: List['SuspectScalarFieldKeys']
-    include: 'SuspectIncludeFromSuspectRecursive1'
+FindManyBlameArgsFromUser = dict
 
 
-class FindManySuspectArgsFromUserRecursive1(TypedDict, total=False):
-    """Arguments for User"""
-    take: int
-    skip: int
-    order_by: Union['SuspectOrderByInput', List['SuspectOrderByInput']]
-    where: 'SuspectWhereInput'
-    cursor: 'SuspectWhereUniqueInput'
-    distinct: List['SuspectScalarFieldKeys']
-    include: 'SuspectIncludeFromSuspectRecursive2'
+FindManyBlameArgsFromUserRecursive1 = dict
 
 
-class FindManySuspectArgsFromUserRecursive2(TypedDict, total=False):
-    """Arguments for User"""
-    take: int
-    skip: int
-    order_by: Union['SuspectOrderByInput', List['SuspectOrderByInput']]
-    where: 'SuspectWhereInput'
-    cursor: 'SuspectWhereUniqueInput'
-    distinct: List['SuspectScalarFieldKeys']
-    include: 'SuspectIncludeFromSuspectRecursive3'
+FindManyBlameArgsFromUserRecursive2 = dict
 
 
-class FindManySuspectArgsFromUserRecursive3(TypedDict, total=False):
-    """Arguments for User"""
-    take: int
-    skip: int
-    order_by: Union['SuspectOrderByInput', List['SuspectOrderByInput']]
-    where: 'SuspectWhereInput'
-    cursor: 'SuspectWhereUniqueInput'
-    distinct: List['SuspectScalarFieldKeys']
-    include: 'SuspectIncludeFromSuspectRecursive4'
+FindManyBlameArgsFromUserRecursive3 = dict
 
 
-class FindManySuspectArgsFromUserRecursive4(TypedDict, total=False):
-    """Arguments for User"""
-    take: int
-    skip: int
-    order_by: Union['SuspectOrderByInput', List['SuspectOrderByInput']]
-    where: 'SuspectWhereInput'
-    cursor: 'SuspectWhereUniqueInput'
-    distinct: List['SuspectScalarFieldKeys']
+FindManyBlameArgsFromUserRecursive4 = dict
     
     
 
-class BlameIncludeFromUser(TypedDict, total=False):
-    """Relational arguments for User"""
-    judgment: Union[bool, 'JudgmentArgsFromUserRecursive1']
+AnalysisJobIncludeFromUser = dict
 
 
-class BlameIncludeFromUserRecursive1(TypedDict, total=False):
-    """Relational arguments for User"""
-    judgment: Union[bool, 'JudgmentArgsFromUserRecursive2']
+AnalysisJobIncludeFromUserRecursive1 = dict
 
 
-class BlameIncludeFromUserRecursive2(TypedDict, total=False):
-    """Relational arguments for User"""
-    judgment: Union[bool, 'JudgmentArgsFromUserRecursive3']
+AnalysisJobIncludeFromUserRecursive2 = dict
 
 
-class BlameIncludeFromUserRecursive3(TypedDict, total=False):
-    """Relational arguments for User"""
-    judgment: Union[bool, 'JudgmentArgsFromUserRecursive4']
+AnalysisJobIncludeFromUserRecursive3 = dict
 
 
-class BlameIncludeFromUserRecursive4(TypedDict, total=False):
-    """Relational arguments for User"""
+AnalysisJobIncludeFromUserRecursive4 = dict
 
     
 
-class BlameArgsFromUser(TypedDict, total=False):
-    """Arguments for User"""
-    include: 'BlameIncludeFromBlameRecursive1'
+AnalysisJobArgsFromUser = dict
 
 
-class BlameArgsFromUserRecursive1(TypedDict, total=False):
-    """Arguments for User"""
-    include: 'BlameIncludeFromBlameRecursive2'
+AnalysisJobArgsFromUserRecursive1 = dict
 
 
-class BlameArgsFromUserRecursive2(TypedDict, total=False):
-    """Arguments for User"""
-    include: 'BlameIncludeFromBlameRecursive3'
+AnalysisJobArgsFromUserRecursive2 = dict
 
 
-class BlameArgsFromUserRecursive3(TypedDict, total=False):
-    """Arguments for User"""
-    include: 'BlameIncludeFromBlameRecursive4'
+AnalysisJobArgsFromUserRecursive3 = dict
 
 
-class BlameArgsFromUserRecursive4(TypedDict, total=False):
-    """Arguments for User"""
+AnalysisJobArgsFromUserRecursive4 = dict
     
     
 
-class FindManyBlameArgsFromUser(TypedDict, total=False):
-    """Arguments for User"""
-    take: int
-    skip: int
-    order_by: Union['BlameOrderByInput', List['BlameOrderByInput']]
-    where: 'BlameWhereInput'
-    cursor: 'BlameWhereUniqueInput'
-    distinct: List['BlameScalarFieldKeys']
-    include: 'BlameIncludeFromBlameRecursive1'
+FindManyAnalysisJobArgsFromUser = dict
 
 
-class FindManyBlameArgsFromUserRecursive1(TypedDict, total=False):
-    """Arguments for User"""
-    take: int
-    skip: int
-    order_by: Union['BlameOrderByInput', List['BlameOrderByInput']]
-    where: 'BlameWhereInput'
-    cursor: 'BlameWhereUniqueInput'
-    distinct: List['BlameScalarFieldKeys']
-    include: 'BlameIncludeFromBlameRecursive2'
+FindManyAnalysisJobArgsFromUserRecursive1 = dict
 
 
-class FindManyBlameArgsFromUserRecursive2(TypedDict, total=False):
-    """Arguments for User"""
-    take: int
-    skip: int
-    order_by: Union['BlameOrderByInput', List['BlameOrderByInput']]
-    where: 'BlameWhereInput'
-    cursor: 'BlameWhereUniqueInput'
-    distinct: List['BlameScalarFieldKeys']
-    include: 'BlameIncludeFromBlameRecursive3'
+FindManyAnalysisJobArgsFromUserRecursive2 = dict
 
 
-class FindManyBlameArgsFromUserRecursive3(TypedDict, total=False):
-    """Arguments for User"""
-    take: int
-    skip: int
-    order_by: Union['BlameOrderByInput', List['BlameOrderByInput']]
-    where: 'BlameWhereInput'
-    cursor: 'BlameWhereUniqueInput'
-    distinct: List['BlameScalarFieldKeys']
-    include: 'BlameIncludeFromBlameRecursive4'
+FindManyAnalysisJobArgsFromUserRecursive3 = dict
 
 
-class FindManyBlameArgsFromUserRecursive4(TypedDict, total=False):
-    """Arguments for User"""
-    take: int
-    skip: int
-    order_by: Union['BlameOrderByInput', List['BlameOrderByInput']]
-    where: 'BlameWhereInput'
-    cursor: 'BlameWhereUniqueInput'
-    distinct: List['BlameScalarFieldKeys']
+FindManyAnalysisJobArgsFromUserRecursive4 = dict
     
 
 
@@ -1808,265 +955,75 @@ FindFirstUserArgs = FindManyUserArgsFromUser
 
     
 
-class UserWhereInput(TypedDict, total=False):
-    """User arguments for searching"""
-    id: Union[_str, 'types.StringFilter']
-    github_id: Union[_str, 'types.StringFilter']
-    username: Union[_str, 'types.StringFilter']
-    avatar_url: Union[None, _str, 'types.StringFilter']
-    access_token: Union[None, _str, 'types.StringFilter']
-    created_at: Union[datetime.datetime, 'types.DateTimeFilter']
-    updated_at: Union[datetime.datetime, 'types.DateTimeFilter']
-    judgments: 'JudgmentListRelationFilter'
-
-    # should be noted that AND and NOT should be Union['UserWhereInputRecursive1', List['UserWhereInputRecursive1']]
-    # but this causes mypy to hang :/
-    AND: List['UserWhereInputRecursive1']
-    OR: List['UserWhereInputRecursive1']
-    NOT: List['UserWhereInputRecursive1']
-
-
-class UserWhereInputRecursive1(TypedDict, total=False):
-    """User arguments for searching"""
-    id: Union[_str, 'types.StringFilter']
-    github_id: Union[_str, 'types.StringFilter']
-    username: Union[_str, 'types.StringFilter']
-    avatar_url: Union[None, _str, 'types.StringFilter']
-    access_token: Union[None, _str, 'types.StringFilter']
-    created_at: Union[datetime.datetime, 'types.DateTimeFilter']
-    updated_at: Union[datetime.datetime, 'types.DateTimeFilter']
-    judgments: 'JudgmentListRelationFilter'
-
-    # should be noted that AND and NOT should be Union['UserWhereInputRecursive2', List['UserWhereInputRecursive2']]
-    # but this causes mypy to hang :/
-    AND: List['UserWhereInputRecursive2']
-    OR: List['UserWhereInputRecursive2']
-    NOT: List['UserWhereInputRecursive2']
-
-
-class UserWhereInputRecursive2(TypedDict, total=False):
-    """User arguments for searching"""
-    id: Union[_str, 'types.StringFilter']
-    github_id: Union[_str, 'types.StringFilter']
-    username: Union[_str, 'types.StringFilter']
-    avatar_url: Union[None, _str, 'types.StringFilter']
-    access_token: Union[None, _str, 'types.StringFilter']
-    created_at: Union[datetime.datetime, 'types.DateTimeFilter']
-    updated_at: Union[datetime.datetime, 'types.DateTimeFilter']
-    judgments: 'JudgmentListRelationFilter'
-
-    # should be noted that AND and NOT should be Union['UserWhereInputRecursive3', List['UserWhereInputRecursive3']]
-    # but this causes mypy to hang :/
-    AND: List['UserWhereInputRecursive3']
-    OR: List['UserWhereInputRecursive3']
-    NOT: List['UserWhereInputRecursive3']
-
-
-class UserWhereInputRecursive3(TypedDict, total=False):
-    """User arguments for searching"""
-    id: Union[_str, 'types.StringFilter']
-    github_id: Union[_str, 'types.StringFilter']
-    username: Union[_str, 'types.StringFilter']
-    avatar_url: Union[None, _str, 'types.StringFilter']
-    access_token: Union[None, _str, 'types.StringFilter']
-    created_at: Union[datetime.datetime, 'types.DateTimeFilter']
-    updated_at: Union[datetime.datetime, 'types.DateTimeFilter']
-    judgments: 'JudgmentListRelationFilter'
-
-    # should be noted that AND and NOT should be Union['UserWhereInputRecursive4', List['UserWhereInputRecursive4']]
-    # but this causes mypy to hang :/
-    AND: List['UserWhereInputRecursive4']
-    OR: List['UserWhereInputRecursive4']
-    NOT: List['UserWhereInputRecursive4']
-
-
-class UserWhereInputRecursive4(TypedDict, total=False):
-    """User arguments for searching"""
-    id: Union[_str, 'types.StringFilter']
-    github_id: Union[_str, 'types.StringFilter']
-    username: Union[_str, 'types.StringFilter']
-    avatar_url: Union[None, _str, 'types.StringFilter']
-    access_token: Union[None, _str, 'types.StringFilter']
-    created_at: Union[datetime.datetime, 'types.DateTimeFilter']
-    updated_at: Union[datetime.datetime, 'types.DateTimeFilter']
-    judgments: 'JudgmentListRelationFilter'
+UserWhereInput = dict
 
 
+UserWhereInputRecursive1 = dict
 
-# aggregate User types
 
+UserWhereInputRecursive2 = dict
+
+
+UserWhereInputRecursive3 = dict
 
-    
 
-class UserScalarWhereWithAggregatesInput(TypedDict, total=False):
-    """User arguments for searching"""
-    id: Union[_str, 'types.StringWithAggregatesFilter']
-    github_id: Union[_str, 'types.StringWithAggregatesFilter']
-    username: Union[_str, 'types.StringWithAggregatesFilter']
-    avatar_url: Union[_str, 'types.StringWithAggregatesFilter']
-    access_token: Union[_str, 'types.StringWithAggregatesFilter']
-    created_at: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
-    updated_at: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+UserWhereInputRecursive4 = dict
 
-    AND: List['UserScalarWhereWithAggregatesInputRecursive1']
-    OR: List['UserScalarWhereWithAggregatesInputRecursive1']
-    NOT: List['UserScalarWhereWithAggregatesInputRecursive1']
 
 
-class UserScalarWhereWithAggregatesInputRecursive1(TypedDict, total=False):
-    """User arguments for searching"""
-    id: Union[_str, 'types.StringWithAggregatesFilter']
-    github_id: Union[_str, 'types.StringWithAggregatesFilter']
-    username: Union[_str, 'types.StringWithAggregatesFilter']
-    avatar_url: Union[_str, 'types.StringWithAggregatesFilter']
-    access_token: Union[_str, 'types.StringWithAggregatesFilter']
-    created_at: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
-    updated_at: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+# aggregate User types
+
+
+    
 
-    AND: List['UserScalarWhereWithAggregatesInputRecursive2']
-    OR: List['UserScalarWhereWithAggregatesInputRecursive2']
-    NOT: List['UserScalarWhereWithAggregatesInputRecursive2']
+UserScalarWhereWithAggregatesInput = dict
 
 
-class UserScalarWhereWithAggregatesInputRecursive2(TypedDict, total=False):
-    """User arguments for searching"""
-    id: Union[_str, 'types.StringWithAggregatesFilter']
-    github_id: Union[_str, 'types.StringWithAggregatesFilter']
-    username: Union[_str, 'types.StringWithAggregatesFilter']
-    avatar_url: Union[_str, 'types.StringWithAggregatesFilter']
-    access_token: Union[_str, 'types.StringWithAggregatesFilter']
-    created_at: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
-    updated_at: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+UserScalarWhereWithAggregatesInputRecursive1 = dict
 
-    AND: List['UserScalarWhereWithAggregatesInputRecursive3']
-    OR: List['UserScalarWhereWithAggregatesInputRecursive3']
-    NOT: List['UserScalarWhereWithAggregatesInputRecursive3']
 
+UserScalarWhereWithAggregatesInputRecursive2 = dict
 
-class UserScalarWhereWithAggregatesInputRecursive3(TypedDict, total=False):
-    """User arguments for searching"""
-    id: Union[_str, 'types.StringWithAggregatesFilter']
-    github_id: Union[_str, 'types.StringWithAggregatesFilter']
-    username: Union[_str, 'types.StringWithAggregatesFilter']
-    avatar_url: Union[_str, 'types.StringWithAggregatesFilter']
-    access_token: Union[_str, 'types.StringWithAggregatesFilter']
-    created_at: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
-    updated_at: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
 
-    AND: List['UserScalarWhereWithAggregatesInputRecursive4']
-    OR: List['UserScalarWhereWithAggregatesInputRecursive4']
-    NOT: List['UserScalarWhereWithAggregatesInputRecursive4']
+UserScalarWhereWithAggregatesInputRecursive3 = dict
 
 
-class UserScalarWhereWithAggregatesInputRecursive4(TypedDict, total=False):
-    """User arguments for searching"""
-    id: Union[_str, 'types.StringWithAggregatesFilter']
-    github_id: Union[_str, 'types.StringWithAggregatesFilter']
-    username: Union[_str, 'types.StringWithAggregatesFilter']
-    avatar_url: Union[_str, 'types.StringWithAggregatesFilter']
-    access_token: Union[_str, 'types.StringWithAggregatesFilter']
-    created_at: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
-    updated_at: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+UserScalarWhereWithAggregatesInputRecursive4 = dict
 
 
 
-class UserGroupByOutput(TypedDict, total=False):
-    id: _str
-    github_id: _str
-    username: _str
-    avatar_url: _str
-    access_token: _str
-    created_at: datetime.datetime
-    updated_at: datetime.datetime
-    _sum: 'UserSumAggregateOutput'
-    _avg: 'UserAvgAggregateOutput'
-    _min: 'UserMinAggregateOutput'
-    _max: 'UserMaxAggregateOutput'
-    _count: 'UserCountAggregateOutput'
+UserGroupByOutput = dict
 
 
-class UserAvgAggregateOutput(TypedDict, total=False):
-    """User output for aggregating averages"""
+UserAvgAggregateOutput = dict
 
 
-class UserSumAggregateOutput(TypedDict, total=False):
-    """User output for aggregating sums"""
+UserSumAggregateOutput = dict
 
 
-class UserScalarAggregateOutput(TypedDict, total=False):
-    """User output including scalar fields"""
-    id: _str
-    github_id: _str
-    username: _str
-    avatar_url: _str
-    access_token: _str
-    created_at: datetime.datetime
-    updated_at: datetime.datetime
+UserScalarAggregateOutput = dict
 
 
 UserMinAggregateOutput = UserScalarAggregateOutput
 UserMaxAggregateOutput = UserScalarAggregateOutput
 
 
-class UserMaxAggregateInput(TypedDict, total=False):
-    """User input for aggregating by max"""
-    id: bool
-    github_id: bool
-    username: bool
-    avatar_url: bool
-    access_token: bool
-    created_at: bool
-    updated_at: bool
+UserMaxAggregateInput = dict
 
 
-class UserMinAggregateInput(TypedDict, total=False):
-    """User input for aggregating by min"""
-    id: bool
-    github_id: bool
-    username: bool
-    avatar_url: bool
-    access_token: bool
-    created_at: bool
-    updated_at: bool
+UserMinAggregateInput = dict
 
 
-class UserNumberAggregateInput(TypedDict, total=False):
-    """User input for aggregating numbers"""
+UserNumberAggregateInput = dict
 
 
 UserAvgAggregateInput = UserNumberAggregateInput
 UserSumAggregateInput = UserNumberAggregateInput
 
 
-UserCountAggregateInput = TypedDict(
-    'UserCountAggregateInput',
-    {
-        'id': bool,
-        'github_id': bool,
-        'username': bool,
-        'avatar_url': bool,
-        'access_token': bool,
-        'created_at': bool,
-        'updated_at': bool,
-        '_all': bool,
-    },
-    total=False,
-)
+UserCountAggregateInput = dict
 
-UserCountAggregateOutput = TypedDict(
-    'UserCountAggregateOutput',
-    {
-        'id': int,
-        'github_id': int,
-        'username': int,
-        'avatar_url': int,
-        'access_token': int,
-        'created_at': int,
-        'updated_at': int,
-        '_all': int,
-    },
-    total=False,
-)
+UserCountAggregateOutput = dict
 
 
 UserKeys = Literal[
@@ -2096,75 +1053,30 @@ UserRelationalFieldKeys = Literal[
 
 # Judgment types
 
-class JudgmentOptionalCreateInput(TypedDict, total=False):
-    """Optional arguments to the Judgment create method"""
-    id: _str
-    user_id: _str
-    description: Optional[_str]
-    file_path: Optional[_str]
-    period_days: _int
-    created_at: datetime.datetime
-    user: 'UserCreateNestedWithoutRelationsInput'
-    suspects: 'SuspectCreateManyNestedWithoutRelationsInput'
-    blame: 'BlameCreateNestedWithoutRelationsInput'
+JudgmentOptionalCreateInput = dict
 
 
-class JudgmentCreateInput(JudgmentOptionalCreateInput):
-    """Required arguments to the Judgment create method"""
-    repo_owner: _str
-    repo_name: _str
-    title: _str
-    status: _str
-    case_number: _str
+JudgmentCreateInput = dict
 
 
 # TODO: remove this in favour of without explicit relations
 # e.g. PostCreateWithoutAuthorInput
 
-class JudgmentOptionalCreateWithoutRelationsInput(TypedDict, total=False):
-    """Optional arguments to the Judgment create method, without relations"""
-    id: _str
-    user_id: _str
-    description: Optional[_str]
-    file_path: Optional[_str]
-    period_days: _int
-    created_at: datetime.datetime
+JudgmentOptionalCreateWithoutRelationsInput = dict
 
 
-class JudgmentCreateWithoutRelationsInput(JudgmentOptionalCreateWithoutRelationsInput):
-    """Required arguments to the Judgment create method, without relations"""
-    repo_owner: _str
-    repo_name: _str
-    title: _str
-    status: _str
-    case_number: _str
+JudgmentCreateWithoutRelationsInput = dict
 
 
-class JudgmentCreateNestedWithoutRelationsInput(TypedDict, total=False):
-    create: 'JudgmentCreateWithoutRelationsInput'
-    connect: 'JudgmentWhereUniqueInput'
+JudgmentCreateNestedWithoutRelationsInput = dict
 
 
-class JudgmentCreateManyNestedWithoutRelationsInput(TypedDict, total=False):
-    create: Union['JudgmentCreateWithoutRelationsInput', List['JudgmentCreateWithoutRelationsInput']]
-    connect: Union['JudgmentWhereUniqueInput', List['JudgmentWhereUniqueInput']]
+JudgmentCreateManyNestedWithoutRelationsInput = dict
 
 
-_JudgmentWhereUnique_id_Input = TypedDict(
-    '_JudgmentWhereUnique_id_Input',
-    {
-        'id': '_str',
-    },
-    total=True
-)
+_JudgmentWhereUnique_id_Input = dict
 
-_JudgmentWhereUnique_case_number_Input = TypedDict(
-    '_JudgmentWhereUnique_case_number_Input',
-    {
-        'case_number': '_str',
-    },
-    total=True
-)
+_JudgmentWhereUnique_case_number_Input = dict
 
 JudgmentWhereUniqueInput = Union[
     '_JudgmentWhereUnique_id_Input',
@@ -2172,43 +1084,13 @@ JudgmentWhereUniqueInput = Union[
 ]
 
 
-class JudgmentUpdateInput(TypedDict, total=False):
-    """Optional arguments for updating a record"""
-    id: _str
-    repo_owner: _str
-    repo_name: _str
-    title: _str
-    description: Optional[_str]
-    file_path: Optional[_str]
-    period_days: Union[AtomicIntInput, _int]
-    status: _str
-    case_number: _str
-    created_at: datetime.datetime
-    user: 'UserUpdateOneWithoutRelationsInput'
-    suspects: 'SuspectUpdateManyWithoutRelationsInput'
-    blame: 'BlameUpdateOneWithoutRelationsInput'
-
-
-class JudgmentUpdateManyMutationInput(TypedDict, total=False):
-    """Arguments for updating many records"""
-    id: _str
-    repo_owner: _str
-    repo_name: _str
-    title: _str
-    description: Optional[_str]
-    file_path: Optional[_str]
-    period_days: Union[AtomicIntInput, _int]
-    status: _str
-    case_number: _str
-    created_at: datetime.datetime
-
-
-class JudgmentUpdateManyWithoutRelationsInput(TypedDict, total=False):
-    create: List['JudgmentCreateWithoutRelationsInput']
-    connect: List['JudgmentWhereUniqueInput']
-    set: List['JudgmentWhereUniqueInput']
-    disconnect: List['JudgmentWhereUniqueInput']
-    delete: List['JudgmentWhereUniqueInput']
+JudgmentUpdateInput = dict
+
+
+JudgmentUpdateManyMutationInput = dict
+
+
+JudgmentUpdateManyWithoutRelationsInput = dict
 
     # TODO
     # update: List['JudgmentUpdateWithWhereUniqueWithoutRelationsInput']
@@ -2218,11 +1100,7 @@ class JudgmentUpdateManyWithoutRelationsInput(TypedDict, total=False):
     # connectOrCreate: List['JudgmentCreateOrConnectWithoutRelationsInput']
 
 
-class JudgmentUpdateOneWithoutRelationsInput(TypedDict, total=False):
-    create: 'JudgmentCreateWithoutRelationsInput'
-    connect: 'JudgmentWhereUniqueInput'
-    disconnect: bool
-    delete: bool
+JudgmentUpdateOneWithoutRelationsInput = dict
 
     # TODO
     # update: 'JudgmentUpdateInput'
@@ -2230,98 +1108,30 @@ class JudgmentUpdateOneWithoutRelationsInput(TypedDict, total=False):
     # connectOrCreate: 'JudgmentCreateOrConnectWithoutRelationsInput'
 
 
-class JudgmentUpsertInput(TypedDict):
-    create: 'JudgmentCreateInput'
-    update: 'JudgmentUpdateInput'  # pyright: ignore[reportIncompatibleMethodOverride]
+JudgmentUpsertInput = dict
 
 
-_Judgment_id_OrderByInput = TypedDict(
-    '_Judgment_id_OrderByInput',
-    {
-        'id': 'SortOrder',
-    },
-    total=True
-)
+_Judgment_id_OrderByInput = dict
 
-_Judgment_user_id_OrderByInput = TypedDict(
-    '_Judgment_user_id_OrderByInput',
-    {
-        'user_id': 'SortOrder',
-    },
-    total=True
-)
+_Judgment_user_id_OrderByInput = dict
 
-_Judgment_repo_owner_OrderByInput = TypedDict(
-    '_Judgment_repo_owner_OrderByInput',
-    {
-        'repo_owner': 'SortOrder',
-    },
-    total=True
-)
+_Judgment_repo_owner_OrderByInput = dict
 
-_Judgment_repo_name_OrderByInput = TypedDict(
-    '_Judgment_repo_name_OrderByInput',
-    {
-        'repo_name': 'SortOrder',
-    },
-    total=True
-)
+_Judgment_repo_name_OrderByInput = dict
 
-_Judgment_title_OrderByInput = TypedDict(
-    '_Judgment_title_OrderByInput',
-    {
-        'title': 'SortOrder',
-    },
-    total=True
-)
+_Judgment_title_OrderByInput = dict
 
-_Judgment_description_OrderByInput = TypedDict(
-    '_Judgment_description_OrderByInput',
-    {
-        'description': 'SortOrder',
-    },
-    total=True
-)
+_Judgment_description_OrderByInput = dict
 
-_Judgment_file_path_OrderByInput = TypedDict(
-    '_Judgment_file_path_OrderByInput',
-    {
-        'file_path': 'SortOrder',
-    },
-    total=True
-)
+_Judgment_file_path_OrderByInput = dict
 
-_Judgment_period_days_OrderByInput = TypedDict(
-    '_Judgment_period_days_OrderByInput',
-    {
-        'period_days': 'SortOrder',
-    },
-    total=True
-)
+_Judgment_period_days_OrderByInput = dict
 
-_Judgment_status_OrderByInput = TypedDict(
-    '_Judgment_status_OrderByInput',
-    {
-        'status': 'SortOrder',
-    },
-    total=True
-)
+_Judgment_status_OrderByInput = dict
 
-_Judgment_case_number_OrderByInput = TypedDict(
-    '_Judgment_case_number_OrderByInput',
-    {
-        'case_number': 'SortOrder',
-    },
-    total=True
-)
+_Judgment_case_number_OrderByInput = dict
 
-_Judgment_created_at_OrderByInput = TypedDict(
-    '_Judgment_created_at_OrderByInput',
-    {
-        'created_at': 'SortOrder',
-    },
-    total=True
-)
+_Judgment_created_at_OrderByInput = dict
 
 JudgmentOrderByInput = Union[
     '_Judgment_id_OrderByInput',
@@ -2347,456 +1157,254 @@ JudgmentOrderByInput = Union[
 # see https://github.com/RobertCraigie/prisma-client-py/issues/45
 # switch to pyright for improved types, see https://prisma-client-py.readthedocs.io/en/stable/reference/limitations/
 
-JudgmentRelationFilter = TypedDict(
-    'JudgmentRelationFilter',
-    {
-        'is': 'Dict[str, Any]',
-        'is_not': 'Dict[str, Any]',
-    },
-    total=False,
-)
+JudgmentRelationFilter = dict
+
+
+JudgmentListRelationFilter = dict
+
+
+JudgmentInclude = dict
+
+
+    
+
+UserIncludeFromJudgment = dict
+
+
+UserIncludeFromJudgmentRecursive1 = dict
+
+
+UserIncludeFromJudgmentRecursive2 = dict
+
+
+UserIncludeFromJudgmentRecursive3 = dict
+
+
+UserIncludeFromJudgmentRecursive4 = dict
+
+    
+
+UserArgsFromJudgment = dict
+
+
+UserArgsFromJudgmentRecursive1 = dict
+
+
+UserArgsFromJudgmentRecursive2 = dict
+
+
+UserArgsFromJudgmentRecursive3 = dict
+
+
+UserArgsFromJudgmentRecursive4 = dict
+    
+    
+
+FindManyUserArgsFromJudgment = dict
+
 
+FindManyUserArgsFromJudgmentRecursive1 = dict
 
-class JudgmentListRelationFilter(TypedDict, total=False):
-    some: 'Dict[str, Any]'
-    none: 'Dict[str, Any]'
-    every: 'Dict[str, Any]'
 
+FindManyUserArgsFromJudgmentRecursive2 = dict
 
-class JudgmentInclude(TypedDict, total=False):
-    """Judgment relational arguments"""
-    user: Union[bool, 'UserArgsFromJudgment']
-    suspects: Union[bool, 'FindManySuspectArgsFromJudgment']
-    blame: Union[bool, 'BlameArgsFromJudgment']
 
+FindManyUserArgsFromJudgmentRecursive3 = dict
 
+
+FindManyUserArgsFromJudgmentRecursive4 = dict
+    
     
 
-class UserIncludeFromJudgment(TypedDict, total=False):
-    """Relational arguments for Judgment"""
-    judgments: Union[bool, 'FindManyJudgmentArgsFromJudgmentRecursive1']
+JudgmentIncludeFromJudgment = dict
 
 
-class UserIncludeFromJudgmentRecursive1(TypedDict, total=False):
-    """Relational arguments for Judgment"""
-    judgments: Union[bool, 'FindManyJudgmentArgsFromJudgmentRecursive2']
+JudgmentIncludeFromJudgmentRecursive1 = dict
 
 
-class UserIncludeFromJudgmentRecursive2(TypedDict, total=False):
-    """Relational arguments for Judgment"""
-    judgments: Union[bool, 'FindManyJudgmentArgsFromJudgmentRecursive3']
+JudgmentIncludeFromJudgmentRecursive2 = dict
 
 
-class UserIncludeFromJudgmentRecursive3(TypedDict, total=False):
-    """Relational arguments for Judgment"""
-    judgments: Union[bool, 'FindManyJudgmentArgsFromJudgmentRecursive4']
+JudgmentIncludeFromJudgmentRecursive3 = dict
 
 
-class UserIncludeFromJudgmentRecursive4(TypedDict, total=False):
-    """Relational arguments for Judgment"""
+JudgmentIncludeFromJudgmentRecursive4 = dict
 
     
 
-class UserArgsFromJudgment(TypedDict, total=False):
-    """Arguments for Judgment"""
-    include: 'UserIncludeFromUserRecursive1'
+JudgmentArgsFromJudgment = dict
 
 
-class UserArgsFromJudgmentRecursive1(TypedDict, total=False):
-    """Arguments for Judgment"""
-    include: 'UserIncludeFromUserRecursive2'
+JudgmentArgsFromJudgmentRecursive1 = dict
 
 
-class UserArgsFromJudgmentRecursive2(TypedDict, total=False):
-    """Arguments for Judgment"""
-    include: 'UserIncludeFromUserRecursive3'
+JudgmentArgsFromJudgmentRecursive2 = dict
 
 
-class UserArgsFromJudgmentRecursive3(TypedDict, total=False):
-    """Arguments for Judgment"""
-    include: 'UserIncludeFromUserRecursive4'
+JudgmentArgsFromJudgmentRecursive3 = dict
 
 
-class UserArgsFromJudgmentRecursive4(TypedDict, total=False):
-    """Arguments for Judgment"""
+JudgmentArgsFromJudgmentRecursive4 = dict
     
     
 
-class FindManyUserArgsFromJudgment(TypedDict, total=False):
-    """Arguments for Judgment"""
-    take: int
-    skip: int
-    order_by: Union['UserOrderByInput', List['UserOrderByInput']]
-    where: 'UserWhereInput'
-    cursor: 'UserWhereUniqueInput'
-    distinct: List['UserScalarFieldKeys']
-    include: 'UserIncludeFromUserRecursive1'
+FindManyJudgmentArgsFromJudgment = dict
 
 
-class FindManyUserArgsFromJudgmentRecursive1(TypedDict, total=False):
-    """Arguments for Judgment"""
-    take: int
-    skip: int
-    order_by: Union['UserOrderByInput', List['UserOrderByInput']]
-    where: 'UserWhereInput'
-    cursor: 'UserWhereUniqueInput'
-    distinct: List['UserScalarFieldKeys']
-    include: 'UserIncludeFromUserRecursive2'
+FindManyJudgmentArgsFromJudgmentRecursive1 = dict
 
 
-class FindManyUserArgsFromJudgmentRecursive2(TypedDict, total=False):
-    """Arguments for Judgment"""
-    take: int
-    skip: int
-    order_by: Union['UserOrderByInput', List['UserOrderByInput']]
-    where: 'UserWhereInput'
-    cursor: 'UserWhereUniqueInput'
-    distinct: List['UserScalarFieldKeys']
-    include: 'UserIncludeFromUserRecursive3'
+FindManyJudgmentArgsFromJudgmentRecursive2 = dict
 
 
-class FindManyUserArgsFromJudgmentRecursive3(TypedDict, total=False):
-    """Arguments for Judgment"""
-    take: int
-    skip: int
-    order_by: Union['UserOrderByInput', List['UserOrderByInput']]
-    where: 'UserWhereInput'
-    cursor: 'UserWhereUniqueInput'
-    distinct: List['UserScalarFieldKeys']
-    include: 'UserIncludeFromUserRecursive4'
+FindManyJudgmentArgsFromJudgmentRecursive3 = dict
 
 
-class FindManyUserArgsFromJudgmentRecursive4(TypedDict, total=False):
-    """Arguments for Judgment"""
-    take: int
-    skip: int
-    order_by: Union['UserOrderByInput', List['UserOrderByInput']]
-    where: 'UserWhereInput'
-    cursor: 'UserWhereUniqueInput'
-    distinct: List['UserScalarFieldKeys']
+FindManyJudgmentArgsFromJudgmentRecursive4 = dict
     
     
 
-class JudgmentIncludeFromJudgment(TypedDict, total=False):
-    """Relational arguments for Judgment"""
-    user: Union[bool, 'UserArgsFromJudgmentRecursive1']
-    suspects: Union[bool, 'FindManySuspectArgsFromJudgmentRecursive1']
-    blame: Union[bool, 'BlameArgsFromJudgmentRecursive1']
+SuspectIncludeFromJudgment = dict
 
 
-class JudgmentIncludeFromJudgmentRecursive1(TypedDict, total=False):
-    """Relational arguments for Judgment"""
-    user: Union[bool, 'UserArgsFromJudgmentRecursive2']
-    suspects: Union[bool, 'FindManySuspectArgsFromJudgmentRecursive2']
-    blame: Union[bool, 'BlameArgsFromJudgmentRecursive2']
+SuspectIncludeFromJudgmentRecursive1 = dict
 
 
-class JudgmentIncludeFromJudgmentRecursive2(TypedDict, total=False):
-    """Relational arguments for Judgment"""
-    user: Union[bool, 'UserArgsFromJudgmentRecursive3']
-    suspects: Union[bool, 'FindManySuspectArgsFromJudgmentRecursive3']
-    blame: Union[bool, 'BlameArgsFromJudgmentRecursive3']
+SuspectIncludeFromJudgmentRecursive2 = dict
 
 
-class JudgmentIncludeFromJudgmentRecursive3(TypedDict, total=False):
-    """Relational arguments for Judgment"""
-    user: Union[bool, 'UserArgsFromJudgmentRecursive4']
-    suspects: Union[bool, 'FindManySuspectArgsFromJudgmentRecursive4']
-    blame: Union[bool, 'BlameArgsFromJudgmentRecursive4']
+SuspectIncludeFromJudgmentRecursive3 = dict
 
 
-class JudgmentIncludeFromJudgmentRecursive4(TypedDict, total=False):
-    """Relational arguments for Judgment"""
+SuspectIncludeFromJudgmentRecursive4 = dict
 
     
 
-class JudgmentArgsFromJudgment(TypedDict, total=False):
-    """Arguments for Judgment"""
-    include: 'JudgmentIncludeFromJudgmentRecursive1'
+SuspectArgsFromJudgment = dict
 
 
-class JudgmentArgsFromJudgmentRecursive1(TypedDict, total=False):
-    """Arguments for Judgment"""
-    include: 'JudgmentIncludeFromJudgmentRecursive2'
+SuspectArgsFromJudgmentRecursive1 = dict
 
 
-class JudgmentArgsFromJudgmentRecursive2(TypedDict, total=False):
-    """Arguments for Judgment"""
-    include: 'JudgmentIncludeFromJudgmentRecursive3'
+SuspectArgsFromJudgmentRecursive2 = dict
 
 
-class JudgmentArgsFromJudgmentRecursive3(TypedDict, total=False):
-    """Arguments for Judgment"""
-    include: 'JudgmentIncludeFromJudgmentRecursive4'
+SuspectArgsFromJudgmentRecursive3 = dict
 
 
-class JudgmentArgsFromJudgmentRecursive4(TypedDict, total=False):
-    """Arguments for Judgment"""
+SuspectArgsFromJudgmentRecursive4 = dict
     
     
 
-class FindManyJudgmentArgsFromJudgment(TypedDict, total=False):
-    """Arguments for Judgment"""
-    take: int
-    skip: int
-    order_by: Union['JudgmentOrderByInput', List['JudgmentOrderByInput']]
-    where: 'JudgmentWhereInput'
-    cursor: 'JudgmentWhereUniqueInput'
-    distinct: List['JudgmentScalarFieldKeys']
-    include: 'JudgmentIncludeFromJudgmentRecursive1'
+FindManySuspectArgsFromJudgment = dict
 
 
-class FindManyJudgmentArgsFromJudgmentRecursive1(TypedDict, total=False):
-    """Arguments for Judgment"""
-    take: int
-    skip: int
-    order_by: Union['JudgmentOrderByInput', List['JudgmentOrderByInput']]
-    where: 'JudgmentWhereInput'
-    cursor: 'JudgmentWhereUniqueInput'
-    distinct: List['JudgmentScalarFieldKeys']
-    include: 'JudgmentIncludeFromJudgmentRecursive2'
+FindManySuspectArgsFromJudgmentRecursive1 = dict
 
 
-class FindManyJudgmentArgsFromJudgmentRecursive2(TypedDict, total=False):
-    """Arguments for Judgment"""
-    take: int
-    skip: int
-    order_by: Union['JudgmentOrderByInput', List['JudgmentOrderByInput']]
-    where: 'JudgmentWhereInput'
-    cursor: 'JudgmentWhereUniqueInput'
-    distinct: List['JudgmentScalarFieldKeys']
-    include: 'JudgmentIncludeFromJudgmentRecursive3'
+FindManySuspectArgsFromJudgmentRecursive2 = dict
 
 
-class FindManyJudgmentArgsFromJudgmentRecursive3(TypedDict, total=False):
-    """Arguments for Judgment"""
-    take: int
-    skip: int
-    order_by: Union['JudgmentOrderByInput', List['JudgmentOrderByInput']]
-    where: 'JudgmentWhereInput'
-    cursor: 'JudgmentWhereUniqueInput'
-    distinct: List['JudgmentScalarFieldKeys']
-    include: 'JudgmentIncludeFromJudgmentRecursive4'
+FindManySuspectArgsFromJudgmentRecursive3 = dict
 
 
-class FindManyJudgmentArgsFromJudgmentRecursive4(TypedDict, total=False):
-    """Arguments for Judgment"""
-    take: int
-    skip: int
-    order_by: Union['JudgmentOrderByInput', List['JudgmentOrderByInput']]
-    where: 'JudgmentWhereInput'
-    cursor: 'JudgmentWhereUniqueInput'
-    distinct: List['JudgmentScalarFieldKeys']
+FindManySuspectArgsFromJudgmentRecursive4 = dict
     
     
 
-class SuspectIncludeFromJudgment(TypedDict, total=False):
-    """Relational arguments for Judgment"""
-    judgment: Union[bool, 'JudgmentArgsFromJudgmentRecursive1']
+BlameIncludeFromJudgment = dict
 
 
-class SuspectIncludeFromJudgmentRecursive1(TypedDict, total=False):
-    """Relational arguments for Judgment"""
-    judgment: Union[bool, 'JudgmentArgsFromJudgmentRecursive2']
+BlameIncludeFromJudgmentRecursive1 = dict
 
 
-class SuspectIncludeFromJudgmentRecursive2(TypedDict, total=False):
-    """Relational arguments for Judgment"""
-    judgment: Union[bool, 'JudgmentArgsFromJudgmentRecursive3']
+BlameIncludeFromJudgmentRecursive2 = dict
 
 
-class SuspectIncludeFromJudgmentRecursive3(TypedDict, total=False):
-    """Relational arguments for Judgment"""
-    judgment: Union[bool, 'JudgmentArgsFromJudgmentRecursive4']
+BlameIncludeFromJudgmentRecursive3 = dict
 
 
-class SuspectIncludeFromJudgmentRecursive4(TypedDict, total=False):
-    """Relational arguments for Judgment"""
+BlameIncludeFromJudgmentRecursive4 = dict
 
     
 
-class SuspectArgsFromJudgment(TypedDict, total=False):
-    """Arguments for Judgment"""
-    include: 'SuspectIncludeFromSuspectRecursive1'
+BlameArgsFromJudgment = dict
 
 
-class SuspectArgsFromJudgmentRecursive1(TypedDict, total=False):
-    """Arguments for Judgment"""
-    include: 'SuspectIncludeFromSuspectRecursive2'
+BlameArgsFromJudgmentRecursive1 = dict
 
 
-class SuspectArgsFromJudgmentRecursive2(TypedDict, total=False):
-    """Arguments for Judgment"""
-    include: 'SuspectIncludeFromSuspectRecursive3'
+BlameArgsFromJudgmentRecursive2 = dict
 
 
-class SuspectArgsFromJudgmentRecursive3(TypedDict, total=False):
-    """Arguments for Judgment"""
-    include: 'SuspectIncludeFromSuspectRecursive4'
+BlameArgsFromJudgmentRecursive3 = dict
 
 
-class SuspectArgsFromJudgmentRecursive4(TypedDict, total=False):
-    """Arguments for Judgment"""
+BlameArgsFromJudgmentRecursive4 = dict
     
     
 
-class FindManySuspectArgsFromJudgment(TypedDict, total=False):
-    """Arguments for Judgment"""
-    take: int
-    skip: int
-    order_by: Union['SuspectOrderByInput', List['SuspectOrderByInput']]
-    where: 'SuspectWhereInput'
-    cursor: 'SuspectWhereUniqueInput'
-    distinct: List['SuspectScalarFieldKeys']
-    include: 'SuspectIncludeFromSuspectRecursive1'
+FindManyBlameArgsFromJudgment = dict
 
 
-class FindManySuspectArgsFromJudgmentRecursive1(TypedDict, total=False):
-    """Arguments for Judgment"""
-    take: int
-    skip: int
-    order_by: Union['SuspectOrderByInput', List['SuspectOrderByInput']]
-    where: 'SuspectWhereInput'
-    cursor: 'SuspectWhereUniqueInput'
-    distinct: List['SuspectScalarFieldKeys']
-    include: 'SuspectIncludeFromSuspectRecursive2'
+FindManyBlameArgsFromJudgmentRecursive1 = dict
 
 
-class FindManySuspectArgsFromJudgmentRecursive2(TypedDict, total=False):
-    """Arguments for Judgment"""
-    take: int
-    skip: int
-    order_by: Union['SuspectOrderByInput', List['SuspectOrderByInput']]
-    where: 'SuspectWhereInput'
-    cursor: 'SuspectWhereUniqueInput'
-    distinct: List['SuspectScalarFieldKeys']
-    include: 'SuspectIncludeFromSuspectRecursive3'
+FindManyBlameArgsFromJudgmentRecursive2 = dict
 
 
-class FindManySuspectArgsFromJudgmentRecursive3(TypedDict, total=False):
-    """Arguments for Judgment"""
-    take: int
-    skip: int
-    order_by: Union['SuspectOrderByInput', List['SuspectOrderByInput']]
-    where: 'SuspectWhereInput'
-    cursor: 'SuspectWhereUniqueInput'
-    distinct: List['SuspectScalarFieldKeys']
-    include: 'SuspectIncludeFromSuspectRecursive4'
+FindManyBlameArgsFromJudgmentRecursive3 = dict
 
 
-class FindManySuspectArgsFromJudgmentRecursive4(TypedDict, total=False):
-    """Arguments for Judgment"""
-    take: int
-    skip: int
-    order_by: Union['SuspectOrderByInput', List['SuspectOrderByInput']]
-    where: 'SuspectWhereInput'
-    cursor: 'SuspectWhereUniqueInput'
-    distinct: List['SuspectScalarFieldKeys']
+FindManyBlameArgsFromJudgmentRecursive4 = dict
     
     
 
-class BlameIncludeFromJudgment(TypedDict, total=False):
-    """Relational arguments for Judgment"""
-    judgment: Union[bool, 'JudgmentArgsFromJudgmentRecursive1']
+AnalysisJobIncludeFromJudgment = dict
 
 
-class BlameIncludeFromJudgmentRecursive1(TypedDict, total=False):
-    """Relational arguments for Judgment"""
-    judgment: Union[bool, 'JudgmentArgsFromJudgmentRecursive2']
+AnalysisJobIncludeFromJudgmentRecursive1 = dict
 
 
-class BlameIncludeFromJudgmentRecursive2(TypedDict, total=False):
-    """Relational arguments for Judgment"""
-    judgment: Union[bool, 'JudgmentArgsFromJudgmentRecursive3']
+AnalysisJobIncludeFromJudgmentRecursive2 = dict
 
 
-class BlameIncludeFromJudgmentRecursive3(TypedDict, total=False):
-    """Relational arguments for Judgment"""
-    judgment: Union[bool, 'JudgmentArgsFromJudgmentRecursive4']
+AnalysisJobIncludeFromJudgmentRecursive3 = dict
 
 
-class BlameIncludeFromJudgmentRecursive4(TypedDict, total=False):
-    """Relational arguments for Judgment"""
+AnalysisJobIncludeFromJudgmentRecursive4 = dict
 
     
 
-class BlameArgsFromJudgment(TypedDict, total=False):
-    """Arguments for Judgment"""
-    include: 'BlameIncludeFromBlameRecursive1'
+AnalysisJobArgsFromJudgment = dict
 
 
-class BlameArgsFromJudgmentRecursive1(TypedDict, total=False):
-    """Arguments for Judgment"""
-    include: 'BlameIncludeFromBlameRecursive2'
+AnalysisJobArgsFromJudgmentRecursive1 = dict
 
 
-class BlameArgsFromJudgmentRecursive2(TypedDict, total=False):
-    """Arguments for Judgment"""
-    include: 'BlameIncludeFromBlameRecursive3'
+AnalysisJobArgsFromJudgmentRecursive2 = dict
 
 
-class BlameArgsFromJudgmentRecursive3(TypedDict, total=False):
-    """Arguments for Judgment"""
-    include: 'BlameIncludeFromBlameRecursive4'
+AnalysisJobArgsFromJudgmentRecursive3 = dict
 
 
-class BlameArgsFromJudgmentRecursive4(TypedDict, total=False):
-    """Arguments for Judgment"""
+AnalysisJobArgsFromJudgmentRecursive4 = dict
     
     
 
-class FindManyBlameArgsFromJudgment(TypedDict, total=False):
-    """Arguments for Judgment"""
-    take: int
-    skip: int
-    order_by: Union['BlameOrderByInput', List['BlameOrderByInput']]
-    where: 'BlameWhereInput'
-    cursor: 'BlameWhereUniqueInput'
-    distinct: List['BlameScalarFieldKeys']
-    include: 'BlameIncludeFromBlameRecursive1'
+FindManyAnalysisJobArgsFromJudgment = dict
 
 
-class FindManyBlameArgsFromJudgmentRecursive1(TypedDict, total=False):
-    """Arguments for Judgment"""
-    take: int
-    skip: int
-    order_by: Union['BlameOrderByInput', List['BlameOrderByInput']]
-    where: 'BlameWhereInput'
-    cursor: 'BlameWhereUniqueInput'
-    distinct: List['BlameScalarFieldKeys']
-    include: 'BlameIncludeFromBlameRecursive2'
+FindManyAnalysisJobArgsFromJudgmentRecursive1 = dict
 
 
-class FindManyBlameArgsFromJudgmentRecursive2(TypedDict, total=False):
-    """Arguments for Judgment"""
-    take: int
-    skip: int
-    order_by: Union['BlameOrderByInput', List['BlameOrderByInput']]
-    where: 'BlameWhereInput'
-    cursor: 'BlameWhereUniqueInput'
-    distinct: List['BlameScalarFieldKeys']
-    include: 'BlameIncludeFromBlameRecursive3'
+FindManyAnalysisJobArgsFromJudgmentRecursive2 = dict
 
 
-class FindManyBlameArgsFromJudgmentRecursive3(TypedDict, total=False):
-    """Arguments for Judgment"""
-    take: int
-    skip: int
-    order_by: Union['BlameOrderByInput', List['BlameOrderByInput']]
-    where: 'BlameWhereInput'
-    cursor: 'BlameWhereUniqueInput'
-    distinct: List['BlameScalarFieldKeys']
-    include: 'BlameIncludeFromBlameRecursive4'
+FindManyAnalysisJobArgsFromJudgmentRecursive3 = dict
 
 
-class FindManyBlameArgsFromJudgmentRecursive4(TypedDict, total=False):
-    """Arguments for Judgment"""
-    take: int
-    skip: int
-    order_by: Union['BlameOrderByInput', List['BlameOrderByInput']]
-    where: 'BlameWhereInput'
-    cursor: 'BlameWhereUniqueInput'
-    distinct: List['BlameScalarFieldKeys']
+FindManyAnalysisJobArgsFromJudgmentRecursive4 = dict
     
 
 
@@ -2806,118 +1414,19 @@ FindFirstJudgmentArgs = FindManyJudgmentArgsFromJudgment
 
     
 
-class JudgmentWhereInput(TypedDict, total=False):
-    """Judgment arguments for searching"""
-    id: Union[_str, 'types.StringFilter']
-    user_id: Union[_str, 'types.StringFilter']
-    repo_owner: Union[_str, 'types.StringFilter']
-    repo_name: Union[_str, 'types.StringFilter']
-    title: Union[_str, 'types.StringFilter']
-    description: Union[None, _str, 'types.StringFilter']
-    file_path: Union[None, _str, 'types.StringFilter']
-    period_days: Union[_int, 'types.IntFilter']
-    status: Union[_str, 'types.StringFilter']
-    case_number: Union[_str, 'types.StringFilter']
-    created_at: Union[datetime.datetime, 'types.DateTimeFilter']
-    user: 'UserRelationFilter'
-    suspects: 'SuspectListRelationFilter'
-    blame: 'BlameRelationFilter'
-
-    # should be noted that AND and NOT should be Union['JudgmentWhereInputRecursive1', List['JudgmentWhereInputRecursive1']]
-    # but this causes mypy to hang :/
-    AND: List['JudgmentWhereInputRecursive1']
-    OR: List['JudgmentWhereInputRecursive1']
-    NOT: List['JudgmentWhereInputRecursive1']
-
-
-class JudgmentWhereInputRecursive1(TypedDict, total=False):
-    """Judgment arguments for searching"""
-    id: Union[_str, 'types.StringFilter']
-    user_id: Union[_str, 'types.StringFilter']
-    repo_owner: Union[_str, 'types.StringFilter']
-    repo_name: Union[_str, 'types.StringFilter']
-    title: Union[_str, 'types.StringFilter']
-    description: Union[None, _str, 'types.StringFilter']
-    file_path: Union[None, _str, 'types.StringFilter']
-    period_days: Union[_int, 'types.IntFilter']
-    status: Union[_str, 'types.StringFilter']
-    case_number: Union[_str, 'types.StringFilter']
-    created_at: Union[datetime.datetime, 'types.DateTimeFilter']
-    user: 'UserRelationFilter'
-    suspects: 'SuspectListRelationFilter'
-    blame: 'BlameRelationFilter'
-
-    # should be noted that AND and NOT should be Union['JudgmentWhereInputRecursive2', List['JudgmentWhereInputRecursive2']]
-    # but this causes mypy to hang :/
-    AND: List['JudgmentWhereInputRecursive2']
-    OR: List['JudgmentWhereInputRecursive2']
-    NOT: List['JudgmentWhereInputRecursive2']
-
-
-class JudgmentWhereInputRecursive2(TypedDict, total=False):
-    """Judgment arguments for searching"""
-    id: Union[_str, 'types.StringFilter']
-    user_id: Union[_str, 'types.StringFilter']
-    repo_owner: Union[_str, 'types.StringFilter']
-    repo_name: Union[_str, 'types.StringFilter']
-    title: Union[_str, 'types.StringFilter']
-    description: Union[None, _str, 'types.StringFilter']
-    file_path: Union[None, _str, 'types.StringFilter']
-    period_days: Union[_int, 'types.IntFilter']
-    status: Union[_str, 'types.StringFilter']
-    case_number: Union[_str, 'types.StringFilter']
-    created_at: Union[datetime.datetime, 'types.DateTimeFilter']
-    user: 'UserRelationFilter'
-    suspects: 'SuspectListRelationFilter'
-    blame: 'BlameRelationFilter'
-
-    # should be noted that AND and NOT should be Union['JudgmentWhereInputRecursive3', List['JudgmentWhereInputRecursive3']]
-    # but this causes mypy to hang :/
-    AND: List['JudgmentWhereInputRecursive3']
-    OR: List['JudgmentWhereInputRecursive3']
-    NOT: List['JudgmentWhereInputRecursive3']
-
-
-class JudgmentWhereInputRecursive3(TypedDict, total=False):
-    """Judgment arguments for searching"""
-    id: Union[_str, 'types.StringFilter']
-    user_id: Union[_str, 'types.StringFilter']
-    repo_owner: Union[_str, 'types.StringFilter']
-    repo_name: Union[_str, 'types.StringFilter']
-    title: Union[_str, 'types.StringFilter']
-    description: Union[None, _str, 'types.StringFilter']
-    file_path: Union[None, _str, 'types.StringFilter']
-    period_days: Union[_int, 'types.IntFilter']
-    status: Union[_str, 'types.StringFilter']
-    case_number: Union[_str, 'types.StringFilter']
-    created_at: Union[datetime.datetime, 'types.DateTimeFilter']
-    user: 'UserRelationFilter'
-    suspects: 'SuspectListRelationFilter'
-    blame: 'BlameRelationFilter'
-
-    # should be noted that AND and NOT should be Union['JudgmentWhereInputRecursive4', List['JudgmentWhereInputRecursive4']]
-    # but this causes mypy to hang :/
-    AND: List['JudgmentWhereInputRecursive4']
-    OR: List['JudgmentWhereInputRecursive4']
-    NOT: List['JudgmentWhereInputRecursive4']
-
-
-class JudgmentWhereInputRecursive4(TypedDict, total=False):
-    """Judgment arguments for searching"""
-    id: Union[_str, 'types.StringFilter']
-    user_id: Union[_str, 'types.StringFilter']
-    repo_owner: Union[_str, 'types.StringFilter']
-    repo_name: Union[_str, 'types.StringFilter']
-    title: Union[_str, 'types.StringFilter']
-    description: Union[None, _str, 'types.StringFilter']
-    file_path: Union[None, _str, 'types.StringFilter']
-    period_days: Union[_int, 'types.IntFilter']
-    status: Union[_str, 'types.StringFilter']
-    case_number: Union[_str, 'types.StringFilter']
-    created_at: Union[datetime.datetime, 'types.DateTimeFilter']
-    user: 'UserRelationFilter'
-    suspects: 'SuspectListRelationFilter'
-    blame: 'BlameRelationFilter'
+JudgmentWhereInput = dict
+
+
+JudgmentWhereInputRecursive1 = dict
+
+
+JudgmentWhereInputRecursive2 = dict
+
+
+JudgmentWhereInputRecursive3 = dict
+
+
+JudgmentWhereInputRecursive4 = dict
 
 
 
@@ -2926,222 +1435,54 @@ class JudgmentWhereInputRecursive4(TypedDict, total=False):
 
     
 
-class JudgmentScalarWhereWithAggregatesInput(TypedDict, total=False):
-    """Judgment arguments for searching"""
-    id: Union[_str, 'types.StringWithAggregatesFilter']
-    user_id: Union[_str, 'types.StringWithAggregatesFilter']
-    repo_owner: Union[_str, 'types.StringWithAggregatesFilter']
-    repo_name: Union[_str, 'types.StringWithAggregatesFilter']
-    title: Union[_str, 'types.StringWithAggregatesFilter']
-    description: Union[_str, 'types.StringWithAggregatesFilter']
-    file_path: Union[_str, 'types.StringWithAggregatesFilter']
-    period_days: Union[_int, 'types.IntWithAggregatesFilter']
-    status: Union[_str, 'types.StringWithAggregatesFilter']
-    case_number: Union[_str, 'types.StringWithAggregatesFilter']
-    created_at: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
-
-    AND: List['JudgmentScalarWhereWithAggregatesInputRecursive1']
-    OR: List['JudgmentScalarWhereWithAggregatesInputRecursive1']
-    NOT: List['JudgmentScalarWhereWithAggregatesInputRecursive1']
-
-
-class JudgmentScalarWhereWithAggregatesInputRecursive1(TypedDict, total=False):
-    """Judgment arguments for searching"""
-    id: Union[_str, 'types.StringWithAggregatesFilter']
-    user_id: Union[_str, 'types.StringWithAggregatesFilter']
-    repo_owner: Union[_str, 'types.StringWithAggregatesFilter']
-    repo_name: Union[_str, 'types.StringWithAggregatesFilter']
-    title: Union[_str, 'types.StringWithAggregatesFilter']
-    description: Union[_str, 'types.StringWithAggregatesFilter']
-    file_path: Union[_str, 'types.StringWithAggregatesFilter']
-    period_days: Union[_int, 'types.IntWithAggregatesFilter']
-    status: Union[_str, 'types.StringWithAggregatesFilter']
-    case_number: Union[_str, 'types.StringWithAggregatesFilter']
-    created_at: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
-
-    AND: List['JudgmentScalarWhereWithAggregatesInputRecursive2']
-    OR: List['JudgmentScalarWhereWithAggregatesInputRecursive2']
-    NOT: List['JudgmentScalarWhereWithAggregatesInputRecursive2']
-
-
-class JudgmentScalarWhereWithAggregatesInputRecursive2(TypedDict, total=False):
-    """Judgment arguments for searching"""
-    id: Union[_str, 'types.StringWithAggregatesFilter']
-    user_id: Union[_str, 'types.StringWithAggregatesFilter']
-    repo_owner: Union[_str, 'types.StringWithAggregatesFilter']
-    repo_name: Union[_str, 'types.StringWithAggregatesFilter']
-    title: Union[_str, 'types.StringWithAggregatesFilter']
-    description: Union[_str, 'types.StringWithAggregatesFilter']
-    file_path: Union[_str, 'types.StringWithAggregatesFilter']
-    period_days: Union[_int, 'types.IntWithAggregatesFilter']
-    status: Union[_str, 'types.StringWithAggregatesFilter']
-    case_number: Union[_str, 'types.StringWithAggregatesFilter']
-    created_at: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
-
-    AND: List['JudgmentScalarWhereWithAggregatesInputRecursive3']
-    OR: List['JudgmentScalarWhereWithAggregatesInputRecursive3']
-    NOT: List['JudgmentScalarWhereWithAggregatesInputRecursive3']
-
-
-class JudgmentScalarWhereWithAggregatesInputRecursive3(TypedDict, total=False):
-    """Judgment arguments for searching"""
-    id: Union[_str, 'types.StringWithAggregatesFilter']
-    user_id: Union[_str, 'types.StringWithAggregatesFilter']
-    repo_owner: Union[_str, 'types.StringWithAggregatesFilter']
-    repo_name: Union[_str, 'types.StringWithAggregatesFilter']
-    title: Union[_str, 'types.StringWithAggregatesFilter']
-    description: Union[_str, 'types.StringWithAggregatesFilter']
-    file_path: Union[_str, 'types.StringWithAggregatesFilter']
-    period_days: Union[_int, 'types.IntWithAggregatesFilter']
-    status: Union[_str, 'types.StringWithAggregatesFilter']
-    case_number: Union[_str, 'types.StringWithAggregatesFilter']
-    created_at: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
-
-    AND: List['JudgmentScalarWhereWithAggregatesInputRecursive4']
-    OR: List['JudgmentScalarWhereWithAggregatesInputRecursive4']
-    NOT: List['JudgmentScalarWhereWithAggregatesInputRecursive4']
-
-
-class JudgmentScalarWhereWithAggregatesInputRecursive4(TypedDict, total=False):
-    """Judgment arguments for searching"""
-    id: Union[_str, 'types.StringWithAggregatesFilter']
-    user_id: Union[_str, 'types.StringWithAggregatesFilter']
-    repo_owner: Union[_str, 'types.StringWithAggregatesFilter']
-    repo_name: Union[_str, 'types.StringWithAggregatesFilter']
-    title: Union[_str, 'types.StringWithAggregatesFilter']
-    description: Union[_str, 'types.StringWithAggregatesFilter']
-    file_path: Union[_str, 'types.StringWithAggregatesFilter']
-    period_days: Union[_int, 'types.IntWithAggregatesFilter']
-    status: Union[_str, 'types.StringWithAggregatesFilter']
-    case_number: Union[_str, 'types.StringWithAggregatesFilter']
-    created_at: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
-
-
-
-class JudgmentGroupByOutput(TypedDict, total=False):
-    id: _str
-    user_id: _str
-    repo_owner: _str
-    repo_name: _str
-    title: _str
-    description: _str
-    file_path: _str
-    period_days: _int
-    status: _str
-    case_number: _str
-    created_at: datetime.datetime
-    _sum: 'JudgmentSumAggregateOutput'
-    _avg: 'JudgmentAvgAggregateOutput'
-    _min: 'JudgmentMinAggregateOutput'
-    _max: 'JudgmentMaxAggregateOutput'
-    _count: 'JudgmentCountAggregateOutput'
-
-
-class JudgmentAvgAggregateOutput(TypedDict, total=False):
-    """Judgment output for aggregating averages"""
-    period_days: float
-
-
-class JudgmentSumAggregateOutput(TypedDict, total=False):
-    """Judgment output for aggregating sums"""
-    period_days: _int
-
-
-class JudgmentScalarAggregateOutput(TypedDict, total=False):
-    """Judgment output including scalar fields"""
-    id: _str
-    user_id: _str
-    repo_owner: _str
-    repo_name: _str
-    title: _str
-    description: _str
-    file_path: _str
-    period_days: _int
-    status: _str
-    case_number: _str
-    created_at: datetime.datetime
+JudgmentScalarWhereWithAggregatesInput = dict
+
+
+JudgmentScalarWhereWithAggregatesInputRecursive1 = dict
+
+
+JudgmentScalarWhereWithAggregatesInputRecursive2 = dict
+
+
+JudgmentScalarWhereWithAggregatesInputRecursive3 = dict
+
+
+JudgmentScalarWhereWithAggregatesInputRecursive4 = dict
+
+
+
+JudgmentGroupByOutput = dict
+
+
+JudgmentAvgAggregateOutput = dict
+
+
+JudgmentSumAggregateOutput = dict
+
+
+JudgmentScalarAggregateOutput = dict
 
 
 JudgmentMinAggregateOutput = JudgmentScalarAggregateOutput
 JudgmentMaxAggregateOutput = JudgmentScalarAggregateOutput
 
 
-class JudgmentMaxAggregateInput(TypedDict, total=False):
-    """Judgment input for aggregating by max"""
-    id: bool
-    user_id: bool
-    repo_owner: bool
-    repo_name: bool
-    title: bool
-    description: bool
-    file_path: bool
-    period_days: bool
-    status: bool
-    case_number: bool
-    created_at: bool
-
-
-class JudgmentMinAggregateInput(TypedDict, total=False):
-    """Judgment input for aggregating by min"""
-    id: bool
-    user_id: bool
-    repo_owner: bool
-    repo_name: bool
-    title: bool
-    description: bool
-    file_path: bool
-    period_days: bool
-    status: bool
-    case_number: bool
-    created_at: bool
-
-
-class JudgmentNumberAggregateInput(TypedDict, total=False):
-    """Judgment input for aggregating numbers"""
-    period_days: bool
+JudgmentMaxAggregateInput = dict
+
+
+JudgmentMinAggregateInput = dict
+
+
+JudgmentNumberAggregateInput = dict
 
 
 JudgmentAvgAggregateInput = JudgmentNumberAggregateInput
 JudgmentSumAggregateInput = JudgmentNumberAggregateInput
 
 
-JudgmentCountAggregateInput = TypedDict(
-    'JudgmentCountAggregateInput',
-    {
-        'id': bool,
-        'user_id': bool,
-        'repo_owner': bool,
-        'repo_name': bool,
-        'title': bool,
-        'description': bool,
-        'file_path': bool,
-        'period_days': bool,
-        'status': bool,
-        'case_number': bool,
-        'created_at': bool,
-        '_all': bool,
-    },
-    total=False,
-)
+JudgmentCountAggregateInput = dict
 
-JudgmentCountAggregateOutput = TypedDict(
-    'JudgmentCountAggregateOutput',
-    {
-        'id': int,
-        'user_id': int,
-        'repo_owner': int,
-        'repo_name': int,
-        'title': int,
-        'description': int,
-        'file_path': int,
-        'period_days': int,
-        'status': int,
-        'case_number': int,
-        'created_at': int,
-        '_all': int,
-    },
-    total=False,
-)
+JudgmentCountAggregateOutput = dict
 
 
 JudgmentKeys = Literal[
@@ -3159,6 +1500,7 @@ JudgmentKeys = Literal[
     'user',
     'suspects',
     'blame',
+    'jobs',
 ]
 JudgmentScalarFieldKeys = Literal[
     'id',
@@ -3179,100 +1521,44 @@ JudgmentRelationalFieldKeys = Literal[
         'user',
         'suspects',
         'blame',
+        'jobs',
     ]
 
 # Suspect types
 
-class SuspectOptionalCreateInput(TypedDict, total=False):
-    """Optional arguments to the Suspect create method"""
-    id: _str
-    judgment_id: _str
-    avatar_url: Optional[_str]
-    reason: Optional[_str]
-    commit_count: Optional[_int]
-    last_commit_msg: Optional[_str]
-    last_commit_date: Optional[datetime.datetime]
-    judgment: 'JudgmentCreateNestedWithoutRelationsInput'
+SuspectOptionalCreateInput = dict
 
 
-class SuspectCreateInput(SuspectOptionalCreateInput):
-    """Required arguments to the Suspect create method"""
-    username: _str
-    responsibility: _int
+SuspectCreateInput = dict
 
 
 # TODO: remove this in favour of without explicit relations
 # e.g. PostCreateWithoutAuthorInput
 
-class SuspectOptionalCreateWithoutRelationsInput(TypedDict, total=False):
-    """Optional arguments to the Suspect create method, without relations"""
-    id: _str
-    judgment_id: _str
-    avatar_url: Optional[_str]
-    reason: Optional[_str]
-    commit_count: Optional[_int]
-    last_commit_msg: Optional[_str]
-    last_commit_date: Optional[datetime.datetime]
+SuspectOptionalCreateWithoutRelationsInput = dict
 
 
-class SuspectCreateWithoutRelationsInput(SuspectOptionalCreateWithoutRelationsInput):
-    """Required arguments to the Suspect create method, without relations"""
-    username: _str
-    responsibility: _int
+SuspectCreateWithoutRelationsInput = dict
 
 
-class SuspectCreateNestedWithoutRelationsInput(TypedDict, total=False):
-    create: 'SuspectCreateWithoutRelationsInput'
-    connect: 'SuspectWhereUniqueInput'
+SuspectCreateNestedWithoutRelationsInput = dict
 
 
-class SuspectCreateManyNestedWithoutRelationsInput(TypedDict, total=False):
-    create: Union['SuspectCreateWithoutRelationsInput', List['SuspectCreateWithoutRelationsInput']]
-    connect: Union['SuspectWhereUniqueInput', List['SuspectWhereUniqueInput']]
+SuspectCreateManyNestedWithoutRelationsInput = dict
 
 
-_SuspectWhereUnique_id_Input = TypedDict(
-    '_SuspectWhereUnique_id_Input',
-    {
-        'id': '_str',
-    },
-    total=True
-)
+_SuspectWhereUnique_id_Input = dict
 
 SuspectWhereUniqueInput = _SuspectWhereUnique_id_Input
 
 
-class SuspectUpdateInput(TypedDict, total=False):
-    """Optional arguments for updating a record"""
-    id: _str
-    username: _str
-    avatar_url: Optional[_str]
-    responsibility: Union[AtomicIntInput, _int]
-    reason: Optional[_str]
-    commit_count: Optional[Union[AtomicIntInput, _int]]
-    last_commit_msg: Optional[_str]
-    last_commit_date: Optional[datetime.datetime]
-    judgment: 'JudgmentUpdateOneWithoutRelationsInput'
-
-
-class SuspectUpdateManyMutationInput(TypedDict, total=False):
-    """Arguments for updating many records"""
-    id: _str
-    username: _str
-    avatar_url: Optional[_str]
-    responsibility: Union[AtomicIntInput, _int]
-    reason: Optional[_str]
-    commit_count: Optional[Union[AtomicIntInput, _int]]
-    last_commit_msg: Optional[_str]
-    last_commit_date: Optional[datetime.datetime]
-
-
-class SuspectUpdateManyWithoutRelationsInput(TypedDict, total=False):
-    create: List['SuspectCreateWithoutRelationsInput']
-    connect: List['SuspectWhereUniqueInput']
-    set: List['SuspectWhereUniqueInput']
-    disconnect: List['SuspectWhereUniqueInput']
-    delete: List['SuspectWhereUniqueInput']
+SuspectUpdateInput = dict
+
+
+SuspectUpdateManyMutationInput = dict
+
+
+SuspectUpdateManyWithoutRelationsInput = dict
 
     # TODO
     # update: List['SuspectUpdateWithWhereUniqueWithoutRelationsInput']
@@ -3282,11 +1568,7 @@ class SuspectUpdateManyWithoutRelationsInput(TypedDict, total=False):
     # connectOrCreate: List['SuspectCreateOrConnectWithoutRelationsInput']
 
 
-class SuspectUpdateOneWithoutRelationsInput(TypedDict, total=False):
-    create: 'SuspectCreateWithoutRelationsInput'
-    connect: 'SuspectWhereUniqueInput'
-    disconnect: bool
-    delete: bool
+SuspectUpdateOneWithoutRelationsInput = dict
 
     # TODO
     # update: 'SuspectUpdateInput'
@@ -3294,82 +1576,26 @@ class SuspectUpdateOneWithoutRelationsInput(TypedDict, total=False):
     # connectOrCreate: 'SuspectCreateOrConnectWithoutRelationsInput'
 
 
-class SuspectUpsertInput(TypedDict):
-    create: 'SuspectCreateInput'
-    update: 'SuspectUpdateInput'  # pyright: ignore[reportIncompatibleMethodOverride]
+SuspectUpsertInput = dict
 
 
-_Suspect_id_OrderByInput = TypedDict(
-    '_Suspect_id_OrderByInput',
-    {
-        'id': 'SortOrder',
-    },
-    total=True
-)
+_Suspect_id_OrderByInput = dict
 
-_Suspect_judgment_id_OrderByInput = TypedDict(
-    '_Suspect_judgment_id_OrderByInput',
-    {
-        'judgment_id': 'SortOrder',
-    },
-    total=True
-)
+_Suspect_judgment_id_OrderByInput = dict
 
-_Suspect_username_OrderByInput = TypedDict(
-    '_Suspect_username_OrderByInput',
-    {
-        'username': 'SortOrder',
-    },
-    total=True
-)
+_Suspect_username_OrderByInput = dict
 
-_Suspect_avatar_url_OrderByInput = TypedDict(
-    '_Suspect_avatar_url_OrderByInput',
-    {
-        'avatar_url': 'SortOrder',
-    },
-    total=True
-)
+_Suspect_avatar_url_OrderByInput = dict
 
-_Suspect_responsibility_OrderByInput = TypedDict(
-    '_Suspect_responsibility_OrderByInput',
-    {
-        'responsibility': 'SortOrder',
-    },
-    total=True
-)
+_Suspect_responsibility_OrderByInput = dict
 
-_Suspect_reason_OrderByInput = TypedDict(
-    '_Suspect_reason_OrderByInput',
-    {
-        'reason': 'SortOrder',
-    },
-    total=True
-)
+_Suspect_reason_OrderByInput = dict
 
-_Suspect_commit_count_OrderByInput = TypedDict(
-    '_Suspect_commit_count_OrderByInput',
-    {
-        'commit_count': 'SortOrder',
-    },
-    total=True
-)
+_Suspect_commit_count_OrderByInput = dict
 
-_Suspect_last_commit_msg_OrderByInput = TypedDict(
-    '_Suspect_last_commit_msg_OrderByInput',
-    {
-        'last_commit_msg': 'SortOrder',
-    },
-    total=True
-)
+_Suspect_last_commit_msg_OrderByInput = dict
 
-_Suspect_last_commit_date_OrderByInput = TypedDict(
-    '_Suspect_last_commit_date_OrderByInput',
-    {
-        'last_commit_date': 'SortOrder',
-    },
-    total=True
-)
+_Suspect_last_commit_date_OrderByInput = dict
 
 SuspectOrderByInput = Union[
     '_Suspect_id_OrderByInput',
@@ -3393,773 +1619,345 @@ SuspectOrderByInput = Union[
 # see https://github.com/RobertCraigie/prisma-client-py/issues/45
 # switch to pyright for improved types, see https://prisma-client-py.readthedocs.io/en/stable/reference/limitations/
 
-SuspectRelationFilter = TypedDict(
-    'SuspectRelationFilter',
-    {
-        'is': 'Dict[str, Any]',
-        'is_not': 'Dict[str, Any]',
-    },
-    total=False,
-)
+SuspectRelationFilter = dict
 
 
-class SuspectListRelationFilter(TypedDict, total=False):
-    some: 'Dict[str, Any]'
-    none: 'Dict[str, Any]'
-    every: 'Dict[str, Any]'
+SuspectListRelationFilter = dict
 
 
-class SuspectInclude(TypedDict, total=False):
-    """Suspect relational arguments"""
-    judgment: Union[bool, 'JudgmentArgsFromSuspect']
+SuspectInclude = dict
 
 
     
 
-class UserIncludeFromSuspect(TypedDict, total=False):
-    """Relational arguments for Suspect"""
-    judgments: Union[bool, 'FindManyJudgmentArgsFromSuspectRecursive1']
+UserIncludeFromSuspect = dict
 
 
-class UserIncludeFromSuspectRecursive1(TypedDict, total=False):
-    """Relational arguments for Suspect"""
-    judgments: Union[bool, 'FindManyJudgmentArgsFromSuspectRecursive2']
+UserIncludeFromSuspectRecursive1 = dict
 
 
-class UserIncludeFromSuspectRecursive2(TypedDict, total=False):
-    """Relational arguments for Suspect"""
-    judgments: Union[bool, 'FindManyJudgmentArgsFromSuspectRecursive3']
+UserIncludeFromSuspectRecursive2 = dict
 
 
-class UserIncludeFromSuspectRecursive3(TypedDict, total=False):
-    """Relational arguments for Suspect"""
-    judgments: Union[bool, 'FindManyJudgmentArgsFromSuspectRecursive4']
+UserIncludeFromSuspectRecursive3 = dict
 
 
-class UserIncludeFromSuspectRecursive4(TypedDict, total=False):
-    """Relational arguments for Suspect"""
+UserIncludeFromSuspectRecursive4 = dict
 
     
 
-class UserArgsFromSuspect(TypedDict, total=False):
-    """Arguments for Suspect"""
-    include: 'UserIncludeFromUserRecursive1'
+UserArgsFromSuspect = dict
 
 
-class UserArgsFromSuspectRecursive1(TypedDict, total=False):
-    """Arguments for Suspect"""
-    include: 'UserIncludeFromUserRecursive2'
+UserArgsFromSuspectRecursive1 = dict
 
 
-class UserArgsFromSuspectRecursive2(TypedDict, total=False):
-    """Arguments for Suspect"""
-    include: 'UserIncludeFromUserRecursive3'
+UserArgsFromSuspectRecursive2 = dict
 
 
-class UserArgsFromSuspectRecursive3(TypedDict, total=False):
-    """Arguments for Suspect"""
-    include: 'UserIncludeFromUserRecursive4'
+UserArgsFromSuspectRecursive3 = dict
 
 
-class UserArgsFromSuspectRecursive4(TypedDict, total=False):
-    """Arguments for Suspect"""
+UserArgsFromSuspectRecursive4 = dict
     
     
 
-class FindManyUserArgsFromSuspect(TypedDict, total=False):
-    """Arguments for Suspect"""
-    take: int
-    skip: int
-    order_by: Union['UserOrderByInput', List['UserOrderByInput']]
-    where: 'UserWhereInput'
-    cursor: 'UserWhereUniqueInput'
-    distinct: List['UserScalarFieldKeys']
-    include: 'UserIncludeFromUserRecursive1'
+FindManyUserArgsFromSuspect = dict
 
 
-class FindManyUserArgsFromSuspectRecursive1(TypedDict, total=False):
-    """Arguments for Suspect"""
-    take: int
-    skip: int
-    order_by: Union['UserOrderByInput', List['UserOrderByInput']]
-    where: 'UserWhereInput'
-    cursor: 'UserWhereUniqueInput'
-    distinct: List['UserScalarFieldKeys']
-    include: 'UserIncludeFromUserRecursive2'
+FindManyUserArgsFromSuspectRecursive1 = dict
 
 
-class FindManyUserArgsFromSuspectRecursive2(TypedDict, total=False):
-    """Arguments for Suspect"""
-    take: int
-    skip: int
-    order_by: Union['UserOrderByInput', List['UserOrderByInput']]
-    where: 'UserWhereInput'
-    cursor: 'UserWhereUniqueInput'
-    distinct: List['UserScalarFieldKeys']
-    include: 'UserIncludeFromUserRecursive3'
+FindManyUserArgsFromSuspectRecursive2 = dict
 
 
-class FindManyUserArgsFromSuspectRecursive3(TypedDict, total=False):
-    """Arguments for Suspect"""
-    take: int
-    skip: int
-    order_by: Union['UserOrderByInput', List['UserOrderByInput']]
-    where: 'UserWhereInput'
-    cursor: 'UserWhereUniqueInput'
-    distinct: List['UserScalarFieldKeys']
-    include: 'UserIncludeFromUserRecursive4'
+FindManyUserArgsFromSuspectRecursive3 = dict
 
 
-class FindManyUserArgsFromSuspectRecursive4(TypedDict, total=False):
-    """Arguments for Suspect"""
-    take: int
-    skip: int
-    order_by: Union['UserOrderByInput', List['UserOrderByInput']]
-    where: 'UserWhereInput'
-    cursor: 'UserWhereUniqueInput'
-    distinct: List['UserScalarFieldKeys']
+FindManyUserArgsFromSuspectRecursive4 = dict
     
     
 
-class JudgmentIncludeFromSuspect(TypedDict, total=False):
-    """Relational arguments for Suspect"""
-    user: Union[bool, 'UserArgsFromSuspectRecursive1']
-    suspects: Union[bool, 'FindManySuspectArgsFromSuspectRecursive1']
-    blame: Union[bool, 'BlameArgsFromSuspectRecursive1']
+JudgmentIncludeFromSuspect = dict
 
 
-class JudgmentIncludeFromSuspectRecursive1(TypedDict, total=False):
-    """Relational arguments for Suspect"""
-    user: Union[bool, 'UserArgsFromSuspectRecursive2']
-    suspects: Union[bool, 'FindManySuspectArgsFromSuspectRecursive2']
-    blame: Union[bool, 'BlameArgsFromSuspectRecursive2']
+JudgmentIncludeFromSuspectRecursive1 = dict
 
 
-class JudgmentIncludeFromSuspectRecursive2(TypedDict, total=False):
-    """Relational arguments for Suspect"""
-    user: Union[bool, 'UserArgsFromSuspectRecursive3']
-    suspects: Union[bool, 'FindManySuspectArgsFromSuspectRecursive3']
-    blame: Union[bool, 'BlameArgsFromSuspectRecursive3']
+JudgmentIncludeFromSuspectRecursive2 = dict
 
 
-class JudgmentIncludeFromSuspectRecursive3(TypedDict, total=False):
-    """Relational arguments for Suspect"""
-    user: Union[bool, 'UserArgsFromSuspectRecursive4']
-    suspects: Union[bool, 'FindManySuspectArgsFromSuspectRecursive4']
-    blame: Union[bool, 'BlameArgsFromSuspectRecursive4']
+JudgmentIncludeFromSuspectRecursive3 = dict
 
 
-class JudgmentIncludeFromSuspectRecursive4(TypedDict, total=False):
-    """Relational arguments for Suspect"""
+JudgmentIncludeFromSuspectRecursive4 = dict
 
     
 
-class JudgmentArgsFromSuspect(TypedDict, total=False):
-    """Arguments for Suspect"""
-    include: 'JudgmentIncludeFromJudgmentRecursive1'
+JudgmentArgsFromSuspect = dict
 
 
-class JudgmentArgsFromSuspectRecursive1(TypedDict, total=False):
-    """Arguments for Suspect"""
-    include: 'JudgmentIncludeFromJudgmentRecursive2'
+JudgmentArgsFromSuspectRecursive1 = dict
 
 
-class JudgmentArgsFromSuspectRecursive2(TypedDict, total=False):
-    """Arguments for Suspect"""
-    include: 'JudgmentIncludeFromJudgmentRecursive3'
+JudgmentArgsFromSuspectRecursive2 = dict
 
 
-class JudgmentArgsFromSuspectRecursive3(TypedDict, total=False):
-    """Arguments for Suspect"""
-    include: 'JudgmentIncludeFromJudgmentRecursive4'
+JudgmentArgsFromSuspectRecursive3 = dict
 
 
-class JudgmentArgsFromSuspectRecursive4(TypedDict, total=False):
-    """Arguments for Suspect"""
+JudgmentArgsFromSuspectRecursive4 = dict
     
     
 
-class FindManyJudgmentArgsFromSuspect(TypedDict, total=False):
-    """Arguments for Suspect"""
-    take: int
-    skip: int
-    order_by: Union['JudgmentOrderByInput', List['JudgmentOrderByInput']]
-    where: 'JudgmentWhereInput'
-    cursor: 'JudgmentWhereUniqueInput'
-    distinct: List['JudgmentScalarFieldKeys']
-    include: 'JudgmentIncludeFromJudgmentRecursive1'
+FindManyJudgmentArgsFromSuspect = dict
 
 
-class FindManyJudgmentArgsFromSuspectRecursive1(TypedDict, total=False):
-    """Arguments for Suspect"""
-    take: int
-    skip: int
-    order_by: Union['JudgmentOrderByInput', List['JudgmentOrderByInput']]
-    where: 'JudgmentWhereInput'
-    cursor: 'JudgmentWhereUniqueInput'
-    distinct: List['JudgmentScalarFieldKeys']
-    include: 'JudgmentIncludeFromJudgmentRecursive2'
+FindManyJudgmentArgsFromSuspectRecursive1 = dict
 
 
-class FindManyJudgmentArgsFromSuspectRecursive2(TypedDict, total=False):
-    """Arguments for Suspect"""
-    take: int
-    skip: int
-    order_by: Union['JudgmentOrderByInput', List['JudgmentOrderByInput']]
-    where: 'JudgmentWhereInput'
-    cursor: 'JudgmentWhereUniqueInput'
-    distinct: List['JudgmentScalarFieldKeys']
-    include: 'JudgmentIncludeFromJudgmentRecursive3'
+FindManyJudgmentArgsFromSuspectRecursive2 = dict
 
 
-class FindManyJudgmentArgsFromSuspectRecursive3(TypedDict, total=False):
-    """Arguments for Suspect"""
-    take: int
-    skip: int
-    order_by: Union['JudgmentOrderByInput', List['JudgmentOrderByInput']]
-    where: 'JudgmentWhereInput'
-    cursor: 'JudgmentWhereUniqueInput'
-    distinct: List['JudgmentScalarFieldKeys']
-    include: 'JudgmentIncludeFromJudgmentRecursive4'
+FindManyJudgmentArgsFromSuspectRecursive3 = dict
 
 
-class FindManyJudgmentArgsFromSuspectRecursive4(TypedDict, total=False):
-    """Arguments for Suspect"""
-    take: int
-    skip: int
-    order_by: Union['JudgmentOrderByInput', List['JudgmentOrderByInput']]
-    where: 'JudgmentWhereInput'
-    cursor: 'JudgmentWhereUniqueInput'
-    distinct: List['JudgmentScalarFieldKeys']
+FindManyJudgmentArgsFromSuspectRecursive4 = dict
     
     
 
-class SuspectIncludeFromSuspect(TypedDict, total=False):
-    """Relational arguments for Suspect"""
-    judgment: Union[bool, 'JudgmentArgsFromSuspectRecursive1']
+SuspectIncludeFromSuspect = dict
 
 
-class SuspectIncludeFromSuspectRecursive1(TypedDict, total=False):
-    """Relational arguments for Suspect"""
-    judgment: Union[bool, 'JudgmentArgsFromSuspectRecursive2']
+SuspectIncludeFromSuspectRecursive1 = dict
 
 
-class SuspectIncludeFromSuspectRecursive2(TypedDict, total=False):
-    """Relational arguments for Suspect"""
-    judgment: Union[bool, 'JudgmentArgsFromSuspectRecursive3']
+SuspectIncludeFromSuspectRecursive2 = dict
 
 
-class SuspectIncludeFromSuspectRecursive3(TypedDict, total=False):
-    """Relational arguments for Suspect"""
-    judgment: Union[bool, 'JudgmentArgsFromSuspectRecursive4']
+SuspectIncludeFromSuspectRecursive3 = dict
 
 
-class SuspectIncludeFromSuspectRecursive4(TypedDict, total=False):
-    """Relational arguments for Suspect"""
+SuspectIncludeFromSuspectRecursive4 = dict
 
     
 
-class SuspectArgsFromSuspect(TypedDict, total=False):
-    """Arguments for Suspect"""
-    include: 'SuspectIncludeFromSuspectRecursive1'
+SuspectArgsFromSuspect = dict
 
 
-class SuspectArgsFromSuspectRecursive1(TypedDict, total=False):
-    """Arguments for Suspect"""
-    include: 'SuspectIncludeFromSuspectRecursive2'
+SuspectArgsFromSuspectRecursive1 = dict
 
 
-class SuspectArgsFromSuspectRecursive2(TypedDict, total=False):
-    """Arguments for Suspect"""
-    include: 'SuspectIncludeFromSuspectRecursive3'
+SuspectArgsFromSuspectRecursive2 = dict
 
 
-class SuspectArgsFromSuspectRecursive3(TypedDict, total=False):
-    """Arguments for Suspect"""
-    include: 'SuspectIncludeFromSuspectRecursive4'
+SuspectArgsFromSuspectRecursive3 = dict
 
 
-class SuspectArgsFromSuspectRecursive4(TypedDict, total=False):
-    """Arguments for Suspect"""
+SuspectArgsFromSuspectRecursive4 = dict
     
     
 
-class FindManySuspectArgsFromSuspect(TypedDict, total=False):
-    """Arguments for Suspect"""
-    take: int
-    skip: int
-    order_by: Union['SuspectOrderByInput', List['SuspectOrderByInput']]
-    where: 'SuspectWhereInput'
-    cursor: 'SuspectWhereUniqueInput'
-    distinct: List['SuspectScalarFieldKeys']
-    include: 'SuspectIncludeFromSuspectRecursive1'
+FindManySuspectArgsFromSuspect = dict
 
 
-class FindManySuspectArgsFromSuspectRecursive1(TypedDict, total=False):
-    """Arguments for Suspect"""
-    take: int
-    skip: int
-    order_by: Union['SuspectOrderByInput', List['SuspectOrderByInput']]
-    where: 'SuspectWhereInput'
-    cursor: 'SuspectWhereUniqueInput'
-    distinct: List['SuspectScalarFieldKeys']
-    include: 'SuspectIncludeFromSuspectRecursive2'
+FindManySuspectArgsFromSuspectRecursive1 = dict
 
 
-class FindManySuspectArgsFromSuspectRecursive2(TypedDict, total=False):
-    """Arguments for Suspect"""
-    take: int
-    skip: int
-    order_by: Union['SuspectOrderByInput', List['SuspectOrderByInput']]
-    where: 'SuspectWhereInput'
-    cursor: 'SuspectWhereUniqueInput'
-    distinct: List['SuspectScalarFieldKeys']
-    include: 'SuspectIncludeFromSuspectRecursive3'
+FindManySuspectArgsFromSuspectRecursive2 = dict
 
 
-class FindManySuspectArgsFromSuspectRecursive3(TypedDict, total=False):
-    """Arguments for Suspect"""
-    take: int
-    skip: int
-    order_by: Union['SuspectOrderByInput', List['SuspectOrderByInput']]
-    where: 'SuspectWhereInput'
-    cursor: 'SuspectWhereUniqueInput'
-    distinct: List['SuspectScalarFieldKeys']
-    include: 'SuspectIncludeFromSuspectRecursive4'
+FindManySuspectArgsFromSuspectRecursive3 = dict
 
 
-class FindManySuspectArgsFromSuspectRecursive4(TypedDict, total=False):
-    """Arguments for Suspect"""
-    take: int
-    skip: int
-    order_by: Union['SuspectOrderByInput', List['SuspectOrderByInput']]
-    where: 'SuspectWhereInput'
-    cursor: 'SuspectWhereUniqueInput'
-    distinct: List['SuspectScalarFieldKeys']
+FindManySuspectArgsFromSuspectRecursive4 = dict
     
     
 
-class BlameIncludeFromSuspect(TypedDict, total=False):
-    """Relational arguments for Suspect"""
-    judgment: Union[bool, 'JudgmentArgsFromSuspectRecursive1']
+BlameIncludeFromSuspect = dict
 
 
-class BlameIncludeFromSuspectRecursive1(TypedDict, total=False):
-    """Relational arguments for Suspect"""
-    judgment: Union[bool, 'JudgmentArgsFromSuspectRecursive2']
+BlameIncludeFromSuspectRecursive1 = dict
 
 
-class BlameIncludeFromSuspectRecursive2(TypedDict, total=False):
-    """Relational arguments for Suspect"""
-    judgment: Union[bool, 'JudgmentArgsFromSuspectRecursive3']
+BlameIncludeFromSuspectRecursive2 = dict
 
 
-class BlameIncludeFromSuspectRecursive3(TypedDict, total=False):
-    """Relational arguments for Suspect"""
-    judgment: Union[bool, 'JudgmentArgsFromSuspectRecursive4']
+BlameIncludeFromSuspectRecursive3 = dict
 
 
-class BlameIncludeFromSuspectRecursive4(TypedDict, total=False):
-    """Relational arguments for Suspect"""
+BlameIncludeFromSuspectRecursive4 = dict
 
     
 
-class BlameArgsFromSuspect(TypedDict, total=False):
-    """Arguments for Suspect"""
-    include: 'BlameIncludeFromBlameRecursive1'
+BlameArgsFromSuspect = dict
 
 
-class BlameArgsFromSuspectRecursive1(TypedDict, total=False):
-    """Arguments for Suspect"""
-    include: 'BlameIncludeFromBlameRecursive2'
+BlameArgsFromSuspectRecursive1 = dict
 
 
-class BlameArgsFromSuspectRecursive2(TypedDict, total=False):
-    """Arguments for Suspect"""
-    include: 'BlameIncludeFromBlameRecursive3'
+BlameArgsFromSuspectRecursive2 = dict
 
 
-class BlameArgsFromSuspectRecursive3(TypedDict, total=False):
-    """Arguments for Suspect"""
-    include: 'BlameIncludeFromBlameRecursive4'
+BlameArgsFromSuspectRecursive3 = dict
 
 
-class BlameArgsFromSuspectRecursive4(TypedDict, total=False):
-    """Arguments for Suspect"""
+BlameArgsFromSuspectRecursive4 = dict
     
     
 
-class FindManyBlameArgsFromSuspect(TypedDict, total=False):
-    """Arguments for Suspect"""
-    take: int
-    skip: int
-    order_by: Union['BlameOrderByInput', List['BlameOrderByInput']]
-    where: 'BlameWhereInput'
-    cursor: 'BlameWhereUniqueInput'
-    distinct: List['BlameScalarFieldKeys']
-    include: 'BlameIncludeFromBlameRecursive1'
+FindManyBlameArgsFromSuspect = dict
 
 
-class FindManyBlameArgsFromSuspectRecursive1(TypedDict, total=False):
-    """Arguments for Suspect"""
-    take: int
-    skip: int
-    order_by: Union['BlameOrderByInput', List['BlameOrderByInput']]
-    where: 'BlameWhereInput'
-    cursor: 'BlameWhereUniqueInput'
-    distinct: List['BlameScalarFieldKeys']
-    include: 'BlameIncludeFromBlameRecursive2'
+FindManyBlameArgsFromSuspectRecursive1 = dict
 
 
-class FindManyBlameArgsFromSuspectRecursive2(TypedDict, total=False):
-    """Arguments for Suspect"""
-    take: int
-    skip: int
-    order_by: Union['BlameOrderByInput', List['BlameOrderByInput']]
-    where: 'BlameWhereInput'
-    cursor: 'BlameWhereUniqueInput'
-    distinct: List['BlameScalarFieldKeys']
-    include: 'BlameIncludeFromBlameRecursive3'
+FindManyBlameArgsFromSuspectRecursive2 = dict
 
 
-class FindManyBlameArgsFromSuspectRecursive3(TypedDict, total=False):
-    """Arguments for Suspect"""
-    take: int
-    skip: int
-    order_by: Union['BlameOrderByInput', List['BlameOrderByInput']]
-    where: 'BlameWhereInput'
-    cursor: 'BlameWhereUniqueInput'
-    distinct: List['BlameScalarFieldKeys']
-    include: 'BlameIncludeFromBlameRecursive4'
+FindManyBlameArgsFromSuspectRecursive3 = dict
 
 
-class FindManyBlameArgsFromSuspectRecursive4(TypedDict, total=False):
-    """Arguments for Suspect"""
-    take: int
-    skip: int
-    order_by: Union['BlameOrderByInput', List['BlameOrderByInput']]
-    where: 'BlameWhereInput'
-    cursor: 'BlameWhereUniqueInput'
-    distinct: List['BlameScalarFieldKeys']
+FindManyBlameArgsFromSuspectRecursive4 = dict
+    
     
 
+AnalysisJobIncludeFromSuspect = dict
 
-FindManySuspectArgs = FindManySuspectArgsFromSuspect
-FindFirstSuspectArgs = FindManySuspectArgsFromSuspect
 
+AnalysisJobIncludeFromSuspectRecursive1 = dict
+
+
+AnalysisJobIncludeFromSuspectRecursive2 = dict
+
+
+AnalysisJobIncludeFromSuspectRecursive3 = dict
+
+
+AnalysisJobIncludeFromSuspectRecursive4 = dict
 
     
 
-class SuspectWhereInput(TypedDict, total=False):
-    """Suspect arguments for searching"""
-    id: Union[_str, 'types.StringFilter']
-    judgment_id: Union[_str, 'types.StringFilter']
-    username: Union[_str, 'types.StringFilter']
-    avatar_url: Union[None, _str, 'types.StringFilter']
-    responsibility: Union[_int, 'types.IntFilter']
-    reason: Union[None, _str, 'types.StringFilter']
-    commit_count: Union[None, _int, 'types.IntFilter']
-    last_commit_msg: Union[None, _str, 'types.StringFilter']
-    last_commit_date: Union[None, datetime.datetime, 'types.DateTimeFilter']
-    judgment: 'JudgmentRelationFilter'
-
-    # should be noted that AND and NOT should be Union['SuspectWhereInputRecursive1', List['SuspectWhereInputRecursive1']]
-    # but this causes mypy to hang :/
-    AND: List['SuspectWhereInputRecursive1']
-    OR: List['SuspectWhereInputRecursive1']
-    NOT: List['SuspectWhereInputRecursive1']
-
-
-class SuspectWhereInputRecursive1(TypedDict, total=False):
-    """Suspect arguments for searching"""
-    id: Union[_str, 'types.StringFilter']
-    judgment_id: Union[_str, 'types.StringFilter']
-    username: Union[_str, 'types.StringFilter']
-    avatar_url: Union[None, _str, 'types.StringFilter']
-    responsibility: Union[_int, 'types.IntFilter']
-    reason: Union[None, _str, 'types.StringFilter']
-    commit_count: Union[None, _int, 'types.IntFilter']
-    last_commit_msg: Union[None, _str, 'types.StringFilter']
-    last_commit_date: Union[None, datetime.datetime, 'types.DateTimeFilter']
-    judgment: 'JudgmentRelationFilter'
-
-    # should be noted that AND and NOT should be Union['SuspectWhereInputRecursive2', List['SuspectWhereInputRecursive2']]
-    # but this causes mypy to hang :/
-    AND: List['SuspectWhereInputRecursive2']
-    OR: List['SuspectWhereInputRecursive2']
-    NOT: List['SuspectWhereInputRecursive2']
-
-
-class SuspectWhereInputRecursive2(TypedDict, total=False):
-    """Suspect arguments for searching"""
-    id: Union[_str, 'types.StringFilter']
-    judgment_id: Union[_str, 'types.StringFilter']
-    username: Union[_str, 'types.StringFilter']
-    avatar_url: Union[None, _str, 'types.StringFilter']
-    responsibility: Union[_int, 'types.IntFilter']
-    reason: Union[None, _str, 'types.StringFilter']
-    commit_count: Union[None, _int, 'types.IntFilter']
-    last_commit_msg: Union[None, _str, 'types.StringFilter']
-    last_commit_date: Union[None, datetime.datetime, 'types.DateTimeFilter']
-    judgment: 'JudgmentRelationFilter'
-
-    # should be noted that AND and NOT should be Union['SuspectWhereInputRecursive3', List['SuspectWhereInputRecursive3']]
-    # but this causes mypy to hang :/
-    AND: List['SuspectWhereInputRecursive3']
-    OR: List['SuspectWhereInputRecursive3']
-    NOT: List['SuspectWhereInputRecursive3']
-
-
-class SuspectWhereInputRecursive3(TypedDict, total=False):
-    """Suspect arguments for searching"""
-    id: Union[_str, 'types.StringFilter']
-    judgment_id: Union[_str, 'types.StringFilter']
-    username: Union[_str, 'types.StringFilter']
-    avatar_url: Union[None, _str, 'types.StringFilter']
-    responsibility: Union[_int, 'types.IntFilter']
-    reason: Union[None, _str, 'types.StringFilter']
-    commit_count: Union[None, _int, 'types.IntFilter']
-    last_commit_msg: Union[None, _str, 'types.StringFilter']
-    last_commit_date: Union[None, datetime.datetime, 'types.DateTimeFilter']
-    judgment: 'JudgmentRelationFilter'
-
-    # should be noted that AND and NOT should be Union['SuspectWhereInputRecursive4', List['SuspectWhereInputRecursive4']]
-    # but this causes mypy to hang :/
-    AND: List['SuspectWhereInputRecursive4']
-    OR: List['SuspectWhereInputRecursive4']
-    NOT: List['SuspectWhereInputRecursive4']
-
-
-class SuspectWhereInputRecursive4(TypedDict, total=False):
-    """Suspect arguments for searching"""
-    id: Union[_str, 'types.StringFilter']
-    judgment_id: Union[_str, 'types.StringFilter']
-    username: Union[_str, 'types.StringFilter']
-    avatar_url: Union[None, _str, 'types.StringFilter']
-    responsibility: Union[_int, 'types.IntFilter']
-    reason: Union[None, _str, 'types.StringFilter']
-    commit_count: Union[None, _int, 'types.IntFilter']
-    last_commit_msg: Union[None, _str, 'types.StringFilter']
-    last_commit_date: Union[None, datetime.datetime, 'types.DateTimeFilter']
-    judgment: 'JudgmentRelationFilter'
+AnalysisJobArgsFromSuspect = dict
 
 
+AnalysisJobArgsFromSuspectRecursive1 = dict
 
-# aggregate Suspect types
+
+AnalysisJobArgsFromSuspectRecursive2 = dict
 
 
+AnalysisJobArgsFromSuspectRecursive3 = dict
+
+
+AnalysisJobArgsFromSuspectRecursive4 = dict
+    
     
 
-class SuspectScalarWhereWithAggregatesInput(TypedDict, total=False):
-    """Suspect arguments for searching"""
-    id: Union[_str, 'types.StringWithAggregatesFilter']
-    judgment_id: Union[_str, 'types.StringWithAggregatesFilter']
-    username: Union[_str, 'types.StringWithAggregatesFilter']
-    avatar_url: Union[_str, 'types.StringWithAggregatesFilter']
-    responsibility: Union[_int, 'types.IntWithAggregatesFilter']
-    reason: Union[_str, 'types.StringWithAggregatesFilter']
-    commit_count: Union[_int, 'types.IntWithAggregatesFilter']
-    last_commit_msg: Union[_str, 'types.StringWithAggregatesFilter']
-    last_commit_date: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
-
-    AND: List['SuspectScalarWhereWithAggregatesInputRecursive1']
-    OR: List['SuspectScalarWhereWithAggregatesInputRecursive1']
-    NOT: List['SuspectScalarWhereWithAggregatesInputRecursive1']
-
-
-class SuspectScalarWhereWithAggregatesInputRecursive1(TypedDict, total=False):
-    """Suspect arguments for searching"""
-    id: Union[_str, 'types.StringWithAggregatesFilter']
-    judgment_id: Union[_str, 'types.StringWithAggregatesFilter']
-    username: Union[_str, 'types.StringWithAggregatesFilter']
-    avatar_url: Union[_str, 'types.StringWithAggregatesFilter']
-    responsibility: Union[_int, 'types.IntWithAggregatesFilter']
-    reason: Union[_str, 'types.StringWithAggregatesFilter']
-    commit_count: Union[_int, 'types.IntWithAggregatesFilter']
-    last_commit_msg: Union[_str, 'types.StringWithAggregatesFilter']
-    last_commit_date: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
-
-    AND: List['SuspectScalarWhereWithAggregatesInputRecursive2']
-    OR: List['SuspectScalarWhereWithAggregatesInputRecursive2']
-    NOT: List['SuspectScalarWhereWithAggregatesInputRecursive2']
-
-
-class SuspectScalarWhereWithAggregatesInputRecursive2(TypedDict, total=False):
-    """Suspect arguments for searching"""
-    id: Union[_str, 'types.StringWithAggregatesFilter']
-    judgment_id: Union[_str, 'types.StringWithAggregatesFilter']
-    username: Union[_str, 'types.StringWithAggregatesFilter']
-    avatar_url: Union[_str, 'types.StringWithAggregatesFilter']
-    responsibility: Union[_int, 'types.IntWithAggregatesFilter']
-    reason: Union[_str, 'types.StringWithAggregatesFilter']
-    commit_count: Union[_int, 'types.IntWithAggregatesFilter']
-    last_commit_msg: Union[_str, 'types.StringWithAggregatesFilter']
-    last_commit_date: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
-
-    AND: List['SuspectScalarWhereWithAggregatesInputRecursive3']
-    OR: List['SuspectScalarWhereWithAggregatesInputRecursive3']
-    NOT: List['SuspectScalarWhereWithAggregatesInputRecursive3']
-
-
-class SuspectScalarWhereWithAggregatesInputRecursive3(TypedDict, total=False):
-    """Suspect arguments for searching"""
-    id: Union[_str, 'types.StringWithAggregatesFilter']
-    judgment_id: Union[_str, 'types.StringWithAggregatesFilter']
-    username: Union[_str, 'types.StringWithAggregatesFilter']
-    avatar_url: Union[_str, 'types.StringWithAggregatesFilter']
-    responsibility: Union[_int, 'types.IntWithAggregatesFilter']
-    reason: Union[_str, 'types.StringWithAggregatesFilter']
-    commit_count: Union[_int, 'types.IntWithAggregatesFilter']
-    last_commit_msg: Union[_str, 'types.StringWithAggregatesFilter']
-    last_commit_date: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
-
-    AND: List['SuspectScalarWhereWithAggregatesInputRecursive4']
-    OR: List['SuspectScalarWhereWithAggregatesInputRecursive4']
-    NOT: List['SuspectScalarWhereWithAggregatesInputRecursive4']
-
-
-class SuspectScalarWhereWithAggregatesInputRecursive4(TypedDict, total=False):
-    """Suspect arguments for searching"""
-    id: Union[_str, 'types.StringWithAggregatesFilter']
-    judgment_id: Union[_str, 'types.StringWithAggregatesFilter']
-    username: Union[_str, 'types.StringWithAggregatesFilter']
-    avatar_url: Union[_str, 'types.StringWithAggregatesFilter']
-    responsibility: Union[_int, 'types.IntWithAggregatesFilter']
-    reason: Union[_str, 'types.StringWithAggregatesFilter']
-    commit_count: Union[_int, 'types.IntWithAggregatesFilter']
-    last_commit_msg: Union[_str, 'types.StringWithAggregatesFilter']
-    last_commit_date: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
-
-
-
-class SuspectGroupByOutput(TypedDict, total=False):
-    id: _str
-    judgment_id: _str
-    username: _str
-    avatar_url: _str
-    responsibility: _int
-    reason: _str
-    commit_count: _int
-    last_commit_msg: _str
-    last_commit_date: datetime.datetime
-    _sum: 'SuspectSumAggregateOutput'
-    _avg: 'SuspectAvgAggregateOutput'
-    _min: 'SuspectMinAggregateOutput'
-    _max: 'SuspectMaxAggregateOutput'
-    _count: 'SuspectCountAggregateOutput'
-
-
-class SuspectAvgAggregateOutput(TypedDict, total=False):
-    """Suspect output for aggregating averages"""
-    responsibility: float
-    commit_count: float
-
-
-class SuspectSumAggregateOutput(TypedDict, total=False):
-    """Suspect output for aggregating sums"""
-    responsibility: _int
-    commit_count: _int
-
-
-class SuspectScalarAggregateOutput(TypedDict, total=False):
-    """Suspect output including scalar fields"""
-    id: _str
-    judgment_id: _str
-    username: _str
-    avatar_url: _str
-    responsibility: _int
-    reason: _str
-    commit_count: _int
-    last_commit_msg: _str
-    last_commit_date: datetime.datetime
+FindManyAnalysisJobArgsFromSuspect = dict
 
 
-SuspectMinAggregateOutput = SuspectScalarAggregateOutput
-SuspectMaxAggregateOutput = SuspectScalarAggregateOutput
+FindManyAnalysisJobArgsFromSuspectRecursive1 = dict
 
 
-class SuspectMaxAggregateInput(TypedDict, total=False):
-    """Suspect input for aggregating by max"""
-    id: bool
-    judgment_id: bool
-    username: bool
-    avatar_url: bool
-    responsibility: bool
-    reason: bool
-    commit_count: bool
-    last_commit_msg: bool
-    last_commit_date: bool
+FindManyAnalysisJobArgsFromSuspectRecursive2 = dict
 
 
-class SuspectMinAggregateInput(TypedDict, total=False):
-    """Suspect input for aggregating by min"""
-    id: bool
-    judgment_id: bool
-    username: bool
-    avatar_url: bool
-    responsibility: bool
-    reason: bool
-    commit_count: bool
-    last_commit_msg: bool
-    last_commit_date: bool
+FindManyAnalysisJobArgsFromSuspectRecursive3 = dict
 
 
-class SuspectNumberAggregateInput(TypedDict, total=False):
-    """Suspect input for aggregating numbers"""
-    responsibility: bool
-    commit_count: bool
+FindManyAnalysisJobArgsFromSuspectRecursive4 = dict
+    
 
 
-SuspectAvgAggregateInput = SuspectNumberAggregateInput
-SuspectSumAggregateInput = SuspectNumberAggregateInput
+FindManySuspectArgs = FindManySuspectArgsFromSuspect
+FindFirstSuspectArgs = FindManySuspectArgsFromSuspect
 
 
-SuspectCountAggregateInput = TypedDict(
-    'SuspectCountAggregateInput',
-    {
-        'id': bool,
-        'judgment_id': bool,
-        'username': bool,
-        'avatar_url': bool,
-        'responsibility': bool,
-        'reason': bool,
-        'commit_count': bool,
-        'last_commit_msg': bool,
-        'last_commit_date': bool,
-        '_all': bool,
-    },
-    total=False,
-)
+    
 
-SuspectCountAggregateOutput = TypedDict(
-    'SuspectCountAggregateOutput',
-    {
-        'id': int,
-        'judgment_id': int,
-        'username': int,
-        'avatar_url': int,
-        'responsibility': int,
-        'reason': int,
-        'commit_count': int,
-        'last_commit_msg': int,
-        'last_commit_date': int,
-        '_all': int,
-    },
-    total=False,
-)
+SuspectWhereInput = dict
 
 
-SuspectKeys = Literal[
-    'id',
-    'judgment_id',
-    'username',
-    'avatar_url',
-    'responsibility',
-    'reason',
-    'commit_count',
-    'last_commit_msg',
-    'last_commit_date',
-    'judgment',
+SuspectWhereInputRecursive1 = dict
+
+
+SuspectWhereInputRecursive2 = dict
+
+
+SuspectWhereInputRecursive3 = dict
+
+
+SuspectWhereInputRecursive4 = dict
+
+
+
+# aggregate Suspect types
+
+
+    
+
+SuspectScalarWhereWithAggregatesInput = dict
+
+
+SuspectScalarWhereWithAggregatesInputRecursive1 = dict
+
+
+SuspectScalarWhereWithAggregatesInputRecursive2 = dict
+
+
+SuspectScalarWhereWithAggregatesInputRecursive3 = dict
+
+
+SuspectScalarWhereWithAggregatesInputRecursive4 = dict
+
+
+
+SuspectGroupByOutput = dict
+
+
+SuspectAvgAggregateOutput = dict
+
+
+SuspectSumAggregateOutput = dict
+
+
+SuspectScalarAggregateOutput = dict
+
+
+SuspectMinAggregateOutput = SuspectScalarAggregateOutput
+SuspectMaxAggregateOutput = SuspectScalarAggregateOutput
+
+
+SuspectMaxAggregateInput = dict
+
+
+SuspectMinAggregateInput = dict
+
+
+SuspectNumberAggregateInput = dict
+
+
+SuspectAvgAggregateInput = SuspectNumberAggregateInput
+SuspectSumAggregateInput = SuspectNumberAggregateInput
+
+
+SuspectCountAggregateInput = dict
+
+SuspectCountAggregateOutput = dict
+
+
+SuspectKeys = Literal[
+    'id',
+    'judgment_id',
+    'username',
+    'avatar_url',
+    'responsibility',
+    'reason',
+    'commit_count',
+    'last_commit_msg',
+    'last_commit_date',
+    'judgment',
 ]
 SuspectScalarFieldKeys = Literal[
     'id',
@@ -4180,71 +1978,30 @@ SuspectRelationalFieldKeys = Literal[
 
 # Blame types
 
-class BlameOptionalCreateInput(TypedDict, total=False):
-    """Optional arguments to the Blame create method"""
-    id: _str
-    judgment_id: _str
-    target_avatar: Optional[_str]
-    reason: Optional[_str]
-    message: Optional[_str]
-    intensity: _str
-    image_url: Optional[_str]
-    created_at: datetime.datetime
-    judgment: 'JudgmentCreateNestedWithoutRelationsInput'
+BlameOptionalCreateInput = dict
 
 
-class BlameCreateInput(BlameOptionalCreateInput):
-    """Required arguments to the Blame create method"""
-    target_username: _str
-    responsibility: _int
+BlameCreateInput = dict
 
 
 # TODO: remove this in favour of without explicit relations
 # e.g. PostCreateWithoutAuthorInput
 
-class BlameOptionalCreateWithoutRelationsInput(TypedDict, total=False):
-    """Optional arguments to the Blame create method, without relations"""
-    id: _str
-    judgment_id: _str
-    target_avatar: Optional[_str]
-    reason: Optional[_str]
-    message: Optional[_str]
-    intensity: _str
-    image_url: Optional[_str]
-    created_at: datetime.datetime
+BlameOptionalCreateWithoutRelationsInput = dict
 
 
-class BlameCreateWithoutRelationsInput(BlameOptionalCreateWithoutRelationsInput):
-    """Required arguments to the Blame create method, without relations"""
-    target_username: _str
-    responsibility: _int
+BlameCreateWithoutRelationsInput = dict
 
 
-class BlameCreateNestedWithoutRelationsInput(TypedDict, total=False):
-    create: 'BlameCreateWithoutRelationsInput'
-    connect: 'BlameWhereUniqueInput'
+BlameCreateNestedWithoutRelationsInput = dict
 
 
-class BlameCreateManyNestedWithoutRelationsInput(TypedDict, total=False):
-    create: Union['BlameCreateWithoutRelationsInput', List['BlameCreateWithoutRelationsInput']]
-    connect: Union['BlameWhereUniqueInput', List['BlameWhereUniqueInput']]
+BlameCreateManyNestedWithoutRelationsInput = dict
 
 
-_BlameWhereUnique_id_Input = TypedDict(
-    '_BlameWhereUnique_id_Input',
-    {
-        'id': '_str',
-    },
-    total=True
-)
+_BlameWhereUnique_id_Input = dict
 
-_BlameWhereUnique_judgment_id_Input = TypedDict(
-    '_BlameWhereUnique_judgment_id_Input',
-    {
-        'judgment_id': '_str',
-    },
-    total=True
-)
+_BlameWhereUnique_judgment_id_Input = dict
 
 BlameWhereUniqueInput = Union[
     '_BlameWhereUnique_id_Input',
@@ -4252,39 +2009,13 @@ BlameWhereUniqueInput = Union[
 ]
 
 
-class BlameUpdateInput(TypedDict, total=False):
-    """Optional arguments for updating a record"""
-    id: _str
-    target_username: _str
-    target_avatar: Optional[_str]
-    responsibility: Union[AtomicIntInput, _int]
-    reason: Optional[_str]
-    message: Optional[_str]
-    intensity: _str
-    image_url: Optional[_str]
-    created_at: datetime.datetime
-    judgment: 'JudgmentUpdateOneWithoutRelationsInput'
-
-
-class BlameUpdateManyMutationInput(TypedDict, total=False):
-    """Arguments for updating many records"""
-    id: _str
-    target_username: _str
-    target_avatar: Optional[_str]
-    responsibility: Union[AtomicIntInput, _int]
-    reason: Optional[_str]
-    message: Optional[_str]
-    intensity: _str
-    image_url: Optional[_str]
-    created_at: datetime.datetime
-
-
-class BlameUpdateManyWithoutRelationsInput(TypedDict, total=False):
-    create: List['BlameCreateWithoutRelationsInput']
-    connect: List['BlameWhereUniqueInput']
-    set: List['BlameWhereUniqueInput']
-    disconnect: List['BlameWhereUniqueInput']
-    delete: List['BlameWhereUniqueInput']
+BlameUpdateInput = dict
+
+
+BlameUpdateManyMutationInput = dict
+
+
+BlameUpdateManyWithoutRelationsInput = dict
 
     # TODO
     # update: List['BlameUpdateWithWhereUniqueWithoutRelationsInput']
@@ -4294,11 +2025,7 @@ class BlameUpdateManyWithoutRelationsInput(TypedDict, total=False):
     # connectOrCreate: List['BlameCreateOrConnectWithoutRelationsInput']
 
 
-class BlameUpdateOneWithoutRelationsInput(TypedDict, total=False):
-    create: 'BlameCreateWithoutRelationsInput'
-    connect: 'BlameWhereUniqueInput'
-    disconnect: bool
-    delete: bool
+BlameUpdateOneWithoutRelationsInput = dict
 
     # TODO
     # update: 'BlameUpdateInput'
@@ -4306,90 +2033,28 @@ class BlameUpdateOneWithoutRelationsInput(TypedDict, total=False):
     # connectOrCreate: 'BlameCreateOrConnectWithoutRelationsInput'
 
 
-class BlameUpsertInput(TypedDict):
-    create: 'BlameCreateInput'
-    update: 'BlameUpdateInput'  # pyright: ignore[reportIncompatibleMethodOverride]
+BlameUpsertInput = dict
 
 
-_Blame_id_OrderByInput = TypedDict(
-    '_Blame_id_OrderByInput',
-    {
-        'id': 'SortOrder',
-    },
-    total=True
-)
+_Blame_id_OrderByInput = dict
 
-_Blame_judgment_id_OrderByInput = TypedDict(
-    '_Blame_judgment_id_OrderByInput',
-    {
-        'judgment_id': 'SortOrder',
-    },
-    total=True
-)
+_Blame_judgment_id_OrderByInput = dict
 
-_Blame_target_username_OrderByInput = TypedDict(
-    '_Blame_target_username_OrderByInput',
-    {
-        'target_username': 'SortOrder',
-    },
-    total=True
-)
+_Blame_target_username_OrderByInput = dict
 
-_Blame_target_avatar_OrderByInput = TypedDict(
-    '_Blame_target_avatar_OrderByInput',
-    {
-        'target_avatar': 'SortOrder',
-    },
-    total=True
-)
+_Blame_target_avatar_OrderByInput = dict
 
-_Blame_responsibility_OrderByInput = TypedDict(
-    '_Blame_responsibility_OrderByInput',
-    {
-        'responsibility': 'SortOrder',
-    },
-    total=True
-)
+_Blame_responsibility_OrderByInput = dict
 
-_Blame_reason_OrderByInput = TypedDict(
-    '_Blame_reason_OrderByInput',
-    {
-        'reason': 'SortOrder',
-    },
-    total=True
-)
+_Blame_reason_OrderByInput = dict
 
-_Blame_message_OrderByInput = TypedDict(
-    '_Blame_message_OrderByInput',
-    {
-        'message': 'SortOrder',
-    },
-    total=True
-)
+_Blame_message_OrderByInput = dict
 
-_Blame_intensity_OrderByInput = TypedDict(
-    '_Blame_intensity_OrderByInput',
-    {
-        'intensity': 'SortOrder',
-    },
-    total=True
-)
+_Blame_intensity_OrderByInput = dict
 
-_Blame_image_url_OrderByInput = TypedDict(
-    '_Blame_image_url_OrderByInput',
-    {
-        'image_url': 'SortOrder',
-    },
-    total=True
-)
+_Blame_image_url_OrderByInput = dict
 
-_Blame_created_at_OrderByInput = TypedDict(
-    '_Blame_created_at_OrderByInput',
-    {
-        'created_at': 'SortOrder',
-    },
-    total=True
-)
+_Blame_created_at_OrderByInput = dict
 
 BlameOrderByInput = Union[
     '_Blame_id_OrderByInput',
@@ -4414,454 +2079,254 @@ BlameOrderByInput = Union[
 # see https://github.com/RobertCraigie/prisma-client-py/issues/45
 # switch to pyright for improved types, see https://prisma-client-py.readthedocs.io/en/stable/reference/limitations/
 
-BlameRelationFilter = TypedDict(
-    'BlameRelationFilter',
-    {
-        'is': 'Dict[str, Any]',
-        'is_not': 'Dict[str, Any]',
-    },
-    total=False,
-)
+BlameRelationFilter = dict
+
+
+BlameListRelationFilter = dict
+
+
+BlameInclude = dict
+
+
+    
+
+UserIncludeFromBlame = dict
+
+
+UserIncludeFromBlameRecursive1 = dict
+
+
+UserIncludeFromBlameRecursive2 = dict
+
+
+UserIncludeFromBlameRecursive3 = dict
+
+
+UserIncludeFromBlameRecursive4 = dict
+
+    
+
+UserArgsFromBlame = dict
+
+
+UserArgsFromBlameRecursive1 = dict
+
 
+UserArgsFromBlameRecursive2 = dict
 
-class BlameListRelationFilter(TypedDict, total=False):
-    some: 'Dict[str, Any]'
-    none: 'Dict[str, Any]'
-    every: 'Dict[str, Any]'
 
+UserArgsFromBlameRecursive3 = dict
 
-class BlameInclude(TypedDict, total=False):
-    """Blame relational arguments"""
-    judgment: Union[bool, 'JudgmentArgsFromBlame']
 
+UserArgsFromBlameRecursive4 = dict
+    
+    
+
+FindManyUserArgsFromBlame = dict
+
+
+FindManyUserArgsFromBlameRecursive1 = dict
+
+
+FindManyUserArgsFromBlameRecursive2 = dict
 
+
+FindManyUserArgsFromBlameRecursive3 = dict
+
+
+FindManyUserArgsFromBlameRecursive4 = dict
+    
     
 
-class UserIncludeFromBlame(TypedDict, total=False):
-    """Relational arguments for Blame"""
-    judgments: Union[bool, 'FindManyJudgmentArgsFromBlameRecursive1']
+JudgmentIncludeFromBlame = dict
 
 
-class UserIncludeFromBlameRecursive1(TypedDict, total=False):
-    """Relational arguments for Blame"""
-    judgments: Union[bool, 'FindManyJudgmentArgsFromBlameRecursive2']
+JudgmentIncludeFromBlameRecursive1 = dict
 
 
-class UserIncludeFromBlameRecursive2(TypedDict, total=False):
-    """Relational arguments for Blame"""
-    judgments: Union[bool, 'FindManyJudgmentArgsFromBlameRecursive3']
+JudgmentIncludeFromBlameRecursive2 = dict
 
 
-class UserIncludeFromBlameRecursive3(TypedDict, total=False):
-    """Relational arguments for Blame"""
-    judgments: Union[bool, 'FindManyJudgmentArgsFromBlameRecursive4']
+JudgmentIncludeFromBlameRecursive3 = dict
 
 
-class UserIncludeFromBlameRecursive4(TypedDict, total=False):
-    """Relational arguments for Blame"""
+JudgmentIncludeFromBlameRecursive4 = dict
 
     
 
-class UserArgsFromBlame(TypedDict, total=False):
-    """Arguments for Blame"""
-    include: 'UserIncludeFromUserRecursive1'
+JudgmentArgsFromBlame = dict
 
 
-class UserArgsFromBlameRecursive1(TypedDict, total=False):
-    """Arguments for Blame"""
-    include: 'UserIncludeFromUserRecursive2'
+JudgmentArgsFromBlameRecursive1 = dict
 
 
-class UserArgsFromBlameRecursive2(TypedDict, total=False):
-    """Arguments for Blame"""
-    include: 'UserIncludeFromUserRecursive3'
+JudgmentArgsFromBlameRecursive2 = dict
 
 
-class UserArgsFromBlameRecursive3(TypedDict, total=False):
-    """Arguments for Blame"""
-    include: 'UserIncludeFromUserRecursive4'
+JudgmentArgsFromBlameRecursive3 = dict
 
 
-class UserArgsFromBlameRecursive4(TypedDict, total=False):
-    """Arguments for Blame"""
+JudgmentArgsFromBlameRecursive4 = dict
     
     
 
-class FindManyUserArgsFromBlame(TypedDict, total=False):
-    """Arguments for Blame"""
-    take: int
-    skip: int
-    order_by: Union['UserOrderByInput', List['UserOrderByInput']]
-    where: 'UserWhereInput'
-    cursor: 'UserWhereUniqueInput'
-    distinct: List['UserScalarFieldKeys']
-    include: 'UserIncludeFromUserRecursive1'
+FindManyJudgmentArgsFromBlame = dict
 
 
-class FindManyUserArgsFromBlameRecursive1(TypedDict, total=False):
-    """Arguments for Blame"""
-    take: int
-    skip: int
-    order_by: Union['UserOrderByInput', List['UserOrderByInput']]
-    where: 'UserWhereInput'
-    cursor: 'UserWhereUniqueInput'
-    distinct: List['UserScalarFieldKeys']
-    include: 'UserIncludeFromUserRecursive2'
+FindManyJudgmentArgsFromBlameRecursive1 = dict
 
 
-class FindManyUserArgsFromBlameRecursive2(TypedDict, total=False):
-    """Arguments for Blame"""
-    take: int
-    skip: int
-    order_by: Union['UserOrderByInput', List['UserOrderByInput']]
-    where: 'UserWhereInput'
-    cursor: 'UserWhereUniqueInput'
-    distinct: List['UserScalarFieldKeys']
-    include: 'UserIncludeFromUserRecursive3'
+FindManyJudgmentArgsFromBlameRecursive2 = dict
 
 
-class FindManyUserArgsFromBlameRecursive3(TypedDict, total=False):
-    """Arguments for Blame"""
-    take: int
-    skip: int
-    order_by: Union['UserOrderByInput', List['UserOrderByInput']]
-    where: 'UserWhereInput'
-    cursor: 'UserWhereUniqueInput'
-    distinct: List['UserScalarFieldKeys']
-    include: 'UserIncludeFromUserRecursive4'
+FindManyJudgmentArgsFromBlameRecursive3 = dict
 
 
-class FindManyUserArgsFromBlameRecursive4(TypedDict, total=False):
-    """Arguments for Blame"""
-    take: int
-    skip: int
-    order_by: Union['UserOrderByInput', List['UserOrderByInput']]
-    where: 'UserWhereInput'
-    cursor: 'UserWhereUniqueInput'
-    distinct: List['UserScalarFieldKeys']
+FindManyJudgmentArgsFromBlameRecursive4 = dict
     
     
 
-class JudgmentIncludeFromBlame(TypedDict, total=False):
-    """Relational arguments for Blame"""
-    user: Union[bool, 'UserArgsFromBlameRecursive1']
-    suspects: Union[bool, 'FindManySuspectArgsFromBlameRecursive1']
-    blame: Union[bool, 'BlameArgsFromBlameRecursive1']
+SuspectIncludeFromBlame = dict
 
 
-class JudgmentIncludeFromBlameRecursive1(TypedDict, total=False):
-    """Relational arguments for Blame"""
-    user: Union[bool, 'UserArgsFromBlameRecursive2']
-    suspects: Union[bool, 'FindManySuspectArgsFromBlameRecursive2']
-    blame: Union[bool, 'BlameArgsFromBlameRecursive2']
+SuspectIncludeFromBlameRecursive1 = dict
 
 
-class JudgmentIncludeFromBlameRecursive2(TypedDict, total=False):
-    """Relational arguments for Blame"""
-    user: Union[bool, 'UserArgsFromBlameRecursive3']
-    suspects: Union[bool, 'FindManySuspectArgsFromBlameRecursive3']
-    blame: Union[bool, 'BlameArgsFromBlameRecursive3']
+SuspectIncludeFromBlameRecursive2 = dict
 
 
-class JudgmentIncludeFromBlameRecursive3(TypedDict, total=False):
-    """Relational arguments for Blame"""
-    user: Union[bool, 'UserArgsFromBlameRecursive4']
-    suspects: Union[bool, 'FindManySuspectArgsFromBlameRecursive4']
-    blame: Union[bool, 'BlameArgsFromBlameRecursive4']
+SuspectIncludeFromBlameRecursive3 = dict
 
 
-class JudgmentIncludeFromBlameRecursive4(TypedDict, total=False):
-    """Relational arguments for Blame"""
+SuspectIncludeFromBlameRecursive4 = dict
 
     
 
-class JudgmentArgsFromBlame(TypedDict, total=False):
-    """Arguments for Blame"""
-    include: 'JudgmentIncludeFromJudgmentRecursive1'
+SuspectArgsFromBlame = dict
 
 
-class JudgmentArgsFromBlameRecursive1(TypedDict, total=False):
-    """Arguments for Blame"""
-    include: 'JudgmentIncludeFromJudgmentRecursive2'
+SuspectArgsFromBlameRecursive1 = dict
 
 
-class JudgmentArgsFromBlameRecursive2(TypedDict, total=False):
-    """Arguments for Blame"""
-    include: 'JudgmentIncludeFromJudgmentRecursive3'
+SuspectArgsFromBlameRecursive2 = dict
 
 
-class JudgmentArgsFromBlameRecursive3(TypedDict, total=False):
-    """Arguments for Blame"""
-    include: 'JudgmentIncludeFromJudgmentRecursive4'
+SuspectArgsFromBlameRecursive3 = dict
 
 
-class JudgmentArgsFromBlameRecursive4(TypedDict, total=False):
-    """Arguments for Blame"""
+SuspectArgsFromBlameRecursive4 = dict
     
     
 
-class FindManyJudgmentArgsFromBlame(TypedDict, total=False):
-    """Arguments for Blame"""
-    take: int
-    skip: int
-    order_by: Union['JudgmentOrderByInput', List['JudgmentOrderByInput']]
-    where: 'JudgmentWhereInput'
-    cursor: 'JudgmentWhereUniqueInput'
-    distinct: List['JudgmentScalarFieldKeys']
-    include: 'JudgmentIncludeFromJudgmentRecursive1'
+FindManySuspectArgsFromBlame = dict
 
 
-class FindManyJudgmentArgsFromBlameRecursive1(TypedDict, total=False):
-    """Arguments for Blame"""
-    take: int
-    skip: int
-    order_by: Union['JudgmentOrderByInput', List['JudgmentOrderByInput']]
-    where: 'JudgmentWhereInput'
-    cursor: 'JudgmentWhereUniqueInput'
-    distinct: List['JudgmentScalarFieldKeys']
-    include: 'JudgmentIncludeFromJudgmentRecursive2'
+FindManySuspectArgsFromBlameRecursive1 = dict
 
 
-class FindManyJudgmentArgsFromBlameRecursive2(TypedDict, total=False):
-    """Arguments for Blame"""
-    take: int
-    skip: int
-    order_by: Union['JudgmentOrderByInput', List['JudgmentOrderByInput']]
-    where: 'JudgmentWhereInput'
-    cursor: 'JudgmentWhereUniqueInput'
-    distinct: List['JudgmentScalarFieldKeys']
-    include: 'JudgmentIncludeFromJudgmentRecursive3'
+FindManySuspectArgsFromBlameRecursive2 = dict
 
 
-class FindManyJudgmentArgsFromBlameRecursive3(TypedDict, total=False):
-    """Arguments for Blame"""
-    take: int
-    skip: int
-    order_by: Union['JudgmentOrderByInput', List['JudgmentOrderByInput']]
-    where: 'JudgmentWhereInput'
-    cursor: 'JudgmentWhereUniqueInput'
-    distinct: List['JudgmentScalarFieldKeys']
-    include: 'JudgmentIncludeFromJudgmentRecursive4'
+FindManySuspectArgsFromBlameRecursive3 = dict
 
 
-class FindManyJudgmentArgsFromBlameRecursive4(TypedDict, total=False):
-    """Arguments for Blame"""
-    take: int
-    skip: int
-    order_by: Union['JudgmentOrderByInput', List['JudgmentOrderByInput']]
-    where: 'JudgmentWhereInput'
-    cursor: 'JudgmentWhereUniqueInput'
-    distinct: List['JudgmentScalarFieldKeys']
+FindManySuspectArgsFromBlameRecursive4 = dict
     
     
 
-class SuspectIncludeFromBlame(TypedDict, total=False):
-    """Relational arguments for Blame"""
-    judgment: Union[bool, 'JudgmentArgsFromBlameRecursive1']
+BlameIncludeFromBlame = dict
 
 
-class SuspectIncludeFromBlameRecursive1(TypedDict, total=False):
-    """Relational arguments for Blame"""
-    judgment: Union[bool, 'JudgmentArgsFromBlameRecursive2']
+BlameIncludeFromBlameRecursive1 = dict
 
 
-class SuspectIncludeFromBlameRecursive2(TypedDict, total=False):
-    """Relational arguments for Blame"""
-    judgment: Union[bool, 'JudgmentArgsFromBlameRecursive3']
+BlameIncludeFromBlameRecursive2 = dict
 
 
-class SuspectIncludeFromBlameRecursive3(TypedDict, total=False):
-    """Relational arguments for Blame"""
-    judgment: Union[bool, 'JudgmentArgsFromBlameRecursive4']
+BlameIncludeFromBlameRecursive3 = dict
 
 
-class SuspectIncludeFromBlameRecursive4(TypedDict, total=False):
-    """Relational arguments for Blame"""
+BlameIncludeFromBlameRecursive4 = dict
 
     
 
-class SuspectArgsFromBlame(TypedDict, total=False):
-    """Arguments for Blame"""
-    include: 'SuspectIncludeFromSuspectRecursive1'
+BlameArgsFromBlame = dict
 
 
-class SuspectArgsFromBlameRecursive1(TypedDict, total=False):
-    """Arguments for Blame"""
-    include: 'SuspectIncludeFromSuspectRecursive2'
+BlameArgsFromBlameRecursive1 = dict
 
 
-class SuspectArgsFromBlameRecursive2(TypedDict, total=False):
-    """Arguments for Blame"""
-    include: 'SuspectIncludeFromSuspectRecursive3'
+BlameArgsFromBlameRecursive2 = dict
 
 
-class SuspectArgsFromBlameRecursive3(TypedDict, total=False):
-    """Arguments for Blame"""
-    include: 'SuspectIncludeFromSuspectRecursive4'
+BlameArgsFromBlameRecursive3 = dict
 
 
-class SuspectArgsFromBlameRecursive4(TypedDict, total=False):
-    """Arguments for Blame"""
+BlameArgsFromBlameRecursive4 = dict
     
     
 
-class FindManySuspectArgsFromBlame(TypedDict, total=False):
-    """Arguments for Blame"""
-    take: int
-    skip: int
-    order_by: Union['SuspectOrderByInput', List['SuspectOrderByInput']]
-    where: 'SuspectWhereInput'
-    cursor: 'SuspectWhereUniqueInput'
-    distinct: List['SuspectScalarFieldKeys']
-    include: 'SuspectIncludeFromSuspectRecursive1'
+FindManyBlameArgsFromBlame = dict
 
 
-class FindManySuspectArgsFromBlameRecursive1(TypedDict, total=False):
-    """Arguments for Blame"""
-    take: int
-    skip: int
-    order_by: Union['SuspectOrderByInput', List['SuspectOrderByInput']]
-    where: 'SuspectWhereInput'
-    cursor: 'SuspectWhereUniqueInput'
-    distinct: List['SuspectScalarFieldKeys']
-    include: 'SuspectIncludeFromSuspectRecursive2'
+FindManyBlameArgsFromBlameRecursive1 = dict
 
 
-class FindManySuspectArgsFromBlameRecursive2(TypedDict, total=False):
-    """Arguments for Blame"""
-    take: int
-    skip: int
-    order_by: Union['SuspectOrderByInput', List['SuspectOrderByInput']]
-    where: 'SuspectWhereInput'
-    cursor: 'SuspectWhereUniqueInput'
-    distinct: List['SuspectScalarFieldKeys']
-    include: 'SuspectIncludeFromSuspectRecursive3'
+FindManyBlameArgsFromBlameRecursive2 = dict
 
 
-class FindManySuspectArgsFromBlameRecursive3(TypedDict, total=False):
-    """Arguments for Blame"""
-    take: int
-    skip: int
-    order_by: Union['SuspectOrderByInput', List['SuspectOrderByInput']]
-    where: 'SuspectWhereInput'
-    cursor: 'SuspectWhereUniqueInput'
-    distinct: List['SuspectScalarFieldKeys']
-    include: 'SuspectIncludeFromSuspectRecursive4'
+FindManyBlameArgsFromBlameRecursive3 = dict
 
 
-class FindManySuspectArgsFromBlameRecursive4(TypedDict, total=False):
-    """Arguments for Blame"""
-    take: int
-    skip: int
-    order_by: Union['SuspectOrderByInput', List['SuspectOrderByInput']]
-    where: 'SuspectWhereInput'
-    cursor: 'SuspectWhereUniqueInput'
-    distinct: List['SuspectScalarFieldKeys']
+FindManyBlameArgsFromBlameRecursive4 = dict
     
     
 
-class BlameIncludeFromBlame(TypedDict, total=False):
-    """Relational arguments for Blame"""
-    judgment: Union[bool, 'JudgmentArgsFromBlameRecursive1']
+AnalysisJobIncludeFromBlame = dict
 
 
-class BlameIncludeFromBlameRecursive1(TypedDict, total=False):
-    """Relational arguments for Blame"""
-    judgment: Union[bool, 'JudgmentArgsFromBlameRecursive2']
+AnalysisJobIncludeFromBlameRecursive1 = dict
 
 
-class BlameIncludeFromBlameRecursive2(TypedDict, total=False):
-    """Relational arguments for Blame"""
-    judgment: Union[bool, 'JudgmentArgsFromBlameRecursive3']
+AnalysisJobIncludeFromBlameRecursive2 = dict
 
 
-class BlameIncludeFromBlameRecursive3(TypedDict, total=False):
-    """Relational arguments for Blame"""
-    judgment: Union[bool, 'JudgmentArgsFromBlameRecursive4']
+AnalysisJobIncludeFromBlameRecursive3 = dict
 
 
-class BlameIncludeFromBlameRecursive4(TypedDict, total=False):
-    """Relational arguments for Blame"""
+AnalysisJobIncludeFromBlameRecursive4 = dict
 
     
 
-class BlameArgsFromBlame(TypedDict, total=False):
-    """Arguments for Blame"""
-    include: 'BlameIncludeFromBlameRecursive1'
+AnalysisJobArgsFromBlame = dict
 
 
-class BlameArgsFromBlameRecursive1(TypedDict, total=False):
-    """Arguments for Blame"""
-    include: 'BlameIncludeFromBlameRecursive2'
+AnalysisJobArgsFromBlameRecursive1 = dict
 
 
-class BlameArgsFromBlameRecursive2(TypedDict, total=False):
-    """Arguments for Blame"""
-    include: 'BlameIncludeFromBlameRecursive3'
+AnalysisJobArgsFromBlameRecursive2 = dict
 
 
-class BlameArgsFromBlameRecursive3(TypedDict, total=False):
-    """Arguments for Blame"""
-    include: 'BlameIncludeFromBlameRecursive4'
+AnalysisJobArgsFromBlameRecursive3 = dict
 
 
-class BlameArgsFromBlameRecursive4(TypedDict, total=False):
-    """Arguments for Blame"""
+AnalysisJobArgsFromBlameRecursive4 = dict
     
     
 
-class FindManyBlameArgsFromBlame(TypedDict, total=False):
-    """Arguments for Blame"""
-    take: int
-    skip: int
-    order_by: Union['BlameOrderByInput', List['BlameOrderByInput']]
-    where: 'BlameWhereInput'
-    cursor: 'BlameWhereUniqueInput'
-    distinct: List['BlameScalarFieldKeys']
-    include: 'BlameIncludeFromBlameRecursive1'
+FindManyAnalysisJobArgsFromBlame = dict
 
 
-class FindManyBlameArgsFromBlameRecursive1(TypedDict, total=False):
-    """Arguments for Blame"""
-    take: int
-    skip: int
-    order_by: Union['BlameOrderByInput', List['BlameOrderByInput']]
-    where: 'BlameWhereInput'
-    cursor: 'BlameWhereUniqueInput'
-    distinct: List['BlameScalarFieldKeys']
-    include: 'BlameIncludeFromBlameRecursive2'
+FindManyAnalysisJobArgsFromBlameRecursive1 = dict
 
 
-class FindManyBlameArgsFromBlameRecursive2(TypedDict, total=False):
-    """Arguments for Blame"""
-    take: int
-    skip: int
-    order_by: Union['BlameOrderByInput', List['BlameOrderByInput']]
-    where: 'BlameWhereInput'
-    cursor: 'BlameWhereUniqueInput'
-    distinct: List['BlameScalarFieldKeys']
-    include: 'BlameIncludeFromBlameRecursive3'
+FindManyAnalysisJobArgsFromBlameRecursive2 = dict
 
 
-class FindManyBlameArgsFromBlameRecursive3(TypedDict, total=False):
-    """Arguments for Blame"""
-    take: int
-    skip: int
-    order_by: Union['BlameOrderByInput', List['BlameOrderByInput']]
-    where: 'BlameWhereInput'
-    cursor: 'BlameWhereUniqueInput'
-    distinct: List['BlameScalarFieldKeys']
-    include: 'BlameIncludeFromBlameRecursive4'
+FindManyAnalysisJobArgsFromBlameRecursive3 = dict
 
 
-class FindManyBlameArgsFromBlameRecursive4(TypedDict, total=False):
-    """Arguments for Blame"""
-    take: int
-    skip: int
-    order_by: Union['BlameOrderByInput', List['BlameOrderByInput']]
-    where: 'BlameWhereInput'
-    cursor: 'BlameWhereUniqueInput'
-    distinct: List['BlameScalarFieldKeys']
+FindManyAnalysisJobArgsFromBlameRecursive4 = dict
     
 
 
@@ -4871,103 +2336,19 @@ FindFirstBlameArgs = FindManyBlameArgsFromBlame
 
     
 
-class BlameWhereInput(TypedDict, total=False):
-    """Blame arguments for searching"""
-    id: Union[_str, 'types.StringFilter']
-    judgment_id: Union[_str, 'types.StringFilter']
-    target_username: Union[_str, 'types.StringFilter']
-    target_avatar: Union[None, _str, 'types.StringFilter']
-    responsibility: Union[_int, 'types.IntFilter']
-    reason: Union[None, _str, 'types.StringFilter']
-    message: Union[None, _str, 'types.StringFilter']
-    intensity: Union[_str, 'types.StringFilter']
-    image_url: Union[None, _str, 'types.StringFilter']
-    created_at: Union[datetime.datetime, 'types.DateTimeFilter']
-    judgment: 'JudgmentRelationFilter'
-
-    # should be noted that AND and NOT should be Union['BlameWhereInputRecursive1', List['BlameWhereInputRecursive1']]
-    # but this causes mypy to hang :/
-    AND: List['BlameWhereInputRecursive1']
-    OR: List['BlameWhereInputRecursive1']
-    NOT: List['BlameWhereInputRecursive1']
-
-
-class BlameWhereInputRecursive1(TypedDict, total=False):
-    """Blame arguments for searching"""
-    id: Union[_str, 'types.StringFilter']
-    judgment_id: Union[_str, 'types.StringFilter']
-    target_username: Union[_str, 'types.StringFilter']
-    target_avatar: Union[None, _str, 'types.StringFilter']
-    responsibility: Union[_int, 'types.IntFilter']
-    reason: Union[None, _str, 'types.StringFilter']
-    message: Union[None, _str, 'types.StringFilter']
-    intensity: Union[_str, 'types.StringFilter']
-    image_url: Union[None, _str, 'types.StringFilter']
-    created_at: Union[datetime.datetime, 'types.DateTimeFilter']
-    judgment: 'JudgmentRelationFilter'
-
-    # should be noted that AND and NOT should be Union['BlameWhereInputRecursive2', List['BlameWhereInputRecursive2']]
-    # but this causes mypy to hang :/
-    AND: List['BlameWhereInputRecursive2']
-    OR: List['BlameWhereInputRecursive2']
-    NOT: List['BlameWhereInputRecursive2']
-
-
-class BlameWhereInputRecursive2(TypedDict, total=False):
-    """Blame arguments for searching"""
-    id: Union[_str, 'types.StringFilter']
-    judgment_id: Union[_str, 'types.StringFilter']
-    target_username: Union[_str, 'types.StringFilter']
-    target_avatar: Union[None, _str, 'types.StringFilter']
-    responsibility: Union[_int, 'types.IntFilter']
-    reason: Union[None, _str, 'types.StringFilter']
-    message: Union[None, _str, 'types.StringFilter']
-    intensity: Union[_str, 'types.StringFilter']
-    image_url: Union[None, _str, 'types.StringFilter']
-    created_at: Union[datetime.datetime, 'types.DateTimeFilter']
-    judgment: 'JudgmentRelationFilter'
-
-    # should be noted that AND and NOT should be Union['BlameWhereInputRecursive3', List['BlameWhereInputRecursive3']]
-    # but this causes mypy to hang :/
-    AND: List['BlameWhereInputRecursive3']
-    OR: List['BlameWhereInputRecursive3']
-    NOT: List['BlameWhereInputRecursive3']
-
-
-class BlameWhereInputRecursive3(TypedDict, total=False):
-    """Blame arguments for searching"""
-    id: Union[_str, 'types.StringFilter']
-    judgment_id: Union[_str, 'types.StringFilter']
-    target_username: Union[_str, 'types.StringFilter']
-    target_avatar: Union[None, _str, 'types.StringFilter']
-    responsibility: Union[_int, 'types.IntFilter']
-    reason: Union[None, _str, 'types.StringFilter']
-    message: Union[None, _str, 'types.StringFilter']
-    intensity: Union[_str, 'types.StringFilter']
-    image_url: Union[None, _str, 'types.StringFilter']
-    created_at: Union[datetime.datetime, 'types.DateTimeFilter']
-    judgment: 'JudgmentRelationFilter'
-
-    # should be noted that AND and NOT should be Union['BlameWhereInputRecursive4', List['BlameWhereInputRecursive4']]
-    # but this causes mypy to hang :/
-    AND: List['BlameWhereInputRecursive4']
-    OR: List['BlameWhereInputRecursive4']
-    NOT: List['BlameWhereInputRecursive4']
-
-
-class BlameWhereInputRecursive4(TypedDict, total=False):
-    """Blame arguments for searching"""
-    id: Union[_str, 'types.StringFilter']
-    judgment_id: Union[_str, 'types.StringFilter']
-    target_username: Union[_str, 'types.StringFilter']
-    target_avatar: Union[None, _str, 'types.StringFilter']
-    responsibility: Union[_int, 'types.IntFilter']
-    reason: Union[None, _str, 'types.StringFilter']
-    message: Union[None, _str, 'types.StringFilter']
-    intensity: Union[_str, 'types.StringFilter']
-    image_url: Union[None, _str, 'types.StringFilter']
-    created_at: Union[datetime.datetime, 'types.DateTimeFilter']
-    judgment: 'JudgmentRelationFilter'
+BlameWhereInput = dict
+
+
+BlameWhereInputRecursive1 = dict
+
+
+BlameWhereInputRecursive2 = dict
+
+
+BlameWhereInputRecursive3 = dict
+
+
+BlameWhereInputRecursive4 = dict
 
 
 
@@ -4976,211 +2357,54 @@ class BlameWhereInputRecursive4(TypedDict, total=False):
 
     
 
-class BlameScalarWhereWithAggregatesInput(TypedDict, total=False):
-    """Blame arguments for searching"""
-    id: Union[_str, 'types.StringWithAggregatesFilter']
-    judgment_id: Union[_str, 'types.StringWithAggregatesFilter']
-    target_username: Union[_str, 'types.StringWithAggregatesFilter']
-    target_avatar: Union[_str, 'types.StringWithAggregatesFilter']
-    responsibility: Union[_int, 'types.IntWithAggregatesFilter']
-    reason: Union[_str, 'types.StringWithAggregatesFilter']
-    message: Union[_str, 'types.StringWithAggregatesFilter']
-    intensity: Union[_str, 'types.StringWithAggregatesFilter']
-    image_url: Union[_str, 'types.StringWithAggregatesFilter']
-    created_at: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
-
-    AND: List['BlameScalarWhereWithAggregatesInputRecursive1']
-    OR: List['BlameScalarWhereWithAggregatesInputRecursive1']
-    NOT: List['BlameScalarWhereWithAggregatesInputRecursive1']
-
-
-class BlameScalarWhereWithAggregatesInputRecursive1(TypedDict, total=False):
-    """Blame arguments for searching"""
-    id: Union[_str, 'types.StringWithAggregatesFilter']
-    judgment_id: Union[_str, 'types.StringWithAggregatesFilter']
-    target_username: Union[_str, 'types.StringWithAggregatesFilter']
-    target_avatar: Union[_str, 'types.StringWithAggregatesFilter']
-    responsibility: Union[_int, 'types.IntWithAggregatesFilter']
-    reason: Union[_str, 'types.StringWithAggregatesFilter']
-    message: Union[_str, 'types.StringWithAggregatesFilter']
-    intensity: Union[_str, 'types.StringWithAggregatesFilter']
-    image_url: Union[_str, 'types.StringWithAggregatesFilter']
-    created_at: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
-
-    AND: List['BlameScalarWhereWithAggregatesInputRecursive2']
-    OR: List['BlameScalarWhereWithAggregatesInputRecursive2']
-    NOT: List['BlameScalarWhereWithAggregatesInputRecursive2']
-
-
-class BlameScalarWhereWithAggregatesInputRecursive2(TypedDict, total=False):
-    """Blame arguments for searching"""
-    id: Union[_str, 'types.StringWithAggregatesFilter']
-    judgment_id: Union[_str, 'types.StringWithAggregatesFilter']
-    target_username: Union[_str, 'types.StringWithAggregatesFilter']
-    target_avatar: Union[_str, 'types.StringWithAggregatesFilter']
-    responsibility: Union[_int, 'types.IntWithAggregatesFilter']
-    reason: Union[_str, 'types.StringWithAggregatesFilter']
-    message: Union[_str, 'types.StringWithAggregatesFilter']
-    intensity: Union[_str, 'types.StringWithAggregatesFilter']
-    image_url: Union[_str, 'types.StringWithAggregatesFilter']
-    created_at: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
-
-    AND: List['BlameScalarWhereWithAggregatesInputRecursive3']
-    OR: List['BlameScalarWhereWithAggregatesInputRecursive3']
-    NOT: List['BlameScalarWhereWithAggregatesInputRecursive3']
-
-
-class BlameScalarWhereWithAggregatesInputRecursive3(TypedDict, total=False):
-    """Blame arguments for searching"""
-    id: Union[_str, 'types.StringWithAggregatesFilter']
-    judgment_id: Union[_str, 'types.StringWithAggregatesFilter']
-    target_username: Union[_str, 'types.StringWithAggregatesFilter']
-    target_avatar: Union[_str, 'types.StringWithAggregatesFilter']
-    responsibility: Union[_int, 'types.IntWithAggregatesFilter']
-    reason: Union[_str, 'types.StringWithAggregatesFilter']
-    message: Union[_str, 'types.StringWithAggregatesFilter']
-    intensity: Union[_str, 'types.StringWithAggregatesFilter']
-    image_url: Union[_str, 'types.StringWithAggregatesFilter']
-    created_at: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
-
-    AND: List['BlameScalarWhereWithAggregatesInputRecursive4']
-    OR: List['BlameScalarWhereWithAggregatesInputRecursive4']
-    NOT: List['BlameScalarWhereWithAggregatesInputRecursive4']
-
-
-class BlameScalarWhereWithAggregatesInputRecursive4(TypedDict, total=False):
-    """Blame arguments for searching"""
-    id: Union[_str, 'types.StringWithAggregatesFilter']
-    judgment_id: Union[_str, 'types.StringWithAggregatesFilter']
-    target_username: Union[_str, 'types.StringWithAggregatesFilter']
-    target_avatar: Union[_str, 'types.StringWithAggregatesFilter']
-    responsibility: Union[_int, 'types.IntWithAggregatesFilter']
-    reason: Union[_str, 'types.StringWithAggregatesFilter']
-    message: Union[_str, 'types.StringWithAggregatesFilter']
-    intensity: Union[_str, 'types.StringWithAggregatesFilter']
-    image_url: Union[_str, 'types.StringWithAggregatesFilter']
-    created_at: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
-
-
-
-class BlameGroupByOutput(TypedDict, total=False):
-    id: _str
-    judgment_id: _str
-    target_username: _str
-    target_avatar: _str
-    responsibility: _int
-    reason: _str
-    message: _str
-    intensity: _str
-    image_url: _str
-    created_at: datetime.datetime
-    _sum: 'BlameSumAggregateOutput'
-    _avg: 'BlameAvgAggregateOutput'
-    _min: 'BlameMinAggregateOutput'
-    _max: 'BlameMaxAggregateOutput'
-    _count: 'BlameCountAggregateOutput'
-
-
-class BlameAvgAggregateOutput(TypedDict, total=False):
-    """Blame output for aggregating averages"""
-    responsibility: float
-
-
-class BlameSumAggregateOutput(TypedDict, total=False):
-    """Blame output for aggregating sums"""
-    responsibility: _int
-
-
-class BlameScalarAggregateOutput(TypedDict, total=False):
-    """Blame output including scalar fields"""
-    id: _str
-    judgment_id: _str
-    target_username: _str
-    target_avatar: _str
-    responsibility: _int
-    reason: _str
-    message: _str
-    intensity: _str
-    image_url: _str
-    created_at: datetime.datetime
+BlameScalarWhereWithAggregatesInput = dict
+
+
+BlameScalarWhereWithAggregatesInputRecursive1 = dict
+
+
+BlameScalarWhereWithAggregatesInputRecursive2 = dict
+
+
+BlameScalarWhereWithAggregatesInputRecursive3 = dict
+
+
+BlameScalarWhereWithAggregatesInputRecursive4 = dict
+
+
+
+BlameGroupByOutput = dict
+
+
+BlameAvgAggregateOutput = dict
+
+
+BlameSumAggregateOutput = dict
+
+
+BlameScalarAggregateOutput = dict
 
 
 BlameMinAggregateOutput = BlameScalarAggregateOutput
 BlameMaxAggregateOutput = BlameScalarAggregateOutput
 
 
-class BlameMaxAggregateInput(TypedDict, total=False):
-    """Blame input for aggregating by max"""
-    id: bool
-    judgment_id: bool
-    target_username: bool
-    target_avatar: bool
-    responsibility: bool
-    reason: bool
-    message: bool
-    intensity: bool
-    image_url: bool
-    created_at: bool
+BlameMaxAggregateInput = dict
 
 
-class BlameMinAggregateInput(TypedDict, total=False):
-    """Blame input for aggregating by min"""
-    id: bool
-    judgment_id: bool
-    target_username: bool
-    target_avatar: bool
-    responsibility: bool
-    reason: bool
-    message: bool
-    intensity: bool
-    image_url: bool
-    created_at: bool
+BlameMinAggregateInput = dict
 
 
-class BlameNumberAggregateInput(TypedDict, total=False):
-    """Blame input for aggregating numbers"""
-    responsibility: bool
+BlameNumberAggregateInput = dict
 
 
 BlameAvgAggregateInput = BlameNumberAggregateInput
 BlameSumAggregateInput = BlameNumberAggregateInput
 
 
-BlameCountAggregateInput = TypedDict(
-    'BlameCountAggregateInput',
-    {
-        'id': bool,
-        'judgment_id': bool,
-        'target_username': bool,
-        'target_avatar': bool,
-        'responsibility': bool,
-        'reason': bool,
-        'message': bool,
-        'intensity': bool,
-        'image_url': bool,
-        'created_at': bool,
-        '_all': bool,
-    },
-    total=False,
-)
+BlameCountAggregateInput = dict
 
-BlameCountAggregateOutput = TypedDict(
-    'BlameCountAggregateOutput',
-    {
-        'id': int,
-        'judgment_id': int,
-        'target_username': int,
-        'target_avatar': int,
-        'responsibility': int,
-        'reason': int,
-        'message': int,
-        'intensity': int,
-        'image_url': int,
-        'created_at': int,
-        '_all': int,
-    },
-    total=False,
-)
+BlameCountAggregateOutput = dict
 
 
 BlameKeys = Literal[
@@ -5214,7 +2438,469 @@ BlameRelationalFieldKeys = Literal[
         'judgment',
     ]
 
+# AnalysisJob types
+
+AnalysisJobOptionalCreateInput = dict
+
+
+AnalysisJobCreateInput = dict
+
+
+# TODO: remove this in favour of without explicit relations
+# e.g. PostCreateWithoutAuthorInput
+
+AnalysisJobOptionalCreateWithoutRelationsInput = dict
+
+
+AnalysisJobCreateWithoutRelationsInput = dict
+
+
+AnalysisJobCreateNestedWithoutRelationsInput = dict
+
+
+AnalysisJobCreateManyNestedWithoutRelationsInput = dict
+
+
+_AnalysisJobWhereUnique_id_Input = dict
+
+AnalysisJobWhereUniqueInput = _AnalysisJobWhereUnique_id_Input
+
+
+AnalysisJobUpdateInput = dict
+
+
+AnalysisJobUpdateManyMutationInput = dict
+
+
+AnalysisJobUpdateManyWithoutRelationsInput = dict
+
+    # TODO
+    # update: List['AnalysisJobUpdateWithWhereUniqueWithoutRelationsInput']
+    # updateMany: List['AnalysisJobUpdateManyWithWhereUniqueWithoutRelationsInput']
+    # deleteMany: List['AnalysisJobScalarWhereInput']
+    # upsert: List['AnalysisJobUpserteWithWhereUniqueWithoutRelationsInput']
+    # connectOrCreate: List['AnalysisJobCreateOrConnectWithoutRelationsInput']
+
+
+AnalysisJobUpdateOneWithoutRelationsInput = dict
+
+    # TODO
+    # update: 'AnalysisJobUpdateInput'
+    # upsert: 'AnalysisJobUpsertWithoutRelationsInput'
+    # connectOrCreate: 'AnalysisJobCreateOrConnectWithoutRelationsInput'
+
+
+AnalysisJobUpsertInput = dict
+
+
+_AnalysisJob_id_OrderByInput = dict
+
+_AnalysisJob_judgment_id_OrderByInput = dict
+
+_AnalysisJob_user_id_OrderByInput = dict
+
+_AnalysisJob_status_OrderByInput = dict
+
+_AnalysisJob_attempts_OrderByInput = dict
+
+_AnalysisJob_max_attempts_OrderByInput = dict
+
+_AnalysisJob_run_at_OrderByInput = dict
+
+_AnalysisJob_locked_until_OrderByInput = dict
+
+_AnalysisJob_last_error_OrderByInput = dict
+
+_AnalysisJob_created_at_OrderByInput = dict
+
+_AnalysisJob_updated_at_OrderByInput = dict
+
+AnalysisJobOrderByInput = Union[
+    '_AnalysisJob_id_OrderByInput',
+    '_AnalysisJob_judgment_id_OrderByInput',
+    '_AnalysisJob_user_id_OrderByInput',
+    '_AnalysisJob_status_OrderByInput',
+    '_AnalysisJob_attempts_OrderByInput',
+    '_AnalysisJob_max_attempts_OrderByInput',
+    '_AnalysisJob_run_at_OrderByInput',
+    '_AnalysisJob_locked_until_OrderByInput',
+    '_AnalysisJob_last_error_OrderByInput',
+    '_AnalysisJob_created_at_OrderByInput',
+    '_AnalysisJob_updated_at_OrderByInput',
+]
+
+
+
+# recursive AnalysisJob types
+# TODO: cleanup these types
+
+
+# Dict[str, Any] is a mypy limitation
+# see https://github.com/RobertCraigie/prisma-client-py/issues/45
+# switch to pyright for improved types, see https://prisma-client-py.readthedocs.io/en/stable/reference/limitations/
+
+AnalysisJobRelationFilter = dict
+
+
+AnalysisJobListRelationFilter = dict
+
+
+AnalysisJobInclude = dict
+
+
+    
+
+UserIncludeFromAnalysisJob = dict
+
+
+UserIncludeFromAnalysisJobRecursive1 = dict
+
+
+UserIncludeFromAnalysisJobRecursive2 = dict
+
+
+UserIncludeFromAnalysisJobRecursive3 = dict
+
+
+UserIncludeFromAnalysisJobRecursive4 = dict
+
+    
+
+UserArgsFromAnalysisJob = dict
+
+
+UserArgsFromAnalysisJobRecursive1 = dict
+
+
+UserArgsFromAnalysisJobRecursive2 = dict
+
+
+UserArgsFromAnalysisJobRecursive3 = dict
+
+
+UserArgsFromAnalysisJobRecursive4 = dict
+    
+    
+
+FindManyUserArgsFromAnalysisJob = dict
+
+
+FindManyUserArgsFromAnalysisJobRecursive1 = dict
+
+
+FindManyUserArgsFromAnalysisJobRecursive2 = dict
+
+
+FindManyUserArgsFromAnalysisJobRecursive3 = dict
+
+
+FindManyUserArgsFromAnalysisJobRecursive4 = dict
+    
+    
+
+JudgmentIncludeFromAnalysisJob = dict
+
+
+JudgmentIncludeFromAnalysisJobRecursive1 = dict
+
+
+JudgmentIncludeFromAnalysisJobRecursive2 = dict
+
+
+JudgmentIncludeFromAnalysisJobRecursive3 = dict
+
+
+JudgmentIncludeFromAnalysisJobRecursive4 = dict
+
+    
+
+JudgmentArgsFromAnalysisJob = dict
+
+
+JudgmentArgsFromAnalysisJobRecursive1 = dict
+
+
+JudgmentArgsFromAnalysisJobRecursive2 = dict
+
+
+JudgmentArgsFromAnalysisJobRecursive3 = dict
+
+
+JudgmentArgsFromAnalysisJobRecursive4 = dict
+    
+    
+
+FindManyJudgmentArgsFromAnalysisJob = dict
+
+
+FindManyJudgmentArgsFromAnalysisJobRecursive1 = dict
+
+
+FindManyJudgmentArgsFromAnalysisJobRecursive2 = dict
+
+
+FindManyJudgmentArgsFromAnalysisJobRecursive3 = dict
+
+
+FindManyJudgmentArgsFromAnalysisJobRecursive4 = dict
+    
+    
+
+SuspectIncludeFromAnalysisJob = dict
+
+
+SuspectIncludeFromAnalysisJobRecursive1 = dict
+
+
+SuspectIncludeFromAnalysisJobRecursive2 = dict
+
+
+SuspectIncludeFromAnalysisJobRecursive3 = dict
+
+
+SuspectIncludeFromAnalysisJobRecursive4 = dict
+
+    
+
+SuspectArgsFromAnalysisJob = dict
+
+
+SuspectArgsFromAnalysisJobRecursive1 = dict
+
+
+SuspectArgsFromAnalysisJobRecursive2 = dict
+
+
+SuspectArgsFromAnalysisJobRecursive3 = dict
+
+
+SuspectArgsFromAnalysisJobRecursive4 = dict
+    
+    
+
+FindManySuspectArgsFromAnalysisJob = dict
+
+
+FindManySuspectArgsFromAnalysisJobRecursive1 = dict
+
+
+FindManySuspectArgsFromAnalysisJobRecursive2 = dict
+
+
+FindManySuspectArgsFromAnalysisJobRecursive3 = dict
+
+
+FindManySuspectArgsFromAnalysisJobRecursive4 = dict
+    
+    
+
+BlameIncludeFromAnalysisJob = dict
+
+
+BlameIncludeFromAnalysisJobRecursive1 = dict
+
+
+BlameIncludeFromAnalysisJobRecursive2 = dict
+
+
+BlameIncludeFromAnalysisJobRecursive3 = dict
+
+
+BlameIncludeFromAnalysisJobRecursive4 = dict
+
+    
+
+BlameArgsFromAnalysisJob = dict
+
+
+BlameArgsFromAnalysisJobRecursive1 = dict
+
+
+BlameArgsFromAnalysisJobRecursive2 = dict
+
+
+BlameArgsFromAnalysisJobRecursive3 = dict
+
+
+BlameArgsFromAnalysisJobRecursive4 = dict
+    
+    
+
+FindManyBlameArgsFromAnalysisJob = dict
+
+
+FindManyBlameArgsFromAnalysisJobRecursive1 = dict
+
+
+FindManyBlameArgsFromAnalysisJobRecursive2 = dict
+
+
+FindManyBlameArgsFromAnalysisJobRecursive3 = dict
+
+
+FindManyBlameArgsFromAnalysisJobRecursive4 = dict
+    
+    
+
+AnalysisJobIncludeFromAnalysisJob = dict
+
+
+AnalysisJobIncludeFromAnalysisJobRecursive1 = dict
+
+
+AnalysisJobIncludeFromAnalysisJobRecursive2 = dict
+
+
+AnalysisJobIncludeFromAnalysisJobRecursive3 = dict
+
+
+AnalysisJobIncludeFromAnalysisJobRecursive4 = dict
+
+    
+
+AnalysisJobArgsFromAnalysisJob = dict
+
+
+AnalysisJobArgsFromAnalysisJobRecursive1 = dict
+
+
+AnalysisJobArgsFromAnalysisJobRecursive2 = dict
+
+
+AnalysisJobArgsFromAnalysisJobRecursive3 = dict
+
+
+AnalysisJobArgsFromAnalysisJobRecursive4 = dict
+    
+    
+
+FindManyAnalysisJobArgsFromAnalysisJob = dict
+
+
+FindManyAnalysisJobArgsFromAnalysisJobRecursive1 = dict
+
+
+FindManyAnalysisJobArgsFromAnalysisJobRecursive2 = dict
+
+
+FindManyAnalysisJobArgsFromAnalysisJobRecursive3 = dict
+
+
+FindManyAnalysisJobArgsFromAnalysisJobRecursive4 = dict
+    
+
+
+FindManyAnalysisJobArgs = FindManyAnalysisJobArgsFromAnalysisJob
+FindFirstAnalysisJobArgs = FindManyAnalysisJobArgsFromAnalysisJob
+
+
+    
+
+AnalysisJobWhereInput = dict
+
+
+AnalysisJobWhereInputRecursive1 = dict
+
+
+AnalysisJobWhereInputRecursive2 = dict
+
+
+AnalysisJobWhereInputRecursive3 = dict
+
+
+AnalysisJobWhereInputRecursive4 = dict
+
+
+
+# aggregate AnalysisJob types
+
+
+    
+
+AnalysisJobScalarWhereWithAggregatesInput = dict
+
+
+AnalysisJobScalarWhereWithAggregatesInputRecursive1 = dict
+
+
+AnalysisJobScalarWhereWithAggregatesInputRecursive2 = dict
+
+
+AnalysisJobScalarWhereWithAggregatesInputRecursive3 = dict
+
+
+AnalysisJobScalarWhereWithAggregatesInputRecursive4 = dict
+
+
+
+AnalysisJobGroupByOutput = dict
+
+
+AnalysisJobAvgAggregateOutput = dict
+
+
+AnalysisJobSumAggregateOutput = dict
+
+
+AnalysisJobScalarAggregateOutput = dict
+
+
+AnalysisJobMinAggregateOutput = AnalysisJobScalarAggregateOutput
+AnalysisJobMaxAggregateOutput = AnalysisJobScalarAggregateOutput
+
+
+AnalysisJobMaxAggregateInput = dict
+
+
+AnalysisJobMinAggregateInput = dict
+
+
+AnalysisJobNumberAggregateInput = dict
+
+
+AnalysisJobAvgAggregateInput = AnalysisJobNumberAggregateInput
+AnalysisJobSumAggregateInput = AnalysisJobNumberAggregateInput
+
+
+AnalysisJobCountAggregateInput = dict
+
+AnalysisJobCountAggregateOutput = dict
+
+
+AnalysisJobKeys = Literal[
+    'id',
+    'judgment_id',
+    'user_id',
+    'status',
+    'attempts',
+    'max_attempts',
+    'run_at',
+    'locked_until',
+    'last_error',
+    'created_at',
+    'updated_at',
+    'judgment',
+]
+AnalysisJobScalarFieldKeys = Literal[
+    'id',
+    'judgment_id',
+    'user_id',
+    'status',
+    'attempts',
+    'max_attempts',
+    'run_at',
+    'locked_until',
+    'last_error',
+    'created_at',
+    'updated_at',
+]
+AnalysisJobScalarFieldKeysT = TypeVar('AnalysisJobScalarFieldKeysT', bound=AnalysisJobScalarFieldKeys)
+
+AnalysisJobRelationalFieldKeys = Literal[
+        'judgment',
+    ]
+
 
 
 # we have to import ourselves as types can be namespaced to types
-from . import types, enums, models, fields
\ No newline at end of file
+from . import types, enums, models, fields
@@ -0,0 +1,7084 @@
+# -*- coding: utf-8 -*-
+# code generated by Prisma. DO NOT EDIT.
+# pyright: reportUnusedImport=false
+# fmt: off
+
+# global imports for type checking
+from builtins import bool as _bool
+from builtins import int as _int
+from builtins import float as _float
+from builtins import str as _str
+import sys
+import decimal
+import datetime
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+    Iterable,
+    Iterator,
+    Sequence,
+    Callable,
+    ClassVar,
+    NoReturn,
+    TypeVar,
+    Generic,
+    Mapping,
+    Tuple,
+    Union,
+    List,
+    Dict,
+    Type,
+    Any,
+    Set,
+    overload,
+    cast,
+)
+from typing_extensions import TypedDict, Literal
+
+
+LiteralString = str
+# -- template types.py.jinja --
+from typing import TypeVar
+
+import httpx
+from .utils import _NoneType
+
+
+
+# TODO: filters with aggregates should have their own recursive fields
+# TODO: cleanup whitespace control
+# TODO: add an argument to signify that the last iteration should be skipped
+
+
+SortMode = Literal['default', 'insensitive']
+SortOrder = Literal['asc', 'desc']
+
+MetricsFormat = Literal['json', 'prometheus']
+
+
+class _DatasourceOverrideOptional(TypedDict, total=False):
+    env: str
+    name: str
+
+
+class DatasourceOverride(_DatasourceOverrideOptional):
+    url: str
+
+
+# NOTE: we don't support some options as their type hints are not publicly exposed
+# https://github.com/encode/httpx/discussions/1977
+class HttpConfig(TypedDict, total=False):
+    app: Callable[[Mapping[str, Any], Any], Any]
+    http1: bool
+    http2: bool
+    limits: httpx.Limits
+    timeout: Union[None, float, httpx.Timeout]
+    trust_env: bool
+    max_redirects: int
+
+
+# types that can be serialized to json by our query builder
+Serializable = Union[
+    None,
+    bool,
+    float,
+    int,
+    str,
+    datetime.datetime,
+    List[Any],
+    Dict[None, Any],
+    Dict[bool, Any],
+    Dict[float, Any],
+    Dict[int, Any],
+    Dict[str, Any],
+]
+
+
+    
+
+StringFilter = TypedDict(
+    'StringFilter',
+    {
+        'equals': str,
+        'not_in': List[str],
+        'lt': str,
+        'lte': str,
+        'gt': str,
+        'gte': str,
+        'contains': str,
+        'startswith': str,
+        'endswith': str,
+        'in': List[str],
+        'not': Union[str, 'StringFilterRecursive1'],
+        'mode': SortMode,
+    },
+    total=False,
+)
+
+
+StringFilterRecursive1 = TypedDict(
+    'StringFilterRecursive1',
+    {
+        'equals': str,
+        'not_in': List[str],
+        'lt': str,
+        'lte': str,
+        'gt': str,
+        'gte': str,
+        'contains': str,
+        'startswith': str,
+        'endswith': str,
+        'in': List[str],
+        'not': Union[str, 'StringFilterRecursive2'],
+        'mode': SortMode,
+    },
+    total=False,
+)
+
+
+StringFilterRecursive2 = TypedDict(
+    'StringFilterRecursive2',
+    {
+        'equals': str,
+        'not_in': List[str],
+        'lt': str,
+        'lte': str,
+        'gt': str,
+        'gte': str,
+        'contains': str,
+        'startswith': str,
+        'endswith': str,
+        'in': List[str],
+        'not': Union[str, 'StringFilterRecursive3'],
+        'mode': SortMode,
+    },
+    total=False,
+)
+
+
+StringFilterRecursive3 = TypedDict(
+    'StringFilterRecursive3',
+    {
+        'equals': str,
+        'not_in': List[str],
+        'lt': str,
+        'lte': str,
+        'gt': str,
+        'gte': str,
+        'contains': str,
+        'startswith': str,
+        'endswith': str,
+        'in': List[str],
+        'not': Union[str, 'StringFilterRecursive4'],
+        'mode': SortMode,
+    },
+    total=False,
+)
+
+
+StringFilterRecursive4 = TypedDict(
+    'StringFilterRecursive4',
+    {
+        'equals': str,
+        'not_in': List[str],
+        'lt': str,
+        'lte': str,
+        'gt': str,
+        'gte': str,
+        'contains': str,
+        'startswith': str,
+        'endswith': str,
+        'in': List[str],
+                'mode': SortMode,
+    },
+    total=False,
+)
+
+
+class StringWithAggregatesFilter(StringFilter, total=False):
+    _max: 'StringFilter'
+    _min: 'StringFilter'
+    _sum: 'StringFilter'
+    _avg: 'StringFilter'
+    _count: 'IntFilter'
+
+
+    
+
+DateTimeFilter = TypedDict(
+    'DateTimeFilter',
+    {
+        'equals': datetime.datetime,
+        'not_in': List[datetime.datetime],
+        'lt': datetime.datetime,
+        'lte': datetime.datetime,
+        'gt': datetime.datetime,
+        'gte': datetime.datetime,
+        'in': List[datetime.datetime],
+        'not': Union[datetime.datetime, 'DateTimeFilterRecursive1'],
+    },
+    total=False,
+)
+
+
+DateTimeFilterRecursive1 = TypedDict(
+    'DateTimeFilterRecursive1',
+    {
+        'equals': datetime.datetime,
+        'not_in': List[datetime.datetime],
+        'lt': datetime.datetime,
+        'lte': datetime.datetime,
+        'gt': datetime.datetime,
+        'gte': datetime.datetime,
+        'in': List[datetime.datetime],
+        'not': Union[datetime.datetime, 'DateTimeFilterRecursive2'],
+    },
+    total=False,
+)
+
+
+DateTimeFilterRecursive2 = TypedDict(
+    'DateTimeFilterRecursive2',
+    {
+        'equals': datetime.datetime,
+        'not_in': List[datetime.datetime],
+        'lt': datetime.datetime,
+        'lte': datetime.datetime,
+        'gt': datetime.datetime,
+        'gte': datetime.datetime,
+        'in': List[datetime.datetime],
+        'not': Union[datetime.datetime, 'DateTimeFilterRecursive3'],
+    },
+    total=False,
+)
+
+
+DateTimeFilterRecursive3 = TypedDict(
+    'DateTimeFilterRecursive3',
+    {
+        'equals': datetime.datetime,
+        'not_in': List[datetime.datetime],
+        'lt': datetime.datetime,
+        'lte': datetime.datetime,
+        'gt': datetime.datetime,
+        'gte': datetime.datetime,
+        'in': List[datetime.datetime],
+        'not': Union[datetime.datetime, 'DateTimeFilterRecursive4'],
+    },
+    total=False,
+)
+
+
+DateTimeFilterRecursive4 = TypedDict(
+    'DateTimeFilterRecursive4',
+    {
+        'equals': datetime.datetime,
+        'not_in': List[datetime.datetime],
+        'lt': datetime.datetime,
+        'lte': datetime.datetime,
+        'gt': datetime.datetime,
+        'gte': datetime.datetime,
+        'in': List[datetime.datetime],
+            },
+    total=False,
+)
+
+
+class DateTimeWithAggregatesFilter(DateTimeFilter, total=False):
+    _max: 'DateTimeFilter'
+    _min: 'DateTimeFilter'
+    _sum: 'DateTimeFilter'
+    _avg: 'DateTimeFilter'
+    _count: 'IntFilter'
+
+
+    
+
+BooleanFilter = TypedDict(
+    'BooleanFilter',
+    {
+        'equals': bool,
+        'not': Union[bool, 'BooleanFilterRecursive1'],
+    },
+    total=False,
+)
+
+
+BooleanFilterRecursive1 = TypedDict(
+    'BooleanFilterRecursive1',
+    {
+        'equals': bool,
+        'not': Union[bool, 'BooleanFilterRecursive2'],
+    },
+    total=False,
+)
+
+
+BooleanFilterRecursive2 = TypedDict(
+    'BooleanFilterRecursive2',
+    {
+        'equals': bool,
+        'not': Union[bool, 'BooleanFilterRecursive3'],
+    },
+    total=False,
+)
+
+
+BooleanFilterRecursive3 = TypedDict(
+    'BooleanFilterRecursive3',
+    {
+        'equals': bool,
+        'not': Union[bool, 'BooleanFilterRecursive4'],
+    },
+    total=False,
+)
+
+
+BooleanFilterRecursive4 = TypedDict(
+    'BooleanFilterRecursive4',
+    {
+        'equals': bool,
+            },
+    total=False,
+)
+
+
+class BooleanWithAggregatesFilter(BooleanFilter, total=False):
+    _max: 'BooleanFilter'
+    _min: 'BooleanFilter'
+    _sum: 'BooleanFilter'
+    _avg: 'BooleanFilter'
+    _count: 'IntFilter'
+
+
+    
+
+IntFilter = TypedDict(
+    'IntFilter',
+    {
+        'equals': int,
+        'not_in': List[int],
+        'lt': int,
+        'lte': int,
+        'gt': int,
+        'gte': int,
+        'in': List[int],
+        'not': Union[int, 'IntFilterRecursive1'],
+    },
+    total=False,
+)
+
+
+IntFilterRecursive1 = TypedDict(
+    'IntFilterRecursive1',
+    {
+        'equals': int,
+        'not_in': List[int],
+        'lt': int,
+        'lte': int,
+        'gt': int,
+        'gte': int,
+        'in': List[int],
+        'not': Union[int, 'IntFilterRecursive2'],
+    },
+    total=False,
+)
+
+
+IntFilterRecursive2 = TypedDict(
+    'IntFilterRecursive2',
+    {
+        'equals': int,
+        'not_in': List[int],
+        'lt': int,
+        'lte': int,
+        'gt': int,
+        'gte': int,
+        'in': List[int],
+        'not': Union[int, 'IntFilterRecursive3'],
+    },
+    total=False,
+)
+
+
+IntFilterRecursive3 = TypedDict(
+    'IntFilterRecursive3',
+    {
+        'equals': int,
+        'not_in': List[int],
+        'lt': int,
+        'lte': int,
+        'gt': int,
+        'gte': int,
+        'in': List[int],
+        'not': Union[int, 'IntFilterRecursive4'],
+    },
+    total=False,
+)
+
+
+IntFilterRecursive4 = TypedDict(
+    'IntFilterRecursive4',
+    {
+        'equals': int,
+        'not_in': List[int],
+        'lt': int,
+        'lte': int,
+        'gt': int,
+        'gte': int,
+        'in': List[int],
+            },
+    total=False,
+)
+
+
+class IntWithAggregatesFilter(IntFilter, total=False):
+    _max: 'IntFilter'
+    _min: 'IntFilter'
+    _sum: 'IntFilter'
+    _avg: 'IntFilter'
+    _count: 'IntFilter'
+
+
+BigIntFilter = IntFilter
+BigIntWithAggregatesFilter = IntWithAggregatesFilter
+    
+
+FloatFilter = TypedDict(
+    'FloatFilter',
+    {
+        'equals': float,
+        'not_in': List[float],
+        'lt': float,
+        'lte': float,
+        'gt': float,
+        'gte': float,
+        'in': List[float],
+        'not': Union[float, 'FloatFilterRecursive1'],
+    },
+    total=False,
+)
+
+
+FloatFilterRecursive1 = TypedDict(
+    'FloatFilterRecursive1',
+    {
+        'equals': float,
+        'not_in': List[float],
+        'lt': float,
+        'lte': float,
+        'gt': float,
+        'gte': float,
+        'in': List[float],
+        'not': Union[float, 'FloatFilterRecursive2'],
+    },
+    total=False,
+)
+
+
+FloatFilterRecursive2 = TypedDict(
+    'FloatFilterRecursive2',
+    {
+        'equals': float,
+        'not_in': List[float],
+        'lt': float,
+        'lte': float,
+        'gt': float,
+        'gte': float,
+        'in': List[float],
+        'not': Union[float, 'FloatFilterRecursive3'],
+    },
+    total=False,
+)
+
+
+FloatFilterRecursive3 = TypedDict(
+    'FloatFilterRecursive3',
+    {
+        'equals': float,
+        'not_in': List[float],
+        'lt': float,
+        'lte': float,
+        'gt': float,
+        'gte': float,
+        'in': List[float],
+        'not': Union[float, 'FloatFilterRecursive4'],
+    },
+    total=False,
+)
+
+
+FloatFilterRecursive4 = TypedDict(
+    'FloatFilterRecursive4',
+    {
+        'equals': float,
+        'not_in': List[float],
+        'lt': float,
+        'lte': float,
+        'gt': float,
+        'gte': float,
+        'in': List[float],
+            },
+    total=False,
+)
+
+
+class FloatWithAggregatesFilter(FloatFilter, total=False):
+    _max: 'FloatFilter'
+    _min: 'FloatFilter'
+    _sum: 'FloatFilter'
+    _avg: 'FloatFilter'
+    _count: 'IntFilter'
+
+
+    
+
+BytesFilter = TypedDict(
+    'BytesFilter',
+    {
+        'equals': 'fields.Base64',
+        'in': List['fields.Base64'],
+        'not_in': List['fields.Base64'],
+        'not': Union['fields.Base64', 'BytesFilterRecursive1'],
+    },
+    total=False,
+)
+
+
+BytesFilterRecursive1 = TypedDict(
+    'BytesFilterRecursive1',
+    {
+        'equals': 'fields.Base64',
+        'in': List['fields.Base64'],
+        'not_in': List['fields.Base64'],
+        'not': Union['fields.Base64', 'BytesFilterRecursive2'],
+    },
+    total=False,
+)
+
+
+BytesFilterRecursive2 = TypedDict(
+    'BytesFilterRecursive2',
+    {
+        'equals': 'fields.Base64',
+        'in': List['fields.Base64'],
+        'not_in': List['fields.Base64'],
+        'not': Union['fields.Base64', 'BytesFilterRecursive3'],
+    },
+    total=False,
+)
+
+
+BytesFilterRecursive3 = TypedDict(
+    'BytesFilterRecursive3',
+    {
+        'equals': 'fields.Base64',
+        'in': List['fields.Base64'],
+        'not_in': List['fields.Base64'],
+        'not': Union['fields.Base64', 'BytesFilterRecursive4'],
+    },
+    total=False,
+)
+
+
+BytesFilterRecursive4 = TypedDict(
+    'BytesFilterRecursive4',
+    {
+        'equals': 'fields.Base64',
+        'in': List['fields.Base64'],
+        'not_in': List['fields.Base64'],
+            },
+    total=False,
+)
+
+
+class BytesWithAggregatesFilter(BytesFilter, total=False):
+    _max: 'BytesFilter'
+    _min: 'BytesFilter'
+    _sum: 'BytesFilter'
+    _avg: 'BytesFilter'
+    _count: 'IntFilter'
+
+
+# TODO: preview feature for improving JSON filtering
+JsonFilter = TypedDict(
+    'JsonFilter',
+    {
+        'equals': 'fields.Json',
+        'not': 'fields.Json',
+    },
+    total=False,
+)
+
+
+class JsonWithAggregatesFilter(JsonFilter, total=False):
+    _max: 'JsonFilter'
+    _min: 'JsonFilter'
+    _sum: 'JsonFilter'
+    _avg: 'JsonFilter'
+    _count: 'IntFilter'
+
+
+    
+
+DecimalFilter = TypedDict(
+    'DecimalFilter',
+    {
+        'equals': decimal.Decimal,
+        'not_in': List[decimal.Decimal],
+        'lt': decimal.Decimal,
+        'lte': decimal.Decimal,
+        'gt': decimal.Decimal,
+        'gte': decimal.Decimal,
+        'in': List[decimal.Decimal],
+        'not': Union[decimal.Decimal, 'DecimalFilterRecursive1'],
+    },
+    total=False,
+)
+
+
+DecimalFilterRecursive1 = TypedDict(
+    'DecimalFilterRecursive1',
+    {
+        'equals': decimal.Decimal,
+        'not_in': List[decimal.Decimal],
+        'lt': decimal.Decimal,
+        'lte': decimal.Decimal,
+        'gt': decimal.Decimal,
+        'gte': decimal.Decimal,
+        'in': List[decimal.Decimal],
+        'not': Union[decimal.Decimal, 'DecimalFilterRecursive2'],
+    },
+    total=False,
+)
+
+
+DecimalFilterRecursive2 = TypedDict(
+    'DecimalFilterRecursive2',
+    {
+        'equals': decimal.Decimal,
+        'not_in': List[decimal.Decimal],
+        'lt': decimal.Decimal,
+        'lte': decimal.Decimal,
+        'gt': decimal.Decimal,
+        'gte': decimal.Decimal,
+        'in': List[decimal.Decimal],
+        'not': Union[decimal.Decimal, 'DecimalFilterRecursive3'],
+    },
+    total=False,
+)
+
+
+DecimalFilterRecursive3 = TypedDict(
+    'DecimalFilterRecursive3',
+    {
+        'equals': decimal.Decimal,
+        'not_in': List[decimal.Decimal],
+        'lt': decimal.Decimal,
+        'lte': decimal.Decimal,
+        'gt': decimal.Decimal,
+        'gte': decimal.Decimal,
+        'in': List[decimal.Decimal],
+        'not': Union[decimal.Decimal, 'DecimalFilterRecursive4'],
+    },
+    total=False,
+)
+
+
+DecimalFilterRecursive4 = TypedDict(
+    'DecimalFilterRecursive4',
+    {
+        'equals': decimal.Decimal,
+        'not_in': List[decimal.Decimal],
+        'lt': decimal.Decimal,
+        'lte': decimal.Decimal,
+        'gt': decimal.Decimal,
+        'gte': decimal.Decimal,
+        'in': List[decimal.Decimal],
+            },
+    total=False,
+)
+
+
+class DecimalWithAggregatesFilter(StringFilter, total=False):
+    _max: 'DecimalFilter'
+    _min: 'DecimalFilter'
+    _sum: 'DecimalFilter'
+    _avg: 'DecimalFilter'
+    _count: 'IntFilter'
+
+
+class _FloatSetInput(TypedDict):
+    set: float
+
+
+class _FloatDivideInput(TypedDict):
+    divide: float
+
+
+class _FloatMultiplyInput(TypedDict):
+    multiply: float
+
+
+class _FloatIncrementInput(TypedDict):
+    increment: float
+
+
+class _FloatDecrementInput(TypedDict):
+    decrement: float
+
+
+class _IntSetInput(TypedDict):
+    set: int
+
+
+class _IntDivideInput(TypedDict):
+    divide: int
+
+
+class _IntMultiplyInput(TypedDict):
+    multiply: int
+
+
+class _IntIncrementInput(TypedDict):
+    increment: int
+
+
+class _IntDecrementInput(TypedDict):
+    decrement: int
+
+
+AtomicFloatInput = Union[
+    _FloatSetInput,
+    _FloatDivideInput,
+    _FloatMultiplyInput,
+    _FloatIncrementInput,
+    _FloatDecrementInput,
+]
+AtomicIntInput = Union[
+    _IntSetInput,
+    _IntDivideInput,
+    _IntMultiplyInput,
+    _IntIncrementInput,
+    _IntDecrementInput,
+]
+AtomicBigIntInput = AtomicIntInput
+
+class _StringListFilterEqualsInput(TypedDict):
+    equals: Optional[List[_str]]
+
+
+class _StringListFilterHasInput(TypedDict):
+    has: _str
+
+
+class _StringListFilterHasEveryInput(TypedDict):
+    has_every: List[_str]
+
+
+class _StringListFilterHasSomeInput(TypedDict):
+    has_some: List[_str]
+
+
+class _StringListFilterIsEmptyInput(TypedDict):
+    is_empty: bool
+
+
+StringListFilter = Union[
+    _StringListFilterHasInput,
+    _StringListFilterEqualsInput,
+    _StringListFilterHasSomeInput,
+    _StringListFilterIsEmptyInput,
+    _StringListFilterHasEveryInput,
+]
+
+
+class _StringListUpdateSet(TypedDict):
+    set: List[_str]
+
+
+class _StringListUpdatePush(TypedDict):
+    push: List[_str]
+
+
+StringListUpdate = Union[
+    List[_str],
+    _StringListUpdateSet,
+    _StringListUpdatePush,
+]
+
+class _BytesListFilterEqualsInput(TypedDict):
+    equals: Optional[List['fields.Base64']]
+
+
+class _BytesListFilterHasInput(TypedDict):
+    has: 'fields.Base64'
+
+
+class _BytesListFilterHasEveryInput(TypedDict):
+    has_every: List['fields.Base64']
+
+
+class _BytesListFilterHasSomeInput(TypedDict):
+    has_some: List['fields.Base64']
+
+
+class _BytesListFilterIsEmptyInput(TypedDict):
+    is_empty: bool
+
+
+BytesListFilter = Union[
+    _BytesListFilterHasInput,
+    _BytesListFilterEqualsInput,
+    _BytesListFilterHasSomeInput,
+    _BytesListFilterIsEmptyInput,
+    _BytesListFilterHasEveryInput,
+]
+
+
+class _BytesListUpdateSet(TypedDict):
+    set: List['fields.Base64']
+
+
+class _BytesListUpdatePush(TypedDict):
+    push: List['fields.Base64']
+
+
+BytesListUpdate = Union[
+    List['fields.Base64'],
+    _BytesListUpdateSet,
+    _BytesListUpdatePush,
+]
+
+class _DateTimeListFilterEqualsInput(TypedDict):
+    equals: Optional[List[datetime.datetime]]
+
+
+class _DateTimeListFilterHasInput(TypedDict):
+    has: datetime.datetime
+
+
+class _DateTimeListFilterHasEveryInput(TypedDict):
+    has_every: List[datetime.datetime]
+
+
+class _DateTimeListFilterHasSomeInput(TypedDict):
+    has_some: List[datetime.datetime]
+
+
+class _DateTimeListFilterIsEmptyInput(TypedDict):
+    is_empty: bool
+
+
+DateTimeListFilter = Union[
+    _DateTimeListFilterHasInput,
+    _DateTimeListFilterEqualsInput,
+    _DateTimeListFilterHasSomeInput,
+    _DateTimeListFilterIsEmptyInput,
+    _DateTimeListFilterHasEveryInput,
+]
+
+
+class _DateTimeListUpdateSet(TypedDict):
+    set: List[datetime.datetime]
+
+
+class _DateTimeListUpdatePush(TypedDict):
+    push: List[datetime.datetime]
+
+
+DateTimeListUpdate = Union[
+    List[datetime.datetime],
+    _DateTimeListUpdateSet,
+    _DateTimeListUpdatePush,
+]
+
+class _BooleanListFilterEqualsInput(TypedDict):
+    equals: Optional[List[_bool]]
+
+
+class _BooleanListFilterHasInput(TypedDict):
+    has: _bool
+
+
+class _BooleanListFilterHasEveryInput(TypedDict):
+    has_every: List[_bool]
+
+
+class _BooleanListFilterHasSomeInput(TypedDict):
+    has_some: List[_bool]
+
+
+class _BooleanListFilterIsEmptyInput(TypedDict):
+    is_empty: bool
+
+
+BooleanListFilter = Union[
+    _BooleanListFilterHasInput,
+    _BooleanListFilterEqualsInput,
+    _BooleanListFilterHasSomeInput,
+    _BooleanListFilterIsEmptyInput,
+    _BooleanListFilterHasEveryInput,
+]
+
+
+class _BooleanListUpdateSet(TypedDict):
+    set: List[_bool]
+
+
+class _BooleanListUpdatePush(TypedDict):
+    push: List[_bool]
+
+
+BooleanListUpdate = Union[
+    List[_bool],
+    _BooleanListUpdateSet,
+    _BooleanListUpdatePush,
+]
+
+class _IntListFilterEqualsInput(TypedDict):
+    equals: Optional[List[_int]]
+
+
+class _IntListFilterHasInput(TypedDict):
+    has: _int
+
+
+class _IntListFilterHasEveryInput(TypedDict):
+    has_every: List[_int]
+
+
+class _IntListFilterHasSomeInput(TypedDict):
+    has_some: List[_int]
+
+
+class _IntListFilterIsEmptyInput(TypedDict):
+    is_empty: bool
+
+
+IntListFilter = Union[
+    _IntListFilterHasInput,
+    _IntListFilterEqualsInput,
+    _IntListFilterHasSomeInput,
+    _IntListFilterIsEmptyInput,
+    _IntListFilterHasEveryInput,
+]
+
+
+class _IntListUpdateSet(TypedDict):
+    set: List[_int]
+
+
+class _IntListUpdatePush(TypedDict):
+    push: List[_int]
+
+
+IntListUpdate = Union[
+    List[_int],
+    _IntListUpdateSet,
+    _IntListUpdatePush,
+]
+
+class _BigIntListFilterEqualsInput(TypedDict):
+    equals: Optional[List[_int]]
+
+
+class _BigIntListFilterHasInput(TypedDict):
+    has: _int
+
+
+class _BigIntListFilterHasEveryInput(TypedDict):
+    has_every: List[_int]
+
+
+class _BigIntListFilterHasSomeInput(TypedDict):
+    has_some: List[_int]
+
+
+class _BigIntListFilterIsEmptyInput(TypedDict):
+    is_empty: bool
+
+
+BigIntListFilter = Union[
+    _BigIntListFilterHasInput,
+    _BigIntListFilterEqualsInput,
+    _BigIntListFilterHasSomeInput,
+    _BigIntListFilterIsEmptyInput,
+    _BigIntListFilterHasEveryInput,
+]
+
+
+class _BigIntListUpdateSet(TypedDict):
+    set: List[_int]
+
+
+class _BigIntListUpdatePush(TypedDict):
+    push: List[_int]
+
+
+BigIntListUpdate = Union[
+    List[_int],
+    _BigIntListUpdateSet,
+    _BigIntListUpdatePush,
+]
+
+class _FloatListFilterEqualsInput(TypedDict):
+    equals: Optional[List[_float]]
+
+
+class _FloatListFilterHasInput(TypedDict):
+    has: _float
+
+
+class _FloatListFilterHasEveryInput(TypedDict):
+    has_every: List[_float]
+
+
+class _FloatListFilterHasSomeInput(TypedDict):
+    has_some: List[_float]
+
+
+class _FloatListFilterIsEmptyInput(TypedDict):
+    is_empty: bool
+
+
+FloatListFilter = Union[
+    _FloatListFilterHasInput,
+    _FloatListFilterEqualsInput,
+    _FloatListFilterHasSomeInput,
+    _FloatListFilterIsEmptyInput,
+    _FloatListFilterHasEveryInput,
+]
+
+
+class _FloatListUpdateSet(TypedDict):
+    set: List[_float]
+
+
+class _FloatListUpdatePush(TypedDict):
+    push: List[_float]
+
+
+FloatListUpdate = Union[
+    List[_float],
+    _FloatListUpdateSet,
+    _FloatListUpdatePush,
+]
+
+class _JsonListFilterEqualsInput(TypedDict):
+    equals: Optional[List['fields.Json']]
+
+
+class _JsonListFilterHasInput(TypedDict):
+    has: 'fields.Json'
+
+
+class _JsonListFilterHasEveryInput(TypedDict):
+    has_every: List['fields.Json']
+
+
+class _JsonListFilterHasSomeInput(TypedDict):
+    has_some: List['fields.Json']
+
+
+class _JsonListFilterIsEmptyInput(TypedDict):
+    is_empty: bool
+
+
+JsonListFilter = Union[
+    _JsonListFilterHasInput,
+    _JsonListFilterEqualsInput,
+    _JsonListFilterHasSomeInput,
+    _JsonListFilterIsEmptyInput,
+    _JsonListFilterHasEveryInput,
+]
+
+
+class _JsonListUpdateSet(TypedDict):
+    set: List['fields.Json']
+
+
+class _JsonListUpdatePush(TypedDict):
+    push: List['fields.Json']
+
+
+JsonListUpdate = Union[
+    List['fields.Json'],
+    _JsonListUpdateSet,
+    _JsonListUpdatePush,
+]
+
+class _DecimalListFilterEqualsInput(TypedDict):
+    equals: Optional[List[decimal.Decimal]]
+
+
+class _DecimalListFilterHasInput(TypedDict):
+    has: decimal.Decimal
+
+
+class _DecimalListFilterHasEveryInput(TypedDict):
+    has_every: List[decimal.Decimal]
+
+
+class _DecimalListFilterHasSomeInput(TypedDict):
+    has_some: List[decimal.Decimal]
+
+
+class _DecimalListFilterIsEmptyInput(TypedDict):
+    is_empty: bool
+
+
+DecimalListFilter = Union[
+    _DecimalListFilterHasInput,
+    _DecimalListFilterEqualsInput,
+    _DecimalListFilterHasSomeInput,
+    _DecimalListFilterIsEmptyInput,
+    _DecimalListFilterHasEveryInput,
+]
+
+
+class _DecimalListUpdateSet(TypedDict):
+    set: List[decimal.Decimal]
+
+
+class _DecimalListUpdatePush(TypedDict):
+    push: List[decimal.Decimal]
+
+
+DecimalListUpdate = Union[
+    List[decimal.Decimal],
+    _DecimalListUpdateSet,
+    _DecimalListUpdatePush,
+]
+
+
+# User types
+
+class UserOptionalCreateInput(TypedDict, total=False):
+    """Optional arguments to the User create method"""
+    id: _str
+    avatar_url: Optional[_str]
+    access_token: Optional[_str]
+    created_at: datetime.datetime
+    updated_at: datetime.datetime
+    judgments: 'JudgmentCreateManyNestedWithoutRelationsInput'
+
+
+class UserCreateInput(UserOptionalCreateInput):
+    """Required arguments to the User create method"""
+    github_id: _str
+    username: _str
+
+
+# TODO: remove this in favour of without explicit relations
+# e.g. PostCreateWithoutAuthorInput
+
+class UserOptionalCreateWithoutRelationsInput(TypedDict, total=False):
+    """Optional arguments to the User create method, without relations"""
+    id: _str
+    avatar_url: Optional[_str]
+    access_token: Optional[_str]
+    created_at: datetime.datetime
+    updated_at: datetime.datetime
+
+
+class UserCreateWithoutRelationsInput(UserOptionalCreateWithoutRelationsInput):
+    """Required arguments to the User create method, without relations"""
+    github_id: _str
+    username: _str
+
+
+class UserCreateNestedWithoutRelationsInput(TypedDict, total=False):
+    create: 'UserCreateWithoutRelationsInput'
+    connect: 'UserWhereUniqueInput'
+
+
+class UserCreateManyNestedWithoutRelationsInput(TypedDict, total=False):
+    create: Union['UserCreateWithoutRelationsInput', List['UserCreateWithoutRelationsInput']]
+    connect: Union['UserWhereUniqueInput', List['UserWhereUniqueInput']]
+
+
+_UserWhereUnique_id_Input = TypedDict(
+    '_UserWhereUnique_id_Input',
+    {
+        'id': '_str',
+    },
+    total=True
+)
+
+_UserWhereUnique_github_id_Input = TypedDict(
+    '_UserWhereUnique_github_id_Input',
+    {
+        'github_id': '_str',
+    },
+    total=True
+)
+
+UserWhereUniqueInput = Union[
+    '_UserWhereUnique_id_Input',
+    '_UserWhereUnique_github_id_Input',
+]
+
+
+class UserUpdateInput(TypedDict, total=False):
+    """Optional arguments for updating a record"""
+    id: _str
+    github_id: _str
+    username: _str
+    avatar_url: Optional[_str]
+    access_token: Optional[_str]
+    created_at: datetime.datetime
+    updated_at: datetime.datetime
+    judgments: 'JudgmentUpdateManyWithoutRelationsInput'
+
+
+class UserUpdateManyMutationInput(TypedDict, total=False):
+    """Arguments for updating many records"""
+    id: _str
+    github_id: _str
+    username: _str
+    avatar_url: Optional[_str]
+    access_token: Optional[_str]
+    created_at: datetime.datetime
+    updated_at: datetime.datetime
+
+
+class UserUpdateManyWithoutRelationsInput(TypedDict, total=False):
+    create: List['UserCreateWithoutRelationsInput']
+    connect: List['UserWhereUniqueInput']
+    set: List['UserWhereUniqueInput']
+    disconnect: List['UserWhereUniqueInput']
+    delete: List['UserWhereUniqueInput']
+
+    # TODO
+    # update: List['UserUpdateWithWhereUniqueWithoutRelationsInput']
+    # updateMany: List['UserUpdateManyWithWhereUniqueWithoutRelationsInput']
+    # deleteMany: List['UserScalarWhereInput']
+    # upsert: List['UserUpserteWithWhereUniqueWithoutRelationsInput']
+    # connectOrCreate: List['UserCreateOrConnectWithoutRelationsInput']
+
+
+class UserUpdateOneWithoutRelationsInput(TypedDict, total=False):
+    create: 'UserCreateWithoutRelationsInput'
+    connect: 'UserWhereUniqueInput'
+    disconnect: bool
+    delete: bool
+
+    # TODO
+    # update: 'UserUpdateInput'
+    # upsert: 'UserUpsertWithoutRelationsInput'
+    # connectOrCreate: 'UserCreateOrConnectWithoutRelationsInput'
+
+
+class UserUpsertInput(TypedDict):
+    create: 'UserCreateInput'
+    update: 'UserUpdateInput'  # pyright: ignore[reportIncompatibleMethodOverride]
+
+
+_User_id_OrderByInput = TypedDict(
+    '_User_id_OrderByInput',
+    {
+        'id': 'SortOrder',
+    },
+    total=True
+)
+
+_User_github_id_OrderByInput = TypedDict(
+    '_User_github_id_OrderByInput',
+    {
+        'github_id': 'SortOrder',
+    },
+    total=True
+)
+
+_User_username_OrderByInput = TypedDict(
+    '_User_username_OrderByInput',
+    {
+        'username': 'SortOrder',
+    },
+    total=True
+)
+
+_User_avatar_url_OrderByInput = TypedDict(
+    '_User_avatar_url_OrderByInput',
+    {
+        'avatar_url': 'SortOrder',
+    },
+    total=True
+)
+
+_User_access_token_OrderByInput = TypedDict(
+    '_User_access_token_OrderByInput',
+    {
+        'access_token': 'SortOrder',
+    },
+    total=True
+)
+
+_User_created_at_OrderByInput = TypedDict(
+    '_User_created_at_OrderByInput',
+    {
+        'created_at': 'SortOrder',
+    },
+    total=True
+)
+
+_User_updated_at_OrderByInput = TypedDict(
+    '_User_updated_at_OrderByInput',
+    {
+        'updated_at': 'SortOrder',
+    },
+    total=True
+)
+
+UserOrderByInput = Union[
+    '_User_id_OrderByInput',
+    '_User_github_id_OrderByInput',
+    '_User_username_OrderByInput',
+    '_User_avatar_url_OrderByInput',
+    '_User_access_token_OrderByInput',
+    '_User_created_at_OrderByInput',
+    '_User_updated_at_OrderByInput',
+]
+
+
+
+# recursive User types
+# TODO: cleanup these types
+
+
+# Dict[str, Any] is a mypy limitation
+# see https://github.com/RobertCraigie/prisma-client-py/issues/45
+# switch to pyright for improved types, see https://prisma-client-py.readthedocs.io/en/stable/reference/limitations/
+
+UserRelationFilter = TypedDict(
+    'UserRelationFilter',
+    {
+        'is': 'Dict[str, Any]',
+        'is_not': 'Dict[str, Any]',
+    },
+    total=False,
+)
+
+
+class UserListRelationFilter(TypedDict, total=False):
+    some: 'Dict[str, Any]'
+    none: 'Dict[str, Any]'
+    every: 'Dict[str, Any]'
+
+
+class UserInclude(TypedDict, total=False):
+    """User relational arguments"""
+    judgments: Union[bool, 'FindManyJudgmentArgsFromUser']
+
+
+    
+
+class UserIncludeFromUser(TypedDict, total=False):
+    """Relational arguments for User"""
+    judgments: Union[bool, 'FindManyJudgmentArgsFromUserRecursive1']
+
+
+class UserIncludeFromUserRecursive1(TypedDict, total=False):
+    """Relational arguments for User"""
+    judgments: Union[bool, 'FindManyJudgmentArgsFromUserRecursive2']
+
+
+class UserIncludeFromUserRecursive2(TypedDict, total=False):
+    """Relational arguments for User"""
+    judgments: Union[bool, 'FindManyJudgmentArgsFromUserRecursive3']
+
+
+class UserIncludeFromUserRecursive3(TypedDict, total=False):
+    """Relational arguments for User"""
+    judgments: Union[bool, 'FindManyJudgmentArgsFromUserRecursive4']
+
+
+class UserIncludeFromUserRecursive4(TypedDict, total=False):
+    """Relational arguments for User"""
+
+    
+
+class UserArgsFromUser(TypedDict, total=False):
+    """Arguments for User"""
+    select: List['UserScalarFieldKeys']
+    include: 'UserIncludeFromUserRecursive1'
+
+
+class UserArgsFromUserRecursive1(TypedDict, total=False):
+    """Arguments for User"""
+    select: List['UserScalarFieldKeys']
+    include: 'UserIncludeFromUserRecursive2'
+
+
+class UserArgsFromUserRecursive2(TypedDict, total=False):
+    """Arguments for User"""
+    select: List['UserScalarFieldKeys']
+    include: 'UserIncludeFromUserRecursive3'
+
+
+class UserArgsFromUserRecursive3(TypedDict, total=False):
+    """Arguments for User"""
+    select: List['UserScalarFieldKeys']
+    include: 'UserIncludeFromUserRecursive4'
+
+
+class UserArgsFromUserRecursive4(TypedDict, total=False):
+    """Arguments for User"""
+    select: List['UserScalarFieldKeys']
+    
+    
+
+class FindManyUserArgsFromUser(TypedDict, total=False):
+    """Arguments for User"""
+    take: int
+    skip: int
+    order_by: Union['UserOrderByInput', List['UserOrderByInput']]
+    where: 'UserWhereInput'
+    cursor: 'UserWhereUniqueInput'
+    distinct: List['UserScalarFieldKeys']
+    select: List['UserScalarFieldKeys']
+    include: 'UserIncludeFromUserRecursive1'
+
+
+class FindManyUserArgsFromUserRecursive1(TypedDict, total=False):
+    """Arguments for User"""
+    take: int
+    skip: int
+    order_by: Union['UserOrderByInput', List['UserOrderByInput']]
+    where: 'UserWhereInput'
+    cursor: 'UserWhereUniqueInput'
+    distinct: List['UserScalarFieldKeys']
+    select: List['UserScalarFieldKeys']
+    include: 'UserIncludeFromUserRecursive2'
+
+
+class FindManyUserArgsFromUserRecursive2(TypedDict, total=False):
+    """Arguments for User"""
+    take: int
+    skip: int
+    order_by: Union['UserOrderByInput', List['UserOrderByInput']]
+    where: 'UserWhereInput'
+    cursor: 'UserWhereUniqueInput'
+    distinct: List['UserScalarFieldKeys']
+    select: List['UserScalarFieldKeys']
+    include: 'UserIncludeFromUserRecursive3'
+
+
+class FindManyUserArgsFromUserRecursive3(TypedDict, total=False):
+    """Arguments for User"""
+    take: int
+    skip: int
+    order_by: Union['UserOrderByInput', List['UserOrderByInput']]
+    where: 'UserWhereInput'
+    cursor: 'UserWhereUniqueInput'
+    distinct: List['UserScalarFieldKeys']
+    select: List['UserScalarFieldKeys']
+    include: 'UserIncludeFromUserRecursive4'
+
+
+class FindManyUserArgsFromUserRecursive4(TypedDict, total=False):
+    """Arguments for User"""
+    take: int
+    skip: int
+    order_by: Union['UserOrderByInput', List['UserOrderByInput']]
+    where: 'UserWhereInput'
+    cursor: 'UserWhereUniqueInput'
+    distinct: List['UserScalarFieldKeys']
+    select: List['UserScalarFieldKeys']
+    
+    
+
+class JudgmentIncludeFromUser(TypedDict, total=False):
+    """Relational arguments for User"""
+    user: Union[bool, 'UserArgsFromUserRecursive1']
+    suspects: Union[bool, 'FindManySuspectArgsFromUserRecursive1']
+    blame: Union[bool, 'BlameArgsFromUserRecursive1']
+    jobs: Union[bool, 'FindManyAnalysisJobArgsFromUserRecursive1']
+
+
+class JudgmentIncludeFromUserRecursive1(TypedDict, total=False):
+    """Relational arguments for User"""
+    user: Union[bool, 'UserArgsFromUserRecursive2']
+    suspects: Union[bool, 'FindManySuspectArgsFromUserRecursive2']
+    blame: Union[bool, 'BlameArgsFromUserRecursive2']
+    jobs: Union[bool, 'FindManyAnalysisJobArgsFromUserRecursive2']
+
+
+class JudgmentIncludeFromUserRecursive2(TypedDict, total=False):
+    """Relational arguments for User"""
+    user: Union[bool, 'UserArgsFromUserRecursive3']
+    suspects: Union[bool, 'FindManySuspectArgsFromUserRecursive3']
+    blame: Union[bool, 'BlameArgsFromUserRecursive3']
+    jobs: Union[bool, 'FindManyAnalysisJobArgsFromUserRecursive3']
+
+
+class JudgmentIncludeFromUserRecursive3(TypedDict, total=False):
+    """Relational arguments for User"""
+    user: Union[bool, 'UserArgsFromUserRecursive4']
+    suspects: Union[bool, 'FindManySuspectArgsFromUserRecursive4']
+    blame: Union[bool, 'BlameArgsFromUserRecursive4']
+    jobs: Union[bool, 'FindManyAnalysisJobArgsFromUserRecursive4']
+
+
+class JudgmentIncludeFromUserRecursive4(TypedDict, total=False):
+    """Relational arguments for User"""
+
+    
+
+class JudgmentArgsFromUser(TypedDict, total=False):
+    """Arguments for User"""
+    select: List['JudgmentScalarFieldKeys']
+    include: 'JudgmentIncludeFromJudgmentRecursive1'
+
+
+class JudgmentArgsFromUserRecursive1(TypedDict, total=False):
+    """Arguments for User"""
+    select: List['JudgmentScalarFieldKeys']
+    include: 'JudgmentIncludeFromJudgmentRecursive2'
+
+
+class JudgmentArgsFromUserRecursive2(TypedDict, total=False):
+    """Arguments for User"""
+    select: List['JudgmentScalarFieldKeys']
+    include: 'JudgmentIncludeFromJudgmentRecursive3'
+
+
+class JudgmentArgsFromUserRecursive3(TypedDict, total=False):
+    """Arguments for User"""
+    select: List['JudgmentScalarFieldKeys']
+    include: 'JudgmentIncludeFromJudgmentRecursive4'
+
+
+class JudgmentArgsFromUserRecursive4(TypedDict, total=False):
+    """Arguments for User"""
+    select: List['JudgmentScalarFieldKeys']
+    
+    
+
+class FindManyJudgmentArgsFromUser(TypedDict, total=False):
+    """Arguments for User"""
+    take: int
+    skip: int
+    order_by: Union['JudgmentOrderByInput', List['JudgmentOrderByInput']]
+    where: 'JudgmentWhereInput'
+    cursor: 'JudgmentWhereUniqueInput'
+    distinct: List['JudgmentScalarFieldKeys']
+    select: List['JudgmentScalarFieldKeys']
+    include: 'JudgmentIncludeFromJudgmentRecursive1'
+
+
+class FindManyJudgmentArgsFromUserRecursive1(TypedDict, total=False):
+    """Arguments for User"""
+    take: int
+    skip: int
+    order_by: Union['JudgmentOrderByInput', List['JudgmentOrderByInput']]
+    where: 'JudgmentWhereInput'
+    cursor: 'JudgmentWhereUniqueInput'
+    distinct: List['JudgmentScalarFieldKeys']
+    select: List['JudgmentScalarFieldKeys']
+    include: 'JudgmentIncludeFromJudgmentRecursive2'
+
+
+class FindManyJudgmentArgsFromUserRecursive2(TypedDict, total=False):
+    """Arguments for User"""
+    take: int
+    skip: int
+    order_by: Union['JudgmentOrderByInput', List['JudgmentOrderByInput']]
+    where: 'JudgmentWhereInput'
+    cursor: 'JudgmentWhereUniqueInput'
+    distinct: List['JudgmentScalarFieldKeys']
+    select: List['JudgmentScalarFieldKeys']
+    include: 'JudgmentIncludeFromJudgmentRecursive3'
+
+
+class FindManyJudgmentArgsFromUserRecursive3(TypedDict, total=False):
+    """Arguments for User"""
+    take: int
+    skip: int
+    order_by: Union['JudgmentOrderByInput', List['JudgmentOrderByInput']]
+    where: 'JudgmentWhereInput'
+    cursor: 'JudgmentWhereUniqueInput'
+    distinct: List['JudgmentScalarFieldKeys']
+    select: List['JudgmentScalarFieldKeys']
+    include: 'JudgmentIncludeFromJudgmentRecursive4'
+
+
+class FindManyJudgmentArgsFromUserRecursive4(TypedDict, total=False):
+    """Arguments for User"""
+    take: int
+    skip: int
+    order_by: Union['JudgmentOrderByInput', List['JudgmentOrderByInput']]
+    where: 'JudgmentWhereInput'
+    cursor: 'JudgmentWhereUniqueInput'
+    distinct: List['JudgmentScalarFieldKeys']
+    select: List['JudgmentScalarFieldKeys']
+    
+    
+
+class SuspectIncludeFromUser(TypedDict, total=False):
+    """Relational arguments for User"""
+    judgment: Union[bool, 'JudgmentArgsFromUserRecursive1']
+
+
+class SuspectIncludeFromUserRecursive1(TypedDict, total=False):
+    """Relational arguments for User"""
+    judgment: Union[bool, 'JudgmentArgsFromUserRecursive2']
+
+
+class SuspectIncludeFromUserRecursive2(TypedDict, total=False):
+    """Relational arguments for User"""
+    judgment: Union[bool, 'JudgmentArgsFromUserRecursive3']
+
+
+class SuspectIncludeFromUserRecursive3(TypedDict, total=False):
+    """Relational arguments for User"""
+    judgment: Union[bool, 'JudgmentArgsFromUserRecursive4']
+
+
+class SuspectIncludeFromUserRecursive4(TypedDict, total=False):
+    """Relational arguments for User"""
+
+    
+
+class SuspectArgsFromUser(TypedDict, total=False):
+    """Arguments for User"""
+    select: List['SuspectScalarFieldKeys']
+    include: 'SuspectIncludeFromSuspectRecursive1'
+
+
+class SuspectArgsFromUserRecursive1(TypedDict, total=False):
+    """Arguments for User"""
+    select: List['SuspectScalarFieldKeys']
+    include: 'SuspectIncludeFromSuspectRecursive2'
+
+
+class SuspectArgsFromUserRecursive2(TypedDict, total=False):
+    """Arguments for User"""
+    select: List['SuspectScalarFieldKeys']
+    include: 'SuspectIncludeFromSuspectRecursive3'
+
+
+class SuspectArgsFromUserRecursive3(TypedDict, total=False):
+    """Arguments for User"""
+    select: List['SuspectScalarFieldKeys']
+    include: 'SuspectIncludeFromSuspectRecursive4'
+
+
+class SuspectArgsFromUserRecursive4(TypedDict, total=False):
+    """Arguments for User"""
+    select: List['SuspectScalarFieldKeys']
+    
+    
+
+class FindManySuspectArgsFromUser(TypedDict, total=False):
+    """Arguments for User"""
+    take: int
+    skip: int
+    order_by: Union['SuspectOrderByInput', List['SuspectOrderByInput']]
+    where: 'SuspectWhereInput'
+    cursor: 'SuspectWhereUniqueInput'
+    distinct: List['SuspectScalarFieldKeys']
+    select: List['SuspectScalarFieldKeys']
+    include: 'SuspectIncludeFromSuspectRecursive1'
+
+
+class FindManySuspectArgsFromUserRecursive1(TypedDict, total=False):
+    """Arguments for User"""
+    take: int
+    skip: int
+    order_by: Union['SuspectOrderByInput', List['SuspectOrderByInput']]
+    where: 'SuspectWhereInput'
+    cursor: 'SuspectWhereUniqueInput'
+    distinct: List['SuspectScalarFieldKeys']
+    select: List['SuspectScalarFieldKeys']
+    include: 'SuspectIncludeFromSuspectRecursive2'
+
+
+class FindManySuspectArgsFromUserRecursive2(TypedDict, total=False):
+    """Arguments for User"""
+    take: int
+    skip: int
+    order_by: Union['SuspectOrderByInput', List['SuspectOrderByInput']]
+    where: 'SuspectWhereInput'
+    cursor: 'SuspectWhereUniqueInput'
+    distinct: List['SuspectScalarFieldKeys']
+    select: List['SuspectScalarFieldKeys']
+    include: 'SuspectIncludeFromSuspectRecursive3'
+
+
+class FindManySuspectArgsFromUserRecursive3(TypedDict, total=False):
+    """Arguments for User"""
+    take: int
+    skip: int
+    order_by: Union['SuspectOrderByInput', List['SuspectOrderByInput']]
+    where: 'SuspectWhereInput'
+    cursor: 'SuspectWhereUniqueInput'
+    distinct: List['SuspectScalarFieldKeys']
+    select: List['SuspectScalarFieldKeys']
+    include: 'SuspectIncludeFromSuspectRecursive4'
+
+
+class FindManySuspectArgsFromUserRecursive4(TypedDict, total=False):
+    """Arguments for User"""
+    take: int
+    skip: int
+    order_by: Union['SuspectOrderByInput', List['SuspectOrderByInput']]
+    where: 'SuspectWhereInput'
+    cursor: 'SuspectWhereUniqueInput'
+    distinct: List['SuspectScalarFieldKeys']
+    select: List['SuspectScalarFieldKeys']
+    
+    
+
+class BlameIncludeFromUser(TypedDict, total=False):
+    """Relational arguments for User"""
+    judgment: Union[bool, 'JudgmentArgsFromUserRecursive1']
+
+
+class BlameIncludeFromUserRecursive1(TypedDict, total=False):
+    """Relational arguments for User"""
+    judgment: Union[bool, 'JudgmentArgsFromUserRecursive2']
+
+
+class BlameIncludeFromUserRecursive2(TypedDict, total=False):
+    """Relational arguments for User"""
+    judgment: Union[bool, 'JudgmentArgsFromUserRecursive3']
+
+
+class BlameIncludeFromUserRecursive3(TypedDict, total=False):
+    """Relational arguments for User"""
+    judgment: Union[bool, 'JudgmentArgsFromUserRecursive4']
+
+
+class BlameIncludeFromUserRecursive4(TypedDict, total=False):
+    """Relational arguments for User"""
+
+    
+
+class BlameArgsFromUser(TypedDict, total=False):
+    """Arguments for User"""
+    select: List['BlameScalarFieldKeys']
+    include: 'BlameIncludeFromBlameRecursive1'
+
+
+class BlameArgsFromUserRecursive1(TypedDict, total=False):
+    """Arguments for User"""
+    select: List['BlameScalarFieldKeys']
+    include: 'BlameIncludeFromBlameRecursive2'
+
+
+class BlameArgsFromUserRecursive2(TypedDict, total=False):
+    """Arguments for User"""
+    select: List['BlameScalarFieldKeys']
+    include: 'BlameIncludeFromBlameRecursive3'
+
+
+class BlameArgsFromUserRecursive3(TypedDict, total=False):
+    """Arguments for User"""
+    select: List['BlameScalarFieldKeys']
+    include: 'BlameIncludeFromBlameRecursive4'
+
+
+class BlameArgsFromUserRecursive4(TypedDict, total=False):
+    """Arguments for User"""
+    select: List['BlameScalarFieldKeys']
+    
+    
+
+class FindManyBlameArgsFromUser(TypedDict, total=False):
+    """Arguments for User"""
+    take: int
+    skip: int
+    order_by: Union['BlameOrderByInput', List['BlameOrderByInput']]
+    where: 'BlameWhereInput'
+    cursor: 'BlameWhereUniqueInput'
+    distinct: List['BlameScalarFieldKeys']
+    select: List['BlameScalarFieldKeys']
+    include: 'BlameIncludeFromBlameRecursive1'
+
+
+class FindManyBlameArgsFromUserRecursive1(TypedDict, total=False):
+    """Arguments for User"""
+    take: int
+    skip: int
+    order_by: Union['BlameOrderByInput', List['BlameOrderByInput']]
+    where: 'BlameWhereInput'
+    cursor: 'BlameWhereUniqueInput'
+    distinct: List['BlameScalarFieldKeys']
+    select: List['BlameScalarFieldKeys']
+    include: 'BlameIncludeFromBlameRecursive2'
+
+
+class FindManyBlameArgsFromUserRecursive2(TypedDict, total=False):
+    """Arguments for User"""
+    take: int
+    skip: int
+    order_by: Union['BlameOrderByInput', List['BlameOrderByInput']]
+    where: 'BlameWhereInput'
+    cursor: 'BlameWhereUniqueInput'
+    distinct: List['BlameScalarFieldKeys']
+    select: List['BlameScalarFieldKeys']
+    include: 'BlameIncludeFromBlameRecursive3'
+
+
+class FindManyBlameArgsFromUserRecursive3(TypedDict, total=False):
+    """Arguments for User"""
+    take: int
+    skip: int
+    order_by: Union['BlameOrderByInput', List['BlameOrderByInput']]
+    where: 'BlameWhereInput'
+    cursor: 'BlameWhereUniqueInput'
+    distinct: List['BlameScalarFieldKeys']
+    select: List['BlameScalarFieldKeys']
+    include: 'BlameIncludeFromBlameRecursive4'
+
+
+class FindManyBlameArgsFromUserRecursive4(TypedDict, total=False):
+    """Arguments for User"""
+    take: int
+    skip: int
+    order_by: Union['BlameOrderByInput', List['BlameOrderByInput']]
+    where: 'BlameWhereInput'
+    cursor: 'BlameWhereUniqueInput'
+    distinct: List['BlameScalarFieldKeys']
+    select: List['BlameScalarFieldKeys']
+    
+    
+
+class AnalysisJobIncludeFromUser(TypedDict, total=False):
+    """Relational arguments for User"""
+    judgment: Union[bool, 'JudgmentArgsFromUserRecursive1']
+
+
+class AnalysisJobIncludeFromUserRecursive1(TypedDict, total=False):
+    """Relational arguments for User"""
+    judgment: Union[bool, 'JudgmentArgsFromUserRecursive2']
+
+
+class AnalysisJobIncludeFromUserRecursive2(TypedDict, total=False):
+    """Relational arguments for User"""
+    judgment: Union[bool, 'JudgmentArgsFromUserRecursive3']
+
+
+class AnalysisJobIncludeFromUserRecursive3(TypedDict, total=False):
+    """Relational arguments for User"""
+    judgment: Union[bool, 'JudgmentArgsFromUserRecursive4']
+
+
+class AnalysisJobIncludeFromUserRecursive4(TypedDict, total=False):
+    """Relational arguments for User"""
+
+    
+
+class AnalysisJobArgsFromUser(TypedDict, total=False):
+    """Arguments for User"""
+    select: List['AnalysisJobScalarFieldKeys']
+    include: 'AnalysisJobIncludeFromAnalysisJobRecursive1'
+
+
+class AnalysisJobArgsFromUserRecursive1(TypedDict, total=False):
+    """Arguments for User"""
+    select: List['AnalysisJobScalarFieldKeys']
+    include: 'AnalysisJobIncludeFromAnalysisJobRecursive2'
+
+
+class AnalysisJobArgsFromUserRecursive2(TypedDict, total=False):
+    """Arguments for User"""
+    select: List['AnalysisJobScalarFieldKeys']
+    include: 'AnalysisJobIncludeFromAnalysisJobRecursive3'
+
+
+class AnalysisJobArgsFromUserRecursive3(TypedDict, total=False):
+    """Arguments for User"""
+    select: List['AnalysisJobScalarFieldKeys']
+    include: 'AnalysisJobIncludeFromAnalysisJobRecursive4'
+
+
+class AnalysisJobArgsFromUserRecursive4(TypedDict, total=False):
+    """Arguments for User"""
+    select: List['AnalysisJobScalarFieldKeys']
+    
+    
+
+class FindManyAnalysisJobArgsFromUser(TypedDict, total=False):
+    """Arguments for User"""
+    take: int
+    skip: int
+    order_by: Union['AnalysisJobOrderByInput', List['AnalysisJobOrderByInput']]
+    where: 'AnalysisJobWhereInput'
+    cursor: 'AnalysisJobWhereUniqueInput'
+    distinct: List['AnalysisJobScalarFieldKeys']
+    select: List['AnalysisJobScalarFieldKeys']
+    include: 'AnalysisJobIncludeFromAnalysisJobRecursive1'
+
+
+class FindManyAnalysisJobArgsFromUserRecursive1(TypedDict, total=False):
+    """Arguments for User"""
+    take: int
+    skip: int
+    order_by: Union['AnalysisJobOrderByInput', List['AnalysisJobOrderByInput']]
+    where: 'AnalysisJobWhereInput'
+    cursor: 'AnalysisJobWhereUniqueInput'
+    distinct: List['AnalysisJobScalarFieldKeys']
+    select: List['AnalysisJobScalarFieldKeys']
+    include: 'AnalysisJobIncludeFromAnalysisJobRecursive2'
+
+
+class FindManyAnalysisJobArgsFromUserRecursive2(TypedDict, total=False):
+    """Arguments for User"""
+    take: int
+    skip: int
+    order_by: Union['AnalysisJobOrderByInput', List['AnalysisJobOrderByInput']]
+    where: 'AnalysisJobWhereInput'
+    cursor: 'AnalysisJobWhereUniqueInput'
+    distinct: List['AnalysisJobScalarFieldKeys']
+    select: List['AnalysisJobScalarFieldKeys']
+    include: 'AnalysisJobIncludeFromAnalysisJobRecursive3'
+
+
+class FindManyAnalysisJobArgsFromUserRecursive3(TypedDict, total=False):
+    """Arguments for User"""
+    take: int
+    skip: int
+    order_by: Union['AnalysisJobOrderByInput', List['AnalysisJobOrderByInput']]
+    where: 'AnalysisJobWhereInput'
+    cursor: 'AnalysisJobWhereUniqueInput'
+    distinct: List['AnalysisJobScalarFieldKeys']
+    select: List['AnalysisJobScalarFieldKeys']
+    include: 'AnalysisJobIncludeFromAnalysisJobRecursive4'
+
+
+class FindManyAnalysisJobArgsFromUserRecursive4(TypedDict, total=False):
+    """Arguments for User"""
+    take: int
+    skip: int
+    order_by: Union['AnalysisJobOrderByInput', List['AnalysisJobOrderByInput']]
+    where: 'AnalysisJobWhereInput'
+    cursor: 'AnalysisJobWhereUniqueInput'
+    distinct: List['AnalysisJobScalarFieldKeys']
+    select: List['AnalysisJobScalarFieldKeys']
+    
+
+
+FindManyUserArgs = FindManyUserArgsFromUser
+FindFirstUserArgs = FindManyUserArgsFromUser
+
+
+    
+
+class UserWhereInput(TypedDict, total=False):
+    """User arguments for searching"""
+    id: Union[_str, 'types.StringFilter']
+    github_id: Union[_str, 'types.StringFilter']
+    username: Union[_str, 'types.StringFilter']
+    avatar_url: Union[None, _str, 'types.StringFilter']
+    access_token: Union[None, _str, 'types.StringFilter']
+    created_at: Union[datetime.datetime, 'types.DateTimeFilter']
+    updated_at: Union[datetime.datetime, 'types.DateTimeFilter']
+    judgments: 'JudgmentListRelationFilter'
+
+    # should be noted that AND and NOT should be Union['UserWhereInputRecursive1', List['UserWhereInputRecursive1']]
+    # but this causes mypy to hang :/
+    AND: List['UserWhereInputRecursive1']
+    OR: List['UserWhereInputRecursive1']
+    NOT: List['UserWhereInputRecursive1']
+
+
+class UserWhereInputRecursive1(TypedDict, total=False):
+    """User arguments for searching"""
+    id: Union[_str, 'types.StringFilter']
+    github_id: Union[_str, 'types.StringFilter']
+    username: Union[_str, 'types.StringFilter']
+    avatar_url: Union[None, _str, 'types.StringFilter']
+    access_token: Union[None, _str, 'types.StringFilter']
+    created_at: Union[datetime.datetime, 'types.DateTimeFilter']
+    updated_at: Union[datetime.datetime, 'types.DateTimeFilter']
+    judgments: 'JudgmentListRelationFilter'
+
+    # should be noted that AND and NOT should be Union['UserWhereInputRecursive2', List['UserWhereInputRecursive2']]
+    # but this causes mypy to hang :/
+    AND: List['UserWhereInputRecursive2']
+    OR: List['UserWhereInputRecursive2']
+    NOT: List['UserWhereInputRecursive2']
+
+
+class UserWhereInputRecursive2(TypedDict, total=False):
+    """User arguments for searching"""
+    id: Union[_str, 'types.StringFilter']
+    github_id: Union[_str, 'types.StringFilter']
+    username: Union[_str, 'types.StringFilter']
+    avatar_url: Union[None, _str, 'types.StringFilter']
+    access_token: Union[None, _str, 'types.StringFilter']
+    created_at: Union[datetime.datetime, 'types.DateTimeFilter']
+    updated_at: Union[datetime.datetime, 'types.DateTimeFilter']
+    judgments: 'JudgmentListRelationFilter'
+
+    # should be noted that AND and NOT should be Union['UserWhereInputRecursive3', List['UserWhereInputRecursive3']]
+    # but this causes mypy to hang :/
+    AND: List['UserWhereInputRecursive3']
+    OR: List['UserWhereInputRecursive3']
+    NOT: List['UserWhereInputRecursive3']
+
+
+class UserWhereInputRecursive3(TypedDict, total=False):
+    """User arguments for searching"""
+    id: Union[_str, 'types.StringFilter']
+    github_id: Union[_str, 'types.StringFilter']
+    username: Union[_str, 'types.StringFilter']
+    avatar_url: Union[None, _str, 'types.StringFilter']
+    access_token: Union[None, _str, 'types.StringFilter']
+    created_at: Union[datetime.datetime, 'types.DateTimeFilter']
+    updated_at: Union[datetime.datetime, 'types.DateTimeFilter']
+    judgments: 'JudgmentListRelationFilter'
+
+    # should be noted that AND and NOT should be Union['UserWhereInputRecursive4', List['UserWhereInputRecursive4']]
+    # but this causes mypy to hang :/
+    AND: List['UserWhereInputRecursive4']
+    OR: List['UserWhereInputRecursive4']
+    NOT: List['UserWhereInputRecursive4']
+
+
+class UserWhereInputRecursive4(TypedDict, total=False):
+    """User arguments for searching"""
+    id: Union[_str, 'types.StringFilter']
+    github_id: Union[_str, 'types.StringFilter']
+    username: Union[_str, 'types.StringFilter']
+    avatar_url: Union[None, _str, 'types.StringFilter']
+    access_token: Union[None, _str, 'types.StringFilter']
+    created_at: Union[datetime.datetime, 'types.DateTimeFilter']
+    updated_at: Union[datetime.datetime, 'types.DateTimeFilter']
+    judgments: 'JudgmentListRelationFilter'
+
+
+
+# aggregate User types
+
+
+    
+
+class UserScalarWhereWithAggregatesInput(TypedDict, total=False):
+    """User arguments for searching"""
+    id: Union[_str, 'types.StringWithAggregatesFilter']
+    github_id: Union[_str, 'types.StringWithAggregatesFilter']
+    username: Union[_str, 'types.StringWithAggregatesFilter']
+    avatar_url: Union[_str, 'types.StringWithAggregatesFilter']
+    access_token: Union[_str, 'types.StringWithAggregatesFilter']
+    created_at: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+    updated_at: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+
+    AND: List['UserScalarWhereWithAggregatesInputRecursive1']
+    OR: List['UserScalarWhereWithAggregatesInputRecursive1']
+    NOT: List['UserScalarWhereWithAggregatesInputRecursive1']
+
+
+class UserScalarWhereWithAggregatesInputRecursive1(TypedDict, total=False):
+    """User arguments for searching"""
+    id: Union[_str, 'types.StringWithAggregatesFilter']
+    github_id: Union[_str, 'types.StringWithAggregatesFilter']
+    username: Union[_str, 'types.StringWithAggregatesFilter']
+    avatar_url: Union[_str, 'types.StringWithAggregatesFilter']
+    access_token: Union[_str, 'types.StringWithAggregatesFilter']
+    created_at: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+    updated_at: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+
+    AND: List['UserScalarWhereWithAggregatesInputRecursive2']
+    OR: List['UserScalarWhereWithAggregatesInputRecursive2']
+    NOT: List['UserScalarWhereWithAggregatesInputRecursive2']
+
+
+class UserScalarWhereWithAggregatesInputRecursive2(TypedDict, total=False):
+    """User arguments for searching"""
+    id: Union[_str, 'types.StringWithAggregatesFilter']
+    github_id: Union[_str, 'types.StringWithAggregatesFilter']
+    username: Union[_str, 'types.StringWithAggregatesFilter']
+    avatar_url: Union[_str, 'types.StringWithAggregatesFilter']
+    access_token: Union[_str, 'types.StringWithAggregatesFilter']
+    created_at: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+    updated_at: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+
+    AND: List['UserScalarWhereWithAggregatesInputRecursive3']
+    OR: List['UserScalarWhereWithAggregatesInputRecursive3']
+    NOT: List['UserScalarWhereWithAggregatesInputRecursive3']
+
+
+class UserScalarWhereWithAggregatesInputRecursive3(TypedDict, total=False):
+    """User arguments for searching"""
+    id: Union[_str, 'types.StringWithAggregatesFilter']
+    github_id: Union[_str, 'types.StringWithAggregatesFilter']
+    username: Union[_str, 'types.StringWithAggregatesFilter']
+    avatar_url: Union[_str, 'types.StringWithAggregatesFilter']
+    access_token: Union[_str, 'types.StringWithAggregatesFilter']
+    created_at: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+    updated_at: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+
+    AND: List['UserScalarWhereWithAggregatesInputRecursive4']
+    OR: List['UserScalarWhereWithAggregatesInputRecursive4']
+    NOT: List['UserScalarWhereWithAggregatesInputRecursive4']
+
+
+class UserScalarWhereWithAggregatesInputRecursive4(TypedDict, total=False):
+    """User arguments for searching"""
+    id: Union[_str, 'types.StringWithAggregatesFilter']
+    github_id: Union[_str, 'types.StringWithAggregatesFilter']
+    username: Union[_str, 'types.StringWithAggregatesFilter']
+    avatar_url: Union[_str, 'types.StringWithAggregatesFilter']
+    access_token: Union[_str, 'types.StringWithAggregatesFilter']
+    created_at: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+    updated_at: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+
+
+
+class UserGroupByOutput(TypedDict, total=False):
+    id: _str
+    github_id: _str
+    username: _str
+    avatar_url: _str
+    access_token: _str
+    created_at: datetime.datetime
+    updated_at: datetime.datetime
+    _sum: 'UserSumAggregateOutput'
+    _avg: 'UserAvgAggregateOutput'
+    _min: 'UserMinAggregateOutput'
+    _max: 'UserMaxAggregateOutput'
+    _count: 'UserCountAggregateOutput'
+
+
+class UserAvgAggregateOutput(TypedDict, total=False):
+    """User output for aggregating averages"""
+
+
+class UserSumAggregateOutput(TypedDict, total=False):
+    """User output for aggregating sums"""
+
+
+class UserScalarAggregateOutput(TypedDict, total=False):
+    """User output including scalar fields"""
+    id: _str
+    github_id: _str
+    username: _str
+    avatar_url: _str
+    access_token: _str
+    created_at: datetime.datetime
+    updated_at: datetime.datetime
+
+
+UserMinAggregateOutput = UserScalarAggregateOutput
+UserMaxAggregateOutput = UserScalarAggregateOutput
+
+
+class UserMaxAggregateInput(TypedDict, total=False):
+    """User input for aggregating by max"""
+    id: bool
+    github_id: bool
+    username: bool
+    avatar_url: bool
+    access_token: bool
+    created_at: bool
+    updated_at: bool
+
+
+class UserMinAggregateInput(TypedDict, total=False):
+    """User input for aggregating by min"""
+    id: bool
+    github_id: bool
+    username: bool
+    avatar_url: bool
+    access_token: bool
+    created_at: bool
+    updated_at: bool
+
+
+class UserNumberAggregateInput(TypedDict, total=False):
+    """User input for aggregating numbers"""
+
+
+UserAvgAggregateInput = UserNumberAggregateInput
+UserSumAggregateInput = UserNumberAggregateInput
+
+
+UserCountAggregateInput = TypedDict(
+    'UserCountAggregateInput',
+    {
+        'id': bool,
+        'github_id': bool,
+        'username': bool,
+        'avatar_url': bool,
+        'access_token': bool,
+        'created_at': bool,
+        'updated_at': bool,
+        '_all': bool,
+    },
+    total=False,
+)
+
+UserCountAggregateOutput = TypedDict(
+    'UserCountAggregateOutput',
+    {
+        'id': int,
+        'github_id': int,
+        'username': int,
+        'avatar_url': int,
+        'access_token': int,
+        'created_at': int,
+        'updated_at': int,
+        '_all': int,
+    },
+    total=False,
+)
+
+
+UserKeys = Literal[
+    'id',
+    'github_id',
+    'username',
+    'avatar_url',
+    'access_token',
+    'created_at',
+    'updated_at',
+    'judgments',
+]
+UserScalarFieldKeys = Literal[
+    'id',
+    'github_id',
+    'username',
+    'avatar_url',
+    'access_token',
+    'created_at',
+    'updated_at',
+]
+UserScalarFieldKeysT = TypeVar('UserScalarFieldKeysT', bound=UserScalarFieldKeys)
+
+UserRelationalFieldKeys = Literal[
+        'judgments',
+    ]
+
+# Judgment types
+
+class JudgmentOptionalCreateInput(TypedDict, total=False):
+    """Optional arguments to the Judgment create method"""
+    id: _str
+    user_id: _str
+    description: Optional[_str]
+    file_path: Optional[_str]
+    period_days: _int
+    created_at: datetime.datetime
+    user: 'UserCreateNestedWithoutRelationsInput'
+    suspects: 'SuspectCreateManyNestedWithoutRelationsInput'
+    blame: 'BlameCreateNestedWithoutRelationsInput'
+    jobs: 'AnalysisJobCreateManyNestedWithoutRelationsInput'
+
+
+class JudgmentCreateInput(JudgmentOptionalCreateInput):
+    """Required arguments to the Judgment create method"""
+    repo_owner: _str
+    repo_name: _str
+    title: _str
+    status: _str
+    case_number: _str
+
+
+# TODO: remove this in favour of without explicit relations
+# e.g. PostCreateWithoutAuthorInput
+
+class JudgmentOptionalCreateWithoutRelationsInput(TypedDict, total=False):
+    """Optional arguments to the Judgment create method, without relations"""
+    id: _str
+    user_id: _str
+    description: Optional[_str]
+    file_path: Optional[_str]
+    period_days: _int
+    created_at: datetime.datetime
+
+
+class JudgmentCreateWithoutRelationsInput(JudgmentOptionalCreateWithoutRelationsInput):
+    """Required arguments to the Judgment create method, without relations"""
+    repo_owner: _str
+    repo_name: _str
+    title: _str
+    status: _str
+    case_number: _str
+
+
+class JudgmentCreateNestedWithoutRelationsInput(TypedDict, total=False):
+    create: 'JudgmentCreateWithoutRelationsInput'
+    connect: 'JudgmentWhereUniqueInput'
+
+
+class JudgmentCreateManyNestedWithoutRelationsInput(TypedDict, total=False):
+    create: Union['JudgmentCreateWithoutRelationsInput', List['JudgmentCreateWithoutRelationsInput']]
+    connect: Union['JudgmentWhereUniqueInput', List['JudgmentWhereUniqueInput']]
+
+
+_JudgmentWhereUnique_id_Input = TypedDict(
+    '_JudgmentWhereUnique_id_Input',
+    {
+        'id': '_str',
+    },
+    total=True
+)
+
+_JudgmentWhereUnique_case_number_Input = TypedDict(
+    '_JudgmentWhereUnique_case_number_Input',
+    {
+        'case_number': '_str',
+    },
+    total=True
+)
+
+JudgmentWhereUniqueInput = Union[
+    '_JudgmentWhereUnique_id_Input',
+    '_JudgmentWhereUnique_case_number_Input',
+]
+
+
+class JudgmentUpdateInput(TypedDict, total=False):
+    """Optional arguments for updating a record"""
+    id: _str
+    repo_owner: _str
+    repo_name: _str
+    title: _str
+    description: Optional[_str]
+    file_path: Optional[_str]
+    period_days: Union[AtomicIntInput, _int]
+    status: _str
+    case_number: _str
+    created_at: datetime.datetime
+    user: 'UserUpdateOneWithoutRelationsInput'
+    suspects: 'SuspectUpdateManyWithoutRelationsInput'
+    blame: 'BlameUpdateOneWithoutRelationsInput'
+    jobs: 'AnalysisJobUpdateManyWithoutRelationsInput'
+
+
+class JudgmentUpdateManyMutationInput(TypedDict, total=False):
+    """Arguments for updating many records"""
+    id: _str
+    repo_owner: _str
+    repo_name: _str
+    title: _str
+    description: Optional[_str]
+    file_path: Optional[_str]
+    period_days: Union[AtomicIntInput, _int]
+    status: _str
+    case_number: _str
+    created_at: datetime.datetime
+
+
+class JudgmentUpdateManyWithoutRelationsInput(TypedDict, total=False):
+    create: List['JudgmentCreateWithoutRelationsInput']
+    connect: List['JudgmentWhereUniqueInput']
+    set: List['JudgmentWhereUniqueInput']
+    disconnect: List['JudgmentWhereUniqueInput']
+    delete: List['JudgmentWhereUniqueInput']
+
+    # TODO
+    # update: List['JudgmentUpdateWithWhereUniqueWithoutRelationsInput']
+    # updateMany: List['JudgmentUpdateManyWithWhereUniqueWithoutRelationsInput']
+    # deleteMany: List['JudgmentScalarWhereInput']
+    # upsert: List['JudgmentUpserteWithWhereUniqueWithoutRelationsInput']
+    # connectOrCreate: List['JudgmentCreateOrConnectWithoutRelationsInput']
+
+
+class JudgmentUpdateOneWithoutRelationsInput(TypedDict, total=False):
+    create: 'JudgmentCreateWithoutRelationsInput'
+    connect: 'JudgmentWhereUniqueInput'
+    disconnect: bool
+    delete: bool
+
+    # TODO
+    # update: 'JudgmentUpdateInput'
+    # upsert: 'JudgmentUpsertWithoutRelationsInput'
+    # connectOrCreate: 'JudgmentCreateOrConnectWithoutRelationsInput'
+
+
+class JudgmentUpsertInput(TypedDict):
+    create: 'JudgmentCreateInput'
+    update: 'JudgmentUpdateInput'  # pyright: ignore[reportIncompatibleMethodOverride]
+
+
+_Judgment_id_OrderByInput = TypedDict(
+    '_Judgment_id_OrderByInput',
+    {
+        'id': 'SortOrder',
+    },
+    total=True
+)
+
+_Judgment_user_id_OrderByInput = TypedDict(
+    '_Judgment_user_id_OrderByInput',
+    {
+        'user_id': 'SortOrder',
+    },
+    total=True
+)
+
+_Judgment_repo_owner_OrderByInput = TypedDict(
+    '_Judgment_repo_owner_OrderByInput',
+    {
+        'repo_owner': 'SortOrder',
+    },
+    total=True
+)
+
+_Judgment_repo_name_OrderByInput = TypedDict(
+    '_Judgment_repo_name_OrderByInput',
+    {
+        'repo_name': 'SortOrder',
+    },
+    total=True
+)
+
+_Judgment_title_OrderByInput = TypedDict(
+    '_Judgment_title_OrderByInput',
+    {
+        'title': 'SortOrder',
+    },
+    total=True
+)
+
+_Judgment_description_OrderByInput = TypedDict(
+    '_Judgment_description_OrderByInput',
+    {
+        'description': 'SortOrder',
+    },
+    total=True
+)
+
+_Judgment_file_path_OrderByInput = TypedDict(
+    '_Judgment_file_path_OrderByInput',
+    {
+        'file_path': 'SortOrder',
+    },
+    total=True
+)
+
+_Judgment_period_days_OrderByInput = TypedDict(
+    '_Judgment_period_days_OrderByInput',
+    {
+        'period_days': 'SortOrder',
+    },
+    total=True
+)
+
+_Judgment_status_OrderByInput = TypedDict(
+    '_Judgment_status_OrderByInput',
+    {
+        'status': 'SortOrder',
+    },
+    total=True
+)
+
+_Judgment_case_number_OrderByInput = TypedDict(
+    '_Judgment_case_number_OrderByInput',
+    {
+        'case_number': 'SortOrder',
+    },
+    total=True
+)
+
+_Judgment_created_at_OrderByInput = TypedDict(
+    '_Judgment_created_at_OrderByInput',
+    {
+        'created_at': 'SortOrder',
+    },
+    total=True
+)
+
+JudgmentOrderByInput = Union[
+    '_Judgment_id_OrderByInput',
+    '_Judgment_user_id_OrderByInput',
+    '_Judgment_repo_owner_OrderByInput',
+    '_Judgment_repo_name_OrderByInput',
+    '_Judgment_title_OrderByInput',
+    '_Judgment_description_OrderByInput',
+    '_Judgment_file_path_OrderByInput',
+    '_Judgment_period_days_OrderByInput',
+    '_Judgment_status_OrderByInput',
+    '_Judgment_case_number_OrderByInput',
+    '_Judgment_created_at_OrderByInput',
+]
+
+
+
+# recursive Judgment types
+# TODO: cleanup these types
+
+
+# Dict[str, Any] is a mypy limitation
+# see https://github.com/RobertCraigie/prisma-client-py/issues/45
+# switch to pyright for improved types, see https://prisma-client-py.readthedocs.io/en/stable/reference/limitations/
+
+JudgmentRelationFilter = TypedDict(
+    'JudgmentRelationFilter',
+    {
+        'is': 'Dict[str, Any]',
+        'is_not': 'Dict[str, Any]',
+    },
+    total=False,
+)
+
+
+class JudgmentListRelationFilter(TypedDict, total=False):
+    some: 'Dict[str, Any]'
+    none: 'Dict[str, Any]'
+    every: 'Dict[str, Any]'
+
+
+class JudgmentInclude(TypedDict, total=False):
+    """Judgment relational arguments"""
+    user: Union[bool, 'UserArgsFromJudgment']
+    suspects: Union[bool, 'FindManySuspectArgsFromJudgment']
+    blame: Union[bool, 'BlameArgsFromJudgment']
+    jobs: Union[bool, 'FindManyAnalysisJobArgsFromJudgment']
+
+
+    
+
+class UserIncludeFromJudgment(TypedDict, total=False):
+    """Relational arguments for Judgment"""
+    judgments: Union[bool, 'FindManyJudgmentArgsFromJudgmentRecursive1']
+
+
+class UserIncludeFromJudgmentRecursive1(TypedDict, total=False):
+    """Relational arguments for Judgment"""
+    judgments: Union[bool, 'FindManyJudgmentArgsFromJudgmentRecursive2']
+
+
+class UserIncludeFromJudgmentRecursive2(TypedDict, total=False):
+    """Relational arguments for Judgment"""
+    judgments: Union[bool, 'FindManyJudgmentArgsFromJudgmentRecursive3']
+
+
+class UserIncludeFromJudgmentRecursive3(TypedDict, total=False):
+    """Relational arguments for Judgment"""
+    judgments: Union[bool, 'FindManyJudgmentArgsFromJudgmentRecursive4']
+
+
+class UserIncludeFromJudgmentRecursive4(TypedDict, total=False):
+    """Relational arguments for Judgment"""
+
+    
+
+class UserArgsFromJudgment(TypedDict, total=False):
+    """Arguments for Judgment"""
+    select: List['UserScalarFieldKeys']
+    include: 'UserIncludeFromUserRecursive1'
+
+
+class UserArgsFromJudgmentRecursive1(TypedDict, total=False):
+    """Arguments for Judgment"""
+    select: List['UserScalarFieldKeys']
+    include: 'UserIncludeFromUserRecursive2'
+
+
+class UserArgsFromJudgmentRecursive2(TypedDict, total=False):
+    """Arguments for Judgment"""
+    select: List['UserScalarFieldKeys']
+    include: 'UserIncludeFromUserRecursive3'
+
+
+class UserArgsFromJudgmentRecursive3(TypedDict, total=False):
+    """Arguments for Judgment"""
+    select: List['UserScalarFieldKeys']
+    include: 'UserIncludeFromUserRecursive4'
+
+
+class UserArgsFromJudgmentRecursive4(TypedDict, total=False):
+    """Arguments for Judgment"""
+    select: List['UserScalarFieldKeys']
+    
+    
+
+class FindManyUserArgsFromJudgment(TypedDict, total=False):
+    """Arguments for Judgment"""
+    take: int
+    skip: int
+    order_by: Union['UserOrderByInput', List['UserOrderByInput']]
+    where: 'UserWhereInput'
+    cursor: 'UserWhereUniqueInput'
+    distinct: List['UserScalarFieldKeys']
+    select: List['UserScalarFieldKeys']
+    include: 'UserIncludeFromUserRecursive1'
+
+
+class FindManyUserArgsFromJudgmentRecursive1(TypedDict, total=False):
+    """Arguments for Judgment"""
+    take: int
+    skip: int
+    order_by: Union['UserOrderByInput', List['UserOrderByInput']]
+    where: 'UserWhereInput'
+    cursor: 'UserWhereUniqueInput'
+    distinct: List['UserScalarFieldKeys']
+    select: List['UserScalarFieldKeys']
+    include: 'UserIncludeFromUserRecursive2'
+
+
+class FindManyUserArgsFromJudgmentRecursive2(TypedDict, total=False):
+    """Arguments for Judgment"""
+    take: int
+    skip: int
+    order_by: Union['UserOrderByInput', List['UserOrderByInput']]
+    where: 'UserWhereInput'
+    cursor: 'UserWhereUniqueInput'
+    distinct: List['UserScalarFieldKeys']
+    select: List['UserScalarFieldKeys']
+    include: 'UserIncludeFromUserRecursive3'
+
+
+class FindManyUserArgsFromJudgmentRecursive3(TypedDict, total=False):
+    """Arguments for Judgment"""
+    take: int
+    skip: int
+    order_by: Union['UserOrderByInput', List['UserOrderByInput']]
+    where: 'UserWhereInput'
+    cursor: 'UserWhereUniqueInput'
+    distinct: List['UserScalarFieldKeys']
+    select: List['UserScalarFieldKeys']
+    include: 'UserIncludeFromUserRecursive4'
+
+
+class FindManyUserArgsFromJudgmentRecursive4(TypedDict, total=False):
+    """Arguments for Judgment"""
+    take: int
+    skip: int
+    order_by: Union['UserOrderByInput', List['UserOrderByInput']]
+    where: 'UserWhereInput'
+    cursor: 'UserWhereUniqueInput'
+    distinct: List['UserScalarFieldKeys']
+    select: List['UserScalarFieldKeys']
+    
+    
+
+class JudgmentIncludeFromJudgment(TypedDict, total=False):
+    """Relational arguments for Judgment"""
+    user: Union[bool, 'UserArgsFromJudgmentRecursive1']
+    suspects: Union[bool, 'FindManySuspectArgsFromJudgmentRecursive1']
+    blame: Union[bool, 'BlameArgsFromJudgmentRecursive1']
+    jobs: Union[bool, 'FindManyAnalysisJobArgsFromJudgmentRecursive1']
+
+
+class JudgmentIncludeFromJudgmentRecursive1(TypedDict, total=False):
+    """Relational arguments for Judgment"""
+    user: Union[bool, 'UserArgsFromJudgmentRecursive2']
+    suspects: Union[bool, 'FindManySuspectArgsFromJudgmentRecursive2']
+    blame: Union[bool, 'BlameArgsFromJudgmentRecursive2']
+    jobs: Union[bool, 'FindManyAnalysisJobArgsFromJudgmentRecursive2']
+
+
+class JudgmentIncludeFromJudgmentRecursive2(TypedDict, total=False):
+    """Relational arguments for Judgment"""
+    user: Union[bool, 'UserArgsFromJudgmentRecursive3']
+    suspects: Union[bool, 'FindManySuspectArgsFromJudgmentRecursive3']
+    blame: Union[bool, 'BlameArgsFromJudgmentRecursive3']
+    jobs: Union[bool, 'FindManyAnalysisJobArgsFromJudgmentRecursive3']
+
+
+class JudgmentIncludeFromJudgmentRecursive3(TypedDict, total=False):
+    """Relational arguments for Judgment"""
+    user: Union[bool, 'UserArgsFromJudgmentRecursive4']
+    suspects: Union[bool, 'FindManySuspectArgsFromJudgmentRecursive4']
+    blame: Union[bool, 'BlameArgsFromJudgmentRecursive4']
+    jobs: Union[bool, 'FindManyAnalysisJobArgsFromJudgmentRecursive4']
+
+
+class JudgmentIncludeFromJudgmentRecursive4(TypedDict, total=False):
+    """Relational arguments for Judgment"""
+
+    
+
+class JudgmentArgsFromJudgment(TypedDict, total=False):
+    """Arguments for Judgment"""
+    select: List['JudgmentScalarFieldKeys']
+    include: 'JudgmentIncludeFromJudgmentRecursive1'
+
+
+class JudgmentArgsFromJudgmentRecursive1(TypedDict, total=False):
+    """Arguments for Judgment"""
+    select: List['JudgmentScalarFieldKeys']
+    include: 'JudgmentIncludeFromJudgmentRecursive2'
+
+
+class JudgmentArgsFromJudgmentRecursive2(TypedDict, total=False):
+    """Arguments for Judgment"""
+    select: List['JudgmentScalarFieldKeys']
+    include: 'JudgmentIncludeFromJudgmentRecursive3'
+
+
+class JudgmentArgsFromJudgmentRecursive3(TypedDict, total=False):
+    """Arguments for Judgment"""
+    select: List['JudgmentScalarFieldKeys']
+    include: 'JudgmentIncludeFromJudgmentRecursive4'
+
+
+class JudgmentArgsFromJudgmentRecursive4(TypedDict, total=False):
+    """Arguments for Judgment"""
+    select: List['JudgmentScalarFieldKeys']
+    
+    
+
+class FindManyJudgmentArgsFromJudgment(TypedDict, total=False):
+    """Arguments for Judgment"""
+    take: int
+    skip: int
+    order_by: Union['JudgmentOrderByInput', List['JudgmentOrderByInput']]
+    where: 'JudgmentWhereInput'
+    cursor: 'JudgmentWhereUniqueInput'
+    distinct: List['JudgmentScalarFieldKeys']
+    select: List['JudgmentScalarFieldKeys']
+    include: 'JudgmentIncludeFromJudgmentRecursive1'
+
+
+class FindManyJudgmentArgsFromJudgmentRecursive1(TypedDict, total=False):
+    """Arguments for Judgment"""
+    take: int
+    skip: int
+    order_by: Union['JudgmentOrderByInput', List['JudgmentOrderByInput']]
+    where: 'JudgmentWhereInput'
+    cursor: 'JudgmentWhereUniqueInput'
+    distinct: List['JudgmentScalarFieldKeys']
+    select: List['JudgmentScalarFieldKeys']
+    include: 'JudgmentIncludeFromJudgmentRecursive2'
+
+
+class FindManyJudgmentArgsFromJudgmentRecursive2(TypedDict, total=False):
+    """Arguments for Judgment"""
+    take: int
+    skip: int
+    order_by: Union['JudgmentOrderByInput', List['JudgmentOrderByInput']]
+    where: 'JudgmentWhereInput'
+    cursor: 'JudgmentWhereUniqueInput'
+    distinct: List['JudgmentScalarFieldKeys']
+    select: List['JudgmentScalarFieldKeys']
+    include: 'JudgmentIncludeFromJudgmentRecursive3'
+
+
+class FindManyJudgmentArgsFromJudgmentRecursive3(TypedDict, total=False):
+    """Arguments for Judgment"""
+    take: int
+    skip: int
+    order_by: Union['JudgmentOrderByInput', List['JudgmentOrderByInput']]
+    where: 'JudgmentWhereInput'
+    cursor: 'JudgmentWhereUniqueInput'
+    distinct: List['JudgmentScalarFieldKeys']
+    select: List['JudgmentScalarFieldKeys']
+    include: 'JudgmentIncludeFromJudgmentRecursive4'
+
+
+class FindManyJudgmentArgsFromJudgmentRecursive4(TypedDict, total=False):
+    """Arguments for Judgment"""
+    take: int
+    skip: int
+    order_by: Union['JudgmentOrderByInput', List['JudgmentOrderByInput']]
+    where: 'JudgmentWhereInput'
+    cursor: 'JudgmentWhereUniqueInput'
+    distinct: List['JudgmentScalarFieldKeys']
+    select: List['JudgmentScalarFieldKeys']
+    
+    
+
+class SuspectIncludeFromJudgment(TypedDict, total=False):
+    """Relational arguments for Judgment"""
+    judgment: Union[bool, 'JudgmentArgsFromJudgmentRecursive1']
+
+
+class SuspectIncludeFromJudgmentRecursive1(TypedDict, total=False):
+    """Relational arguments for Judgment"""
+    judgment: Union[bool, 'JudgmentArgsFromJudgmentRecursive2']
+
+
+class SuspectIncludeFromJudgmentRecursive2(TypedDict, total=False):
+    """Relational arguments for Judgment"""
+    judgment: Union[bool, 'JudgmentArgsFromJudgmentRecursive3']
+
+
+class SuspectIncludeFromJudgmentRecursive3(TypedDict, total=False):
+    """Relational arguments for Judgment"""
+    judgment: Union[bool, 'JudgmentArgsFromJudgmentRecursive4']
+
+
+class SuspectIncludeFromJudgmentRecursive4(TypedDict, total=False):
+    """Relational arguments for Judgment"""
+
+    
+
+class SuspectArgsFromJudgment(TypedDict, total=False):
+    """Arguments for Judgment"""
+    select: List['SuspectScalarFieldKeys']
+    include: 'SuspectIncludeFromSuspectRecursive1'
+
+
+class SuspectArgsFromJudgmentRecursive1(TypedDict, total=False):
+    """Arguments for Judgment"""
+    select: List['SuspectScalarFieldKeys']
+    include: 'SuspectIncludeFromSuspectRecursive2'
+
+
+class SuspectArgsFromJudgmentRecursive2(TypedDict, total=False):
+    """Arguments for Judgment"""
+    select: List['SuspectScalarFieldKeys']
+    include: 'SuspectIncludeFromSuspectRecursive3'
+
+
+class SuspectArgsFromJudgmentRecursive3(TypedDict, total=False):
+    """Arguments for Judgment"""
+    select: List['SuspectScalarFieldKeys']
+    include: 'SuspectIncludeFromSuspectRecursive4'
+
+
+class SuspectArgsFromJudgmentRecursive4(TypedDict, total=False):
+    """Arguments for Judgment"""
+    select: List['SuspectScalarFieldKeys']
+    
+    
+
+class FindManySuspectArgsFromJudgment(TypedDict, total=False):
+    """Arguments for Judgment"""
+    take: int
+    skip: int
+    order_by: Union['SuspectOrderByInput', List['SuspectOrderByInput']]
+    where: 'SuspectWhereInput'
+    cursor: 'SuspectWhereUniqueInput'
+    distinct: List['SuspectScalarFieldKeys']
+    select: List['SuspectScalarFieldKeys']
+    include: 'SuspectIncludeFromSuspectRecursive1'
+
+
+class FindManySuspectArgsFromJudgmentRecursive1(TypedDict, total=False):
+    """Arguments for Judgment"""
+    take: int
+    skip: int
+    order_by: Union['SuspectOrderByInput', List['SuspectOrderByInput']]
+    where: 'SuspectWhereInput'
+    cursor: 'SuspectWhereUniqueInput'
+    distinct: List['SuspectScalarFieldKeys']
+    select: List['SuspectScalarFieldKeys']
+    include: 'SuspectIncludeFromSuspectRecursive2'
+
+
+class FindManySuspectArgsFromJudgmentRecursive2(TypedDict, total=False):
+    """Arguments for Judgment"""
+    take: int
+    skip: int
+    order_by: Union['SuspectOrderByInput', List['SuspectOrderByInput']]
+    where: 'SuspectWhereInput'
+    cursor: 'SuspectWhereUniqueInput'
+    distinct: List['SuspectScalarFieldKeys']
+    select: List['SuspectScalarFieldKeys']
+    include: 'SuspectIncludeFromSuspectRecursive3'
+
+
+class FindManySuspectArgsFromJudgmentRecursive3(TypedDict, total=False):
+    """Arguments for Judgment"""
+    take: int
+    skip: int
+    order_by: Union['SuspectOrderByInput', List['SuspectOrderByInput']]
+    where: 'SuspectWhereInput'
+    cursor: 'SuspectWhereUniqueInput'
+    distinct: List['SuspectScalarFieldKeys']
+    select: List['SuspectScalarFieldKeys']
+    include: 'SuspectIncludeFromSuspectRecursive4'
+
+
+class FindManySuspectArgsFromJudgmentRecursive4(TypedDict, total=False):
+    """Arguments for Judgment"""
+    take: int
+    skip: int
+    order_by: Union['SuspectOrderByInput', List['SuspectOrderByInput']]
+    where: 'SuspectWhereInput'
+    cursor: 'SuspectWhereUniqueInput'
+    distinct: List['SuspectScalarFieldKeys']
+    select: List['SuspectScalarFieldKeys']
+    
+    
+
+class BlameIncludeFromJudgment(TypedDict, total=False):
+    """Relational arguments for Judgment"""
+    judgment: Union[bool, 'JudgmentArgsFromJudgmentRecursive1']
+
+
+class BlameIncludeFromJudgmentRecursive1(TypedDict, total=False):
+    """Relational arguments for Judgment"""
+    judgment: Union[bool, 'JudgmentArgsFromJudgmentRecursive2']
+
+
+class BlameIncludeFromJudgmentRecursive2(TypedDict, total=False):
+    """Relational arguments for Judgment"""
+    judgment: Union[bool, 'JudgmentArgsFromJudgmentRecursive3']
+
+
+class BlameIncludeFromJudgmentRecursive3(TypedDict, total=False):
+    """Relational arguments for Judgment"""
+    judgment: Union[bool, 'JudgmentArgsFromJudgmentRecursive4']
+
+
+class BlameIncludeFromJudgmentRecursive4(TypedDict, total=False):
+    """Relational arguments for Judgment"""
+
+    
+
+class BlameArgsFromJudgment(TypedDict, total=False):
+    """Arguments for Judgment"""
+    select: List['BlameScalarFieldKeys']
+    include: 'BlameIncludeFromBlameRecursive1'
+
+
+class BlameArgsFromJudgmentRecursive1(TypedDict, total=False):
+    """Arguments for Judgment"""
+    select: List['BlameScalarFieldKeys']
+    include: 'BlameIncludeFromBlameRecursive2'
+
+
+class BlameArgsFromJudgmentRecursive2(TypedDict, total=False):
+    """Arguments for Judgment"""
+    select: List['BlameScalarFieldKeys']
+    include: 'BlameIncludeFromBlameRecursive3'
+
+
+class BlameArgsFromJudgmentRecursive3(TypedDict, total=False):
+    """Arguments for Judgment"""
+    select: List['BlameScalarFieldKeys']
+    include: 'BlameIncludeFromBlameRecursive4'
+
+
+class BlameArgsFromJudgmentRecursive4(TypedDict, total=False):
+    """Arguments for Judgment"""
+    select: List['BlameScalarFieldKeys']
+    
+    
+
+class FindManyBlameArgsFromJudgment(TypedDict, total=False):
+    """Arguments for Judgment"""
+    take: int
+    skip: int
+    order_by: Union['BlameOrderByInput', List['BlameOrderByInput']]
+    where: 'BlameWhereInput'
+    cursor: 'BlameWhereUniqueInput'
+    distinct: List['BlameScalarFieldKeys']
+    select: List['BlameScalarFieldKeys']
+    include: 'BlameIncludeFromBlameRecursive1'
+
+
+class FindManyBlameArgsFromJudgmentRecursive1(TypedDict, total=False):
+    """Arguments for Judgment"""
+    take: int
+    skip: int
+    order_by: Union['BlameOrderByInput', List['BlameOrderByInput']]
+    where: 'BlameWhereInput'
+    cursor: 'BlameWhereUniqueInput'
+    distinct: List['BlameScalarFieldKeys']
+    select: List['BlameScalarFieldKeys']
+    include: 'BlameIncludeFromBlameRecursive2'
+
+
+class FindManyBlameArgsFromJudgmentRecursive2(TypedDict, total=False):
+    """Arguments for Judgment"""
+    take: int
+    skip: int
+    order_by: Union['BlameOrderByInput', List['BlameOrderByInput']]
+    where: 'BlameWhereInput'
+    cursor: 'BlameWhereUniqueInput'
+    distinct: List['BlameScalarFieldKeys']
+    select: List['BlameScalarFieldKeys']
+    include: 'BlameIncludeFromBlameRecursive3'
+
+
+class FindManyBlameArgsFromJudgmentRecursive3(TypedDict, total=False):
+    """Arguments for Judgment"""
+    take: int
+    skip: int
+    order_by: Union['BlameOrderByInput', List['BlameOrderByInput']]
+    where: 'BlameWhereInput'
+    cursor: 'BlameWhereUniqueInput'
+    distinct: List['BlameScalarFieldKeys']
+    select: List['BlameScalarFieldKeys']
+    include: 'BlameIncludeFromBlameRecursive4'
+
+
+class FindManyBlameArgsFromJudgmentRecursive4(TypedDict, total=False):
+    """Arguments for Judgment"""
+    take: int
+    skip: int
+    order_by: Union['BlameOrderByInput', List['BlameOrderByInput']]
+    where: 'BlameWhereInput'
+    cursor: 'BlameWhereUniqueInput'
+    distinct: List['BlameScalarFieldKeys']
+    select: List['BlameScalarFieldKeys']
+    
+    
+
+class AnalysisJobIncludeFromJudgment(TypedDict, total=False):
+    """Relational arguments for Judgment"""
+    judgment: Union[bool, 'JudgmentArgsFromJudgmentRecursive1']
+
+
+class AnalysisJobIncludeFromJudgmentRecursive1(TypedDict, total=False):
+    """Relational arguments for Judgment"""
+    judgment: Union[bool, 'JudgmentArgsFromJudgmentRecursive2']
+
+
+class AnalysisJobIncludeFromJudgmentRecursive2(TypedDict, total=False):
+    """Relational arguments for Judgment"""
+    judgment: Union[bool, 'JudgmentArgsFromJudgmentRecursive3']
+
+
+class AnalysisJobIncludeFromJudgmentRecursive3(TypedDict, total=False):
+    """Relational arguments for Judgment"""
+    judgment: Union[bool, 'JudgmentArgsFromJudgmentRecursive4']
+
+
+class AnalysisJobIncludeFromJudgmentRecursive4(TypedDict, total=False):
+    """Relational arguments for Judgment"""
+
+    
+
+class AnalysisJobArgsFromJudgment(TypedDict, total=False):
+    """Arguments for Judgment"""
+    select: List['AnalysisJobScalarFieldKeys']
+    include: 'AnalysisJobIncludeFromAnalysisJobRecursive1'
+
+
+class AnalysisJobArgsFromJudgmentRecursive1(TypedDict, total=False):
+    """Arguments for Judgment"""
+    select: List['AnalysisJobScalarFieldKeys']
+    include: 'AnalysisJobIncludeFromAnalysisJobRecursive2'
+
+
+class AnalysisJobArgsFromJudgmentRecursive2(TypedDict, total=False):
+    """Arguments for Judgment"""
+    select: List['AnalysisJobScalarFieldKeys']
+    include: 'AnalysisJobIncludeFromAnalysisJobRecursive3'
+
+
+class AnalysisJobArgsFromJudgmentRecursive3(TypedDict, total=False):
+    """Arguments for Judgment"""
+    select: List['AnalysisJobScalarFieldKeys']
+    include: 'AnalysisJobIncludeFromAnalysisJobRecursive4'
+
+
+class AnalysisJobArgsFromJudgmentRecursive4(TypedDict, total=False):
+    """Arguments for Judgment"""
+    select: List['AnalysisJobScalarFieldKeys']
+    
+    
+
+class FindManyAnalysisJobArgsFromJudgment(TypedDict, total=False):
+    """Arguments for Judgment"""
+    take: int
+    skip: int
+    order_by: Union['AnalysisJobOrderByInput', List['AnalysisJobOrderByInput']]
+    where: 'AnalysisJobWhereInput'
+    cursor: 'AnalysisJobWhereUniqueInput'
+    distinct: List['AnalysisJobScalarFieldKeys']
+    select: List['AnalysisJobScalarFieldKeys']
+    include: 'AnalysisJobIncludeFromAnalysisJobRecursive1'
+
+
+class FindManyAnalysisJobArgsFromJudgmentRecursive1(TypedDict, total=False):
+    """Arguments for Judgment"""
+    take: int
+    skip: int
+    order_by: Union['AnalysisJobOrderByInput', List['AnalysisJobOrderByInput']]
+    where: 'AnalysisJobWhereInput'
+    cursor: 'AnalysisJobWhereUniqueInput'
+    distinct: List['AnalysisJobScalarFieldKeys']
+    select: List['AnalysisJobScalarFieldKeys']
+    include: 'AnalysisJobIncludeFromAnalysisJobRecursive2'
+
+
+class FindManyAnalysisJobArgsFromJudgmentRecursive2(TypedDict, total=False):
+    """Arguments for Judgment"""
+    take: int
+    skip: int
+    order_by: Union['AnalysisJobOrderByInput', List['AnalysisJobOrderByInput']]
+    where: 'AnalysisJobWhereInput'
+    cursor: 'AnalysisJobWhereUniqueInput'
+    distinct: List['AnalysisJobScalarFieldKeys']
+    select: List['AnalysisJobScalarFieldKeys']
+    include: 'AnalysisJobIncludeFromAnalysisJobRecursive3'
+
+
+class FindManyAnalysisJobArgsFromJudgmentRecursive3(TypedDict, total=False):
+    """Arguments for Judgment"""
+    take: int
+    skip: int
+    order_by: Union['AnalysisJobOrderByInput', List['AnalysisJobOrderByInput']]
+    where: 'AnalysisJobWhereInput'
+    cursor: 'AnalysisJobWhereUniqueInput'
+    distinct: List['AnalysisJobScalarFieldKeys']
+    select: List['AnalysisJobScalarFieldKeys']
+    include: 'AnalysisJobIncludeFromAnalysisJobRecursive4'
+
+
+class FindManyAnalysisJobArgsFromJudgmentRecursive4(TypedDict, total=False):
+    """Arguments for Judgment"""
+    take: int
+    skip: int
+    order_by: Union['AnalysisJobOrderByInput', List['AnalysisJobOrderByInput']]
+    where: 'AnalysisJobWhereInput'
+    cursor: 'AnalysisJobWhereUniqueInput'
+    distinct: List['AnalysisJobScalarFieldKeys']
+    select: List['AnalysisJobScalarFieldKeys']
+    
+
+
+FindManyJudgmentArgs = FindManyJudgmentArgsFromJudgment
+FindFirstJudgmentArgs = FindManyJudgmentArgsFromJudgment
+
+
+    
+
+class JudgmentWhereInput(TypedDict, total=False):
+    """Judgment arguments for searching"""
+    id: Union[_str, 'types.StringFilter']
+    user_id: Union[_str, 'types.StringFilter']
+    repo_owner: Union[_str, 'types.StringFilter']
+    repo_name: Union[_str, 'types.StringFilter']
+    title: Union[_str, 'types.StringFilter']
+    description: Union[None, _str, 'types.StringFilter']
+    file_path: Union[None, _str, 'types.StringFilter']
+    period_days: Union[_int, 'types.IntFilter']
+    status: Union[_str, 'types.StringFilter']
+    case_number: Union[_str, 'types.StringFilter']
+    created_at: Union[datetime.datetime, 'types.DateTimeFilter']
+    user: 'UserRelationFilter'
+    suspects: 'SuspectListRelationFilter'
+    blame: 'BlameRelationFilter'
+    jobs: 'AnalysisJobListRelationFilter'
+
+    # should be noted that AND and NOT should be Union['JudgmentWhereInputRecursive1', List['JudgmentWhereInputRecursive1']]
+    # but this causes mypy to hang :/
+    AND: List['JudgmentWhereInputRecursive1']
+    OR: List['JudgmentWhereInputRecursive1']
+    NOT: List['JudgmentWhereInputRecursive1']
+
+
+class JudgmentWhereInputRecursive1(TypedDict, total=False):
+    """Judgment arguments for searching"""
+    id: Union[_str, 'types.StringFilter']
+    user_id: Union[_str, 'types.StringFilter']
+    repo_owner: Union[_str, 'types.StringFilter']
+    repo_name: Union[_str, 'types.StringFilter']
+    title: Union[_str, 'types.StringFilter']
+    description: Union[None, _str, 'types.StringFilter']
+    file_path: Union[None, _str, 'types.StringFilter']
+    period_days: Union[_int, 'types.IntFilter']
+    status: Union[_str, 'types.StringFilter']
+    case_number: Union[_str, 'types.StringFilter']
+    created_at: Union[datetime.datetime, 'types.DateTimeFilter']
+    user: 'UserRelationFilter'
+    suspects: 'SuspectListRelationFilter'
+    blame: 'BlameRelationFilter'
+    jobs: 'AnalysisJobListRelationFilter'
+
+    # should be noted that AND and NOT should be Union['JudgmentWhereInputRecursive2', List['JudgmentWhereInputRecursive2']]
+    # but this causes mypy to hang :/
+    AND: List['JudgmentWhereInputRecursive2']
+    OR: List['JudgmentWhereInputRecursive2']
+    NOT: List['JudgmentWhereInputRecursive2']
+
+
+class JudgmentWhereInputRecursive2(TypedDict, total=False):
+    """Judgment arguments for searching"""
+    id: Union[_str, 'types.StringFilter']
+    user_id: Union[_str, 'types.StringFilter']
+    repo_owner: Union[_str, 'types.StringFilter']
+    repo_name: Union[_str, 'types.StringFilter']
+    title: Union[_str, 'types.StringFilter']
+    description: Union[None, _str, 'types.StringFilter']
+    file_path: Union[None, _str, 'types.StringFilter']
+    period_days: Union[_int, 'types.IntFilter']
+    status: Union[_str, 'types.StringFilter']
+    case_number: Union[_str, 'types.StringFilter']
+    created_at: Union[datetime.datetime, 'types.DateTimeFilter']
+    user: 'UserRelationFilter'
+    suspects: 'SuspectListRelationFilter'
+    blame: 'BlameRelationFilter'
+    jobs: 'AnalysisJobListRelationFilter'
+
+    # should be noted that AND and NOT should be Union['JudgmentWhereInputRecursive3', List['JudgmentWhereInputRecursive3']]
+    # but this causes mypy to hang :/
+    AND: List['JudgmentWhereInputRecursive3']
+    OR: List['JudgmentWhereInputRecursive3']
+    NOT: List['JudgmentWhereInputRecursive3']
+
+
+class JudgmentWhereInputRecursive3(TypedDict, total=False):
+    """Judgment arguments for searching"""
+    id: Union[_str, 'types.StringFilter']
+    user_id: Union[_str, 'types.StringFilter']
+    repo_owner: Union[_str, 'types.StringFilter']
+    repo_name: Union[_str, 'types.StringFilter']
+    title: Union[_str, 'types.StringFilter']
+    description: Union[None, _str, 'types.StringFilter']
+    file_path: Union[None, _str, 'types.StringFilter']
+    period_days: Union[_int, 'types.IntFilter']
+    status: Union[_str, 'types.StringFilter']
+    case_number: Union[_str, 'types.StringFilter']
+    created_at: Union[datetime.datetime, 'types.DateTimeFilter']
+    user: 'UserRelationFilter'
+    suspects: 'SuspectListRelationFilter'
+    blame: 'BlameRelationFilter'
+    jobs: 'AnalysisJobListRelationFilter'
+
+    # should be noted that AND and NOT should be Union['JudgmentWhereInputRecursive4', List['JudgmentWhereInputRecursive4']]
+    # but this causes mypy to hang :/
+    AND: List['JudgmentWhereInputRecursive4']
+    OR: List['JudgmentWhereInputRecursive4']
+    NOT: List['JudgmentWhereInputRecursive4']
+
+
+class JudgmentWhereInputRecursive4(TypedDict, total=False):
+    """Judgment arguments for searching"""
+    id: Union[_str, 'types.StringFilter']
+    user_id: Union[_str, 'types.StringFilter']
+    repo_owner: Union[_str, 'types.StringFilter']
+    repo_name: Union[_str, 'types.StringFilter']
+    title: Union[_str, 'types.StringFilter']
+    description: Union[None, _str, 'types.StringFilter']
+    file_path: Union[None, _str, 'types.StringFilter']
+    period_days: Union[_int, 'types.IntFilter']
+    status: Union[_str, 'types.StringFilter']
+    case_number: Union[_str, 'types.StringFilter']
+    created_at: Union[datetime.datetime, 'types.DateTimeFilter']
+    user: 'UserRelationFilter'
+    suspects: 'SuspectListRelationFilter'
+    blame: 'BlameRelationFilter'
+    jobs: 'AnalysisJobListRelationFilter'
+
+
+
+# aggregate Judgment types
+
+
+    
+
+class JudgmentScalarWhereWithAggregatesInput(TypedDict, total=False):
+    """Judgment arguments for searching"""
+    id: Union[_str, 'types.StringWithAggregatesFilter']
+    user_id: Union[_str, 'types.StringWithAggregatesFilter']
+    repo_owner: Union[_str, 'types.StringWithAggregatesFilter']
+    repo_name: Union[_str, 'types.StringWithAggregatesFilter']
+    title: Union[_str, 'types.StringWithAggregatesFilter']
+    description: Union[_str, 'types.StringWithAggregatesFilter']
+    file_path: Union[_str, 'types.StringWithAggregatesFilter']
+    period_days: Union[_int, 'types.IntWithAggregatesFilter']
+    status: Union[_str, 'types.StringWithAggregatesFilter']
+    case_number: Union[_str, 'types.StringWithAggregatesFilter']
+    created_at: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+
+    AND: List['JudgmentScalarWhereWithAggregatesInputRecursive1']
+    OR: List['JudgmentScalarWhereWithAggregatesInputRecursive1']
+    NOT: List['JudgmentScalarWhereWithAggregatesInputRecursive1']
+
+
+class JudgmentScalarWhereWithAggregatesInputRecursive1(TypedDict, total=False):
+    """Judgment arguments for searching"""
+    id: Union[_str, 'types.StringWithAggregatesFilter']
+    user_id: Union[_str, 'types.StringWithAggregatesFilter']
+    repo_owner: Union[_str, 'types.StringWithAggregatesFilter']
+    repo_name: Union[_str, 'types.StringWithAggregatesFilter']
+    title: Union[_str, 'types.StringWithAggregatesFilter']
+    description: Union[_str, 'types.StringWithAggregatesFilter']
+    file_path: Union[_str, 'types.StringWithAggregatesFilter']
+    period_days: Union[_int, 'types.IntWithAggregatesFilter']
+    status: Union[_str, 'types.StringWithAggregatesFilter']
+    case_number: Union[_str, 'types.StringWithAggregatesFilter']
+    created_at: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+
+    AND: List['JudgmentScalarWhereWithAggregatesInputRecursive2']
+    OR: List['JudgmentScalarWhereWithAggregatesInputRecursive2']
+    NOT: List['JudgmentScalarWhereWithAggregatesInputRecursive2']
+
+
+class JudgmentScalarWhereWithAggregatesInputRecursive2(TypedDict, total=False):
+    """Judgment arguments for searching"""
+    id: Union[_str, 'types.StringWithAggregatesFilter']
+    user_id: Union[_str, 'types.StringWithAggregatesFilter']
+    repo_owner: Union[_str, 'types.StringWithAggregatesFilter']
+    repo_name: Union[_str, 'types.StringWithAggregatesFilter']
+    title: Union[_str, 'types.StringWithAggregatesFilter']
+    description: Union[_str, 'types.StringWithAggregatesFilter']
+    file_path: Union[_str, 'types.StringWithAggregatesFilter']
+    period_days: Union[_int, 'types.IntWithAggregatesFilter']
+    status: Union[_str, 'types.StringWithAggregatesFilter']
+    case_number: Union[_str, 'types.StringWithAggregatesFilter']
+    created_at: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+
+    AND: List['JudgmentScalarWhereWithAggregatesInputRecursive3']
+    OR: List['JudgmentScalarWhereWithAggregatesInputRecursive3']
+    NOT: List['JudgmentScalarWhereWithAggregatesInputRecursive3']
+
+
+class JudgmentScalarWhereWithAggregatesInputRecursive3(TypedDict, total=False):
+    """Judgment arguments for searching"""
+    id: Union[_str, 'types.StringWithAggregatesFilter']
+    user_id: Union[_str, 'types.StringWithAggregatesFilter']
+    repo_owner: Union[_str, 'types.StringWithAggregatesFilter']
+    repo_name: Union[_str, 'types.StringWithAggregatesFilter']
+    title: Union[_str, 'types.StringWithAggregatesFilter']
+    description: Union[_str, 'types.StringWithAggregatesFilter']
+    file_path: Union[_str, 'types.StringWithAggregatesFilter']
+    period_days: Union[_int, 'types.IntWithAggregatesFilter']
+    status: Union[_str, 'types.StringWithAggregatesFilter']
+    case_number: Union[_str, 'types.StringWithAggregatesFilter']
+    created_at: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+
+    AND: List['JudgmentScalarWhereWithAggregatesInputRecursive4']
+    OR: List['JudgmentScalarWhereWithAggregatesInputRecursive4']
+    NOT: List['JudgmentScalarWhereWithAggregatesInputRecursive4']
+
+
+class JudgmentScalarWhereWithAggregatesInputRecursive4(TypedDict, total=False):
+    """Judgment arguments for searching"""
+    id: Union[_str, 'types.StringWithAggregatesFilter']
+    user_id: Union[_str, 'types.StringWithAggregatesFilter']
+    repo_owner: Union[_str, 'types.StringWithAggregatesFilter']
+    repo_name: Union[_str, 'types.StringWithAggregatesFilter']
+    title: Union[_str, 'types.StringWithAggregatesFilter']
+    description: Union[_str, 'types.StringWithAggregatesFilter']
+    file_path: Union[_str, 'types.StringWithAggregatesFilter']
+    period_days: Union[_int, 'types.IntWithAggregatesFilter']
+    status: Union[_str, 'types.StringWithAggregatesFilter']
+    case_number: Union[_str, 'types.StringWithAggregatesFilter']
+    created_at: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+
+
+
+class JudgmentGroupByOutput(TypedDict, total=False):
+    id: _str
+    user_id: _str
+    repo_owner: _str
+    repo_name: _str
+    title: _str
+    description: _str
+    file_path: _str
+    period_days: _int
+    status: _str
+    case_number: _str
+    created_at: datetime.datetime
+    _sum: 'JudgmentSumAggregateOutput'
+    _avg: 'JudgmentAvgAggregateOutput'
+    _min: 'JudgmentMinAggregateOutput'
+    _max: 'JudgmentMaxAggregateOutput'
+    _count: 'JudgmentCountAggregateOutput'
+
+
+class JudgmentAvgAggregateOutput(TypedDict, total=False):
+    """Judgment output for aggregating averages"""
+    period_days: float
+
+
+class JudgmentSumAggregateOutput(TypedDict, total=False):
+    """Judgment output for aggregating sums"""
+    period_days: _int
+
+
+class JudgmentScalarAggregateOutput(TypedDict, total=False):
+    """Judgment output including scalar fields"""
+    id: _str
+    user_id: _str
+    repo_owner: _str
+    repo_name: _str
+    title: _str
+    description: _str
+    file_path: _str
+    period_days: _int
+    status: _str
+    case_number: _str
+    created_at: datetime.datetime
+
+
+JudgmentMinAggregateOutput = JudgmentScalarAggregateOutput
+JudgmentMaxAggregateOutput = JudgmentScalarAggregateOutput
+
+
+class JudgmentMaxAggregateInput(TypedDict, total=False):
+    """Judgment input for aggregating by max"""
+    id: bool
+    user_id: bool
+    repo_owner: bool
+    repo_name: bool
+    title: bool
+    description: bool
+    file_path: bool
+    period_days: bool
+    status: bool
+    case_number: bool
+    created_at: bool
+
+
+class JudgmentMinAggregateInput(TypedDict, total=False):
+    """Judgment input for aggregating by min"""
+    id: bool
+    user_id: bool
+    repo_owner: bool
+    repo_name: bool
+    title: bool
+    description: bool
+    file_path: bool
+    period_days: bool
+    status: bool
+    case_number: bool
+    created_at: bool
+
+
+class JudgmentNumberAggregateInput(TypedDict, total=False):
+    """Judgment input for aggregating numbers"""
+    period_days: bool
+
+
+JudgmentAvgAggregateInput = JudgmentNumberAggregateInput
+JudgmentSumAggregateInput = JudgmentNumberAggregateInput
+
+
+JudgmentCountAggregateInput = TypedDict(
+    'JudgmentCountAggregateInput',
+    {
+        'id': bool,
+        'user_id': bool,
+        'repo_owner': bool,
+        'repo_name': bool,
+        'title': bool,
+        'description': bool,
+        'file_path': bool,
+        'period_days': bool,
+        'status': bool,
+        'case_number': bool,
+        'created_at': bool,
+        '_all': bool,
+    },
+    total=False,
+)
+
+JudgmentCountAggregateOutput = TypedDict(
+    'JudgmentCountAggregateOutput',
+    {
+        'id': int,
+        'user_id': int,
+        'repo_owner': int,
+        'repo_name': int,
+        'title': int,
+        'description': int,
+        'file_path': int,
+        'period_days': int,
+        'status': int,
+        'case_number': int,
+        'created_at': int,
+        '_all': int,
+    },
+    total=False,
+)
+
+
+JudgmentKeys = Literal[
+    'id',
+    'user_id',
+    'repo_owner',
+    'repo_name',
+    'title',
+    'description',
+    'file_path',
+    'period_days',
+    'status',
+    'case_number',
+    'created_at',
+    'user',
+    'suspects',
+    'blame',
+    'jobs',
+]
+JudgmentScalarFieldKeys = Literal[
+    'id',
+    'user_id',
+    'repo_owner',
+    'repo_name',
+    'title',
+    'description',
+    'file_path',
+    'period_days',
+    'status',
+    'case_number',
+    'created_at',
+]
+JudgmentScalarFieldKeysT = TypeVar('JudgmentScalarFieldKeysT', bound=JudgmentScalarFieldKeys)
+
+JudgmentRelationalFieldKeys = Literal[
+        'user',
+        'suspects',
+        'blame',
+        'jobs',
+    ]
+
+# Suspect types
+
+class SuspectOptionalCreateInput(TypedDict, total=False):
+    """Optional arguments to the Suspect create method"""
+    id: _str
+    judgment_id: _str
+    avatar_url: Optional[_str]
+    reason: Optional[_str]
+    commit_count: Optional[_int]
+    last_commit_msg: Optional[_str]
+    last_commit_date: Optional[datetime.datetime]
+    judgment: 'JudgmentCreateNestedWithoutRelationsInput'
+
+
+class SuspectCreateInput(SuspectOptionalCreateInput):
+    """Required arguments to the Suspect create method"""
+    username: _str
+    responsibility: _int
+
+
+# TODO: remove this in favour of without explicit relations
+# e.g. PostCreateWithoutAuthorInput
+
+class SuspectOptionalCreateWithoutRelationsInput(TypedDict, total=False):
+    """Optional arguments to the Suspect create method, without relations"""
+    id: _str
+    judgment_id: _str
+    avatar_url: Optional[_str]
+    reason: Optional[_str]
+    commit_count: Optional[_int]
+    last_commit_msg: Optional[_str]
+    last_commit_date: Optional[datetime.datetime]
+
+
+class SuspectCreateWithoutRelationsInput(SuspectOptionalCreateWithoutRelationsInput):
+    """Required arguments to the Suspect create method, without relations"""
+    username: _str
+    responsibility: _int
+
+
+class SuspectCreateNestedWithoutRelationsInput(TypedDict, total=False):
+    create: 'SuspectCreateWithoutRelationsInput'
+    connect: 'SuspectWhereUniqueInput'
+
+
+class SuspectCreateManyNestedWithoutRelationsInput(TypedDict, total=False):
+    create: Union['SuspectCreateWithoutRelationsInput', List['SuspectCreateWithoutRelationsInput']]
+    connect: Union['SuspectWhereUniqueInput', List['SuspectWhereUniqueInput']]
+
+
+_SuspectWhereUnique_id_Input = TypedDict(
+    '_SuspectWhereUnique_id_Input',
+    {
+        'id': '_str',
+    },
+    total=True
+)
+
+SuspectWhereUniqueInput = _SuspectWhereUnique_id_Input
+
+
+class SuspectUpdateInput(TypedDict, total=False):
+    """Optional arguments for updating a record"""
+    id: _str
+    username: _str
+    avatar_url: Optional[_str]
+    responsibility: Union[AtomicIntInput, _int]
+    reason: Optional[_str]
+    commit_count: Optional[Union[AtomicIntInput, _int]]
+    last_commit_msg: Optional[_str]
+    last_commit_date: Optional[datetime.datetime]
+    judgment: 'JudgmentUpdateOneWithoutRelationsInput'
+
+
+class SuspectUpdateManyMutationInput(TypedDict, total=False):
+    """Arguments for updating many records"""
+    id: _str
+    username: _str
+    avatar_url: Optional[_str]
+    responsibility: Union[AtomicIntInput, _int]
+    reason: Optional[_str]
+    commit_count: Optional[Union[AtomicIntInput, _int]]
+    last_commit_msg: Optional[_str]
+    last_commit_date: Optional[datetime.datetime]
+
+
+class SuspectUpdateManyWithoutRelationsInput(TypedDict, total=False):
+    create: List['SuspectCreateWithoutRelationsInput']
+    connect: List['SuspectWhereUniqueInput']
+    set: List['SuspectWhereUniqueInput']
+    disconnect: List['SuspectWhereUniqueInput']
+    delete: List['SuspectWhereUniqueInput']
+
+    # TODO
+    # update: List['SuspectUpdateWithWhereUniqueWithoutRelationsInput']
+    # updateMany: List['SuspectUpdateManyWithWhereUniqueWithoutRelationsInput']
+    # deleteMany: List['SuspectScalarWhereInput']
+    # upsert: List['SuspectUpserteWithWhereUniqueWithoutRelationsInput']
+    # connectOrCreate: List['SuspectCreateOrConnectWithoutRelationsInput']
+
+
+class SuspectUpdateOneWithoutRelationsInput(TypedDict, total=False):
+    create: 'SuspectCreateWithoutRelationsInput'
+    connect: 'SuspectWhereUniqueInput'
+    disconnect: bool
+    delete: bool
+
+    # TODO
+    # update: 'SuspectUpdateInput'
+    # upsert: 'SuspectUpsertWithoutRelationsInput'
+    # connectOrCreate: 'SuspectCreateOrConnectWithoutRelationsInput'
+
+
+class SuspectUpsertInput(TypedDict):
+    create: 'SuspectCreateInput'
+    update: 'SuspectUpdateInput'  # pyright: ignore[reportIncompatibleMethodOverride]
+
+
+_Suspect_id_OrderByInput = TypedDict(
+    '_Suspect_id_OrderByInput',
+    {
+        'id': 'SortOrder',
+    },
+    total=True
+)
+
+_Suspect_judgment_id_OrderByInput = TypedDict(
+    '_Suspect_judgment_id_OrderByInput',
+    {
+        'judgment_id': 'SortOrder',
+    },
+    total=True
+)
+
+_Suspect_username_OrderByInput = TypedDict(
+    '_Suspect_username_OrderByInput',
+    {
+        'username': 'SortOrder',
+    },
+    total=True
+)
+
+_Suspect_avatar_url_OrderByInput = TypedDict(
+    '_Suspect_avatar_url_OrderByInput',
+    {
+        'avatar_url': 'SortOrder',
+    },
+    total=True
+)
+
+_Suspect_responsibility_OrderByInput = TypedDict(
+    '_Suspect_responsibility_OrderByInput',
+    {
+        'responsibility': 'SortOrder',
+    },
+    total=True
+)
+
+_Suspect_reason_OrderByInput = TypedDict(
+    '_Suspect_reason_OrderByInput',
+    {
+        'reason': 'SortOrder',
+    },
+    total=True
+)
+
+_Suspect_commit_count_OrderByInput = TypedDict(
+    '_Suspect_commit_count_OrderByInput',
+    {
+        'commit_count': 'SortOrder',
+    },
+    total=True
+)
+
+_Suspect_last_commit_msg_OrderByInput = TypedDict(
+    '_Suspect_last_commit_msg_OrderByInput',
+    {
+        'last_commit_msg': 'SortOrder',
+    },
+    total=True
+)
+
+_Suspect_last_commit_date_OrderByInput = TypedDict(
+    '_Suspect_last_commit_date_OrderByInput',
+    {
+        'last_commit_date': 'SortOrder',
+    },
+    total=True
+)
+
+SuspectOrderByInput = Union[
+    '_Suspect_id_OrderByInput',
+    '_Suspect_judgment_id_OrderByInput',
+    '_Suspect_username_OrderByInput',
+    '_Suspect_avatar_url_OrderByInput',
+    '_Suspect_responsibility_OrderByInput',
+    '_Suspect_reason_OrderByInput',
+    '_Suspect_commit_count_OrderByInput',
+    '_Suspect_last_commit_msg_OrderByInput',
+    '_Suspect_last_commit_date_OrderByInput',
+]
+
+
+
+# recursive Suspect types
+# TODO: cleanup these types
+
+
+# Dict[str, Any] is a mypy limitation
+# see https://github.com/RobertCraigie/prisma-client-py/issues/45
+# switch to pyright for improved types, see https://prisma-client-py.readthedocs.io/en/stable/reference/limitations/
+
+SuspectRelationFilter = TypedDict(
+    'SuspectRelationFilter',
+    {
+        'is': 'Dict[str, Any]',
+        'is_not': 'Dict[str, Any]',
+    },
+    total=False,
+)
+
+
+class SuspectListRelationFilter(TypedDict, total=False):
+    some: 'Dict[str, Any]'
+    none: 'Dict[str, Any]'
+    every: 'Dict[str, Any]'
+
+
+class SuspectInclude(TypedDict, total=False):
+    """Suspect relational arguments"""
+    judgment: Union[bool, 'JudgmentArgsFromSuspect']
+
+
+    
+
+class UserIncludeFromSuspect(TypedDict, total=False):
+    """Relational arguments for Suspect"""
+    judgments: Union[bool, 'FindManyJudgmentArgsFromSuspectRecursive1']
+
+
+class UserIncludeFromSuspectRecursive1(TypedDict, total=False):
+    """Relational arguments for Suspect"""
+    judgments: Union[bool, 'FindManyJudgmentArgsFromSuspectRecursive2']
+
+
+class UserIncludeFromSuspectRecursive2(TypedDict, total=False):
+    """Relational arguments for Suspect"""
+    judgments: Union[bool, 'FindManyJudgmentArgsFromSuspectRecursive3']
+
+
+class UserIncludeFromSuspectRecursive3(TypedDict, total=False):
+    """Relational arguments for Suspect"""
+    judgments: Union[bool, 'FindManyJudgmentArgsFromSuspectRecursive4']
+
+
+class UserIncludeFromSuspectRecursive4(TypedDict, total=False):
+    """Relational arguments for Suspect"""
+
+    
+
+class UserArgsFromSuspect(TypedDict, total=False):
+    """Arguments for Suspect"""
+    select: List['UserScalarFieldKeys']
+    include: 'UserIncludeFromUserRecursive1'
+
+
+class UserArgsFromSuspectRecursive1(TypedDict, total=False):
+    """Arguments for Suspect"""
+    select: List['UserScalarFieldKeys']
+    include: 'UserIncludeFromUserRecursive2'
+
+
+class UserArgsFromSuspectRecursive2(TypedDict, total=False):
+    """Arguments for Suspect"""
+    select: List['UserScalarFieldKeys']
+    include: 'UserIncludeFromUserRecursive3'
+
+
+class UserArgsFromSuspectRecursive3(TypedDict, total=False):
+    """Arguments for Suspect"""
+    select: List['UserScalarFieldKeys']
+    include: 'UserIncludeFromUserRecursive4'
+
+
+class UserArgsFromSuspectRecursive4(TypedDict, total=False):
+    """Arguments for Suspect"""
+    select: List['UserScalarFieldKeys']
+    
+    
+
+class FindManyUserArgsFromSuspect(TypedDict, total=False):
+    """Arguments for Suspect"""
+    take: int
+    skip: int
+    order_by: Union['UserOrderByInput', List['UserOrderByInput']]
+    where: 'UserWhereInput'
+    cursor: 'UserWhereUniqueInput'
+    distinct: List['UserScalarFieldKeys']
+    select: List['UserScalarFieldKeys']
+    include: 'UserIncludeFromUserRecursive1'
+
+
+class FindManyUserArgsFromSuspectRecursive1(TypedDict, total=False):
+    """Arguments for Suspect"""
+    take: int
+    skip: int
+    order_by: Union['UserOrderByInput', List['UserOrderByInput']]
+    where: 'UserWhereInput'
+    cursor: 'UserWhereUniqueInput'
+    distinct: List['UserScalarFieldKeys']
+    select: List['UserScalarFieldKeys']
+    include: 'UserIncludeFromUserRecursive2'
+
+
+class FindManyUserArgsFromSuspectRecursive2(TypedDict, total=False):
+    """Arguments for Suspect"""
+    take: int
+    skip: int
+    order_by: Union['UserOrderByInput', List['UserOrderByInput']]
+    where: 'UserWhereInput'
+    cursor: 'UserWhereUniqueInput'
+    distinct: List['UserScalarFieldKeys']
+    select: List['UserScalarFieldKeys']
+    include: 'UserIncludeFromUserRecursive3'
+
+
+class FindManyUserArgsFromSuspectRecursive3(TypedDict, total=False):
+    """Arguments for Suspect"""
+    take: int
+    skip: int
+    order_by: Union['UserOrderByInput', List['UserOrderByInput']]
+    where: 'UserWhereInput'
+    cursor: 'UserWhereUniqueInput'
+    distinct: List['UserScalarFieldKeys']
+    select: List['UserScalarFieldKeys']
+    include: 'UserIncludeFromUserRecursive4'
+
+
+class FindManyUserArgsFromSuspectRecursive4(TypedDict, total=False):
+    """Arguments for Suspect"""
+    take: int
+    skip: int
+    order_by: Union['UserOrderByInput', List['UserOrderByInput']]
+    where: 'UserWhereInput'
+    cursor: 'UserWhereUniqueInput'
+    distinct: List['UserScalarFieldKeys']
+    select: List['UserScalarFieldKeys']
+    
+    
+
+class JudgmentIncludeFromSuspect(TypedDict, total=False):
+    """Relational arguments for Suspect"""
+    user: Union[bool, 'UserArgsFromSuspectRecursive1']
+    suspects: Union[bool, 'FindManySuspectArgsFromSuspectRecursive1']
+    blame: Union[bool, 'BlameArgsFromSuspectRecursive1']
+    jobs: Union[bool, 'FindManyAnalysisJobArgsFromSuspectRecursive1']
+
+
+class JudgmentIncludeFromSuspectRecursive1(TypedDict, total=False):
+    """Relational arguments for Suspect"""
+    user: Union[bool, 'UserArgsFromSuspectRecursive2']
+    suspects: Union[bool, 'FindManySuspectArgsFromSuspectRecursive2']
+    blame: Union[bool, 'BlameArgsFromSuspectRecursive2']
+    jobs: Union[bool, 'FindManyAnalysisJobArgsFromSuspectRecursive2']
+
+
+class JudgmentIncludeFromSuspectRecursive2(TypedDict, total=False):
+    """Relational arguments for Suspect"""
+    user: Union[bool, 'UserArgsFromSuspectRecursive3']
+    suspects: Union[bool, 'FindManySuspectArgsFromSuspectRecursive3']
+    blame: Union[bool, 'BlameArgsFromSuspectRecursive3']
+    jobs: Union[bool, 'FindManyAnalysisJobArgsFromSuspectRecursive3']
+
+
+class JudgmentIncludeFromSuspectRecursive3(TypedDict, total=False):
+    """Relational arguments for Suspect"""
+    user: Union[bool, 'UserArgsFromSuspectRecursive4']
+    suspects: Union[bool, 'FindManySuspectArgsFromSuspectRecursive4']
+    blame: Union[bool, 'BlameArgsFromSuspectRecursive4']
+    jobs: Union[bool, 'FindManyAnalysisJobArgsFromSuspectRecursive4']
+
+
+class JudgmentIncludeFromSuspectRecursive4(TypedDict, total=False):
+    """Relational arguments for Suspect"""
+
+    
+
+class JudgmentArgsFromSuspect(TypedDict, total=False):
+    """Arguments for Suspect"""
+    select: List['JudgmentScalarFieldKeys']
+    include: 'JudgmentIncludeFromJudgmentRecursive1'
+
+
+class JudgmentArgsFromSuspectRecursive1(TypedDict, total=False):
+    """Arguments for Suspect"""
+    select: List['JudgmentScalarFieldKeys']
+    include: 'JudgmentIncludeFromJudgmentRecursive2'
+
+
+class JudgmentArgsFromSuspectRecursive2(TypedDict, total=False):
+    """Arguments for Suspect"""
+    select: List['JudgmentScalarFieldKeys']
+    include: 'JudgmentIncludeFromJudgmentRecursive3'
+
+
+class JudgmentArgsFromSuspectRecursive3(TypedDict, total=False):
+    """Arguments for Suspect"""
+    select: List['JudgmentScalarFieldKeys']
+    include: 'JudgmentIncludeFromJudgmentRecursive4'
+
+
+class JudgmentArgsFromSuspectRecursive4(TypedDict, total=False):
+    """Arguments for Suspect"""
+    select: List['JudgmentScalarFieldKeys']
+    
+    
+
+class FindManyJudgmentArgsFromSuspect(TypedDict, total=False):
+    """Arguments for Suspect"""
+    take: int
+    skip: int
+    order_by: Union['JudgmentOrderByInput', List['JudgmentOrderByInput']]
+    where: 'JudgmentWhereInput'
+    cursor: 'JudgmentWhereUniqueInput'
+    distinct: List['JudgmentScalarFieldKeys']
+    select: List['JudgmentScalarFieldKeys']
+    include: 'JudgmentIncludeFromJudgmentRecursive1'
+
+
+class FindManyJudgmentArgsFromSuspectRecursive1(TypedDict, total=False):
+    """Arguments for Suspect"""
+    take: int
+    skip: int
+    order_by: Union['JudgmentOrderByInput', List['JudgmentOrderByInput']]
+    where: 'JudgmentWhereInput'
+    cursor: 'JudgmentWhereUniqueInput'
+    distinct: List['JudgmentScalarFieldKeys']
+    select: List['JudgmentScalarFieldKeys']
+    include: 'JudgmentIncludeFromJudgmentRecursive2'
+
+
+class FindManyJudgmentArgsFromSuspectRecursive2(TypedDict, total=False):
+    """Arguments for Suspect"""
+    take: int
+    skip: int
+    order_by: Union['JudgmentOrderByInput', List['JudgmentOrderByInput']]
+    where: 'JudgmentWhereInput'
+    cursor: 'JudgmentWhereUniqueInput'
+    distinct: List['JudgmentScalarFieldKeys']
+    select: List['JudgmentScalarFieldKeys']
+    include: 'JudgmentIncludeFromJudgmentRecursive3'
+
+
+class FindManyJudgmentArgsFromSuspectRecursive3(TypedDict, total=False):
+    """Arguments for Suspect"""
+    take: int
+    skip: int
+    order_by: Union['JudgmentOrderByInput', List['JudgmentOrderByInput']]
+    where: 'JudgmentWhereInput'
+    cursor: 'JudgmentWhereUniqueInput'
+    distinct: List['JudgmentScalarFieldKeys']
+    select: List['JudgmentScalarFieldKeys']
+    include: 'JudgmentIncludeFromJudgmentRecursive4'
+
+
+class FindManyJudgmentArgsFromSuspectRecursive4(TypedDict, total=False):
+    """Arguments for Suspect"""
+    take: int
+    skip: int
+    order_by: Union['JudgmentOrderByInput', List['JudgmentOrderByInput']]
+    where: 'JudgmentWhereInput'
+    cursor: 'JudgmentWhereUniqueInput'
+    distinct: List['JudgmentScalarFieldKeys']
+    select: List['JudgmentScalarFieldKeys']
+    
+    
+
+class SuspectIncludeFromSuspect(TypedDict, total=False):
+    """Relational arguments for Suspect"""
+    judgment: Union[bool, 'JudgmentArgsFromSuspectRecursive1']
+
+
+class SuspectIncludeFromSuspectRecursive1(TypedDict, total=False):
+    """Relational arguments for Suspect"""
+    judgment: Union[bool, 'JudgmentArgsFromSuspectRecursive2']
+
+
+class SuspectIncludeFromSuspectRecursive2(TypedDict, total=False):
+    """Relational arguments for Suspect"""
+    judgment: Union[bool, 'JudgmentArgsFromSuspectRecursive3']
+
+
+class SuspectIncludeFromSuspectRecursive3(TypedDict, total=False):
+    """Relational arguments for Suspect"""
+    judgment: Union[bool, 'JudgmentArgsFromSuspectRecursive4']
+
+
+class SuspectIncludeFromSuspectRecursive4(TypedDict, total=False):
+    """Relational arguments for Suspect"""
+
+    
+
+class SuspectArgsFromSuspect(TypedDict, total=False):
+    """Arguments for Suspect"""
+    select: List['SuspectScalarFieldKeys']
+    include: 'SuspectIncludeFromSuspectRecursive1'
+
+
+class SuspectArgsFromSuspectRecursive1(TypedDict, total=False):
+    """Arguments for Suspect"""
+    select: List['SuspectScalarFieldKeys']
+    include: 'SuspectIncludeFromSuspectRecursive2'
+
+
+class SuspectArgsFromSuspectRecursive2(TypedDict, total=False):
+    """Arguments for Suspect"""
+    select: List['SuspectScalarFieldKeys']
+    include: 'SuspectIncludeFromSuspectRecursive3'
+
+
+class SuspectArgsFromSuspectRecursive3(TypedDict, total=False):
+    """Arguments for Suspect"""
+    select: List['SuspectScalarFieldKeys']
+    include: 'SuspectIncludeFromSuspectRecursive4'
+
+
+class SuspectArgsFromSuspectRecursive4(TypedDict, total=False):
+    """Arguments for Suspect"""
+    select: List['SuspectScalarFieldKeys']
+    
+    
+
+class FindManySuspectArgsFromSuspect(TypedDict, total=False):
+    """Arguments for Suspect"""
+    take: int
+    skip: int
+    order_by: Union['SuspectOrderByInput', List['SuspectOrderByInput']]
+    where: 'SuspectWhereInput'
+    cursor: 'SuspectWhereUniqueInput'
+    distinct: List['SuspectScalarFieldKeys']
+    select: List['SuspectScalarFieldKeys']
+    include: 'SuspectIncludeFromSuspectRecursive1'
+
+
+class FindManySuspectArgsFromSuspectRecursive1(TypedDict, total=False):
+    """Arguments for Suspect"""
+    take: int
+    skip: int
+    order_by: Union['SuspectOrderByInput', List['SuspectOrderByInput']]
+    where: 'SuspectWhereInput'
+    cursor: 'SuspectWhereUniqueInput'
+    distinct: List['SuspectScalarFieldKeys']
+    select: List['SuspectScalarFieldKeys']
+    include: 'SuspectIncludeFromSuspectRecursive2'
+
+
+class FindManySuspectArgsFromSuspectRecursive2(TypedDict, total=False):
+    """Arguments for Suspect"""
+    take: int
+    skip: int
+    order_by: Union['SuspectOrderByInput', List['SuspectOrderByInput']]
+    where: 'SuspectWhereInput'
+    cursor: 'SuspectWhereUniqueInput'
+    distinct: List['SuspectScalarFieldKeys']
+    select: List['SuspectScalarFieldKeys']
+    include: 'SuspectIncludeFromSuspectRecursive3'
+
+
+class FindManySuspectArgsFromSuspectRecursive3(TypedDict, total=False):
+    """Arguments for Suspect"""
+    take: int
+    skip: int
+    order_by: Union['SuspectOrderByInput', List['SuspectOrderByInput']]
+    where: 'SuspectWhereInput'
+    cursor: 'SuspectWhereUniqueInput'
+    distinct: List['SuspectScalarFieldKeys']
+    select: List['SuspectScalarFieldKeys']
+    include: 'SuspectIncludeFromSuspectRecursive4'
+
+
+class FindManySuspectArgsFromSuspectRecursive4(TypedDict, total=False):
+    """Arguments for Suspect"""
+    take: int
+    skip: int
+    order_by: Union['SuspectOrderByInput', List['SuspectOrderByInput']]
+    where: 'SuspectWhereInput'
+    cursor: 'SuspectWhereUniqueInput'
+    distinct: List['SuspectScalarFieldKeys']
+    select: List['SuspectScalarFieldKeys']
+    
+    
+
+class BlameIncludeFromSuspect(TypedDict, total=False):
+    """Relational arguments for Suspect"""
+    judgment: Union[bool, 'JudgmentArgsFromSuspectRecursive1']
+
+
+class BlameIncludeFromSuspectRecursive1(TypedDict, total=False):
+    """Relational arguments for Suspect"""
+    judgment: Union[bool, 'JudgmentArgsFromSuspectRecursive2']
+
+
+class BlameIncludeFromSuspectRecursive2(TypedDict, total=False):
+    """Relational arguments for Suspect"""
+    judgment: Union[bool, 'JudgmentArgsFromSuspectRecursive3']
+
+
+class BlameIncludeFromSuspectRecursive3(TypedDict, total=False):
+    """Relational arguments for Suspect"""
+    judgment: Union[bool, 'JudgmentArgsFromSuspectRecursive4']
+
+
+class BlameIncludeFromSuspectRecursive4(TypedDict, total=False):
+    """Relational arguments for Suspect"""
+
+    
+
+class BlameArgsFromSuspect(TypedDict, total=False):
+    """Arguments for Suspect"""
+    select: List['BlameScalarFieldKeys']
+    include: 'BlameIncludeFromBlameRecursive1'
+
+
+class BlameArgsFromSuspectRecursive1(TypedDict, total=False):
+    """Arguments for Suspect"""
+    select: List['BlameScalarFieldKeys']
+    include: 'BlameIncludeFromBlameRecursive2'
+
+
+class BlameArgsFromSuspectRecursive2(TypedDict, total=False):
+    """Arguments for Suspect"""
+    select: List['BlameScalarFieldKeys']
+    include: 'BlameIncludeFromBlameRecursive3'
+
+
+class BlameArgsFromSuspectRecursive3(TypedDict, total=False):
+    """Arguments for Suspect"""
+    select: List['BlameScalarFieldKeys']
+    include: 'BlameIncludeFromBlameRecursive4'
+
+
+class BlameArgsFromSuspectRecursive4(TypedDict, total=False):
+    """Arguments for Suspect"""
+    select: List['BlameScalarFieldKeys']
+    
+    
+
+class FindManyBlameArgsFromSuspect(TypedDict, total=False):
+    """Arguments for Suspect"""
+    take: int
+    skip: int
+    order_by: Union['BlameOrderByInput', List['BlameOrderByInput']]
+    where: 'BlameWhereInput'
+    cursor: 'BlameWhereUniqueInput'
+    distinct: List['BlameScalarFieldKeys']
+    select: List['BlameScalarFieldKeys']
+    include: 'BlameIncludeFromBlameRecursive1'
+
+
+class FindManyBlameArgsFromSuspectRecursive1(TypedDict, total=False):
+    """Arguments for Suspect"""
+    take: int
+    skip: int
+    order_by: Union['BlameOrderByInput', List['BlameOrderByInput']]
+    where: 'BlameWhereInput'
+    cursor: 'BlameWhereUniqueInput'
+    distinct: List['BlameScalarFieldKeys']
+    select: List['BlameScalarFieldKeys']
+    include: 'BlameIncludeFromBlameRecursive2'
+
+
+class FindManyBlameArgsFromSuspectRecursive2(TypedDict, total=False):
+    """Arguments for Suspect"""
+    take: int
+    skip: int
+    order_by: Union['BlameOrderByInput', List['BlameOrderByInput']]
+    where: 'BlameWhereInput'
+    cursor: 'BlameWhereUniqueInput'
+    distinct: List['BlameScalarFieldKeys']
+    select: List['BlameScalarFieldKeys']
+    include: 'BlameIncludeFromBlameRecursive3'
+
+
+class FindManyBlameArgsFromSuspectRecursive3(TypedDict, total=False):
+    """Arguments for Suspect"""
+    take: int
+    skip: int
+    order_by: Union['BlameOrderByInput', List['BlameOrderByInput']]
+    where: 'BlameWhereInput'
+    cursor: 'BlameWhereUniqueInput'
+    distinct: List['BlameScalarFieldKeys']
+    select: List['BlameScalarFieldKeys']
+    include: 'BlameIncludeFromBlameRecursive4'
+
+
+class FindManyBlameArgsFromSuspectRecursive4(TypedDict, total=False):
+    """Arguments for Suspect"""
+    take: int
+    skip: int
+    order_by: Union['BlameOrderByInput', List['BlameOrderByInput']]
+    where: 'BlameWhereInput'
+    cursor: 'BlameWhereUniqueInput'
+    distinct: List['BlameScalarFieldKeys']
+    select: List['BlameScalarFieldKeys']
+    
+    
+
+class AnalysisJobIncludeFromSuspect(TypedDict, total=False):
+    """Relational arguments for Suspect"""
+    judgment: Union[bool, 'JudgmentArgsFromSuspectRecursive1']
+
+
+class AnalysisJobIncludeFromSuspectRecursive1(TypedDict, total=False):
+    """Relational arguments for Suspect"""
+    judgment: Union[bool, 'JudgmentArgsFromSuspectRecursive2']
+
+
+class AnalysisJobIncludeFromSuspectRecursive2(TypedDict, total=False):
+    """Relational arguments for Suspect"""
+    judgment: Union[bool, 'JudgmentArgsFromSuspectRecursive3']
+
+
+class AnalysisJobIncludeFromSuspectRecursive3(TypedDict, total=False):
+    """Relational arguments for Suspect"""
+    judgment: Union[bool, 'JudgmentArgsFromSuspectRecursive4']
+
+
+class AnalysisJobIncludeFromSuspectRecursive4(TypedDict, total=False):
+    """Relational arguments for Suspect"""
+
+    
+
+class AnalysisJobArgsFromSuspect(TypedDict, total=False):
+    """Arguments for Suspect"""
+    select: List['AnalysisJobScalarFieldKeys']
+    include: 'AnalysisJobIncludeFromAnalysisJobRecursive1'
+
+
+class AnalysisJobArgsFromSuspectRecursive1(TypedDict, total=False):
+    """Arguments for Suspect"""
+    select: List['AnalysisJobScalarFieldKeys']
+    include: 'AnalysisJobIncludeFromAnalysisJobRecursive2'
+
+
+class AnalysisJobArgsFromSuspectRecursive2(TypedDict, total=False):
+    """Arguments for Suspect"""
+    select: List['AnalysisJobScalarFieldKeys']
+    include: 'AnalysisJobIncludeFromAnalysisJobRecursive3'
+
+
+class AnalysisJobArgsFromSuspectRecursive3(TypedDict, total=False):
+    """Arguments for Suspect"""
+    select: List['AnalysisJobScalarFieldKeys']
+    include: 'AnalysisJobIncludeFromAnalysisJobRecursive4'
+
+
+class AnalysisJobArgsFromSuspectRecursive4(TypedDict, total=False):
+    """Arguments for Suspect"""
+    select: List['AnalysisJobScalarFieldKeys']
+    
+    
+
+class FindManyAnalysisJobArgsFromSuspect(TypedDict, total=False):
+    """Arguments for Suspect"""
+    take: int
+    skip: int
+    order_by: Union['AnalysisJobOrderByInput', List['AnalysisJobOrderByInput']]
+    where: 'AnalysisJobWhereInput'
+    cursor: 'AnalysisJobWhereUniqueInput'
+    distinct: List['AnalysisJobScalarFieldKeys']
+    select: List['AnalysisJobScalarFieldKeys']
+    include: 'AnalysisJobIncludeFromAnalysisJobRecursive1'
+
+
+class FindManyAnalysisJobArgsFromSuspectRecursive1(TypedDict, total=False):
+    """Arguments for Suspect"""
+    take: int
+    skip: int
+    order_by: Union['AnalysisJobOrderByInput', List['AnalysisJobOrderByInput']]
+    where: 'AnalysisJobWhereInput'
+    cursor: 'AnalysisJobWhereUniqueInput'
+    distinct: List['AnalysisJobScalarFieldKeys']
+    select: List['AnalysisJobScalarFieldKeys']
+    include: 'AnalysisJobIncludeFromAnalysisJobRecursive2'
+
+
+class FindManyAnalysisJobArgsFromSuspectRecursive2(TypedDict, total=False):
+    """Arguments for Suspect"""
+    take: int
+    skip: int
+    order_by: Union['AnalysisJobOrderByInput', List['AnalysisJobOrderByInput']]
+    where: 'AnalysisJobWhereInput'
+    cursor: 'AnalysisJobWhereUniqueInput'
+    distinct: List['AnalysisJobScalarFieldKeys']
+    select: List['AnalysisJobScalarFieldKeys']
+    include: 'AnalysisJobIncludeFromAnalysisJobRecursive3'
+
+
+class FindManyAnalysisJobArgsFromSuspectRecursive3(TypedDict, total=False):
+    """Arguments for Suspect"""
+    take: int
+    skip: int
+    order_by: Union['AnalysisJobOrderByInput', List['AnalysisJobOrderByInput']]
+    where: 'AnalysisJobWhereInput'
+    cursor: 'AnalysisJobWhereUniqueInput'
+    distinct: List['AnalysisJobScalarFieldKeys']
+    select: List['AnalysisJobScalarFieldKeys']
+    include: 'AnalysisJobIncludeFromAnalysisJobRecursive4'
+
+
+class FindManyAnalysisJobArgsFromSuspectRecursive4(TypedDict, total=False):
+    """Arguments for Suspect"""
+    take: int
+    skip: int
+    order_by: Union['AnalysisJobOrderByInput', List['AnalysisJobOrderByInput']]
+    where: 'AnalysisJobWhereInput'
+    cursor: 'AnalysisJobWhereUniqueInput'
+    distinct: List['AnalysisJobScalarFieldKeys']
+    select: List['AnalysisJobScalarFieldKeys']
+    
+
+
+FindManySuspectArgs = FindManySuspectArgsFromSuspect
+FindFirstSuspectArgs = FindManySuspectArgsFromSuspect
+
+
+    
+
+class SuspectWhereInput(TypedDict, total=False):
+    """Suspect arguments for searching"""
+    id: Union[_str, 'types.StringFilter']
+    judgment_id: Union[_str, 'types.StringFilter']
+    username: Union[_str, 'types.StringFilter']
+    avatar_url: Union[None, _str, 'types.StringFilter']
+    responsibility: Union[_int, 'types.IntFilter']
+    reason: Union[None, _str, 'types.StringFilter']
+    commit_count: Union[None, _int, 'types.IntFilter']
+    last_commit_msg: Union[None, _str, 'types.StringFilter']
+    last_commit_date: Union[None, datetime.datetime, 'types.DateTimeFilter']
+    judgment: 'JudgmentRelationFilter'
+
+    # should be noted that AND and NOT should be Union['SuspectWhereInputRecursive1', List['SuspectWhereInputRecursive1']]
+    # but this causes mypy to hang :/
+    AND: List['SuspectWhereInputRecursive1']
+    OR: List['SuspectWhereInputRecursive1']
+    NOT: List['SuspectWhereInputRecursive1']
+
+
+class SuspectWhereInputRecursive1(TypedDict, total=False):
+    """Suspect arguments for searching"""
+    id: Union[_str, 'types.StringFilter']
+    judgment_id: Union[_str, 'types.StringFilter']
+    username: Union[_str, 'types.StringFilter']
+    avatar_url: Union[None, _str, 'types.StringFilter']
+    responsibility: Union[_int, 'types.IntFilter']
+    reason: Union[None, _str, 'types.StringFilter']
+    commit_count: Union[None, _int, 'types.IntFilter']
+    last_commit_msg: Union[None, _str, 'types.StringFilter']
+    last_commit_date: Union[None, datetime.datetime, 'types.DateTimeFilter']
+    judgment: 'JudgmentRelationFilter'
+
+    # should be noted that AND and NOT should be Union['SuspectWhereInputRecursive2', List['SuspectWhereInputRecursive2']]
+    # but this causes mypy to hang :/
+    AND: List['SuspectWhereInputRecursive2']
+    OR: List['SuspectWhereInputRecursive2']
+    NOT: List['SuspectWhereInputRecursive2']
+
+
+class SuspectWhereInputRecursive2(TypedDict, total=False):
+    """Suspect arguments for searching"""
+    id: Union[_str, 'types.StringFilter']
+    judgment_id: Union[_str, 'types.StringFilter']
+    username: Union[_str, 'types.StringFilter']
+    avatar_url: Union[None, _str, 'types.StringFilter']
+    responsibility: Union[_int, 'types.IntFilter']
+    reason: Union[None, _str, 'types.StringFilter']
+    commit_count: Union[None, _int, 'types.IntFilter']
+    last_commit_msg: Union[None, _str, 'types.StringFilter']
+    last_commit_date: Union[None, datetime.datetime, 'types.DateTimeFilter']
+    judgment: 'JudgmentRelationFilter'
+
+    # should be noted that AND and NOT should be Union['SuspectWhereInputRecursive3', List['SuspectWhereInputRecursive3']]
+    # but this causes mypy to hang :/
+    AND: List['SuspectWhereInputRecursive3']
+    OR: List['SuspectWhereInputRecursive3']
+    NOT: List['SuspectWhereInputRecursive3']
+
+
+class SuspectWhereInputRecursive3(TypedDict, total=False):
+    """Suspect arguments for searching"""
+    id: Union[_str, 'types.StringFilter']
+    judgment_id: Union[_str, 'types.StringFilter']
+    username: Union[_str, 'types.StringFilter']
+    avatar_url: Union[None, _str, 'types.StringFilter']
+    responsibility: Union[_int, 'types.IntFilter']
+    reason: Union[None, _str, 'types.StringFilter']
+    commit_count: Union[None, _int, 'types.IntFilter']
+    last_commit_msg: Union[None, _str, 'types.StringFilter']
+    last_commit_date: Union[None, datetime.datetime, 'types.DateTimeFilter']
+    judgment: 'JudgmentRelationFilter'
+
+    # should be noted that AND and NOT should be Union['SuspectWhereInputRecursive4', List['SuspectWhereInputRecursive4']]
+    # but this causes mypy to hang :/
+    AND: List['SuspectWhereInputRecursive4']
+    OR: List['SuspectWhereInputRecursive4']
+    NOT: List['SuspectWhereInputRecursive4']
+
+
+class SuspectWhereInputRecursive4(TypedDict, total=False):
+    """Suspect arguments for searching"""
+    id: Union[_str, 'types.StringFilter']
+    judgment_id: Union[_str, 'types.StringFilter']
+    username: Union[_str, 'types.StringFilter']
+    avatar_url: Union[None, _str, 'types.StringFilter']
+    responsibility: Union[_int, 'types.IntFilter']
+    reason: Union[None, _str, 'types.StringFilter']
+    commit_count: Union[None, _int, 'types.IntFilter']
+    last_commit_msg: Union[None, _str, 'types.StringFilter']
+    last_commit_date: Union[None, datetime.datetime, 'types.DateTimeFilter']
+    judgment: 'JudgmentRelationFilter'
+
+
+
+# aggregate Suspect types
+
+
+    
+
+class SuspectScalarWhereWithAggregatesInput(TypedDict, total=False):
+    """Suspect arguments for searching"""
+    id: Union[_str, 'types.StringWithAggregatesFilter']
+    judgment_id: Union[_str, 'types.StringWithAggregatesFilter']
+    username: Union[_str, 'types.StringWithAggregatesFilter']
+    avatar_url: Union[_str, 'types.StringWithAggregatesFilter']
+    responsibility: Union[_int, 'types.IntWithAggregatesFilter']
+    reason: Union[_str, 'types.StringWithAggregatesFilter']
+    commit_count: Union[_int, 'types.IntWithAggregatesFilter']
+    last_commit_msg: Union[_str, 'types.StringWithAggregatesFilter']
+    last_commit_date: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+
+    AND: List['SuspectScalarWhereWithAggregatesInputRecursive1']
+    OR: List['SuspectScalarWhereWithAggregatesInputRecursive1']
+    NOT: List['SuspectScalarWhereWithAggregatesInputRecursive1']
+
+
+class SuspectScalarWhereWithAggregatesInputRecursive1(TypedDict, total=False):
+    """Suspect arguments for searching"""
+    id: Union[_str, 'types.StringWithAggregatesFilter']
+    judgment_id: Union[_str, 'types.StringWithAggregatesFilter']
+    username: Union[_str, 'types.StringWithAggregatesFilter']
+    avatar_url: Union[_str, 'types.StringWithAggregatesFilter']
+    responsibility: Union[_int, 'types.IntWithAggregatesFilter']
+    reason: Union[_str, 'types.StringWithAggregatesFilter']
+    commit_count: Union[_int, 'types.IntWithAggregatesFilter']
+    last_commit_msg: Union[_str, 'types.StringWithAggregatesFilter']
+    last_commit_date: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+
+    AND: List['SuspectScalarWhereWithAggregatesInputRecursive2']
+    OR: List['SuspectScalarWhereWithAggregatesInputRecursive2']
+    NOT: List['SuspectScalarWhereWithAggregatesInputRecursive2']
+
+
+class SuspectScalarWhereWithAggregatesInputRecursive2(TypedDict, total=False):
+    """Suspect arguments for searching"""
+    id: Union[_str, 'types.StringWithAggregatesFilter']
+    judgment_id: Union[_str, 'types.StringWithAggregatesFilter']
+    username: Union[_str, 'types.StringWithAggregatesFilter']
+    avatar_url: Union[_str, 'types.StringWithAggregatesFilter']
+    responsibility: Union[_int, 'types.IntWithAggregatesFilter']
+    reason: Union[_str, 'types.StringWithAggregatesFilter']
+    commit_count: Union[_int, 'types.IntWithAggregatesFilter']
+    last_commit_msg: Union[_str, 'types.StringWithAggregatesFilter']
+    last_commit_date: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+
+    AND: List['SuspectScalarWhereWithAggregatesInputRecursive3']
+    OR: List['SuspectScalarWhereWithAggregatesInputRecursive3']
+    NOT: List['SuspectScalarWhereWithAggregatesInputRecursive3']
+
+
+class SuspectScalarWhereWithAggregatesInputRecursive3(TypedDict, total=False):
+    """Suspect arguments for searching"""
+    id: Union[_str, 'types.StringWithAggregatesFilter']
+    judgment_id: Union[_str, 'types.StringWithAggregatesFilter']
+    username: Union[_str, 'types.StringWithAggregatesFilter']
+    avatar_url: Union[_str, 'types.StringWithAggregatesFilter']
+    responsibility: Union[_int, 'types.IntWithAggregatesFilter']
+    reason: Union[_str, 'types.StringWithAggregatesFilter']
+    commit_count: Union[_int, 'types.IntWithAggregatesFilter']
+    last_commit_msg: Union[_str, 'types.StringWithAggregatesFilter']
+    last_commit_date: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+
+    AND: List['SuspectScalarWhereWithAggregatesInputRecursive4']
+    OR: List['SuspectScalarWhereWithAggregatesInputRecursive4']
+    NOT: List['SuspectScalarWhereWithAggregatesInputRecursive4']
+
+
+class SuspectScalarWhereWithAggregatesInputRecursive4(TypedDict, total=False):
+    """Suspect arguments for searching"""
+    id: Union[_str, 'types.StringWithAggregatesFilter']
+    judgment_id: Union[_str, 'types.StringWithAggregatesFilter']
+    username: Union[_str, 'types.StringWithAggregatesFilter']
+    avatar_url: Union[_str, 'types.StringWithAggregatesFilter']
+    responsibility: Union[_int, 'types.IntWithAggregatesFilter']
+    reason: Union[_str, 'types.StringWithAggregatesFilter']
+    commit_count: Union[_int, 'types.IntWithAggregatesFilter']
+    last_commit_msg: Union[_str, 'types.StringWithAggregatesFilter']
+    last_commit_date: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+
+
+
+class SuspectGroupByOutput(TypedDict, total=False):
+    id: _str
+    judgment_id: _str
+    username: _str
+    avatar_url: _str
+    responsibility: _int
+    reason: _str
+    commit_count: _int
+    last_commit_msg: _str
+    last_commit_date: datetime.datetime
+    _sum: 'SuspectSumAggregateOutput'
+    _avg: 'SuspectAvgAggregateOutput'
+    _min: 'SuspectMinAggregateOutput'
+    _max: 'SuspectMaxAggregateOutput'
+    _count: 'SuspectCountAggregateOutput'
+
+
+class SuspectAvgAggregateOutput(TypedDict, total=False):
+    """Suspect output for aggregating averages"""
+    responsibility: float
+    commit_count: float
+
+
+class SuspectSumAggregateOutput(TypedDict, total=False):
+    """Suspect output for aggregating sums"""
+    responsibility: _int
+    commit_count: _int
+
+
+class SuspectScalarAggregateOutput(TypedDict, total=False):
+    """Suspect output including scalar fields"""
+    id: _str
+    judgment_id: _str
+    username: _str
+    avatar_url: _str
+    responsibility: _int
+    reason: _str
+    commit_count: _int
+    last_commit_msg: _str
+    last_commit_date: datetime.datetime
+
+
+SuspectMinAggregateOutput = SuspectScalarAggregateOutput
+SuspectMaxAggregateOutput = SuspectScalarAggregateOutput
+
+
+class SuspectMaxAggregateInput(TypedDict, total=False):
+    """Suspect input for aggregating by max"""
+    id: bool
+    judgment_id: bool
+    username: bool
+    avatar_url: bool
+    responsibility: bool
+    reason: bool
+    commit_count: bool
+    last_commit_msg: bool
+    last_commit_date: bool
+
+
+class SuspectMinAggregateInput(TypedDict, total=False):
+    """Suspect input for aggregating by min"""
+    id: bool
+    judgment_id: bool
+    username: bool
+    avatar_url: bool
+    responsibility: bool
+    reason: bool
+    commit_count: bool
+    last_commit_msg: bool
+    last_commit_date: bool
+
+
+class SuspectNumberAggregateInput(TypedDict, total=False):
+    """Suspect input for aggregating numbers"""
+    responsibility: bool
+    commit_count: bool
+
+
+SuspectAvgAggregateInput = SuspectNumberAggregateInput
+SuspectSumAggregateInput = SuspectNumberAggregateInput
+
+
+SuspectCountAggregateInput = TypedDict(
+    'SuspectCountAggregateInput',
+    {
+        'id': bool,
+        'judgment_id': bool,
+        'username': bool,
+        'avatar_url': bool,
+        'responsibility': bool,
+        'reason': bool,
+        'commit_count': bool,
+        'last_commit_msg': bool,
+        'last_commit_date': bool,
+        '_all': bool,
+    },
+    total=False,
+)
+
+SuspectCountAggregateOutput = TypedDict(
+    'SuspectCountAggregateOutput',
+    {
+        'id': int,
+        'judgment_id': int,
+        'username': int,
+        'avatar_url': int,
+        'responsibility': int,
+        'reason': int,
+        'commit_count': int,
+        'last_commit_msg': int,
+        'last_commit_date': int,
+        '_all': int,
+    },
+    total=False,
+)
+
+
+SuspectKeys = Literal[
+    'id',
+    'judgment_id',
+    'username',
+    'avatar_url',
+    'responsibility',
+    'reason',
+    'commit_count',
+    'last_commit_msg',
+    'last_commit_date',
+    'judgment',
+]
+SuspectScalarFieldKeys = Literal[
+    'id',
+    'judgment_id',
+    'username',
+    'avatar_url',
+    'responsibility',
+    'reason',
+    'commit_count',
+    'last_commit_msg',
+    'last_commit_date',
+]
+SuspectScalarFieldKeysT = TypeVar('SuspectScalarFieldKeysT', bound=SuspectScalarFieldKeys)
+
+SuspectRelationalFieldKeys = Literal[
+        'judgment',
+    ]
+
+# Blame types
+
+class BlameOptionalCreateInput(TypedDict, total=False):
+    """Optional arguments to the Blame create method"""
+    id: _str
+    judgment_id: _str
+    target_avatar: Optional[_str]
+    reason: Optional[_str]
+    message: Optional['fields.Json']
+    intensity: _str
+    image_url: Optional[_str]
+    created_at: datetime.datetime
+    judgment: 'JudgmentCreateNestedWithoutRelationsInput'
+
+
+class BlameCreateInput(BlameOptionalCreateInput):
+    """Required arguments to the Blame create method"""
+    target_username: _str
+    responsibility: _int
+
+
+# TODO: remove this in favour of without explicit relations
+# e.g. PostCreateWithoutAuthorInput
+
+class BlameOptionalCreateWithoutRelationsInput(TypedDict, total=False):
+    """Optional arguments to the Blame create method, without relations"""
+    id: _str
+    judgment_id: _str
+    target_avatar: Optional[_str]
+    reason: Optional[_str]
+    message: Optional['fields.Json']
+    intensity: _str
+    image_url: Optional[_str]
+    created_at: datetime.datetime
+
+
+class BlameCreateWithoutRelationsInput(BlameOptionalCreateWithoutRelationsInput):
+    """Required arguments to the Blame create method, without relations"""
+    target_username: _str
+    responsibility: _int
+
+
+class BlameCreateNestedWithoutRelationsInput(TypedDict, total=False):
+    create: 'BlameCreateWithoutRelationsInput'
+    connect: 'BlameWhereUniqueInput'
+
+
+class BlameCreateManyNestedWithoutRelationsInput(TypedDict, total=False):
+    create: Union['BlameCreateWithoutRelationsInput', List['BlameCreateWithoutRelationsInput']]
+    connect: Union['BlameWhereUniqueInput', List['BlameWhereUniqueInput']]
+
+
+_BlameWhereUnique_id_Input = TypedDict(
+    '_BlameWhereUnique_id_Input',
+    {
+        'id': '_str',
+    },
+    total=True
+)
+
+_BlameWhereUnique_judgment_id_Input = TypedDict(
+    '_BlameWhereUnique_judgment_id_Input',
+    {
+        'judgment_id': '_str',
+    },
+    total=True
+)
+
+BlameWhereUniqueInput = Union[
+    '_BlameWhereUnique_id_Input',
+    '_BlameWhereUnique_judgment_id_Input',
+]
+
+
+class BlameUpdateInput(TypedDict, total=False):
+    """Optional arguments for updating a record"""
+    id: _str
+    target_username: _str
+    target_avatar: Optional[_str]
+    responsibility: Union[AtomicIntInput, _int]
+    reason: Optional[_str]
+    message: Optional['fields.Json']
+    intensity: _str
+    image_url: Optional[_str]
+    created_at: datetime.datetime
+    judgment: 'JudgmentUpdateOneWithoutRelationsInput'
+
+
+class BlameUpdateManyMutationInput(TypedDict, total=False):
+    """Arguments for updating many records"""
+    id: _str
+    target_username: _str
+    target_avatar: Optional[_str]
+    responsibility: Union[AtomicIntInput, _int]
+    reason: Optional[_str]
+    message: Optional['fields.Json']
+    intensity: _str
+    image_url: Optional[_str]
+    created_at: datetime.datetime
+
+
+class BlameUpdateManyWithoutRelationsInput(TypedDict, total=False):
+    create: List['BlameCreateWithoutRelationsInput']
+    connect: List['BlameWhereUniqueInput']
+    set: List['BlameWhereUniqueInput']
+    disconnect: List['BlameWhereUniqueInput']
+    delete: List['BlameWhereUniqueInput']
+
+    # TODO
+    # update: List['BlameUpdateWithWhereUniqueWithoutRelationsInput']
+    # updateMany: List['BlameUpdateManyWithWhereUniqueWithoutRelationsInput']
+    # deleteMany: List['BlameScalarWhereInput']
+    # upsert: List['BlameUpserteWithWhereUniqueWithoutRelationsInput']
+    # connectOrCreate: List['BlameCreateOrConnectWithoutRelationsInput']
+
+
+class BlameUpdateOneWithoutRelationsInput(TypedDict, total=False):
+    create: 'BlameCreateWithoutRelationsInput'
+    connect: 'BlameWhereUniqueInput'
+    disconnect: bool
+    delete: bool
+
+    # TODO
+    # update: 'BlameUpdateInput'
+    # upsert: 'BlameUpsertWithoutRelationsInput'
+    # connectOrCreate: 'BlameCreateOrConnectWithoutRelationsInput'
+
+
+class BlameUpsertInput(TypedDict):
+    create: 'BlameCreateInput'
+    update: 'BlameUpdateInput'  # pyright: ignore[reportIncompatibleMethodOverride]
+
+
+_Blame_id_OrderByInput = TypedDict(
+    '_Blame_id_OrderByInput',
+    {
+        'id': 'SortOrder',
+    },
+    total=True
+)
+
+_Blame_judgment_id_OrderByInput = TypedDict(
+    '_Blame_judgment_id_OrderByInput',
+    {
+        'judgment_id': 'SortOrder',
+    },
+    total=True
+)
+
+_Blame_target_username_OrderByInput = TypedDict(
+    '_Blame_target_username_OrderByInput',
+    {
+        'target_username': 'SortOrder',
+    },
+    total=True
+)
+
+_Blame_target_avatar_OrderByInput = TypedDict(
+    '_Blame_target_avatar_OrderByInput',
+    {
+        'target_avatar': 'SortOrder',
+    },
+    total=True
+)
+
+_Blame_responsibility_OrderByInput = TypedDict(
+    '_Blame_responsibility_OrderByInput',
+    {
+        'responsibility': 'SortOrder',
+    },
+    total=True
+)
+
+_Blame_reason_OrderByInput = TypedDict(
+    '_Blame_reason_OrderByInput',
+    {
+        'reason': 'SortOrder',
+    },
+    total=True
+)
+
+_Blame_message_OrderByInput = TypedDict(
+    '_Blame_message_OrderByInput',
+    {
+        'message': 'SortOrder',
+    },
+    total=True
+)
+
+_Blame_intensity_OrderByInput = TypedDict(
+    '_Blame_intensity_OrderByInput',
+    {
+        'intensity': 'SortOrder',
+    },
+    total=True
+)
+
+_Blame_image_url_OrderByInput = TypedDict(
+    '_Blame_image_url_OrderByInput',
+    {
+        'image_url': 'SortOrder',
+    },
+    total=True
+)
+
+_Blame_created_at_OrderByInput = TypedDict(
+    '_Blame_created_at_OrderByInput',
+    {
+        'created_at': 'SortOrder',
+    },
+    total=True
+)
+
+BlameOrderByInput = Union[
+    '_Blame_id_OrderByInput',
+    '_Blame_judgment_id_OrderByInput',
+    '_Blame_target_username_OrderByInput',
+    '_Blame_target_avatar_OrderByInput',
+    '_Blame_responsibility_OrderByInput',
+    '_Blame_reason_OrderByInput',
+    '_Blame_message_OrderByInput',
+    '_Blame_intensity_OrderByInput',
+    '_Blame_image_url_OrderByInput',
+    '_Blame_created_at_OrderByInput',
+]
+
+
+
+# recursive Blame types
+# TODO: cleanup these types
+
+
+# Dict[str, Any] is a mypy limitation
+# see https://github.com/RobertCraigie/prisma-client-py/issues/45
+# switch to pyright for improved types, see https://prisma-client-py.readthedocs.io/en/stable/reference/limitations/
+
+BlameRelationFilter = TypedDict(
+    'BlameRelationFilter',
+    {
+        'is': 'Dict[str, Any]',
+        'is_not': 'Dict[str, Any]',
+    },
+    total=False,
+)
+
+
+class BlameListRelationFilter(TypedDict, total=False):
+    some: 'Dict[str, Any]'
+    none: 'Dict[str, Any]'
+    every: 'Dict[str, Any]'
+
+
+class BlameInclude(TypedDict, total=False):
+    """Blame relational arguments"""
+    judgment: Union[bool, 'JudgmentArgsFromBlame']
+
+
+    
+
+class UserIncludeFromBlame(TypedDict, total=False):
+    """Relational arguments for Blame"""
+    judgments: Union[bool, 'FindManyJudgmentArgsFromBlameRecursive1']
+
+
+class UserIncludeFromBlameRecursive1(TypedDict, total=False):
+    """Relational arguments for Blame"""
+    judgments: Union[bool, 'FindManyJudgmentArgsFromBlameRecursive2']
+
+
+class UserIncludeFromBlameRecursive2(TypedDict, total=False):
+    """Relational arguments for Blame"""
+    judgments: Union[bool, 'FindManyJudgmentArgsFromBlameRecursive3']
+
+
+class UserIncludeFromBlameRecursive3(TypedDict, total=False):
+    """Relational arguments for Blame"""
+    judgments: Union[bool, 'FindManyJudgmentArgsFromBlameRecursive4']
+
+
+class UserIncludeFromBlameRecursive4(TypedDict, total=False):
+    """Relational arguments for Blame"""
+
+    
+
+class UserArgsFromBlame(TypedDict, total=False):
+    """Arguments for Blame"""
+    select: List['UserScalarFieldKeys']
+    include: 'UserIncludeFromUserRecursive1'
+
+
+class UserArgsFromBlameRecursive1(TypedDict, total=False):
+    """Arguments for Blame"""
+    select: List['UserScalarFieldKeys']
+    include: 'UserIncludeFromUserRecursive2'
+
+
+class UserArgsFromBlameRecursive2(TypedDict, total=False):
+    """Arguments for Blame"""
+    select: List['UserScalarFieldKeys']
+    include: 'UserIncludeFromUserRecursive3'
+
+
+class UserArgsFromBlameRecursive3(TypedDict, total=False):
+    """Arguments for Blame"""
+    select: List['UserScalarFieldKeys']
+    include: 'UserIncludeFromUserRecursive4'
+
+
+class UserArgsFromBlameRecursive4(TypedDict, total=False):
+    """Arguments for Blame"""
+    select: List['UserScalarFieldKeys']
+    
+    
+
+class FindManyUserArgsFromBlame(TypedDict, total=False):
+    """Arguments for Blame"""
+    take: int
+    skip: int
+    order_by: Union['UserOrderByInput', List['UserOrderByInput']]
+    where: 'UserWhereInput'
+    cursor: 'UserWhereUniqueInput'
+    distinct: List['UserScalarFieldKeys']
+    select: List['UserScalarFieldKeys']
+    include: 'UserIncludeFromUserRecursive1'
+
+
+class FindManyUserArgsFromBlameRecursive1(TypedDict, total=False):
+    """Arguments for Blame"""
+    take: int
+    skip: int
+    order_by: Union['UserOrderByInput', List['UserOrderByInput']]
+    where: 'UserWhereInput'
+    cursor: 'UserWhereUniqueInput'
+    distinct: List['UserScalarFieldKeys']
+    select: List['UserScalarFieldKeys']
+    include: 'UserIncludeFromUserRecursive2'
+
+
+class FindManyUserArgsFromBlameRecursive2(TypedDict, total=False):
+    """Arguments for Blame"""
+    take: int
+    skip: int
+    order_by: Union['UserOrderByInput', List['UserOrderByInput']]
+    where: 'UserWhereInput'
+    cursor: 'UserWhereUniqueInput'
+    distinct: List['UserScalarFieldKeys']
+    select: List['UserScalarFieldKeys']
+    include: 'UserIncludeFromUserRecursive3'
+
+
+class FindManyUserArgsFromBlameRecursive3(TypedDict, total=False):
+    """Arguments for Blame"""
+    take: int
+    skip: int
+    order_by: Union['UserOrderByInput', List['UserOrderByInput']]
+    where: 'UserWhereInput'
+    cursor: 'UserWhereUniqueInput'
+    distinct: List['UserScalarFieldKeys']
+    select: List['UserScalarFieldKeys']
+    include: 'UserIncludeFromUserRecursive4'
+
+
+class FindManyUserArgsFromBlameRecursive4(TypedDict, total=False):
+    """Arguments for Blame"""
+    take: int
+    skip: int
+    order_by: Union['UserOrderByInput', List['UserOrderByInput']]
+    where: 'UserWhereInput'
+    cursor: 'UserWhereUniqueInput'
+    distinct: List['UserScalarFieldKeys']
+    select: List['UserScalarFieldKeys']
+    
+    
+
+class JudgmentIncludeFromBlame(TypedDict, total=False):
+    """Relational arguments for Blame"""
+    user: Union[bool, 'UserArgsFromBlameRecursive1']
+    suspects: Union[bool, 'FindManySuspectArgsFromBlameRecursive1']
+    blame: Union[bool, 'BlameArgsFromBlameRecursive1']
+    jobs: Union[bool, 'FindManyAnalysisJobArgsFromBlameRecursive1']
+
+
+class JudgmentIncludeFromBlameRecursive1(TypedDict, total=False):
+    """Relational arguments for Blame"""
+    user: Union[bool, 'UserArgsFromBlameRecursive2']
+    suspects: Union[bool, 'FindManySuspectArgsFromBlameRecursive2']
+    blame: Union[bool, 'BlameArgsFromBlameRecursive2']
+    jobs: Union[bool, 'FindManyAnalysisJobArgsFromBlameRecursive2']
+
+
+class JudgmentIncludeFromBlameRecursive2(TypedDict, total=False):
+    """Relational arguments for Blame"""
+    user: Union[bool, 'UserArgsFromBlameRecursive3']
+    suspects: Union[bool, 'FindManySuspectArgsFromBlameRecursive3']
+    blame: Union[bool, 'BlameArgsFromBlameRecursive3']
+    jobs: Union[bool, 'FindManyAnalysisJobArgsFromBlameRecursive3']
+
+
+class JudgmentIncludeFromBlameRecursive3(TypedDict, total=False):
+    """Relational arguments for Blame"""
+    user: Union[bool, 'UserArgsFromBlameRecursive4']
+    suspects: Union[bool, 'FindManySuspectArgsFromBlameRecursive4']
+    blame: Union[bool, 'BlameArgsFromBlameRecursive4']
+    jobs: Union[bool, 'FindManyAnalysisJobArgsFromBlameRecursive4']
+
+
+class JudgmentIncludeFromBlameRecursive4(TypedDict, total=False):
+    """Relational arguments for Blame"""
+
+    
+
+class JudgmentArgsFromBlame(TypedDict, total=False):
+    """Arguments for Blame"""
+    select: List['JudgmentScalarFieldKeys']
+    include: 'JudgmentIncludeFromJudgmentRecursive1'
+
+
+class JudgmentArgsFromBlameRecursive1(TypedDict, total=False):
+    """Arguments for Blame"""
+    select: List['JudgmentScalarFieldKeys']
+    include: 'JudgmentIncludeFromJudgmentRecursive2'
+
+
+class JudgmentArgsFromBlameRecursive2(TypedDict, total=False):
+    """Arguments for Blame"""
+    select: List['JudgmentScalarFieldKeys']
+    include: 'JudgmentIncludeFromJudgmentRecursive3'
+
+
+class JudgmentArgsFromBlameRecursive3(TypedDict, total=False):
+    """Arguments for Blame"""
+    select: List['JudgmentScalarFieldKeys']
+    include: 'JudgmentIncludeFromJudgmentRecursive4'
+
+
+class JudgmentArgsFromBlameRecursive4(TypedDict, total=False):
+    """Arguments for Blame"""
+    select: List['JudgmentScalarFieldKeys']
+    
+    
+
+class FindManyJudgmentArgsFromBlame(TypedDict, total=False):
+    """Arguments for Blame"""
+    take: int
+    skip: int
+    order_by: Union['JudgmentOrderByInput', List['JudgmentOrderByInput']]
+    where: 'JudgmentWhereInput'
+    cursor: 'JudgmentWhereUniqueInput'
+    distinct: List['JudgmentScalarFieldKeys']
+    select: List['JudgmentScalarFieldKeys']
+    include: 'JudgmentIncludeFromJudgmentRecursive1'
+
+
+class FindManyJudgmentArgsFromBlameRecursive1(TypedDict, total=False):
+    """Arguments for Blame"""
+    take: int
+    skip: int
+    order_by: Union['JudgmentOrderByInput', List['JudgmentOrderByInput']]
+    where: 'JudgmentWhereInput'
+    cursor: 'JudgmentWhereUniqueInput'
+    distinct: List['JudgmentScalarFieldKeys']
+    select: List['JudgmentScalarFieldKeys']
+    include: 'JudgmentIncludeFromJudgmentRecursive2'
+
+
+class FindManyJudgmentArgsFromBlameRecursive2(TypedDict, total=False):
+    """Arguments for Blame"""
+    take: int
+    skip: int
+    order_by: Union['JudgmentOrderByInput', List['JudgmentOrderByInput']]
+    where: 'JudgmentWhereInput'
+    cursor: 'JudgmentWhereUniqueInput'
+    distinct: List['JudgmentScalarFieldKeys']
+    select: List['JudgmentScalarFieldKeys']
+    include: 'JudgmentIncludeFromJudgmentRecursive3'
+
+
+class FindManyJudgmentArgsFromBlameRecursive3(TypedDict, total=False):
+    """Arguments for Blame"""
+    take: int
+    skip: int
+    order_by: Union['JudgmentOrderByInput', List['JudgmentOrderByInput']]
+    where: 'JudgmentWhereInput'
+    cursor: 'JudgmentWhereUniqueInput'
+    distinct: List['JudgmentScalarFieldKeys']
+    select: List['JudgmentScalarFieldKeys']
+    include: 'JudgmentIncludeFromJudgmentRecursive4'
+
+
+class FindManyJudgmentArgsFromBlameRecursive4(TypedDict, total=False):
+    """Arguments for Blame"""
+    take: int
+    skip: int
+    order_by: Union['JudgmentOrderByInput', List['JudgmentOrderByInput']]
+    where: 'JudgmentWhereInput'
+    cursor: 'JudgmentWhereUniqueInput'
+    distinct: List['JudgmentScalarFieldKeys']
+    select: List['JudgmentScalarFieldKeys']
+    
+    
+
+class SuspectIncludeFromBlame(TypedDict, total=False):
+    """Relational arguments for Blame"""
+    judgment: Union[bool, 'JudgmentArgsFromBlameRecursive1']
+
+
+class SuspectIncludeFromBlameRecursive1(TypedDict, total=False):
+    """Relational arguments for Blame"""
+    judgment: Union[bool, 'JudgmentArgsFromBlameRecursive2']
+
+
+class SuspectIncludeFromBlameRecursive2(TypedDict, total=False):
+    """Relational arguments for Blame"""
+    judgment: Union[bool, 'JudgmentArgsFromBlameRecursive3']
+
+
+class SuspectIncludeFromBlameRecursive3(TypedDict, total=False):
+    """Relational arguments for Blame"""
+    judgment: Union[bool, 'JudgmentArgsFromBlameRecursive4']
+
+
+class SuspectIncludeFromBlameRecursive4(TypedDict, total=False):
+    """Relational arguments for Blame"""
+
+    
+
+class SuspectArgsFromBlame(TypedDict, total=False):
+    """Arguments for Blame"""
+    select: List['SuspectScalarFieldKeys']
+    include: 'SuspectIncludeFromSuspectRecursive1'
+
+
+class SuspectArgsFromBlameRecursive1(TypedDict, total=False):
+    """Arguments for Blame"""
+    select: List['SuspectScalarFieldKeys']
+    include: 'SuspectIncludeFromSuspectRecursive2'
+
+
+class SuspectArgsFromBlameRecursive2(TypedDict, total=False):
+    """Arguments for Blame"""
+    select: List['SuspectScalarFieldKeys']
+    include: 'SuspectIncludeFromSuspectRecursive3'
+
+
+class SuspectArgsFromBlameRecursive3(TypedDict, total=False):
+    """Arguments for Blame"""
+    select: List['SuspectScalarFieldKeys']
+    include: 'SuspectIncludeFromSuspectRecursive4'
+
+
+class SuspectArgsFromBlameRecursive4(TypedDict, total=False):
+    """Arguments for Blame"""
+    select: List['SuspectScalarFieldKeys']
+    
+    
+
+class FindManySuspectArgsFromBlame(TypedDict, total=False):
+    """Arguments for Blame"""
+    take: int
+    skip: int
+    order_by: Union['SuspectOrderByInput', List['SuspectOrderByInput']]
+    where: 'SuspectWhereInput'
+    cursor: 'SuspectWhereUniqueInput'
+    distinct: List['SuspectScalarFieldKeys']
+    select: List['SuspectScalarFieldKeys']
+    include: 'SuspectIncludeFromSuspectRecursive1'
+
+
+class FindManySuspectArgsFromBlameRecursive1(TypedDict, total=False):
+    """Arguments for Blame"""
+    take: int
+    skip: int
+    order_by: Union['SuspectOrderByInput', List['SuspectOrderByInput']]
+    where: 'SuspectWhereInput'
+    cursor: 'SuspectWhereUniqueInput'
+    distinct: List['SuspectScalarFieldKeys']
+    select: List['SuspectScalarFieldKeys']
+    include: 'SuspectIncludeFromSuspectRecursive2'
+
+
+class FindManySuspectArgsFromBlameRecursive2(TypedDict, total=False):
+    """Arguments for Blame"""
+    take: int
+    skip: int
+    order_by: Union['SuspectOrderByInput', List['SuspectOrderByInput']]
+    where: 'SuspectWhereInput'
+    cursor: 'SuspectWhereUniqueInput'
+    distinct: List['SuspectScalarFieldKeys']
+    select: List['SuspectScalarFieldKeys']
+    include: 'SuspectIncludeFromSuspectRecursive3'
+
+
+class FindManySuspectArgsFromBlameRecursive3(TypedDict, total=False):
+    """Arguments for Blame"""
+    take: int
+    skip: int
+    order_by: Union['SuspectOrderByInput', List['SuspectOrderByInput']]
+    where: 'SuspectWhereInput'
+    cursor: 'SuspectWhereUniqueInput'
+    distinct: List['SuspectScalarFieldKeys']
+    select: List['SuspectScalarFieldKeys']
+    include: 'SuspectIncludeFromSuspectRecursive4'
+
+
+class FindManySuspectArgsFromBlameRecursive4(TypedDict, total=False):
+    """Arguments for Blame"""
+    take: int
+    skip: int
+    order_by: Union['SuspectOrderByInput', List['SuspectOrderByInput']]
+    where: 'SuspectWhereInput'
+    cursor: 'SuspectWhereUniqueInput'
+    distinct: List['SuspectScalarFieldKeys']
+    select: List['SuspectScalarFieldKeys']
+    
+    
+
+class BlameIncludeFromBlame(TypedDict, total=False):
+    """Relational arguments for Blame"""
+    judgment: Union[bool, 'JudgmentArgsFromBlameRecursive1']
+
+
+class BlameIncludeFromBlameRecursive1(TypedDict, total=False):
+    """Relational arguments for Blame"""
+    judgment: Union[bool, 'JudgmentArgsFromBlameRecursive2']
+
+
+class BlameIncludeFromBlameRecursive2(TypedDict, total=False):
+    """Relational arguments for Blame"""
+    judgment: Union[bool, 'JudgmentArgsFromBlameRecursive3']
+
+
+class BlameIncludeFromBlameRecursive3(TypedDict, total=False):
+    """Relational arguments for Blame"""
+    judgment: Union[bool, 'JudgmentArgsFromBlameRecursive4']
+
+
+class BlameIncludeFromBlameRecursive4(TypedDict, total=False):
+    """Relational arguments for Blame"""
+
+    
+
+class BlameArgsFromBlame(TypedDict, total=False):
+    """Arguments for Blame"""
+    select: List['BlameScalarFieldKeys']
+    include: 'BlameIncludeFromBlameRecursive1'
+
+
+class BlameArgsFromBlameRecursive1(TypedDict, total=False):
+    """Arguments for Blame"""
+    select: List['BlameScalarFieldKeys']
+    include: 'BlameIncludeFromBlameRecursive2'
+
+
+class BlameArgsFromBlameRecursive2(TypedDict, total=False):
+    """Arguments for Blame"""
+    select: List['BlameScalarFieldKeys']
+    include: 'BlameIncludeFromBlameRecursive3'
+
+
+class BlameArgsFromBlameRecursive3(TypedDict, total=False):
+    """Arguments for Blame"""
+    select: List['BlameScalarFieldKeys']
+    include: 'BlameIncludeFromBlameRecursive4'
+
+
+class BlameArgsFromBlameRecursive4(TypedDict, total=False):
+    """Arguments for Blame"""
+    select: List['BlameScalarFieldKeys']
+    
+    
+
+class FindManyBlameArgsFromBlame(TypedDict, total=False):
+    """Arguments for Blame"""
+    take: int
+    skip: int
+    order_by: Union['BlameOrderByInput', List['BlameOrderByInput']]
+    where: 'BlameWhereInput'
+    cursor: 'BlameWhereUniqueInput'
+    distinct: List['BlameScalarFieldKeys']
+    select: List['BlameScalarFieldKeys']
+    include: 'BlameIncludeFromBlameRecursive1'
+
+
+class FindManyBlameArgsFromBlameRecursive1(TypedDict, total=False):
+    """Arguments for Blame"""
+    take: int
+    skip: int
+    order_by: Union['BlameOrderByInput', List['BlameOrderByInput']]
+    where: 'BlameWhereInput'
+    cursor: 'BlameWhereUniqueInput'
+    distinct: List['BlameScalarFieldKeys']
+    select: List['BlameScalarFieldKeys']
+    include: 'BlameIncludeFromBlameRecursive2'
+
+
+class FindManyBlameArgsFromBlameRecursive2(TypedDict, total=False):
+    """Arguments for Blame"""
+    take: int
+    skip: int
+    order_by: Union['BlameOrderByInput', List['BlameOrderByInput']]
+    where: 'BlameWhereInput'
+    cursor: 'BlameWhereUniqueInput'
+    distinct: List['BlameScalarFieldKeys']
+    select: List['BlameScalarFieldKeys']
+    include: 'BlameIncludeFromBlameRecursive3'
+
+
+class FindManyBlameArgsFromBlameRecursive3(TypedDict, total=False):
+    """Arguments for Blame"""
+    take: int
+    skip: int
+    order_by: Union['BlameOrderByInput', List['BlameOrderByInput']]
+    where: 'BlameWhereInput'
+    cursor: 'BlameWhereUniqueInput'
+    distinct: List['BlameScalarFieldKeys']
+    select: List['BlameScalarFieldKeys']
+    include: 'BlameIncludeFromBlameRecursive4'
+
+
+class FindManyBlameArgsFromBlameRecursive4(TypedDict, total=False):
+    """Arguments for Blame"""
+    take: int
+    skip: int
+    order_by: Union['BlameOrderByInput', List['BlameOrderByInput']]
+    where: 'BlameWhereInput'
+    cursor: 'BlameWhereUniqueInput'
+    distinct: List['BlameScalarFieldKeys']
+    select: List['BlameScalarFieldKeys']
+    
+    
+
+class AnalysisJobIncludeFromBlame(TypedDict, total=False):
+    """Relational arguments for Blame"""
+    judgment: Union[bool, 'JudgmentArgsFromBlameRecursive1']
+
+
+class AnalysisJobIncludeFromBlameRecursive1(TypedDict, total=False):
+    """Relational arguments for Blame"""
+    judgment: Union[bool, 'JudgmentArgsFromBlameRecursive2']
+
+
+class AnalysisJobIncludeFromBlameRecursive2(TypedDict, total=False):
+    """Relational arguments for Blame"""
+    judgment: Union[bool, 'JudgmentArgsFromBlameRecursive3']
+
+
+class AnalysisJobIncludeFromBlameRecursive3(TypedDict, total=False):
+    """Relational arguments for Blame"""
+    judgment: Union[bool, 'JudgmentArgsFromBlameRecursive4']
+
+
+class AnalysisJobIncludeFromBlameRecursive4(TypedDict, total=False):
+    """Relational arguments for Blame"""
+
+    
+
+class AnalysisJobArgsFromBlame(TypedDict, total=False):
+    """Arguments for Blame"""
+    select: List['AnalysisJobScalarFieldKeys']
+    include: 'AnalysisJobIncludeFromAnalysisJobRecursive1'
+
+
+class AnalysisJobArgsFromBlameRecursive1(TypedDict, total=False):
+    """Arguments for Blame"""
+    select: List['AnalysisJobScalarFieldKeys']
+    include: 'AnalysisJobIncludeFromAnalysisJobRecursive2'
+
+
+class AnalysisJobArgsFromBlameRecursive2(TypedDict, total=False):
+    """Arguments for Blame"""
+    select: List['AnalysisJobScalarFieldKeys']
+    include: 'AnalysisJobIncludeFromAnalysisJobRecursive3'
+
+
+class AnalysisJobArgsFromBlameRecursive3(TypedDict, total=False):
+    """Arguments for Blame"""
+    select: List['AnalysisJobScalarFieldKeys']
+    include: 'AnalysisJobIncludeFromAnalysisJobRecursive4'
+
+
+class AnalysisJobArgsFromBlameRecursive4(TypedDict, total=False):
+    """Arguments for Blame"""
+    select: List['AnalysisJobScalarFieldKeys']
+    
+    
+
+class FindManyAnalysisJobArgsFromBlame(TypedDict, total=False):
+    """Arguments for Blame"""
+    take: int
+    skip: int
+    order_by: Union['AnalysisJobOrderByInput', List['AnalysisJobOrderByInput']]
+    where: 'AnalysisJobWhereInput'
+    cursor: 'AnalysisJobWhereUniqueInput'
+    distinct: List['AnalysisJobScalarFieldKeys']
+    select: List['AnalysisJobScalarFieldKeys']
+    include: 'AnalysisJobIncludeFromAnalysisJobRecursive1'
+
+
+class FindManyAnalysisJobArgsFromBlameRecursive1(TypedDict, total=False):
+    """Arguments for Blame"""
+    take: int
+    skip: int
+    order_by: Union['AnalysisJobOrderByInput', List['AnalysisJobOrderByInput']]
+    where: 'AnalysisJobWhereInput'
+    cursor: 'AnalysisJobWhereUniqueInput'
+    distinct: List['AnalysisJobScalarFieldKeys']
+    select: List['AnalysisJobScalarFieldKeys']
+    include: 'AnalysisJobIncludeFromAnalysisJobRecursive2'
+
+
+class FindManyAnalysisJobArgsFromBlameRecursive2(TypedDict, total=False):
+    """Arguments for Blame"""
+    take: int
+    skip: int
+    order_by: Union['AnalysisJobOrderByInput', List['AnalysisJobOrderByInput']]
+    where: 'AnalysisJobWhereInput'
+    cursor: 'AnalysisJobWhereUniqueInput'
+    distinct: List['AnalysisJobScalarFieldKeys']
+    select: List['AnalysisJobScalarFieldKeys']
+    include: 'AnalysisJobIncludeFromAnalysisJobRecursive3'
+
+
+class FindManyAnalysisJobArgsFromBlameRecursive3(TypedDict, total=False):
+    """Arguments for Blame"""
+    take: int
+    skip: int
+    order_by: Union['AnalysisJobOrderByInput', List['AnalysisJobOrderByInput']]
+    where: 'AnalysisJobWhereInput'
+    cursor: 'AnalysisJobWhereUniqueInput'
+    distinct: List['AnalysisJobScalarFieldKeys']
+    select: List['AnalysisJobScalarFieldKeys']
+    include: 'AnalysisJobIncludeFromAnalysisJobRecursive4'
+
+
+class FindManyAnalysisJobArgsFromBlameRecursive4(TypedDict, total=False):
+    """Arguments for Blame"""
+    take: int
+    skip: int
+    order_by: Union['AnalysisJobOrderByInput', List['AnalysisJobOrderByInput']]
+    where: 'AnalysisJobWhereInput'
+    cursor: 'AnalysisJobWhereUniqueInput'
+    distinct: List['AnalysisJobScalarFieldKeys']
+    select: List['AnalysisJobScalarFieldKeys']
+    
+
+
+FindManyBlameArgs = FindManyBlameArgsFromBlame
+FindFirstBlameArgs = FindManyBlameArgsFromBlame
+
+
+    
+
+class BlameWhereInput(TypedDict, total=False):
+    """Blame arguments for searching"""
+    id: Union[_str, 'types.StringFilter']
+    judgment_id: Union[_str, 'types.StringFilter']
+    target_username: Union[_str, 'types.StringFilter']
+    target_avatar: Union[None, _str, 'types.StringFilter']
+    responsibility: Union[_int, 'types.IntFilter']
+    reason: Union[None, _str, 'types.StringFilter']
+    message: Union[None, 'fields.Json', 'types.JsonFilter']
+    intensity: Union[_str, 'types.StringFilter']
+    image_url: Union[None, _str, 'types.StringFilter']
+    created_at: Union[datetime.datetime, 'types.DateTimeFilter']
+    judgment: 'JudgmentRelationFilter'
+
+    # should be noted that AND and NOT should be Union['BlameWhereInputRecursive1', List['BlameWhereInputRecursive1']]
+    # but this causes mypy to hang :/
+    AND: List['BlameWhereInputRecursive1']
+    OR: List['BlameWhereInputRecursive1']
+    NOT: List['BlameWhereInputRecursive1']
+
+
+class BlameWhereInputRecursive1(TypedDict, total=False):
+    """Blame arguments for searching"""
+    id: Union[_str, 'types.StringFilter']
+    judgment_id: Union[_str, 'types.StringFilter']
+    target_username: Union[_str, 'types.StringFilter']
+    target_avatar: Union[None, _str, 'types.StringFilter']
+    responsibility: Union[_int, 'types.IntFilter']
+    reason: Union[None, _str, 'types.StringFilter']
+    message: Union[None, 'fields.Json', 'types.JsonFilter']
+    intensity: Union[_str, 'types.StringFilter']
+    image_url: Union[None, _str, 'types.StringFilter']
+    created_at: Union[datetime.datetime, 'types.DateTimeFilter']
+    judgment: 'JudgmentRelationFilter'
+
+    # should be noted that AND and NOT should be Union['BlameWhereInputRecursive2', List['BlameWhereInputRecursive2']]
+    # but this causes mypy to hang :/
+    AND: List['BlameWhereInputRecursive2']
+    OR: List['BlameWhereInputRecursive2']
+    NOT: List['BlameWhereInputRecursive2']
+
+
+class BlameWhereInputRecursive2(TypedDict, total=False):
+    """Blame arguments for searching"""
+    id: Union[_str, 'types.StringFilter']
+    judgment_id: Union[_str, 'types.StringFilter']
+    target_username: Union[_str, 'types.StringFilter']
+    target_avatar: Union[None, _str, 'types.StringFilter']
+    responsibility: Union[_int, 'types.IntFilter']
+    reason: Union[None, _str, 'types.StringFilter']
+    message: Union[None, 'fields.Json', 'types.JsonFilter']
+    intensity: Union[_str, 'types.StringFilter']
+    image_url: Union[None, _str, 'types.StringFilter']
+    created_at: Union[datetime.datetime, 'types.DateTimeFilter']
+    judgment: 'JudgmentRelationFilter'
+
+    # should be noted that AND and NOT should be Union['BlameWhereInputRecursive3', List['BlameWhereInputRecursive3']]
+    # but this causes mypy to hang :/
+    AND: List['BlameWhereInputRecursive3']
+    OR: List['BlameWhereInputRecursive3']
+    NOT: List['BlameWhereInputRecursive3']
+
+
+class BlameWhereInputRecursive3(TypedDict, total=False):
+    """Blame arguments for searching"""
+    id: Union[_str, 'types.StringFilter']
+    judgment_id: Union[_str, 'types.StringFilter']
+    target_username: Union[_str, 'types.StringFilter']
+    target_avatar: Union[None, _str, 'types.StringFilter']
+    responsibility: Union[_int, 'types.IntFilter']
+    reason: Union[None, _str, 'types.StringFilter']
+    message: Union[None, 'fields.Json', 'types.JsonFilter']
+    intensity: Union[_str, 'types.StringFilter']
+    image_url: Union[None, _str, 'types.StringFilter']
+    created_at: Union[datetime.datetime, 'types.DateTimeFilter']
+    judgment: 'JudgmentRelationFilter'
+
+    # should be noted that AND and NOT should be Union['BlameWhereInputRecursive4', List['BlameWhereInputRecursive4']]
+    # but this causes mypy to hang :/
+    AND: List['BlameWhereInputRecursive4']
+    OR: List['BlameWhereInputRecursive4']
+    NOT: List['BlameWhereInputRecursive4']
+
+
+class BlameWhereInputRecursive4(TypedDict, total=False):
+    """Blame arguments for searching"""
+    id: Union[_str, 'types.StringFilter']
+    judgment_id: Union[_str, 'types.StringFilter']
+    target_username: Union[_str, 'types.StringFilter']
+    target_avatar: Union[None, _str, 'types.StringFilter']
+    responsibility: Union[_int, 'types.IntFilter']
+    reason: Union[None, _str, 'types.StringFilter']
+    message: Union[None, 'fields.Json', 'types.JsonFilter']
+    intensity: Union[_str, 'types.StringFilter']
+    image_url: Union[None, _str, 'types.StringFilter']
+    created_at: Union[datetime.datetime, 'types.DateTimeFilter']
+    judgment: 'JudgmentRelationFilter'
+
+
+
+# aggregate Blame types
+
+
+    
+
+class BlameScalarWhereWithAggregatesInput(TypedDict, total=False):
+    """Blame arguments for searching"""
+    id: Union[_str, 'types.StringWithAggregatesFilter']
+    judgment_id: Union[_str, 'types.StringWithAggregatesFilter']
+    target_username: Union[_str, 'types.StringWithAggregatesFilter']
+    target_avatar: Union[_str, 'types.StringWithAggregatesFilter']
+    responsibility: Union[_int, 'types.IntWithAggregatesFilter']
+    reason: Union[_str, 'types.StringWithAggregatesFilter']
+    message: Union['fields.Json', 'types.JsonWithAggregatesFilter']
+    intensity: Union[_str, 'types.StringWithAggregatesFilter']
+    image_url: Union[_str, 'types.StringWithAggregatesFilter']
+    created_at: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+
+    AND: List['BlameScalarWhereWithAggregatesInputRecursive1']
+    OR: List['BlameScalarWhereWithAggregatesInputRecursive1']
+    NOT: List['BlameScalarWhereWithAggregatesInputRecursive1']
+
+
+class BlameScalarWhereWithAggregatesInputRecursive1(TypedDict, total=False):
+    """Blame arguments for searching"""
+    id: Union[_str, 'types.StringWithAggregatesFilter']
+    judgment_id: Union[_str, 'types.StringWithAggregatesFilter']
+    target_username: Union[_str, 'types.StringWithAggregatesFilter']
+    target_avatar: Union[_str, 'types.StringWithAggregatesFilter']
+    responsibility: Union[_int, 'types.IntWithAggregatesFilter']
+    reason: Union[_str, 'types.StringWithAggregatesFilter']
+    message: Union['fields.Json', 'types.JsonWithAggregatesFilter']
+    intensity: Union[_str, 'types.StringWithAggregatesFilter']
+    image_url: Union[_str, 'types.StringWithAggregatesFilter']
+    created_at: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+
+    AND: List['BlameScalarWhereWithAggregatesInputRecursive2']
+    OR: List['BlameScalarWhereWithAggregatesInputRecursive2']
+    NOT: List['BlameScalarWhereWithAggregatesInputRecursive2']
+
+
+class BlameScalarWhereWithAggregatesInputRecursive2(TypedDict, total=False):
+    """Blame arguments for searching"""
+    id: Union[_str, 'types.StringWithAggregatesFilter']
+    judgment_id: Union[_str, 'types.StringWithAggregatesFilter']
+    target_username: Union[_str, 'types.StringWithAggregatesFilter']
+    target_avatar: Union[_str, 'types.StringWithAggregatesFilter']
+    responsibility: Union[_int, 'types.IntWithAggregatesFilter']
+    reason: Union[_str, 'types.StringWithAggregatesFilter']
+    message: Union['fields.Json', 'types.JsonWithAggregatesFilter']
+    intensity: Union[_str, 'types.StringWithAggregatesFilter']
+    image_url: Union[_str, 'types.StringWithAggregatesFilter']
+    created_at: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+
+    AND: List['BlameScalarWhereWithAggregatesInputRecursive3']
+    OR: List['BlameScalarWhereWithAggregatesInputRecursive3']
+    NOT: List['BlameScalarWhereWithAggregatesInputRecursive3']
+
+
+class BlameScalarWhereWithAggregatesInputRecursive3(TypedDict, total=False):
+    """Blame arguments for searching"""
+    id: Union[_str, 'types.StringWithAggregatesFilter']
+    judgment_id: Union[_str, 'types.StringWithAggregatesFilter']
+    target_username: Union[_str, 'types.StringWithAggregatesFilter']
+    target_avatar: Union[_str, 'types.StringWithAggregatesFilter']
+    responsibility: Union[_int, 'types.IntWithAggregatesFilter']
+    reason: Union[_str, 'types.StringWithAggregatesFilter']
+    message: Union['fields.Json', 'types.JsonWithAggregatesFilter']
+    intensity: Union[_str, 'types.StringWithAggregatesFilter']
+    image_url: Union[_str, 'types.StringWithAggregatesFilter']
+    created_at: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+
+    AND: List['BlameScalarWhereWithAggregatesInputRecursive4']
+    OR: List['BlameScalarWhereWithAggregatesInputRecursive4']
+    NOT: List['BlameScalarWhereWithAggregatesInputRecursive4']
+
+
+class BlameScalarWhereWithAggregatesInputRecursive4(TypedDict, total=False):
+    """Blame arguments for searching"""
+    id: Union[_str, 'types.StringWithAggregatesFilter']
+    judgment_id: Union[_str, 'types.StringWithAggregatesFilter']
+    target_username: Union[_str, 'types.StringWithAggregatesFilter']
+    target_avatar: Union[_str, 'types.StringWithAggregatesFilter']
+    responsibility: Union[_int, 'types.IntWithAggregatesFilter']
+    reason: Union[_str, 'types.StringWithAggregatesFilter']
+    message: Union['fields.Json', 'types.JsonWithAggregatesFilter']
+    intensity: Union[_str, 'types.StringWithAggregatesFilter']
+    image_url: Union[_str, 'types.StringWithAggregatesFilter']
+    created_at: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+
+
+
+class BlameGroupByOutput(TypedDict, total=False):
+    id: _str
+    judgment_id: _str
+    target_username: _str
+    target_avatar: _str
+    responsibility: _int
+    reason: _str
+    message: 'fields.Json'
+    intensity: _str
+    image_url: _str
+    created_at: datetime.datetime
+    _sum: 'BlameSumAggregateOutput'
+    _avg: 'BlameAvgAggregateOutput'
+    _min: 'BlameMinAggregateOutput'
+    _max: 'BlameMaxAggregateOutput'
+    _count: 'BlameCountAggregateOutput'
+
+
+class BlameAvgAggregateOutput(TypedDict, total=False):
+    """Blame output for aggregating averages"""
+    responsibility: float
+
+
+class BlameSumAggregateOutput(TypedDict, total=False):
+    """Blame output for aggregating sums"""
+    responsibility: _int
+
+
+class BlameScalarAggregateOutput(TypedDict, total=False):
+    """Blame output including scalar fields"""
+    id: _str
+    judgment_id: _str
+    target_username: _str
+    target_avatar: _str
+    responsibility: _int
+    reason: _str
+    message: 'fields.Json'
+    intensity: _str
+    image_url: _str
+    created_at: datetime.datetime
+
+
+BlameMinAggregateOutput = BlameScalarAggregateOutput
+BlameMaxAggregateOutput = BlameScalarAggregateOutput
+
+
+class BlameMaxAggregateInput(TypedDict, total=False):
+    """Blame input for aggregating by max"""
+    id: bool
+    judgment_id: bool
+    target_username: bool
+    target_avatar: bool
+    responsibility: bool
+    reason: bool
+    message: bool
+    intensity: bool
+    image_url: bool
+    created_at: bool
+
+
+class BlameMinAggregateInput(TypedDict, total=False):
+    """Blame input for aggregating by min"""
+    id: bool
+    judgment_id: bool
+    target_username: bool
+    target_avatar: bool
+    responsibility: bool
+    reason: bool
+    message: bool
+    intensity: bool
+    image_url: bool
+    created_at: bool
+
+
+class BlameNumberAggregateInput(TypedDict, total=False):
+    """Blame input for aggregating numbers"""
+    responsibility: bool
+
+
+BlameAvgAggregateInput = BlameNumberAggregateInput
+BlameSumAggregateInput = BlameNumberAggregateInput
+
+
+BlameCountAggregateInput = TypedDict(
+    'BlameCountAggregateInput',
+    {
+        'id': bool,
+        'judgment_id': bool,
+        'target_username': bool,
+        'target_avatar': bool,
+        'responsibility': bool,
+        'reason': bool,
+        'message': bool,
+        'intensity': bool,
+        'image_url': bool,
+        'created_at': bool,
+        '_all': bool,
+    },
+    total=False,
+)
+
+BlameCountAggregateOutput = TypedDict(
+    'BlameCountAggregateOutput',
+    {
+        'id': int,
+        'judgment_id': int,
+        'target_username': int,
+        'target_avatar': int,
+        'responsibility': int,
+        'reason': int,
+        'message': int,
+        'intensity': int,
+        'image_url': int,
+        'created_at': int,
+        '_all': int,
+    },
+    total=False,
+)
+
+
+BlameKeys = Literal[
+    'id',
+    'judgment_id',
+    'target_username',
+    'target_avatar',
+    'responsibility',
+    'reason',
+    'message',
+    'intensity',
+    'image_url',
+    'created_at',
+    'judgment',
+]
+BlameScalarFieldKeys = Literal[
+    'id',
+    'judgment_id',
+    'target_username',
+    'target_avatar',
+    'responsibility',
+    'reason',
+    'message',
+    'intensity',
+    'image_url',
+    'created_at',
+]
+BlameScalarFieldKeysT = TypeVar('BlameScalarFieldKeysT', bound=BlameScalarFieldKeys)
+
+BlameRelationalFieldKeys = Literal[
+        'judgment',
+    ]
+
+# AnalysisJob types
+
+class AnalysisJobOptionalCreateInput(TypedDict, total=False):
+    """Optional arguments to the AnalysisJob create method"""
+    id: _str
+    judgment_id: _str
+    status: _str
+    attempts: _int
+    max_attempts: _int
+    run_at: datetime.datetime
+    locked_until: Optional[datetime.datetime]
+    last_error: Optional[_str]
+    created_at: datetime.datetime
+    updated_at: datetime.datetime
+    judgment: 'JudgmentCreateNestedWithoutRelationsInput'
+
+
+class AnalysisJobCreateInput(AnalysisJobOptionalCreateInput):
+    """Required arguments to the AnalysisJob create method"""
+    user_id: _str
+
+
+# TODO: remove this in favour of without explicit relations
+# e.g. PostCreateWithoutAuthorInput
+
+class AnalysisJobOptionalCreateWithoutRelationsInput(TypedDict, total=False):
+    """Optional arguments to the AnalysisJob create method, without relations"""
+    id: _str
+    judgment_id: _str
+    status: _str
+    attempts: _int
+    max_attempts: _int
+    run_at: datetime.datetime
+    locked_until: Optional[datetime.datetime]
+    last_error: Optional[_str]
+    created_at: datetime.datetime
+    updated_at: datetime.datetime
+
+
+class AnalysisJobCreateWithoutRelationsInput(AnalysisJobOptionalCreateWithoutRelationsInput):
+    """Required arguments to the AnalysisJob create method, without relations"""
+    user_id: _str
+
+
+class AnalysisJobCreateNestedWithoutRelationsInput(TypedDict, total=False):
+    create: 'AnalysisJobCreateWithoutRelationsInput'
+    connect: 'AnalysisJobWhereUniqueInput'
+
+
+class AnalysisJobCreateManyNestedWithoutRelationsInput(TypedDict, total=False):
+    create: Union['AnalysisJobCreateWithoutRelationsInput', List['AnalysisJobCreateWithoutRelationsInput']]
+    connect: Union['AnalysisJobWhereUniqueInput', List['AnalysisJobWhereUniqueInput']]
+
+
+_AnalysisJobWhereUnique_id_Input = TypedDict(
+    '_AnalysisJobWhereUnique_id_Input',
+    {
+        'id': '_str',
+    },
+    total=True
+)
+
+AnalysisJobWhereUniqueInput = _AnalysisJobWhereUnique_id_Input
+
+
+class AnalysisJobUpdateInput(TypedDict, total=False):
+    """Optional arguments for updating a record"""
+    id: _str
+    user_id: _str
+    status: _str
+    attempts: Union[AtomicIntInput, _int]
+    max_attempts: Union[AtomicIntInput, _int]
+    run_at: datetime.datetime
+    locked_until: Optional[datetime.datetime]
+    last_error: Optional[_str]
+    created_at: datetime.datetime
+    updated_at: datetime.datetime
+    judgment: 'JudgmentUpdateOneWithoutRelationsInput'
+
+
+class AnalysisJobUpdateManyMutationInput(TypedDict, total=False):
+    """Arguments for updating many records"""
+    id: _str
+    user_id: _str
+    status: _str
+    attempts: Union[AtomicIntInput, _int]
+    max_attempts: Union[AtomicIntInput, _int]
+    run_at: datetime.datetime
+    locked_until: Optional[datetime.datetime]
+    last_error: Optional[_str]
+    created_at: datetime.datetime
+    updated_at: datetime.datetime
+
+
+class AnalysisJobUpdateManyWithoutRelationsInput(TypedDict, total=False):
+    create: List['AnalysisJobCreateWithoutRelationsInput']
+    connect: List['AnalysisJobWhereUniqueInput']
+    set: List['AnalysisJobWhereUniqueInput']
+    disconnect: List['AnalysisJobWhereUniqueInput']
+    delete: List['AnalysisJobWhereUniqueInput']
+
+    # TODO
+    # update: List['AnalysisJobUpdateWithWhereUniqueWithoutRelationsInput']
+    # updateMany: List['AnalysisJobUpdateManyWithWhereUniqueWithoutRelationsInput']
+    # deleteMany: List['AnalysisJobScalarWhereInput']
+    # upsert: List['AnalysisJobUpserteWithWhereUniqueWithoutRelationsInput']
+    # connectOrCreate: List['AnalysisJobCreateOrConnectWithoutRelationsInput']
+
+
+class AnalysisJobUpdateOneWithoutRelationsInput(TypedDict, total=False):
+    create: 'AnalysisJobCreateWithoutRelationsInput'
+    connect: 'AnalysisJobWhereUniqueInput'
+    disconnect: bool
+    delete: bool
+
+    # TODO
+    # update: 'AnalysisJobUpdateInput'
+    # upsert: 'AnalysisJobUpsertWithoutRelationsInput'
+    # connectOrCreate: 'AnalysisJobCreateOrConnectWithoutRelationsInput'
+
+
+class AnalysisJobUpsertInput(TypedDict):
+    create: 'AnalysisJobCreateInput'
+    update: 'AnalysisJobUpdateInput'  # pyright: ignore[reportIncompatibleMethodOverride]
+
+
+_AnalysisJob_id_OrderByInput = TypedDict(
+    '_AnalysisJob_id_OrderByInput',
+    {
+        'id': 'SortOrder',
+    },
+    total=True
+)
+
+_AnalysisJob_judgment_id_OrderByInput = TypedDict(
+    '_AnalysisJob_judgment_id_OrderByInput',
+    {
+        'judgment_id': 'SortOrder',
+    },
+    total=True
+)
+
+_AnalysisJob_user_id_OrderByInput = TypedDict(
+    '_AnalysisJob_user_id_OrderByInput',
+    {
+        'user_id': 'SortOrder',
+    },
+    total=True
+)
+
+_AnalysisJob_status_OrderByInput = TypedDict(
+    '_AnalysisJob_status_OrderByInput',
+    {
+        'status': 'SortOrder',
+    },
+    total=True
+)
+
+_AnalysisJob_attempts_OrderByInput = TypedDict(
+    '_AnalysisJob_attempts_OrderByInput',
+    {
+        'attempts': 'SortOrder',
+    },
+    total=True
+)
+
+_AnalysisJob_max_attempts_OrderByInput = TypedDict(
+    '_AnalysisJob_max_attempts_OrderByInput',
+    {
+        'max_attempts': 'SortOrder',
+    },
+    total=True
+)
+
+_AnalysisJob_run_at_OrderByInput = TypedDict(
+    '_AnalysisJob_run_at_OrderByInput',
+    {
+        'run_at': 'SortOrder',
+    },
+    total=True
+)
+
+_AnalysisJob_locked_until_OrderByInput = TypedDict(
+    '_AnalysisJob_locked_until_OrderByInput',
+    {
+        'locked_until': 'SortOrder',
+    },
+    total=True
+)
+
+_AnalysisJob_last_error_OrderByInput = TypedDict(
+    '_AnalysisJob_last_error_OrderByInput',
+    {
+        'last_error': 'SortOrder',
+    },
+    total=True
+)
+
+_AnalysisJob_created_at_OrderByInput = TypedDict(
+    '_AnalysisJob_created_at_OrderByInput',
+    {
+        'created_at': 'SortOrder',
+    },
+    total=True
+)
+
+_AnalysisJob_updated_at_OrderByInput = TypedDict(
+    '_AnalysisJob_updated_at_OrderByInput',
+    {
+        'updated_at': 'SortOrder',
+    },
+    total=True
+)
+
+AnalysisJobOrderByInput = Union[
+    '_AnalysisJob_id_OrderByInput',
+    '_AnalysisJob_judgment_id_OrderByInput',
+    '_AnalysisJob_user_id_OrderByInput',
+    '_AnalysisJob_status_OrderByInput',
+    '_AnalysisJob_attempts_OrderByInput',
+    '_AnalysisJob_max_attempts_OrderByInput',
+    '_AnalysisJob_run_at_OrderByInput',
+    '_AnalysisJob_locked_until_OrderByInput',
+    '_AnalysisJob_last_error_OrderByInput',
+    '_AnalysisJob_created_at_OrderByInput',
+    '_AnalysisJob_updated_at_OrderByInput',
+]
+
+
+
+# recursive AnalysisJob types
+# TODO: cleanup these types
+
+
+# Dict[str, Any] is a mypy limitation
+# see https://github.com/RobertCraigie/prisma-client-py/issues/45
+# switch to pyright for improved types, see https://prisma-client-py.readthedocs.io/en/stable/reference/limitations/
+
+AnalysisJobRelationFilter = TypedDict(
+    'AnalysisJobRelationFilter',
+    {
+        'is': 'Dict[str, Any]',
+        'is_not': 'Dict[str, Any]',
+    },
+    total=False,
+)
+
+
+class AnalysisJobListRelationFilter(TypedDict, total=False):
+    some: 'Dict[str, Any]'
+    none: 'Dict[str, Any]'
+    every: 'Dict[str, Any]'
+
+
+class AnalysisJobInclude(TypedDict, total=False):
+    """AnalysisJob relational arguments"""
+    judgment: Union[bool, 'JudgmentArgsFromAnalysisJob']
+
+
+    
+
+class UserIncludeFromAnalysisJob(TypedDict, total=False):
+    """Relational arguments for AnalysisJob"""
+    judgments: Union[bool, 'FindManyJudgmentArgsFromAnalysisJobRecursive1']
+
+
+class UserIncludeFromAnalysisJobRecursive1(TypedDict, total=False):
+    """Relational arguments for AnalysisJob"""
+    judgments: Union[bool, 'FindManyJudgmentArgsFromAnalysisJobRecursive2']
+
+
+class UserIncludeFromAnalysisJobRecursive2(TypedDict, total=False):
+    """Relational arguments for AnalysisJob"""
+    judgments: Union[bool, 'FindManyJudgmentArgsFromAnalysisJobRecursive3']
+
+
+class UserIncludeFromAnalysisJobRecursive3(TypedDict, total=False):
+    """Relational arguments for AnalysisJob"""
+    judgments: Union[bool, 'FindManyJudgmentArgsFromAnalysisJobRecursive4']
+
+
+class UserIncludeFromAnalysisJobRecursive4(TypedDict, total=False):
+    """Relational arguments for AnalysisJob"""
+
+    
+
+class UserArgsFromAnalysisJob(TypedDict, total=False):
+    """Arguments for AnalysisJob"""
+    select: List['UserScalarFieldKeys']
+    include: 'UserIncludeFromUserRecursive1'
+
+
+class UserArgsFromAnalysisJobRecursive1(TypedDict, total=False):
+    """Arguments for AnalysisJob"""
+    select: List['UserScalarFieldKeys']
+    include: 'UserIncludeFromUserRecursive2'
+
+
+class UserArgsFromAnalysisJobRecursive2(TypedDict, total=False):
+    """Arguments for AnalysisJob"""
+    select: List['UserScalarFieldKeys']
+    include: 'UserIncludeFromUserRecursive3'
+
+
+class UserArgsFromAnalysisJobRecursive3(TypedDict, total=False):
+    """Arguments for AnalysisJob"""
+    select: List['UserScalarFieldKeys']
+    include: 'UserIncludeFromUserRecursive4'
+
+
+class UserArgsFromAnalysisJobRecursive4(TypedDict, total=False):
+    """Arguments for AnalysisJob"""
+    select: List['UserScalarFieldKeys']
+    
+    
+
+class FindManyUserArgsFromAnalysisJob(TypedDict, total=False):
+    """Arguments for AnalysisJob"""
+    take: int
+    skip: int
+    order_by: Union['UserOrderByInput', List['UserOrderByInput']]
+    where: 'UserWhereInput'
+    cursor: 'UserWhereUniqueInput'
+    distinct: List['UserScalarFieldKeys']
+    select: List['UserScalarFieldKeys']
+    include: 'UserIncludeFromUserRecursive1'
+
+
+class FindManyUserArgsFromAnalysisJobRecursive1(TypedDict, total=False):
+    """Arguments for AnalysisJob"""
+    take: int
+    skip: int
+    order_by: Union['UserOrderByInput', List['UserOrderByInput']]
+    where: 'UserWhereInput'
+    cursor: 'UserWhereUniqueInput'
+    distinct: List['UserScalarFieldKeys']
+    select: List['UserScalarFieldKeys']
+    include: 'UserIncludeFromUserRecursive2'
+
+
+class FindManyUserArgsFromAnalysisJobRecursive2(TypedDict, total=False):
+    """Arguments for AnalysisJob"""
+    take: int
+    skip: int
+    order_by: Union['UserOrderByInput', List['UserOrderByInput']]
+    where: 'UserWhereInput'
+    cursor: 'UserWhereUniqueInput'
+    distinct: List['UserScalarFieldKeys']
+    select: List['UserScalarFieldKeys']
+    include: 'UserIncludeFromUserRecursive3'
+
+
+class FindManyUserArgsFromAnalysisJobRecursive3(TypedDict, total=False):
+    """Arguments for AnalysisJob"""
+    take: int
+    skip: int
+    order_by: Union['UserOrderByInput', List['UserOrderByInput']]
+    where: 'UserWhereInput'
+    cursor: 'UserWhereUniqueInput'
+    distinct: List['UserScalarFieldKeys']
+    select: List['UserScalarFieldKeys']
+    include: 'UserIncludeFromUserRecursive4'
+
+
+class FindManyUserArgsFromAnalysisJobRecursive4(TypedDict, total=False):
+    """Arguments for AnalysisJob"""
+    take: int
+    skip: int
+    order_by: Union['UserOrderByInput', List['UserOrderByInput']]
+    where: 'UserWhereInput'
+    cursor: 'UserWhereUniqueInput'
+    distinct: List['UserScalarFieldKeys']
+    select: List['UserScalarFieldKeys']
+    
+    
+
+class JudgmentIncludeFromAnalysisJob(TypedDict, total=False):
+    """Relational arguments for AnalysisJob"""
+    user: Union[bool, 'UserArgsFromAnalysisJobRecursive1']
+    suspects: Union[bool, 'FindManySuspectArgsFromAnalysisJobRecursive1']
+    blame: Union[bool, 'BlameArgsFromAnalysisJobRecursive1']
+    jobs: Union[bool, 'FindManyAnalysisJobArgsFromAnalysisJobRecursive1']
+
+
+class JudgmentIncludeFromAnalysisJobRecursive1(TypedDict, total=False):
+    """Relational arguments for AnalysisJob"""
+    user: Union[bool, 'UserArgsFromAnalysisJobRecursive2']
+    suspects: Union[bool, 'FindManySuspectArgsFromAnalysisJobRecursive2']
+    blame: Union[bool, 'BlameArgsFromAnalysisJobRecursive2']
+    jobs: Union[bool, 'FindManyAnalysisJobArgsFromAnalysisJobRecursive2']
+
+
+class JudgmentIncludeFromAnalysisJobRecursive2(TypedDict, total=False):
+    """Relational arguments for AnalysisJob"""
+    user: Union[bool, 'UserArgsFromAnalysisJobRecursive3']
+    suspects: Union[bool, 'FindManySuspectArgsFromAnalysisJobRecursive3']
+    blame: Union[bool, 'BlameArgsFromAnalysisJobRecursive3']
+    jobs: Union[bool, 'FindManyAnalysisJobArgsFromAnalysisJobRecursive3']
+
+
+class JudgmentIncludeFromAnalysisJobRecursive3(TypedDict, total=False):
+    """Relational arguments for AnalysisJob"""
+    user: Union[bool, 'UserArgsFromAnalysisJobRecursive4']
+    suspects: Union[bool, 'FindManySuspectArgsFromAnalysisJobRecursive4']
+    blame: Union[bool, 'BlameArgsFromAnalysisJobRecursive4']
+    jobs: Union[bool, 'FindManyAnalysisJobArgsFromAnalysisJobRecursive4']
+
+
+class JudgmentIncludeFromAnalysisJobRecursive4(TypedDict, total=False):
+    """Relational arguments for AnalysisJob"""
+
+    
+
+class JudgmentArgsFromAnalysisJob(TypedDict, total=False):
+    """Arguments for AnalysisJob"""
+    select: List['JudgmentScalarFieldKeys']
+    include: 'JudgmentIncludeFromJudgmentRecursive1'
+
+
+class JudgmentArgsFromAnalysisJobRecursive1(TypedDict, total=False):
+    """Arguments for AnalysisJob"""
+    select: List['JudgmentScalarFieldKeys']
+    include: 'JudgmentIncludeFromJudgmentRecursive2'
+
+
+class JudgmentArgsFromAnalysisJobRecursive2(TypedDict, total=False):
+    """Arguments for AnalysisJob"""
+    select: List['JudgmentScalarFieldKeys']
+    include: 'JudgmentIncludeFromJudgmentRecursive3'
+
+
+class JudgmentArgsFromAnalysisJobRecursive3(TypedDict, total=False):
+    """Arguments for AnalysisJob"""
+    select: List['JudgmentScalarFieldKeys']
+    include: 'JudgmentIncludeFromJudgmentRecursive4'
+
+
+class JudgmentArgsFromAnalysisJobRecursive4(TypedDict, total=False):
+    """Arguments for AnalysisJob"""
+    select: List['JudgmentScalarFieldKeys']
+    
+    
+
+class FindManyJudgmentArgsFromAnalysisJob(TypedDict, total=False):
+    """Arguments for AnalysisJob"""
+    take: int
+    skip: int
+    order_by: Union['JudgmentOrderByInput', List['JudgmentOrderByInput']]
+    where: 'JudgmentWhereInput'
+    cursor: 'JudgmentWhereUniqueInput'
+    distinct: List['JudgmentScalarFieldKeys']
+    select: List['JudgmentScalarFieldKeys']
+    include: 'JudgmentIncludeFromJudgmentRecursive1'
+
+
+class FindManyJudgmentArgsFromAnalysisJobRecursive1(TypedDict, total=False):
+    """Arguments for AnalysisJob"""
+    take: int
+    skip: int
+    order_by: Union['JudgmentOrderByInput', List['JudgmentOrderByInput']]
+    where: 'JudgmentWhereInput'
+    cursor: 'JudgmentWhereUniqueInput'
+    distinct: List['JudgmentScalarFieldKeys']
+    select: List['JudgmentScalarFieldKeys']
+    include: 'JudgmentIncludeFromJudgmentRecursive2'
+
+
+class FindManyJudgmentArgsFromAnalysisJobRecursive2(TypedDict, total=False):
+    """Arguments for AnalysisJob"""
+    take: int
+    skip: int
+    order_by: Union['JudgmentOrderByInput', List['JudgmentOrderByInput']]
+    where: 'JudgmentWhereInput'
+    cursor: 'JudgmentWhereUniqueInput'
+    distinct: List['JudgmentScalarFieldKeys']
+    select: List['JudgmentScalarFieldKeys']
+    include: 'JudgmentIncludeFromJudgmentRecursive3'
+
+
+class FindManyJudgmentArgsFromAnalysisJobRecursive3(TypedDict, total=False):
+    """Arguments for AnalysisJob"""
+    take: int
+    skip: int
+    order_by: Union['JudgmentOrderByInput', List['JudgmentOrderByInput']]
+    where: 'JudgmentWhereInput'
+    cursor: 'JudgmentWhereUniqueInput'
+    distinct: List['JudgmentScalarFieldKeys']
+    select: List['JudgmentScalarFieldKeys']
+    include: 'JudgmentIncludeFromJudgmentRecursive4'
+
+
+class FindManyJudgmentArgsFromAnalysisJobRecursive4(TypedDict, total=False):
+    """Arguments for AnalysisJob"""
+    take: int
+    skip: int
+    order_by: Union['JudgmentOrderByInput', List['JudgmentOrderByInput']]
+    where: 'JudgmentWhereInput'
+    cursor: 'JudgmentWhereUniqueInput'
+    distinct: List['JudgmentScalarFieldKeys']
+    select: List['JudgmentScalarFieldKeys']
+    
+    
+
+class SuspectIncludeFromAnalysisJob(TypedDict, total=False):
+    """Relational arguments for AnalysisJob"""
+    judgment: Union[bool, 'JudgmentArgsFromAnalysisJobRecursive1']
+
+
+class SuspectIncludeFromAnalysisJobRecursive1(TypedDict, total=False):
+    """Relational arguments for AnalysisJob"""
+    judgment: Union[bool, 'JudgmentArgsFromAnalysisJobRecursive2']
+
+
+class SuspectIncludeFromAnalysisJobRecursive2(TypedDict, total=False):
+    """Relational arguments for AnalysisJob"""
+    judgment: Union[bool, 'JudgmentArgsFromAnalysisJobRecursive3']
+
+
+class SuspectIncludeFromAnalysisJobRecursive3(TypedDict, total=False):
+    """Relational arguments for AnalysisJob"""
+    judgment: Union[bool, 'JudgmentArgsFromAnalysisJobRecursive4']
+
+
+class SuspectIncludeFromAnalysisJobRecursive4(TypedDict, total=False):
+    """Relational arguments for AnalysisJob"""
+
+    
+
+class SuspectArgsFromAnalysisJob(TypedDict, total=False):
+    """Arguments for AnalysisJob"""
+    select: List['SuspectScalarFieldKeys']
+    include: 'SuspectIncludeFromSuspectRecursive1'
+
+
+class SuspectArgsFromAnalysisJobRecursive1(TypedDict, total=False):
+    """Arguments for AnalysisJob"""
+    select: List['SuspectScalarFieldKeys']
+    include: 'SuspectIncludeFromSuspectRecursive2'
+
+
+class SuspectArgsFromAnalysisJobRecursive2(TypedDict, total=False):
+    """Arguments for AnalysisJob"""
+    select: List['SuspectScalarFieldKeys']
+    include: 'SuspectIncludeFromSuspectRecursive3'
+
+
+class SuspectArgsFromAnalysisJobRecursive3(TypedDict, total=False):
+    """Arguments for AnalysisJob"""
+    select: List['SuspectScalarFieldKeys']
+    include: 'SuspectIncludeFromSuspectRecursive4'
+
+
+class SuspectArgsFromAnalysisJobRecursive4(TypedDict, total=False):
+    """Arguments for AnalysisJob"""
+    select: List['SuspectScalarFieldKeys']
+    
+    
+
+class FindManySuspectArgsFromAnalysisJob(TypedDict, total=False):
+    """Arguments for AnalysisJob"""
+    take: int
+    skip: int
+    order_by: Union['SuspectOrderByInput', List['SuspectOrderByInput']]
+    where: 'SuspectWhereInput'
+    cursor: 'SuspectWhereUniqueInput'
+    distinct: List['SuspectScalarFieldKeys']
+    select: List['SuspectScalarFieldKeys']
+    include: 'SuspectIncludeFromSuspectRecursive1'
+
+
+class FindManySuspectArgsFromAnalysisJobRecursive1(TypedDict, total=False):
+    """Arguments for AnalysisJob"""
+    take: int
+    skip: int
+    order_by: Union['SuspectOrderByInput', List['SuspectOrderByInput']]
+    where: 'SuspectWhereInput'
+    cursor: 'SuspectWhereUniqueInput'
+    distinct: List['SuspectScalarFieldKeys']
+    select: List['SuspectScalarFieldKeys']
+    include: 'SuspectIncludeFromSuspectRecursive2'
+
+
+class FindManySuspectArgsFromAnalysisJobRecursive2(TypedDict, total=False):
+    """Arguments for AnalysisJob"""
+    take: int
+    skip: int
+    order_by: Union['SuspectOrderByInput', List['SuspectOrderByInput']]
+    where: 'SuspectWhereInput'
+    cursor: 'SuspectWhereUniqueInput'
+    distinct: List['SuspectScalarFieldKeys']
+    select: List['SuspectScalarFieldKeys']
+    include: 'SuspectIncludeFromSuspectRecursive3'
+
+
+class FindManySuspectArgsFromAnalysisJobRecursive3(TypedDict, total=False):
+    """Arguments for AnalysisJob"""
+    take: int
+    skip: int
+    order_by: Union['SuspectOrderByInput', List['SuspectOrderByInput']]
+    where: 'SuspectWhereInput'
+    cursor: 'SuspectWhereUniqueInput'
+    distinct: List['SuspectScalarFieldKeys']
+    select: List['SuspectScalarFieldKeys']
+    include: 'SuspectIncludeFromSuspectRecursive4'
+
+
+class FindManySuspectArgsFromAnalysisJobRecursive4(TypedDict, total=False):
+    """Arguments for AnalysisJob"""
+    take: int
+    skip: int
+    order_by: Union['SuspectOrderByInput', List['SuspectOrderByInput']]
+    where: 'SuspectWhereInput'
+    cursor: 'SuspectWhereUniqueInput'
+    distinct: List['SuspectScalarFieldKeys']
+    select: List['SuspectScalarFieldKeys']
+    
+    
+
+class BlameIncludeFromAnalysisJob(TypedDict, total=False):
+    """Relational arguments for AnalysisJob"""
+    judgment: Union[bool, 'JudgmentArgsFromAnalysisJobRecursive1']
+
+
+class BlameIncludeFromAnalysisJobRecursive1(TypedDict, total=False):
+    """Relational arguments for AnalysisJob"""
+    judgment: Union[bool, 'JudgmentArgsFromAnalysisJobRecursive2']
+
+
+class BlameIncludeFromAnalysisJobRecursive2(TypedDict, total=False):
+    """Relational arguments for AnalysisJob"""
+    judgment: Union[bool, 'JudgmentArgsFromAnalysisJobRecursive3']
+
+
+class BlameIncludeFromAnalysisJobRecursive3(TypedDict, total=False):
+    """Relational arguments for AnalysisJob"""
+    judgment: Union[bool, 'JudgmentArgsFromAnalysisJobRecursive4']
+
+
+class BlameIncludeFromAnalysisJobRecursive4(TypedDict, total=False):
+    """Relational arguments for AnalysisJob"""
+
+    
+
+class BlameArgsFromAnalysisJob(TypedDict, total=False):
+    """Arguments for AnalysisJob"""
+    select: List['BlameScalarFieldKeys']
+    include: 'BlameIncludeFromBlameRecursive1'
+
+
+class BlameArgsFromAnalysisJobRecursive1(TypedDict, total=False):
+    """Arguments for AnalysisJob"""
+    select: List['BlameScalarFieldKeys']
+    include: 'BlameIncludeFromBlameRecursive2'
+
+
+class BlameArgsFromAnalysisJobRecursive2(TypedDict, total=False):
+    """Arguments for AnalysisJob"""
+    select: List['BlameScalarFieldKeys']
+    include: 'BlameIncludeFromBlameRecursive3'
+
+
+class BlameArgsFromAnalysisJobRecursive3(TypedDict, total=False):
+    """Arguments for AnalysisJob"""
+    select: List['BlameScalarFieldKeys']
+    include: 'BlameIncludeFromBlameRecursive4'
+
+
+class BlameArgsFromAnalysisJobRecursive4(TypedDict, total=False):
+    """Arguments for AnalysisJob"""
+    select: List['BlameScalarFieldKeys']
+    
+    
+
+class FindManyBlameArgsFromAnalysisJob(TypedDict, total=False):
+    """Arguments for AnalysisJob"""
+    take: int
+    skip: int
+    order_by: Union['BlameOrderByInput', List['BlameOrderByInput']]
+    where: 'BlameWhereInput'
+    cursor: 'BlameWhereUniqueInput'
+    distinct: List['BlameScalarFieldKeys']
+    select: List['BlameScalarFieldKeys']
+    include: 'BlameIncludeFromBlameRecursive1'
+
+
+class FindManyBlameArgsFromAnalysisJobRecursive1(TypedDict, total=False):
+    """Arguments for AnalysisJob"""
+    take: int
+    skip: int
+    order_by: Union['BlameOrderByInput', List['BlameOrderByInput']]
+    where: 'BlameWhereInput'
+    cursor: 'BlameWhereUniqueInput'
+    distinct: List['BlameScalarFieldKeys']
+    select: List['BlameScalarFieldKeys']
+    include: 'BlameIncludeFromBlameRecursive2'
+
+
+class FindManyBlameArgsFromAnalysisJobRecursive2(TypedDict, total=False):
+    """Arguments for AnalysisJob"""
+    take: int
+    skip: int
+    order_by: Union['BlameOrderByInput', List['BlameOrderByInput']]
+    where: 'BlameWhereInput'
+    cursor: 'BlameWhereUniqueInput'
+    distinct: List['BlameScalarFieldKeys']
+    select: List['BlameScalarFieldKeys']
+    include: 'BlameIncludeFromBlameRecursive3'
+
+
+class FindManyBlameArgsFromAnalysisJobRecursive3(TypedDict, total=False):
+    """Arguments for AnalysisJob"""
+    take: int
+    skip: int
+    order_by: Union['BlameOrderByInput', List['BlameOrderByInput']]
+    where: 'BlameWhereInput'
+    cursor: 'BlameWhereUniqueInput'
+    distinct: List['BlameScalarFieldKeys']
+    select: List['BlameScalarFieldKeys']
+    include: 'BlameIncludeFromBlameRecursive4'
+
+
+class FindManyBlameArgsFromAnalysisJobRecursive4(TypedDict, total=False):
+    """Arguments for AnalysisJob"""
+    take: int
+    skip: int
+    order_by: Union['BlameOrderByInput', List['BlameOrderByInput']]
+    where: 'BlameWhereInput'
+    cursor: 'BlameWhereUniqueInput'
+    distinct: List['BlameScalarFieldKeys']
+    select: List['BlameScalarFieldKeys']
+    
+    
+
+class AnalysisJobIncludeFromAnalysisJob(TypedDict, total=False):
+    """Relational arguments for AnalysisJob"""
+    judgment: Union[bool, 'JudgmentArgsFromAnalysisJobRecursive1']
+
+
+class AnalysisJobIncludeFromAnalysisJobRecursive1(TypedDict, total=False):
+    """Relational arguments for AnalysisJob"""
+    judgment: Union[bool, 'JudgmentArgsFromAnalysisJobRecursive2']
+
+
+class AnalysisJobIncludeFromAnalysisJobRecursive2(TypedDict, total=False):
+    """Relational arguments for AnalysisJob"""
+    judgment: Union[bool, 'JudgmentArgsFromAnalysisJobRecursive3']
+
+
+class AnalysisJobIncludeFromAnalysisJobRecursive3(TypedDict, total=False):
+    """Relational arguments for AnalysisJob"""
+    judgment: Union[bool, 'JudgmentArgsFromAnalysisJobRecursive4']
+
+
+class AnalysisJobIncludeFromAnalysisJobRecursive4(TypedDict, total=False):
+    """Relational arguments for AnalysisJob"""
+
+    
+
+class AnalysisJobArgsFromAnalysisJob(TypedDict, total=False):
+    """Arguments for AnalysisJob"""
+    select: List['AnalysisJobScalarFieldKeys']
+    include: 'AnalysisJobIncludeFromAnalysisJobRecursive1'
+
+
+class AnalysisJobArgsFromAnalysisJobRecursive1(TypedDict, total=False):
+    """Arguments for AnalysisJob"""
+    select: List['AnalysisJobScalarFieldKeys']
+    include: 'AnalysisJobIncludeFromAnalysisJobRecursive2'
+
+
+class AnalysisJobArgsFromAnalysisJobRecursive2(TypedDict, total=False):
+    """Arguments for AnalysisJob"""
+    select: List['AnalysisJobScalarFieldKeys']
+    include: 'AnalysisJobIncludeFromAnalysisJobRecursive3'
+
+
+class AnalysisJobArgsFromAnalysisJobRecursive3(TypedDict, total=False):
+    """Arguments for AnalysisJob"""
+    select: List['AnalysisJobScalarFieldKeys']
+    include: 'AnalysisJobIncludeFromAnalysisJobRecursive4'
+
+
+class AnalysisJobArgsFromAnalysisJobRecursive4(TypedDict, total=False):
+    """Arguments for AnalysisJob"""
+    select: List['AnalysisJobScalarFieldKeys']
+    
+    
+
+class FindManyAnalysisJobArgsFromAnalysisJob(TypedDict, total=False):
+    """Arguments for AnalysisJob"""
+    take: int
+    skip: int
+    order_by: Union['AnalysisJobOrderByInput', List['AnalysisJobOrderByInput']]
+    where: 'AnalysisJobWhereInput'
+    cursor: 'AnalysisJobWhereUniqueInput'
+    distinct: List['AnalysisJobScalarFieldKeys']
+    select: List['AnalysisJobScalarFieldKeys']
+    include: 'AnalysisJobIncludeFromAnalysisJobRecursive1'
+
+
+class FindManyAnalysisJobArgsFromAnalysisJobRecursive1(TypedDict, total=False):
+    """Arguments for AnalysisJob"""
+    take: int
+    skip: int
+    order_by: Union['AnalysisJobOrderByInput', List['AnalysisJobOrderByInput']]
+    where: 'AnalysisJobWhereInput'
+    cursor: 'AnalysisJobWhereUniqueInput'
+    distinct: List['AnalysisJobScalarFieldKeys']
+    select: List['AnalysisJobScalarFieldKeys']
+    include: 'AnalysisJobIncludeFromAnalysisJobRecursive2'
+
+
+class FindManyAnalysisJobArgsFromAnalysisJobRecursive2(TypedDict, total=False):
+    """Arguments for AnalysisJob"""
+    take: int
+    skip: int
+    order_by: Union['AnalysisJobOrderByInput', List['AnalysisJobOrderByInput']]
+    where: 'AnalysisJobWhereInput'
+    cursor: 'AnalysisJobWhereUniqueInput'
+    distinct: List['AnalysisJobScalarFieldKeys']
+    select: List['AnalysisJobScalarFieldKeys']
+    include: 'AnalysisJobIncludeFromAnalysisJobRecursive3'
+
+
+class FindManyAnalysisJobArgsFromAnalysisJobRecursive3(TypedDict, total=False):
+    """Arguments for AnalysisJob"""
+    take: int
+    skip: int
+    order_by: Union['AnalysisJobOrderByInput', List['AnalysisJobOrderByInput']]
+    where: 'AnalysisJobWhereInput'
+    cursor: 'AnalysisJobWhereUniqueInput'
+    distinct: List['AnalysisJobScalarFieldKeys']
+    select: List['AnalysisJobScalarFieldKeys']
+    include: 'AnalysisJobIncludeFromAnalysisJobRecursive4'
+
+
+class FindManyAnalysisJobArgsFromAnalysisJobRecursive4(TypedDict, total=False):
+    """Arguments for AnalysisJob"""
+    take: int
+    skip: int
+    order_by: Union['AnalysisJobOrderByInput', List['AnalysisJobOrderByInput']]
+    where: 'AnalysisJobWhereInput'
+    cursor: 'AnalysisJobWhereUniqueInput'
+    distinct: List['AnalysisJobScalarFieldKeys']
+    select: List['AnalysisJobScalarFieldKeys']
+    
+
+
+FindManyAnalysisJobArgs = FindManyAnalysisJobArgsFromAnalysisJob
+FindFirstAnalysisJobArgs = FindManyAnalysisJobArgsFromAnalysisJob
+
+
+    
+
+class AnalysisJobWhereInput(TypedDict, total=False):
+    """AnalysisJob arguments for searching"""
+    id: Union[_str, 'types.StringFilter']
+    judgment_id: Union[_str, 'types.StringFilter']
+    user_id: Union[_str, 'types.StringFilter']
+    status: Union[_str, 'types.StringFilter']
+    attempts: Union[_int, 'types.IntFilter']
+    max_attempts: Union[_int, 'types.IntFilter']
+    run_at: Union[datetime.datetime, 'types.DateTimeFilter']
+    locked_until: Union[None, datetime.datetime, 'types.DateTimeFilter']
+    last_error: Union[None, _str, 'types.StringFilter']
+    created_at: Union[datetime.datetime, 'types.DateTimeFilter']
+    updated_at: Union[datetime.datetime, 'types.DateTimeFilter']
+    judgment: 'JudgmentRelationFilter'
+
+    # should be noted that AND and NOT should be Union['AnalysisJobWhereInputRecursive1', List['AnalysisJobWhereInputRecursive1']]
+    # but this causes mypy to hang :/
+    AND: List['AnalysisJobWhereInputRecursive1']
+    OR: List['AnalysisJobWhereInputRecursive1']
+    NOT: List['AnalysisJobWhereInputRecursive1']
+
+
+class AnalysisJobWhereInputRecursive1(TypedDict, total=False):
+    """AnalysisJob arguments for searching"""
+    id: Union[_str, 'types.StringFilter']
+    judgment_id: Union[_str, 'types.StringFilter']
+    user_id: Union[_str, 'types.StringFilter']
+    status: Union[_str, 'types.StringFilter']
+    attempts: Union[_int, 'types.IntFilter']
+    max_attempts: Union[_int, 'types.IntFilter']
+    run_at: Union[datetime.datetime, 'types.DateTimeFilter']
+    locked_until: Union[None, datetime.datetime, 'types.DateTimeFilter']
+    last_error: Union[None, _str, 'types.StringFilter']
+    created_at: Union[datetime.datetime, 'types.DateTimeFilter']
+    updated_at: Union[datetime.datetime, 'types.DateTimeFilter']
+    judgment: 'JudgmentRelationFilter'
+
+    # should be noted that AND and NOT should be Union['AnalysisJobWhereInputRecursive2', List['AnalysisJobWhereInputRecursive2']]
+    # but this causes mypy to hang :/
+    AND: List['AnalysisJobWhereInputRecursive2']
+    OR: List['AnalysisJobWhereInputRecursive2']
+    NOT: List['AnalysisJobWhereInputRecursive2']
+
+
+class AnalysisJobWhereInputRecursive2(TypedDict, total=False):
+    """AnalysisJob arguments for searching"""
+    id: Union[_str, 'types.StringFilter']
+    judgment_id: Union[_str, 'types.StringFilter']
+    user_id: Union[_str, 'types.StringFilter']
+    status: Union[_str, 'types.StringFilter']
+    attempts: Union[_int, 'types.IntFilter']
+    max_attempts: Union[_int, 'types.IntFilter']
+    run_at: Union[datetime.datetime, 'types.DateTimeFilter']
+    locked_until: Union[None, datetime.datetime, 'types.DateTimeFilter']
+    last_error: Union[None, _str, 'types.StringFilter']
+    created_at: Union[datetime.datetime, 'types.DateTimeFilter']
+    updated_at: Union[datetime.datetime, 'types.DateTimeFilter']
+    judgment: 'JudgmentRelationFilter'
+
+    # should be noted that AND and NOT should be Union['AnalysisJobWhereInputRecursive3', List['AnalysisJobWhereInputRecursive3']]
+    # but this causes mypy to hang :/
+    AND: List['AnalysisJobWhereInputRecursive3']
+    OR: List['AnalysisJobWhereInputRecursive3']
+    NOT: List['AnalysisJobWhereInputRecursive3']
+
+
+class AnalysisJobWhereInputRecursive3(TypedDict, total=False):
+    """AnalysisJob arguments for searching"""
+    id: Union[_str, 'types.StringFilter']
+    judgment_id: Union[_str, 'types.StringFilter']
+    user_id: Union[_str, 'types.StringFilter']
+    status: Union[_str, 'types.StringFilter']
+    attempts: Union[_int, 'types.IntFilter']
+    max_attempts: Union[_int, 'types.IntFilter']
+    run_at: Union[datetime.datetime, 'types.DateTimeFilter']
+    locked_until: Union[None, datetime.datetime, 'types.DateTimeFilter']
+    last_error: Union[None, _str, 'types.StringFilter']
+    created_at: Union[datetime.datetime, 'types.DateTimeFilter']
+    updated_at: Union[datetime.datetime, 'types.DateTimeFilter']
+    judgment: 'JudgmentRelationFilter'
+
+    # should be noted that AND and NOT should be Union['AnalysisJobWhereInputRecursive4', List['AnalysisJobWhereInputRecursive4']]
+    # but this causes mypy to hang :/
+    AND: List['AnalysisJobWhereInputRecursive4']
+    OR: List['AnalysisJobWhereInputRecursive4']
+    NOT: List['AnalysisJobWhereInputRecursive4']
+
+
+class AnalysisJobWhereInputRecursive4(TypedDict, total=False):
+    """AnalysisJob arguments for searching"""
+    id: Union[_str, 'types.StringFilter']
+    judgment_id: Union[_str, 'types.StringFilter']
+    user_id: Union[_str, 'types.StringFilter']
+    status: Union[_str, 'types.StringFilter']
+    attempts: Union[_int, 'types.IntFilter']
+    max_attempts: Union[_int, 'types.IntFilter']
+    run_at: Union[datetime.datetime, 'types.DateTimeFilter']
+    locked_until: Union[None, datetime.datetime, 'types.DateTimeFilter']
+    last_error: Union[None, _str, 'types.StringFilter']
+    created_at: Union[datetime.datetime, 'types.DateTimeFilter']
+    updated_at: Union[datetime.datetime, 'types.DateTimeFilter']
+    judgment: 'JudgmentRelationFilter'
+
+
+
+# aggregate AnalysisJob types
+
+
+    
+
+class AnalysisJobScalarWhereWithAggregatesInput(TypedDict, total=False):
+    """AnalysisJob arguments for searching"""
+    id: Union[_str, 'types.StringWithAggregatesFilter']
+    judgment_id: Union[_str, 'types.StringWithAggregatesFilter']
+    user_id: Union[_str, 'types.StringWithAggregatesFilter']
+    status: Union[_str, 'types.StringWithAggregatesFilter']
+    attempts: Union[_int, 'types.IntWithAggregatesFilter']
+    max_attempts: Union[_int, 'types.IntWithAggregatesFilter']
+    run_at: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+    locked_until: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+    last_error: Union[_str, 'types.StringWithAggregatesFilter']
+    created_at: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+    updated_at: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+
+    AND: List['AnalysisJobScalarWhereWithAggregatesInputRecursive1']
+    OR: List['AnalysisJobScalarWhereWithAggregatesInputRecursive1']
+    NOT: List['AnalysisJobScalarWhereWithAggregatesInputRecursive1']
+
+
+class AnalysisJobScalarWhereWithAggregatesInputRecursive1(TypedDict, total=False):
+    """AnalysisJob arguments for searching"""
+    id: Union[_str, 'types.StringWithAggregatesFilter']
+    judgment_id: Union[_str, 'types.StringWithAggregatesFilter']
+    user_id: Union[_str, 'types.StringWithAggregatesFilter']
+    status: Union[_str, 'types.StringWithAggregatesFilter']
+    attempts: Union[_int, 'types.IntWithAggregatesFilter']
+    max_attempts: Union[_int, 'types.IntWithAggregatesFilter']
+    run_at: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+    locked_until: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+    last_error: Union[_str, 'types.StringWithAggregatesFilter']
+    created_at: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+    updated_at: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+
+    AND: List['AnalysisJobScalarWhereWithAggregatesInputRecursive2']
+    OR: List['AnalysisJobScalarWhereWithAggregatesInputRecursive2']
+    NOT: List['AnalysisJobScalarWhereWithAggregatesInputRecursive2']
+
+
+class AnalysisJobScalarWhereWithAggregatesInputRecursive2(TypedDict, total=False):
+    """AnalysisJob arguments for searching"""
+    id: Union[_str, 'types.StringWithAggregatesFilter']
+    judgment_id: Union[_str, 'types.StringWithAggregatesFilter']
+    user_id: Union[_str, 'types.StringWithAggregatesFilter']
+    status: Union[_str, 'types.StringWithAggregatesFilter']
+    attempts: Union[_int, 'types.IntWithAggregatesFilter']
+    max_attempts: Union[_int, 'types.IntWithAggregatesFilter']
+    run_at: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+    locked_until: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+    last_error: Union[_str, 'types.StringWithAggregatesFilter']
+    created_at: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+    updated_at: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+
+    AND: List['AnalysisJobScalarWhereWithAggregatesInputRecursive3']
+    OR: List['AnalysisJobScalarWhereWithAggregatesInputRecursive3']
+    NOT: List['AnalysisJobScalarWhereWithAggregatesInputRecursive3']
+
+
+class AnalysisJobScalarWhereWithAggregatesInputRecursive3(TypedDict, total=False):
+    """AnalysisJob arguments for searching"""
+    id: Union[_str, 'types.StringWithAggregatesFilter']
+    judgment_id: Union[_str, 'types.StringWithAggregatesFilter']
+    user_id: Union[_str, 'types.StringWithAggregatesFilter']
+    status: Union[_str, 'types.StringWithAggregatesFilter']
+    attempts: Union[_int, 'types.IntWithAggregatesFilter']
+    max_attempts: Union[_int, 'types.IntWithAggregatesFilter']
+    run_at: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+    locked_until: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+    last_error: Union[_str, 'types.StringWithAggregatesFilter']
+    created_at: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+    updated_at: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+
+    AND: List['AnalysisJobScalarWhereWithAggregatesInputRecursive4']
+    OR: List['AnalysisJobScalarWhereWithAggregatesInputRecursive4']
+    NOT: List['AnalysisJobScalarWhereWithAggregatesInputRecursive4']
+
+
+class AnalysisJobScalarWhereWithAggregatesInputRecursive4(TypedDict, total=False):
+    """AnalysisJob arguments for searching"""
+    id: Union[_str, 'types.StringWithAggregatesFilter']
+    judgment_id: Union[_str, 'types.StringWithAggregatesFilter']
+    user_id: Union[_str, 'types.StringWithAggregatesFilter']
+    status: Union[_str, 'types.StringWithAggregatesFilter']
+    attempts: Union[_int, 'types.IntWithAggregatesFilter']
+    max_attempts: Union[_int, 'types.IntWithAggregatesFilter']
+    run_at: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+    locked_until: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+    last_error: Union[_str, 'types.StringWithAggregatesFilter']
+    created_at: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+    updated_at: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+
+
+
+class AnalysisJobGroupByOutput(TypedDict, total=False):
+    id: _str
+    judgment_id: _str
+    user_id: _str
+    status: _str
+    attempts: _int
+    max_attempts: _int
+    run_at: datetime.datetime
+    locked_until: datetime.datetime
+    last_error: _str
+    created_at: datetime.datetime
+    updated_at: datetime.datetime
+    _sum: 'AnalysisJobSumAggregateOutput'
+    _avg: 'AnalysisJobAvgAggregateOutput'
+    _min: 'AnalysisJobMinAggregateOutput'
+    _max: 'AnalysisJobMaxAggregateOutput'
+    _count: 'AnalysisJobCountAggregateOutput'
+
+
+class AnalysisJobAvgAggregateOutput(TypedDict, total=False):
+    """AnalysisJob output for aggregating averages"""
+    attempts: float
+    max_attempts: float
+
+
+class AnalysisJobSumAggregateOutput(TypedDict, total=False):
+    """AnalysisJob output for aggregating sums"""
+    attempts: _int
+    max_attempts: _int
+
+
+class AnalysisJobScalarAggregateOutput(TypedDict, total=False):
+    """AnalysisJob output including scalar fields"""
+    id: _str
+    judgment_id: _str
+    user_id: _str
+    status: _str
+    attempts: _int
+    max_attempts: _int
+    run_at: datetime.datetime
+    locked_until: datetime.datetime
+    last_error: _str
+    created_at: datetime.datetime
+    updated_at: datetime.datetime
+
+
+AnalysisJobMinAggregateOutput = AnalysisJobScalarAggregateOutput
+AnalysisJobMaxAggregateOutput = AnalysisJobScalarAggregateOutput
+
+
+class AnalysisJobMaxAggregateInput(TypedDict, total=False):
+    """AnalysisJob input for aggregating by max"""
+    id: bool
+    judgment_id: bool
+    user_id: bool
+    status: bool
+    attempts: bool
+    max_attempts: bool
+    run_at: bool
+    locked_until: bool
+    last_error: bool
+    created_at: bool
+    updated_at: bool
+
+
+class AnalysisJobMinAggregateInput(TypedDict, total=False):
+    """AnalysisJob input for aggregating by min"""
+    id: bool
+    judgment_id: bool
+    user_id: bool
+    status: bool
+    attempts: bool
+    max_attempts: bool
+    run_at: bool
+    locked_until: bool
+    last_error: bool
+    created_at: bool
+    updated_at: bool
+
+
+class AnalysisJobNumberAggregateInput(TypedDict, total=False):
+    """AnalysisJob input for aggregating numbers"""
+    attempts: bool
+    max_attempts: bool
+
+
+AnalysisJobAvgAggregateInput = AnalysisJobNumberAggregateInput
+AnalysisJobSumAggregateInput = AnalysisJobNumberAggregateInput
+
+
+AnalysisJobCountAggregateInput = TypedDict(
+    'AnalysisJobCountAggregateInput',
+    {
+        'id': bool,
+        'judgment_id': bool,
+        'user_id': bool,
+        'status': bool,
+        'attempts': bool,
+        'max_attempts': bool,
+        'run_at': bool,
+        'locked_until': bool,
+        'last_error': bool,
+        'created_at': bool,
+        'updated_at': bool,
+        '_all': bool,
+    },
+    total=False,
+)
+
+AnalysisJobCountAggregateOutput = TypedDict(
+    'AnalysisJobCountAggregateOutput',
+    {
+        'id': int,
+        'judgment_id': int,
+        'user_id': int,
+        'status': int,
+        'attempts': int,
+        'max_attempts': int,
+        'run_at': int,
+        'locked_until': int,
+        'last_error': int,
+        'created_at': int,
+        'updated_at': int,
+        '_all': int,
+    },
+    total=False,
+)
+
+
+AnalysisJobKeys = Literal[
+    'id',
+    'judgment_id',
+    'user_id',
+    'status',
+    'attempts',
+    'max_attempts',
+    'run_at',
+    'locked_until',
+    'last_error',
+    'created_at',
+    'updated_at',
+    'judgment',
+]
+AnalysisJobScalarFieldKeys = Literal[
+    'id',
+    'judgment_id',
+    'user_id',
+    'status',
+    'attempts',
+    'max_attempts',
+    'run_at',
+    'locked_until',
+    'last_error',
+    'created_at',
+    'updated_at',
+]
+AnalysisJobScalarFieldKeysT = TypeVar('AnalysisJobScalarFieldKeysT', bound=AnalysisJobScalarFieldKeys)
+
+AnalysisJobRelationalFieldKeys = Literal[
+        'judgment',
+    ]
+
+
+
+# we have to import ourselves as types can be namespaced to types
+from . import types, enums, models, fields
\ No newline at end of file
@@ -4,9 +4,10 @@ import httpx
 import jwt
 from datetime import datetime, timedelta
 from app.config import settings
-from app.database import _ensure_prisma_client
+from app.database import connect_db
 from app.models.schemas import UserResponse, Token
 from app.dependencies import get_current_user
+from app.utils.user_cache import user_cache
 
 router = APIRouter()
 
@@ -29,9 +30,7 @@ async def github_login():
 
 @router.get("/github/callback")
 async def github_callback(code: str):
-    prisma = _ensure_prisma_client()
-    if not prisma.is_connected():
-        await prisma.connect()
+    prisma = await connect_db()
 
     # Exchange code for access token
     async with httpx.AsyncClient(timeout=30.0) as client:
@@ -81,6 +80,8 @@ async def github_callback(code: str):
                 },
             },
         )
+        # Drop the cached record so the new access_token is used right away
+        await user_cache.invalidate(user.id)
         
         # Create JWT
         token = create_jwt_token(user.id, user.username)
@@ -1,11 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException
 from app.database import _ensure_prisma_client
 from app.dependencies import get_current_user
-from app.models.schemas import BlameCreate, BlameResponse, BlameMessages
+from app.models.schemas import BlameCreate, BlameResponse
 from app.services.claude_service import ClaudeService
 from app.services.image_service import ImageService
-from app.utils.exceptions import ForbiddenException
-import json
+from app.services.judgment_repository import JudgmentRepository
+from app.prisma_client.fields import Json
 
 router = APIRouter()
 
@@ -19,15 +19,14 @@ async def create_blame(
     if not db.is_connected():
         await db.connect()
 
-    judgment = await db.judgment.find_unique(
-        where={"id": judgment_id},
-        include={"suspects": True, "blame": True}
+    judgment = await JudgmentRepository(db, current_user.id).get(
+        judgment_id,
+        include={"suspects": True},
+        select=["id", "repo_name", "title", "status"]
     )
     
     if not judgment:
         raise HTTPException(status_code=404, detail="Judgment not found")
-    if judgment.user_id != current_user.id:
-        raise ForbiddenException()
     if judgment.status != "completed":
         raise HTTPException(status_code=400, detail="Judgment not completed")
     if not judgment.suspects:
@@ -51,8 +50,8 @@ async def create_blame(
         }, intensity)
         messages[intensity] = message_list
 
-    # Convert messages dict to JSON string for DB storage
-    message_json = json.dumps(messages, ensure_ascii=False)
+    # Stored as jsonb; Json() marks the dict as a value rather than a nested write
+    message_json = Json(messages)
 
     # Upsert Blame
     blame = await db.blame.upsert(
@@ -78,25 +77,7 @@ async def create_blame(
         }
     )
 
-    # Safely parse messages and construct the response model instance
-    parsed_messages = {"mild": [], "medium": [], "spicy": []}
-    if blame.message and isinstance(blame.message, str):
-        try:
-            parsed_messages = json.loads(blame.message)
-        except json.JSONDecodeError:
-            # Data is corrupt, use default empty messages
-            pass
-
-    return BlameResponse(
-        id=blame.id,
-        target_username=blame.target_username,
-        target_avatar=blame.target_avatar,
-        responsibility=blame.responsibility,
-        reason=blame.reason,
-        messages=BlameMessages(**parsed_messages),
-        image_url=blame.image_url,
-        created_at=blame.created_at
-    )
+    return BlameResponse.model_validate(blame)
 
 @router.get("/{judgment_id}/blame", response_model=BlameResponse)
 async def get_blame(
@@ -107,34 +88,12 @@ async def get_blame(
     if not db.is_connected():
         await db.connect()
 
-    blame = await db.blame.find_unique(where={"judgment_id": judgment_id})
+    # Ownership is checked through the judgment relation in the same query
+    blame = await JudgmentRepository(db, current_user.id).get_blame(judgment_id)
     if not blame:
         raise HTTPException(status_code=404, detail="Blame not found")
 
-    # Check ownership via judgment
-    judgment = await db.judgment.find_unique(where={"id": judgment_id})
-    if judgment.user_id != current_user.id:
-        raise ForbiddenException()
-
-    # Safely parse message and construct the response model instance
-    parsed_messages = {"mild": [], "medium": [], "spicy": []}
-    if blame.message and isinstance(blame.message, str):
-        try:
-            parsed_messages = json.loads(blame.message)
-        except json.JSONDecodeError:
-            # Data is corrupt, use default empty messages
-            pass
-
-    return BlameResponse(
-        id=blame.id,
-        target_username=blame.target_username,
-        target_avatar=blame.target_avatar,
-        responsibility=blame.responsibility,
-        reason=blame.reason,
-        messages=BlameMessages(**parsed_messages),
-        image_url=blame.image_url,
-        created_at=blame.created_at
-    )
+    return BlameResponse.model_validate(blame)
 
 @router.post("/{judgment_id}/blame/image")
 async def generate_blame_image(
@@ -145,17 +104,19 @@ async def generate_blame_image(
     if not db.is_connected():
         await db.connect()
 
-    judgment = await db.judgment.find_unique(
-        where={"id": judgment_id},
-        include={"blame": True, "suspects": True} # suspects needed for commit msg if not in blame? Blame has it? No blame doesn't have commit msg.
+    judgment = await JudgmentRepository(db, current_user.id).get_with_blame(
+        judgment_id,
+        include={
+            "blame": {"select": ["id", "target_username", "target_avatar", "responsibility"]},
+            "suspects": {"select": ["username", "last_commit_msg"]},
+        }, # suspects needed for commit msg if not in blame? Blame has it? No blame doesn't have commit msg.
+        select=["id", "repo_name", "title", "created_at"]
         # Wait, Blame model doesn't have last_commit_msg. But ImageService needs it.
         # We can get it from the suspect that matches target_username.
     )
     
-    if not judgment or not judgment.blame:
+    if not judgment:
         raise HTTPException(status_code=404, detail="Blame not found")
-    if judgment.user_id != current_user.id:
-        raise ForbiddenException()
         
     # Find suspect for commit msg
     suspect = next((s for s in judgment.suspects if s.username == judgment.blame.target_username), None)
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, Query
 from typing import List
-from app.dependencies import get_current_user
+from app.dependencies import get_current_user_with_token
 from app.services.github_service import GitHubService
 from app.models.schemas import RepoResponse, ContributorResponse, CommitResponse, PaginatedResponse, FileTreeResponse
 
@@ -11,7 +11,7 @@ async def get_repos(
     page: int = 1,
     per_page: int = 30,
     sort: str = "updated",
-    current_user = Depends(get_current_user)
+    current_user = Depends(get_current_user_with_token)
 ):
     service = GitHubService(current_user.access_token)
     result = await service.get_user_repos(page, per_page, sort)
@@ -27,7 +27,7 @@ async def get_repos(
 async def get_contributors(
     owner: str,
     repo: str,
-    current_user = Depends(get_current_user)
+    current_user = Depends(get_current_user_with_token)
 ):
     service = GitHubService(current_user.access_token)
     result = await service.get_repo_contributors(owner, repo)
@@ -41,7 +41,7 @@ async def get_commits(
     since: str = None,
     until: str = None,
     per_page: int = 100,
-    current_user = Depends(get_current_user)
+    current_user = Depends(get_current_user_with_token)
 ):
     service = GitHubService(current_user.access_token)
     result = await service.get_repo_commits(owner, repo, path, since, until, per_page)
@@ -52,7 +52,7 @@ async def get_repo_tree(
     owner: str,
     repo: str,
     branch: str = "main",
-    current_user = Depends(get_current_user)
+    current_user = Depends(get_current_user_with_token)
 ):
     """
     Get the file tree for a repository
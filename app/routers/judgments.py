@@ -1,14 +1,23 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List
-from datetime import datetime, timedelta
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from collections import OrderedDict
+from typing import Optional
+from datetime import datetime, timezone
 from app.database import _ensure_prisma_client
-from app.dependencies import get_current_user
-from app.models.schemas import JudgmentCreate, JudgmentResponse, JudgmentListResponse, SuspectResponse, PaginatedResponse
-from app.services.github_service import GitHubService
+from app.dependencies import get_current_user, get_current_user_with_token
+from app.models.schemas import JudgmentCreate, JudgmentResponse, JudgmentListResponse, CursorPaginatedResponse, AnalysisJobResponse
+from app.services.analysis_service import AnalysisService
 from app.services.claude_service import ClaudeService
-from app.utils.exceptions import ForbiddenException
+from app.services.job_queue import JobQueue
+from app.services.judgment_repository import JudgmentRepository
+from app.services.suspect_ranker import SuspectRanker
+from app.utils.exceptions import GitHubAPIException, ClaudeAPIException
+import asyncio
+import base64
+import json
 import random
-import string
+import time
+import uuid
 
 router = APIRouter()
 
@@ -43,53 +52,108 @@ async def create_judgment(
     )
     return judgment
 
-@router.get("", response_model=PaginatedResponse[JudgmentListResponse])
+LIST_JUDGMENTS_SQL = """
+SELECT j."id", j."case_number", j."repo_name", j."title", j."status", j."created_at",
+       EXISTS (SELECT 1 FROM "Blame" b WHERE b."judgment_id" = j."id") AS "has_blame"
+FROM "Judgment" j
+WHERE j."user_id" = $1::uuid
+  AND ($2::text IS NULL OR j."status" = $2::text)
+  AND ($3::timestamp IS NULL OR (j."created_at", j."id") < ($3::timestamp, $4::uuid))
+ORDER BY j."created_at" DESC, j."id" DESC
+LIMIT $5
+"""
+
+# (user_id, status) -> (expires_at, total); totals are approximate by design.
+# Entries share one TTL, so insertion order is expiry order and expired ones are pruned from the front.
+_TOTAL_CACHE_TTL = 30
+_TOTAL_CACHE_MAX_SIZE = 1024
+_total_cache = OrderedDict()
+
+def _cursor_timestamp(value) -> datetime:
+    # created_at is a `timestamp` (without time zone) holding UTC, the form the cursor is compared in
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+def _encode_cursor(created_at, judgment_id) -> str:
+    raw = json.dumps([_cursor_timestamp(created_at).isoformat(), str(judgment_id)]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def _decode_cursor(cursor: str):
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded))
+        if not isinstance(payload, list) or len(payload) != 2:
+            raise ValueError("expected [created_at, id]")
+        created_at, judgment_id = payload
+        # both reach Postgres casts, a tampered cursor must fail here rather than in the query
+        return _cursor_timestamp(created_at).isoformat(), str(uuid.UUID(judgment_id))
+    except (ValueError, TypeError, AttributeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def _cached_total(user_id: str, status: Optional[str]) -> Optional[int]:
+    cached = _total_cache.get((user_id, status))
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+    return None
+
+def _store_total(user_id: str, status: Optional[str], total: int) -> None:
+    now = time.monotonic()
+    _total_cache[(user_id, status)] = (now + _TOTAL_CACHE_TTL, total)
+    _total_cache.move_to_end((user_id, status))
+    while _total_cache and (
+        len(_total_cache) > _TOTAL_CACHE_MAX_SIZE or next(iter(_total_cache.values()))[0] <= now
+    ):
+        _total_cache.popitem(last=False)
+
+@router.get("", response_model=CursorPaginatedResponse[JudgmentListResponse])
 async def list_judgments(
     status: str = None,
-    page: int = 1,
-    per_page: int = 20,
+    cursor: Optional[str] = None,
+    per_page: int = Query(20, ge=1, le=100),
+    include_total: bool = False,
     current_user = Depends(get_current_user)
 ):
     db = _ensure_prisma_client()
     if not db.is_connected():
         await db.connect()
 
-    where = {"user_id": current_user.id}
-    if status:
-        where["status"] = status
-        
-    total = await db.judgment.count(where=where)
-    judgments = await db.judgment.find_many(
-        where=where,
-        take=per_page,
-        skip=(page - 1) * per_page,
-        order={"created_at": "desc"},
-        include={"blame": True} # To check has_blame
-    )
-    
-    items = []
-    for j in judgments:
-        items.append(JudgmentListResponse(
-            id=j.id,
-            case_number=j.case_number,
-            repo_name=j.repo_name,
-            title=j.title,
-            status=j.status,
-            has_blame=bool(j.blame),
-            created_at=j.created_at
-        ))
-        
-    return PaginatedResponse(
+    # Keyset pagination on (created_at, id): one query whose cost doesn't grow with page depth.
+    # has_blame is an EXISTS projection instead of loading the whole blame row.
+    created_at, judgment_id = _decode_cursor(cursor) if cursor else (None, None)
+    args = (current_user.id, status or None, created_at, judgment_id, per_page + 1)
+
+    total = _cached_total(current_user.id, status or None) if include_total else None
+    if include_total and total is None:
+        # Page and count are independent reads: one non-transactional batch, one engine round trip.
+        where = {"user_id": current_user.id}
+        if status:
+            where["status"] = status
+        batch = db.batch_(transaction=False)
+        batch.query_raw(LIST_JUDGMENTS_SQL, *args)
+        batch.judgment.count(where=where)
+        rows, total = await batch.commit()
+        _store_total(current_user.id, status or None, total)
+    else:
+        rows = await db.query_raw(LIST_JUDGMENTS_SQL, *args)
+
+    next_cursor = None
+    if len(rows) > per_page:
+        rows = rows[:per_page]
+        last = rows[-1]
+        next_cursor = _encode_cursor(last["created_at"], last["id"])
+
+    items = [JudgmentListResponse(**row) for row in rows]
+
+    return CursorPaginatedResponse(
         items=items,
+        next_cursor=next_cursor,
         total=total,
-        page=page,
         per_page=per_page
     )
 
-# Need to import PaginatedResponse here or move it to common
-from app.models.schemas import PaginatedResponse, BlameMessages
-import json
-
 @router.get("/{judgment_id}", response_model=JudgmentResponse)
 async def get_judgment(
     judgment_id: str,
@@ -99,40 +163,29 @@ async def get_judgment(
     if not db.is_connected():
         await db.connect()
 
-    judgment = await db.judgment.find_unique(
-        where={"id": judgment_id},
+    judgment = await JudgmentRepository(db, current_user.id).get(
+        judgment_id,
         include={"suspects": True, "blame": True}
     )
     
     if not judgment:
         raise HTTPException(status_code=404, detail="Judgment not found")
-        
-    if judgment.user_id != current_user.id:
-        raise ForbiddenException()
-
-    if judgment.blame:
-        # If blame object exists, we MUST provide a `messages` field for the response model.
-        if hasattr(judgment.blame, 'message') and isinstance(judgment.blame.message, str):
-            try:
-                judgment.blame.messages = json.loads(judgment.blame.message)
-            except json.JSONDecodeError:
-                # Handle invalid JSON
-                judgment.blame.messages = BlameMessages(
-                    mild=["[메시지 파싱 오류]"],
-                    medium=["[메시지 파싱 오류]"],
-                    spicy=["[메시지 파싱 오류]"]
-                )
-        else:
-            # Handle missing or non-string `message` field
-            judgment.blame.messages = BlameMessages(
-                mild=["[메시지 없음]"],
-                medium=["[메시지 없음]"],
-                spicy=["[메시지 없음]"]
-            )
-            
+
+    # blame.message is jsonb, decoded into `messages` by BlameResponse
     return judgment
 
-@router.post("/{judgment_id}/analyze", response_model=JudgmentResponse)
+async def _get_analyzable_judgment(db, judgment_id: str, current_user):
+    judgment = await JudgmentRepository(db, current_user.id).get(judgment_id)
+    
+    if not judgment:
+        raise HTTPException(status_code=404, detail="Judgment not found")
+    if judgment.status == "completed":
+        raise HTTPException(status_code=400, detail="Already analyzed")
+    if judgment.status == "processing":
+        raise HTTPException(status_code=409, detail="Analysis already in progress")
+    return judgment
+
+@router.post("/{judgment_id}/analyze", response_model=AnalysisJobResponse, status_code=status.HTTP_202_ACCEPTED)
 async def analyze_judgment(
     judgment_id: str,
     current_user = Depends(get_current_user)
@@ -141,84 +194,115 @@ async def analyze_judgment(
     if not db.is_connected():
         await db.connect()
 
-    judgment = await db.judgment.find_unique(where={"id": judgment_id})
-    
-    if not judgment:
-        raise HTTPException(status_code=404, detail="Judgment not found")
-    if judgment.user_id != current_user.id:
-        raise ForbiddenException()
-    if judgment.status == "completed":
-        raise HTTPException(status_code=400, detail="Already analyzed")
-        
-    # 1. Fetch Commits
-    github_service = GitHubService(current_user.access_token)
-    since_date = datetime.utcnow() - timedelta(days=judgment.period_days)
-    commits_data = await github_service.get_repo_commits(
-        owner=judgment.repo_owner,
-        repo=judgment.repo_name,
-        path=judgment.file_path,
-        since=since_date.isoformat()
+    judgment = await _get_analyzable_judgment(db, judgment_id, current_user)
+
+    # Analysis runs on the background worker pool; poll GET /judgments/{id} for the result
+    job = await JobQueue(db).enqueue(judgment.id)
+    if job is None:
+        raise HTTPException(status_code=409, detail="Analysis already in progress")
+
+    return AnalysisJobResponse(
+        job_id=job["id"],
+        judgment_id=job["judgment_id"],
+        status="processing"
     )
-    
-    commits_payload = []
-    for c in commits_data['commits']:
-        commits_payload.append({
-            "sha": c.sha,
-            "message": c.message,
-            "author": c.author.username,
-            "date": c.date.isoformat(),
-            "additions": c.additions,
-            "deletions": c.deletions,
-            "diff": c.diff
-        })
-        
-    # 2. Claude Analysis
-    claude_service = ClaudeService()
-    analysis_result = await claude_service.analyze_commits({
-        "title": judgment.title,
-        "description": judgment.description,
-        "file_path": judgment.file_path,
-        "commits": commits_payload
-    })
-    
-    # 3. Save Suspects
-    for s in analysis_result['suspects']:
-        # Try to get avatar from commits or GitHub API (simplified here)
-        # We can search in commits_data for matching author
-        avatar_url = None
-        last_commit_msg = None
-        last_commit_date = None
-        commit_count = 0
-        
-        for c in commits_data['commits']:
-            if c.author.username == s['username']:
-                if not avatar_url: avatar_url = c.author.avatar_url
-                if not last_commit_msg: 
-                    last_commit_msg = c.message
-                    last_commit_date = c.date
-                commit_count += 1
-                
-        await db.suspect.create(
-            data={
-                "judgment_id": judgment.id,
-                "username": s['username'],
-                "avatar_url": avatar_url,
-                "responsibility": s['responsibility'],
-                "reason": s['reason'],
-                "commit_count": commit_count,
-                "last_commit_msg": last_commit_msg,
-                "last_commit_date": last_commit_date
-            }
-        )
-        
-    # 4. Update Judgment
-    updated_judgment = await db.judgment.update(
-        where={"id": judgment.id},
-        data={"status": "completed"},
-        include={"suspects": True, "blame": True}
+
+def _sse(event: str, data) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+@router.post("/{judgment_id}/analyze/stream")
+async def analyze_judgment_stream(
+    judgment_id: str,
+    current_user = Depends(get_current_user_with_token)
+):
+    """
+    Server-Sent Events variant of `/analyze`.
+
+    Emits `commits_fetched`, `ranked` (local pre-ranking), `prompt_built`, `token`
+    (LLM output deltas), `suspects_saved` (the final judgment) or `error` as each
+    stage completes. `prompt_built`/`token` are skipped when the local ranking is conclusive.
+
+    The analysis is queued like `/analyze` and its job is claimed by this request, so the
+    two never run the same judgment at once. If the job cannot be claimed right away (the
+    user is at the concurrency limit), a single `queued` event is sent and a background
+    worker runs it instead; a failed attempt is retried by the workers.
+    """
+    db = _ensure_prisma_client()
+    if not db.is_connected():
+        await db.connect()
+
+    # Validate before the stream starts so 404/403/400/409 are still plain HTTP errors
+    judgment = await _get_analyzable_judgment(db, judgment_id, current_user)
+
+    queue = JobQueue(db)
+    job = await queue.enqueue(judgment.id)
+    if job is None:
+        raise HTTPException(status_code=409, detail="Analysis already in progress")
+    claimed = await queue.claim(job["id"])
+
+    async def event_stream():
+        if claimed is None:
+            yield _sse("queued", {"job_id": job["id"], "judgment_id": job["judgment_id"]})
+            return
+
+        # Keeps the claim from being handed to a worker while this request is still analyzing
+        heartbeat = asyncio.ensure_future(queue.keep_alive(claimed))
+        try:
+            analysis_service = AnalysisService(db)
+            commits_data, commits_payload = await analysis_service.fetch_commits(judgment, current_user)
+            yield _sse("commits_fetched", {"count": len(commits_payload)})
+
+            ranker = SuspectRanker()
+            ranking = ranker.rank(judgment, commits_data['commits'])
+            yield _sse("ranked", {"candidates": ranking["candidates"], "confidence": ranking["confidence"]})
+
+            if ranker.is_confident(ranking):
+                analysis_result = ranking
+            else:
+                params = analysis_service.build_params(
+                    judgment, analysis_service.candidate_payload(ranking, commits_payload)
+                )
+                yield _sse("prompt_built", {"commits": len(params["commits"])})
+
+                claude_service = ClaudeService()
+                analysis_result = None
+                try:
+                    async for kind, value in claude_service.stream_analyze_commits(params):
+                        if kind == "token":
+                            yield _sse("token", {"text": value})
+                        else:
+                            analysis_result = value
+                except ClaudeAPIException:
+                    if not ranking["suspects"]:
+                        raise
+                    analysis_result = ranking
+
+            if heartbeat.done():
+                # The lease lapsed (e.g. the database was unreachable) and a worker has taken the job over
+                yield _sse("queued", {"job_id": job["id"], "judgment_id": job["judgment_id"]})
+                return
+
+            updated_judgment = await analysis_service.save_suspects(judgment, analysis_result, commits_data)
+            await queue.complete(claimed)
+            yield _sse(
+                "suspects_saved",
+                JudgmentResponse.model_validate(updated_judgment).model_dump(mode="json"),
+            )
+        except (GitHubAPIException, ClaudeAPIException) as e:
+            await queue.fail(claimed, str(e))
+            yield _sse("error", {"message": type(e).__name__, "detail": str(e)})
+        except Exception as e:
+            # A disconnected client (cancellation) leaves the job running; its visibility timeout hands it to a worker
+            await queue.fail(claimed, str(e))
+            raise
+        finally:
+            heartbeat.cancel()
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
-    
-    return updated_judgment
 
 @router.delete("/{judgment_id}")
 async def delete_judgment(
@@ -229,11 +313,6 @@ async def delete_judgment(
     if not db.is_connected():
         await db.connect()
 
-    judgment = await db.judgment.find_unique(where={"id": judgment_id})
-    if not judgment:
+    if not await JudgmentRepository(db, current_user.id).delete(judgment_id):
         raise HTTPException(status_code=404, detail="Judgment not found")
-    if judgment.user_id != current_user.id:
-        raise ForbiddenException()
-        
-    await db.judgment.delete(where={"id": judgment_id})
     return {"message": "Deleted successfully"}
@@ -0,0 +1,122 @@
+from datetime import datetime, timedelta
+from app.services.github_service import GitHubService
+from app.services.claude_service import ClaudeService
+from app.services.suspect_ranker import SuspectRanker
+from app.utils.exceptions import ClaudeAPIException
+from app.utils.metrics import metrics
+
+
+class AnalysisService:
+    """Fetch commits -> Claude analysis -> persist suspects, shared by the API and the job workers."""
+
+    def __init__(self, db):
+        self.db = db
+
+    async def fetch_commits(self, judgment, user):
+        github_service = GitHubService(user.access_token)
+        since_date = datetime.utcnow() - timedelta(days=judgment.period_days)
+        commits_data = await github_service.get_repo_commits(
+            owner=judgment.repo_owner,
+            repo=judgment.repo_name,
+            path=judgment.file_path,
+            since=since_date.isoformat()
+        )
+
+        commits_payload = []
+        for c in commits_data['commits']:
+            commits_payload.append({
+                "sha": c.sha,
+                "message": c.message,
+                "author": c.author.username,
+                "date": c.date.isoformat(),
+                "additions": c.additions,
+                "deletions": c.deletions,
+                "diff": c.diff
+            })
+        return commits_data, commits_payload
+
+    def build_params(self, judgment, commits_payload: list) -> dict:
+        return {
+            "title": judgment.title,
+            "description": judgment.description,
+            "file_path": judgment.file_path,
+            "commits": commits_payload
+        }
+
+    def candidate_payload(self, ranking: dict, commits_payload: list) -> list:
+        """Only the top-ranked authors' commits are worth sending to Claude."""
+        if not ranking["candidates"]:
+            return commits_payload
+        candidates = set(ranking["candidates"])
+        return [c for c in commits_payload if c["author"] in candidates]
+
+    def build_suspect_rows(self, analysis_result: dict, commits_data: dict) -> list:
+        rows = []
+        for s in analysis_result['suspects']:
+            # Try to get avatar from commits or GitHub API (simplified here)
+            # We can search in commits_data for matching author
+            avatar_url = None
+            last_commit_msg = None
+            last_commit_date = None
+            commit_count = 0
+
+            for c in commits_data['commits']:
+                if c.author.username == s['username']:
+                    if not avatar_url: avatar_url = c.author.avatar_url
+                    if not last_commit_msg:
+                        last_commit_msg = c.message
+                        last_commit_date = c.date
+                    commit_count += 1
+
+            rows.append({
+                "username": s['username'],
+                "avatar_url": avatar_url,
+                "responsibility": s['responsibility'],
+                "reason": s['reason'],
+                "commit_count": commit_count,
+                "last_commit_msg": last_commit_msg,
+                "last_commit_date": last_commit_date
+            })
+        return rows
+
+    async def save_suspects(self, judgment, analysis_result: dict, commits_data: dict):
+        # One nested write: the engine replaces the suspects (dropping rows from an earlier,
+        # interrupted attempt), inserts the new ones with a single INSERT and flips the status
+        # inside one transaction, in one round trip.
+        return await self.db.judgment.update(
+            where={"id": judgment.id},
+            data={
+                "status": "completed",
+                "suspects": {
+                    "deleteMany": {},
+                    "createMany": {"data": self.build_suspect_rows(analysis_result, commits_data)},
+                },
+            },
+            include={"suspects": True, "blame": True}
+        )
+
+    async def analyze(self, judgment, user):
+        # 1. Fetch Commits
+        commits_data, commits_payload = await self.fetch_commits(judgment, user)
+
+        # 2. Local pre-ranking: skip Claude entirely when one author clearly dominates
+        ranker = SuspectRanker()
+        ranking = ranker.rank(judgment, commits_data['commits'])
+        if ranker.is_confident(ranking):
+            metrics.incr("suspect_ranker.llm_skipped")
+            analysis_result = ranking
+        else:
+            # 3. Claude Analysis on the top candidates, falling back to the local ranking
+            claude_service = ClaudeService()
+            try:
+                analysis_result = await claude_service.analyze_commits(
+                    self.build_params(judgment, self.candidate_payload(ranking, commits_payload))
+                )
+            except ClaudeAPIException:
+                if not ranking["suspects"]:
+                    raise
+                metrics.incr("suspect_ranker.llm_fallback")
+                analysis_result = ranking
+
+        # 4. Save Suspects & Update Judgment
+        return await self.save_suspects(judgment, analysis_result, commits_data)
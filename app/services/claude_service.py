@@ -1,87 +1,241 @@
-from anthropic import Anthropic
-import json
 import asyncio
+import json
+import logging
 from app.config import settings
 from app.utils.exceptions import ClaudeAPIException
+from app.utils.metrics import metrics
+from app.services.llm_scheduler import llm_scheduler, estimate_tokens, INTERACTIVE, BULK
+
+logger = logging.getLogger(__name__)
+
+# Static instruction blocks are sent as the system prompt with `cache_control`
+# so that they are byte-identical across calls and can be served from the prompt cache.
+# Only the incident details / commits (the user message) change per request.
+ANALYZE_SYSTEM_PROMPT = """
+당신은 Git 커밋 히스토리를 분석하여 버그/장애의 책임자를 판단하는 AI입니다.
+
+사용자는 [사건 정보]와 [커밋 히스토리]를 제공합니다.
+각 커밋에는 'diff' 필드가 포함되어 있으며, 이는 해당 커밋의 코드 변경 내용을 보여줍니다.
+
+제공된 정보를 분석하여 각 개발자의 책임 비율을 판단해주세요.
+
+판단 기준:
+1. **코드 변경 내용(diff) 심층 분석**: diff 내용을 최우선으로 분석하여, 에러의 직접적인 원인이 되는 코드를 작성하거나 수정한 사람에게 가장 높은 책임을 부여하세요.
+2. **에러와의 연관성**: 커밋 메시지와 에러 내용의 연관성을 고려하세요.
+3. **최신성**: 해당 파일/기능의 마지막 수정자이거나, 최근에 커밋했을수록 책임 비율이 높아집니다.
+4. **기여도**: 단순히 코드 라인 수가 아닌, 로직 변경의 중요도를 파악하여 책임을 판단하세요.
+
+반드시 다음 JSON 형식으로만 응답하세요 (다른 텍스트 없이):
+{
+  "suspects": [
+    {
+      "username": "개발자명",
+      "responsibility": 책임비율(0-100 정수),
+      "reason": "책임 사유 (한국어, 1-2문장)"
+    }
+  ]
+}
+
+주의:
+- 책임 비율의 합은 반드시 100이어야 합니다
+- 최소 1명, 최대 5명까지 선정
+- responsibility가 높은 순으로 정렬
+"""
+
+BLAME_MESSAGE_SYSTEM_PROMPT = """
+주어진 상황에 맞는 Blame 메시지를 정확히 3개의 짧은 문장으로 작성해주세요.
+
+강도별 톤:
+- mild (순한맛): 정중하고 부드럽게 ("확인 부탁드려요~", "시간 되실 때 봐주세요")
+- medium (중간맛): 유머러스하게 ("커피 한 잔 사주세요 ☕", "다음엔 테스트 코드 좀...")
+- spicy (매운맛): 직설적이고 재미있게 ("야 이거 누가 짠 거야", "책임지세요 선배님")
+
+반드시 다음 JSON 형식으로만 응답하세요:
+["문장1", "문장2", "문장3 (마지막에 이모지 포함)"]
+
+예시:
+["hjy080530님 확인 부탁드려요.", "신택스 에러가 발생했습니다.", "시간 되실 때 봐주세요~ 🙏"]
+"""
+
+
+def _cached_system(text: str) -> list:
+    # Always marked: prefixes below the model's minimum cacheable length (2048 tokens for
+    # claude-3-haiku) are simply not cached, which `_record_usage` reports as `cache_uncached`
+    return [{"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}]
+
+
+# (sync, async) SDK clients shared by every ClaudeService so their connection pools are reused
+_clients = None
+
+
+def _get_clients():
+    global _clients
+    if _clients is None:
+        # the SDK is slow to import, only pay for it once a request actually needs Claude
+        from anthropic import Anthropic, AsyncAnthropic
+
+        # Retries are owned by the scheduler so they respect the shared rate budget
+        _clients = (
+            Anthropic(api_key=settings.CLAUDE_API_KEY, max_retries=0),
+            AsyncAnthropic(api_key=settings.CLAUDE_API_KEY, max_retries=0),
+        )
+    return _clients
+
+
+async def close_clients():
+    """Close the shared SDK clients, on shutdown."""
+    global _clients
+    if _clients is None:
+        return
+    client, async_client = _clients
+    _clients = None
+    client.close()
+    await async_client.close()
+
 
 class ClaudeService:
     def __init__(self):
-        self.client = Anthropic(api_key=settings.CLAUDE_API_KEY)
+        self.client, self.async_client = _get_clients()
 
-    async def analyze_commits(self, params: dict) -> dict:
-        prompt = f"""
-        당신은 Git 커밋 히스토리를 분석하여 버그/장애의 책임자를 판단하는 AI입니다.
+    def _record_usage(self, kind: str, response):
+        """Surface input/output and prompt-cache token counts from the response usage."""
+        usage = getattr(response, "usage", None)
+        if usage is None:
+            return
+
+        input_tokens = getattr(usage, "input_tokens", 0) or 0
+        output_tokens = getattr(usage, "output_tokens", 0) or 0
+        cache_read = getattr(usage, "cache_read_input_tokens", 0) or 0
+        cache_write = getattr(usage, "cache_creation_input_tokens", 0) or 0
 
+        metrics.incr(f"claude.{kind}.requests")
+        metrics.incr(f"claude.{kind}.input_tokens", input_tokens)
+        metrics.incr(f"claude.{kind}.output_tokens", output_tokens)
+        metrics.incr(f"claude.{kind}.cache_read_input_tokens", cache_read)
+        metrics.incr(f"claude.{kind}.cache_creation_input_tokens", cache_write)
+        # hit: served from the cache, miss: written to it, uncached: prefix too short to be cached
+        if cache_read:
+            metrics.incr(f"claude.{kind}.cache_hits")
+        elif cache_write:
+            metrics.incr(f"claude.{kind}.cache_misses")
+        else:
+            metrics.incr(f"claude.{kind}.cache_uncached")
+
+        logger.debug(
+            "claude %s usage: input=%s output=%s cache_read=%s cache_write=%s",
+            kind, input_tokens, output_tokens, cache_read, cache_write,
+        )
+
+    def _build_analysis_prompt(self, params: dict) -> str:
+        return f"""
         [사건 정보]
         제목: {params['title']}
         에러 내용: {params['description']}
         관련 파일: {params['file_path']}
 
         [커밋 히스토리]
-        각 커밋에는 'diff' 필드가 포함되어 있으며, 이는 해당 커밋의 코드 변경 내용을 보여줍니다.
         {json.dumps(params['commits'], indent=2, ensure_ascii=False)}
-
-        위 정보를 분석하여 각 개발자의 책임 비율을 판단해주세요.
-
-        판단 기준:
-        1. **코드 변경 내용(diff) 심층 분석**: diff 내용을 최우선으로 분석하여, 에러의 직접적인 원인이 되는 코드를 작성하거나 수정한 사람에게 가장 높은 책임을 부여하세요.
-        2. **에러와의 연관성**: 커밋 메시지와 에러 내용의 연관성을 고려하세요.
-        3. **최신성**: 해당 파일/기능의 마지막 수정자이거나, 최근에 커밋했을수록 책임 비율이 높아집니다.
-        4. **기여도**: 단순히 코드 라인 수가 아닌, 로직 변경의 중요도를 파악하여 책임을 판단하세요.
-
-        반드시 다음 JSON 형식으로만 응답하세요 (다른 텍스트 없이):
-        {{
-          "suspects": [
-            {{
-              "username": "개발자명",
-              "responsibility": 책임비율(0-100 정수),
-              "reason": "책임 사유 (한국어, 1-2문장)"
-            }}
-          ]
-        }}
-
-        주의:
-        - 책임 비율의 합은 반드시 100이어야 합니다
-        - 최소 1명, 최대 5명까지 선정
-        - responsibility가 높은 순으로 정렬
         """
 
+    def _extract_json(self, text: str):
+        # Extract JSON from response (might have extra text)
+        text = text.strip()
+
+        # Try to find JSON in the response
+        if text.startswith("```json"):
+            text = text.split("```json")[1].split("```")[0].strip()
+        elif text.startswith("```"):
+            text = text.split("```")[1].split("```")[0].strip()
+
+        return json.loads(text)
+
+    async def analyze_commits(self, params: dict) -> dict:
+        prompt = self._build_analysis_prompt(params)
+        cost = estimate_tokens(ANALYZE_SYSTEM_PROMPT, prompt, max_tokens=2000)
+
+        # Rate-limit / overload errors are retried by the scheduler (honouring retry-after);
+        # here we only re-ask when the model returns malformed JSON.
         retries = 2
         for attempt in range(retries + 1):
             try:
-                response = await asyncio.to_thread(
+                response = await llm_scheduler.run(
                     self.client.messages.create,
+                    cost=cost,
+                    lane=BULK,
                     model="claude-3-haiku-20240307",
                     max_tokens=2000,
+                    system=_cached_system(ANALYZE_SYSTEM_PROMPT),
                     messages=[
                         {"role": "user", "content": prompt}
                     ]
                 )
+                self._record_usage("analyze", response)
 
                 text = response.content[0].text
                 if not text:
                     raise ValueError("Empty response from Claude")
 
-                # Extract JSON from response (might have extra text)
-                text = text.strip()
+                return self._extract_json(text)
 
-                # Try to find JSON in the response
-                if text.startswith("```json"):
-                    text = text.split("```json")[1].split("```")[0].strip()
-                elif text.startswith("```"):
-                    text = text.split("```")[1].split("```")[0].strip()
+            except ValueError as e:
+                if attempt == retries:
+                    raise ClaudeAPIException(f"Claude Analysis Failed: {str(e)}")
+            except Exception as e:
+                raise ClaudeAPIException(f"Claude Analysis Failed: {str(e)}")
 
-                return json.loads(text)
+    async def stream_analyze_commits(self, params: dict):
+        """
+        Streaming variant of `analyze_commits`.
+
+        Yields ("token", text_delta) as the model generates, then a single
+        ("result", parsed_json) once the message is complete.
+        """
+        prompt = self._build_analysis_prompt(params)
+        cost = estimate_tokens(ANALYZE_SYSTEM_PROMPT, prompt, max_tokens=2000)
 
+        # Rate-limit / overload errors are retried like `llm_scheduler.run` does, as long as
+        # no token has been sent to the client yet
+        attempt = 0
+        while True:
+            streamed = False
+            try:
+                async with llm_scheduler.slot(cost, lane=BULK), self.async_client.messages.stream(
+                    model="claude-3-haiku-20240307",
+                    max_tokens=2000,
+                    system=_cached_system(ANALYZE_SYSTEM_PROMPT),
+                    messages=[
+                        {"role": "user", "content": prompt}
+                    ]
+                ) as stream:
+                    async for text in stream.text_stream:
+                        streamed = True
+                        yield "token", text
+                    response = await stream.get_final_message()
+                    llm_scheduler.settle(cost, response)
+                break
             except Exception as e:
-                if attempt == retries:
+                delay = None if streamed else llm_scheduler.retry_delay(e, attempt)
+                if delay is None:
                     raise ClaudeAPIException(f"Claude Analysis Failed: {str(e)}")
-                await asyncio.sleep(1)
+
+            metrics.incr("llm_scheduler.retries")
+            await asyncio.sleep(delay)
+            attempt += 1
+
+        try:
+            self._record_usage("analyze", response)
+
+            text = response.content[0].text
+            if not text:
+                raise ValueError("Empty response from Claude")
+            result = self._extract_json(text)
+        except Exception as e:
+            raise ClaudeAPIException(f"Claude Analysis Failed: {str(e)}")
+
+        yield "result", result
 
     async def generate_blame_message(self, params: dict, intensity: str) -> list:
         prompt = f"""
-        다음 상황에 맞는 Blame 메시지를 정확히 3개의 짧은 문장으로 작성해주세요.
-
         프로젝트: {params['repo_name']}
         사건: {params['title']}
         범인: {params['target_username']}
@@ -90,36 +244,23 @@ class ClaudeService:
         책임 사유: {params['reason']}
 
         강도: {intensity}
-        - mild (순한맛): 정중하고 부드럽게 ("확인 부탁드려요~", "시간 되실 때 봐주세요")
-        - medium (중간맛): 유머러스하게 ("커피 한 잔 사주세요 ☕", "다음엔 테스트 코드 좀...")
-        - spicy (매운맛): 직설적이고 재미있게 ("야 이거 누가 짠 거야", "책임지세요 선배님")
-
-        반드시 다음 JSON 형식으로만 응답하세요:
-        ["문장1", "문장2", "문장3 (마지막에 이모지 포함)"]
-
-        예시:
-        ["hjy080530님 확인 부탁드려요.", "신택스 에러가 발생했습니다.", "시간 되실 때 봐주세요~ 🙏"]
         """
 
         try:
-            response = await asyncio.to_thread(
+            response = await llm_scheduler.run(
                 self.client.messages.create,
+                cost=estimate_tokens(BLAME_MESSAGE_SYSTEM_PROMPT, prompt, max_tokens=300),
+                lane=INTERACTIVE,
                 model="claude-3-haiku-20240307",
                 max_tokens=300,
+                system=_cached_system(BLAME_MESSAGE_SYSTEM_PROMPT),
                 messages=[
                     {"role": "user", "content": prompt}
                 ]
             )
+            self._record_usage("blame_message", response)
 
-            text = response.content[0].text.strip()
-
-            # Extract JSON from response
-            if text.startswith("```json"):
-                text = text.split("```json")[1].split("```")[0].strip()
-            elif text.startswith("```"):
-                text = text.split("```")[1].split("```")[0].strip()
-
-            return json.loads(text)
+            return self._extract_json(response.content[0].text)
 
         except Exception as e:
             raise ClaudeAPIException(f"Claude Message Generation Failed: {str(e)}")
@@ -1,16 +1,23 @@
-from PIL import Image, ImageDraw, ImageFont
 from io import BytesIO
+from typing import TYPE_CHECKING
 import httpx
-from supabase import create_client, Client
 from app.config import settings
 import asyncio
 
+if TYPE_CHECKING:
+    from supabase import Client
+
 class ImageService:
     def __init__(self):
-        self.supabase: Client = create_client(settings.SUPABASE_URL, settings.SUPABASE_KEY)
+        # Pillow and the supabase SDK are only needed to render share images, keep them off the startup path
+        from supabase import create_client
+
+        self.supabase: "Client" = create_client(settings.SUPABASE_URL, settings.SUPABASE_KEY)
         self.bucket_name = "blame-images"
 
     async def generate_blame_image(self, params: dict) -> str:
+        from PIL import Image, ImageDraw, ImageFont
+
         # 1. Create Background
         width, height = 1200, 630
         image = Image.new('RGB', (width, height))
@@ -0,0 +1,254 @@
+import asyncio
+import contextlib
+import logging
+from app.config import settings
+from app.prisma_client import loader_scope
+from app.services.analysis_service import AnalysisService
+from app.utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# Judgment.status moves pending -> processing -> completed | failed.
+# AnalysisJob.status moves queued -> running -> completed | failed (and back to queued on retry).
+# A claim is identified by (id, attempts): reclaiming a job bumps `attempts`, so a worker whose lease
+# lapsed can no longer extend, complete or fail the job.
+
+ENQUEUE_SQL = """
+WITH claimed AS (
+    UPDATE "Judgment"
+    SET "status" = 'processing'
+    WHERE "id" = $1::uuid AND "status" IN ('pending', 'failed')
+    RETURNING "id", "user_id"
+)
+INSERT INTO "AnalysisJob" ("judgment_id", "user_id", "max_attempts", "updated_at")
+SELECT "id", "user_id", $2, CURRENT_TIMESTAMP FROM claimed
+RETURNING "id", "judgment_id", "status"
+"""
+
+# Picks a runnable job: queued and due, or running with an expired visibility timeout; $2 restricts it
+# to one job, $3 (comma separated) excludes users found at the limit by an earlier pick of the same claim.
+# Users already at the concurrency limit are skipped; SKIP LOCKED lets workers pick in parallel, the
+# row stays locked until the claiming transaction ends.
+CANDIDATE_SQL = """
+SELECT c."id", c."user_id" FROM "AnalysisJob" AS c
+WHERE (
+    (c."status" = 'queued' AND c."run_at" <= CURRENT_TIMESTAMP)
+    OR (c."status" = 'running' AND c."locked_until" < CURRENT_TIMESTAMP)
+)
+AND ($2::uuid IS NULL OR c."id" = $2::uuid)
+AND ($3::text IS NULL OR NOT (c."user_id"::text = ANY(string_to_array($3::text, ','))))
+AND (
+    SELECT count(*) FROM "AnalysisJob" AS r
+    WHERE r."user_id" = c."user_id"
+      AND r."status" = 'running'
+      AND r."locked_until" >= CURRENT_TIMESTAMP
+) < $1
+ORDER BY c."run_at"
+LIMIT 1
+FOR UPDATE SKIP LOCKED
+"""
+
+# Serializes claims for one user until the claiming transaction ends. The candidate query's running
+# count comes from a snapshot taken before the lock, so it is checked again with RUNNING_COUNT_SQL.
+LOCK_USER_SQL = 'SELECT pg_advisory_xact_lock(hashtext($1))'
+
+RUNNING_COUNT_SQL = """
+SELECT count(*)::int AS "running" FROM "AnalysisJob"
+WHERE "user_id" = $1::uuid AND "status" = 'running' AND "locked_until" >= CURRENT_TIMESTAMP
+"""
+
+CLAIM_SQL = """
+UPDATE "AnalysisJob"
+SET "status" = 'running',
+    "attempts" = "attempts" + 1,
+    "locked_until" = CURRENT_TIMESTAMP + make_interval(secs => $2),
+    "updated_at" = CURRENT_TIMESTAMP
+WHERE "id" = $1::uuid
+RETURNING "id", "judgment_id", "user_id", "attempts", "max_attempts"
+"""
+
+# The statements below only apply while the claim is still owned (see above): $2 is the claim's attempts
+HEARTBEAT_SQL = """
+UPDATE "AnalysisJob"
+SET "locked_until" = CURRENT_TIMESTAMP + make_interval(secs => $3), "updated_at" = CURRENT_TIMESTAMP
+WHERE "id" = $1::uuid AND "status" = 'running' AND "attempts" = $2
+"""
+
+COMPLETE_SQL = """
+UPDATE "AnalysisJob"
+SET "status" = 'completed', "locked_until" = NULL, "last_error" = NULL, "updated_at" = CURRENT_TIMESTAMP
+WHERE "id" = $1::uuid AND "status" = 'running' AND "attempts" = $2
+"""
+
+RETRY_SQL = """
+UPDATE "AnalysisJob"
+SET "status" = 'queued',
+    "locked_until" = NULL,
+    "run_at" = CURRENT_TIMESTAMP + make_interval(secs => $3),
+    "last_error" = $4,
+    "updated_at" = CURRENT_TIMESTAMP
+WHERE "id" = $1::uuid AND "status" = 'running' AND "attempts" = $2
+"""
+
+FAIL_SQL = """
+WITH failed AS (
+    UPDATE "AnalysisJob"
+    SET "status" = 'failed', "locked_until" = NULL, "last_error" = $3, "updated_at" = CURRENT_TIMESTAMP
+    WHERE "id" = $1::uuid AND "status" = 'running' AND "attempts" = $2
+    RETURNING "judgment_id"
+)
+UPDATE "Judgment" SET "status" = 'failed'
+WHERE "id" IN (SELECT "judgment_id" FROM failed)
+"""
+
+
+class JobQueue:
+    """Postgres-backed queue of judgment analyses, accessed through raw queries on the Prisma client."""
+
+    def __init__(self, db):
+        self.db = db
+
+    async def enqueue(self, judgment_id: str):
+        """Mark the judgment as processing and queue its analysis. Returns None if it is not analyzable."""
+        job = await self.db.query_first(ENQUEUE_SQL, judgment_id, settings.ANALYSIS_MAX_ATTEMPTS)
+        if job:
+            metrics.incr("jobs.enqueued")
+        return job
+
+    async def claim(self, job_id: str = None):
+        """Claim the next runnable job, or only the given one. Returns None if there is nothing to claim."""
+        limit = settings.ANALYSIS_PER_USER_CONCURRENCY
+        capped = []
+        async with self.db.tx() as tx:
+            while True:
+                candidate = await tx.query_first(CANDIDATE_SQL, limit, job_id, ",".join(capped) or None)
+                if candidate is None:
+                    return None
+
+                # Another worker may have claimed a job for this user since the candidate query's snapshot
+                await tx.execute_raw(LOCK_USER_SQL, candidate["user_id"])
+                running = await tx.query_first(RUNNING_COUNT_SQL, candidate["user_id"])
+                if running["running"] < limit:
+                    return await tx.query_first(CLAIM_SQL, candidate["id"], settings.ANALYSIS_VISIBILITY_TIMEOUT)
+
+                # Other users may still have runnable jobs
+                capped.append(candidate["user_id"])
+
+    async def extend(self, job: dict) -> bool:
+        """Push back the visibility timeout of a running job. Returns False if the claim was lost."""
+        return bool(await self.db.execute_raw(
+            HEARTBEAT_SQL, job["id"], job["attempts"], settings.ANALYSIS_VISIBILITY_TIMEOUT
+        ))
+
+    async def keep_alive(self, job: dict):
+        """Extend the job's lease every third of the visibility timeout, returns once the lease is lost."""
+        while True:
+            await asyncio.sleep(settings.ANALYSIS_VISIBILITY_TIMEOUT / 3)
+            try:
+                if not await self.extend(job):
+                    self._lost(job)
+                    return
+            except Exception as e:
+                # Keep trying: the lease only lapses once a whole visibility timeout passes without extension
+                logger.warning("analysis job %s heartbeat failed: %s", job["id"], e)
+
+    def _lost(self, job: dict):
+        logger.warning("analysis job %s attempt %s lost its lease", job["id"], job["attempts"])
+        metrics.incr("jobs.lease_lost")
+
+    async def complete(self, job: dict):
+        if not await self.db.execute_raw(COMPLETE_SQL, job["id"], job["attempts"]):
+            self._lost(job)
+            return
+        metrics.incr("jobs.completed")
+
+    async def fail(self, job: dict, error: str):
+        if job["attempts"] < job["max_attempts"]:
+            backoff = settings.ANALYSIS_RETRY_BACKOFF * (2 ** (job["attempts"] - 1))
+            owned = await self.db.execute_raw(RETRY_SQL, job["id"], job["attempts"], backoff, error)
+            counter = "jobs.retried"
+        else:
+            owned = await self.db.execute_raw(FAIL_SQL, job["id"], job["attempts"], error)
+            counter = "jobs.failed"
+
+        if not owned:
+            self._lost(job)
+            return
+        metrics.incr(counter)
+
+
+class AnalysisWorkerPool:
+    """Runs `concurrency` async workers that claim and process analysis jobs."""
+
+    def __init__(self, db, concurrency: int = None, poll_interval: float = None):
+        self.db = db
+        self.queue = JobQueue(db)
+        self.concurrency = concurrency if concurrency is not None else settings.ANALYSIS_WORKERS
+        self.poll_interval = poll_interval if poll_interval is not None else settings.ANALYSIS_POLL_INTERVAL
+        self._tasks = []
+
+    def start(self):
+        # Workers copy the context at creation, so they all share one scope: lookups made by
+        # concurrent jobs are batched, but nothing is cached across jobs.
+        scope = loader_scope(cache=False) if settings.PRISMA_AUTO_BATCH else contextlib.nullcontext()
+        with scope:
+            for i in range(self.concurrency):
+                self._tasks.append(asyncio.create_task(self._worker(i)))
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _worker(self, index: int):
+        while True:
+            try:
+                job = await self.queue.claim()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("analysis worker %s failed to claim a job: %s", index, e)
+                job = None
+
+            if job is None:
+                await asyncio.sleep(self.poll_interval)
+                continue
+
+            await self._run(job)
+
+    async def _run(self, job: dict):
+        # A job whose visibility timeout expired on its final attempt is not retried again
+        if job["attempts"] > job["max_attempts"]:
+            await self.queue.fail(job, "Visibility timeout exceeded")
+            return
+
+        # The lease is extended while the analysis runs; once it is lost another worker owns the job
+        analysis = asyncio.ensure_future(self._analyze(job))
+        heartbeat = asyncio.ensure_future(self.queue.keep_alive(job))
+        try:
+            await asyncio.wait({analysis, heartbeat}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            analysis.cancel()
+            heartbeat.cancel()
+            await asyncio.gather(analysis, heartbeat, return_exceptions=True)
+
+        if analysis.cancelled():
+            return
+
+        error = analysis.exception()
+        if error is not None:
+            logger.warning("analysis job %s attempt %s failed: %s", job["id"], job["attempts"], error)
+            await self.queue.fail(job, str(error))
+            return
+
+        await self.queue.complete(job)
+
+    async def _analyze(self, job: dict):
+        judgment = await self.db.judgment.find_unique(where={"id": job["judgment_id"]})
+        user = await self.db.user.find_unique(where={"id": job["user_id"]}, select=["id", "access_token"])
+        if judgment is None or user is None:
+            # Judgment or user deleted while queued; nothing left to analyze
+            return
+
+        await AnalysisService(self.db).analyze(judgment, user)
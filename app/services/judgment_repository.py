@@ -0,0 +1,58 @@
+from app.utils.exceptions import ForbiddenException
+
+
+class JudgmentRepository:
+    """
+    Judgment/blame lookups scoped to one user.
+
+    The ownership predicate is part of the `where` clause, so the happy path is a
+    single query. Only on a miss is a cheap `count` issued to tell "someone else's"
+    (ForbiddenException) apart from "doesn't exist" (None / False, callers raise 404).
+    """
+
+    def __init__(self, db, user_id: str):
+        self.db = db
+        self.user_id = user_id
+
+    async def _forbid_if_exists(self, actions, where: dict):
+        if await actions.count(where=where, take=1):
+            raise ForbiddenException()
+
+    async def get(self, judgment_id: str, include: dict = None, select: list = None):
+        judgment = await self.db.judgment.find_first(
+            where={"id": judgment_id, "user_id": self.user_id},
+            include=include,
+            select=select
+        )
+        if judgment is None:
+            await self._forbid_if_exists(self.db.judgment, {"id": judgment_id})
+        return judgment
+
+    async def get_with_blame(self, judgment_id: str, include: dict = None, select: list = None):
+        """Like `get`, but a judgment without a blame counts as missing (404 before 403)."""
+        judgment = await self.db.judgment.find_first(
+            where={"id": judgment_id, "user_id": self.user_id},
+            include=include,
+            select=select
+        )
+        if judgment is None:
+            await self._forbid_if_exists(self.db.blame, {"judgment_id": judgment_id})
+            return None
+        return judgment if judgment.blame is not None else None
+
+    async def get_blame(self, judgment_id: str):
+        blame = await self.db.blame.find_first(
+            where={"judgment_id": judgment_id, "judgment": {"is": {"user_id": self.user_id}}}
+        )
+        if blame is None:
+            await self._forbid_if_exists(self.db.blame, {"judgment_id": judgment_id})
+        return blame
+
+    async def delete(self, judgment_id: str) -> bool:
+        deleted = await self.db.judgment.delete_many(
+            where={"id": judgment_id, "user_id": self.user_id}
+        )
+        if not deleted:
+            await self._forbid_if_exists(self.db.judgment, {"id": judgment_id})
+            return False
+        return True
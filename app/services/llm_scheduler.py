@@ -0,0 +1,200 @@
+import asyncio
+import heapq
+import itertools
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import partial
+from app.config import settings
+from app.utils.metrics import metrics
+
+# Priority lanes: lower value is served first
+INTERACTIVE = 0
+BULK = 1
+
+_LANE_NAMES = {INTERACTIVE: "interactive", BULK: "bulk"}
+
+_RETRYABLE_STATUS = {408, 409, 429, 500, 502, 503, 504, 529}
+
+
+def estimate_tokens(*texts: str, max_tokens: int = 0) -> int:
+    """Rough token cost of a request: ~3 characters per token for the prompt plus the output budget."""
+    return sum(len(t) for t in texts if t) // 3 + max_tokens
+
+
+def usage_tokens(response):
+    """Tokens a response actually counted against the budget, None when it reports no usage."""
+    usage = getattr(response, "usage", None)
+    if usage is None:
+        return None
+    return sum(
+        getattr(usage, field, 0) or 0
+        for field in ("input_tokens", "cache_creation_input_tokens", "cache_read_input_tokens", "output_tokens")
+    )
+
+
+def _retry_after(exc: Exception):
+    response = getattr(exc, "response", None)
+    if response is None:
+        return None
+    headers = response.headers
+    try:
+        if "retry-after-ms" in headers:
+            return float(headers["retry-after-ms"]) / 1000
+        if "retry-after" in headers:
+            return float(headers["retry-after"])
+    except ValueError:
+        return None
+    return None
+
+
+def _is_retryable(exc: Exception) -> bool:
+    # a request has already been made at this point so the SDK is loaded
+    import anthropic
+
+    if isinstance(exc, anthropic.APIConnectionError):
+        return True
+    if isinstance(exc, anthropic.APIStatusError):
+        return exc.status_code in _RETRYABLE_STATUS
+    return False
+
+
+class LLMScheduler:
+    """
+    Admits Claude requests under a concurrent-request limit and a tokens-per-minute budget.
+
+    Waiters are served strictly by (lane, arrival order), so interactive requests overtake
+    queued bulk analyses. Blocking SDK calls run on a dedicated, bounded thread pool.
+
+    A request reserves its estimated cost up front; `settle` then refunds or charges the
+    difference to what its response reports as used.
+    """
+
+    def __init__(self, max_concurrency: int, tokens_per_minute: int, max_retries: int = 3):
+        self.max_concurrency = max_concurrency
+        self.capacity = tokens_per_minute
+        self.refill_rate = tokens_per_minute / 60.0
+        self.max_retries = max_retries
+
+        self._tokens = float(tokens_per_minute)
+        self._updated = time.monotonic()
+        self._active = 0
+        self._waiters = []
+        self._seq = itertools.count()
+        self._timer = None
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="claude")
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.refill_rate)
+        self._updated = now
+
+    def _dispatch(self):
+        self._timer = None
+        self._refill()
+
+        while self._waiters and self._active < self.max_concurrency:
+            _, _, cost, future = self._waiters[0]
+            if future.done():
+                heapq.heappop(self._waiters)
+                continue
+            if cost > self._tokens:
+                # Head of the queue waits for the budget; later waiters must not jump ahead of it
+                delay = (cost - self._tokens) / self.refill_rate
+                self._timer = asyncio.get_running_loop().call_later(delay, self._dispatch)
+                break
+
+            heapq.heappop(self._waiters)
+            self._tokens -= cost
+            self._active += 1
+            future.set_result(None)
+
+        metrics.set("llm_scheduler.queue_depth", len(self._waiters))
+        metrics.set("llm_scheduler.active", self._active)
+
+    def _wake(self):
+        # the head of the queue may have changed (a new interactive waiter) or the budget grown,
+        # so re-evaluate now instead of waiting for a timer armed for the previous head
+        if self._timer is not None:
+            self._timer.cancel()
+        self._dispatch()
+
+    def _release(self):
+        self._active -= 1
+        self._wake()
+
+    def _reserved(self, cost: int) -> int:
+        return min(cost, self.capacity)
+
+    async def _acquire(self, cost: int, lane: int):
+        cost = self._reserved(cost)
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (lane, next(self._seq), cost, future))
+
+        started = time.monotonic()
+        self._wake()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self._release()
+            raise
+
+        lane_name = _LANE_NAMES.get(lane, str(lane))
+        metrics.incr(f"llm_scheduler.{lane_name}.acquired")
+        metrics.incr(f"llm_scheduler.{lane_name}.wait_ms", int((time.monotonic() - started) * 1000))
+
+    def settle(self, cost: int, response):
+        """Reconcile the `cost` reserved for a request with the usage reported by its response."""
+        used = usage_tokens(response)
+        if used is None:
+            return
+        self._refill()
+        # an underestimate leaves the budget in debt, which later waiters wait out
+        self._tokens = min(self.capacity, self._tokens + self._reserved(cost) - used)
+        metrics.incr("llm_scheduler.estimate_error_tokens", abs(self._reserved(cost) - used))
+        self._wake()
+
+    def retry_delay(self, exc: Exception, attempt: int):
+        """Seconds to back off before retrying after `exc`, None if it should be raised instead."""
+        if attempt >= self.max_retries or not _is_retryable(exc):
+            return None
+        delay = _retry_after(exc)
+        if delay is None:
+            delay = min(0.5 * (2 ** attempt), 30.0)
+        return delay
+
+    @asynccontextmanager
+    async def slot(self, cost: int, lane: int = BULK):
+        """Hold one request slot (and `cost` tokens of budget) for the duration of the block."""
+        await self._acquire(cost, lane)
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def run(self, fn, *args, cost: int, lane: int = BULK, **kwargs):
+        """Run a blocking SDK call under the scheduler, retrying rate-limit/overload errors."""
+        loop = asyncio.get_running_loop()
+        for attempt in range(self.max_retries + 1):
+            async with self.slot(cost, lane):
+                try:
+                    response = await loop.run_in_executor(self._executor, partial(fn, *args, **kwargs))
+                except Exception as e:
+                    delay = self.retry_delay(e, attempt)
+                    if delay is None:
+                        raise
+                else:
+                    self.settle(cost, response)
+                    return response
+
+            # Back off outside the slot so other requests keep flowing
+            metrics.incr("llm_scheduler.retries")
+            await asyncio.sleep(delay)
+
+
+llm_scheduler = LLMScheduler(
+    max_concurrency=settings.CLAUDE_MAX_CONCURRENCY,
+    tokens_per_minute=settings.CLAUDE_TOKENS_PER_MINUTE,
+    max_retries=settings.CLAUDE_MAX_RETRIES,
+)
@@ -0,0 +1,126 @@
+import math
+import re
+from datetime import datetime, timezone
+from app.config import settings
+
+# Words in commit messages that tend to accompany risky or bug-introducing changes
+RISKY_KEYWORDS = {
+    "fix", "hotfix", "quickfix", "hack", "temp", "tmp", "wip", "workaround",
+    "refactor", "revert", "todo", "임시", "수정", "리팩토링", "긴급",
+}
+
+WEIGHTS = {
+    "ownership": 0.45,
+    "recency": 0.25,
+    "churn": 0.15,
+    "keywords": 0.15,
+}
+
+RECENCY_HALF_LIFE_DAYS = 3.0
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def _words(text: str) -> set:
+    return {w.lower() for w in _WORD_RE.findall(text or "") if len(w) > 1}
+
+
+def _added_lines(diff: str) -> int:
+    return sum(1 for line in diff.splitlines() if line.startswith("+") and not line.startswith("+++"))
+
+
+def _normalize(values: list) -> list:
+    top = max(values, default=0)
+    if top <= 0:
+        return [0.0] * len(values)
+    return [v / top for v in values]
+
+
+def _to_percentages(scores: list) -> list:
+    """Integer percentages summing to 100 (largest remainder)."""
+    total = sum(scores)
+    if total <= 0:
+        return [0] * len(scores)
+    raw = [s * 100 / total for s in scores]
+    result = [int(r) for r in raw]
+    by_remainder = sorted(range(len(raw)), key=lambda i: raw[i] - result[i], reverse=True)
+    for i in by_remainder[:100 - sum(result)]:
+        result[i] += 1
+    return result
+
+
+class SuspectRanker:
+    """
+    Deterministic per-author scoring over the fetched commits.
+
+    Each commit gets a feature column (diff line ownership, recency decay, churn,
+    keyword overlap with the incident); columns are normalized, weighted, and summed
+    per author. Output uses the same `suspects` shape as the Claude analysis.
+    """
+
+    def __init__(self, max_suspects: int = 5):
+        self.max_suspects = max_suspects
+
+    def rank(self, judgment, commits: list) -> dict:
+        if not commits:
+            return {"suspects": [], "confidence": 0.0, "candidates": []}
+
+        now = datetime.now(timezone.utc)
+        incident_words = _words(f"{judgment.title} {judgment.description or ''}")
+
+        authors = [c.author.username for c in commits]
+        ownership = [
+            _added_lines(c.diff) if c.diff else (c.additions or 0)
+            for c in commits
+        ]
+        recency = []
+        for c in commits:
+            date = c.date if c.date.tzinfo else c.date.replace(tzinfo=timezone.utc)
+            age_days = max((now - date).total_seconds(), 0) / 86400
+            recency.append(0.5 ** (age_days / RECENCY_HALF_LIFE_DAYS))
+        churn = [math.log1p((c.additions or 0) + (c.deletions or 0)) for c in commits]
+        keywords = []
+        for c in commits:
+            message_words = _words(c.message)
+            keywords.append(len(message_words & incident_words) + 0.5 * len(message_words & RISKY_KEYWORDS))
+
+        columns = {
+            "ownership": _normalize(ownership),
+            "recency": recency,
+            "churn": _normalize(churn),
+            "keywords": _normalize(keywords),
+        }
+        commit_scores = [
+            sum(WEIGHTS[name] * column[i] for name, column in columns.items())
+            for i in range(len(commits))
+        ]
+
+        per_author = {}
+        for i, author in enumerate(authors):
+            stats = per_author.setdefault(author, {"score": 0.0, "commits": 0, "lines": 0})
+            stats["score"] += commit_scores[i]
+            stats["commits"] += 1
+            stats["lines"] += ownership[i]
+
+        ranked = sorted(per_author.items(), key=lambda item: item[1]["score"], reverse=True)
+        top = ranked[:self.max_suspects]
+        total_score = sum(stats["score"] for _, stats in ranked)
+        percentages = _to_percentages([stats["score"] for _, stats in top])
+
+        suspects = []
+        for (username, stats), responsibility in zip(top, percentages):
+            suspects.append({
+                "username": username,
+                "responsibility": responsibility,
+                "reason": f"분석 기간 동안 {stats['commits']}개 커밋으로 관련 코드 {stats['lines']}줄을 변경했습니다.",
+            })
+
+        return {
+            "suspects": suspects,
+            # Share of the total score held by the top author across *all* authors
+            "confidence": top[0][1]["score"] / total_score if total_score > 0 else 0.0,
+            "candidates": [username for username, _ in ranked[:settings.SUSPECT_RANKER_TOP_K]],
+        }
+
+    def is_confident(self, ranking: dict) -> bool:
+        return bool(ranking["suspects"]) and ranking["confidence"] >= settings.SUSPECT_RANKER_SKIP_THRESHOLD
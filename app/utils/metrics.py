@@ -0,0 +1,37 @@
+import threading
+from collections import defaultdict
+
+# Upper bounds (ms) of the histogram buckets used by `Metrics.observe`
+DEFAULT_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class Metrics:
+    """In-process counters and gauges for observing upstream usage (Claude tokens, cache hits, ...)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = defaultdict(int)
+
+    def incr(self, key: str, value: int = 1):
+        with self._lock:
+            self._counters[key] += value
+
+    def set(self, key: str, value):
+        with self._lock:
+            self._counters[key] = value
+
+    def observe(self, key: str, value: float, buckets=DEFAULT_BUCKETS_MS):
+        """Record `value` in a cumulative histogram: `{key}.le_<bound>`, `{key}.count` and `{key}.sum`."""
+        with self._lock:
+            for bound in buckets:
+                if value <= bound:
+                    self._counters[f"{key}.le_{bound}"] += 1
+            self._counters[f"{key}.count"] += 1
+            self._counters[f"{key}.sum"] += value
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return dict(self._counters)
+
+
+metrics = Metrics()
@@ -0,0 +1,107 @@
+import logging
+import time
+from collections import OrderedDict
+from typing import Optional
+from app.config import settings
+from app.utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class UserCache:
+    """
+    Bounded TTL cache of User records keyed by JWT `sub`.
+
+    Entries (including `access_token`) are dropped after `ttl` seconds no matter how
+    often they are hit; the least recently used entry is evicted once `max_size` is
+    reached. With `redis_url` set, entries are also shared across workers via Redis
+    (SET with the same TTL), which requires the optional `redis` package. The GitHub
+    `access_token` never leaves the process: shared entries are stored without it, so
+    users read from Redis have `access_token=None` until it is loaded from the database.
+    """
+
+    def __init__(self, ttl: float = None, max_size: int = None, redis_url: Optional[str] = None):
+        self.ttl = ttl if ttl is not None else settings.USER_CACHE_TTL
+        self.max_size = max_size if max_size is not None else settings.USER_CACHE_MAX_SIZE
+        self._entries = OrderedDict()
+        self._redis_url = redis_url if redis_url is not None else settings.USER_CACHE_REDIS_URL
+        self._redis = None
+
+    def _shared(self):
+        if not self._redis_url:
+            return None
+        if self._redis is None:
+            try:
+                from redis import asyncio as redis_asyncio
+            except ImportError as exc:
+                raise RuntimeError(
+                    "USER_CACHE_REDIS_URL is set but the `redis` package is not installed."
+                ) from exc
+            self._redis = redis_asyncio.from_url(self._redis_url)
+        return self._redis
+
+    @staticmethod
+    def _key(user_id: str) -> str:
+        return f"user-cache:{user_id}"
+
+    async def get(self, user_id: str, model):
+        entry = self._entries.get(user_id)
+        if entry is not None:
+            expires_at, user = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(user_id)
+                metrics.incr("user_cache.hit")
+                return user
+            del self._entries[user_id]
+
+        shared = self._shared()
+        if shared is not None:
+            try:
+                raw = await shared.get(self._key(user_id))
+                remaining_ms = await shared.pttl(self._key(user_id)) if raw is not None else 0
+            except Exception as e:
+                logger.warning("shared user cache read failed: %s", e)
+                raw = None
+            if raw is not None:
+                user = model.model_validate_json(raw)
+                # Only the remaining lifetime of the shared entry may be reused locally
+                if remaining_ms and remaining_ms > 0:
+                    self._store(user_id, user, min(remaining_ms / 1000, self.ttl))
+                metrics.incr("user_cache.shared_hit")
+                return user
+
+        metrics.incr("user_cache.miss")
+        return None
+
+    def _store(self, user_id: str, user, ttl: float):
+        self._entries[user_id] = (time.monotonic() + ttl, user)
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def set(self, user_id: str, user, local_only: bool = False):
+        """Cache `user`, with `local_only` not in Redis (e.g. when it only adds the access_token)."""
+        if self.ttl <= 0:
+            return
+        self._store(user_id, user, self.ttl)
+
+        shared = None if local_only else self._shared()
+        if shared is not None:
+            try:
+                raw = user.model_dump_json(exclude={"access_token"})
+                await shared.set(self._key(user_id), raw, px=max(int(self.ttl * 1000), 1))
+            except Exception as e:
+                logger.warning("shared user cache write failed: %s", e)
+
+    async def invalidate(self, user_id: str):
+        self._entries.pop(user_id, None)
+
+        shared = self._shared()
+        if shared is not None:
+            try:
+                await shared.delete(self._key(user_id))
+            except Exception as e:
+                logger.warning("shared user cache invalidation failed: %s", e)
+
+
+user_cache = UserCache()
@@ -0,0 +1,89 @@
+"""
+Measure find_many + include throughput with one query engine process versus an
+EnginePool of several, for the listing-with-suspects shape that is the most
+expensive for the engine to serialize.
+
+Runs against the database in DATABASE_URL (use a local Postgres, it seeds one user
+with judgments and suspects and deletes it when done):
+
+    python -m benchmarks.bench_engine_pool --sizes 1 2 4 --concurrency 32 --duration 10
+"""
+import argparse
+import asyncio
+import time
+
+from app.prisma_client import Prisma
+
+SEED_USER_SQL = """
+INSERT INTO "User" ("github_id", "username", "updated_at")
+VALUES ('bench-pool', 'bench-pool', CURRENT_TIMESTAMP)
+RETURNING "id"
+"""
+
+SEED_JUDGMENTS_SQL = """
+INSERT INTO "Judgment" ("user_id", "repo_owner", "repo_name", "title", "status", "case_number")
+SELECT $1::uuid, 'bench', 'bench', 'benchmark', 'completed', 'bench-pool-' || n
+FROM generate_series(1, $2) AS n
+"""
+
+SEED_SUSPECTS_SQL = """
+INSERT INTO "Suspect" ("judgment_id", "username", "responsibility", "reason", "last_commit_msg")
+SELECT j."id", 'dev' || n, 100 / $2, repeat('reason ', 20), repeat('fix: benchmark ', 10)
+FROM "Judgment" j, generate_series(1, $2) AS n
+WHERE j."user_id" = $1::uuid
+"""
+
+
+async def _worker(db: Prisma, user_id: str, take: int, deadline: float) -> int:
+    done = 0
+    while time.perf_counter() < deadline:
+        await db.judgment.find_many(
+            where={"user_id": user_id},
+            include={"suspects": True, "blame": True},
+            take=take,
+        )
+        done += 1
+    return done
+
+
+async def _run(size: int, user_id: str, concurrency: int, duration: float, take: int) -> float:
+    db = Prisma(engine_pool_size=size)
+    await db.connect()
+    try:
+        # warm up every engine's connection pool
+        await _worker(db, user_id, take, time.perf_counter() + 1)
+
+        started = time.perf_counter()
+        deadline = started + duration
+        counts = await asyncio.gather(*(_worker(db, user_id, take, deadline) for _ in range(concurrency)))
+        return sum(counts) / (time.perf_counter() - started)
+    finally:
+        await db.disconnect()
+
+
+async def main(sizes: list, concurrency: int, duration: float, judgments: int, suspects: int, take: int):
+    db = Prisma()
+    await db.connect()
+    try:
+        user = await db.query_first(SEED_USER_SQL)
+        await db.execute_raw(SEED_JUDGMENTS_SQL, user["id"], judgments)
+        await db.execute_raw(SEED_SUSPECTS_SQL, user["id"], suspects)
+
+        for size in sizes:
+            qps = await _run(size, user["id"], concurrency, duration, take)
+            print(f"engines={size}: {qps:8.1f} find_many/s ({take} judgments x {suspects} suspects each)")
+    finally:
+        await db.execute_raw('DELETE FROM "User" WHERE "github_id" = \'bench-pool\'')
+        await db.disconnect()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--judgments", type=int, default=500)
+    parser.add_argument("--suspects", type=int, default=5)
+    parser.add_argument("--take", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(main(args.sizes, args.concurrency, args.duration, args.judgments, args.suspects, args.take))
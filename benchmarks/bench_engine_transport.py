@@ -0,0 +1,49 @@
+"""
+Compare query engine round-trip latency over TCP and over a unix domain socket.
+
+Spawns one query engine per transport against the database in DATABASE_URL and
+times a trivial raw query, so the numbers are dominated by the transport:
+
+    python -m benchmarks.bench_engine_transport --queries 2000
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from app.prisma_client import Prisma
+
+
+async def _measure(unix_socket: bool, queries: int, warmup: int) -> list:
+    db = Prisma(unix_socket=unix_socket)
+    await db.connect()
+    try:
+        for _ in range(warmup):
+            await db.query_raw("SELECT 1")
+
+        timings = []
+        for _ in range(queries):
+            started = time.perf_counter()
+            await db.query_raw("SELECT 1")
+            timings.append((time.perf_counter() - started) * 1e6)
+        return timings
+    finally:
+        await db.disconnect()
+
+
+async def main(queries: int, warmup: int):
+    for label, unix_socket in (("tcp", False), ("uds", True)):
+        timings = sorted(await _measure(unix_socket, queries, warmup))
+        p99 = timings[int(len(timings) * 0.99) - 1]
+        print(
+            f"{label}: mean {statistics.mean(timings):8.1f} us  "
+            f"p50 {statistics.median(timings):8.1f} us  p99 {p99:8.1f} us"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--warmup", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(main(args.queries, args.warmup))
@@ -0,0 +1,66 @@
+"""
+Measure client generation time: every template rendered on a single process, rendered
+on a process pool, and a repeated generation with nothing changed, which is skipped.
+
+Generation needs the data Prisma sends to the generator, capture it once with:
+
+    PRISMA_PY_DEBUG_GENERATOR=1 prisma generate
+
+which writes app/prisma_client/generator/debug-params.json, then run:
+
+    python -m benchmarks.bench_generate --runs 3
+"""
+import argparse
+import json
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from app.prisma_client._compat import model_parse
+from app.prisma_client.generator.generator import Generator
+from app.prisma_client.generator.models import PythonData
+
+DEFAULT_PARAMS = Path(__file__).resolve().parent.parent / "app" / "prisma_client" / "generator" / "debug-params.json"
+
+
+def _generate(params: dict, output: Path, env: dict) -> float:
+    previous = {key: os.environ.get(key) for key in env}
+    os.environ.update(env)
+    try:
+        params = {**params, "generator": {**params["generator"], "output": {"value": str(output), "fromEnvVar": None}}}
+        data = model_parse(PythonData, params)
+
+        started = time.perf_counter()
+        Generator().generate(data)
+        return time.perf_counter() - started
+    finally:
+        for key, value in previous.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+def main(params_path: Path, runs: int, workers: int):
+    params = json.loads(params_path.read_text())
+    scenarios = [
+        ("sequential", {"PRISMA_PY_FORCE_GENERATE": "1", "PRISMA_PY_GENERATOR_WORKERS": "1"}),
+        ("parallel", {"PRISMA_PY_FORCE_GENERATE": "1", "PRISMA_PY_GENERATOR_WORKERS": str(workers)}),
+        ("unchanged", {"PRISMA_PY_FORCE_GENERATE": "0", "PRISMA_PY_GENERATOR_WORKERS": str(workers)}),
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        output = Path(tmp) / "prisma"
+        for label, env in scenarios:
+            timings = [_generate(params, output, env) for _ in range(runs)]
+            print(f"{label:>10}: {statistics.median(timings) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--params", type=Path, default=DEFAULT_PARAMS)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+    main(args.params, args.runs, args.workers)
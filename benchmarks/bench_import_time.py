@@ -0,0 +1,76 @@
+"""
+Measure cold import time with `python -X importtime`, e.g. what a serverless cold
+start pays before the first request can be served.
+
+Every run imports the given statement in a fresh interpreter, the median over all runs
+is reported together with the modules that took the longest to import themselves:
+
+    python -m benchmarks.bench_import_time --runs 10
+    python -m benchmarks.bench_import_time --statement "from app.prisma_client import Prisma" --top 20
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+DEFAULT_STATEMENTS = [
+    "import app.prisma_client",
+    "from app.prisma_client import Prisma",
+    "from app.prisma_client.models import User",
+    "import app.main",
+]
+
+
+def _importtime(statement: str) -> list:
+    """Returns (module, self us, cumulative us, depth) for every module imported by the statement"""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        # e.g. `import app.main` needs the settings from .env
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+
+    entries = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        entries.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return entries
+
+
+def main(statements: list, runs: int, top: int):
+    for statement in statements:
+        totals = []
+        self_times = defaultdict(list)
+        for _ in range(runs):
+            try:
+                entries = _importtime(statement)
+            except RuntimeError as exc:
+                print(f"{statement}: failed, {exc}")
+                break
+            # top level imports do not overlap, their cumulative times add up to the total
+            totals.append(sum(cumulative for _, _, cumulative, depth in entries if depth == 0) / 1000)
+            for name, self_us, _, _ in entries:
+                self_times[name].append(self_us / 1000)
+
+        if not totals:
+            continue
+
+        print(f"{statement}: {statistics.median(totals):8.1f} ms over {len(self_times)} modules")
+        slowest = sorted(self_times.items(), key=lambda item: statistics.median(item[1]), reverse=True)
+        for name, times in slowest[:top]:
+            print(f"    {statistics.median(times):8.2f} ms  {name}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--statement", action="append", dest="statements")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+    main(args.statements or DEFAULT_STATEMENTS, args.runs, args.top)
@@ -0,0 +1,113 @@
+"""
+Seed a large Judgment/Suspect dataset and compare EXPLAIN ANALYZE plans of the hot
+queries without and with the indexes from
+prisma/migrations/20261019000000_judgment_suspect_indexes.
+
+Runs against the database in DATABASE_URL (use a local Postgres, it drops and
+recreates those indexes and deletes its seeded users when done):
+
+    python -m benchmarks.bench_judgment_indexes --users 200 --judgments 500 --suspects 5
+"""
+import argparse
+import asyncio
+import time
+
+from app.database import _ensure_prisma_client
+from app.routers.judgments import LIST_JUDGMENTS_SQL
+
+INDEXES = {
+    "Judgment_user_id_created_at_id_idx":
+        'CREATE INDEX "Judgment_user_id_created_at_id_idx" ON "Judgment"("user_id", "created_at", "id")',
+    "Judgment_user_id_status_created_at_id_idx":
+        'CREATE INDEX "Judgment_user_id_status_created_at_id_idx" ON "Judgment"("user_id", "status", "created_at", "id")',
+    "Suspect_judgment_id_idx":
+        'CREATE INDEX "Suspect_judgment_id_idx" ON "Suspect"("judgment_id")',
+}
+
+SEED_USERS_SQL = """
+INSERT INTO "User" ("github_id", "username", "updated_at")
+SELECT 'bench-idx-' || n, 'bench' || n, CURRENT_TIMESTAMP
+FROM generate_series(1, $1) AS n
+"""
+
+SEED_JUDGMENTS_SQL = """
+INSERT INTO "Judgment" ("user_id", "repo_owner", "repo_name", "title", "status", "case_number", "created_at")
+SELECT u."id", 'bench', 'bench', 'benchmark',
+       (ARRAY['pending', 'processing', 'completed', 'failed'])[1 + (n % 4)],
+       'bench-idx-' || u."github_id" || '-' || n,
+       CURRENT_TIMESTAMP - make_interval(mins => n)
+FROM "User" u, generate_series(1, $1) AS n
+WHERE u."github_id" LIKE 'bench-idx-%'
+"""
+
+SEED_SUSPECTS_SQL = """
+INSERT INTO "Suspect" ("judgment_id", "username", "responsibility")
+SELECT j."id", 'dev' || n, 100 / $1
+FROM "Judgment" j, generate_series(1, $1) AS n
+WHERE j."case_number" LIKE 'bench-idx-%'
+"""
+
+SUSPECTS_SQL = 'SELECT * FROM "Suspect" WHERE "judgment_id" = $1::uuid'
+
+COUNT_SQL = 'SELECT count(*) FROM "Judgment" WHERE "user_id" = $1::uuid AND "status" = $2'
+
+
+async def _explain(db, sql: str, *args) -> tuple:
+    rows = await db.query_raw(f"EXPLAIN (ANALYZE, BUFFERS) {sql}", *args)
+    plan = [row["QUERY PLAN"] for row in rows]
+    execution = next((line for line in plan if line.startswith("Execution Time")), "")
+    return plan[0], execution
+
+
+async def _run_queries(db, user_id: str, judgment_id: str) -> dict:
+    await db.execute_raw('ANALYZE "Judgment"')
+    await db.execute_raw('ANALYZE "Suspect"')
+    return {
+        "list": await _explain(db, LIST_JUDGMENTS_SQL, user_id, None, None, None, 21),
+        "list status=completed": await _explain(db, LIST_JUDGMENTS_SQL, user_id, "completed", None, None, 21),
+        "suspects by judgment": await _explain(db, SUSPECTS_SQL, judgment_id),
+        "count by status": await _explain(db, COUNT_SQL, user_id, "completed"),
+    }
+
+
+async def main(users: int, judgments: int, suspects: int):
+    db = _ensure_prisma_client()
+    await db.connect()
+
+    try:
+        started = time.perf_counter()
+        await db.execute_raw(SEED_USERS_SQL, users)
+        await db.execute_raw(SEED_JUDGMENTS_SQL, judgments)
+        await db.execute_raw(SEED_SUSPECTS_SQL, suspects)
+        print(f"seeded {users} users x {judgments} judgments x {suspects} suspects "
+              f"in {time.perf_counter() - started:.1f}s")
+
+        sample = await db.query_first(
+            'SELECT j."id", j."user_id" FROM "Judgment" j '
+            'WHERE j."case_number" LIKE \'bench-idx-%\' ORDER BY random() LIMIT 1'
+        )
+
+        for name in INDEXES:
+            await db.execute_raw(f'DROP INDEX IF EXISTS "{name}"')
+        before = await _run_queries(db, sample["user_id"], sample["id"])
+
+        for ddl in INDEXES.values():
+            await db.execute_raw(ddl)
+        after = await _run_queries(db, sample["user_id"], sample["id"])
+
+        for query in before:
+            print(f"\n== {query}")
+            print(f"  before: {before[query][0].strip()}\n          {before[query][1]}")
+            print(f"  after:  {after[query][0].strip()}\n          {after[query][1]}")
+    finally:
+        await db.execute_raw('DELETE FROM "User" WHERE "github_id" LIKE \'bench-idx-%\'')
+        await db.disconnect()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--judgments", type=int, default=500)
+    parser.add_argument("--suspects", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.users, args.judgments, args.suspects))
@@ -0,0 +1,99 @@
+"""
+Compare building queries from a fresh node tree against the compiled query-shape
+cache in the vendored QueryBuilder, for the query shapes the routers issue.
+
+No database needed:
+
+    python -m benchmarks.bench_query_builder --iterations 20000
+"""
+import argparse
+import time
+import uuid
+from datetime import datetime
+
+from app.prisma_client import models
+from app.prisma_client.builder import QueryBuilder
+
+
+def _shapes() -> list:
+    judgment_id = str(uuid.uuid4())
+    user_id = str(uuid.uuid4())
+    return [
+        ("find_unique User", "find_unique", models.User, {"where": {"id": user_id}}, None),
+        (
+            "find_first Judgment + relations",
+            "find_first",
+            models.Judgment,
+            {"where": {"id": judgment_id, "user_id": user_id}, "include": {"suspects": True, "blame": True}},
+            None,
+        ),
+        (
+            "find_first Judgment select",
+            "find_first",
+            models.Judgment,
+            {
+                "where": {"id": judgment_id, "user_id": user_id},
+                "include": {
+                    "blame": {"select": ["id", "target_username", "target_avatar", "responsibility"]},
+                    "suspects": {"select": ["username", "last_commit_msg"]},
+                },
+            },
+            ["id", "repo_name", "title", "created_at"],
+        ),
+        (
+            "update Judgment nested suspects",
+            "update",
+            models.Judgment,
+            {
+                "where": {"id": judgment_id},
+                "data": {
+                    "status": "completed",
+                    "suspects": {
+                        "deleteMany": {},
+                        "createMany": {
+                            "data": [
+                                {"username": f"dev{i}", "responsibility": 20, "last_commit_date": datetime.utcnow()}
+                                for i in range(5)
+                            ]
+                        },
+                    },
+                },
+                "include": {"suspects": True, "blame": True},
+            },
+            None,
+        ),
+    ]
+
+
+def _tree(method, model, arguments, root_selection) -> str:
+    builder = QueryBuilder(method=method, model=model, arguments=arguments, root_selection=root_selection)
+    return builder._create_root_node().render()
+
+
+def _compiled(method, model, arguments, root_selection) -> str:
+    builder = QueryBuilder(method=method, model=model, arguments=arguments, root_selection=root_selection)
+    return builder.build_query()
+
+
+def main(iterations: int):
+    for name, method, model, arguments, root_selection in _shapes():
+        assert _tree(method, model, arguments, root_selection) == _compiled(method, model, arguments, root_selection)
+
+        results = {}
+        for label, build in (("tree", _tree), ("compiled", _compiled)):
+            started = time.perf_counter()
+            for _ in range(iterations):
+                build(method, model, arguments, root_selection)
+            results[label] = (time.perf_counter() - started) * 1e6 / iterations
+
+        print(
+            f"{name:<34} tree {results['tree']:8.1f} us  compiled {results['compiled']:8.1f} us  "
+            f"({results['tree'] / results['compiled']:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+    main(args.iterations)
@@ -0,0 +1,101 @@
+"""
+Compare the generated client with and without the generator's `slim` option: import
+time, memory allocated by the import and the size of the modules on disk.
+
+No `prisma generate` needed, both variants are derived from the checked in client in
+temporary copies of the `app` package (the full modules are the `.pyi` stubs of a
+client generated with `slim = true`):
+
+    python -m benchmarks.bench_slim_client --runs 10
+"""
+import argparse
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from app.prisma_client.generator.generator import SLIM_TEMPLATES
+from app.prisma_client.generator.slim import slim_module
+
+APP_DIR = Path(__file__).resolve().parent.parent / "app"
+
+IMPORT = "from app.prisma_client import Prisma, models, types"
+
+# tracemalloc slows the import down considerably, time and memory are measured separately
+MEASURE_TIME = f"""
+import time
+started = time.perf_counter()
+{IMPORT}
+print((time.perf_counter() - started) * 1000)
+"""
+
+MEASURE_MEMORY = f"""
+import tracemalloc
+tracemalloc.start()
+{IMPORT}
+print(tracemalloc.get_traced_memory()[0] / 1024 / 1024)
+"""
+
+
+def _make_full(root: Path) -> None:
+    client_dir = root / "app" / "prisma_client"
+    for template in SLIM_TEMPLATES:
+        module = client_dir / template[: -len(".jinja")]
+        stub = module.with_suffix(".pyi")
+        if stub.exists():
+            module.write_text(stub.read_text())
+            stub.unlink()
+
+
+def _make_slim(root: Path) -> None:
+    client_dir = root / "app" / "prisma_client"
+    for template in SLIM_TEMPLATES:
+        module = client_dir / template[: -len(".jinja")]
+        source = module.read_text()
+        module.with_suffix(".pyi").write_text(source)
+        module.write_text(slim_module(source))
+
+
+def _run(root: Path, code: str) -> float:
+    proc = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True, check=True)
+    return float(proc.stdout)
+
+
+def _measure(root: Path, runs: int) -> tuple:
+    # the first run only writes the bytecode cache
+    subprocess.run([sys.executable, "-c", IMPORT], cwd=root, check=True)
+
+    timings = [_run(root, MEASURE_TIME) for _ in range(runs)]
+    return statistics.median(timings), _run(root, MEASURE_MEMORY)
+
+
+def _size(root: Path) -> float:
+    client_dir = root / "app" / "prisma_client"
+    return sum(
+        (client_dir / template[: -len(".jinja")]).stat().st_size for template in SLIM_TEMPLATES
+    ) / 1024
+
+
+def main(runs: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        for label in ("full", "slim"):
+            root = Path(tmp) / label
+            shutil.copytree(APP_DIR, root / "app", ignore=shutil.ignore_patterns("__pycache__"))
+            _make_full(root)
+            if label == "slim":
+                _make_slim(root)
+
+            elapsed, allocated = _measure(root, runs)
+            print(
+                f"{label}: import {elapsed:7.1f} ms  allocated {allocated:6.1f} MiB  "
+                f"types.py + actions.py {_size(root):6.1f} KiB"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+    main(args.runs)
@@ -0,0 +1,99 @@
+"""
+Compare the old per-suspect write loop against the single nested write used by
+`AnalysisService.save_suspects`.
+
+Runs against the database in DATABASE_URL (use a local Postgres, it creates and
+deletes its own benchmark user):
+
+    python -m benchmarks.bench_suspect_writes --judgments 50 --suspects 5
+"""
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from datetime import datetime
+
+from app.database import _ensure_prisma_client
+
+
+def _rows(count: int) -> list:
+    return [
+        {
+            "username": f"dev{i}",
+            "avatar_url": None,
+            "responsibility": 100 // count,
+            "reason": "benchmark",
+            "commit_count": random.randint(1, 10),
+            "last_commit_msg": "fix: benchmark",
+            "last_commit_date": datetime.utcnow(),
+        }
+        for i in range(count)
+    ]
+
+
+async def _loop_write(db, judgment_id: str, rows: list):
+    for row in rows:
+        await db.suspect.create(data={"judgment_id": judgment_id, **row})
+    return await db.judgment.update(
+        where={"id": judgment_id},
+        data={"status": "completed"},
+        include={"suspects": True, "blame": True},
+    )
+
+
+async def _nested_write(db, judgment_id: str, rows: list):
+    return await db.judgment.update(
+        where={"id": judgment_id},
+        data={
+            "status": "completed",
+            "suspects": {"deleteMany": {}, "createMany": {"data": rows}},
+        },
+        include={"suspects": True, "blame": True},
+    )
+
+
+async def _create_judgments(db, user_id: str, count: int) -> list:
+    ids = []
+    for _ in range(count):
+        judgment = await db.judgment.create(
+            data={
+                "user_id": user_id,
+                "case_number": f"bench-{uuid.uuid4()}",
+                "repo_owner": "bench",
+                "repo_name": "bench",
+                "title": "benchmark",
+                "status": "pending",
+            }
+        )
+        ids.append(judgment.id)
+    return ids
+
+
+async def main(judgments: int, suspects: int):
+    db = _ensure_prisma_client()
+    await db.connect()
+
+    user = await db.user.create(
+        data={"github_id": f"bench-{uuid.uuid4()}", "username": "bench"}
+    )
+    try:
+        rows = _rows(suspects)
+        for name, write in (("loop", _loop_write), ("nested", _nested_write)):
+            ids = await _create_judgments(db, user.id, judgments)
+            started = time.perf_counter()
+            for judgment_id in ids:
+                await write(db, judgment_id, rows)
+            elapsed = time.perf_counter() - started
+            print(f"{name:>6}: {elapsed * 1000 / judgments:8.2f} ms/judgment ({judgments} judgments x {suspects} suspects)")
+    finally:
+        await db.user.delete(where={"id": user.id})
+        await db.disconnect()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--judgments", type=int, default=50)
+    parser.add_argument("--suspects", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.judgments, args.suspects))
@@ -38,6 +38,10 @@ CREATE TABLE "Judgment" (
 -- Unique Index for Case Number
 CREATE UNIQUE INDEX "Judgment_case_number_key" ON "Judgment"("case_number");
 
+-- Keyset listing per user, with and without a status filter
+CREATE INDEX "Judgment_user_id_created_at_id_idx" ON "Judgment"("user_id", "created_at", "id");
+CREATE INDEX "Judgment_user_id_status_created_at_id_idx" ON "Judgment"("user_id", "status", "created_at", "id");
+
 -- 3. Suspect Table
 CREATE TABLE "Suspect" (
     "id" UUID NOT NULL DEFAULT gen_random_uuid(),
@@ -53,6 +57,9 @@ CREATE TABLE "Suspect" (
     CONSTRAINT "Suspect_pkey" PRIMARY KEY ("id")
 );
 
+-- Suspect includes join on judgment_id
+CREATE INDEX "Suspect_judgment_id_idx" ON "Suspect"("judgment_id");
+
 -- 4. Blame Table
 CREATE TABLE "Blame" (
     "id" UUID NOT NULL DEFAULT gen_random_uuid(),
@@ -61,7 +68,7 @@ CREATE TABLE "Blame" (
     "target_avatar" TEXT,
     "responsibility" INTEGER NOT NULL,
     "reason" TEXT,
-    "message" TEXT,
+    "message" JSONB,
     "intensity" TEXT NOT NULL DEFAULT 'medium',
     "image_url" TEXT,
     "created_at" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
@@ -72,9 +79,32 @@ CREATE TABLE "Blame" (
 -- Unique Index for Blame (One-to-One with Judgment)
 CREATE UNIQUE INDEX "Blame_judgment_id_key" ON "Blame"("judgment_id");
 
+-- 5. AnalysisJob Table (background analysis queue)
+CREATE TABLE "AnalysisJob" (
+    "id" UUID NOT NULL DEFAULT gen_random_uuid(),
+    "judgment_id" UUID NOT NULL,
+    "user_id" UUID NOT NULL,
+    "status" TEXT NOT NULL DEFAULT 'queued',
+    "attempts" INTEGER NOT NULL DEFAULT 0,
+    "max_attempts" INTEGER NOT NULL DEFAULT 3,
+    "run_at" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "locked_until" TIMESTAMP(3),
+    "last_error" TEXT,
+    "created_at" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "updated_at" TIMESTAMP(3) NOT NULL,
+
+    CONSTRAINT "AnalysisJob_pkey" PRIMARY KEY ("id")
+);
+
+-- Claiming scans runnable jobs by status/run_at and counts running jobs per user
+CREATE INDEX "AnalysisJob_status_run_at_idx" ON "AnalysisJob"("status", "run_at");
+CREATE INDEX "AnalysisJob_user_id_status_idx" ON "AnalysisJob"("user_id", "status");
+
 -- Add Relationships (Foreign Keys)
 ALTER TABLE "Judgment" ADD CONSTRAINT "Judgment_user_id_fkey" FOREIGN KEY ("user_id") REFERENCES "User"("id") ON DELETE CASCADE ON UPDATE CASCADE;
 
 ALTER TABLE "Suspect" ADD CONSTRAINT "Suspect_judgment_id_fkey" FOREIGN KEY ("judgment_id") REFERENCES "Judgment"("id") ON DELETE CASCADE ON UPDATE CASCADE;
 
 ALTER TABLE "Blame" ADD CONSTRAINT "Blame_judgment_id_fkey" FOREIGN KEY ("judgment_id") REFERENCES "Judgment"("id") ON DELETE CASCADE ON UPDATE CASCADE;
+
+ALTER TABLE "AnalysisJob" ADD CONSTRAINT "AnalysisJob_judgment_id_fkey" FOREIGN KEY ("judgment_id") REFERENCES "Judgment"("id") ON DELETE CASCADE ON UPDATE CASCADE;
@@ -0,0 +1,6 @@
+-- Keyset listing per user (list_judgments), with and without a status filter
+CREATE INDEX IF NOT EXISTS "Judgment_user_id_created_at_id_idx" ON "Judgment"("user_id", "created_at", "id");
+CREATE INDEX IF NOT EXISTS "Judgment_user_id_status_created_at_id_idx" ON "Judgment"("user_id", "status", "created_at", "id");
+
+-- include={"suspects": True} joins on judgment_id
+CREATE INDEX IF NOT EXISTS "Suspect_judgment_id_idx" ON "Suspect"("judgment_id");
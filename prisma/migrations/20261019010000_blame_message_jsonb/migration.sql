@@ -0,0 +1,13 @@
+-- Blame.message: TEXT holding JSON -> JSONB.
+-- Values that are not valid JSON (legacy single-intensity plain text) are kept as JSON
+-- strings; `python -m scripts.backfill_blame_messages` rewrites them into the
+-- {"mild": [...], "medium": [...], "spicy": [...]} shape.
+CREATE FUNCTION pg_temp.blame_message_to_jsonb(value TEXT) RETURNS JSONB AS $$
+BEGIN
+    RETURN value::jsonb;
+EXCEPTION WHEN invalid_text_representation THEN
+    RETURN to_jsonb(value);
+END;
+$$ LANGUAGE plpgsql IMMUTABLE;
+
+ALTER TABLE "Blame" ALTER COLUMN "message" TYPE JSONB USING pg_temp.blame_message_to_jsonb("message");
@@ -0,0 +1,21 @@
+-- Background analysis queue (app/services/job_queue.py), used by POST /judgments/{id}/analyze
+CREATE TABLE IF NOT EXISTS "AnalysisJob" (
+    "id" UUID NOT NULL DEFAULT gen_random_uuid(),
+    "judgment_id" UUID NOT NULL,
+    "user_id" UUID NOT NULL,
+    "status" TEXT NOT NULL DEFAULT 'queued',
+    "attempts" INTEGER NOT NULL DEFAULT 0,
+    "max_attempts" INTEGER NOT NULL DEFAULT 3,
+    "run_at" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "locked_until" TIMESTAMP(3),
+    "last_error" TEXT,
+    "created_at" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "updated_at" TIMESTAMP(3) NOT NULL,
+
+    CONSTRAINT "AnalysisJob_pkey" PRIMARY KEY ("id"),
+    CONSTRAINT "AnalysisJob_judgment_id_fkey" FOREIGN KEY ("judgment_id") REFERENCES "Judgment"("id") ON DELETE CASCADE ON UPDATE CASCADE
+);
+
+-- Claiming scans runnable jobs by status/run_at and counts running jobs per user
+CREATE INDEX IF NOT EXISTS "AnalysisJob_status_run_at_idx" ON "AnalysisJob"("status", "run_at");
+CREATE INDEX IF NOT EXISTS "AnalysisJob_user_id_status_idx" ON "AnalysisJob"("user_id", "status");
@@ -0,0 +1,40 @@
+"""
+Run the background analysis workers (POST /judgments/{id}/analyze) as a dedicated process.
+
+The API does not start them by default: serverless instances are frozen between requests,
+which would stall claimed jobs until their visibility timeout. Run this next to the API,
+on any host with DATABASE_URL and the API keys set:
+
+    python -m scripts.analysis_worker
+
+Stops on SIGINT/SIGTERM; jobs that are interrupted are picked up again once their lease lapses.
+"""
+import asyncio
+import logging
+import signal
+
+from app.database import connect_db, disconnect_db
+from app.services.claude_service import close_clients
+from app.services.job_queue import AnalysisWorkerPool
+
+
+async def main():
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop.set)
+
+    workers = AnalysisWorkerPool(await connect_db())
+    workers.start()
+    print(f"running {workers.concurrency} analysis workers")
+    try:
+        await stop.wait()
+    finally:
+        await workers.stop()
+        await close_clients()
+        await disconnect_db()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
@@ -0,0 +1,65 @@
+"""
+Normalize Blame.message after prisma/migrations/20261019010000_blame_message_jsonb.
+
+The migration keeps non-JSON legacy messages as JSON strings; this rewrites every
+row whose message is not a {"mild": [...], "medium": [...], "spicy": [...]} object
+into that shape. Reads decode the legacy shapes until then (see
+`BlameMessages.from_stored`), this only saves them the work:
+
+    python -m scripts.backfill_blame_messages --batch-size 500 [--dry-run]
+"""
+import argparse
+import asyncio
+import json
+
+from app.database import _ensure_prisma_client
+from app.models.schemas import BlameMessages
+
+# Rows needing work: anything but an object holding a string array per intensity
+SELECT_SQL = """
+SELECT "id", "intensity", "message"::text AS "message"
+FROM "Blame"
+WHERE "message" IS NOT NULL
+  AND NOT (
+    jsonb_typeof("message") = 'object'
+    AND jsonb_typeof("message"->'mild') = 'array'
+    AND jsonb_typeof("message"->'medium') = 'array'
+    AND jsonb_typeof("message"->'spicy') = 'array'
+  )
+  AND "id" > $1::uuid
+ORDER BY "id"
+LIMIT $2
+"""
+
+UPDATE_SQL = 'UPDATE "Blame" SET "message" = $2::jsonb WHERE "id" = $1::uuid'
+
+
+async def main(batch_size: int, dry_run: bool):
+    db = _ensure_prisma_client()
+    await db.connect()
+
+    updated = 0
+    last_id = "00000000-0000-0000-0000-000000000000"
+    try:
+        while True:
+            rows = await db.query_raw(SELECT_SQL, last_id, batch_size)
+            if not rows:
+                break
+            for row in rows:
+                messages = BlameMessages.from_stored(json.loads(row["message"]), row["intensity"]).model_dump()
+                if not dry_run:
+                    await db.execute_raw(UPDATE_SQL, row["id"], json.dumps(messages, ensure_ascii=False))
+                updated += 1
+            last_id = rows[-1]["id"]
+    finally:
+        await db.disconnect()
+
+    print(f"{'would update' if dry_run else 'updated'} {updated} blame rows")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+    asyncio.run(main(args.batch_size, args.dry_run))
@@ -0,0 +1,52 @@
+"""
+Export judgments with their suspects and blame as JSON lines, e.g. for backups or offline analysis:
+
+    python -m scripts.export_judgments [--user-id UUID] [--status completed] [--batch-size 200] > judgments.jsonl
+
+Judgments are read in id order with `find_many_iter`, which pages with a cursor and prefetches the
+next batch while the current one is written, so memory stays bounded by two batches.
+"""
+import argparse
+import asyncio
+import json
+import sys
+
+from app.database import _ensure_prisma_client
+from app.models.schemas import JudgmentResponse
+
+
+async def main(user_id: str, status: str, batch_size: int):
+    db = _ensure_prisma_client()
+    await db.connect()
+
+    where = {}
+    if user_id:
+        where["user_id"] = user_id
+    if status:
+        where["status"] = status
+
+    exported = 0
+    try:
+        judgments = db.judgment.find_many_iter(
+            batch_size=batch_size,
+            where=where,
+            include={"suspects": True, "blame": True},
+        )
+        async for judgment in judgments:
+            # JudgmentResponse decodes the stored blame messages, the owner is kept for multi-user exports
+            record = {"user_id": judgment.user_id, **JudgmentResponse.model_validate(judgment).model_dump(mode="json")}
+            sys.stdout.write(json.dumps(record, ensure_ascii=False) + "\n")
+            exported += 1
+    finally:
+        await db.disconnect()
+
+    print(f"exported {exported} judgments", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--user-id")
+    parser.add_argument("--status")
+    parser.add_argument("--batch-size", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.user_id, args.status, args.batch_size))
@@ -0,0 +1,23 @@
+"""
+Write the Prisma binary manifest at build time so that cold starts skip the platform
+and query engine probes (OpenSSL version detection, `query-engine --version`, ...).
+
+Run after `prisma generate`, the manifest is written into the client package
+(app/prisma_client/binary-manifest.json) so that it is deployed with the function:
+
+    python -m scripts.prebake_prisma
+
+This is the same as `python -m app.prisma_client py prebake`.
+"""
+from app.prisma_client.binaries.manifest import BUNDLED_MANIFEST
+from app.prisma_client.cli.commands.prebake import prebake
+
+
+def main():
+    for name, value in prebake().items():
+        print(f"{name}: {value or 'not found'}")
+    print(f"wrote {BUNDLED_MANIFEST}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,15 @@
+import os
+
+# app.config.Settings requires these; tests never reach the real services
+for _name, _value in {
+    'DATABASE_URL': 'postgresql://test@localhost/test',
+    'GITHUB_CLIENT_ID': 'test',
+    'GITHUB_CLIENT_SECRET': 'test',
+    'GITHUB_REDIRECT_URI': 'http://localhost/callback',
+    'CLAUDE_API_KEY': 'test',
+    'SUPABASE_URL': 'http://localhost',
+    'SUPABASE_KEY': 'test',
+    'SECRET_KEY': 'test',
+    'FRONTEND_URL': 'http://localhost',
+}.items():
+    os.environ.setdefault(_name, _value)
@@ -0,0 +1,115 @@
+import asyncio
+import json
+
+import pytest
+
+from app.prisma_client import Prisma, errors, models
+
+USER = {
+    'id': '1',
+    'github_id': 'github-1',
+    'username': 'octocat',
+    'avatar_url': None,
+    'access_token': None,
+    'created_at': '2026-01-01T00:00:00+00:00',
+    'updated_at': '2026-01-01T00:00:00+00:00',
+}
+
+
+def _error(code, message='error'):
+    return {'errors': [{'error': message, 'user_facing_error': {'error_code': code, 'message': message}}]}
+
+
+class FakeEngine:
+    """Answers a batch request with the given per-operation results"""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.payloads = []
+
+    async def query(self, content, *, tx_id):
+        self.payloads.append(json.loads(content))
+        return {'batchResult': self.results}
+
+
+def _client(*results):
+    db = Prisma()
+    db._engine = FakeEngine(*results)
+    return db
+
+
+def test_results_are_parsed_per_operation():
+    db = _client(
+        {'data': {'result': [USER]}},
+        {'data': {'result': {'_count': {'_all': 7}}}},
+        {'data': {'result': None}},
+        {'data': {'result': {'username': 'octocat', 'id': '1'}}},
+    )
+
+    batch = db.batch_(transaction=False)
+    batch.user.find_many(where={'username': 'octocat'})
+    batch.user.count()
+    batch.user.find_unique(where={'id': 'missing'})
+    batch.user.find_unique(where={'id': '1'}, select=['username'])
+    users, total, missing, partial = asyncio.run(batch.commit())
+
+    assert [user.id for user in users] == ['1']
+    assert isinstance(users[0], models.User)
+    assert total == 7
+    assert missing is None
+    assert partial.username == 'octocat'
+    assert partial.github_id is None
+
+    [payload] = db._engine.payloads
+    assert payload['transaction'] is False
+    assert len(payload['batch']) == 4
+
+
+def test_transaction_flag_is_sent():
+    db = _client({'data': {'result': {'_count': {'_all': 1}}}})
+
+    batch = db.batch_()
+    batch.user.count()
+    asyncio.run(batch.commit())
+
+    assert db._engine.payloads[0]['transaction'] is True
+
+
+def test_failed_operation_raises_its_mapped_error():
+    db = _client({'data': {'result': USER}}, _error('P2002', 'Unique constraint failed'))
+
+    batch = db.batch_(transaction=False)
+    batch.user.create(data={'github_id': 'github-1', 'username': 'octocat'})
+    batch.user.create(data={'github_id': 'github-1', 'username': 'octocat'})
+
+    with pytest.raises(errors.UniqueViolationError):
+        asyncio.run(batch.commit())
+
+
+def test_missing_record_of_a_delete_is_none():
+    db = _client(_error('P2025', 'Record to delete does not exist.'), {'data': {'result': USER}})
+
+    batch = db.batch_(transaction=False)
+    batch.user.delete(where={'id': 'missing'})
+    batch.user.delete(where={'id': '1'})
+    missing, deleted = asyncio.run(batch.commit())
+
+    assert missing is None
+    assert deleted.id == '1'
+
+
+def test_unmapped_errors_are_data_errors():
+    db = _client({'errors': [{'error': 'something went wrong'}]})
+
+    batch = db.batch_(transaction=False)
+    batch.user.count()
+
+    with pytest.raises(errors.DataError):
+        asyncio.run(batch.commit())
+
+
+def test_empty_batch_makes_no_request():
+    db = _client()
+
+    assert asyncio.run(db.batch_().commit()) == []
+    assert db._engine.payloads == []
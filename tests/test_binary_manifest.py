@@ -0,0 +1,115 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from app.prisma_client.binaries import manifest
+
+
+class Probe:
+    def __init__(self, result):
+        self.result = result
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.result
+
+
+@pytest.fixture
+def paths(tmp_path, monkeypatch):
+    paths = SimpleNamespace(
+        manifest=tmp_path / 'cache' / 'manifest.json',
+        bundled=tmp_path / 'package' / 'binary-manifest.json',
+        binary=tmp_path / 'cache' / 'query-engine',
+    )
+    monkeypatch.setattr(manifest, 'config', SimpleNamespace(binary_manifest=paths.manifest))
+    monkeypatch.setattr(manifest, 'BUNDLED_MANIFEST', paths.bundled)
+    _new_process(monkeypatch)
+    paths.binary.parent.mkdir(parents=True)
+    paths.binary.write_bytes(b'engine v1')
+    return paths
+
+
+def _new_process(monkeypatch):
+    monkeypatch.setattr(manifest, '_manifest', None)
+
+
+def test_probe_results_are_reused_by_later_processes(paths, monkeypatch):
+    probe = Probe('5.0.0')
+    assert manifest.cached_for_binary('version', paths.binary, probe) == '5.0.0'
+
+    _new_process(monkeypatch)
+    assert manifest.cached_for_binary('version', paths.binary, probe) == '5.0.0'
+    assert probe.calls == 1
+
+
+def test_changed_binary_is_probed_again(paths, monkeypatch):
+    manifest.cached_for_binary('version', paths.binary, Probe('5.0.0'))
+
+    paths.binary.write_bytes(b'engine v2')
+    _new_process(monkeypatch)
+    probe = Probe('5.1.0')
+
+    assert manifest.cached_for_binary('version', paths.binary, probe) == '5.1.0'
+    assert probe.calls == 1
+
+
+def test_large_binaries_are_stamped_by_their_start_and_end(paths):
+    size = 4 * manifest._STAMP_CHUNK_SIZE
+    paths.binary.write_bytes(b'\0' * size)
+    before = manifest.file_stamp(paths.binary)
+
+    with paths.binary.open('r+b') as file:
+        file.seek(size - 1)
+        file.write(b'\1')
+
+    assert manifest.file_stamp(paths.binary) != before
+
+
+def test_bundled_manifest_applies_to_binaries_deployed_elsewhere(paths, monkeypatch, tmp_path):
+    manifest.cached_for_binary('version', paths.binary, Probe('5.0.0'))
+    manifest.write(paths.bundled)
+
+    # a fresh instance: no cache dir, the same binary at another path
+    paths.manifest.unlink()
+    deployed = tmp_path / 'deployed' / paths.binary.name
+    deployed.parent.mkdir()
+    deployed.write_bytes(paths.binary.read_bytes())
+    _new_process(monkeypatch)
+    probe = Probe('unexpected')
+
+    assert manifest.cached_for_binary('version', deployed, probe) == '5.0.0'
+    assert probe.calls == 0
+
+
+def test_manifest_of_another_version_is_ignored(paths, monkeypatch):
+    manifest.cached_for_binary('version', paths.binary, Probe('5.0.0'))
+    data = json.loads(paths.manifest.read_text())
+    data['version'] = manifest.MANIFEST_VERSION - 1
+    paths.manifest.write_text(json.dumps(data))
+
+    _new_process(monkeypatch)
+    probe = Probe('5.0.0')
+    manifest.cached_for_binary('version', paths.binary, probe)
+
+    assert probe.calls == 1
+
+
+def test_failed_probes_are_not_cached(paths):
+    def fail():
+        raise RuntimeError('not executable')
+
+    with pytest.raises(RuntimeError):
+        manifest.cached_for_binary('version', paths.binary, fail)
+
+    probe = Probe('5.0.0')
+    assert manifest.cached_for_binary('version', paths.binary, probe) == '5.0.0'
+    assert probe.calls == 1
+
+
+def test_unwritable_manifest_is_not_an_error(paths, monkeypatch):
+    # e.g. a read-only file system: the directory of the manifest can not be created
+    monkeypatch.setattr(manifest, 'config', SimpleNamespace(binary_manifest=paths.binary / 'manifest.json'))
+
+    assert manifest.cached('platform', 'linux', 'stamp', Probe('debian-openssl-3.0.x')) == 'debian-openssl-3.0.x'
@@ -0,0 +1,45 @@
+from types import SimpleNamespace
+
+import pytest
+
+from app.services import claude_service
+from app.services.claude_service import ClaudeService, _cached_system
+from app.utils.metrics import metrics
+
+
+@pytest.fixture
+def service():
+    # _record_usage does not touch the SDK clients
+    return ClaudeService.__new__(ClaudeService)
+
+
+def _response(cache_read=0, cache_write=0):
+    return SimpleNamespace(usage=SimpleNamespace(
+        input_tokens=100,
+        output_tokens=10,
+        cache_read_input_tokens=cache_read,
+        cache_creation_input_tokens=cache_write,
+    ))
+
+
+def test_system_prompts_are_always_marked_cacheable():
+    for prompt in (claude_service.ANALYZE_SYSTEM_PROMPT, claude_service.BLAME_MESSAGE_SYSTEM_PROMPT):
+        [block] = _cached_system(prompt)
+        assert block['text'] == prompt
+        assert block['cache_control'] == {'type': 'ephemeral'}
+
+
+@pytest.mark.parametrize('usage, counter', [
+    ({'cache_read': 2100}, 'cache_hits'),
+    ({'cache_write': 2100}, 'cache_misses'),
+    ({}, 'cache_uncached'),
+])
+def test_record_usage_classifies_cache_outcome(service, usage, counter):
+    before = metrics.snapshot()
+    service._record_usage('test', _response(**usage))
+    after = metrics.snapshot()
+
+    for name in ('cache_hits', 'cache_misses', 'cache_uncached'):
+        key = f'claude.test.{name}'
+        assert after.get(key, 0) - before.get(key, 0) == (1 if name == counter else 0)
+    assert after['claude.test.requests'] - before.get('claude.test.requests', 0) == 1
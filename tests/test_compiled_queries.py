@@ -0,0 +1,71 @@
+import datetime
+
+import pytest
+
+from app.prisma_client import builder, models
+from app.prisma_client.builder import QueryBuilder
+
+
+@pytest.fixture(autouse=True)
+def compiled_queries(monkeypatch):
+    cache = {}
+    monkeypatch.setattr(builder, '_compiled_queries', cache)
+    return cache
+
+
+def _legacy(method, model, arguments, root_selection=None):
+    """The query as rendered from the node tree, without the compiled query cache"""
+    return QueryBuilder(method=method, model=model, arguments=arguments, root_selection=root_selection)._create_root_node().render()
+
+
+def _compiled(method, model, arguments, root_selection=None):
+    return QueryBuilder(method=method, model=model, arguments=arguments, root_selection=root_selection).build_query()
+
+
+def _in_filters(ids):
+    return {
+        'where': {
+            'id': {'in': ids},
+            'AND': [{'status': {'not_in': ids[::-1]}}, {'user_id': 'u'}],
+        },
+        'include': {'suspects': {'where': {'username': {'in': ids}}}},
+    }
+
+
+def test_list_lengths_share_one_compiled_query(compiled_queries):
+    for size in (0, 1, 2, 5, 40):
+        ids = [f'id-{i}' for i in range(size)]
+        assert _compiled('find_many', models.Judgment, _in_filters(ids)) == _legacy('find_many', models.Judgment, _in_filters(ids))
+
+    assert len(compiled_queries) == 1
+
+
+@pytest.mark.parametrize('arguments', [
+    {'where': {'id': {'in': ('a', 'b')}}},
+    {'where': {'id': {'in': ['a', None, 'b"\n']}}},
+    {'where': {'created_at': {'in': [datetime.datetime(2026, 1, 1, tzinfo=datetime.timezone.utc)]}}},
+    # only objects in a list are part of the shape
+    {'where': {'OR': [{'id': 'a'}, {'id': {'in': ['b', 'c']}}]}},
+    {'where': {'OR': []}},
+])
+def test_list_values_render_like_the_node_tree(arguments):
+    assert _compiled('find_many', models.Judgment, arguments) == _legacy('find_many', models.Judgment, arguments)
+
+
+def test_lists_of_objects_are_part_of_the_shape(compiled_queries):
+    for ors in ([{'id': 'a'}], [{'id': 'a'}, {'id': 'b'}]):
+        assert _compiled('find_many', models.Judgment, {'where': {'OR': ors}}) == _legacy('find_many', models.Judgment, {'where': {'OR': ors}})
+
+    assert len(compiled_queries) == 2
+
+
+def test_nested_create_many_data():
+    arguments = {
+        'where': {'id': 'x'},
+        'data': {'suspects': {'createMany': {'data': [
+            {'username': 'a', 'responsibility': 60, 'last_commit_date': datetime.datetime(2026, 1, 1)},
+            {'username': 'b', 'responsibility': 40, 'last_commit_date': datetime.datetime(2026, 1, 2)},
+        ]}}},
+    }
+
+    assert _compiled('update', models.Judgment, arguments) == _legacy('update', models.Judgment, arguments)
@@ -0,0 +1,177 @@
+import asyncio
+import json
+
+from app.prisma_client.engine import pool as pool_module
+from app.prisma_client.engine.pool import EnginePool
+
+ENGINE_METRICS = '''# HELP prisma_client_queries_total Total number of Prisma Client queries executed
+# TYPE prisma_client_queries_total counter
+prisma_client_queries_total {queries}
+
+# HELP prisma_pool_connections_open Number of currently open Pool Connections
+# TYPE prisma_pool_connections_open gauge
+prisma_pool_connections_open{{db="main"}} 1
+
+# HELP prisma_client_queries_duration_histogram_ms Histogram of the duration of all executed Prisma Client queries in ms
+# TYPE prisma_client_queries_duration_histogram_ms histogram
+prisma_client_queries_duration_histogram_ms_bucket{{le="10"}} {queries}
+prisma_client_queries_duration_histogram_ms_bucket{{le="+Inf"}} {queries}
+prisma_client_queries_duration_histogram_ms_sum 4.5
+prisma_client_queries_duration_histogram_ms_count {queries}
+'''
+
+
+class FakeEngine:
+    """Records the requests it is sent, the way `QueryEngine` would answer them"""
+
+    created = 0
+
+    def __init__(self):
+        self.index = FakeEngine.created
+        FakeEngine.created += 1
+        self.requests = []
+
+    async def query(self, content, *, tx_id):
+        self.requests.append(('query', tx_id))
+        return self.index
+
+    async def start_transaction(self, *, content):
+        self.requests.append(('start', content))
+        return f'tx-{self.index}-{len(self.requests)}'
+
+    async def commit_transaction(self, tx_id):
+        self.requests.append(('commit', tx_id))
+
+    async def rollback_transaction(self, tx_id):
+        self.requests.append(('rollback', tx_id))
+
+    async def metrics(self, *, format, global_labels):
+        return ENGINE_METRICS.format(queries=10 * (self.index + 1))
+
+
+def _pool(size=2):
+    FakeEngine.created = 0
+    return EnginePool(size=size, factory=FakeEngine)
+
+
+def _content(timeout_ms=5000):
+    return json.dumps({'timeout': timeout_ms, 'max_wait': 2000})
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+class SlowEngine(FakeEngine):
+    def __init__(self):
+        super().__init__()
+        self.release = asyncio.Event()
+
+    async def query(self, content, *, tx_id):
+        if content == 'slow':
+            await self.release.wait()
+        return await super().query(content, tx_id=tx_id)
+
+
+def test_queries_go_to_the_least_busy_engine():
+    FakeEngine.created = 0
+    pool = EnginePool(size=3, factory=SlowEngine)
+
+    async def run():
+        slow = [asyncio.create_task(pool.query('slow', tx_id=None)) for _ in range(2)]
+        await asyncio.sleep(0)
+        # two engines are busy, everything else goes to the idle one
+        answered = [await pool.query('{}', tx_id=None) for _ in range(3)]
+        for engine in pool.engines:
+            engine.release.set()
+        return answered, await asyncio.gather(*slow)
+
+    answered, slow = asyncio.run(run())
+
+    assert sorted(slow) == [0, 1]
+    assert answered == [2, 2, 2]
+
+
+def test_idle_engines_share_the_load():
+    pool = _pool(size=3)
+
+    async def run():
+        return [await pool.query('{}', tx_id=None) for _ in range(6)]
+
+    assert asyncio.run(run()) == [0, 1, 2, 0, 1, 2]
+
+
+def test_transaction_queries_stay_on_their_engine():
+    pool = _pool()
+
+    async def run():
+        tx_id = await pool.start_transaction(content=_content())
+        answered = [await pool.query('{}', tx_id=tx_id) for _ in range(3)]
+        await pool.commit_transaction(tx_id)
+        return tx_id, answered
+
+    tx_id, answered = asyncio.run(run())
+
+    assert len(set(answered)) == 1
+    assert ('commit', tx_id) in pool.engines[answered[0]].requests
+    assert pool._transactions == {}
+
+
+def test_abandoned_transactions_are_forgotten_after_their_timeout(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(pool_module.time, 'monotonic', clock.monotonic)
+    pool = _pool()
+
+    async def run():
+        abandoned = await pool.start_transaction(content=_content(timeout_ms=5000))
+        clock.now += 5 + pool_module.TRANSACTION_AFFINITY_GRACE - 1
+        recent = await pool.start_transaction(content=_content())
+        assert set(pool._transactions) == {abandoned, recent}
+
+        clock.now += 2
+        await pool.start_transaction(content=_content())
+        return abandoned, recent
+
+    abandoned, recent = asyncio.run(run())
+
+    assert abandoned not in pool._transactions
+    assert recent in pool._transactions
+
+
+def test_prometheus_metrics_have_one_header_per_family():
+    lines = asyncio.run(_pool().metrics(format='prometheus', global_labels=None)).splitlines()
+
+    for family in (
+        'prisma_client_queries_total',
+        'prisma_pool_connections_open',
+        'prisma_client_queries_duration_histogram_ms',
+    ):
+        assert len([line for line in lines if line.startswith(f'# HELP {family} ')]) == 1
+        assert len([line for line in lines if line.startswith(f'# TYPE {family} ')]) == 1
+
+    # the samples of a family directly follow its header, one per engine
+    start = lines.index('# TYPE prisma_client_queries_total counter')
+    assert lines[start + 1:start + 3] == [
+        'prisma_client_queries_total{engine="0"} 10',
+        'prisma_client_queries_total{engine="1"} 20',
+    ]
+    start = lines.index('# TYPE prisma_pool_connections_open gauge')
+    assert lines[start + 1:start + 3] == [
+        'prisma_pool_connections_open{engine="0",db="main"} 1',
+        'prisma_pool_connections_open{engine="1",db="main"} 1',
+    ]
+    start = lines.index('# TYPE prisma_client_queries_duration_histogram_ms histogram')
+    assert lines[start + 1:] == [
+        'prisma_client_queries_duration_histogram_ms_bucket{engine="0",le="10"} 10',
+        'prisma_client_queries_duration_histogram_ms_bucket{engine="0",le="+Inf"} 10',
+        'prisma_client_queries_duration_histogram_ms_sum{engine="0"} 4.5',
+        'prisma_client_queries_duration_histogram_ms_count{engine="0"} 10',
+        'prisma_client_queries_duration_histogram_ms_bucket{engine="1",le="10"} 20',
+        'prisma_client_queries_duration_histogram_ms_bucket{engine="1",le="+Inf"} 20',
+        'prisma_client_queries_duration_histogram_ms_sum{engine="1"} 4.5',
+        'prisma_client_queries_duration_histogram_ms_count{engine="1"} 20',
+    ]
@@ -0,0 +1,143 @@
+import shutil
+from pathlib import Path
+
+import pytest
+
+from app.prisma_client._compat import model_parse
+from app.prisma_client.generator import generator as generator_module
+from app.prisma_client.generator.generator import FINGERPRINT_FILE, Generator
+from app.prisma_client.generator.models import PythonData
+from app.prisma_client._config import config
+
+DATAMODEL = '''
+datasource db {
+  provider = "postgresql"
+  url      = env("DATABASE_URL")
+}
+
+generator client {
+  provider = "python -m app.prisma_client"
+  output   = "../app/prisma_client"
+}
+
+model User {
+  id       String @id
+  username String
+}
+'''
+
+
+def _field(name: str, **extra):
+    return {
+        'name': name,
+        'kind': 'scalar',
+        'isList': False,
+        'isRequired': True,
+        'isUnique': False,
+        'isId': False,
+        'isReadOnly': False,
+        'hasDefaultValue': False,
+        'type': 'String',
+        'isGenerated': False,
+        'isUpdatedAt': False,
+        **extra,
+    }
+
+
+def _data(root: Path, datamodel: str = DATAMODEL, target: str = 'debian-openssl-3.0.x') -> PythonData:
+    """Generator params as the Prisma CLI sends them for a project checked out at `root` on `target`"""
+    engine_dir = root / '.cache' / 'binaries'
+    return model_parse(PythonData, {
+        'datamodel': datamodel,
+        'version': config.expected_engine_version,
+        'generator': {
+            'name': 'client',
+            'output': {'value': str(root / 'app' / 'prisma_client'), 'fromEnvVar': None},
+            'provider': {'value': 'python -m app.prisma_client', 'fromEnvVar': None},
+            'config': {'recursive_type_depth': '5'},
+            'binaryTargets': [{'value': target, 'fromEnvVar': None, 'native': True}],
+            'previewFeatures': [],
+        },
+        'dmmf': {
+            'datamodel': {
+                'enums': [],
+                'models': [{
+                    'name': 'User',
+                    'dbName': None,
+                    'fields': [_field('id', isId=True), _field('username')],
+                    'primaryKey': None,
+                    'uniqueFields': [],
+                    'uniqueIndexes': [],
+                    'isGenerated': False,
+                }],
+                'types': [],
+            },
+            'schema': {},
+            'mappings': {},
+        },
+        'schemaPath': str(root / 'prisma' / 'schema.prisma'),
+        'datasources': [{
+            'name': 'db',
+            'provider': 'postgresql',
+            'activeProvider': 'postgresql',
+            'url': {'value': None, 'fromEnvVar': 'DATABASE_URL'},
+        }],
+        'otherGenerators': [],
+        'binaryPaths': {'queryEngine': {target: str(engine_dir / f'query-engine-{target}')}},
+    })
+
+
+def _project(root: Path, datamodel: str = DATAMODEL) -> PythonData:
+    (root / 'prisma').mkdir(parents=True)
+    (root / 'prisma' / 'schema.prisma').write_text(datamodel)
+    return _data(root, datamodel)
+
+
+@pytest.fixture(autouse=True)
+def _sequential(monkeypatch):
+    monkeypatch.setenv('PRISMA_PY_GENERATOR_WORKERS', '1')
+    monkeypatch.delenv('PRISMA_PY_FORCE_GENERATE', raising=False)
+
+
+@pytest.fixture
+def generated(tmp_path):
+    """A project generated at one root, then checked out (copied) at another"""
+    Generator().generate(_project(tmp_path / 'first'))
+    shutil.copytree(tmp_path / 'first', tmp_path / 'second')
+    return tmp_path / 'second'
+
+
+def test_unchanged_schema_skips_generation_at_another_root(generated, monkeypatch):
+    package = generated / 'app' / 'prisma_client'
+    types_before = (package / 'types.py').read_bytes()
+
+    def fail(*args, **kwargs):
+        raise AssertionError('the client should not have been regenerated')
+
+    monkeypatch.setattr(generator_module, '_render_templates', fail)
+    # e.g. generated on a developer machine, then deployed from a fresh clone on a build server
+    Generator().generate(_data(generated, target='rhel-openssl-3.0.x'))
+
+    assert (package / FINGERPRINT_FILE).exists()
+    assert (package / 'types.py').read_bytes() == types_before
+    # the machine local paths are rendered for the new root
+    client = (package / 'client.py').read_text()
+    assert (generated / 'prisma' / 'schema.prisma').as_posix() in client
+    assert (generated.parent / 'first').as_posix() not in client
+    assert 'query-engine-rhel-openssl-3.0.x' in client
+
+
+def test_changed_schema_regenerates_at_another_root(generated, monkeypatch):
+    rendered = []
+    render_templates = generator_module._render_templates
+
+    def record(rootdir, names, *args, **kwargs):
+        rendered.extend(names)
+        return render_templates(rootdir, names, *args, **kwargs)
+
+    monkeypatch.setattr(generator_module, '_render_templates', record)
+    datamodel = DATAMODEL.replace('username String', 'username String // renamed later')
+    (generated / 'prisma' / 'schema.prisma').write_text(datamodel)
+    Generator().generate(_data(generated, datamodel))
+
+    assert 'types.py.jinja' in rendered
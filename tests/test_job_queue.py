@@ -0,0 +1,139 @@
+import asyncio
+import contextlib
+
+import pytest
+
+from app.config import settings
+from app.services import job_queue
+from app.services.job_queue import AnalysisWorkerPool, JobQueue
+from app.utils.metrics import metrics
+
+
+class FakeDB:
+    """Answers the queue's raw queries from in-memory jobs, the way the SQL in job_queue would."""
+
+    def __init__(self, jobs, running=None):
+        self.jobs = jobs
+        # running count per user, as seen after taking the user lock
+        self.running = running or {}
+        self.owned = True
+        self.statements = []
+
+    @contextlib.asynccontextmanager
+    async def tx(self):
+        yield self
+
+    async def query_first(self, sql, *args):
+        if sql is job_queue.CANDIDATE_SQL:
+            _, job_id, capped = args
+            excluded = capped.split(',') if capped else []
+            for job in self.jobs:
+                if (job_id is None or job['id'] == job_id) and job['user_id'] not in excluded:
+                    return job
+            return None
+        if sql is job_queue.RUNNING_COUNT_SQL:
+            return {'running': self.running.get(args[0], 0)}
+        if sql is job_queue.CLAIM_SQL:
+            return {'id': args[0], 'judgment_id': f'judgment-{args[0]}', 'user_id': 'u', 'attempts': 1, 'max_attempts': 3}
+        raise AssertionError(sql)
+
+    async def execute_raw(self, sql, *args):
+        self.statements.append((sql, args))
+        if sql is job_queue.LOCK_USER_SQL:
+            return 1
+        return 1 if self.owned else 0
+
+
+def _counter(name):
+    return metrics.snapshot().get(name, 0)
+
+
+def test_claim_moves_past_users_at_the_limit(monkeypatch):
+    monkeypatch.setattr(settings, 'ANALYSIS_PER_USER_CONCURRENCY', 1)
+    db = FakeDB(
+        [{'id': 'a1', 'user_id': 'busy'}, {'id': 'a2', 'user_id': 'busy'}, {'id': 'b1', 'user_id': 'idle'}],
+        running={'busy': 1},
+    )
+
+    claimed = asyncio.run(JobQueue(db).claim())
+
+    assert claimed['id'] == 'b1'
+
+
+def test_claim_of_a_given_job_of_a_user_at_the_limit(monkeypatch):
+    monkeypatch.setattr(settings, 'ANALYSIS_PER_USER_CONCURRENCY', 1)
+    db = FakeDB([{'id': 'a1', 'user_id': 'busy'}, {'id': 'b1', 'user_id': 'idle'}], running={'busy': 1})
+
+    assert asyncio.run(JobQueue(db).claim('a1')) is None
+
+
+def test_claim_with_nothing_runnable():
+    assert asyncio.run(JobQueue(FakeDB([])).claim()) is None
+
+
+@pytest.mark.parametrize('attempts, statement', [(1, 'RETRY_SQL'), (3, 'FAIL_SQL')])
+def test_fail_is_scoped_to_the_claim(attempts, statement):
+    db = FakeDB([])
+    job = {'id': 'a1', 'attempts': attempts, 'max_attempts': 3}
+
+    asyncio.run(JobQueue(db).fail(job, 'boom'))
+
+    [(sql, args)] = db.statements
+    assert sql is getattr(job_queue, statement)
+    assert args[:2] == ('a1', attempts)
+
+
+def test_completing_a_lost_claim_is_reported():
+    db = FakeDB([])
+    db.owned = False
+    completed, lost = _counter('jobs.completed'), _counter('jobs.lease_lost')
+
+    asyncio.run(JobQueue(db).complete({'id': 'a1', 'attempts': 1}))
+
+    assert _counter('jobs.completed') == completed
+    assert _counter('jobs.lease_lost') == lost + 1
+
+
+class _Pool(AnalysisWorkerPool):
+    def __init__(self, db, duration):
+        super().__init__(db, concurrency=1, poll_interval=0)
+        self.duration = duration
+        self.finished = False
+
+    async def _analyze(self, job):
+        await asyncio.sleep(self.duration)
+        self.finished = True
+
+
+JOB = {'id': 'a1', 'judgment_id': 'j1', 'user_id': 'u1', 'attempts': 1, 'max_attempts': 3}
+
+
+def _statements(db, name):
+    return [args for sql, args in db.statements if sql is getattr(job_queue, name)]
+
+
+def test_lease_is_extended_while_the_analysis_runs(monkeypatch):
+    monkeypatch.setattr(settings, 'ANALYSIS_VISIBILITY_TIMEOUT', 0.03)
+    db = FakeDB([])
+    pool = _Pool(db, duration=0.1)
+
+    asyncio.run(pool._run(dict(JOB)))
+
+    assert pool.finished
+    # extended every third of the visibility timeout, then completed once
+    assert len(_statements(db, 'HEARTBEAT_SQL')) >= 5
+    assert _statements(db, 'COMPLETE_SQL') == [('a1', 1)]
+
+
+def test_analysis_is_abandoned_once_the_lease_is_lost(monkeypatch):
+    monkeypatch.setattr(settings, 'ANALYSIS_VISIBILITY_TIMEOUT', 0.03)
+    db = FakeDB([])
+    db.owned = False
+    pool = _Pool(db, duration=1)
+
+    asyncio.run(pool._run(dict(JOB)))
+
+    assert not pool.finished
+    assert _statements(db, 'HEARTBEAT_SQL') == [('a1', 1, 0.03)]
+    assert not _statements(db, 'COMPLETE_SQL')
+    assert not _statements(db, 'RETRY_SQL')
@@ -0,0 +1,46 @@
+import datetime
+import decimal
+import json
+import uuid
+
+import pytest
+
+from app.prisma_client import _json, fields
+from app.prisma_client.builder import dumps, serializer
+
+
+@pytest.fixture(params=['orjson', 'std'])
+def backend(request, monkeypatch):
+    if request.param == 'std':
+        monkeypatch.setattr(_json, 'orjson', None)
+    elif not _json.HAS_ORJSON:
+        pytest.skip('orjson is not installed')
+    return request.param
+
+
+@pytest.mark.parametrize('payload', [
+    {'name': '한글 "quoted"\n', 'count': 3, 'ratio': 0.25, 'tags': ['a', None], 'nested': {'ok': True}},
+    {'when': datetime.datetime(2026, 1, 1, 12, 30, tzinfo=datetime.timezone.utc), 'price': decimal.Decimal('1.10')},
+    {'id': uuid.UUID(int=1)},
+    {'data': fields.Json({'a': [1, 2.5]})},
+    # keys that are not strings are converted like the standard library does
+    {1: 'int', 1.5: 'float', True: 'bool', None: 'none'},
+    2 ** 70,
+])
+def test_backends_agree(backend, payload):
+    assert json.loads(dumps(payload)) == json.loads(json.dumps(payload, default=serializer, ensure_ascii=False))
+
+
+@pytest.mark.parametrize('payload', [
+    float('nan'),
+    {'ratio': float('inf')},
+    {'values': [1.0, -float('inf')]},
+    {'data': fields.Json({'a': float('nan')})},
+])
+def test_non_finite_floats_are_rejected(backend, payload):
+    with pytest.raises(ValueError):
+        dumps(payload)
+
+
+def test_none_is_not_mistaken_for_a_non_finite_float(backend):
+    assert json.loads(dumps({'a': None, 'b': [None, 1.5]})) == {'a': None, 'b': [None, 1.5]}
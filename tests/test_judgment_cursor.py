@@ -0,0 +1,46 @@
+import base64
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import HTTPException
+
+from app.routers.judgments import _decode_cursor, _encode_cursor
+
+JUDGMENT_ID = '0b7e6c4e-1d7a-4c37-9a63-0f1c2b9d4e55'
+
+
+def _raw(payload) -> str:
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip('=')
+
+
+def test_round_trip_of_a_query_raw_row():
+    # query_raw returns timestamps as ISO strings with the UTC offset
+    cursor = _encode_cursor('2026-10-19T06:47:28.263+00:00', JUDGMENT_ID)
+    assert _decode_cursor(cursor) == ('2026-10-19T06:47:28.263000', JUDGMENT_ID)
+
+
+@pytest.mark.parametrize('created_at', [
+    '2026-10-19T15:47:28.263+09:00',
+    datetime(2026, 10, 19, 15, 47, 28, 263000, tzinfo=timezone(timedelta(hours=9))),
+    datetime(2026, 10, 19, 6, 47, 28, 263000),
+])
+def test_offsets_are_normalized_to_utc(created_at):
+    created, _ = _decode_cursor(_encode_cursor(created_at, JUDGMENT_ID))
+    assert created == '2026-10-19T06:47:28.263000'
+
+
+@pytest.mark.parametrize('cursor', [
+    'not base64 at all!',
+    _raw({'created_at': '2026-10-19T06:47:28', 'id': JUDGMENT_ID}),
+    _raw(['2026-10-19T06:47:28']),
+    _raw(['2026-10-19T06:47:28', JUDGMENT_ID, 'extra']),
+    _raw(['yesterday', JUDGMENT_ID]),
+    _raw(['2026-10-19T06:47:28', 'not-a-uuid']),
+    _raw([1760856448, JUDGMENT_ID]),
+    _raw(['2026-10-19T06:47:28', 42]),
+])
+def test_tampered_cursors_are_rejected(cursor):
+    with pytest.raises(HTTPException) as exc:
+        _decode_cursor(cursor)
+    assert exc.value.status_code == 400
@@ -0,0 +1,201 @@
+import asyncio
+from types import SimpleNamespace
+
+import anthropic
+import httpx
+import pytest
+
+from app.services import claude_service
+from app.services.claude_service import ClaudeService
+from app.services.llm_scheduler import BULK, INTERACTIVE, LLMScheduler
+from app.utils.exceptions import ClaudeAPIException
+
+
+def _response(text='', input_tokens=0, output_tokens=0):
+    return SimpleNamespace(
+        content=[SimpleNamespace(text=text)],
+        usage=SimpleNamespace(input_tokens=input_tokens, output_tokens=output_tokens),
+    )
+
+
+def _rate_limited():
+    request = httpx.Request('POST', 'https://api.anthropic.com/v1/messages')
+    response = httpx.Response(429, headers={'retry-after': '0'}, request=request)
+    return anthropic.RateLimitError('rate limited', response=response, body=None)
+
+
+def test_interactive_waiters_overtake_queued_bulk_ones():
+    scheduler = LLMScheduler(max_concurrency=1, tokens_per_minute=100_000)
+    order = []
+
+    async def request(name, lane):
+        async with scheduler.slot(10, lane):
+            order.append(name)
+
+    async def run():
+        async with scheduler.slot(10):
+            tasks = [
+                asyncio.create_task(request('bulk-1', BULK)),
+                asyncio.create_task(request('bulk-2', BULK)),
+                asyncio.create_task(request('interactive', INTERACTIVE)),
+            ]
+            await asyncio.sleep(0)
+        await asyncio.gather(*tasks)
+
+    asyncio.run(run())
+
+    assert order == ['interactive', 'bulk-1', 'bulk-2']
+
+
+def test_run_retries_rate_limited_calls():
+    scheduler = LLMScheduler(max_concurrency=1, tokens_per_minute=100_000, max_retries=2)
+    outcomes = [_rate_limited(), _response(input_tokens=10)]
+
+    def call():
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    response = asyncio.run(scheduler.run(call, cost=10))
+
+    assert response.usage.input_tokens == 10
+    assert outcomes == []
+
+
+def test_run_does_not_retry_other_errors():
+    scheduler = LLMScheduler(max_concurrency=1, tokens_per_minute=100_000, max_retries=2)
+    calls = []
+
+    def call():
+        calls.append(1)
+        raise ValueError('bad request')
+
+    with pytest.raises(ValueError):
+        asyncio.run(scheduler.run(call, cost=10))
+
+    assert len(calls) == 1
+
+
+def test_interactive_waiter_is_not_stuck_behind_a_refill_timer():
+    # 10 tokens per second
+    scheduler = LLMScheduler(max_concurrency=3, tokens_per_minute=600)
+
+    async def run():
+        async with scheduler.slot(500):
+            # the bulk head needs the full budget back, which takes 50 seconds
+            bulk = asyncio.create_task(scheduler._acquire(600, BULK))
+            await asyncio.sleep(0)
+            # the remaining budget covers this one right away
+            await asyncio.wait_for(scheduler._acquire(50, INTERACTIVE), timeout=1)
+            scheduler._release()
+            assert not bulk.done()
+            bulk.cancel()
+
+    asyncio.run(run())
+
+
+def test_overestimated_cost_is_refunded():
+    scheduler = LLMScheduler(max_concurrency=3, tokens_per_minute=600)
+
+    async def run():
+        async with scheduler.slot(600):
+            waiter = asyncio.create_task(scheduler._acquire(400, BULK))
+            await asyncio.sleep(0)
+            assert not waiter.done()
+
+            # only 100 of the 600 reserved tokens were used
+            scheduler.settle(600, _response(input_tokens=80, output_tokens=20))
+            await asyncio.wait_for(waiter, timeout=1)
+            scheduler._release()
+
+    asyncio.run(run())
+
+
+def test_underestimated_cost_is_charged():
+    scheduler = LLMScheduler(max_concurrency=3, tokens_per_minute=600)
+
+    async def run():
+        async with scheduler.slot(100):
+            scheduler.settle(100, _response(input_tokens=350, output_tokens=50))
+
+    asyncio.run(run())
+
+    assert scheduler._tokens == pytest.approx(200, abs=1)
+
+
+class FakeStream:
+    """Stands in for `AsyncMessages.stream()`: fails on entering when `outcome` is an exception,
+    otherwise streams its chunks, raising any exception among them."""
+
+    def __init__(self, outcome):
+        self.outcome = outcome
+
+    async def __aenter__(self):
+        if isinstance(self.outcome, Exception):
+            raise self.outcome
+        self.text_stream = self._texts()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def _texts(self):
+        for chunk in self.outcome:
+            if isinstance(chunk, Exception):
+                raise chunk
+            yield chunk
+
+    async def get_final_message(self):
+        return _response(''.join(self.outcome), input_tokens=100, output_tokens=10)
+
+
+class FakeMessages:
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.opened = 0
+
+    def stream(self, **kwargs):
+        self.opened += 1
+        return FakeStream(self.outcomes.pop(0))
+
+
+def _stream(monkeypatch, messages):
+    monkeypatch.setattr(
+        claude_service, 'llm_scheduler', LLMScheduler(max_concurrency=1, tokens_per_minute=100_000, max_retries=2)
+    )
+    service = ClaudeService.__new__(ClaudeService)
+    service.async_client = SimpleNamespace(messages=messages)
+    params = {'title': 't', 'description': 'd', 'file_path': 'f', 'commits': []}
+
+    async def run():
+        return [event async for event in service.stream_analyze_commits(params)]
+
+    return asyncio.run(run())
+
+
+def test_stream_is_retried_before_the_first_token(monkeypatch):
+    messages = FakeMessages(_rate_limited(), ['{"suspects": ', '[]}'])
+
+    events = _stream(monkeypatch, messages)
+
+    assert messages.opened == 2
+    assert events == [('token', '{"suspects": '), ('token', '[]}'), ('result', {'suspects': []})]
+
+
+def test_stream_is_not_retried_once_tokens_were_sent(monkeypatch):
+    messages = FakeMessages(['{"suspects": ', _rate_limited()], ['{"suspects": []}'])
+
+    with pytest.raises(ClaudeAPIException):
+        _stream(monkeypatch, messages)
+
+    assert messages.opened == 1
+
+
+def test_stream_gives_up_after_max_retries(monkeypatch):
+    messages = FakeMessages(_rate_limited(), _rate_limited(), _rate_limited(), ['{}'])
+
+    with pytest.raises(ClaudeAPIException):
+        _stream(monkeypatch, messages)
+
+    assert messages.opened == 3
@@ -0,0 +1,136 @@
+import asyncio
+
+from app.prisma_client import Prisma
+from app.prisma_client._loader import loader_scope
+
+
+def _user(user_id):
+    return {
+        'id': user_id,
+        'github_id': f'github-{user_id}',
+        'username': f'user-{user_id}',
+        'avatar_url': None,
+        'access_token': None,
+        'created_at': '2026-01-01T00:00:00+00:00',
+        'updated_at': '2026-01-01T00:00:00+00:00',
+    }
+
+
+class FakePrisma(Prisma):
+    """Answers user queries from `ids` the way the query engine would, without connecting.
+
+    `aliases` are keys the database matches to another id but Python does not, e.g. an
+    upper case UUID, and `broken` keys fail any query that contains them.
+    """
+
+    def __init__(self, ids, aliases=None, broken=()):
+        super().__init__()
+        self.ids = set(ids)
+        self.aliases = aliases or {}
+        self.broken = set(broken)
+        self.calls = []
+
+    async def _execute(self, method, arguments, model=None, root_selection=None):
+        where = arguments['where']
+        self.calls.append((method, where))
+        if method == 'find_many':
+            keys = where['id']['in']
+            if self.broken & set(keys):
+                raise ValueError('malformed key')
+            return {'data': {'result': [_user(key) for key in keys if key in self.ids]}}
+
+        assert method == 'find_unique'
+        key = where['id']
+        if key in self.broken:
+            raise ValueError('malformed key')
+        key = self.aliases.get(key, key)
+        return {'data': {'result': _user(key) if key in self.ids else None}}
+
+
+def _find(db, *keys):
+    return asyncio.gather(*(db.user.find_unique(where={'id': key}) for key in keys), return_exceptions=True)
+
+
+def test_same_tick_lookups_are_one_query():
+    db = FakePrisma(['1', '2', '3'])
+
+    async def run():
+        with loader_scope():
+            return await _find(db, '1', '2', '1', '3')
+
+    users = asyncio.run(run())
+
+    assert [user.id for user in users] == ['1', '2', '1', '3']
+    assert db.calls == [('find_many', {'id': {'in': ['1', '2', '3']}})]
+
+
+def test_misses_are_resolved_individually():
+    db = FakePrisma(['1', 'abc'], aliases={'ABC': 'abc'})
+
+    async def run():
+        with loader_scope():
+            return await _find(db, '1', 'missing', 'ABC')
+
+    found, missing, alias = asyncio.run(run())
+
+    assert found.id == '1'
+    assert missing is None
+    # matched by the database, not by the batched lookup
+    assert alias.id == 'abc'
+    assert db.calls[1:] == [('find_unique', {'id': 'missing'}), ('find_unique', {'id': 'ABC'})]
+
+
+def test_one_failing_key_does_not_fail_the_others():
+    db = FakePrisma(['1', '2'], broken=['bad'])
+
+    async def run():
+        with loader_scope():
+            return await _find(db, '1', 'bad', '2')
+
+    first, bad, second = asyncio.run(run())
+
+    assert (first.id, second.id) == ('1', '2')
+    assert isinstance(bad, ValueError)
+
+
+def test_results_are_cached_within_the_scope_but_errors_are_not():
+    db = FakePrisma(['1'], broken=['bad'])
+
+    async def run():
+        with loader_scope():
+            await _find(db, '1', 'bad')
+            db.calls.clear()
+            return await _find(db, '1', 'bad')
+
+    user, bad = asyncio.run(run())
+
+    assert user.id == '1'
+    assert isinstance(bad, ValueError)
+    assert db.calls == [('find_unique', {'id': 'bad'})]
+
+
+def test_selects_without_the_key_are_not_batched():
+    db = FakePrisma(['1', '2'])
+
+    async def run():
+        with loader_scope():
+            return await asyncio.gather(*(
+                db.user.find_unique(where={'id': key}, select=['username']) for key in ('1', '2')
+            ))
+
+    users = asyncio.run(run())
+
+    # the key is needed to match records to callers
+    assert [user.username for user in users] == ['user-1', 'user-2']
+    assert db.calls == [('find_unique', {'id': '1'}), ('find_unique', {'id': '2'})]
+
+
+def test_lookups_outside_a_scope_are_not_batched():
+    db = FakePrisma(['1', '2'])
+
+    async def run():
+        return await _find(db, '1', '2')
+
+    asyncio.run(run())
+
+    assert db.calls == [('find_unique', {'id': '1'}), ('find_unique', {'id': '2'})]
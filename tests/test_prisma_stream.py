@@ -0,0 +1,128 @@
+import asyncio
+import uuid
+
+import pytest
+
+from app.prisma_client import models
+from app.prisma_client.actions import UserActions
+
+ROWS = [
+    {
+        'id': str(uuid.UUID(int=i)),
+        'username': f'user-{i}',
+        'avatar_url': None,
+        'github_id': str(i),
+        'created_at': '2026-01-01T00:00:00Z',
+        'updated_at': '2026-01-01T00:00:00Z',
+    }
+    for i in range(1, 24)
+]
+
+
+class FakeClient:
+    """Answers `find_many` queries from `rows` the way the query engine applies take / skip / cursor."""
+
+    def __init__(self, rows, delay=0.0):
+        self.rows = sorted(rows, key=lambda row: row['id'])
+        self.delay = delay
+        self.calls = []
+        self.selections = []
+        self.cancelled = 0
+        self.completed = 0
+
+    async def _execute(self, method, arguments, model=None, root_selection=None):
+        assert method == 'find_many'
+        self.calls.append(arguments)
+        self.selections.append(root_selection)
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        self.completed += 1
+
+        rows = self.rows
+        if arguments['cursor'] is not None:
+            ids = [row['id'] for row in rows]
+            rows = rows[ids.index(arguments['cursor']['id']):]
+        rows = rows[arguments['skip'] or 0:][:arguments['take']]
+        return {'data': {'result': [
+            {key: value for key, value in row.items() if root_selection is None or key in root_selection}
+            for row in rows
+        ]}}
+
+
+def _collect(actions, **kwargs):
+    async def run():
+        return [page async for page in actions.stream(**kwargs)]
+
+    return asyncio.run(run())
+
+
+def test_stream_partial_last_page():
+    client = FakeClient(ROWS)
+    pages = _collect(UserActions(client, models.User), batch_size=5)
+
+    assert [len(page) for page in pages] == [5, 5, 5, 5, 3]
+    assert [user.id for page in pages for user in page] == [row['id'] for row in ROWS]
+    assert len(client.calls) == 5
+
+    # pages after the first continue from the last record of the previous page
+    assert client.calls[0]['cursor'] is None
+    for previous, call in zip(pages, client.calls[1:]):
+        assert call['cursor'] == {'id': previous[-1].id}
+        assert call['skip'] == 1
+
+
+def test_stream_exact_multiple_of_batch_size():
+    client = FakeClient(ROWS[:20])
+    pages = _collect(UserActions(client, models.User), batch_size=5)
+
+    assert [len(page) for page in pages] == [5, 5, 5, 5]
+    # a full last page can only be told apart from a partial one by one more, empty, query
+    assert len(client.calls) == 5
+
+
+def test_stream_orders_by_id_and_selects_it():
+    client = FakeClient(ROWS)
+    _collect(UserActions(client, models.User), batch_size=10, order={'username': 'desc'}, select=['username'])
+
+    for call, selection in zip(client.calls, client.selections):
+        assert call['order_by'] == [{'username': 'desc'}, {'id': 'asc'}]
+        assert selection == ['username', 'id']
+
+
+def test_stream_rejects_non_positive_batch_size():
+    with pytest.raises(TypeError):
+        _collect(UserActions(FakeClient(ROWS), models.User), batch_size=0)
+
+
+def test_find_many_iter_yields_records():
+    async def run():
+        return [user.id async for user in UserActions(FakeClient(ROWS), models.User).find_many_iter(batch_size=4)]
+
+    assert asyncio.run(run()) == [row['id'] for row in ROWS]
+
+
+def test_find_many_iter_early_close_cancels_prefetch():
+    client = FakeClient(ROWS, delay=0.01)
+
+    async def run():
+        records = UserActions(client, models.User).find_many_iter(batch_size=5)
+        async for user in records:
+            first = user
+            # let the prefetch of the next page start before walking away
+            await asyncio.sleep(0)
+            break
+        await records.aclose()
+        # give a prefetch that was not cancelled the chance to run to completion
+        await asyncio.sleep(0.05)
+        return first
+
+    first = asyncio.run(run())
+
+    assert first.id == ROWS[0]['id']
+    # the second page was requested ahead of time and then abandoned
+    assert len(client.calls) == 2
+    assert client.cancelled == 1
+    assert client.completed == 1
@@ -0,0 +1,66 @@
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from app.config import settings
+from app.services.suspect_ranker import SuspectRanker
+
+NOW = datetime.now(timezone.utc)
+JUDGMENT = SimpleNamespace(title='로그인 500 에러', description='auth 토큰 검증 실패')
+
+
+def _commit(username, lines=10, days_ago=1, message='update readme'):
+    return SimpleNamespace(
+        author=SimpleNamespace(username=username),
+        diff='\n'.join(['+++ b/app/auth.py'] + ['+line'] * lines),
+        additions=lines,
+        deletions=0,
+        date=NOW - timedelta(days=days_ago),
+        message=message,
+    )
+
+
+def test_dominant_author_is_confident():
+    commits = [
+        _commit('alice', lines=200, days_ago=0, message='hotfix 로그인 토큰 검증'),
+        _commit('alice', lines=120, days_ago=0, message='fix auth 토큰'),
+    ] + [_commit(f'bystander{i}', lines=1, days_ago=30) for i in range(3)]
+
+    ranker = SuspectRanker()
+    ranking = ranker.rank(JUDGMENT, commits)
+
+    assert ranking['suspects'][0]['username'] == 'alice'
+    assert ranking['confidence'] >= settings.SUSPECT_RANKER_SKIP_THRESHOLD
+    assert ranker.is_confident(ranking)
+    assert sum(suspect['responsibility'] for suspect in ranking['suspects']) == 100
+
+
+def test_evenly_matched_authors_are_not_confident():
+    commits = [_commit(name) for name in ('alice', 'bob', 'carol')]
+
+    ranker = SuspectRanker()
+    ranking = ranker.rank(JUDGMENT, commits)
+
+    assert ranking['confidence'] == pytest.approx(1 / 3)
+    assert not ranker.is_confident(ranking)
+    assert sorted(suspect['responsibility'] for suspect in ranking['suspects']) == [33, 33, 34]
+
+
+def test_confidence_counts_authors_beyond_the_suspects():
+    commits = [_commit(f'dev{i}') for i in range(8)]
+
+    ranking = SuspectRanker(max_suspects=2).rank(JUDGMENT, commits)
+
+    assert len(ranking['suspects']) == 2
+    # the top author holds an eighth of the total score, not half of the two suspects' score
+    assert ranking['confidence'] == pytest.approx(1 / 8)
+    assert len(ranking['candidates']) == settings.SUSPECT_RANKER_TOP_K
+
+
+def test_no_commits():
+    ranker = SuspectRanker()
+    ranking = ranker.rank(JUDGMENT, [])
+
+    assert ranking == {'suspects': [], 'confidence': 0.0, 'candidates': []}
+    assert not ranker.is_confident(ranking)
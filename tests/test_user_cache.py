@@ -0,0 +1,153 @@
+import asyncio
+import json
+
+import jwt
+import pytest
+
+from app import dependencies
+from app.config import settings
+from app.prisma_client.models import User
+from app.utils import user_cache as user_cache_module
+from app.utils.user_cache import UserCache
+
+USER = User(
+    id='7b0c3f0e-54a5-4a5e-8f39-2f4f2ad2b0f1',
+    github_id='42',
+    username='octocat',
+    access_token='gho_secret',
+    created_at='2026-01-01T00:00:00Z',
+    updated_at='2026-01-01T00:00:00Z',
+)
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def pttl(self, key):
+        return 30_000
+
+    async def set(self, key, value, px):
+        self.values[key] = value
+
+    async def delete(self, key):
+        self.values.pop(key, None)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(user_cache_module.time, 'monotonic', clock.monotonic)
+    return clock
+
+
+def _shared_cache(redis):
+    cache = UserCache(ttl=60, max_size=10, redis_url='redis://test')
+    cache._redis = redis
+    return cache
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = UserCache(ttl=60, max_size=10, redis_url='')
+    asyncio.run(cache.set(USER.id, USER))
+
+    clock.now += 59
+    assert asyncio.run(cache.get(USER.id, User)) is USER
+    clock.now += 2
+    assert asyncio.run(cache.get(USER.id, User)) is None
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    cache = UserCache(ttl=60, max_size=2, redis_url='')
+    asyncio.run(cache.set('a', USER))
+    asyncio.run(cache.set('b', USER))
+    asyncio.run(cache.get('a', User))
+    asyncio.run(cache.set('c', USER))
+
+    assert asyncio.run(cache.get('b', User)) is None
+    assert asyncio.run(cache.get('a', User)) is USER
+
+
+def test_invalidate_drops_both_tiers(clock):
+    redis = FakeRedis()
+    cache = _shared_cache(redis)
+    asyncio.run(cache.set(USER.id, USER))
+    asyncio.run(cache.invalidate(USER.id))
+
+    assert redis.values == {}
+    assert asyncio.run(cache.get(USER.id, User)) is None
+
+
+def test_shared_entries_never_hold_the_access_token(clock):
+    redis = FakeRedis()
+    asyncio.run(_shared_cache(redis).set(USER.id, USER))
+
+    [raw] = redis.values.values()
+    assert 'gho_secret' not in raw
+    assert 'access_token' not in json.loads(raw)
+
+    # another worker only gets the user without its token
+    user = asyncio.run(_shared_cache(redis).get(USER.id, User))
+    assert user.username == 'octocat'
+    assert user.access_token is None
+
+
+def test_local_only_entries_are_not_shared(clock):
+    redis = FakeRedis()
+    cache = _shared_cache(redis)
+    asyncio.run(cache.set(USER.id, USER, local_only=True))
+
+    assert redis.values == {}
+    assert asyncio.run(cache.get(USER.id, User)) is USER
+
+
+class FakeUsers:
+    def __init__(self):
+        self.queries = []
+
+    async def find_unique(self, where, select=None):
+        self.queries.append(select)
+        return User.model_construct(id=USER.id, access_token=USER.access_token)
+
+
+class FakePrisma:
+    def __init__(self):
+        self.user = FakeUsers()
+
+
+def test_token_is_loaded_for_users_from_the_shared_cache(clock, monkeypatch):
+    redis = FakeRedis()
+    prisma = FakePrisma()
+    monkeypatch.setattr(dependencies, 'user_cache', _shared_cache(redis))
+
+    async def get_db():
+        return prisma
+
+    monkeypatch.setattr(dependencies, 'get_db', get_db)
+    redis.values[f'user-cache:{USER.id}'] = USER.model_dump_json(exclude={'access_token'})
+    token = jwt.encode({'sub': USER.id}, settings.SECRET_KEY, algorithm='HS256')
+
+    async def authenticate():
+        user = await dependencies.get_current_user(token)
+        assert user.access_token is None
+        with_token = await dependencies.get_current_user_with_token(user)
+        # the token is now cached in this process only
+        again = await dependencies.get_current_user_with_token(await dependencies.get_current_user(token))
+        return with_token, again
+
+    with_token, again = asyncio.run(authenticate())
+
+    assert with_token.access_token == again.access_token == 'gho_secret'
+    assert prisma.user.queries == [['id', 'access_token']]
+    assert 'gho_secret' not in ''.join(redis.values.values())